@@ -33,6 +33,16 @@ Generates a C header file with extra SWIG annotations to apply typemaps.
 
 Extra arguments required: path to opencmiss.i
 
+Check
+-----
+
+Checks that previously generated binding files contain every public cmfe_
+routine in opencmiss_iron.f90 and lists any that are missing. This only reads
+opencmiss_iron.f90 so is fast enough to use as a pre-commit hook.
+
+Extra arguments required: paths to any of the generated iron.h,
+iron_c.f90, iron_generated.i and iron.py files
+
 Testing
 -------
 
@@ -56,6 +66,7 @@ import os
 import sys
 
 from c import generate as c_generate
+from check import generate as check_generate
 from python import generate as python_generate
 from swig import generate as swig_generate
 
@@ -68,7 +79,8 @@ else:
             % sys.argv[0])
     exit(1)
 
-languages = {'C': c_generate, 'Python': python_generate, 'SWIG': swig_generate}
+languages = {'C': c_generate, 'Python': python_generate, 'SWIG': swig_generate,
+        'Check': check_generate}
 if language not in languages.keys():
     sys.stderr.write('Language must be one of:\n')
     for l in languages:
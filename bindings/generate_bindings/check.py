@@ -0,0 +1,98 @@
+from __future__ import with_statement
+import os
+import re
+import sys
+
+from parse import LibrarySource
+from c import subroutine_c_names
+
+
+# Patterns used to find the routine names in each generated file type.
+# The C header and SWIG interface declare routines by their C name, the
+# C/Fortran wrapper binds to the C name and the Python module calls the
+# SWIG extension module routines by their C name.
+DECLARATION_RE = re.compile(
+    r'^\s*(?:IRON_C_EXPORT\s+)?cmfe_Error\s+([A-Z0-9_]+)\(',
+    re.IGNORECASE | re.MULTILINE)
+BIND_RE = re.compile(
+    r'BIND\(C,\s*NAME="([A-Z0-9_]+)"\)', re.IGNORECASE)
+PYTHON_CALL_RE = re.compile(
+    r'_wrap_routine\(_[A-Z0-9_]+\.([A-Z0-9_]+)\s*,', re.IGNORECASE)
+
+BINDING_FILE_TYPES = {
+    '.h': ('C header', DECLARATION_RE),
+    '.f90': ('C/Fortran wrapper', BIND_RE),
+    '.i': ('SWIG interface', DECLARATION_RE),
+    '.py': ('Python module', PYTHON_CALL_RE)}
+
+
+def generate(cm_path, args):
+    """Check generated binding files contain all public routines
+
+    Each argument is the path to a generated binding file, with the file
+    type determined by the extension. Any missing routines are written to
+    stdout and the exit status is non-zero if anything is missing.
+    """
+
+    if not args:
+        sys.stderr.write('Usage: %s cm_path Check binding_file ...\n'
+                % sys.argv[0])
+        exit(1)
+
+    library = LibrarySource(cm_path, routines_only=True)
+    expected = expected_c_names(library)
+
+    missing_count = 0
+    for path in args:
+        (description, binding_re) = binding_file_type(path)
+        with open(path, 'r') as binding_file:
+            found = binding_names(binding_file.read(), binding_re)
+        missing = missing_routines(expected, found)
+        if missing:
+            print('%d routines missing from %s %s:' %
+                    (len(missing), description, path))
+            for (routine_name, c_name) in missing:
+                print('  %s (%s)' % (routine_name, c_name))
+        else:
+            print('No routines missing from %s %s' % (description, path))
+        missing_count += len(missing)
+
+    if missing_count > 0:
+        exit(1)
+
+
+def binding_file_type(path):
+    """Return the description and routine name pattern for a binding file"""
+
+    extension = os.path.splitext(path)[1].lower()
+    try:
+        return BINDING_FILE_TYPES[extension]
+    except KeyError:
+        raise ValueError("Unknown binding file type for %s, extension must "
+                "be one of: %s" % (path, ', '.join(sorted(BINDING_FILE_TYPES))))
+
+
+def expected_c_names(library):
+    """Return a dictionary of the Fortran routine name for each C name"""
+
+    return dict((subroutine_c_names(routine)[0], routine.name)
+            for routine in library.public_subroutines)
+
+
+def binding_names(source, binding_re):
+    """Return the set of routine names found in a generated binding file"""
+
+    return set(binding_re.findall(source))
+
+
+def missing_routines(expected, found):
+    """Return a sorted list of (Fortran name, C name) tuples for routines
+    that are expected but not found
+
+    Arguments:
+    expected -- Dictionary of Fortran routine names keyed by C name
+    found -- Set of C names found in a binding file
+    """
+
+    return sorted((expected[c_name], c_name)
+            for c_name in set(expected).difference(found))
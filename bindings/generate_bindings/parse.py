@@ -170,25 +170,32 @@ class LibrarySource(object):
                             current_section = section
                             break
 
-    def __init__(self, cm_path):
+    def __init__(self, cm_path, routines_only=False):
         """Load library information from source files
 
         Arguments:
         cm_path -- Path to OpenCMISS iron directory
+        routines_only -- Only find the public routines, without resolving
+            constant values or reading routine parameters. This avoids
+            parsing every other source file so is much faster.
         """
 
         self.lib_source = self.SourceFile(
             os.sep.join((cm_path, 'src', 'opencmiss_iron.f90')))
         cm_source_path = cm_path + os.sep + 'src'
-        source_files = [
-                cm_source_path + os.sep + file_name
-                for file_name in os.listdir(cm_source_path)
-                if file_name.endswith('.f90') and file_name != 'opencmiss_iron.f90']
-        self.sources = [
-                self.SourceFile(source, params_only=True)
-                for source in source_files]
+        if routines_only:
+            self.sources = []
+        else:
+            source_files = [
+                    cm_source_path + os.sep + file_name
+                    for file_name in os.listdir(cm_source_path)
+                    if file_name.endswith('.f90') and
+                    file_name != 'opencmiss_iron.f90']
+            self.sources = [
+                    self.SourceFile(source, params_only=True)
+                    for source in source_files]
 
-        self.resolve_constants()
+            self.resolve_constants()
 
         # Get all public types, constants and routines to include
         # Store all objects to be output in a dictionary with the line number
@@ -217,14 +224,31 @@ class LibrarySource(object):
             self.public_subroutines, key=attrgetter('name'))
         # Remove cmfe...TypesCopy routines, as these are only used within the
         # C bindings.  Also remove cmfe_GeneratedMeshSurfaceGet for now as it
-        # takes an allocatable array but will be removed soon anyways.
+        # takes an allocatable array but will be removed soon anyways, and
+        # cmfe_CellML_BatchRHSRoutineSet as it takes a C function pointer.
         self.public_subroutines = list(filter(
                 lambda r:
                 not (r.name.startswith('cmfe_GeneratedMesh_SurfaceGet') or
+                r.name.startswith('cmfe_CellML_BatchRHSRoutineSet') or
                 r.name.endswith('TypesCopy')),
                 self.public_subroutines))
 
         self.unbound_routines = []
+        if not routines_only:
+            self.bind_routines()
+
+        for routine in self.public_subroutines:
+            public_objects[routine.line_number] = routine
+
+        for doxygen_grouping in self.lib_source.doxygen_groupings:
+            public_objects[doxygen_grouping.line_number] = doxygen_grouping
+
+        self.ordered_objects = [public_objects[k]
+            for k in sorted(public_objects.keys())]
+
+    def bind_routines(self):
+        """Read routine parameters and attach methods to their classes"""
+
         for routine in self.public_subroutines:
             routine.get_parameters()
             owner_class = routine.get_class()
@@ -238,15 +262,6 @@ class LibrarySource(object):
             else:
                 self.unbound_routines.append(routine)
 
-        for routine in self.public_subroutines:
-            public_objects[routine.line_number] = routine
-
-        for doxygen_grouping in self.lib_source.doxygen_groupings:
-            public_objects[doxygen_grouping.line_number] = doxygen_grouping
-
-        self.ordered_objects = [public_objects[k]
-            for k in sorted(public_objects.keys())]
-
     def resolve_constants(self):
         """Go through all public constants and work out their actual values"""
 
@@ -1,5 +1,5 @@
 from unittest import TestLoader, TextTestRunner, TestSuite
-from tests import test_parse, test_c, test_swig, test_python
+from tests import test_parse, test_c, test_swig, test_python, test_check
 
 
 if __name__ == "__main__":
@@ -8,7 +8,8 @@ if __name__ == "__main__":
         loader.loadTestsFromTestCase(test_parse.ParseTestClass),
         loader.loadTestsFromTestCase(test_c.CTestClass),
         loader.loadTestsFromTestCase(test_swig.SWIGTestClass),
-        loader.loadTestsFromTestCase(test_python.PythonTestClass)))
+        loader.loadTestsFromTestCase(test_python.PythonTestClass),
+        loader.loadTestsFromTestCase(test_check.CheckTestClass)))
 
     runner = TextTestRunner(verbosity=2)
     runner.run(suite)
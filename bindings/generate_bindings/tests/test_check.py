@@ -0,0 +1,61 @@
+import unittest
+
+from check import *
+from tests import mocks as m
+
+
+class CheckTestClass(unittest.TestCase):
+    def setUp(self):
+        self.library = m.Mock(public_subroutines=[
+            m.Mock(name="cmfe_Routine_DoSomethingObj"),
+            m.Mock(name="cmfe_Routine_DoSomethingNumber"),
+            m.Mock(name="cmfe_Routine_OtherThing1")])
+        self.expected = expected_c_names(self.library)
+
+    def test_expected_names(self):
+        """Test routines are checked by the name used from C"""
+
+        self.assertEqual(self.expected, {
+            "cmfe_Routine_DoSomething": "cmfe_Routine_DoSomethingObj",
+            "cmfe_Routine_DoSomethingNum": "cmfe_Routine_DoSomethingNumber",
+            "cmfe_Routine_OtherThing": "cmfe_Routine_OtherThing1"})
+
+    def test_binding_names(self):
+        """Test routine names are found in each type of binding file"""
+
+        header = ("/*> Comment */\n"
+            "IRON_C_EXPORT cmfe_Error cmfe_Routine_DoSomething("
+            "const int test /*< Test */);\n")
+        swig = "cmfe_Error cmfe_Routine_DoSomethingNum(const int test);\n"
+        wrapper = ("  FUNCTION cmfe_Routine_DoSomethingC(testPtr,"
+            "cmfe_Routine_DoSomethingC) &\n"
+            '    & BIND(C, NAME="cmfe_Routine_DoSomething")\n')
+        module = ("    return _wrap_routine("
+            "_iron_python.cmfe_Routine_OtherThing, [test])\n")
+        self.assertEqual(
+            binding_names(header, binding_file_type("iron.h")[1]),
+            set(["cmfe_Routine_DoSomething"]))
+        self.assertEqual(
+            binding_names(swig, binding_file_type("iron_generated.i")[1]),
+            set(["cmfe_Routine_DoSomethingNum"]))
+        self.assertEqual(
+            binding_names(wrapper, binding_file_type("iron_c.f90")[1]),
+            set(["cmfe_Routine_DoSomething"]))
+        self.assertEqual(
+            binding_names(module, binding_file_type("iron.py")[1]),
+            set(["cmfe_Routine_OtherThing"]))
+        self.assertRaises(ValueError, binding_file_type, "iron.txt")
+
+    def test_missing_routines(self):
+        """Test missing routines are reported with their Fortran name"""
+
+        found = set(["cmfe_Routine_DoSomething", "cmfe_Routine_Unknown"])
+        self.assertEqual(missing_routines(self.expected, found), [
+            ("cmfe_Routine_DoSomethingNumber", "cmfe_Routine_DoSomethingNum"),
+            ("cmfe_Routine_OtherThing1", "cmfe_Routine_OtherThing")])
+        self.assertEqual(
+            missing_routines(self.expected, set(self.expected)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
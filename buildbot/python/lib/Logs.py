@@ -28,13 +28,103 @@ class ShellCommandWithHtmlLog(shell.ShellCommand):
        self.addHTMLLog('results', content)
 
 import xml.etree.ElementTree as ET
-from xml.etree.ElementTree import XMLParser
+from io import BytesIO
 import os
+import re
+
+class HtmlTreeSummary(object):
+     """Summarise the nose html test results in a single streaming pass.
+     Failure status is propagated up from each element as it is closed,
+     so every element is only visited once."""
+
+     steps = (("Building the test", "build"),
+              ("Running the test", "execute"),
+              ("Checking the output", "check"))
+     duration_re = re.compile(r'([0-9]+(?:\.[0-9]*)?)\s*(?:s|sec|secs|seconds)\b')
+
+     def __init__(self) :
+       self.library_failed = False
+       self.fails = dict((kind, []) for (text, kind) in self.steps)
+       self.examples = []
+       self.durations = {}
+
+     def stepKind(self, text) :
+       if text is None :
+         return None
+       for (step_text, kind) in self.steps :
+         if text.find(step_text) != -1 :
+           return kind
+       return None
+
+     def parse(self, content) :
+       if not isinstance(content, bytes) :
+         content = content.encode("utf-8")
+       content = content.replace(b"&nbsp;", b"")
+       stack = []
+       failed_flags = []
+       library_build = None
+       for (event, elem) in ET.iterparse(BytesIO(content), events=("start", "end")) :
+         if event == "start" :
+           # The first item in the top level list is the library build
+           if (library_build is None and elem.tag == "li" and len(stack) >= 2
+               and stack[-1].tag == "ul" and stack[-2].tag == "body") :
+             library_build = elem
+           stack.append(elem)
+           failed_flags.append(False)
+           continue
+         stack.pop()
+         failed = failed_flags.pop() or elem.text == "FAIL"
+         if failed and failed_flags :
+           failed_flags[-1] = True
+         if elem is library_build :
+           self.library_failed = failed
+         elif elem.tag == "li" :
+           kind = self.stepKind(elem.text)
+           if kind is not None and len(stack) >= 2 :
+             self.addStep(kind, elem, stack[-2].text)
+             elem.clear()
+
+     def addStep(self, kind, item, example) :
+       example = (example or "").strip()
+       if item.findtext("a") == "FAIL" and len(item) > 1 :
+         link = list(item)[1]
+         fail = ET.Element("a", dict(link.attrib))
+         fail.text = example
+         self.fails[kind].append(fail)
+       match = self.duration_re.search("".join(item.itertext()))
+       if match :
+         if example not in self.durations :
+           self.examples.append(example)
+           self.durations[example] = {}
+         self.durations[example][kind] = (
+           self.durations[example].get(kind, 0.0) + float(match.group(1)))
+
+     def fillTable(self, table, links) :
+       for start in range(0, len(links), 5) :
+         tr = ET.SubElement(table, "tr")
+         for link in links[start:start+5] :
+           td = ET.SubElement(tr, "td", width="20%")
+           td.append(link)
+
+     def durationsTable(self) :
+       """Table of build, run and check times for each example, slowest first"""
+       table = ET.Element("table", id="durations", width="100%")
+       header = ET.SubElement(table, "tr")
+       for title in ["Example"] + [text for (text, kind) in self.steps] + ["Total (s)"] :
+         ET.SubElement(header, "th").text = title
+       totals = [(sum(self.durations[e].values()), e) for e in self.examples]
+       for (total, example) in sorted(totals, key=lambda t: -t[0]) :
+         tr = ET.SubElement(table, "tr")
+         ET.SubElement(tr, "td").text = example
+         for (text, kind) in self.steps :
+           duration = self.durations[example].get(kind)
+           ET.SubElement(tr, "td").text = "" if duration is None else "%.1f" % duration
+         ET.SubElement(tr, "td").text = "%.1f" % total
+       return table
 
 class ShellCommandWithHtmlTree(shell.ShellCommand):
-     bcount = 0
-     ecount = 0
-     ccount = 0
+     # Templates are only read from disk once
+     templates = {}
 
      def evaluateCommand(self, cmd):
       if ("FAIL" in self.getLog("results").getText()) :
@@ -42,93 +132,46 @@ class ShellCommandWithHtmlTree(shell.ShellCommand):
       else:
         return SUCCESS
 
-     def isFailed(self,item) :
-       if item.text=="FAIL":
-         return True
-       else :
-         for i in list(item) :
-           if self.isFailed(i) :
-             return True
-         return False
-
-     def operate(self,item,build,execute,check,parent=None):
-       for i in list(item) : 
-         if (i.tag=="li" and i.text.find("Building the test")!=-1) :
-           if i.findtext("a")=="FAIL" :
-             if (self.bcount%5==0 or self.btr==None) :
-               self.btr=ET.Element("tr")
-               build.append(self.btr)
-             btd = ET.Element("td",width="20%")
-             ba = list(i)[1]
-             ba.text = parent.text
-             btd.append(ba)
-             self.btr.append(btd)
-             self.bcount=self.bcount+1
-         elif (i.tag=="li" and i.text.find("Running the test")!=-1) :
-           if i.findtext("a")=="FAIL" :
-             if (self.ecount%5==0 or self.etr==None) :
-               self.etr=ET.Element("tr")
-               execute.append(self.etr)
-             etd = ET.Element("td",width="20%")
-             ea = list(i)[1]
-             ea.text = parent.text
-             etd.append(ea)
-             self.etr.append(etd)
-             self.ecount=self.ecount+1
-         elif (i.tag=="li" and i.text.find("Checking the output")!=-1) :
-           if i.findtext("a")=="FAIL" :
-             if (self.ccount%5==0 or self.ctr==None) :
-               self.ctr=ET.Element("tr")
-               check.append(self.ctr)
-             ctd = ET.Element("td",width="20%")
-             ca = list(i)[1]
-             ca.text = parent.text
-             ctd.append(ca)
-             self.ctr.append(ctd)
-             self.ccount=self.ccount+1
-         else :
-           self.operate(i,build,execute,check,item)
-
-
-     def extractFails(self,content) :
-       tree = ET.fromstring(content.replace("&nbsp;",""))
-       ulelem = tree.find("body/ul")
-       library_build = list(ulelem)[0]
-       if (self.isFailed(library_build)) :
-         outputContent = open("public_html/library_fail.html").read()
-         outputtree = ET.fromstring(outputContent)
+     def loadTemplate(self, name) :
+       if name not in self.templates :
+         self.templates[name] = open(os.path.join("public_html", name)).read()
+       return ET.fromstring(self.templates[name])
+
+     def extractFails(self, summary) :
+       if summary.library_failed :
+         outputtree = self.loadTemplate("library_fail.html")
        else :
-         outputContent = open("public_html/other_fails.html").read()
-         outputtree = ET.fromstring(outputContent)
+         outputtree = self.loadTemplate("other_fails.html")
+         body = outputtree.find("body")
          for table in outputtree.findall("body/table") :
-           if (table.get("id")=="execute") :
-             outputexecute = table
-           elif (table.get("id")=="build") :
-             outputbuild = table
-           elif (table.get("id")=="check") :
-             outputcheck = table
-         self.operate(ulelem, outputbuild,outputexecute,outputcheck)
-         if self.bcount == 0 :
-           outputtree.find("body").remove(outputbuild)
-         if self.ecount == 0 :
-           outputtree.find("body").remove(outputexecute)
-         if self.ccount == 0 :
-           outputtree.find("body").remove(outputcheck)
-         self.addHTMLLog('fails', ET.tostring(outputtree))
-   
+           kind = table.get("id")
+           if kind in summary.fails :
+             if summary.fails[kind] :
+               summary.fillTable(table, summary.fails[kind])
+             else :
+               body.remove(table)
+       self.addHTMLLog('fails', ET.tostring(outputtree))
 
      def createSummary(self, log):
        content =  log.getText()
        content += "</body></html>"
        self.addHTMLLog('results', content)
-       if ("Fail" in content) :
-         self.extractFails(content)
+       summary = HtmlTreeSummary()
+       summary.parse(content)
+       if summary.library_failed or any(summary.fails.values()) :
+         self.extractFails(summary)
+       if summary.examples :
+         durations = ET.Element("html")
+         ET.SubElement(ET.SubElement(durations, "head"), "title").text = "Test durations"
+         ET.SubElement(durations, "body").append(summary.durationsTable())
+         self.addHTMLLog('durations', ET.tostring(durations))
 
 
 
 class ShellCommandToCheckMissingRoutines(shell.ShellCommand):
+     # The bindings check exits with a non-zero status if any routines are missing
      def evaluateCommand(self, cmd):
-      if ("No functions missing in opencmiss_c.f90" in self.getLog("stdio").getText()) and ("No functions missing in opencmiss.h" in self.getLog("stdio").getText()):
+      if cmd.rc == 0:
         return SUCCESS
       else:
         return FAILURE
@@ -1,8 +1,9 @@
 set(IRON_C_SRC
-    #binary_file_c.c
+    binary_file_c.c
     cmiss_c.c
     external_dae_solver_routines.c
     FieldExport.c
+    FieldImport.c
     timer_c.c
 )
 set(IRON_HEADERS
@@ -16,7 +17,7 @@ set(IRON_Fortran_SRC
     analytic_analysis_routines.f90
     base_routines.f90
     basis_routines.f90
-    #binary_file_f.f90
+    binary_file_f.f90
     biodomain_equation_routines.f90
     bioelectric_finite_elasticity_routines.f90
     bioelectric_routines.f90
@@ -24,6 +25,7 @@ set(IRON_Fortran_SRC
     boundary_condition_routines.f90
     Burgers_equation_routines.f90
     characteristic_equation_routines.f90
+    checkpoint_routines.f90
     classical_field_routines.f90
     cmiss_cellml.f90
     cmiss_fortran_c.f90
@@ -66,6 +68,7 @@ set(IRON_Fortran_SRC
     fsi_routines.f90
     generated_mesh_routines.f90
     Hamilton_Jacobi_equations_routines.f90
+    hash_sets.f90
     Helmholtz_equations_routines.f90
     #Helmholtz_TEMPLATE_equations_routines.f90
     history_routines.f90
@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 
 def getLatest(path) :
   latest = -1
@@ -9,18 +11,20 @@ def getLatest(path) :
         i = int(filenames[0])
       except ValueError:
         i = 0
-    if latest < i :
-      latest = i
+      if latest < i :
+        latest = i
   return str(latest)
 
 linux_intel_latest = getLatest('/home/autotest/opencmiss-build/buildmaster/intel/OpenCMISS')
 linux_gnu_latest = getLatest('/home/autotest/opencmiss-build/buildmaster/gnu/OpenCMISS')
 
+# Pass the aliases to doxygen on stdin rather than appending them to the
+# Doxyfile. This is a full build into Programmer/html, which the relocate
+# target and the examples processing expect.
 text = 'ALIASES += linux_intel_latest="'+linux_intel_latest+'"\nALIASES += linux_gnu_latest="'+linux_gnu_latest+'"\n'
 
-file =open('Doxyfile', 'a')
-file.write(text)
-file.close()
-
-os.system("doxygen Doxyfile")
-
+with open('Doxyfile', 'r') as doxyfile:
+  config = doxyfile.read()
+process = subprocess.Popen(['doxygen', '-'], stdin=subprocess.PIPE)
+process.communicate((config+'\n'+text).encode('utf-8'))
+sys.exit(process.returncode)
@@ -1,68 +1,88 @@
-from sgmllib import SGMLParser
-import htmlentitydefs
-
-class BaseHTMLProcessor(SGMLParser):
-
-	def reset(self):
-		# extend (called by SGMLParser.__init__)
-		self.pieces = []
-		self.buffer = ""
-		self.parents = []
-		SGMLParser.reset(self)
-		
-	def unknown_starttag(self, tag, attrs):
-		strattrs = "".join([' %s="%s"' % (key, value) for key, value in attrs])
-		if tag=='a' :
-			self.buffer = "<%(tag)s%(strattrs)s>" % locals()
-		elif tag != 'li':
-			self.pieces.append("<%(tag)s%(strattrs)s>" % locals())
-		
-	def unknown_endtag(self, tag):
-		if tag != 'li' :
-			self.pieces.append("</%(tag)s>" % locals())
-
-	def handle_charref(self, ref):
-		self.pieces.append("&#%(ref)s;" % locals())
-		
-	def handle_entityref(self, ref):
-		self.pieces.append("&%(ref)s" % locals())
-		if htmlentitydefs.entitydefs.has_key(ref):
-			self.pieces.append(";")
-
-	def handle_data(self, text):
-		rmindex=text.find('/src/')
-		if rmindex>0:
-			text=text[:rmindex]
-			texts = text.split('/')
-			for i in range (0,len(self.parents)) :
-			  if(texts[i]!=self.parents[i]) :
-			    for j in range (i, len(self.parents)) :
-			  		self.pieces.append("</li></ul>")
-			    self.parents = self.parents[:i]
-			    break
-			self.pieces.append("<li>")
-			for i in range (len(self.parents),len(texts)-1) :
-				self.parents.append(texts[i])
-				self.pieces.append(texts[i]+"<ul><li>")
-			self.pieces.append(self.buffer)
-			self.buffer=""
-			self.pieces.append(texts[len(texts)-1])
-		else :
-			self.pieces.append(text)
-		
-	def handle_comment(self, text):
-		self.pieces.append("<!--%(text)s-->" % locals())
-		
-	def handle_pi(self, text):
-		self.pieces.append("<?%(text)s>" % locals())
-
-	def handle_decl(self, text):
-		self.pieces.append("<!%(text)s>" % locals())
-		
-	def output(self):
-		"""Return processed HTML as a single string"""
-		return "".join(self.pieces)
-
-if __name__ == "__main__":
-	for k, v in globals().items():
-		print k, "=", v
+try:
+    from html.parser import HTMLParser
+except ImportError:
+    from HTMLParser import HTMLParser
+
+
+class BaseHTMLProcessor(HTMLParser):
+    """Rewrite the doxygen examples list as a nested list of directories
+
+    The processed HTML is written to output as it is parsed, so the input
+    can be fed in blocks without holding the whole document in memory.
+    """
+
+    def __init__(self, output):
+        HTMLParser.__init__(self)
+        self.convert_charrefs = False
+        self.output = output
+        self.buffer = ""
+        self.data = []
+        self.parents = []
+
+    def write(self, text):
+        self.flush_data()
+        self.output.write(text)
+
+    def handle_starttag(self, tag, attrs):
+        strattrs = "".join([' %s="%s"' % (key, value) for key, value in attrs])
+        if tag == 'a':
+            self.flush_data()
+            self.buffer = "<%s%s>" % (tag, strattrs)
+        elif tag != 'li':
+            self.write("<%s%s>" % (tag, strattrs))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag != 'li':
+            self.write("</%s>" % tag)
+
+    def handle_charref(self, ref):
+        self.write("&#%s;" % ref)
+
+    def handle_entityref(self, ref):
+        self.write("&%s;" % ref)
+
+    def handle_data(self, text):
+        # Data may be split across several calls, so process it once the
+        # next tag is reached
+        self.data.append(text)
+
+    def flush_data(self):
+        if not self.data:
+            return
+        text = "".join(self.data)
+        self.data = []
+        rmindex = text.find('/src/')
+        if rmindex > 0:
+            text = text[:rmindex]
+            texts = text.split('/')
+            for i in range(0, len(self.parents)):
+                if texts[i] != self.parents[i]:
+                    for j in range(i, len(self.parents)):
+                        self.output.write("</li></ul>")
+                    self.parents = self.parents[:i]
+                    break
+            self.output.write("<li>")
+            for i in range(len(self.parents), len(texts) - 1):
+                self.parents.append(texts[i])
+                self.output.write(texts[i] + "<ul><li>")
+            self.output.write(self.buffer)
+            self.buffer = ""
+            self.output.write(texts[len(texts) - 1])
+        else:
+            self.output.write(text)
+
+    def handle_comment(self, text):
+        self.write("<!--%s-->" % text)
+
+    def handle_pi(self, text):
+        self.write("<?%s>" % text)
+
+    def handle_decl(self, text):
+        self.write("<!%s>" % text)
+
+    def close(self):
+        HTMLParser.close(self)
+        self.flush_data()
@@ -1,10 +1,10 @@
-import urllib 
-from BaseHTMLProcessor import BaseHTMLProcessor
-                                      
-sock = urllib.urlopen("../Programmer/html/examples.html") 
-htmlSource = sock.read()                            
-sock.close() 
-parser = BaseHTMLProcessor()
-parser.feed(htmlSource)    
-f = open('../Programmer/html/examples1.html', 'w')
-f.write(parser.output())                           
\ No newline at end of file
+from BaseHTMLProcessor import BaseHTMLProcessor
+
+BLOCK_SIZE = 1 << 16
+
+with open("../Programmer/html/examples.html", "r") as source:
+    with open("../Programmer/html/examples1.html", "w") as output:
+        parser = BaseHTMLProcessor(output)
+        for block in iter(lambda: source.read(BLOCK_SIZE), ""):
+            parser.feed(block)
+        parser.close()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+
+"""
+Incremental build of the programmer documentation
+
+Rather than running doxygen over the whole source tree, each source file in
+src, the additional_doc directory and each example directory is documented
+as a separate module with its own HTML output directory and tag file. The
+other modules' tag files are used to link between modules.
+
+A hash of each module's files is recorded after it is built, and only
+modules whose hash has changed are rebuilt. This is done in two passes:
+first the tag files of the changed modules are regenerated, then their HTML
+is generated against the updated tag files. Finally all tag files are
+merged into a single tag file for the whole library, and an index page
+linking to every module is written.
+
+Changing the Doxyfile or this script causes everything to be rebuilt, as
+does the --full option. Changing the extra configuration only rebuilds the
+additional documentation.
+
+Usage: incremental_build.py [options] [extra_config_line ...]
+
+Any extra arguments are appended to the doxygen configuration, eg.
+  'ALIASES = linux_gnu_latest="123"'
+"""
+
+import hashlib
+import json
+import optparse
+import os
+import shutil
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+
+
+SOURCE_DIR = os.path.join('..', '..', 'src')
+ADDITIONAL_DOC_DIR = 'additional_doc'
+EXAMPLES_DIR = os.path.join('..', '..', 'examples')
+SOURCE_EXTENSIONS = ('.f90', '.c', '.h')
+
+INDEX_TEMPLATE = """<html><head>
+<title>%(project)s Programmer Documentation</title>
+</head><body>
+<h1>%(project)s Programmer Documentation</h1>
+<ul>
+%(modules)s
+</ul>
+</body></html>
+"""
+
+
+def find_modules():
+    """Return a dictionary of the list of input paths for each module"""
+
+    modules = {}
+    if os.path.isdir(SOURCE_DIR):
+        for file_name in sorted(os.listdir(SOURCE_DIR)):
+            if file_name.endswith(SOURCE_EXTENSIONS):
+                modules[file_name.replace('.', '_')] = [
+                    os.path.join(SOURCE_DIR, file_name)]
+    if os.path.isdir(ADDITIONAL_DOC_DIR):
+        modules['additional_doc'] = [ADDITIONAL_DOC_DIR]
+    if os.path.isdir(EXAMPLES_DIR):
+        for dir_name in sorted(os.listdir(EXAMPLES_DIR)):
+            path = os.path.join(EXAMPLES_DIR, dir_name)
+            if os.path.isdir(path) and not dir_name.startswith('.'):
+                modules['example_' + dir_name] = [path]
+    return modules
+
+
+def module_files(paths):
+    """List all files in a module, searching directories recursively"""
+
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for (dir_path, dir_names, file_names) in os.walk(path):
+                dir_names[:] = sorted(
+                    d for d in dir_names if not d.startswith('.'))
+                files.extend(os.path.join(dir_path, f)
+                    for f in sorted(file_names))
+        else:
+            files.append(path)
+    return files
+
+
+def hash_files(files, config_hash):
+    sha = hashlib.sha1(config_hash.encode('utf-8'))
+    for file_path in files:
+        sha.update(file_path.encode('utf-8'))
+        with open(file_path, 'rb') as input_file:
+            for block in iter(lambda: input_file.read(1 << 20), b''):
+                sha.update(block)
+    return sha.hexdigest()
+
+
+class ModuleBuilder(object):
+    """Runs doxygen for a single module"""
+
+    def __init__(self, doxyfile, output_dir, extra_config, doxygen):
+        with open(doxyfile, 'r') as config_file:
+            self.base_config = config_file.read()
+        self.output_dir = output_dir
+        self.tag_dir = os.path.join(output_dir, 'tags')
+        self.extra_config = extra_config
+        self.doxygen = doxygen
+
+    def tag_file(self, name):
+        return os.path.join(self.tag_dir, name + '.tag')
+
+    def run(self, name, paths, generate_html, tag_modules):
+        """Run doxygen for a module, reading the configuration from stdin so
+        the Doxyfile is never modified"""
+
+        config = [self.base_config]
+        config.extend(self.extra_config)
+        config.append('INPUT = %s' % ' '.join('"%s"' % p for p in paths))
+        config.append('OUTPUT_DIRECTORY = "%s"' % self.output_dir)
+        config.append('HTML_OUTPUT = "%s"' % name)
+        config.append('GENERATE_HTML = %s' % ('YES' if generate_html else 'NO'))
+        config.append('GENERATE_TAGFILE = "%s"' % self.tag_file(name))
+        # Each module's HTML is in a sibling directory of this one
+        tag_files = ['"%s=../%s"' % (self.tag_file(other), other)
+            for other in tag_modules
+            if other != name and os.path.isfile(self.tag_file(other))]
+        config.append('TAGFILES = %s' % ' '.join(tag_files))
+        process = subprocess.Popen([self.doxygen, '-'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT)
+        (output, _) = process.communicate(
+            '\n'.join(config + ['']).encode('utf-8'))
+        return (name, process.returncode, output.decode('utf-8', 'replace'))
+
+
+def merge_tag_files(tag_files, merged_path):
+    """Combine all compounds from the module tag files into one tag file"""
+
+    merged = ET.Element('tagfile')
+    for tag_file in tag_files:
+        if not os.path.isfile(tag_file):
+            continue
+        for (_, element) in ET.iterparse(tag_file):
+            if element.tag == 'tagfile':
+                merged.extend(list(element))
+    ET.ElementTree(merged).write(merged_path, encoding='utf-8')
+
+
+def write_index(output_dir, project, modules):
+    items = '\n'.join('<li><a href="%s/index.html">%s</a></li>' % (name, name)
+        for name in sorted(modules))
+    with open(os.path.join(output_dir, 'index.html'), 'w') as index:
+        index.write(INDEX_TEMPLATE % {'project': project, 'modules': items})
+
+
+def build(options, extra_config):
+    modules = find_modules()
+    builder = ModuleBuilder(options.doxyfile, options.output_dir,
+        extra_config, options.doxygen)
+    if not os.path.isdir(builder.tag_dir):
+        os.makedirs(builder.tag_dir)
+
+    script_path = os.path.splitext(os.path.abspath(__file__))[0] + '.py'
+    with open(script_path, 'rb') as script:
+        config_hash = hashlib.sha1(builder.base_config.encode('utf-8') +
+            script.read()).hexdigest()
+    hashes_path = os.path.join(options.output_dir, 'module_hashes.json')
+    previous_hashes = {}
+    if os.path.isfile(hashes_path) and not options.full:
+        with open(hashes_path, 'r') as hashes_file:
+            previous_hashes = json.load(hashes_file)
+
+    hashes = dict((name, hash_files(module_files(paths), config_hash))
+        for (name, paths) in modules.items())
+    # Extra configuration such as aliases for the latest build numbers
+    # changes often but only affects the additional documentation pages
+    if ADDITIONAL_DOC_DIR in hashes:
+        hashes[ADDITIONAL_DOC_DIR] = hashlib.sha1((hashes[ADDITIONAL_DOC_DIR] +
+            '\n'.join(extra_config)).encode('utf-8')).hexdigest()
+    changed = sorted(name for name in modules
+        if previous_hashes.get(name) != hashes[name])
+    removed = sorted(set(previous_hashes) - set(modules))
+    for name in removed:
+        shutil.rmtree(os.path.join(options.output_dir, name), True)
+        if os.path.isfile(builder.tag_file(name)):
+            os.remove(builder.tag_file(name))
+    sys.stdout.write('%d of %d modules changed, %d removed\n' %
+        (len(changed), len(modules), len(removed)))
+    if not changed and not removed:
+        return 0
+
+    pool = ThreadPool(options.jobs)
+    failed = set()
+    try:
+        for (generate_html, description) in ((False, 'tags'), (True, 'html')):
+            results = pool.map(lambda name: builder.run(name, modules[name],
+                generate_html, modules), changed)
+            for (name, returncode, output) in results:
+                if options.verbose or returncode != 0:
+                    sys.stdout.write(output)
+                if returncode != 0:
+                    sys.stderr.write('Error generating %s for %s\n' %
+                        (description, name))
+                    failed.add(name)
+    finally:
+        pool.close()
+        pool.join()
+
+    merge_tag_files([builder.tag_file(name) for name in sorted(modules)],
+        os.path.join(options.output_dir, options.tag_file))
+    write_index(options.output_dir, options.project, modules)
+
+    # Failed modules will be rebuilt next time
+    for name in failed:
+        hashes.pop(name)
+    with open(hashes_path, 'w') as hashes_file:
+        json.dump(hashes, hashes_file, indent=0, sort_keys=True)
+    return 1 if failed else 0
+
+
+def main(argv):
+    parser = optparse.OptionParser(
+        usage='%prog [options] [extra_config_line ...]')
+    parser.add_option('-f', '--doxyfile', default='Doxyfile',
+        help='base doxygen configuration (default: %default)')
+    parser.add_option('-o', '--output-dir',
+        default=os.path.join('Programmer', 'modules'),
+        help='output directory (default: %default)')
+    parser.add_option('--tag-file', default='OpenCMISS.tag',
+        help='name of the merged tag file (default: %default)')
+    parser.add_option('--project', default='OpenCMISS',
+        help='project name used in the index page (default: %default)')
+    parser.add_option('--doxygen', default='doxygen',
+        help='doxygen executable (default: %default)')
+    parser.add_option('-j', '--jobs', type='int', default=cpu_count(),
+        help='number of doxygen processes to run at once (default: %default)')
+    parser.add_option('--full', action='store_true', default=False,
+        help='rebuild all modules')
+    parser.add_option('-v', '--verbose', action='store_true', default=False,
+        help='show doxygen output for all modules')
+    (options, extra_config) = parser.parse_args(argv)
+    return build(options, extra_config)
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -47,6 +47,12 @@
 #else
 #include <stdarg.h>
 #endif
+#include <math.h>
+#include <stdint.h>
+#ifndef WIN32
+#include <pthread.h>
+#define USE_ASYNCHRONOUS_WRITER
+#endif
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
@@ -150,6 +156,40 @@ typedef struct
 #endif
 
     int error;
+
+    /*
+        Output is formatted into the buffer and written to the file in FIELD_EXPORT_BUFFER_SIZE blocks. Asynchronous sessions
+        hand each full buffer to the writer thread instead of writing it themselves.
+    */
+    int isAsynchronous;
+
+    char *buffer;
+    size_t bufferLength;
+
+    int lastNodeNumber;
+
+    /*
+        Binary sessions only. The header text is gathered up and written to the JSON index file along with the nodes each
+        header applies to, while the node values are written as raw doubles to a separate values file.
+    */
+    FILE *valuesFile;
+
+    char *valuesBuffer;
+    size_t valuesBufferLength;
+
+    char *header;
+    size_t headerLength;
+    size_t headerSize;
+
+    char *blockHeader;
+    long long blockValueOffset;
+    int *blockNodes;
+    int *blockValueCounts;
+    int blockNodeCount;
+    int blockNodeSize;
+    int blockCount;
+
+    long long valueCount;
 }
 FileSession;
 
@@ -168,11 +208,60 @@ typedef struct _SessionListEntry
 }
 SessionListEntry;
 
+#define FIELD_EXPORT_BUFFER_SIZE ( 1 << 20 )
+
+//Room for a separator and a double formatted by FieldExport_FormatDouble.
+#define FIELD_EXPORT_DOUBLE_SIZE 64
+
 //This is the head of the session list. For convenience, the head itself is a stub, so it exists even for a zero-entry list.
 static SessionListEntry sessions;
 
 static int nextHandle = 0;
 
+/*
+    The writer thread for asynchronous sessions. Full session buffers are queued, in order, and written out in the
+    background, so that the caller can carry on as soon as the values have been formatted into a buffer. At most
+    FIELD_EXPORT_WRITER_QUEUE_SIZE buffers can be waiting to be written; beyond that the session blocks until one has
+    been written. Write errors are held until FieldExport_Wait is called.
+*/
+#define FIELD_EXPORT_WRITER_QUEUE_SIZE 16
+
+typedef struct _WriterJob
+{
+    FILE *file;
+
+    //The buffer to write, which the writer frees, or NULL to close the file.
+    char *buffer;
+    size_t length;
+
+    struct _WriterJob *next;
+}
+WriterJob;
+
+static int isAsynchronousExport = 0;
+
+#ifdef USE_ASYNCHRONOUS_WRITER
+static struct
+{
+    int isStarted;
+    pthread_t thread;
+    pthread_mutex_t mutex;
+    pthread_cond_t jobQueued;
+    pthread_cond_t jobFinished;
+
+    WriterJob *first;
+    WriterJob *last;
+    int bufferCount;
+    int jobCount;
+
+    int error;
+}
+writer = { 0, 0, PTHREAD_MUTEX_INITIALIZER, PTHREAD_COND_INITIALIZER, PTHREAD_COND_INITIALIZER, NULL, NULL, 0, 0,
+    FIELD_EXPORT_NO_ERROR };
+#endif
+
+int FieldExport_Wait( void );
+
 #ifdef USE_HDF5
 static void eep()
 {
@@ -188,6 +277,550 @@ static void eep()
 #endif
 
 
+static int FieldExport_Binary_HeaderPrintf( FileSession *const session, const char *format, va_list args )
+{
+    va_list argsCopy;
+    char *newHeader;
+    size_t newSize;
+    int length;
+
+    va_copy( argsCopy, args );
+    length = vsnprintf( NULL, 0, format, argsCopy );
+    va_end( argsCopy );
+    if( length < 0 )
+    {
+        return FIELD_EXPORT_ERROR_FILE_WRITE;
+    }
+
+    if( session->headerLength + length + 1 > session->headerSize )
+    {
+        newSize = 2 * session->headerSize;
+        if( newSize < session->headerLength + length + 1 )
+        {
+            newSize = session->headerLength + length + 1;
+        }
+        newHeader = realloc( session->header, newSize );
+        if( newHeader == NULL )
+        {
+            return FIELD_EXPORT_ERROR_OUT_OF_MEMORY;
+        }
+        session->header = newHeader;
+        session->headerSize = newSize;
+    }
+
+    vsnprintf( session->header + session->headerLength, length + 1, format, args );
+    session->headerLength += length;
+
+    return FIELD_EXPORT_NO_ERROR;
+}
+
+
+/*
+    Powers of ten for FieldExport_FormatDouble. Each entry is 10^p, for p a multiple of 8, as a 64 bit mantissa with its
+    top bit set and a binary exponent, rounded to nearest.
+*/
+static const struct
+{
+    uint64_t mantissa;
+    int exponent;
+}
+FieldExport_PowersOfTen[] =
+{
+    { 0xD1476E2C07286FAAULL, -1047 }, /* 1E-296 */
+    { 0x9BECCE62836AC577ULL, -1020 }, /* 1E-288 */
+    { 0xE858AD248F5C22CAULL,  -994 }, /* 1E-280 */
+    { 0xAD1C8EAB5EE43B67ULL,  -967 }, /* 1E-272 */
+    { 0x80FA687F881C7F8EULL,  -940 }, /* 1E-264 */
+    { 0xC0314325637A193AULL,  -914 }, /* 1E-256 */
+    { 0x8F31CC0937AE58D3ULL,  -887 }, /* 1E-248 */
+    { 0xD5605FCDCF32E1D7ULL,  -861 }, /* 1E-240 */
+    { 0x9EFA548D26E5A6E2ULL,  -834 }, /* 1E-232 */
+    { 0xECE53CEC4A314EBEULL,  -808 }, /* 1E-224 */
+    { 0xB080392CC4349DEDULL,  -781 }, /* 1E-216 */
+    { 0x8380DEA93DA4BC60ULL,  -754 }, /* 1E-208 */
+    { 0xC3F490AA77BD60FDULL,  -728 }, /* 1E-200 */
+    { 0x91FF83775423CC06ULL,  -701 }, /* 1E-192 */
+    { 0xD98DDAEE19068C76ULL,  -675 }, /* 1E-184 */
+    { 0xA21727DB38CB0030ULL,  -648 }, /* 1E-176 */
+    { 0xF18899B1BC3F8CA2ULL,  -622 }, /* 1E-168 */
+    { 0xB3F4E093DB73A093ULL,  -595 }, /* 1E-160 */
+    { 0x8613FD0145877586ULL,  -568 }, /* 1E-152 */
+    { 0xC7CABA6E7C5382C9ULL,  -542 }, /* 1E-144 */
+    { 0x94DB483840B717F0ULL,  -515 }, /* 1E-136 */
+    { 0xDDD0467C64BCE4A1ULL,  -489 }, /* 1E-128 */
+    { 0xA54394FE1EEDB8FFULL,  -462 }, /* 1E-120 */
+    { 0xF64335BCF065D37DULL,  -436 }, /* 1E-112 */
+    { 0xB77ADA0617E3BBCBULL,  -409 }, /* 1E-104 */
+    { 0x88B402F7FD75539BULL,  -382 }, /* 1E-96 */
+    { 0xCBB41EF979346BCAULL,  -356 }, /* 1E-88 */
+    { 0x97C560BA6B0919A6ULL,  -329 }, /* 1E-80 */
+    { 0xE2280B6C20DD5232ULL,  -303 }, /* 1E-72 */
+    { 0xA87FEA27A539E9A5ULL,  -276 }, /* 1E-64 */
+    { 0xFB158592BE068D2FULL,  -250 }, /* 1E-56 */
+    { 0xBB127C53B17EC159ULL,  -223 }, /* 1E-48 */
+    { 0x8B61313BBABCE2C6ULL,  -196 }, /* 1E-40 */
+    { 0xCFB11EAD453994BAULL,  -170 }, /* 1E-32 */
+    { 0x9ABE14CD44753B53ULL,  -143 }, /* 1E-24 */
+    { 0xE69594BEC44DE15BULL,  -117 }, /* 1E-16 */
+    { 0xABCC77118461CEFDULL,   -90 }, /* 1E-8 */
+    { 0x8000000000000000ULL,   -63 }, /* 1E+0 */
+    { 0xBEBC200000000000ULL,   -37 }, /* 1E+8 */
+    { 0x8E1BC9BF04000000ULL,   -10 }, /* 1E+16 */
+    { 0xD3C21BCECCEDA100ULL,    16 }, /* 1E+24 */
+    { 0x9DC5ADA82B70B59EULL,    43 }, /* 1E+32 */
+    { 0xEB194F8E1AE525FDULL,    69 }, /* 1E+40 */
+    { 0xAF298D050E4395D7ULL,    96 }, /* 1E+48 */
+    { 0x82818F1281ED44A0ULL,   123 }, /* 1E+56 */
+    { 0xC2781F49FFCFA6D5ULL,   149 }, /* 1E+64 */
+    { 0x90E40FBEEA1D3A4BULL,   176 }, /* 1E+72 */
+    { 0xD7E77A8F87DAF7FCULL,   202 }, /* 1E+80 */
+    { 0xA0DC75F1778E39D6ULL,   229 }, /* 1E+88 */
+    { 0xEFB3AB16C59B14A3ULL,   255 }, /* 1E+96 */
+    { 0xB2977EE300C50FE7ULL,   282 }, /* 1E+104 */
+    { 0x850FADC09923329EULL,   309 }, /* 1E+112 */
+    { 0xC646D63501A1511EULL,   335 }, /* 1E+120 */
+    { 0x93BA47C980E98CE0ULL,   362 }, /* 1E+128 */
+    { 0xDC21A1171D42645DULL,   388 }, /* 1E+136 */
+    { 0xA402B9C5A8D3A6E7ULL,   415 }, /* 1E+144 */
+    { 0xF46518C2EF5B8CD1ULL,   441 }, /* 1E+152 */
+    { 0xB616A12B7FE617AAULL,   468 }, /* 1E+160 */
+    { 0x87AA9AFF79042287ULL,   495 }, /* 1E+168 */
+    { 0xCA28A291859BBF93ULL,   521 }, /* 1E+176 */
+    { 0x969EB7C47859E744ULL,   548 }, /* 1E+184 */
+    { 0xE070F78D3927556BULL,   574 }, /* 1E+192 */
+    { 0xA738C6BEBB12D16DULL,   601 }, /* 1E+200 */
+    { 0xF92E0C3537826146ULL,   627 }, /* 1E+208 */
+    { 0xB9A74A0637CE2EE1ULL,   654 }, /* 1E+216 */
+    { 0x8A5296FFE33CC930ULL,   681 }, /* 1E+224 */
+    { 0xCE1DE40642E3F4B9ULL,   707 }, /* 1E+232 */
+    { 0x9991A6F3D6BF1766ULL,   734 }, /* 1E+240 */
+    { 0xE4D5E82392A40515ULL,   760 }, /* 1E+248 */
+    { 0xAA7EEBFB9DF9DE8EULL,   787 }, /* 1E+256 */
+    { 0xFE0EFB53D30DD4D8ULL,   813 }, /* 1E+264 */
+    { 0xBD49D14AA79DBC82ULL,   840 }, /* 1E+272 */
+    { 0x8D07E33455637EB3ULL,   867 }, /* 1E+280 */
+    { 0xD226FC195C6A2F8CULL,   893 }, /* 1E+288 */
+    { 0x9C935E00D4B9D8D2ULL,   920 }, /* 1E+296 */
+    { 0xE950DF20247C83FDULL,   946 }, /* 1E+304 */
+    { 0xADD57A27D29339F6ULL,   973 }, /* 1E+312 */
+    { 0x81842F29F2CCE376ULL,  1000 }, /* 1E+320 */
+    { 0xC0FE908895CF3B44ULL,  1026 }, /* 1E+328 */
+    { 0x8FCAC257558EE4E6ULL,  1053 }, /* 1E+336 */
+};
+
+#define FIELD_EXPORT_FIRST_POWER_OF_TEN -296
+
+
+//Multiplies two mantissas with their top bits set, returning the top 64 bits of the product rounded to nearest.
+static uint64_t FieldExport_MultiplyMantissas( const uint64_t a, const uint64_t b, int *const exponent )
+{
+    const uint64_t a0 = a & 0xFFFFFFFFULL, a1 = a >> 32, b0 = b & 0xFFFFFFFFULL, b1 = b >> 32;
+    const uint64_t p00 = a0 * b0, p01 = a0 * b1, p10 = a1 * b0, p11 = a1 * b1;
+    const uint64_t middle = ( p00 >> 32 ) + ( p01 & 0xFFFFFFFFULL ) + ( p10 & 0xFFFFFFFFULL );
+    uint64_t high = p11 + ( p01 >> 32 ) + ( p10 >> 32 ) + ( middle >> 32 );
+    uint64_t low = ( middle << 32 ) | ( p00 & 0xFFFFFFFFULL );
+
+    *exponent += 64;
+    if( ( high >> 63 ) == 0 )
+    {
+        high = ( high << 1 ) | ( low >> 63 );
+        low <<= 1;
+        *exponent -= 1;
+    }
+    if( ( low >> 63 ) != 0 )
+    {
+        high++;
+        if( high == 0 )
+        {
+            high = 1ULL << 63;
+            *exponent += 1;
+        }
+    }
+
+    return high;
+}
+
+
+/*
+    Formats a double like printf's "%.16E", ie. with 17 significant digits. The digits are calculated with 64 bit integer
+    arithmetic, which is accurate enough that the result always reads back as the same double, although the last digit can
+    differ from printf's for values very close to halfway between two 17 digit decimals. Returns the number of characters
+    written, without a terminating null.
+*/
+static int FieldExport_FormatDouble( char *const string, const double value )
+{
+    //10^0 to 10^7 in the same form as FieldExport_PowersOfTen, exactly.
+    static const struct
+    {
+        uint64_t mantissa;
+        int exponent;
+    }
+    smallPowers[8] =
+    {
+        { 0x8000000000000000ULL, -63 }, { 0xA000000000000000ULL, -60 }, { 0xC800000000000000ULL, -57 },
+        { 0xFA00000000000000ULL, -54 }, { 0x9C40000000000000ULL, -50 }, { 0xC350000000000000ULL, -47 },
+        { 0xF424000000000000ULL, -44 }, { 0x9896800000000000ULL, -40 }
+    };
+    const uint64_t lowestDigits = 10000000000000000ULL, highestDigits = 100000000000000000ULL;
+    union { double d; uint64_t i; } bits;
+    uint64_t mantissa, scaledMantissa, digits;
+    uint32_t highDigits, lowDigits;
+    int binaryExponent, scaledExponent, decimalExponent, p, index, remainder, shift, i, length = 0;
+    char digitString[17];
+
+    bits.d = value;
+    binaryExponent = (int)( ( bits.i >> 52 ) & 0x7FF );
+    mantissa = bits.i & 0xFFFFFFFFFFFFFULL;
+
+    if( binaryExponent == 0x7FF )
+    {
+        //Infinity or NaN
+        return sprintf( string, "%.16E", value );
+    }
+    if( ( bits.i >> 63 ) != 0 )
+    {
+        string[length++] = '-';
+    }
+    if( ( binaryExponent == 0 ) && ( mantissa == 0 ) )
+    {
+        memcpy( string + length, "0.0000000000000000E+00", 22 );
+        return length + 22;
+    }
+
+    //value = mantissa * 2^binaryExponent, with the top bit of the mantissa set.
+    if( binaryExponent == 0 )
+    {
+        binaryExponent = -1074;
+        while( ( mantissa >> 63 ) == 0 )
+        {
+            mantissa <<= 1;
+            binaryExponent--;
+        }
+    }
+    else
+    {
+        mantissa = ( mantissa | ( 1ULL << 52 ) ) << 11;
+        binaryExponent -= 1075 + 11;
+    }
+
+    //The value is in [2^(binaryExponent+63),2^(binaryExponent+64)), so its decimal exponent is this estimate or one more.
+    decimalExponent = (int)floor( ( binaryExponent + 63 ) * 0.30102999566398120 );
+    for( ; ; )
+    {
+        //digits = value * 10^(16-decimalExponent), rounded to nearest.
+        p = 16 - decimalExponent;
+        index = ( p - FIELD_EXPORT_FIRST_POWER_OF_TEN ) / 8;
+        remainder = p - FIELD_EXPORT_FIRST_POWER_OF_TEN - 8 * index;
+        scaledExponent = binaryExponent + FieldExport_PowersOfTen[index].exponent;
+        scaledMantissa = FieldExport_MultiplyMantissas( mantissa, FieldExport_PowersOfTen[index].mantissa, &scaledExponent );
+        if( remainder > 0 )
+        {
+            scaledExponent += smallPowers[remainder].exponent;
+            scaledMantissa = FieldExport_MultiplyMantissas( scaledMantissa, smallPowers[remainder].mantissa, &scaledExponent );
+        }
+        shift = -scaledExponent;
+        digits = ( scaledMantissa >> shift ) + ( ( scaledMantissa >> ( shift - 1 ) ) & 1 );
+        if( digits >= highestDigits )
+        {
+            decimalExponent++;
+        }
+        else if( digits < lowestDigits )
+        {
+            decimalExponent--;
+        }
+        else
+        {
+            break;
+        }
+    }
+
+    //Split the digits so that they can be extracted with 32 bit arithmetic
+    highDigits = (uint32_t)( digits / 100000000ULL );
+    lowDigits = (uint32_t)( digits - 100000000ULL * highDigits );
+    for( i = 16; i >= 9; i-- )
+    {
+        digitString[i] = (char)( '0' + lowDigits % 10 );
+        lowDigits /= 10;
+    }
+    for( i = 8; i >= 0; i-- )
+    {
+        digitString[i] = (char)( '0' + highDigits % 10 );
+        highDigits /= 10;
+    }
+    string[length++] = digitString[0];
+    string[length++] = '.';
+    memcpy( string + length, digitString + 1, 16 );
+    length += 16;
+    string[length++] = 'E';
+    if( decimalExponent < 0 )
+    {
+        string[length++] = '-';
+        decimalExponent = -decimalExponent;
+    }
+    else
+    {
+        string[length++] = '+';
+    }
+    if( decimalExponent >= 100 )
+    {
+        string[length++] = (char)( '0' + decimalExponent / 100 );
+    }
+    string[length++] = (char)( '0' + ( decimalExponent / 10 ) % 10 );
+    string[length++] = (char)( '0' + decimalExponent % 10 );
+
+    return length;
+}
+
+
+//Writes a buffer or closes a file, returning the error code.
+static int FieldExport_Writer_DoJob( FILE *const file, char *const buffer, const size_t length )
+{
+    if( buffer == NULL )
+    {
+        return ( fclose( file ) != 0 ) ? FIELD_EXPORT_ERROR_FILE_WRITE : FIELD_EXPORT_NO_ERROR;
+    }
+    return ( fwrite( buffer, 1, length, file ) != length ) ? FIELD_EXPORT_ERROR_FILE_WRITE : FIELD_EXPORT_NO_ERROR;
+}
+
+
+#ifdef USE_ASYNCHRONOUS_WRITER
+static void *FieldExport_Writer_Run( void *argument )
+{
+    WriterJob *job;
+    int error;
+
+    pthread_mutex_lock( &writer.mutex );
+    while( 1 )
+    {
+        while( writer.first == NULL )
+        {
+            pthread_cond_wait( &writer.jobQueued, &writer.mutex );
+        }
+        job = writer.first;
+        pthread_mutex_unlock( &writer.mutex );
+
+        error = FieldExport_Writer_DoJob( job->file, job->buffer, job->length );
+
+        pthread_mutex_lock( &writer.mutex );
+        if( ( error != FIELD_EXPORT_NO_ERROR ) && ( writer.error == FIELD_EXPORT_NO_ERROR ) )
+        {
+            writer.error = error;
+        }
+        writer.first = job->next;
+        if( writer.first == NULL )
+        {
+            writer.last = NULL;
+        }
+        if( job->buffer != NULL )
+        {
+            writer.bufferCount--;
+        }
+        writer.jobCount--;
+        pthread_cond_broadcast( &writer.jobFinished );
+
+        free( job->buffer );
+        free( job );
+    }
+
+    return NULL;
+}
+
+
+static void FieldExport_Writer_Drain( void )
+{
+    FieldExport_Wait();
+}
+#endif
+
+
+/*
+    Writes the buffer to the file, or closes the file if the buffer is NULL. The buffer is always freed. For asynchronous
+    sessions this is done by the writer thread, falling back to doing it here if the thread can't be started.
+*/
+static int FieldExport_Writer_Queue( FileSession *const session, FILE *const file, char *const buffer, const size_t length )
+{
+#ifdef USE_ASYNCHRONOUS_WRITER
+    WriterJob *job = NULL;
+
+    if( session->isAsynchronous )
+    {
+        job = malloc( sizeof( WriterJob ) );
+    }
+    if( job != NULL )
+    {
+        job->file = file;
+        job->buffer = buffer;
+        job->length = length;
+        job->next = NULL;
+
+        pthread_mutex_lock( &writer.mutex );
+        if( !writer.isStarted )
+        {
+            if( pthread_create( &writer.thread, NULL, FieldExport_Writer_Run, NULL ) == 0 )
+            {
+                writer.isStarted = 1;
+                //Make sure everything queued is written even if FieldExport_Wait is never called.
+                atexit( FieldExport_Writer_Drain );
+            }
+        }
+        if( writer.isStarted )
+        {
+            while( ( buffer != NULL ) && ( writer.bufferCount >= FIELD_EXPORT_WRITER_QUEUE_SIZE ) )
+            {
+                pthread_cond_wait( &writer.jobFinished, &writer.mutex );
+            }
+            if( writer.last == NULL )
+            {
+                writer.first = job;
+            }
+            else
+            {
+                writer.last->next = job;
+            }
+            writer.last = job;
+            if( buffer != NULL )
+            {
+                writer.bufferCount++;
+            }
+            writer.jobCount++;
+            pthread_cond_signal( &writer.jobQueued );
+            pthread_mutex_unlock( &writer.mutex );
+            return FIELD_EXPORT_NO_ERROR;
+        }
+        pthread_mutex_unlock( &writer.mutex );
+        free( job );
+    }
+#endif
+
+    {
+        int error = FieldExport_Writer_DoJob( file, buffer, length );
+
+        free( buffer );
+        return error;
+    }
+}
+
+
+//Writes out a full or final buffer. If isFinal is false, the session is left with an empty buffer to carry on with.
+static int FieldExport_File_WriteBuffer( FileSession *const session, FILE *const file, char **const buffer,
+    size_t *const length, const int isFinal )
+{
+    int error;
+
+    if( !session->isAsynchronous )
+    {
+        if( ( *length > 0 ) && ( session->error == FIELD_EXPORT_NO_ERROR ) )
+        {
+            if( fwrite( *buffer, 1, *length, file ) != *length )
+            {
+                session->error = FIELD_EXPORT_ERROR_FILE_WRITE;
+            }
+        }
+        if( isFinal )
+        {
+            free( *buffer );
+            *buffer = NULL;
+        }
+    }
+    else if( ( *length > 0 ) && ( session->error == FIELD_EXPORT_NO_ERROR ) )
+    {
+        //The writer takes the buffer, so carry on in a new one.
+        error = FieldExport_Writer_Queue( session, file, *buffer, *length );
+        if( ( error != FIELD_EXPORT_NO_ERROR ) && ( session->error == FIELD_EXPORT_NO_ERROR ) )
+        {
+            session->error = error;
+        }
+        *buffer = isFinal ? NULL : malloc( FIELD_EXPORT_BUFFER_SIZE );
+        if( ( *buffer == NULL ) && !isFinal )
+        {
+            session->error = FIELD_EXPORT_ERROR_OUT_OF_MEMORY;
+        }
+    }
+    else if( isFinal )
+    {
+        free( *buffer );
+        *buffer = NULL;
+    }
+    *length = 0;
+
+    return session->error;
+}
+
+
+static int FieldExport_File_Flush( FileSession *const session )
+{
+    return FieldExport_File_WriteBuffer( session, session->file, &session->buffer, &session->bufferLength, 0 );
+}
+
+
+//Writes out whatever is left in the session's buffers and closes its files.
+static int FieldExport_File_Close( FileSession *const session )
+{
+    int error;
+
+    if( session->valuesFile != NULL )
+    {
+        FieldExport_File_WriteBuffer( session, session->valuesFile, &session->valuesBuffer, &session->valuesBufferLength, 1 );
+        error = FieldExport_Writer_Queue( session, session->valuesFile, NULL, 0 );
+        if( ( error != FIELD_EXPORT_NO_ERROR ) && ( session->error == FIELD_EXPORT_NO_ERROR ) )
+        {
+            session->error = error;
+        }
+        session->valuesFile = NULL;
+    }
+    FieldExport_File_WriteBuffer( session, session->file, &session->buffer, &session->bufferLength, 1 );
+    error = FieldExport_Writer_Queue( session, session->file, NULL, 0 );
+    if( ( error != FIELD_EXPORT_NO_ERROR ) && ( session->error == FIELD_EXPORT_NO_ERROR ) )
+    {
+        session->error = error;
+    }
+    session->file = NULL;
+
+    return session->error;
+}
+
+
+static int FieldExport_File_BufferPrintf( FileSession *const session, const char *format, va_list args )
+{
+    va_list argsCopy;
+    char *largeBuffer;
+    int length;
+
+    va_copy( argsCopy, args );
+    length = vsnprintf( session->buffer + session->bufferLength, FIELD_EXPORT_BUFFER_SIZE - session->bufferLength, format, args );
+    if( length < 0 )
+    {
+        session->error = FIELD_EXPORT_ERROR_FILE_WRITE;
+    }
+    else if( (size_t)length < FIELD_EXPORT_BUFFER_SIZE - session->bufferLength )
+    {
+        session->bufferLength += length;
+    }
+    else if( FieldExport_File_Flush( session ) == FIELD_EXPORT_NO_ERROR )
+    {
+        //It didn't fit in what was left of the buffer
+        if( length < FIELD_EXPORT_BUFFER_SIZE )
+        {
+            vsnprintf( session->buffer, FIELD_EXPORT_BUFFER_SIZE, format, argsCopy );
+            session->bufferLength = length;
+        }
+        else if( ( largeBuffer = malloc( length + 1 ) ) == NULL )
+        {
+            session->error = FIELD_EXPORT_ERROR_OUT_OF_MEMORY;
+        }
+        else
+        {
+            //Too big for the buffer, so it gets a buffer of its own to keep the output in order.
+            vsnprintf( largeBuffer, length + 1, format, argsCopy );
+            session->error = FieldExport_Writer_Queue( session, session->file, largeBuffer, length );
+        }
+    }
+    va_end( argsCopy );
+
+    return session->error;
+}
+
+
 static int FieldExport_FPrintf( FileSession *const session, const char *format, ... )
 {
     va_list args;
@@ -195,7 +828,15 @@ static int FieldExport_FPrintf( FileSession *const session, const char *format,
     if( session->error == FIELD_EXPORT_NO_ERROR )
     {
         va_start( args, format );
-        if( vfprintf( session->file, format, args ) < 0 )
+        if( session->valuesFile != NULL )
+        {
+            session->error = FieldExport_Binary_HeaderPrintf( session, format, args );
+        }
+        else if( session->buffer != NULL )
+        {
+            FieldExport_File_BufferPrintf( session, format, args );
+        }
+        else if( vfprintf( session->file, format, args ) < 0 )
         {
             session->error = FIELD_EXPORT_ERROR_FILE_WRITE;
         }
@@ -206,6 +847,35 @@ static int FieldExport_FPrintf( FileSession *const session, const char *format,
 }
 
 
+//Writes the separator followed by the value formatted as "%.16E".
+static int FieldExport_File_Double( FileSession *const session, const char *const separator, const double value )
+{
+    size_t length;
+
+    if( ( session->buffer == NULL ) || ( session->valuesFile != NULL ) )
+    {
+        return FieldExport_FPrintf( session, "%s%.16E", separator, value );
+    }
+    if( session->error != FIELD_EXPORT_NO_ERROR )
+    {
+        return session->error;
+    }
+    if( FIELD_EXPORT_BUFFER_SIZE - session->bufferLength < FIELD_EXPORT_DOUBLE_SIZE )
+    {
+        if( FieldExport_File_Flush( session ) != FIELD_EXPORT_NO_ERROR )
+        {
+            return session->error;
+        }
+    }
+    length = strlen( separator );
+    memcpy( session->buffer + session->bufferLength, separator, length );
+    session->bufferLength += length;
+    session->bufferLength += FieldExport_FormatDouble( session->buffer + session->bufferLength, value );
+
+    return session->error;
+}
+
+
 static SessionListEntry *FieldExport_GetSession( const int handle )
 {
     SessionListEntry *entry = sessions.next;
@@ -856,7 +1526,7 @@ static int FieldExport_File_ElementNodeScales( FileSession *session, const int i
 
     for( i = 0; i < scaleCount; i++ )
     {
-        FieldExport_FPrintf( session, "   %.16E", scales[i] );
+        FieldExport_File_Double( session, "   ", scales[i] );
     }
 
     FieldExport_FPrintf( session, "\n" );
@@ -879,7 +1549,7 @@ static int FieldExport_File_ElementGridValues( FileSession *session, const int i
 
     for( i = 0; i < valueCount; i++ )
     {
-        FieldExport_FPrintf( session, "   %.16E", value );
+        FieldExport_File_Double( session, "   ", value );
     }
 
     FieldExport_FPrintf( session, "\n" );
@@ -896,9 +1566,17 @@ static int FieldExport_File_OpenSession( const char *const name, int * const han
     strcpy( hd5Name, name );
     strcat( hd5Name, ".h5" );
 
+    if( session == NULL )
+    {
+        return FIELD_EXPORT_ERROR_OUT_OF_MEMORY;
+    }
     session->type = EXPORT_TYPE_FILE;
     session->handle = nextHandle++;
     session->fileSession.file = fopen( name, "w" );
+    session->fileSession.isAsynchronous = isAsynchronousExport;
+    session->fileSession.buffer = malloc( FIELD_EXPORT_BUFFER_SIZE );
+    session->fileSession.bufferLength = 0;
+    session->fileSession.lastNodeNumber = -1;
 
 #ifdef USE_HDF5
     session->fileSession.hd5Handle = H5Fcreate( hd5Name, H5F_ACC_TRUNC, H5P_DEFAULT, H5P_DEFAULT );
@@ -907,10 +1585,10 @@ static int FieldExport_File_OpenSession( const char *const name, int * const han
     session->fileSession.error = FIELD_EXPORT_NO_ERROR;
 
 #ifdef USE_HDF5
-    if( ( session->fileSession.file == NULL )
+    if( ( session->fileSession.file == NULL ) || ( session->fileSession.buffer == NULL )
         || ( session->fileSession.hd5Handle < 0 ) )
 #else
-    if( session->fileSession.file == NULL )
+    if( ( session->fileSession.file == NULL ) || ( session->fileSession.buffer == NULL ) )
 #endif
     {
         if( session->fileSession.file != NULL )
@@ -923,6 +1601,12 @@ static int FieldExport_File_OpenSession( const char *const name, int * const han
             H5Fclose( session->fileSession.hd5Handle );
         }
 #endif
+        if( session->fileSession.buffer == NULL )
+        {
+            free( session );
+            return FIELD_EXPORT_ERROR_OUT_OF_MEMORY;
+        }
+        free( session->fileSession.buffer );
         free( session );
         return FIELD_EXPORT_ERROR_FILE_IO;
     }
@@ -938,7 +1622,7 @@ static int FieldExport_File_OpenSession( const char *const name, int * const han
 
 static int FieldExport_File_CloseSession( SessionListEntry *session )
 {
-    fclose( session->fileSession.file );
+    FieldExport_File_Close( &session->fileSession );
 
 #ifdef USE_HDF5
     H5Fclose( session->fileSession.hd5Handle );
@@ -946,7 +1630,7 @@ static int FieldExport_File_CloseSession( SessionListEntry *session )
 
     session->type = EXPORT_TYPE_CLOSED;
 
-    return FIELD_EXPORT_NO_ERROR;
+    return session->fileSession.error;
 }
 
 
@@ -1022,17 +1706,16 @@ static int FieldExport_File_NodeValues( FileSession *session, const int nodeNumb
 #ifdef USE_HDF5
     herr_t status;
 #endif
-    static int lastNodeNumber = -1; //A little bit of a hack, but then so is the whole file format.
-
-    if( nodeNumber != lastNodeNumber )
+    //Consecutive calls for the same node continue its list of values
+    if( nodeNumber != session->lastNodeNumber )
     {
-        lastNodeNumber = nodeNumber;
+        session->lastNodeNumber = nodeNumber;
         FieldExport_FPrintf( session, " Node:            %d\n", nodeNumber );
     }
 
     for( i = 0; i < valueCount; i++ )
     {
-        FieldExport_FPrintf( session, "  %.16E", values[i] );
+        FieldExport_File_Double( session, "  ", values[i] );
     }
     FieldExport_FPrintf( session, "\n" );
 
@@ -1050,6 +1733,317 @@ static int FieldExport_File_NodeValues( FileSession *session, const int nodeNumb
 }
 
 
+/*
+    Binary file export routines. The header text is the same as for CMISS-formatted files, but it is written to a JSON index
+    file together with the nodes it applies to and the offset of their values in the values file.
+*/
+static int FieldExport_Binary_IndexPrintf( FileSession *const session, const char *format, ... )
+{
+    va_list args;
+
+    if( session->error == FIELD_EXPORT_NO_ERROR )
+    {
+        va_start( args, format );
+        FieldExport_File_BufferPrintf( session, format, args );
+        va_end( args );
+    }
+
+    return session->error;
+}
+
+
+static int FieldExport_Binary_IndexString( FileSession *const session, const char *const string )
+{
+    const char *c;
+
+    FieldExport_Binary_IndexPrintf( session, "\"" );
+    for( c = string; *c != '\0'; c++ )
+    {
+        switch( *c )
+        {
+        case '"':
+            FieldExport_Binary_IndexPrintf( session, "\\\"" );
+            break;
+        case '\\':
+            FieldExport_Binary_IndexPrintf( session, "\\\\" );
+            break;
+        case '\n':
+            FieldExport_Binary_IndexPrintf( session, "\\n" );
+            break;
+        default:
+            if( (unsigned char)*c < 0x20 )
+            {
+                FieldExport_Binary_IndexPrintf( session, "\\u%04x", (unsigned char)*c );
+            }
+            else
+            {
+                FieldExport_Binary_IndexPrintf( session, "%c", *c );
+            }
+            break;
+        }
+    }
+
+    return FieldExport_Binary_IndexPrintf( session, "\"" );
+}
+
+
+static int FieldExport_Binary_EndBlock( FileSession *const session )
+{
+    int i;
+    int isUniform = 1;
+
+    if( ( session->blockHeader == NULL ) && ( session->blockNodeCount == 0 ) )
+    {
+        return session->error;
+    }
+
+    FieldExport_Binary_IndexPrintf( session, "%s\n{\"header\":", session->blockCount > 0 ? "," : "" );
+    FieldExport_Binary_IndexString( session, session->blockHeader == NULL ? "" : session->blockHeader );
+    FieldExport_Binary_IndexPrintf( session, ",\"valueOffset\":%lld,\"nodes\":[", session->blockValueOffset );
+    for( i = 0; i < session->blockNodeCount; i++ )
+    {
+        FieldExport_Binary_IndexPrintf( session, i > 0 ? ",%d" : "%d", session->blockNodes[i] );
+        if( session->blockValueCounts[i] != session->blockValueCounts[0] )
+        {
+            isUniform = 0;
+        }
+    }
+    FieldExport_Binary_IndexPrintf( session, "]" );
+    if( isUniform )
+    {
+        FieldExport_Binary_IndexPrintf( session, ",\"valuesPerNode\":%d}",
+            session->blockNodeCount > 0 ? session->blockValueCounts[0] : 0 );
+    }
+    else
+    {
+        //Nodes can have differing numbers of values if not all the fields' components are defined on them.
+        FieldExport_Binary_IndexPrintf( session, ",\"valueCounts\":[" );
+        for( i = 0; i < session->blockNodeCount; i++ )
+        {
+            FieldExport_Binary_IndexPrintf( session, i > 0 ? ",%d" : "%d", session->blockValueCounts[i] );
+        }
+        FieldExport_Binary_IndexPrintf( session, "]}" );
+    }
+
+    free( session->blockHeader );
+    session->blockHeader = NULL;
+    session->blockNodeCount = 0;
+    session->blockValueOffset = session->valueCount;
+    session->blockCount++;
+
+    return session->error;
+}
+
+
+static int FieldExport_Binary_StartBlock( FileSession *const session )
+{
+    if( FieldExport_Binary_EndBlock( session ) != FIELD_EXPORT_NO_ERROR )
+    {
+        return session->error;
+    }
+
+    session->blockHeader = session->header;
+    session->header = NULL;
+    session->headerLength = 0;
+    session->headerSize = 0;
+
+    return session->error;
+}
+
+
+static int FieldExport_Binary_OpenSession( const char *const name, int * const handle )
+{
+    //Binary sessions are file sessions with the node values redirected, so the header routines are shared.
+    SessionListEntry *session = calloc( 1, sizeof( SessionListEntry ) );
+    const union { int i; char c; } endianTest = { 1 };
+    const char *valuesName;
+    char *indexName, *valuesFileName;
+
+    if( session == NULL )
+    {
+        return FIELD_EXPORT_ERROR_OUT_OF_MEMORY;
+    }
+    indexName = malloc( strlen( name ) + 6 );
+    valuesFileName = malloc( strlen( name ) + 5 );
+    if( ( indexName == NULL ) || ( valuesFileName == NULL ) )
+    {
+        free( indexName );
+        free( valuesFileName );
+        free( session );
+        return FIELD_EXPORT_ERROR_OUT_OF_MEMORY;
+    }
+    strcpy( indexName, name );
+    strcat( indexName, ".json" );
+    strcpy( valuesFileName, name );
+    strcat( valuesFileName, ".bin" );
+
+    session->type = EXPORT_TYPE_FILE;
+    session->handle = nextHandle++;
+    session->fileSession.file = fopen( indexName, "w" );
+    session->fileSession.valuesFile = fopen( valuesFileName, "wb" );
+    session->fileSession.isAsynchronous = isAsynchronousExport;
+    session->fileSession.buffer = malloc( FIELD_EXPORT_BUFFER_SIZE );
+    session->fileSession.valuesBuffer = malloc( FIELD_EXPORT_BUFFER_SIZE );
+    session->fileSession.error = FIELD_EXPORT_NO_ERROR;
+    free( indexName );
+
+    if( ( session->fileSession.buffer == NULL ) || ( session->fileSession.valuesBuffer == NULL ) )
+    {
+        if( session->fileSession.file != NULL )
+        {
+            fclose( session->fileSession.file );
+        }
+        if( session->fileSession.valuesFile != NULL )
+        {
+            fclose( session->fileSession.valuesFile );
+        }
+        free( session->fileSession.buffer );
+        free( session->fileSession.valuesBuffer );
+        free( valuesFileName );
+        free( session );
+        return FIELD_EXPORT_ERROR_OUT_OF_MEMORY;
+    }
+    if( ( session->fileSession.file == NULL ) || ( session->fileSession.valuesFile == NULL ) )
+    {
+        if( session->fileSession.file != NULL )
+        {
+            fclose( session->fileSession.file );
+        }
+        if( session->fileSession.valuesFile != NULL )
+        {
+            fclose( session->fileSession.valuesFile );
+        }
+        free( session->fileSession.buffer );
+        free( session->fileSession.valuesBuffer );
+        free( valuesFileName );
+        free( session );
+        return FIELD_EXPORT_ERROR_FILE_IO;
+    }
+
+    //The index refers to the values file relative to its own directory.
+    valuesName = strrchr( valuesFileName, '/' );
+    if( valuesName == NULL )
+    {
+        valuesName = strrchr( valuesFileName, '\\' );
+    }
+    valuesName = ( valuesName == NULL ) ? valuesFileName : valuesName + 1;
+    FieldExport_Binary_IndexPrintf( &session->fileSession,
+        "{\n\"format\":\"OpenCMISS binary exnode\",\n\"version\":1,\n\"values\":" );
+    FieldExport_Binary_IndexString( &session->fileSession, valuesName );
+    FieldExport_Binary_IndexPrintf( &session->fileSession, ",\n\"valueType\":\"float64\",\n\"byteOrder\":\"%s\",\n\"blocks\":[",
+        endianTest.c == 1 ? "little" : "big" );
+    free( valuesFileName );
+
+    session->next = sessions.next;
+    sessions.next = session;
+
+    *handle = session->handle;
+
+    return session->fileSession.error;
+}
+
+
+static int FieldExport_Binary_CloseSession( SessionListEntry *session )
+{
+    FileSession *fileSession = &session->fileSession;
+
+    if( fileSession->headerLength > 0 )
+    {
+        //Trailing header text with no nodes after it
+        FieldExport_Binary_StartBlock( fileSession );
+    }
+    FieldExport_Binary_EndBlock( fileSession );
+    FieldExport_Binary_IndexPrintf( fileSession, "\n]\n}\n" );
+
+    FieldExport_File_Close( fileSession );
+
+    free( fileSession->header );
+    free( fileSession->blockHeader );
+    free( fileSession->blockNodes );
+    free( fileSession->blockValueCounts );
+    fileSession->header = NULL;
+    fileSession->blockHeader = NULL;
+    fileSession->blockNodes = NULL;
+    fileSession->blockValueCounts = NULL;
+
+    session->type = EXPORT_TYPE_CLOSED;
+
+    return fileSession->error;
+}
+
+
+static int FieldExport_Binary_NodeValues( FileSession *session, const int nodeNumber, const int valueCount, const double *const values )
+{
+    int *newNodes, *newValueCounts;
+    int newSize;
+    size_t length, bytesLeft = valueCount * sizeof( double );
+    const char *bytes = (const char *)values;
+
+    if( session->error != FIELD_EXPORT_NO_ERROR )
+    {
+        return session->error;
+    }
+
+    if( session->headerLength > 0 )
+    {
+        //A new header has been written so the following nodes are in a new block
+        if( FieldExport_Binary_StartBlock( session ) != FIELD_EXPORT_NO_ERROR )
+        {
+            return session->error;
+        }
+    }
+
+    if( ( session->blockNodeCount == 0 ) || ( session->blockNodes[session->blockNodeCount - 1] != nodeNumber ) )
+    {
+        if( session->blockNodeCount == session->blockNodeSize )
+        {
+            newSize = session->blockNodeSize > 0 ? 2 * session->blockNodeSize : 1024;
+            newNodes = realloc( session->blockNodes, newSize * sizeof( int ) );
+            if( newNodes == NULL )
+            {
+                return ( session->error = FIELD_EXPORT_ERROR_OUT_OF_MEMORY );
+            }
+            session->blockNodes = newNodes;
+            newValueCounts = realloc( session->blockValueCounts, newSize * sizeof( int ) );
+            if( newValueCounts == NULL )
+            {
+                return ( session->error = FIELD_EXPORT_ERROR_OUT_OF_MEMORY );
+            }
+            session->blockValueCounts = newValueCounts;
+            session->blockNodeSize = newSize;
+        }
+        session->blockNodes[session->blockNodeCount] = nodeNumber;
+        session->blockValueCounts[session->blockNodeCount] = 0;
+        session->blockNodeCount++;
+    }
+    session->blockValueCounts[session->blockNodeCount - 1] += valueCount;
+
+    while( bytesLeft > 0 )
+    {
+        if( session->valuesBufferLength == FIELD_EXPORT_BUFFER_SIZE )
+        {
+            if( FieldExport_File_WriteBuffer( session, session->valuesFile, &session->valuesBuffer,
+                &session->valuesBufferLength, 0 ) != FIELD_EXPORT_NO_ERROR )
+            {
+                return session->error;
+            }
+        }
+        length = FIELD_EXPORT_BUFFER_SIZE - session->valuesBufferLength;
+        if( length > bytesLeft )
+        {
+            length = bytesLeft;
+        }
+        memcpy( session->valuesBuffer + session->valuesBufferLength, bytes, length );
+        session->valuesBufferLength += length;
+        bytes += length;
+        bytesLeft -= length;
+    }
+    session->valueCount += valueCount;
+
+    return session->error;
+}
+
+
 static int FieldExport_FieldDerivateLabels( FileSession *session, const int numberOfDerivatives, const int *const derivatives )
 {
     int i;
@@ -1214,6 +2208,10 @@ int FieldExport_OpenSession( const int type, const char *const name, int * const
     {
         return FieldExport_File_OpenSession( name, handle );
     }
+    else if( type == EXPORT_TYPE_BINARY_FILE )
+    {
+        return FieldExport_Binary_OpenSession( name, handle );
+    }
     else
     {
         return FIELD_EXPORT_ERROR_UNKNOWN_TYPE;
@@ -1542,6 +2540,10 @@ int FieldExport_CloseSession( const int handle )
     {
         return FIELD_EXPORT_ERROR_BAD_HANDLE;
     }
+    else if( ( session->type == EXPORT_TYPE_FILE ) && ( session->fileSession.valuesFile != NULL ) )
+    {
+        return FieldExport_Binary_CloseSession( session );
+    }
     else if( session->type == EXPORT_TYPE_FILE )
     {
         return FieldExport_File_CloseSession( session );
@@ -1563,6 +2565,10 @@ int FieldExport_NodeValues( const int handle, const int nodeNumber, const int va
     {
         return FIELD_EXPORT_ERROR_BAD_HANDLE;
     }
+    else if( ( session->type == EXPORT_TYPE_FILE ) && ( session->fileSession.valuesFile != NULL ) )
+    {
+        return FieldExport_Binary_NodeValues( &session->fileSession, nodeNumber, valueCount, values );
+    }
     else if( session->type == EXPORT_TYPE_FILE )
     {
         return FieldExport_File_NodeValues( &session->fileSession, nodeNumber, valueCount, values );
@@ -1661,3 +2667,40 @@ int FieldExport_EndComponent( const int handle )
     /* Shouldn't get to here */
     return FIELD_EXPORT_ERROR_UNKNOWN_TYPE;
 }
+
+
+/*
+    Sets whether sessions opened from now on write their output asynchronously. Returns immediately; sessions that are
+    already open carry on as they were.
+*/
+int FieldExport_AsynchronousSet( const int isAsynchronous )
+{
+#ifdef USE_ASYNCHRONOUS_WRITER
+    isAsynchronousExport = ( isAsynchronous != 0 );
+#endif
+
+    return FIELD_EXPORT_NO_ERROR;
+}
+
+
+/*
+    Waits until everything queued by asynchronous sessions has been written and their files closed, and returns the first
+    error the writer had since the last wait.
+*/
+int FieldExport_Wait( void )
+{
+    int error = FIELD_EXPORT_NO_ERROR;
+
+#ifdef USE_ASYNCHRONOUS_WRITER
+    pthread_mutex_lock( &writer.mutex );
+    while( writer.jobCount > 0 )
+    {
+        pthread_cond_wait( &writer.jobFinished, &writer.mutex );
+    }
+    error = writer.error;
+    writer.error = FIELD_EXPORT_NO_ERROR;
+    pthread_mutex_unlock( &writer.mutex );
+#endif
+
+    return error;
+}
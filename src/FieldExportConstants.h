@@ -55,9 +55,21 @@
 #define FIELD_EXPORT_ERROR_FILE_WRITE				10005
 #define FIELD_EXPORT_ERROR_UNKNOWN_INTERPOLATION	10006
 #define FIELD_EXPORT_ERROR_UNKNOWN_LABEL_TYPE		10007
+#define FIELD_EXPORT_ERROR_OUT_OF_MEMORY			10008
 #define FIELD_EXPORT_ERROR_HDF5_ERROR       		10100
 
 #define EXPORT_TYPE_CLOSED 0
 #define EXPORT_TYPE_FILE   1
+#define EXPORT_TYPE_BINARY_FILE 2
+
+#define FIELD_IMPORT_NO_ERROR						00000
+#define FIELD_IMPORT_ERROR_UNKNOWN_TYPE				10201
+#define FIELD_IMPORT_ERROR_FILE_IO					10202
+#define FIELD_IMPORT_ERROR_BAD_HANDLE				10203
+#define FIELD_IMPORT_ERROR_OUT_OF_MEMORY			10204
+#define FIELD_IMPORT_ERROR_BAD_RECORD				10205
+
+#define IMPORT_TYPE_NODES    1
+#define IMPORT_TYPE_ELEMENTS 2
 
 #endif
@@ -0,0 +1,669 @@
+/* \file
+ * \brief Parallel reading of exnode and exelem files. Each rank parses its own byte range of a file.
+ *
+ * \section LICENSE
+ *
+ * Version: MPL 1.1/GPL 2.0/LGPL 2.1
+ *
+ * The contents of this file are subject to the Mozilla Public License
+ * Version 1.1 (the "License"); you may not use this file except in
+ * compliance with the License. You may obtain a copy of the License at
+ * http://www.mozilla.org/MPL/
+ *
+ * Software distributed under the License is distributed on an "AS IS"
+ * basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+ * License for the specific language governing rights and limitations
+ * under the License.
+ *
+ * The Original Code is OpenCMISS
+ *
+ * The Initial Developer of the Original Code is University of Auckland,
+ * Auckland, New Zealand, the University of Oxford, Oxford, United
+ * Kingdom and King's College, London, United Kingdom. Portions created
+ * by the University of Auckland, the University of Oxford and King's
+ * College, London are Copyright (C) 2007-2010 by the University of
+ * Auckland, the University of Oxford and King's College, London.
+ * All Rights Reserved.
+ *
+ * Contributor(s):
+ *
+ * Alternatively, the contents of this file may be used under the terms of
+ * either the GNU General Public License Version 2 or later (the "GPL"), or
+ * the GNU Lesser General Public License Version 2.1 or later (the "LGPL"),
+ * in which case the provisions of the GPL or the LGPL are applicable instead
+ * of those above. If you wish to allow use of your version of this file only
+ * under the terms of either the GPL or the LGPL, and not to allow others to
+ * use your version of this file under the terms of the MPL, indicate your
+ * decision by deleting the provisions above and replace them with the notice
+ * and other provisions required by the GPL or the LGPL. If you do not delete
+ * the provisions above, a recipient may use your version of this file under
+ * the terms of any one of the MPL, the GPL or the LGPL.
+ *
+ */
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#ifndef WIN32
+#include <sys/types.h>
+#endif
+
+#include "FieldExportConstants.h"
+
+#ifdef WIN32
+#define fseeko _fseeki64
+#define ftello _ftelli64
+#endif
+
+/*
+    Each rank reads the part of a file between two record boundaries. The file is cut into equal byte ranges, and each cut
+    is moved forward to the start of the next record, i.e. the next line starting with "Node:" or "Element:". Every rank
+    moves the cuts the same way, so the ranges cover the file exactly once. Header lines, and anything else that is not
+    part of a record, are skipped, so the header at the top of the file and any header repeated part way through it are
+    left to the caller.
+
+    Node records are the node number and the values on the lines following it. Element records are the element number
+    and the node numbers on the lines following "Nodes:". The element values and scale factors are not read.
+*/
+
+/*
+    API-local structs.
+*/
+typedef struct
+{
+    int type;
+
+    int recordCount;
+    int recordSize;
+    int *recordNumbers;
+    int *entryCounts;
+
+    int entryCount;
+    int entrySize;
+    int *intEntries;
+    double *doubleEntries;
+}
+ImportSession;
+
+typedef struct _ImportSessionListEntry
+{
+    int handle;
+
+    ImportSession session;
+
+    struct _ImportSessionListEntry *next;
+}
+ImportSessionListEntry;
+
+#define FIELD_IMPORT_INITIAL_SIZE 1024
+
+//This is the head of the session list. For convenience, the head itself is a stub, so it exists even for a zero-entry list.
+static ImportSessionListEntry importSessions;
+
+static int nextImportHandle = 0;
+
+enum
+{
+    FIELD_IMPORT_STATE_SKIP,        //Not in a record, or past the part of the record that is read.
+    FIELD_IMPORT_STATE_WAIT_NODES,  //In an element record, before the "Nodes:" line.
+    FIELD_IMPORT_STATE_COLLECT      //Reading the numbers of a record.
+};
+
+
+static ImportSessionListEntry *FieldImport_GetSession( const int handle )
+{
+    ImportSessionListEntry *entry = importSessions.next;
+
+    while( entry != NULL )
+    {
+        if( entry->handle == handle )
+        {
+            return entry;
+        }
+
+        entry = entry->next;
+    }
+
+    return NULL;
+}
+
+
+static void FieldImport_FreeSession( ImportSession *const session )
+{
+    free( session->recordNumbers );
+    free( session->entryCounts );
+    free( session->intEntries );
+    free( session->doubleEntries );
+}
+
+
+/*
+    Returns the length of the keyword if the line starts, after any blanks, with it, otherwise 0.
+*/
+static int FieldImport_LineStartsWith( const char **const line, const char *const lineEnd, const char *const keyword )
+{
+    const char *cursor = *line;
+    const size_t length = strlen( keyword );
+
+    while( ( cursor < lineEnd ) && ( ( *cursor == ' ' ) || ( *cursor == '\t' ) ) )
+    {
+        cursor++;
+    }
+
+    if( ( (size_t)( lineEnd - cursor ) < length ) || ( memcmp( cursor, keyword, length ) != 0 ) )
+    {
+        return 0;
+    }
+
+    *line = cursor + length;
+
+    return (int)length;
+}
+
+
+/*
+    Finds the first record at or after the given offset, and returns its offset, or the file size if there is none.
+*/
+static int FieldImport_FindRecord( FILE *const file, const long long fileSize, const long long offset,
+    const char *const keyword, long long *const recordOffset )
+{
+    const size_t length = strlen( keyword );
+    long long position = offset;
+    long long lineStart = offset;
+    size_t matched = 0;
+    int isLineStart, isMatching, c;
+
+    if( offset <= 0 )
+    {
+        *recordOffset = 0;
+        return FIELD_IMPORT_NO_ERROR;
+    }
+    if( offset >= fileSize )
+    {
+        *recordOffset = fileSize;
+        return FIELD_IMPORT_NO_ERROR;
+    }
+
+    //Look at the character before the offset to see whether the offset is at the start of a line.
+    if( fseeko( file, offset - 1, SEEK_SET ) != 0 )
+    {
+        return FIELD_IMPORT_ERROR_FILE_IO;
+    }
+    isLineStart = ( getc( file ) == '\n' );
+    isMatching = isLineStart;
+
+    while( ( c = getc( file ) ) != EOF )
+    {
+        if( isLineStart )
+        {
+            lineStart = position;
+            matched = 0;
+            isMatching = 1;
+            isLineStart = 0;
+        }
+        if( c == '\n' )
+        {
+            isLineStart = 1;
+        }
+        else if( isMatching )
+        {
+            if( ( matched == 0 ) && ( ( c == ' ' ) || ( c == '\t' ) ) )
+            {
+                //Leading blanks.
+            }
+            else if( c == keyword[matched] )
+            {
+                matched++;
+                if( matched == length )
+                {
+                    *recordOffset = lineStart;
+                    return FIELD_IMPORT_NO_ERROR;
+                }
+            }
+            else
+            {
+                isMatching = 0;
+            }
+        }
+        position++;
+    }
+
+    if( ferror( file ) )
+    {
+        return FIELD_IMPORT_ERROR_FILE_IO;
+    }
+
+    *recordOffset = fileSize;
+
+    return FIELD_IMPORT_NO_ERROR;
+}
+
+
+static int FieldImport_AddRecord( ImportSession *const session, const int recordNumber )
+{
+    int *numbers, *counts;
+    int size;
+
+    if( session->recordCount == session->recordSize )
+    {
+        size = ( session->recordSize == 0 ) ? FIELD_IMPORT_INITIAL_SIZE : 2 * session->recordSize;
+        numbers = realloc( session->recordNumbers, size * sizeof( int ) );
+        if( numbers == NULL )
+        {
+            return FIELD_IMPORT_ERROR_OUT_OF_MEMORY;
+        }
+        session->recordNumbers = numbers;
+        counts = realloc( session->entryCounts, size * sizeof( int ) );
+        if( counts == NULL )
+        {
+            return FIELD_IMPORT_ERROR_OUT_OF_MEMORY;
+        }
+        session->entryCounts = counts;
+        session->recordSize = size;
+    }
+
+    session->recordNumbers[session->recordCount] = recordNumber;
+    session->entryCounts[session->recordCount] = 0;
+    session->recordCount++;
+
+    return FIELD_IMPORT_NO_ERROR;
+}
+
+
+static int FieldImport_ReserveEntries( ImportSession *const session, const int count )
+{
+    void *entries;
+    int size = ( session->entrySize == 0 ) ? FIELD_IMPORT_INITIAL_SIZE : session->entrySize;
+
+    if( session->entryCount + count <= session->entrySize )
+    {
+        return FIELD_IMPORT_NO_ERROR;
+    }
+
+    while( size < session->entryCount + count )
+    {
+        size *= 2;
+    }
+    if( session->type == IMPORT_TYPE_NODES )
+    {
+        entries = realloc( session->doubleEntries, size * sizeof( double ) );
+        if( entries == NULL )
+        {
+            return FIELD_IMPORT_ERROR_OUT_OF_MEMORY;
+        }
+        session->doubleEntries = entries;
+    }
+    else
+    {
+        entries = realloc( session->intEntries, size * sizeof( int ) );
+        if( entries == NULL )
+        {
+            return FIELD_IMPORT_ERROR_OUT_OF_MEMORY;
+        }
+        session->intEntries = entries;
+    }
+    session->entrySize = size;
+
+    return FIELD_IMPORT_NO_ERROR;
+}
+
+
+static int FieldImport_IsBlank( const char c )
+{
+    return ( c == ' ' ) || ( c == '\t' ) || ( c == '\r' );
+}
+
+
+/*
+    Reads an integer that ends at a blank or at the end of the line.
+*/
+static int FieldImport_ParseInt( const char **const cursor, const char *const lineEnd, int *const value )
+{
+    const char *p = *cursor;
+    int isNegative = 0;
+    long long number = 0;
+
+    if( ( p < lineEnd ) && ( ( *p == '-' ) || ( *p == '+' ) ) )
+    {
+        isNegative = ( *p == '-' );
+        p++;
+    }
+    if( ( p == lineEnd ) || ( *p < '0' ) || ( *p > '9' ) )
+    {
+        return 0;
+    }
+    while( ( p < lineEnd ) && ( *p >= '0' ) && ( *p <= '9' ) )
+    {
+        number = 10 * number + ( *p - '0' );
+        if( number > 2147483647LL )
+        {
+            return 0;
+        }
+        p++;
+    }
+    if( ( p < lineEnd ) && !FieldImport_IsBlank( *p ) )
+    {
+        return 0;
+    }
+
+    *value = (int)( isNegative ? -number : number );
+    *cursor = p;
+
+    return 1;
+}
+
+
+/*
+    Reads the numbers on a line of a record. If anything on the line is not a number, the line is not part of the record,
+    and nothing is added.
+*/
+static int FieldImport_ParseEntries( ImportSession *const session, const char *cursor, const char *const lineEnd,
+    int *const isEntryLine )
+{
+    const int firstEntry = session->entryCount;
+    char *numberEnd;
+    int error;
+
+    *isEntryLine = 0;
+
+    while( 1 )
+    {
+        while( ( cursor < lineEnd ) && FieldImport_IsBlank( *cursor ) )
+        {
+            cursor++;
+        }
+        if( cursor == lineEnd )
+        {
+            break;
+        }
+
+        error = FieldImport_ReserveEntries( session, 1 );
+        if( error != FIELD_IMPORT_NO_ERROR )
+        {
+            return error;
+        }
+        if( session->type == IMPORT_TYPE_NODES )
+        {
+            //strtod stops at the newline, so it never reads past the end of the line.
+            session->doubleEntries[session->entryCount] = strtod( cursor, &numberEnd );
+            if( ( numberEnd == cursor ) || ( ( numberEnd < lineEnd ) && !FieldImport_IsBlank( *numberEnd ) ) )
+            {
+                session->entryCount = firstEntry;
+                return FIELD_IMPORT_NO_ERROR;
+            }
+            cursor = numberEnd;
+        }
+        else if( !FieldImport_ParseInt( &cursor, lineEnd, &session->intEntries[session->entryCount] ) )
+        {
+            session->entryCount = firstEntry;
+            return FIELD_IMPORT_NO_ERROR;
+        }
+        session->entryCount++;
+    }
+
+    if( session->entryCount > firstEntry )
+    {
+        session->entryCounts[session->recordCount - 1] += session->entryCount - firstEntry;
+        *isEntryLine = 1;
+    }
+
+    return FIELD_IMPORT_NO_ERROR;
+}
+
+
+static int FieldImport_Parse( ImportSession *const session, const char *const buffer, const size_t length )
+{
+    const char *const keyword = ( session->type == IMPORT_TYPE_NODES ) ? "Node:" : "Element:";
+    const char *const bufferEnd = buffer + length;
+    const char *line = buffer;
+    const char *lineEnd, *cursor;
+    int state = FIELD_IMPORT_STATE_SKIP;
+    int recordNumber, isEntryLine, error;
+
+    while( line < bufferEnd )
+    {
+        lineEnd = memchr( line, '\n', bufferEnd - line );
+        if( lineEnd == NULL )
+        {
+            lineEnd = bufferEnd;
+        }
+
+        cursor = line;
+        if( FieldImport_LineStartsWith( &cursor, lineEnd, keyword ) )
+        {
+            while( ( cursor < lineEnd ) && FieldImport_IsBlank( *cursor ) )
+            {
+                cursor++;
+            }
+            if( !FieldImport_ParseInt( &cursor, lineEnd, &recordNumber ) )
+            {
+                return FIELD_IMPORT_ERROR_BAD_RECORD;
+            }
+            if( recordNumber > 0 )
+            {
+                error = FieldImport_AddRecord( session, recordNumber );
+                if( error != FIELD_IMPORT_NO_ERROR )
+                {
+                    return error;
+                }
+                state = ( session->type == IMPORT_TYPE_NODES ) ? FIELD_IMPORT_STATE_COLLECT : FIELD_IMPORT_STATE_WAIT_NODES;
+            }
+            else
+            {
+                //Face and line elements are numbered 0 n 0 or 0 0 n.
+                state = FIELD_IMPORT_STATE_SKIP;
+            }
+        }
+        else if( state == FIELD_IMPORT_STATE_WAIT_NODES )
+        {
+            if( FieldImport_LineStartsWith( &cursor, lineEnd, "Nodes:" ) )
+            {
+                state = FIELD_IMPORT_STATE_COLLECT;
+            }
+        }
+        else if( state == FIELD_IMPORT_STATE_COLLECT )
+        {
+            error = FieldImport_ParseEntries( session, line, lineEnd, &isEntryLine );
+            if( error != FIELD_IMPORT_NO_ERROR )
+            {
+                return error;
+            }
+            if( !isEntryLine )
+            {
+                state = FIELD_IMPORT_STATE_SKIP;
+            }
+        }
+
+        line = lineEnd + 1;
+    }
+
+    return FIELD_IMPORT_NO_ERROR;
+}
+
+
+/*
+    Opens a session on the given rank's part of the file, and reads the records in it.
+*/
+int FieldImport_OpenSession( const int type, const char *const name, const int rank, const int numberOfRanks,
+    int *const handle )
+{
+    ImportSessionListEntry *entry;
+    FILE *file;
+    char *buffer;
+    long long fileSize, start, end;
+    int error;
+
+    if( ( type != IMPORT_TYPE_NODES ) && ( type != IMPORT_TYPE_ELEMENTS ) )
+    {
+        return FIELD_IMPORT_ERROR_UNKNOWN_TYPE;
+    }
+    if( ( numberOfRanks < 1 ) || ( rank < 0 ) || ( rank >= numberOfRanks ) )
+    {
+        return FIELD_IMPORT_ERROR_UNKNOWN_TYPE;
+    }
+
+    file = fopen( name, "rb" );
+    if( file == NULL )
+    {
+        return FIELD_IMPORT_ERROR_FILE_IO;
+    }
+    if( ( fseeko( file, 0, SEEK_END ) != 0 ) || ( ( fileSize = ftello( file ) ) < 0 ) )
+    {
+        fclose( file );
+        return FIELD_IMPORT_ERROR_FILE_IO;
+    }
+
+    error = FieldImport_FindRecord( file, fileSize, ( fileSize / numberOfRanks ) * rank +
+        ( fileSize % numberOfRanks ) * rank / numberOfRanks, ( type == IMPORT_TYPE_NODES ) ? "Node:" : "Element:", &start );
+    if( error == FIELD_IMPORT_NO_ERROR )
+    {
+        error = FieldImport_FindRecord( file, fileSize, ( fileSize / numberOfRanks ) * ( rank + 1 ) +
+            ( fileSize % numberOfRanks ) * ( rank + 1 ) / numberOfRanks, ( type == IMPORT_TYPE_NODES ) ? "Node:" : "Element:",
+            &end );
+    }
+    if( error != FIELD_IMPORT_NO_ERROR )
+    {
+        fclose( file );
+        return error;
+    }
+
+    entry = calloc( 1, sizeof( ImportSessionListEntry ) );
+    if( entry == NULL )
+    {
+        fclose( file );
+        return FIELD_IMPORT_ERROR_OUT_OF_MEMORY;
+    }
+    entry->session.type = type;
+
+    if( end > start )
+    {
+        buffer = malloc( (size_t)( end - start ) );
+        if( buffer == NULL )
+        {
+            free( entry );
+            fclose( file );
+            return FIELD_IMPORT_ERROR_OUT_OF_MEMORY;
+        }
+        if( ( fseeko( file, start, SEEK_SET ) != 0 ) ||
+            ( fread( buffer, 1, (size_t)( end - start ), file ) != (size_t)( end - start ) ) )
+        {
+            error = FIELD_IMPORT_ERROR_FILE_IO;
+        }
+        else
+        {
+            error = FieldImport_Parse( &entry->session, buffer, (size_t)( end - start ) );
+        }
+        free( buffer );
+        if( error != FIELD_IMPORT_NO_ERROR )
+        {
+            FieldImport_FreeSession( &entry->session );
+            free( entry );
+            fclose( file );
+            return error;
+        }
+    }
+    fclose( file );
+
+    entry->handle = nextImportHandle++;
+    entry->next = importSessions.next;
+    importSessions.next = entry;
+
+    *handle = entry->handle;
+
+    return FIELD_IMPORT_NO_ERROR;
+}
+
+
+/*
+    Returns the number of records read, and the total number of node numbers (element sessions) or values (node sessions)
+    in them.
+*/
+int FieldImport_RecordCounts( const int handle, int *const recordCount, int *const entryCount )
+{
+    ImportSessionListEntry *entry = FieldImport_GetSession( handle );
+
+    if( entry == NULL )
+    {
+        return FIELD_IMPORT_ERROR_BAD_HANDLE;
+    }
+
+    *recordCount = entry->session.recordCount;
+    *entryCount = entry->session.entryCount;
+
+    return FIELD_IMPORT_NO_ERROR;
+}
+
+
+/*
+    Copies out the element numbers, the number of nodes of each element, and the element nodes one element after another.
+*/
+int FieldImport_ElementRecords( const int handle, int *const elementNumbers, int *const nodeCounts, int *const nodes )
+{
+    ImportSessionListEntry *entry = FieldImport_GetSession( handle );
+
+    if( ( entry == NULL ) || ( entry->session.type != IMPORT_TYPE_ELEMENTS ) )
+    {
+        return FIELD_IMPORT_ERROR_BAD_HANDLE;
+    }
+
+    if( entry->session.recordCount > 0 )
+    {
+        memcpy( elementNumbers, entry->session.recordNumbers, entry->session.recordCount * sizeof( int ) );
+        memcpy( nodeCounts, entry->session.entryCounts, entry->session.recordCount * sizeof( int ) );
+    }
+    if( entry->session.entryCount > 0 )
+    {
+        memcpy( nodes, entry->session.intEntries, entry->session.entryCount * sizeof( int ) );
+    }
+
+    return FIELD_IMPORT_NO_ERROR;
+}
+
+
+/*
+    Copies out the node numbers, the number of values of each node, and the node values one node after another.
+*/
+int FieldImport_NodeRecords( const int handle, int *const nodeNumbers, int *const valueCounts, double *const values )
+{
+    ImportSessionListEntry *entry = FieldImport_GetSession( handle );
+
+    if( ( entry == NULL ) || ( entry->session.type != IMPORT_TYPE_NODES ) )
+    {
+        return FIELD_IMPORT_ERROR_BAD_HANDLE;
+    }
+
+    if( entry->session.recordCount > 0 )
+    {
+        memcpy( nodeNumbers, entry->session.recordNumbers, entry->session.recordCount * sizeof( int ) );
+        memcpy( valueCounts, entry->session.entryCounts, entry->session.recordCount * sizeof( int ) );
+    }
+    if( entry->session.entryCount > 0 )
+    {
+        memcpy( values, entry->session.doubleEntries, entry->session.entryCount * sizeof( double ) );
+    }
+
+    return FIELD_IMPORT_NO_ERROR;
+}
+
+
+int FieldImport_CloseSession( const int handle )
+{
+    ImportSessionListEntry *entry = &importSessions;
+    ImportSessionListEntry *closing;
+
+    while( ( entry->next != NULL ) && ( entry->next->handle != handle ) )
+    {
+        entry = entry->next;
+    }
+    if( entry->next == NULL )
+    {
+        return FIELD_IMPORT_ERROR_BAD_HANDLE;
+    }
+
+    closing = entry->next;
+    entry->next = closing->next;
+    FieldImport_FreeSession( &closing->session );
+    free( closing );
+
+    return FIELD_IMPORT_NO_ERROR;
+}
@@ -294,6 +294,8 @@ MODULE BASE_ROUTINES
 
   PUBLIC DIAGNOSTICS1,DIAGNOSTICS2,DIAGNOSTICS3,DIAGNOSTICS4,DIAGNOSTICS5
 
+  PUBLIC DIAG_OR_TIMING
+
   PUBLIC ALL_DIAG_TYPE,IN_DIAG_TYPE,FROM_DIAG_TYPE
 
   PUBLIC OPEN_COMFILE_UNIT,START_READ_COMFILE_UNIT,STOP_READ_COMFILE_UNIT,TEMPORARY_FILE_UNIT
@@ -51,10 +51,14 @@ This file provides c utility routines for the binary_file module.
 Functions included:
 
 BinaryCloseFile      Close a binary file
+BinaryMapContains    Returns whether or not an address is in a mapped binary file
+BinaryMapFile        Memory map a binary file opened for reading
+BinaryMapRead        Return the address of data in a mapped binary file
 BinaryOpenFile       Open a binary file
 BinaryReadFile       Read data from a binary file
 BinarySetFile        Sets the position of a binary file
 BinarySkipFile       Skip bytes in a binary file
+BinaryTellFile       Returns the position of a binary file
 BinaryWriteFile      Write data to a binary file
 IsBinaryFileOpen     Returns whether or not a binary file is open
 IsEndBinaryFile      Returns whether or not at eof of a binary file
@@ -67,44 +71,67 @@ IsEndBinaryFile      Returns whether or not at eof of a binary file
 #include <stdlib.h>
 #include <string.h>
 
+#if defined(unix) || defined(__unix__) || defined(__APPLE__)
+#define BINARYFILEMMAP
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
 #ifdef VMS
 #define BinaryCloseFile BINARYCLOSEFILE
+#define BinaryMapContains BINARYMAPCONTAINS
+#define BinaryMapFile BINARYMAPFILE
+#define BinaryMapRead BINARYMAPREAD
 #define BinaryOpenFile BINARYOPENFILE
 #define BinaryReadFile BINARYREADFILE
 #define BinarySetFile BINARYSETFILE
 #define BinarySkipFile BINARYSKIPFILE
+#define BinaryTellFile BINARYTELLFILE
 #define BinaryWriteFile BINARYWRITEFILE
 #define IsBinaryFileOpen ISBINARYFILEOPEN
 #define IsEndBinaryFile ISENDBINARYFILE
 #endif
 #ifdef mips
 #define BinaryCloseFile binaryclosefile_
+#define BinaryMapContains binarymapcontains_
+#define BinaryMapFile binarymapfile_
+#define BinaryMapRead binarymapread_
 #define BinaryOpenFile binaryopenfile_
 #define BinaryReadFile binaryreadfile_
 #define BinarySetFile binarysetfile_
 #define BinarySkipFile binaryskipfile_
+#define BinaryTellFile binarytellfile_
 #define BinaryWriteFile binarywritefile_
 #define IsBinaryFileOpen isbinaryfileopen_
 #define IsEndBinaryFile isendbinaryfile_
 #endif
 #ifdef WIN32
 #define BinaryCloseFile binaryclosefile
+#define BinaryMapContains binarymapcontains
+#define BinaryMapFile binarymapfile
+#define BinaryMapRead binarymapread
 #define BinaryOpenFile binaryopenfile
 #define BinaryReadFile binaryreadfile
 #define BinarySetFile binarysetfile
 #define BinarySkipFile binaryskipfile
+#define BinaryTellFile binarytellfile
 #define BinaryWriteFile binarywritefile
 #define IsBinaryFileOpen isbinaryfileopen
 #define IsEndBinaryFile isendbinaryfile
 #endif
-#ifdef linux
-#define BinaryCloseFile binaryclosefile
-#define BinaryOpenFile binaryopenfile
+#if defined(linux) || defined(__linux__)
+#define BinaryCloseFile binaryclosefile_
+#define BinaryMapContains binarymapcontains_
+#define BinaryMapFile binarymapfile_
+#define BinaryMapRead binarymapread_
+#define BinaryOpenFile binaryopenfile_
 #define BinaryReadFile binaryreadfile_
-#define BinarySetFile binarysetfile
-#define BinarySkipFile binaryskipfile
+#define BinarySetFile binarysetfile_
+#define BinarySkipFile binaryskipfile_
+#define BinaryTellFile binarytellfile_
 #define BinaryWriteFile binarywritefile_
-#define IsBinaryFileOpen isbinaryfileopen
+#define IsBinaryFileOpen isbinaryfileopen_
 #define IsEndBinaryFile isendbinaryfile_
 #endif
 
@@ -127,6 +154,8 @@ IsEndBinaryFile      Returns whether or not at eof of a binary file
 #define MAXBINFILES 99
 #define SAMEENDIAN 0
 #define FLIPENDIAN 1
+/* Number of bytes byte swapped at a time when the file endian differs */
+#define SWAPBUFFERSIZE 65536
 
 /* Type definitions */
 
@@ -134,9 +163,29 @@ typedef int logical;
 
 /* Function prototypes */
 
+static int BinaryItemSize(int item_type,
+  int *item_size,
+  int *swap_size);
+
 void BinaryCloseFile(int *fileid,
   int *err, 
   char *error_string);
+void BinaryMapContains(int *fileid,
+  void *address,
+  int *returncode,
+  int *err,
+  char *error_string);
+void BinaryMapFile(int *fileid,
+  int *mapped,
+  int *err,
+  char *error_string);
+void BinaryMapRead(int *fileid,
+  int *endian,
+  int *number_of_items,
+  int *item_type,
+  void **address,
+  int *err,
+  char *error_string);
 void BinaryOpenFile(int *fileid,
   char *filename,
   char* access_code,
@@ -157,6 +206,10 @@ void BinarySkipFile(int *fileid,
   int *number_of_bytes, 
   int *err,
   char *error_string);
+void BinaryTellFile(int *fileid,
+  long long *position,
+  int *err,
+  char *error_string);
 void BinaryWriteFile(int *fileid,
   int *endian,
   int *number_of_items, 
@@ -191,8 +244,52 @@ FILE *binaryfiles[MAXBINFILES]=
    NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL,
    NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL};
 
+/* The read only memory maps of the binary files that have been mapped.
+   Static arrays are zero (NULL) initialised. */
+static char *binarymaps[MAXBINFILES];
+static size_t binarymapsizes[MAXBINFILES];
+
 /* Code */
 
+static int BinaryItemSize(int item_type,
+  int *item_size,
+  int *swap_size)
+
+/*
+Returns in item_size the number of bytes of an item of type item_type
+and in swap_size the number of bytes reversed when changing endian.
+These differ for complex types. Returns 1 for an unknown type.
+*/
+
+{
+  switch(item_type)
+  {
+    case INTEGERTYPE: *item_size=sizeof(int); break;
+    case SHORTINTTYPE: *item_size=sizeof(short int); break;
+    case LONGINTTYPE: *item_size=sizeof(long long int); break;
+    case FLOATTYPE: *item_size=sizeof(float); break;
+    case DOUBLETYPE: *item_size=sizeof(double); break;
+    case CHARTYPE: *item_size=sizeof(char); break;
+    case LOGICALTYPE: *item_size=sizeof(logical); break;
+    case COMPLEXTYPE: *item_size=2*sizeof(float); break;
+    case DOUBLECOMPLEXTYPE: *item_size=2*sizeof(double); break;
+    default: return 1;
+  }
+  if(CHARTYPE == item_type)
+  {
+    *swap_size=1;
+  }
+  else if(COMPLEXTYPE == item_type || DOUBLECOMPLEXTYPE == item_type)
+  {
+    *swap_size=*item_size/2;
+  }
+  else
+  {
+    *swap_size=*item_size;
+  }
+  return 0;
+}
+
 void BinaryCloseFile(int *fileid,
   int *err,
   char *error_string)
@@ -210,6 +307,14 @@ Closes the binary file specified by fileid.
     }
     else
     {
+#ifdef BINARYFILEMMAP
+      if(binarymaps[*fileid-1])
+      {
+        munmap(binarymaps[*fileid-1],binarymapsizes[*fileid-1]);
+        binarymaps[*fileid-1] = (char *)NULL;
+        binarymapsizes[*fileid-1] = 0;
+      }
+#endif
       *err = fclose(binaryfiles[*fileid-1]);
       binaryfiles[*fileid-1] = (FILE *)NULL;
       if(*err != 0)
@@ -225,6 +330,169 @@ Closes the binary file specified by fileid.
   }
 }
 
+void BinaryMapContains(int *fileid,
+  void *address,
+  int *returncode,
+  int *err,
+  char *error_string)
+
+/*
+Returns 1 in returncode if address lies within the memory map of the
+binary file specified by fileid, 0 if not or if the file is not mapped.
+*/
+
+{
+  char *map;
+
+  if((*fileid >= 1) && (*fileid <= MAXBINFILES-1))
+  {
+    map=binarymaps[*fileid-1];
+    if(map && (char *)address >= map && (char *)address < map+binarymapsizes[*fileid-1])
+    {
+      *returncode = 1;
+    }
+    else
+    {
+      *returncode = 0;
+    }
+    *err=0;
+  }
+  else
+  {
+    *err=1;
+    strcpy(error_string,">>ERROR: file ID is out of range");
+  }
+}
+
+void BinaryMapFile(int *fileid,
+  int *mapped,
+  int *err,
+  char *error_string)
+
+/*
+Maps the whole of the binary file specified by fileid read only into
+memory. The file must be open for reading and stays open, so that its
+file position still tracks how far it has been read. mapped is returned
+as 1 if the file was mapped and 0 if it could not be (no mmap on this
+system or an empty file), in which case reads simply copy from the file.
+*/
+
+{
+#ifdef BINARYFILEMMAP
+  struct stat file_status;
+  void *map;
+#endif
+  FILE* binaryfile;
+
+  *mapped=0;
+  if((*fileid >= 1) && (*fileid <= MAXBINFILES-1))
+  {
+    binaryfile=binaryfiles[*fileid-1];
+    if(!binaryfile)
+    {
+      *err = 1;
+      strcpy(error_string,">>ERROR: binary file is not open");
+    }
+    else
+    {
+      *err=0;
+#ifdef BINARYFILEMMAP
+      if(!binarymaps[*fileid-1] && 0 == fstat(fileno(binaryfile),&file_status) && 0 < file_status.st_size)
+      {
+        map=mmap(NULL,(size_t)file_status.st_size,PROT_READ,MAP_PRIVATE,fileno(binaryfile),(off_t)0);
+        if(MAP_FAILED != map)
+        {
+          binarymaps[*fileid-1]=(char *)map;
+          binarymapsizes[*fileid-1]=(size_t)file_status.st_size;
+        }
+      }
+      if(binarymaps[*fileid-1])
+      {
+        *mapped=1;
+      }
+#endif
+    }
+  }
+  else
+  {
+    *err=1;
+    strcpy(error_string,">>ERROR: file ID is out of range");
+  }
+}
+
+void BinaryMapRead(int *fileid,
+  int *endian,
+  int *number_of_items,
+  int *item_type,
+  void **address,
+  int *err,
+  char *error_string)
+
+/*
+Returns in address the location in the memory map of the binary file
+specified by fileid of the next number_of_items of data of a type given
+by item_type, and moves the file position past them. No data is copied.
+
+The address is only returned if the file is mapped, the data is in the
+machine's byte order (endian is SAMEENDIAN) and the data starts on a
+boundary suitable for its type. Otherwise address is returned as NULL,
+the file position is unchanged and the caller should read a copy of the
+data with BinaryReadFile.
+*/
+
+{
+  long position;
+  size_t number_of_bytes;
+  int item_size,swap_size;
+  char *map;
+  FILE* binaryfile;
+
+  *address=NULL;
+  if((*fileid >= 1) && (*fileid <= MAXBINFILES-1))
+  {
+    binaryfile=binaryfiles[*fileid-1];
+    map=binarymaps[*fileid-1];
+    if(!binaryfile)
+    {
+      *err = 1;
+      strcpy(error_string,">>ERROR: binary file is not open");
+    }
+    else if(BinaryItemSize(*item_type,&item_size,&swap_size))
+    {
+      *err=1;
+      strcpy(error_string,">>ERROR: Invalid item type");
+    }
+    else
+    {
+      *err=0;
+      if(map && (SAMEENDIAN == *endian || 1 == swap_size) && 0 <= *number_of_items)
+      {
+        number_of_bytes=(size_t)*number_of_items * (size_t)item_size;
+        position=ftell(binaryfile);
+        if(0 <= position && (size_t)position <= binarymapsizes[*fileid-1] &&
+          number_of_bytes <= binarymapsizes[*fileid-1]-(size_t)position &&
+          0 == ((size_t)(map+position)) % (size_t)swap_size)
+        {
+          if(0 == fseek(binaryfile,position+(long)number_of_bytes,SEEK_SET))
+          {
+            *address=(void *)(map+position);
+          }
+          else
+          {
+            *err=1;
+            strcpy(error_string,">>ERROR: error skipping binary file");
+          }
+        }
+      }
+    }
+  }
+  else
+  {
+    *err=1;
+    strcpy(error_string,">>ERROR: file ID is out of range");
+  }
+}
+
 void BinaryOpenFile(int *fileid,
   char *filename,
   char *access_code,
@@ -275,14 +543,16 @@ void BinaryReadFile(int *fileid,
 Reads number_of_items of data of a type given by item_type from
 a binary file specified by fileid into an array iven by data.
 
-The default endian ordering is big endian. This is specified by
-endian=0. If little endian is required endian must be set to a number
-other than 0.
+The data is read in one block. If endian is FLIPENDIAN the bytes of
+each item (or of each part of a complex item) are reversed after
+reading.
 
 */
 
 {
-  int i,item_size,j,number_of_bytes,start_byte,temp;
+  size_t i,j,number_of_bytes;
+  int item_size,swap_size;
+  char temp;
   FILE* binaryfile;
   
   if((*fileid >= 1) && (*fileid <= MAXBINFILES-1))
@@ -293,77 +563,35 @@ other than 0.
       *err = 1;
       strcpy(error_string,">>ERROR: binary file is not open");
     }
+    else if(BinaryItemSize(*item_type,&item_size,&swap_size))
+    {
+      *err=1;
+      strcpy(error_string,">>ERROR: Invalid item type");
+    }
     else
     {
-      if(INTEGERTYPE == *item_type)
-	    {
-	      /* Integer data */
-	      item_size=sizeof(int);
-	    }
-      else if(FLOATTYPE == *item_type)
-	    {
-	      /* Float data */
-	      item_size=sizeof(float);
-	    }
-      else if(DOUBLETYPE == *item_type)
-	    /* Double data */
-	    {
-	      item_size=sizeof(double);
-	    }
-      else if(CHARTYPE == *item_type)
-	    /* Character data */
-	    {
-	      item_size=sizeof(char);
-	    }
-      else if(LOGICALTYPE == *item_type)
-	    /* Logical data */
-	    {
-	      item_size=sizeof(logical);
-	    }
-      else if(SHORTINTTYPE == *item_type)
-	    /* Short integer data */
-	    {
-	      item_size=sizeof(short int);
-	    }
-      else
-	    {
-	      *err=1;
-	      strcpy(error_string,">>ERROR: Invalid item type");
-	    }
-	  
-      if(SAMEENDIAN == *endian || CHARTYPE == *item_type) 
-	    {
-	      /* Default big endian format */
-	      number_of_bytes=*number_of_items * item_size;
-	      for(i = 0; i < number_of_bytes ; i++)
-        {
-          temp = getc(binaryfile); 
-          data[i] = (char)temp;  
-        }
-        if(CHARTYPE == *item_type)
-        {
-          data[number_of_bytes]='\0';
-        }
-	    }
+      number_of_bytes=(size_t)*number_of_items * (size_t)item_size;
+      if(fread(data,1,number_of_bytes,binaryfile) != number_of_bytes)
+      {
+        *err=1;
+        strcpy(error_string,">>ERROR: error reading binary file");
+      }
       else
-	    {
-	      /* Little endian format - must reverse byte ordering */
-	      for(i = 0; i < *number_of_items; i++)
+      {
+        *err=0;
+        if(SAMEENDIAN != *endian && 1 < swap_size)
         {
-          start_byte=i*item_size;
-          for(j = 0; j < item_size; j++)
+          for(i = 0; i < number_of_bytes; i += swap_size)
           {
-            temp = getc(binaryfile); 
-            data[start_byte+item_size-j-1] = (char)temp;
+            for(j = 0; j < (size_t)swap_size/2; j++)
+            {
+              temp=data[i+j];
+              data[i+j]=data[i+swap_size-j-1];
+              data[i+swap_size-j-1]=temp;
+            }
           }
         }
-	    }
-	  
-      *err=ferror(binaryfile);
-      if(*err != 0)
-	    {
-	      strcpy(error_string,">>ERROR: error reading binary file");
-	    }
+      }
     }
   }
   else
@@ -449,7 +677,6 @@ by fileid.
 */
 
 {
-  int i,temp;
   FILE* binaryfile;
   
   if((*fileid >= 1) && (*fileid <= MAXBINFILES-1))
@@ -462,12 +689,7 @@ by fileid.
     }
     else
     {
-      for(i = 0; i < *number_of_bytes ; i++)
-	    {
-	      temp = getc(binaryfile); 
-	    }
-	  
-      *err=ferror(binaryfile);
+      *err=fseek(binaryfile,(long)*number_of_bytes,SEEK_CUR);
       if(*err != 0)
 	    {
 	      strcpy(error_string,">>ERROR: error skipping binary file");
@@ -481,6 +703,50 @@ by fileid.
   }
 }
 
+void BinaryTellFile(int *fileid,
+  long long *position,
+  int *err,
+  char *error_string)
+
+/*
+Returns in position the current position, in bytes from the beginning,
+of the binary file specified by fileid.
+*/
+
+{
+  long file_position;
+  FILE* binaryfile;
+
+  if((*fileid >= 1) && (*fileid <= MAXBINFILES-1))
+  {
+    binaryfile=binaryfiles[*fileid-1];
+    if(!binaryfile)
+    {
+      *err = 1;
+      strcpy(error_string,">>ERROR: binary file is not open");
+    }
+    else
+    {
+      file_position=ftell(binaryfile);
+      if(0 > file_position)
+      {
+        *err=1;
+        strcpy(error_string,">>ERROR: error finding binary file position");
+      }
+      else
+      {
+        *err=0;
+        *position=(long long)file_position;
+      }
+    }
+  }
+  else
+  {
+    *err=1;
+    strcpy(error_string,">>ERROR: file ID is out of range");
+  }
+}
+
 void BinaryWriteFile(int *fileid,
   int *endian,
   int *number_of_items, 
@@ -493,14 +759,16 @@ void BinaryWriteFile(int *fileid,
 Writes number_of_items of data of a type given byitem_type to a
 binary file specified by fileid from an array given by data. 
 
-The default endian ordering is big endian. This is specified by
-endian=0. If little endian is required endian must be set to a number
-other than 0.
+If endian is SAMEENDIAN the data is written in one block. Otherwise
+the bytes of each item (or of each part of a complex item) are
+reversed through a buffer of SWAPBUFFERSIZE bytes.
 
 */
 
 {
-  int i,item_size,j,number_of_bytes,start_byte;
+  size_t i,j,k,block_bytes,number_of_bytes;
+  int item_size,swap_size;
+  char buffer[SWAPBUFFERSIZE];
   FILE* binaryfile;
   
   if((*fileid >= 1) && (*fileid <= MAXBINFILES-1))
@@ -511,67 +779,44 @@ other than 0.
       *err = 1;
       strcpy(error_string,">>ERROR: binary file is not open");
     }
+    else if(BinaryItemSize(*item_type,&item_size,&swap_size))
+    {
+      *err=1;
+      strcpy(error_string,">>ERROR: Invalid item type");
+    }
     else
     {
-      if(INTEGERTYPE == *item_type)
-	    {
-	      /* Integer data */
-	      item_size=sizeof(int);
-	    }
-      else if(FLOATTYPE == *item_type)
-	    {
-	      /* Float data */
-	      item_size=sizeof(float);
-	    }
-      else if(DOUBLETYPE == *item_type)
-	    /* Double data */
-	    {
-	      item_size=sizeof(double);
-	    }
-      else if(CHARTYPE == *item_type)
-	    /* Character data */
+      *err=0;
+      number_of_bytes=(size_t)*number_of_items * (size_t)item_size;
+      if(SAMEENDIAN == *endian || 1 == swap_size) 
 	    {
-	      item_size=sizeof(char);
-	    }
-      else if(LOGICALTYPE == *item_type)
-	    /* Logical data */
-	    {
-	      item_size=sizeof(logical);
-	    }
-      else if(SHORTINTTYPE == *item_type)
-	    /* Short integer data */
-	    {
-	      item_size=sizeof(short int);
-	    }
-      else
-	    {
-	      *err=1;
-	      strcpy(error_string,">>ERROR: Invalid item type");
-	    }
-	  
-      if(SAMEENDIAN == *endian || CHARTYPE == *item_type) 
-	    {
-	      /* Default big endian format */
-	      number_of_bytes=*number_of_items * item_size;
-	      for(i = 0; i < number_of_bytes ; i++)
+        if(fwrite(data,1,number_of_bytes,binaryfile) != number_of_bytes)
         {
-          putc(data[i],binaryfile);
+          *err=1;
         }
 	    }
       else
 	    {
-	      /* Little endian format - must reverse byte ordering */
-	      for(i = 0; i < *number_of_items; i++)
+        for(i = 0; i < number_of_bytes && 0 == *err; i += block_bytes)
         {
-          start_byte=i*item_size;
-          for(j = 0; j < item_size; j++)
+          block_bytes=number_of_bytes-i;
+          if(block_bytes > (SWAPBUFFERSIZE/swap_size)*swap_size)
+          {
+            block_bytes=(SWAPBUFFERSIZE/swap_size)*swap_size;
+          }
+          for(j = 0; j < block_bytes; j += swap_size)
+          {
+            for(k = 0; k < (size_t)swap_size; k++)
+            {
+              buffer[j+k]=data[i+j+swap_size-k-1];
+            }
+          }
+          if(fwrite(buffer,1,block_bytes,binaryfile) != block_bytes)
           {
-            putc(data[start_byte+item_size-j-1],binaryfile);
+            *err=1;
           }
         }
 	    }
-      
-      *err=ferror(binaryfile);
       if(*err != 0)
 	    {
 	      strcpy(error_string,">>ERROR: error writing binary file");
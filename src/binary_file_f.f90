@@ -46,7 +46,7 @@
 !#### Module: BINARY_FILE 
 !###  Description:
 !###    This module handles the reading and writing of binary files.
-!###  Uses: KINDS,CONSTANTS,MACHINE_CONSTANTS,BASE_ROUTINES,F90C,ISO_VARYING_STRING
+!###  Uses: KINDS,CONSTANTS,MACHINE_CONSTANTS,BASE_ROUTINES,ISO_VARYING_STRING
 !###  Routine: INQUIRE_OPEN_BINARY_FILE
 !###  Routine: INQUIRE_EOF_BINARY_FILE
 !###  Routine: CLOSE_BINARY_FILE
@@ -54,7 +54,9 @@
 !###  Routine: OPEN_BINARY_FILE
 !###  Routine: OPEN_CMISS_BINARY_FILE
 !###  Routine: READ_BINARY_FILE
+!###  Routine: READ_BINARY_FILE_POINTER
 !###  Routine: READ_BINARY_TAG_HEADER
+!###  Routine: RELEASE_BINARY_FILE_POINTER
 !###  Routine: RESET_BINARY_NUMBER_TAGS
 !###  Routine: SET_BINARY_FILE
 !###  Routine: SKIP_CM_BINARY_HEADER
@@ -226,14 +228,14 @@ MODULE BINARY_FILE
   USE CONSTANTS
   USE MACHINE_CONSTANTS
   USE BASE_ROUTINES
-  USE F90C
+  USE ISO_C_BINDING
   USE ISO_VARYING_STRING
   
 #include "macros.h"
 
   IMPLICIT NONE
 
-  !PRIVATE
+  PRIVATE
 
   !Module parameters
   
@@ -251,12 +253,15 @@ MODULE BINARY_FILE
   !Binary file parameters
   INTEGER(INTG), PARAMETER :: BINARY_FILE_READABLE=1
   INTEGER(INTG), PARAMETER :: BINARY_FILE_WRITABLE=2
+  !The boundary, in bytes, on which the data of leaf tags is written so that it can be used in place from a mapped file
+  INTEGER(INTG), PARAMETER :: BINARY_FILE_DATA_ALIGNMENT=8
 
   !CMISS Binary file parameters
   INTEGER(INTG), PARAMETER :: CMISS_BINARY_IDENTITY=7
   INTEGER(INTG), PARAMETER :: CMISS_BINARY_MATRIX_FILE=1
   INTEGER(INTG), PARAMETER :: CMISS_BINARY_HISTORY_FILE=2
   INTEGER(INTG), PARAMETER :: CMISS_BINARY_SIGNAL_FILE=3
+  INTEGER(INTG), PARAMETER :: CMISS_BINARY_NODE_FILE=4
   INTEGER(INTG), PARAMETER :: CMISS_BINARY_IDENTITY_HEADER=1
   INTEGER(INTG), PARAMETER :: CMISS_BINARY_MACHINE_HEADER=2
   INTEGER(INTG), PARAMETER :: CMISS_BINARY_FILE_HEADER=3
@@ -285,10 +290,11 @@ MODULE BINARY_FILE
     INTEGER(INTG) :: DPC_REAL_SIZE
     CHARACTER(LEN=MAXSTRLEN) :: FILE_NAME
     INTEGER(INTG) :: ACCESS_TYPE
+    LOGICAL :: MAPPED
   END TYPE BINARY_FILE_INFO_TYPE
 
   TYPE BINARY_FILE_TYPE
-    TYPE(BINARY_FILE_INFO_TYPE), POINTER :: FILE_INFORMATION
+    TYPE(BINARY_FILE_INFO_TYPE), POINTER :: FILE_INFORMATION=>NULL()
   END TYPE BINARY_FILE_TYPE
 
   TYPE BINARY_TAG_TYPE
@@ -308,48 +314,82 @@ MODULE BINARY_FILE
   INTERFACE
     
     SUBROUTINE BINARYCLOSEFILE(FILE_NUMBER,ERR,CERROR)
-!DEC$ ATTRIBUTES C :: binaryclosefile
       USE CONSTANTS
       INTEGER(INTG), INTENT(IN) :: FILE_NUMBER
       INTEGER(INTG), INTENT(OUT) :: ERR,CERROR(*)
     END SUBROUTINE BINARYCLOSEFILE
 
+    SUBROUTINE BINARYMAPCONTAINS(FILE_NUMBER,ADDRESS,RETURNCODE,ERR,CERROR)
+      USE CONSTANTS
+      USE ISO_C_BINDING
+      INTEGER(INTG), INTENT(IN) :: FILE_NUMBER
+      TYPE(C_PTR), VALUE :: ADDRESS
+      INTEGER(INTG), INTENT(OUT) :: RETURNCODE,ERR,CERROR(*)
+    END SUBROUTINE BINARYMAPCONTAINS
+
+    SUBROUTINE BINARYMAPFILE(FILE_NUMBER,MAPPED,ERR,CERROR)
+      USE CONSTANTS
+      INTEGER(INTG), INTENT(IN) :: FILE_NUMBER
+      INTEGER(INTG), INTENT(OUT) :: MAPPED,ERR,CERROR(*)
+    END SUBROUTINE BINARYMAPFILE
+
+    SUBROUTINE BINARYMAPREAD(FILE_NUMBER,ENDIAN,NUMBER_ITEMS,ITEM_TYPE,ADDRESS,ERR,CERROR)
+      USE CONSTANTS
+      USE ISO_C_BINDING
+      INTEGER(INTG), INTENT(IN) :: FILE_NUMBER,ENDIAN,NUMBER_ITEMS,ITEM_TYPE
+      TYPE(C_PTR), INTENT(OUT) :: ADDRESS
+      INTEGER(INTG), INTENT(OUT) :: ERR,CERROR(*)
+    END SUBROUTINE BINARYMAPREAD
+
     SUBROUTINE BINARYOPENFILE(FILE_NUMBER,CFNAME,CACCESSCODE,ERR,CERROR)
-!DEC$ ATTRIBUTES C :: binaryopenfile
       USE CONSTANTS
       INTEGER(INTG), INTENT(IN) :: FILE_NUMBER,CFNAME(*),CACCESSCODE(*)
       INTEGER(INTG), INTENT(OUT) :: ERR,CERROR(*)
     END SUBROUTINE BINARYOPENFILE
 
-!!DEC$ ATTRIBUTES C :: binaryreadfile
+    SUBROUTINE BINARYREADFILE(FILE_NUMBER,ENDIAN,NUMBER_ITEMS,ITEM_TYPE,DATA,ERR,CERROR)
+      USE CONSTANTS
+      USE ISO_C_BINDING
+      INTEGER(INTG), INTENT(IN) :: FILE_NUMBER,ENDIAN,NUMBER_ITEMS,ITEM_TYPE
+      TYPE(C_PTR), VALUE :: DATA
+      INTEGER(INTG), INTENT(OUT) :: ERR,CERROR(*)
+    END SUBROUTINE BINARYREADFILE
 
     SUBROUTINE BINARYSETFILE(FILE_NUMBER,SET_CODE,ERR,CERROR)
       USE CONSTANTS
-!DEC$ ATTRIBUTES C :: binarysetfile
       INTEGER(INTG), INTENT(IN) :: FILE_NUMBER,SET_CODE
       INTEGER(INTG), INTENT(OUT) :: ERR,CERROR(*)
     END SUBROUTINE BINARYSETFILE
 
     SUBROUTINE BINARYSKIPFILE(FILE_NUMBER,NUMBER_BYTES,ERR,CERROR)
-!DEC$ ATTRIBUTES C :: binaryskipfile
      USE CONSTANTS
       INTEGER(INTG), INTENT(IN) :: FILE_NUMBER,NUMBER_BYTES
       INTEGER(INTG), INTENT(OUT) :: ERR,CERROR(*)
     END SUBROUTINE BINARYSKIPFILE
 
-!!    SUBROUTINE BINARYWRITEFILE
-!!!DEC$ ATTRIBUTES C :: binarywritefile
-!!    END SUBROUTINE BINARYWRITEFILE
+    SUBROUTINE BINARYTELLFILE(FILE_NUMBER,POSITION,ERR,CERROR)
+      USE CONSTANTS
+      USE KINDS
+      INTEGER(INTG), INTENT(IN) :: FILE_NUMBER
+      INTEGER(LINTG), INTENT(OUT) :: POSITION
+      INTEGER(INTG), INTENT(OUT) :: ERR,CERROR(*)
+    END SUBROUTINE BINARYTELLFILE
+
+    SUBROUTINE BINARYWRITEFILE(FILE_NUMBER,ENDIAN,NUMBER_ITEMS,ITEM_TYPE,DATA,ERR,CERROR)
+      USE CONSTANTS
+      USE ISO_C_BINDING
+      INTEGER(INTG), INTENT(IN) :: FILE_NUMBER,ENDIAN,NUMBER_ITEMS,ITEM_TYPE
+      TYPE(C_PTR), VALUE :: DATA
+      INTEGER(INTG), INTENT(OUT) :: ERR,CERROR(*)
+    END SUBROUTINE BINARYWRITEFILE
 
     SUBROUTINE ISBINARYFILEOPEN(FILE_NUMBER,RETURNCODE,ERR,CERROR)
-!DEC$ ATTRIBUTES C :: isbinaryfileopen
       USE CONSTANTS
       INTEGER(INTG), INTENT(IN) :: FILE_NUMBER
       INTEGER(INTG), INTENT(OUT) :: RETURNCODE, ERR, CERROR(*)
     END SUBROUTINE ISBINARYFILEOPEN
 
     SUBROUTINE ISENDBINARYFILE(FILE_NUMBER,RETURN_CODE,ERR,CERROR)
-!DEC$ ATTRIBUTES C :: isbinaryfileopen
       USE CONSTANTS
       INTEGER(INTG), INTENT(IN) :: FILE_NUMBER
       INTEGER(INTG), INTENT(OUT) :: RETURN_CODE,ERR,CERROR(*)
@@ -377,6 +417,16 @@ MODULE BINARY_FILE
     MODULE PROCEDURE READ_BINARY_FILE_DPC1
   END INTERFACE !READ_BINARY_FILE
 
+  INTERFACE READ_BINARY_FILE_POINTER
+    MODULE PROCEDURE READ_BINARY_FILE_POINTER_INTG
+    MODULE PROCEDURE READ_BINARY_FILE_POINTER_DP
+  END INTERFACE !READ_BINARY_FILE_POINTER
+
+  INTERFACE RELEASE_BINARY_FILE_POINTER
+    MODULE PROCEDURE RELEASE_BINARY_FILE_POINTER_INTG
+    MODULE PROCEDURE RELEASE_BINARY_FILE_POINTER_DP
+  END INTERFACE !RELEASE_BINARY_FILE_POINTER
+
   INTERFACE WRITE_BINARY_FILE
     MODULE PROCEDURE WRITE_BINARY_FILE_INTG
     MODULE PROCEDURE WRITE_BINARY_FILE_INTG1
@@ -398,8 +448,14 @@ MODULE BINARY_FILE
   END INTERFACE !WRITE_BINARY_FILE
 
   PUBLIC FILE_BEGINNING,FILE_CURRENT,FILE_END,CMISS_BINARY_MATRIX_FILE,&
-    & CMISS_BINARY_HISTORY_FILE,CMISS_BINARY_SIGNAL_FILE,BINARY_FILE_TYPE
-  PUBLIC READ_BINARY_FILE,WRITE_BINARY_FILE
+    & CMISS_BINARY_HISTORY_FILE,CMISS_BINARY_SIGNAL_FILE,CMISS_BINARY_NODE_FILE,BINARY_FILE_TYPE
+  PUBLIC CMISS_BINARY_IDENTITY_HEADER,CMISS_BINARY_MACHINE_HEADER,CMISS_BINARY_FILE_HEADER,BINARY_TAG_TYPE
+  PUBLIC INQUIRE_OPEN_BINARY_FILE,INQUIRE_EOF_BINARY_FILE,CLOSE_BINARY_FILE,CLOSE_CMISS_BINARY_FILE,OPEN_BINARY_FILE, &
+    & OPEN_CMISS_BINARY_FILE
+  PUBLIC READ_BINARY_FILE,READ_BINARY_TAG_HEADER,RESET_BINARY_NUMBER_TAGS,SET_BINARY_FILE,SKIP_CM_BINARY_HEADER, &
+    & SKIP_BINARY_FILE,SKIP_BINARY_TAGS
+  PUBLIC READ_BINARY_FILE_POINTER,RELEASE_BINARY_FILE_POINTER
+  PUBLIC WRITE_BINARY_FILE,WRITE_BINARY_TAG_HEADER
 
 CONTAINS
 
@@ -481,7 +537,7 @@ CONTAINS
     !###    FILEID and deallocates the binary file information.
     
     !Argument Variables
-    TYPE(BINARY_FILE_TYPE), INTENT(OUT) :: FILEID
+    TYPE(BINARY_FILE_TYPE), INTENT(INOUT) :: FILEID
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local Variables
@@ -551,7 +607,9 @@ CONTAINS
     !###    OPEN_BINARY_FILE opens the binary file specified by
     !###    FILEID with the given FILENAME. The file will be opened
     !###    for reading if COMMAND is "READ" and writting if COMMAND
-    !###    is "WRITE".
+    !###    is "WRITE". If COMMAND is "READ_MAPPED" the file is also
+    !###    mapped into memory where the system allows it, so that
+    !###    READ_BINARY_FILE_POINTER can return the data in place.
         
     !Argument Variables
     TYPE(BINARY_FILE_TYPE), INTENT(OUT) :: FILEID
@@ -560,7 +618,7 @@ CONTAINS
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local Variables
     INTEGER(INTG) :: CACCESSCODE(2), CERROR(100), CFNAME(100),&
-      & FILENUMBER,FILENUM
+      & FILENUMBER,FILENUM,MAPPED
     CHARACTER(LEN=6) :: FACCESSCODE
     CHARACTER(LEN=MAXSTRLEN) :: DUMMY_ERROR
 
@@ -576,13 +634,14 @@ CONTAINS
     IF(FILENUMBER/=0) THEN
       ALLOCATE(FILEID%FILE_INFORMATION,STAT=ERR)
       IF(ERR==0) THEN
-        BINARY_FILE_USED(FILEID%FILE_INFORMATION%FILE_NUMBER)=.TRUE.
         FILEID%FILE_INFORMATION%FILE_NUMBER=FILENUMBER
+        BINARY_FILE_USED(FILENUMBER)=.TRUE.
         FILEID%FILE_INFORMATION%FILE_NAME=FILENAME
         FILEID%FILE_INFORMATION%ENDIAN_TYPE=MACHINE_ENDIAN
+        FILEID%FILE_INFORMATION%MAPPED=.FALSE.
         CALL F2CSTRING(CFNAME,FILENAME,ERR,ERROR,*999)        
         IF(COMMAND(1:4)=="READ") THEN
-          FACCESSCODE="rb+"
+          FACCESSCODE="rb"
           FILEID%FILE_INFORMATION%ACCESS_TYPE=BINARY_FILE_READABLE
         ELSE IF(COMMAND(1:5)=="WRITE") THEN
           FACCESSCODE="wb+"
@@ -597,6 +656,16 @@ CONTAINS
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
         ENDIF
+        IF(FILEID%FILE_INFORMATION%ACCESS_TYPE==BINARY_FILE_READABLE.AND. &
+          & INDEX(COMMAND,"MAPPED")/=0) THEN
+          !A file that cannot be mapped is still read by copying.
+          CALL BINARYMAPFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,MAPPED,ERR,CERROR)
+          IF(ERR/=0) THEN
+            CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
+            CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
+          ENDIF
+          FILEID%FILE_INFORMATION%MAPPED=(MAPPED==1)
+        ENDIF
       ELSE
         CALL FlagError("Could not allocate binary file information",&
           & ERR,ERROR,*999)
@@ -728,7 +797,7 @@ CONTAINS
         WRITE(ERROR_STRING,'("File has a different file type:",/,&
           & "   File type is     ",I3,/,"   Expected file type is ",I3)')&
           & FILETYPE,FILE_TYPE
-        CALL FlagError(WARNING_STRING,ERR,ERROR,*999)
+        CALL FlagError(ERROR_STRING,ERR,ERROR,*999)
       ENDIF
       SELECT CASE(FILEID%FILE_INFORMATION%BINARY_FILE_REVISION)
       CASE(0,1)
@@ -760,13 +829,12 @@ CONTAINS
         CALL FlagError("Invalid binary file identity format",ERR,ERROR,*999)
       END SELECT
       CALL READ_BINARY_FILE(FILEID,1,HEADINGSIZE,ERR,ERROR,*999)
-      IF(HEADINGSIZE==0) THEN
-        WRITE(OP_STRING,'("File heading: ")')
-      ELSE
+      IF(HEADINGSIZE<0.OR.HEADINGSIZE>MAXSTRLEN) CALL FlagError("Invalid file heading size",ERR,ERROR,*999)
+      IF(HEADINGSIZE>0) THEN
         CALL READ_BINARY_FILE(FILEID,HEADINGSIZE,HEADING,ERR,ERROR,*999)
         WRITE(OP_STRING,'("File heading: ",A)') HEADING(1:HEADINGSIZE)
+        CALL WriteStr(GENERAL_OUTPUT_TYPE,ERR,ERROR,*999)
       ENDIF
-      CALL WRITE_STRING(GENERAL_OUTPUT_TYPE,ERR,ERROR,*999)
       CALL READ_BINARY_FILE(FILEID,1,NUMBER_TAGS,ERR,ERROR,*999)
     ELSE IF(COMMAND(1:5)=="WRITE") THEN
       !Write identity header section
@@ -791,6 +859,7 @@ CONTAINS
       CHARDATA(15:15)=CHAR(LOGICAL_SIZE)
       CHARDATA(16:16)=CHAR(SINGLE_COMPLEX_SIZE)
       CHARDATA(17:17)=CHAR(DOUBLE_COMPLEX_SIZE)
+      FILEID%FILE_INFORMATION%BINARY_FILE_REVISION=2
       FILEID%FILE_INFORMATION%MACHINE_TYPE=MACHINE_TYPE
       FILEID%FILE_INFORMATION%OS_TYPE=MACHINE_OS
       FILEID%FILE_INFORMATION%ENDIAN_TYPE=MACHINE_ENDIAN
@@ -805,11 +874,13 @@ CONTAINS
       FILEID%FILE_INFORMATION%SP_REAL_SIZE=SINGLE_REAL_SIZE
       FILEID%FILE_INFORMATION%DP_REAL_SIZE=DOUBLE_REAL_SIZE
       FILEID%FILE_INFORMATION%LOGICAL_SIZE=LOGICAL_SIZE
-      CALL WRITE_BINARY_FILE(FILEID,12,CHARDATA,ERR,ERROR,*999)
+      FILEID%FILE_INFORMATION%SPC_REAL_SIZE=SINGLE_COMPLEX_SIZE
+      FILEID%FILE_INFORMATION%DPC_REAL_SIZE=DOUBLE_COMPLEX_SIZE
+      CALL WRITE_BINARY_FILE(FILEID,17,CHARDATA,ERR,ERROR,*999)
       !Write the file header section
       !Write file type, version and header
       CALL WRITE_BINARY_FILE(FILEID,1,FILE_TYPE,ERR,ERROR,*999)
-      CALL WRITE_BINARY_FILE(FILEID,1,VERSION,ERR,ERROR,*999)
+      CALL WRITE_BINARY_FILE(FILEID,3,VERSION,ERR,ERROR,*999)
       HEADING=" "
       HEADINGSIZE=LEN_TRIM(HEADING)
       CALL WRITE_BINARY_FILE(FILEID,1,HEADINGSIZE,ERR,ERROR,*999)
@@ -857,7 +928,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    INTEGER(INTG), INTENT(OUT) :: DATA(*)
+    INTEGER(INTG), INTENT(OUT), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -873,7 +944,7 @@ CONTAINS
         ENDIAN=FILE_SAME_ENDIAN
       ENDIF
       CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        ENDIAN,NUM_DATA,INTEGER_TYPE,DATA,ERR,CERROR)
+        ENDIAN,NUM_DATA,INTEGER_TYPE,C_LOC(DATA(1)),ERR,CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
         CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -903,7 +974,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    INTEGER(INTG), INTENT(OUT) :: DATA
+    INTEGER(INTG), INTENT(OUT), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -922,7 +993,7 @@ CONTAINS
           ENDIAN=FILE_SAME_ENDIAN
         ENDIF
         CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & ENDIAN,1,INTEGER_TYPE,DATA,ERR,CERROR)
+          & ENDIAN,1,INTEGER_TYPE,C_LOC(DATA),ERR,CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -953,7 +1024,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    INTEGER(SINTG), INTENT(OUT) :: DATA(*)
+    INTEGER(SINTG), INTENT(OUT), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -969,7 +1040,7 @@ CONTAINS
         ENDIAN=FILE_SAME_ENDIAN
       ENDIF
       CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & ENDIAN,NUM_DATA,SHORT_INTEGER_TYPE,DATA,ERR,CERROR)
+        & ENDIAN,NUM_DATA,SHORT_INTEGER_TYPE,C_LOC(DATA(1)),ERR,CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
         CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -999,7 +1070,7 @@ CONTAINS
     !Argument variables
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    INTEGER(SINTG), INTENT(OUT) :: DATA
+    INTEGER(SINTG), INTENT(OUT), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -1018,7 +1089,7 @@ CONTAINS
           ENDIAN=FILE_SAME_ENDIAN
         ENDIF
         CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & ENDIAN,1,SHORT_INTEGER_TYPE,DATA,ERR,CERROR)
+          & ENDIAN,1,SHORT_INTEGER_TYPE,C_LOC(DATA),ERR,CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -1049,7 +1120,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    INTEGER(LINTG), INTENT(OUT) :: DATA(*)
+    INTEGER(LINTG), INTENT(OUT), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -1065,7 +1136,7 @@ CONTAINS
         ENDIAN=FILE_SAME_ENDIAN
       ENDIF
       CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & ENDIAN,NUM_DATA,LONG_INTEGER_TYPE,DATA,ERR,CERROR)
+        & ENDIAN,NUM_DATA,LONG_INTEGER_TYPE,C_LOC(DATA(1)),ERR,CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
         CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -1095,7 +1166,7 @@ CONTAINS
     !Argument variables
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    INTEGER(LINTG), INTENT(OUT) :: DATA
+    INTEGER(LINTG), INTENT(OUT), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -1114,7 +1185,7 @@ CONTAINS
           ENDIAN=FILE_SAME_ENDIAN
         ENDIF
         CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & ENDIAN,1,LONG_INTEGER_TYPE,DATA,ERR,CERROR)
+          & ENDIAN,1,LONG_INTEGER_TYPE,C_LOC(DATA),ERR,CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -1145,7 +1216,7 @@ CONTAINS
     !Argument variables
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    REAL(SP), INTENT(OUT) :: DATA(*)
+    REAL(SP), INTENT(OUT), TARGET :: DATA(*)
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     INTEGER(INTG), INTENT(OUT) :: ERR
     !Local variables
@@ -1161,7 +1232,7 @@ CONTAINS
         ENDIAN=FILE_SAME_ENDIAN
       ENDIF
       CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & ENDIAN,NUM_DATA,SINGLE_REAL_TYPE,DATA,ERR,CERROR)
+        & ENDIAN,NUM_DATA,SINGLE_REAL_TYPE,C_LOC(DATA(1)),ERR,CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
         CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -1191,7 +1262,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    REAL(SP), INTENT(OUT) :: DATA
+    REAL(SP), INTENT(OUT), TARGET :: DATA
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     INTEGER(INTG), INTENT(OUT) :: ERR
     !Local variables
@@ -1210,7 +1281,7 @@ CONTAINS
           ENDIAN=FILE_SAME_ENDIAN
         ENDIF
         CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & ENDIAN,1,SINGLE_REAL_TYPE,DATA,ERR,CERROR)
+          & ENDIAN,1,SINGLE_REAL_TYPE,C_LOC(DATA),ERR,CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -1241,7 +1312,7 @@ CONTAINS
     !Argument variables
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    REAL(DP), INTENT(OUT) :: DATA(*)
+    REAL(DP), INTENT(OUT), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -1257,7 +1328,7 @@ CONTAINS
         ENDIAN=FILE_SAME_ENDIAN
       ENDIF
       CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & ENDIAN,NUM_DATA,DOUBLE_REAL_TYPE,DATA,ERR,CERROR)
+        & ENDIAN,NUM_DATA,DOUBLE_REAL_TYPE,C_LOC(DATA(1)),ERR,CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
         CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -1287,7 +1358,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    REAL(DP), INTENT(OUT) :: DATA
+    REAL(DP), INTENT(OUT), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -1306,7 +1377,7 @@ CONTAINS
           ENDIAN=FILE_SAME_ENDIAN
         ENDIF
         CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & ENDIAN,1,DOUBLE_REAL_TYPE,DATA,ERR,CERROR)
+          & ENDIAN,1,DOUBLE_REAL_TYPE,C_LOC(DATA),ERR,CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -1337,30 +1408,25 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    CHARACTER(LEN=*), INTENT(OUT) :: DATA
+    CHARACTER(LEN=*), INTENT(OUT), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
-    INTEGER(INTG) :: CERROR(100),CSTRING(250),LENGTH
+    INTEGER(INTG) :: CERROR(100)
     CHARACTER(LEN=MAXSTRLEN) :: DUMMY_ERROR
 
     ENTERS("READ_BINARY_FILE_CHARACTER",ERR,ERROR,*999)
 
     IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN
-      CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER, &
-        & FILE_SAME_ENDIAN,NUM_DATA,CHARACTER_TYPE,CSTRING,ERR,&
-        & CERROR)
-      IF(ERR/=0) THEN
-        CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
-        CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
-      ELSE
-        LENGTH=CSTRINGLENGTH(CSTRING)
-        IF(LENGTH==0.AND.NUM_DATA==1) THEN
-          !Zero length string and data read i.e. read a single byte
-          !of value zero.
-          DATA(1:1)=CHAR(0)
-        ELSE
-          CALL C2FSTRING(CSTRING,DATA,ERR,ERROR,*999)
+      IF(NUM_DATA>LEN(DATA)) CALL FlagError("Number of characters to read is greater than the length of DATA.", &
+        & ERR,ERROR,*999)
+      IF(NUM_DATA>0) THEN
+        CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER, &
+          & FILE_SAME_ENDIAN,NUM_DATA,CHARACTER_TYPE,C_LOC(DATA),ERR,&
+          & CERROR)
+        IF(ERR/=0) THEN
+          CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
+          CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
         ENDIF
       ENDIF
     ELSE
@@ -1388,7 +1454,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    LOGICAL, INTENT(OUT) :: DATA(*)
+    LOGICAL, INTENT(OUT), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -1404,7 +1470,7 @@ CONTAINS
         ENDIAN=FILE_SAME_ENDIAN
       ENDIF
       CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & ENDIAN,NUM_DATA,LOGICAL_TYPE,DATA,ERR,CERROR)
+        & ENDIAN,NUM_DATA,LOGICAL_TYPE,C_LOC(DATA(1)),ERR,CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
         CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -1434,7 +1500,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    LOGICAL, INTENT(OUT) :: DATA
+    LOGICAL, INTENT(OUT), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -1453,7 +1519,7 @@ CONTAINS
           ENDIAN=FILE_SAME_ENDIAN
         ENDIF
         CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & ENDIAN,1,LOGICAL_TYPE,DATA,ERR,CERROR)
+          & ENDIAN,1,LOGICAL_TYPE,C_LOC(DATA),ERR,CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -1485,7 +1551,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    COMPLEX(SPC), INTENT(OUT) :: DATA(*)
+    COMPLEX(SPC), INTENT(OUT), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -1501,7 +1567,7 @@ CONTAINS
         ENDIAN=FILE_SAME_ENDIAN
       ENDIF
       CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & ENDIAN,NUM_DATA,SINGLE_COMPLEX_TYPE,DATA,ERR,CERROR)
+        & ENDIAN,NUM_DATA,SINGLE_COMPLEX_TYPE,C_LOC(DATA(1)),ERR,CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
         CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -1532,7 +1598,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    COMPLEX(SPC), INTENT(OUT) :: DATA
+    COMPLEX(SPC), INTENT(OUT), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -1551,7 +1617,7 @@ CONTAINS
           ENDIAN=FILE_SAME_ENDIAN
         ENDIF
         CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & ENDIAN,1,SINGLE_COMPLEX_TYPE,DATA,ERR,CERROR)
+          & ENDIAN,1,SINGLE_COMPLEX_TYPE,C_LOC(DATA),ERR,CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -1583,7 +1649,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    COMPLEX(DPC), INTENT(OUT) :: DATA(*)
+    COMPLEX(DPC), INTENT(OUT), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -1599,7 +1665,7 @@ CONTAINS
         ENDIAN=FILE_SAME_ENDIAN
       ENDIF
       CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & ENDIAN,NUM_DATA,DOUBLE_COMPLEX_TYPE,DATA,ERR,CERROR)
+        & ENDIAN,NUM_DATA,DOUBLE_COMPLEX_TYPE,C_LOC(DATA(1)),ERR,CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
         CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -1630,7 +1696,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    COMPLEX(DPC), INTENT(OUT) :: DATA
+    COMPLEX(DPC), INTENT(OUT), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -1649,7 +1715,7 @@ CONTAINS
           ENDIAN=FILE_SAME_ENDIAN
         ENDIF
         CALL BINARYREADFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & ENDIAN,1,DOUBLE_COMPLEX_TYPE,DATA,ERR,CERROR)
+          & ENDIAN,1,DOUBLE_COMPLEX_TYPE,C_LOC(DATA),ERR,CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -1669,6 +1735,136 @@ CONTAINS
   !============================================================================
   !
   
+  SUBROUTINE READ_BINARY_FILE_POINTER_INTG(FILEID,NUM_DATA,DATA,ERR,ERROR,*)
+
+    !#### Subroutine: READ_BINARY_FILE_POINTER_INTG
+    !###  Description:
+    !###    READ_BINARY_FILE_POINTER_INTG returns in DATA the next NUM_DATA integer
+    !###    values of the binary file specified by FILEID. If the file was
+    !###    opened with "READ_MAPPED" and the values are in this machine's
+    !###    byte order and suitably aligned DATA points straight into the
+    !###    mapped file and nothing is copied. Otherwise DATA is allocated
+    !###    and the values are read into it. Either way DATA must be
+    !###    released with RELEASE_BINARY_FILE_POINTER, before the file is
+    !###    closed.
+    !###  Parent-subroutine: READ_BINARY_FILE_POINTER
+
+    !Argument variables
+    TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
+    INTEGER(INTG), INTENT(IN) :: NUM_DATA
+    INTEGER(INTG), POINTER :: DATA(:)
+    INTEGER(INTG), INTENT(OUT) :: ERR
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
+    !Local variables
+    INTEGER(INTG) :: CERROR(100),ENDIAN
+    TYPE(C_PTR) :: ADDRESS
+    CHARACTER(LEN=MAXSTRLEN) :: DUMMY_ERROR
+
+    ENTERS("READ_BINARY_FILE_POINTER_INTG",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(DATA)) CALL FlagError("Data is already associated",ERR,ERROR,*999)
+    IF(NUM_DATA<0) CALL FlagError("Number of data items is < 0",ERR,ERROR,*999)
+    IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN
+      IF(FILEID%FILE_INFORMATION%ENDIAN_TYPE/=MACHINE_ENDIAN) THEN
+        ENDIAN=FILE_CHANGE_ENDIAN
+      ELSE
+        ENDIAN=FILE_SAME_ENDIAN
+      ENDIF
+      ADDRESS=C_NULL_PTR
+      IF(FILEID%FILE_INFORMATION%MAPPED.AND.NUM_DATA>0) THEN
+        CALL BINARYMAPREAD(FILEID%FILE_INFORMATION%FILE_NUMBER,&
+          & ENDIAN,NUM_DATA,INTEGER_TYPE,ADDRESS,ERR,CERROR)
+        IF(ERR/=0) THEN
+          CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
+          CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
+        ENDIF
+      ENDIF
+      IF(C_ASSOCIATED(ADDRESS)) THEN
+        CALL C_F_POINTER(ADDRESS,DATA,[NUM_DATA])
+      ELSE
+        ALLOCATE(DATA(NUM_DATA),STAT=ERR)
+        IF(ERR/=0) CALL FlagError("Could not allocate data",ERR,ERROR,*999)
+        IF(NUM_DATA>0) CALL READ_BINARY_FILE(FILEID,NUM_DATA,DATA,ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("Invalid FILEID",ERR,ERROR,*999)
+    ENDIF
+      
+    EXITS("READ_BINARY_FILE_POINTER_INTG")
+    RETURN
+999 ERRORSEXITS("READ_BINARY_FILE_POINTER_INTG",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE READ_BINARY_FILE_POINTER_INTG
+
+  !
+  !============================================================================
+  !
+  
+  SUBROUTINE READ_BINARY_FILE_POINTER_DP(FILEID,NUM_DATA,DATA,ERR,ERROR,*)
+
+    !#### Subroutine: READ_BINARY_FILE_POINTER_DP
+    !###  Description:
+    !###    READ_BINARY_FILE_POINTER_DP returns in DATA the next NUM_DATA double precision real
+    !###    values of the binary file specified by FILEID. If the file was
+    !###    opened with "READ_MAPPED" and the values are in this machine's
+    !###    byte order and suitably aligned DATA points straight into the
+    !###    mapped file and nothing is copied. Otherwise DATA is allocated
+    !###    and the values are read into it. Either way DATA must be
+    !###    released with RELEASE_BINARY_FILE_POINTER, before the file is
+    !###    closed.
+    !###  Parent-subroutine: READ_BINARY_FILE_POINTER
+
+    !Argument variables
+    TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
+    INTEGER(INTG), INTENT(IN) :: NUM_DATA
+    REAL(DP), POINTER :: DATA(:)
+    INTEGER(INTG), INTENT(OUT) :: ERR
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
+    !Local variables
+    INTEGER(INTG) :: CERROR(100),ENDIAN
+    TYPE(C_PTR) :: ADDRESS
+    CHARACTER(LEN=MAXSTRLEN) :: DUMMY_ERROR
+
+    ENTERS("READ_BINARY_FILE_POINTER_DP",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(DATA)) CALL FlagError("Data is already associated",ERR,ERROR,*999)
+    IF(NUM_DATA<0) CALL FlagError("Number of data items is < 0",ERR,ERROR,*999)
+    IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN
+      IF(FILEID%FILE_INFORMATION%ENDIAN_TYPE/=MACHINE_ENDIAN) THEN
+        ENDIAN=FILE_CHANGE_ENDIAN
+      ELSE
+        ENDIAN=FILE_SAME_ENDIAN
+      ENDIF
+      ADDRESS=C_NULL_PTR
+      IF(FILEID%FILE_INFORMATION%MAPPED.AND.NUM_DATA>0) THEN
+        CALL BINARYMAPREAD(FILEID%FILE_INFORMATION%FILE_NUMBER,&
+          & ENDIAN,NUM_DATA,DOUBLE_REAL_TYPE,ADDRESS,ERR,CERROR)
+        IF(ERR/=0) THEN
+          CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
+          CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
+        ENDIF
+      ENDIF
+      IF(C_ASSOCIATED(ADDRESS)) THEN
+        CALL C_F_POINTER(ADDRESS,DATA,[NUM_DATA])
+      ELSE
+        ALLOCATE(DATA(NUM_DATA),STAT=ERR)
+        IF(ERR/=0) CALL FlagError("Could not allocate data",ERR,ERROR,*999)
+        IF(NUM_DATA>0) CALL READ_BINARY_FILE(FILEID,NUM_DATA,DATA,ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("Invalid FILEID",ERR,ERROR,*999)
+    ENDIF
+      
+    EXITS("READ_BINARY_FILE_POINTER_DP")
+    RETURN
+999 ERRORSEXITS("READ_BINARY_FILE_POINTER_DP",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE READ_BINARY_FILE_POINTER_DP
+
+  !
+  !============================================================================
+  !
+  
   SUBROUTINE READ_BINARY_TAG_HEADER(FILEID,TAG,ERR,ERROR,*)
 
     !#### Subroutine: READ_BINARY_TAG_HEADER
@@ -1687,6 +1883,7 @@ CONTAINS
     ENTERS("READ_BINARY_TAG_HEADER",ERR,ERROR,*999)
     
     IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN
+      TAG%HEADER=" "
       CALL READ_BINARY_FILE(FILEID,2,INTDATA,ERR,ERROR,*999)
       TAG%INDEX=INTDATA(1)
       TAG%NUM_HEADER_BYTES=INTDATA(2)
@@ -1726,6 +1923,110 @@ CONTAINS
   !============================================================================
   !
   
+  SUBROUTINE RELEASE_BINARY_FILE_POINTER_INTG(FILEID,DATA,ERR,ERROR,*)
+
+    !#### Subroutine: RELEASE_BINARY_FILE_POINTER_INTG
+    !###  Description:
+    !###    RELEASE_BINARY_FILE_POINTER_INTG releases the integer DATA returned by
+    !###    READ_BINARY_FILE_POINTER for the binary file specified by
+    !###    FILEID. Data in the mapped file is nullified and copied data
+    !###    is deallocated.
+    !###  Parent-subroutine: RELEASE_BINARY_FILE_POINTER
+
+    !Argument variables
+    TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
+    INTEGER(INTG), POINTER :: DATA(:)
+    INTEGER(INTG), INTENT(OUT) :: ERR
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
+    !Local variables
+    INTEGER(INTG) :: CERROR(100),RETURNCODE
+    CHARACTER(LEN=MAXSTRLEN) :: DUMMY_ERROR
+
+    ENTERS("RELEASE_BINARY_FILE_POINTER_INTG",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN
+      IF(ASSOCIATED(DATA)) THEN
+        RETURNCODE=0
+        IF(FILEID%FILE_INFORMATION%MAPPED.AND.SIZE(DATA,1)>0) THEN
+          CALL BINARYMAPCONTAINS(FILEID%FILE_INFORMATION%FILE_NUMBER,&
+            & C_LOC(DATA(1)),RETURNCODE,ERR,CERROR)
+          IF(ERR/=0) THEN
+            CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
+            CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
+          ENDIF
+        ENDIF
+        IF(RETURNCODE==1) THEN
+          NULLIFY(DATA)
+        ELSE
+          DEALLOCATE(DATA)
+        ENDIF
+      ENDIF
+    ELSE
+      CALL FlagError("Invalid FILEID",ERR,ERROR,*999)
+    ENDIF
+      
+    EXITS("RELEASE_BINARY_FILE_POINTER_INTG")
+    RETURN
+999 ERRORSEXITS("RELEASE_BINARY_FILE_POINTER_INTG",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE RELEASE_BINARY_FILE_POINTER_INTG
+
+  !
+  !============================================================================
+  !
+  
+  SUBROUTINE RELEASE_BINARY_FILE_POINTER_DP(FILEID,DATA,ERR,ERROR,*)
+
+    !#### Subroutine: RELEASE_BINARY_FILE_POINTER_DP
+    !###  Description:
+    !###    RELEASE_BINARY_FILE_POINTER_DP releases the double precision real DATA returned by
+    !###    READ_BINARY_FILE_POINTER for the binary file specified by
+    !###    FILEID. Data in the mapped file is nullified and copied data
+    !###    is deallocated.
+    !###  Parent-subroutine: RELEASE_BINARY_FILE_POINTER
+
+    !Argument variables
+    TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
+    REAL(DP), POINTER :: DATA(:)
+    INTEGER(INTG), INTENT(OUT) :: ERR
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
+    !Local variables
+    INTEGER(INTG) :: CERROR(100),RETURNCODE
+    CHARACTER(LEN=MAXSTRLEN) :: DUMMY_ERROR
+
+    ENTERS("RELEASE_BINARY_FILE_POINTER_DP",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN
+      IF(ASSOCIATED(DATA)) THEN
+        RETURNCODE=0
+        IF(FILEID%FILE_INFORMATION%MAPPED.AND.SIZE(DATA,1)>0) THEN
+          CALL BINARYMAPCONTAINS(FILEID%FILE_INFORMATION%FILE_NUMBER,&
+            & C_LOC(DATA(1)),RETURNCODE,ERR,CERROR)
+          IF(ERR/=0) THEN
+            CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
+            CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
+          ENDIF
+        ENDIF
+        IF(RETURNCODE==1) THEN
+          NULLIFY(DATA)
+        ELSE
+          DEALLOCATE(DATA)
+        ENDIF
+      ENDIF
+    ELSE
+      CALL FlagError("Invalid FILEID",ERR,ERROR,*999)
+    ENDIF
+      
+    EXITS("RELEASE_BINARY_FILE_POINTER_DP")
+    RETURN
+999 ERRORSEXITS("RELEASE_BINARY_FILE_POINTER_DP",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE RELEASE_BINARY_FILE_POINTER_DP
+
+  !
+  !============================================================================
+  !
+  
   SUBROUTINE RESET_BINARY_NUMBER_TAGS(FILEID,NUMBER_TAGS,ERR,ERROR,*)
     
     !#### Subroutine: RESET_BINARY_NUMBER_TAGS
@@ -1754,7 +2055,11 @@ CONTAINS
       CALL SKIP_CM_BINARY_HEADER(FILEID,CMISS_BINARY_MACHINE_HEADER,&
         & ERR,ERROR,*999)
       !Skip the file type and version
-      NUMBER_SKIP_BYTES=INTEGER_SIZE+SINGLE_REAL_SIZE
+      IF(FILEID%FILE_INFORMATION%BINARY_FILE_REVISION==2) THEN
+        NUMBER_SKIP_BYTES=4*INTEGER_SIZE
+      ELSE
+        NUMBER_SKIP_BYTES=INTEGER_SIZE+SINGLE_REAL_SIZE
+      ENDIF
       CALL SKIP_BINARY_FILE(FILEID,NUMBER_SKIP_BYTES,ERR,ERROR,*999)
       !Skip the file header
       CALL READ_BINARY_FILE(FILEID,1,NUMBER_HEADER_BYTES,ERR,ERROR,*999)
@@ -1845,9 +2150,9 @@ CONTAINS
     ENTERS("SKIP_CM_BINARY_HEADER",ERR,ERROR,*999)
 
     IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN
-      IF(SKIP/=CMISS_BINARY_IDENTITY_HEADER.OR.&
-        & SKIP/=CMISS_BINARY_MACHINE_HEADER.OR.&
-        SKIP/=CMISS_BINARY_FILE_HEADER) &
+      IF(SKIP/=CMISS_BINARY_IDENTITY_HEADER.AND.&
+        & SKIP/=CMISS_BINARY_MACHINE_HEADER.AND.&
+        & SKIP/=CMISS_BINARY_FILE_HEADER) &
         & CALL FlagError("Invalid SKIP code",ERR,ERROR,*999)
       IF(SKIP>=CMISS_BINARY_IDENTITY_HEADER) THEN
         !Skip the identity header section
@@ -1860,7 +2165,7 @@ CONTAINS
         BINARY_FILE_REVISION=ICHAR(CHARDATA(2:2))
         SELECT CASE(BINARY_FILE_REVISION)
         CASE(0)
-          NUMBER_SKIP_BYTES=3
+          NUMBER_SKIP_BYTES=2*CHARACTER_SIZE
         CASE(1,2)
           CALL READ_BINARY_FILE(FILEID,1,CHARDATA,ERR,ERROR,*999)
           NUMBER_SKIP_BYTES=ICHAR(CHARDATA(1:1))
@@ -1872,7 +2177,11 @@ CONTAINS
       ENDIF
       IF(SKIP>=CMISS_BINARY_FILE_HEADER) THEN
         !Skip the file header section
-        NUMBER_SKIP_BYTES=INTEGER_SIZE+SINGLE_REAL_SIZE
+        IF(BINARY_FILE_REVISION==2) THEN
+          NUMBER_SKIP_BYTES=4*INTEGER_SIZE
+        ELSE
+          NUMBER_SKIP_BYTES=INTEGER_SIZE+SINGLE_REAL_SIZE
+        ENDIF
         CALL SKIP_BINARY_FILE(FILEID,NUMBER_SKIP_BYTES, ERR,ERROR,*999)
         CALL READ_BINARY_FILE(FILEID,1,INTDATA,ERR,ERROR,*999)
         NUMBER_SKIP_BYTES=INTDATA(1)*CHARACTER_SIZE+INTEGER_SIZE
@@ -1897,7 +2206,7 @@ CONTAINS
     !#### Subroutine: SKIP_BINARY_FILE
     !###  Description:
     !###    SKIP_BINARY_FILE skips NUMBER_BYTES in a binary file
-    !###    specified bye FILEID.
+    !###    specified bye FILEID. Skipping zero bytes does nothing.
 
     !Argument Variables
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
@@ -1911,13 +2220,15 @@ CONTAINS
     ENTERS("SKIP_BINARY_FILE",ERR,ERROR,*999)
 
     IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN
-      IF(NUMBER_BYTES<=0) &
-        & CALL FlagError("NUMBER_BYTES to skip is <= 0",ERR,ERROR,*999)
-      CALL BINARYSKIPFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & NUMBER_BYTES,ERR,CERROR)
-      IF(ERR/=0) THEN
-        CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
-        CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
+      IF(NUMBER_BYTES<0) &
+        & CALL FlagError("NUMBER_BYTES to skip is < 0",ERR,ERROR,*999)
+      IF(NUMBER_BYTES>0) THEN
+        CALL BINARYSKIPFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
+          & NUMBER_BYTES,ERR,CERROR)
+        IF(ERR/=0) THEN
+          CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
+          CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
+        ENDIF
       ENDIF
     ELSE
       CALL FlagError("Invalid FILEID",ERR,ERROR,*999)
@@ -1946,8 +2257,7 @@ CONTAINS
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
-    INTEGER(INTG) :: CERROR(100),i
-    CHARACTER(LEN=MAXSTRLEN) :: DUMMY_ERROR
+    INTEGER(INTG) :: i
     TYPE(BINARY_TAG_TYPE) :: SUBTAG
 
     ENTERS("SKIP_BINARY_TAGS",ERR,ERROR,*999)
@@ -1959,8 +2269,7 @@ CONTAINS
           CALL SKIP_BINARY_TAGS(FILEID,SUBTAG,ERR,ERROR,*999)
         ENDDO !i
       ELSE
-        CALL BINARYSKIPFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & TAG%NUM_BYTES,ERR,CERROR)        
+        CALL SKIP_BINARY_FILE(FILEID,TAG%NUM_BYTES,ERR,ERROR,*999)
       ENDIF
     ELSE
       CALL FlagError("Invalid FILEID",ERR,ERROR,*999)
@@ -2004,7 +2313,8 @@ CONTAINS
 
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
-    INTEGER(INTG), INTENT(IN) :: NUM_DATA, DATA(*)
+    INTEGER(INTG), INTENT(IN) :: NUM_DATA
+    INTEGER(INTG), INTENT(IN), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2015,7 +2325,7 @@ CONTAINS
 
     IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN    
       CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & FILE_SAME_ENDIAN,NUM_DATA,INTEGER_TYPE,DATA,ERR,CERROR)
+        & FILE_SAME_ENDIAN,NUM_DATA,INTEGER_TYPE,C_LOC(DATA(1)),ERR,CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
         CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -2044,7 +2354,8 @@ CONTAINS
 
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
-    INTEGER(INTG), INTENT(IN) :: NUM_DATA, DATA
+    INTEGER(INTG), INTENT(IN) :: NUM_DATA
+    INTEGER(INTG), INTENT(IN), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2058,7 +2369,7 @@ CONTAINS
         CALL FlagError("Number of data items not equal to one",ERR,ERROR,*999)
       ELSE
         CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & FILE_SAME_ENDIAN,1,INTEGER_TYPE,DATA,ERR,CERROR)
+          & FILE_SAME_ENDIAN,1,INTEGER_TYPE,C_LOC(DATA),ERR,CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -2089,7 +2400,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    INTEGER(SINTG), INTENT(IN) :: DATA(*)
+    INTEGER(SINTG), INTENT(IN), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2100,7 +2411,7 @@ CONTAINS
 
     IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN      
       CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & FILE_SAME_ENDIAN,NUM_DATA,SHORT_INTEGER_TYPE,DATA,ERR,&
+        & FILE_SAME_ENDIAN,NUM_DATA,SHORT_INTEGER_TYPE,C_LOC(DATA(1)),ERR,&
         & CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
@@ -2131,7 +2442,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    INTEGER(SINTG), INTENT(IN) :: DATA
+    INTEGER(SINTG), INTENT(IN), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2145,7 +2456,7 @@ CONTAINS
         CALL FlagError("Number of data items not equal to one",ERR,ERROR,*999)
       ELSE
         CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & FILE_SAME_ENDIAN,1,SHORT_INTEGER_TYPE,DATA,ERR,CERROR)
+          & FILE_SAME_ENDIAN,1,SHORT_INTEGER_TYPE,C_LOC(DATA),ERR,CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -2176,7 +2487,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    INTEGER(LINTG), INTENT(IN) :: DATA(*)
+    INTEGER(LINTG), INTENT(IN), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2187,7 +2498,7 @@ CONTAINS
 
     IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN      
       CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & FILE_SAME_ENDIAN,NUM_DATA,LONG_INTEGER_TYPE,DATA,ERR,&
+        & FILE_SAME_ENDIAN,NUM_DATA,LONG_INTEGER_TYPE,C_LOC(DATA(1)),ERR,&
         & CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
@@ -2218,7 +2529,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    INTEGER(LINTG), INTENT(IN) :: DATA
+    INTEGER(LINTG), INTENT(IN), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2232,7 +2543,7 @@ CONTAINS
         CALL FlagError("Number of data items not equal to one",ERR,ERROR,*999)
       ELSE
         CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & FILE_SAME_ENDIAN,1,LONG_INTEGER_TYPE,DATA,ERR,CERROR)
+          & FILE_SAME_ENDIAN,1,LONG_INTEGER_TYPE,C_LOC(DATA),ERR,CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -2264,7 +2575,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    REAL(SP), INTENT(IN) :: DATA(*)
+    REAL(SP), INTENT(IN), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2275,7 +2586,7 @@ CONTAINS
 
     IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN      
       CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & FILE_SAME_ENDIAN,NUM_DATA,SINGLE_REAL_TYPE,DATA,ERR,&
+        & FILE_SAME_ENDIAN,NUM_DATA,SINGLE_REAL_TYPE,C_LOC(DATA(1)),ERR,&
         & CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
@@ -2306,7 +2617,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    REAL(SP), INTENT(IN) :: DATA
+    REAL(SP), INTENT(IN), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2320,7 +2631,7 @@ CONTAINS
         CALL FlagError("Number of data items not equal to one",ERR,ERROR,*999)
       ELSE
         CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & FILE_SAME_ENDIAN,1,SINGLE_REAL_TYPE,DATA,ERR,CERROR)
+          & FILE_SAME_ENDIAN,1,SINGLE_REAL_TYPE,C_LOC(DATA),ERR,CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -2352,7 +2663,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    REAL(DP), INTENT(IN) :: DATA(*)
+    REAL(DP), INTENT(IN), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2363,7 +2674,7 @@ CONTAINS
 
     IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN
       CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & FILE_SAME_ENDIAN, NUM_DATA, DOUBLE_REAL_TYPE, DATA, ERR,&
+        & FILE_SAME_ENDIAN, NUM_DATA, DOUBLE_REAL_TYPE, C_LOC(DATA(1)), ERR,&
         & CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
@@ -2394,7 +2705,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    REAL(DP), INTENT(IN) :: DATA
+    REAL(DP), INTENT(IN), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2408,7 +2719,7 @@ CONTAINS
         CALL FlagError("Number of data items not equal to one",ERR,ERROR,*999)
       ELSE
         CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & FILE_SAME_ENDIAN,1,DOUBLE_REAL_TYPE,DATA,ERR,CERROR)
+          & FILE_SAME_ENDIAN,1,DOUBLE_REAL_TYPE,C_LOC(DATA),ERR,CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -2439,23 +2750,26 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    CHARACTER(LEN=*), INTENT(IN) :: DATA
+    CHARACTER(LEN=*), INTENT(IN), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
-    INTEGER(INTG) :: CERROR(100),CSTRING(250)
+    INTEGER(INTG) :: CERROR(100)
     CHARACTER(LEN=MAXSTRLEN) :: DUMMY_ERROR
 
     ENTERS("WRITE_BINARY_FILE_CHARACTER",ERR,ERROR,*999)
 
     IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN
-      CALL F2CSTRING(CSTRING,DATA,ERR,ERROR,*999)
-      CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & FILE_SAME_ENDIAN,NUM_DATA,CHARACTER_TYPE,CSTRING,ERR,&
-        & CERROR)
-      IF(ERR/=0) THEN
-        CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
-        CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
+      IF(NUM_DATA>LEN(DATA)) CALL FlagError("Number of characters to write is greater than the length of DATA.", &
+        & ERR,ERROR,*999)
+      IF(NUM_DATA>0) THEN
+        CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
+          & FILE_SAME_ENDIAN,NUM_DATA,CHARACTER_TYPE,C_LOC(DATA),ERR,&
+          & CERROR)
+        IF(ERR/=0) THEN
+          CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
+          CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
+        ENDIF
       ENDIF
     ELSE
       CALL FlagError("Invalid FILEID",ERR,ERROR,*999)
@@ -2482,7 +2796,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    LOGICAL, INTENT(IN) :: DATA(*)
+    LOGICAL, INTENT(IN), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2493,7 +2807,7 @@ CONTAINS
 
     IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN      
       CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & FILE_SAME_ENDIAN,NUM_DATA,LOGICAL_TYPE,DATA,ERR,CERROR)
+        & FILE_SAME_ENDIAN,NUM_DATA,LOGICAL_TYPE,C_LOC(DATA(1)),ERR,CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
         CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -2523,7 +2837,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    LOGICAL, INTENT(IN) :: DATA
+    LOGICAL, INTENT(IN), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2537,7 +2851,7 @@ CONTAINS
         CALL FlagError("Number of data items not equal to one",ERR,ERROR,*999)
       ELSE
         CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & FILE_SAME_ENDIAN,1,LOGICAL_TYPE,DATA,ERR,CERROR)
+          & FILE_SAME_ENDIAN,1,LOGICAL_TYPE,C_LOC(DATA),ERR,CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
           CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
@@ -2569,7 +2883,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    COMPLEX(SPC), INTENT(IN) :: DATA(*)
+    COMPLEX(SPC), INTENT(IN), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2580,7 +2894,7 @@ CONTAINS
 
     IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN      
       CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & FILE_SAME_ENDIAN,NUM_DATA,SINGLE_COMPLEX_TYPE,DATA,ERR,&
+        & FILE_SAME_ENDIAN,NUM_DATA,SINGLE_COMPLEX_TYPE,C_LOC(DATA(1)),ERR,&
         & CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
@@ -2611,7 +2925,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    COMPLEX(SPC), INTENT(IN) :: DATA
+    COMPLEX(SPC), INTENT(IN), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2625,7 +2939,7 @@ CONTAINS
         CALL FlagError("Number of data items not equal to one",ERR,ERROR,*999)
       ELSE
         CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & FILE_SAME_ENDIAN, 1, SINGLE_COMPLEX_TYPE, DATA, ERR,&
+          & FILE_SAME_ENDIAN, 1, SINGLE_COMPLEX_TYPE, C_LOC(DATA), ERR,&
           & CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
@@ -2658,7 +2972,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    COMPLEX(DPC), INTENT(IN) :: DATA(*)
+    COMPLEX(DPC), INTENT(IN), TARGET :: DATA(*)
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2669,7 +2983,7 @@ CONTAINS
 
     IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN
       CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-        & FILE_SAME_ENDIAN,NUM_DATA,DOUBLE_COMPLEX_TYPE,DATA,ERR,&
+        & FILE_SAME_ENDIAN,NUM_DATA,DOUBLE_COMPLEX_TYPE,C_LOC(DATA(1)),ERR,&
         & CERROR)
       IF(ERR/=0) THEN
         CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
@@ -2700,7 +3014,7 @@ CONTAINS
     !Argument variables 
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
     INTEGER(INTG), INTENT(IN) :: NUM_DATA
-    COMPLEX(DPC), INTENT(IN) :: DATA
+    COMPLEX(DPC), INTENT(IN), TARGET :: DATA
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local variables
@@ -2714,7 +3028,7 @@ CONTAINS
         CALL FlagError("Number of data item not equal to one",ERR,ERROR,*999)
       ELSE
         CALL BINARYWRITEFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,&
-          & FILE_SAME_ENDIAN, 1, DOUBLE_COMPLEX_TYPE, DATA, ERR,&
+          & FILE_SAME_ENDIAN, 1, DOUBLE_COMPLEX_TYPE, C_LOC(DATA), ERR,&
           & CERROR)
         IF(ERR/=0) THEN
           CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
@@ -2740,27 +3054,42 @@ CONTAINS
     !#### Subroutine: WRITE_BINARY_TAG_HEADER
     !###  Description:
     !###    WRITE_BINARY_TAG_HEADER writes a binary tag header from
-    !###    the binary file specified by FILEID.
+    !###    the binary file specified by FILEID. The heading of a leaf
+    !###    tag is padded with blanks so that the tag data starts on a
+    !###    BINARY_FILE_DATA_ALIGNMENT byte boundary of the file.
 
     !Argument variables
     TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILEID
-    TYPE(BINARY_TAG_TYPE), INTENT(OUT) :: TAG
+    TYPE(BINARY_TAG_TYPE), INTENT(INOUT) :: TAG
     INTEGER(INTG), INTENT(OUT) :: ERR
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
     !Local Variables
-    INTEGER(INTG) :: INTDATA(2)
+    INTEGER(INTG) :: CERROR(100),INTDATA(2),PADDING
+    INTEGER(LINTG) :: POSITION
+    CHARACTER(LEN=MAXSTRLEN) :: DUMMY_ERROR
 
     ENTERS("WRITE_BINARY_TAG_HEADER",ERR,ERROR,*999)
 
     IF(ASSOCIATED(FILEID%FILE_INFORMATION)) THEN
       INTDATA(1)=TAG%INDEX
       TAG%NUM_HEADER_BYTES=LEN_TRIM(TAG%HEADER)
+      IF(TAG%NUM_SUBTAGS==0) THEN
+        CALL BINARYTELLFILE(FILEID%FILE_INFORMATION%FILE_NUMBER,POSITION,ERR,CERROR)
+        IF(ERR/=0) THEN
+          CALL C2FSTRING(CERROR,DUMMY_ERROR,ERR,ERROR,*999)
+          CALL FlagError(DUMMY_ERROR,ERR,ERROR,*999)
+        ENDIF
+        !The index, heading size, number of subtags and number of bytes are written around the heading.
+        PADDING=INT(MODULO(-(POSITION+4*INTEGER_SIZE+TAG%NUM_HEADER_BYTES), &
+          & INT(BINARY_FILE_DATA_ALIGNMENT,LINTG)),INTG)
+        IF(TAG%NUM_HEADER_BYTES+PADDING<=MAXSTRLEN) TAG%NUM_HEADER_BYTES=TAG%NUM_HEADER_BYTES+PADDING
+      ENDIF
       INTDATA(2)=TAG%NUM_HEADER_BYTES
       CALL WRITE_BINARY_FILE(FILEID,2,INTDATA,ERR,ERROR,*999)
       CALL WRITE_BINARY_FILE(FILEID,TAG%NUM_HEADER_BYTES,&
         & TAG%HEADER,ERR,ERROR,*999)
       CALL WRITE_BINARY_FILE(FILEID,1,TAG%NUM_SUBTAGS,ERR,ERROR,*999)
-      IF(TAG%NUM_SUBTAGS>0) &
+      IF(TAG%NUM_SUBTAGS==0) &
         & CALL WRITE_BINARY_FILE(FILEID,1,TAG%NUM_BYTES,ERR,ERROR,*999)
     ELSE
       CALL FlagError("Invalid FILEID",ERR,ERROR,*999)
@@ -2776,4 +3105,75 @@ CONTAINS
   !============================================================================
   !
   
+  SUBROUTINE C2FSTRING(CSTRING,FSTRING,ERR,ERROR,*)
+
+    !#### Subroutine: C2FSTRING
+    !###  Description:
+    !###    C2FSTRING copies the null terminated C string held in the
+    !###    integer array CSTRING into the Fortran string FSTRING.
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: CSTRING(:)
+    CHARACTER(LEN=*), INTENT(OUT) :: FSTRING
+    INTEGER(INTG), INTENT(OUT) :: ERR
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
+    !Local variables
+    INTEGER(INTG) :: char_idx,word_idx
+    CHARACTER(LEN=INTEGER_SIZE) :: WORD
+
+    ENTERS("C2FSTRING",ERR,ERROR,*999)
+
+    FSTRING=" "
+    DO char_idx=1,MIN(LEN(FSTRING),SIZE(CSTRING,1)*INTEGER_SIZE)
+      word_idx=(char_idx-1)/INTEGER_SIZE+1
+      WORD=TRANSFER(CSTRING(word_idx),WORD)
+      IF(WORD(char_idx-(word_idx-1)*INTEGER_SIZE:char_idx-(word_idx-1)*INTEGER_SIZE)==CHAR(0)) EXIT
+      FSTRING(char_idx:char_idx)=WORD(char_idx-(word_idx-1)*INTEGER_SIZE:char_idx-(word_idx-1)*INTEGER_SIZE)
+    ENDDO !char_idx
+
+    EXITS("C2FSTRING")
+    RETURN
+999 ERRORSEXITS("C2FSTRING",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE C2FSTRING
+
+  !
+  !============================================================================
+  !
+  
+  SUBROUTINE F2CSTRING(CSTRING,FSTRING,ERR,ERROR,*)
+
+    !#### Subroutine: F2CSTRING
+    !###  Description:
+    !###    F2CSTRING copies the trimmed Fortran string FSTRING into the
+    !###    integer array CSTRING as a null terminated C string.
+
+    !Argument variables
+    INTEGER(INTG), INTENT(OUT) :: CSTRING(:)
+    CHARACTER(LEN=*), INTENT(IN) :: FSTRING
+    INTEGER(INTG), INTENT(OUT) :: ERR
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR
+    !Local variables
+    INTEGER(INTG) :: LENGTH,word_idx
+    CHARACTER(LEN=SIZE(CSTRING,1)*INTEGER_SIZE) :: BUFFER
+
+    ENTERS("F2CSTRING",ERR,ERROR,*999)
+
+    LENGTH=LEN_TRIM(FSTRING)
+    IF(LENGTH>=LEN(BUFFER)) CALL FlagError("String is too long to convert to a C string.",ERR,ERROR,*999)
+    BUFFER=FSTRING(1:LENGTH)//CHAR(0)
+    DO word_idx=1,SIZE(CSTRING,1)
+      CSTRING(word_idx)=TRANSFER(BUFFER((word_idx-1)*INTEGER_SIZE+1:word_idx*INTEGER_SIZE),CSTRING(word_idx))
+    ENDDO !word_idx
+
+    EXITS("F2CSTRING")
+    RETURN
+999 ERRORSEXITS("F2CSTRING",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE F2CSTRING
+
+  !
+  !============================================================================
+  !
+  
 END MODULE BINARY_FILE
@@ -0,0 +1,904 @@
+!> \file
+!> \brief This module handles writing and reading problem checkpoints so that a run can be restarted.
+!>
+!> \section LICENSE
+!>
+!> Version: MPL 1.1/GPL 2.0/LGPL 2.1
+!>
+!> The contents of this file are subject to the Mozilla Public License
+!> Version 1.1 (the "License"); you may not use this file except in
+!> compliance with the License. You may obtain a copy of the License at
+!> http://www.mozilla.org/MPL/
+!>
+!> Software distributed under the License is distributed on an "AS IS"
+!> basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+!> License for the specific language governing rights and limitations
+!> under the License.
+!>
+!> The Original Code is OpenCMISS
+!>
+!> The Initial Developer of the Original Code is University of Auckland,
+!> Auckland, New Zealand, the University of Oxford, Oxford, United
+!> Kingdom and King's College, London, United Kingdom. Portions created
+!> by the University of Auckland, the University of Oxford and King's
+!> College, London are Copyright (C) 2007-2010 by the University of
+!> Auckland, the University of Oxford and King's College, London.
+!> All Rights Reserved.
+!>
+!> Contributor(s):
+!>
+!> Alternatively, the contents of this file may be used under the terms of
+!> either the GNU General Public License Version 2 or later (the "GPL"), or
+!> the GNU Lesser General Public License Version 2.1 or later (the "LGPL"),
+!> in which case the provisions of the GPL or the LGPL are applicable instead
+!> of those above. If you wish to allow use of your version of this file only
+!> under the terms of either the GPL or the LGPL, and not to allow others to
+!> use your version of this file under the terms of the MPL, indicate your
+!> decision by deleting the provisions above and replace them with the notice
+!> and other provisions required by the GPL or the LGPL. If you do not delete
+!> the provisions above, a recipient may use your version of this file under
+!> the terms of any one of the MPL, the GPL or the LGPL.
+!>
+
+!> This module handles writing and reading problem checkpoints so that a run can be restarted.
+!>
+!> A checkpoint of a problem at PATH consists of
+!>  - PATH.index, a text index written by the first rank. It holds the number of ranks, the state of each of the problem's
+!>    control loops in depth first order and one line per field parameter set record giving the record key and the number
+!>    of values stored for each rank.
+!>  - PATH.rankN.bin, one stream unformatted file per rank holding the values of the locally owned dofs of every parameter
+!>    set of every finished field in every region and interface, in the order of the records in the index.
+!>
+!> Values are stored in local dof order, so a checkpoint can only be read back on the same number of ranks with the same
+!> decomposition. The regions, meshes, decompositions, fields, equations sets and problem must have been set up again (as
+!> for the original run) before the checkpoint is read. The layout of every record is checked against the index before
+!> any values are changed.
+MODULE CHECKPOINT_ROUTINES
+
+  USE BASE_ROUTINES
+  USE CMISS_MPI
+  USE COMP_ENVIRONMENT
+  USE DISTRIBUTED_MATRIX_VECTOR
+  USE FIELD_ROUTINES
+  USE INTERFACE_ROUTINES
+  USE ISO_VARYING_STRING
+  USE KINDS
+  USE LISTS
+#ifndef NOMPIMOD
+  USE MPI
+#endif
+  USE PROBLEM_CONSTANTS
+  USE REGION_ROUTINES
+  USE STRINGS
+  USE TYPES
+
+#include "macros.h"
+
+  IMPLICIT NONE
+
+  PRIVATE
+
+#ifdef NOMPIMOD
+#include "mpif.h"
+#endif
+
+  !Module parameters
+
+  INTEGER(INTG), PARAMETER :: CHECKPOINT_VERSION=1 !<The version of the checkpoint format
+  INTEGER(INTG), PARAMETER :: CHECKPOINT_MAGIC=1414548291 !<The first value in each rank file ("CKPT" read as a little endian integer), used to detect files that are not checkpoints or were written with a different byte order
+  INTEGER(INTG), PARAMETER :: CHECKPOINT_KEY_SIZE=7 !<The number of integers identifying a record: the region user number, 0 for a region or 1 for an interface field, the interface user number, the field user number, the variable type, the parameter set type and the data type
+
+  !Module types
+
+  !Module variables
+
+  !Interfaces
+
+  PUBLIC CHECKPOINT_READ,CHECKPOINT_WRITE
+
+CONTAINS
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads a checkpoint written by CHECKPOINT_ROUTINES::CHECKPOINT_WRITE back into a problem. The problem, and everything it is
+  !>defined on, must have been set up again with the same number of ranks and the same decomposition as when the checkpoint
+  !>was written. The start time of each time control loop is set to the checkpointed current time so that solving the
+  !>problem again continues from where the checkpoint was taken. Must be called by all ranks.
+  SUBROUTINE CHECKPOINT_READ(PROBLEM,PATH,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(PROBLEM_TYPE), POINTER :: PROBLEM !<A pointer to the problem to read the checkpoint into
+    TYPE(VARYING_STRING), INTENT(IN) :: PATH !<The path of the checkpoint, without the .index or .rankN.bin extensions
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: FILE_UNIT,HEADER(5),INDEX_UNIT,IOS,KEY(CHECKPOINT_KEY_SIZE),LOCAL_COUNT,MPI_IERROR,MY_RANK, &
+      & NUMBER_OF_RANKS,NUMBER_OF_RECORDS,record_idx
+    INTEGER(INTG), ALLOCATABLE :: KEYS(:,:),LOCAL_COUNTS(:)
+    LOGICAL :: ANY_FAILED,FAILED
+    TYPE(FIELD_TYPE), POINTER :: FIELD
+    TYPE(FIELD_PARAMETER_SET_TYPE), POINTER :: PARAMETER_SET
+    TYPE(FIELD_VARIABLE_TYPE), POINTER :: FIELD_VARIABLE
+    TYPE(VARYING_STRING) :: FILE_NAME,LOCAL_ERROR
+
+    ENTERS("CHECKPOINT_READ",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(PROBLEM)) THEN
+      IF(.NOT.PROBLEM%PROBLEM_FINISHED) CALL FlagError("Problem has not been finished.",ERR,ERROR,*999)
+      IF(.NOT.ASSOCIATED(PROBLEM%CONTROL_LOOP)) CALL FlagError("Problem control loop is not associated.",ERR,ERROR,*999)
+      MY_RANK=COMPUTATIONAL_NODE_NUMBER_GET(ERR,ERROR)
+      IF(ERR/=0) GOTO 999
+      NUMBER_OF_RANKS=COMPUTATIONAL_NODES_NUMBER_GET(ERR,ERROR)
+      IF(ERR/=0) GOTO 999
+      INDEX_UNIT=-1
+      FILE_UNIT=-1
+      !Every rank reads the index and checks it against its own fields before anything is changed. As the local layout
+      !can differ between ranks all ranks have to agree that the checkpoint is valid before going on.
+      FAILED=.TRUE.
+      CALL CHECKPOINT_INDEX_READ(PROBLEM,PATH,INDEX_UNIT,NUMBER_OF_RECORDS,KEYS,LOCAL_COUNTS,ERR,ERROR,*10)
+      FILE_NAME=PATH//".rank"//TRIM(NUMBER_TO_VSTRING(MY_RANK,"*",ERR,ERROR))//".bin"
+      OPEN(NEWUNIT=FILE_UNIT,FILE=CHAR(FILE_NAME),STATUS="OLD",ACCESS="STREAM",FORM="UNFORMATTED",ACTION="READ",IOSTAT=IOS)
+      IF(IOS/=0) THEN
+        FILE_UNIT=-1
+        CALL FlagError("Could not open checkpoint file "//FILE_NAME//".",ERR,ERROR,*10)
+      ENDIF
+      READ(FILE_UNIT,IOSTAT=IOS) HEADER
+      IF(IOS/=0) CALL FlagError("Could not read the header of checkpoint file "//FILE_NAME//".",ERR,ERROR,*10)
+      IF(HEADER(1)/=CHECKPOINT_MAGIC.OR.HEADER(2)/=CHECKPOINT_VERSION.OR.HEADER(3)/=MY_RANK.OR. &
+        & HEADER(4)/=NUMBER_OF_RANKS.OR.HEADER(5)/=NUMBER_OF_RECORDS) THEN
+        CALL FlagError("The header of checkpoint file "//FILE_NAME//" does not match the checkpoint index.",ERR,ERROR,*10)
+      ENDIF
+      FAILED=.FALSE.
+10    CALL MPI_ALLREDUCE(FAILED,ANY_FAILED,1,MPI_LOGICAL,MPI_LOR,COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
+      IF(FAILED) GOTO 999
+      CALL MPI_ERROR_CHECK("MPI_ALLREDUCE",MPI_IERROR,ERR,ERROR,*999)
+      IF(ANY_FAILED) CALL FlagError("The checkpoint does not match the problem on another rank.",ERR,ERROR,*999)
+      !The checkpoint is valid so restore the control loop state and then the field values.
+      CALL CHECKPOINT_CONTROL_LOOP_READ(PROBLEM%CONTROL_LOOP,INDEX_UNIT,.TRUE.,ERR,ERROR,*999)
+      CLOSE(INDEX_UNIT)
+      INDEX_UNIT=-1
+      DO record_idx=1,NUMBER_OF_RECORDS
+        READ(FILE_UNIT,IOSTAT=IOS) KEY,LOCAL_COUNT
+        IF(IOS/=0) CALL FlagError("Could not read checkpoint file "//FILE_NAME//".",ERR,ERROR,*999)
+        IF(ANY(KEY/=KEYS(:,record_idx)).OR.LOCAL_COUNT/=LOCAL_COUNTS(record_idx)) THEN
+          LOCAL_ERROR="Record "//TRIM(NUMBER_TO_VSTRING(record_idx,"*",ERR,ERROR))//" of checkpoint file "//FILE_NAME// &
+            & " does not match the checkpoint index."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        ENDIF
+        CALL CHECKPOINT_PARAMETER_SET_FIND(KEY,FIELD,FIELD_VARIABLE,PARAMETER_SET,ERR,ERROR,*999)
+        CALL CHECKPOINT_RECORD_READ(FILE_UNIT,PARAMETER_SET,KEY(7),LOCAL_COUNT,ERR,ERROR,*999)
+        CALL FIELD_PARAMETER_SET_UPDATE_START(FIELD,KEY(5),KEY(6),ERR,ERROR,*999)
+      ENDDO !record_idx
+      CLOSE(FILE_UNIT)
+      FILE_UNIT=-1
+      DO record_idx=1,NUMBER_OF_RECORDS
+        CALL CHECKPOINT_PARAMETER_SET_FIND(KEYS(:,record_idx),FIELD,FIELD_VARIABLE,PARAMETER_SET,ERR,ERROR,*999)
+        CALL FIELD_PARAMETER_SET_UPDATE_FINISH(FIELD,KEYS(5,record_idx),KEYS(6,record_idx),ERR,ERROR,*999)
+      ENDDO !record_idx
+      DEALLOCATE(KEYS)
+      DEALLOCATE(LOCAL_COUNTS)
+    ELSE
+      CALL FlagError("Problem is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("CHECKPOINT_READ")
+    RETURN
+999 IF(ALLOCATED(KEYS)) DEALLOCATE(KEYS)
+    IF(ALLOCATED(LOCAL_COUNTS)) DEALLOCATE(LOCAL_COUNTS)
+    IF(INDEX_UNIT/=-1) CLOSE(INDEX_UNIT)
+    IF(FILE_UNIT/=-1) CLOSE(FILE_UNIT)
+    ERRORSEXITS("CHECKPOINT_READ",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE CHECKPOINT_READ
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Writes a checkpoint of a problem: the state of its control loops and the values of every parameter set of every field in
+  !>every region and interface. Must be called by all ranks. The checkpoint is only complete once the index has been written,
+  !>so alternate between two paths if an interrupted write must not destroy the previous checkpoint.
+  SUBROUTINE CHECKPOINT_WRITE(PROBLEM,PATH,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(PROBLEM_TYPE), POINTER :: PROBLEM !<A pointer to the problem to write the checkpoint for
+    TYPE(VARYING_STRING), INTENT(IN) :: PATH !<The path of the checkpoint, without the .index or .rankN.bin extensions
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: FILE_UNIT,IOS,MPI_IERROR,MY_RANK,NUMBER_OF_RANKS,NUMBER_OF_RECORDS,RECORD_RANGE(2),record_idx
+    INTEGER(INTG), ALLOCATABLE :: ALL_COUNTS(:,:),LOCAL_COUNTS(:),RECORDS(:,:)
+    LOGICAL :: ANY_FAILED,FAILED
+    TYPE(LIST_TYPE), POINTER :: RECORDS_LIST
+    TYPE(REGION_TYPE), POINTER :: WORLD_REGION
+    TYPE(VARYING_STRING) :: FILE_NAME
+
+    ENTERS("CHECKPOINT_WRITE",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(PROBLEM)) THEN
+      IF(.NOT.PROBLEM%PROBLEM_FINISHED) CALL FlagError("Problem has not been finished.",ERR,ERROR,*999)
+      IF(.NOT.ASSOCIATED(PROBLEM%CONTROL_LOOP)) CALL FlagError("Problem control loop is not associated.",ERR,ERROR,*999)
+      MY_RANK=COMPUTATIONAL_NODE_NUMBER_GET(ERR,ERROR)
+      IF(ERR/=0) GOTO 999
+      NUMBER_OF_RANKS=COMPUTATIONAL_NODES_NUMBER_GET(ERR,ERROR)
+      IF(ERR/=0) GOTO 999
+      FILE_UNIT=-1
+      !Find the parameter sets to write
+      NULLIFY(WORLD_REGION)
+      CALL REGION_USER_NUMBER_FIND(0,WORLD_REGION,ERR,ERROR,*999)
+      NULLIFY(RECORDS_LIST)
+      CALL LIST_CREATE_START(RECORDS_LIST,ERR,ERROR,*999)
+      CALL LIST_DATA_TYPE_SET(RECORDS_LIST,LIST_INTG_TYPE,ERR,ERROR,*999)
+      CALL LIST_DATA_DIMENSION_SET(RECORDS_LIST,CHECKPOINT_KEY_SIZE+1,ERR,ERROR,*999)
+      CALL LIST_CREATE_FINISH(RECORDS_LIST,ERR,ERROR,*999)
+      CALL CHECKPOINT_REGION_RECORDS_ADD(WORLD_REGION,RECORDS_LIST,ERR,ERROR,*999)
+      CALL LIST_DETACH_AND_DESTROY(RECORDS_LIST,NUMBER_OF_RECORDS,RECORDS,ERR,ERROR,*999)
+      !Fields are created collectively so every rank should have found the same records
+      RECORD_RANGE=[NUMBER_OF_RECORDS,-NUMBER_OF_RECORDS]
+      CALL MPI_ALLREDUCE(MPI_IN_PLACE,RECORD_RANGE,2,MPI_INTEGER,MPI_MAX,COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
+      CALL MPI_ERROR_CHECK("MPI_ALLREDUCE",MPI_IERROR,ERR,ERROR,*999)
+      IF(RECORD_RANGE(1)/=-RECORD_RANGE(2)) &
+        & CALL FlagError("The number of field parameter sets differs between ranks.",ERR,ERROR,*999)
+      !Write the values for this rank
+      FAILED=.TRUE.
+      FILE_NAME=PATH//".rank"//TRIM(NUMBER_TO_VSTRING(MY_RANK,"*",ERR,ERROR))//".bin"
+      OPEN(NEWUNIT=FILE_UNIT,FILE=CHAR(FILE_NAME),STATUS="REPLACE",ACCESS="STREAM",FORM="UNFORMATTED",ACTION="WRITE", &
+        & IOSTAT=IOS)
+      IF(IOS/=0) THEN
+        FILE_UNIT=-1
+        CALL FlagError("Could not open checkpoint file "//FILE_NAME//".",ERR,ERROR,*10)
+      ENDIF
+      WRITE(FILE_UNIT,IOSTAT=IOS) CHECKPOINT_MAGIC,CHECKPOINT_VERSION,MY_RANK,NUMBER_OF_RANKS,NUMBER_OF_RECORDS
+      IF(IOS/=0) CALL FlagError("Could not write checkpoint file "//FILE_NAME//".",ERR,ERROR,*10)
+      DO record_idx=1,NUMBER_OF_RECORDS
+        CALL CHECKPOINT_RECORD_WRITE(FILE_UNIT,RECORDS(:,record_idx),ERR,ERROR,*10)
+      ENDDO !record_idx
+      CLOSE(FILE_UNIT,IOSTAT=IOS)
+      FILE_UNIT=-1
+      IF(IOS/=0) CALL FlagError("Could not close checkpoint file "//FILE_NAME//".",ERR,ERROR,*10)
+      FAILED=.FALSE.
+10    CALL MPI_ALLREDUCE(FAILED,ANY_FAILED,1,MPI_LOGICAL,MPI_LOR,COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
+      IF(FAILED) GOTO 999
+      CALL MPI_ERROR_CHECK("MPI_ALLREDUCE",MPI_IERROR,ERR,ERROR,*999)
+      IF(ANY_FAILED) CALL FlagError("Writing the checkpoint failed on another rank.",ERR,ERROR,*999)
+      !Gather the number of values each rank wrote for the index
+      ALLOCATE(LOCAL_COUNTS(NUMBER_OF_RECORDS),STAT=ERR)
+      IF(ERR/=0) CALL FlagError("Could not allocate local counts.",ERR,ERROR,*999)
+      LOCAL_COUNTS=RECORDS(CHECKPOINT_KEY_SIZE+1,1:NUMBER_OF_RECORDS)
+      IF(MY_RANK==0) THEN
+        ALLOCATE(ALL_COUNTS(NUMBER_OF_RECORDS,0:NUMBER_OF_RANKS-1),STAT=ERR)
+      ELSE
+        ALLOCATE(ALL_COUNTS(1,1),STAT=ERR)
+      ENDIF
+      IF(ERR/=0) CALL FlagError("Could not allocate all counts.",ERR,ERROR,*999)
+      CALL MPI_GATHER(LOCAL_COUNTS,NUMBER_OF_RECORDS,MPI_INTEGER,ALL_COUNTS,NUMBER_OF_RECORDS,MPI_INTEGER,0, &
+        & COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
+      CALL MPI_ERROR_CHECK("MPI_GATHER",MPI_IERROR,ERR,ERROR,*999)
+      FAILED=.FALSE.
+      IF(MY_RANK==0) THEN
+        FAILED=.TRUE.
+        CALL CHECKPOINT_INDEX_WRITE(PROBLEM,PATH,NUMBER_OF_RANKS,NUMBER_OF_RECORDS,RECORDS,ALL_COUNTS,ERR,ERROR,*20)
+        FAILED=.FALSE.
+      ENDIF
+      !Make sure no rank returns before the checkpoint is complete
+20    CALL MPI_ALLREDUCE(FAILED,ANY_FAILED,1,MPI_LOGICAL,MPI_LOR,COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
+      IF(FAILED) GOTO 999
+      CALL MPI_ERROR_CHECK("MPI_ALLREDUCE",MPI_IERROR,ERR,ERROR,*999)
+      IF(ANY_FAILED) CALL FlagError("Writing the checkpoint index failed.",ERR,ERROR,*999)
+      DEALLOCATE(RECORDS)
+      DEALLOCATE(LOCAL_COUNTS)
+      DEALLOCATE(ALL_COUNTS)
+    ELSE
+      CALL FlagError("Problem is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("CHECKPOINT_WRITE")
+    RETURN
+999 IF(ALLOCATED(RECORDS)) DEALLOCATE(RECORDS)
+    IF(ALLOCATED(LOCAL_COUNTS)) DEALLOCATE(LOCAL_COUNTS)
+    IF(ALLOCATED(ALL_COUNTS)) DEALLOCATE(ALL_COUNTS)
+    IF(FILE_UNIT/=-1) CLOSE(FILE_UNIT)
+    ERRORSEXITS("CHECKPOINT_WRITE",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE CHECKPOINT_WRITE
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads the state of a control loop and its sub loops from a checkpoint index, checking the loop types match the problem.
+  RECURSIVE SUBROUTINE CHECKPOINT_CONTROL_LOOP_READ(CONTROL_LOOP,INDEX_UNIT,RESTORE,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(CONTROL_LOOP_TYPE), POINTER :: CONTROL_LOOP !<A pointer to the control loop to read the state for
+    INTEGER(INTG), INTENT(IN) :: INDEX_UNIT !<The unit the checkpoint index is open on
+    LOGICAL, INTENT(IN) :: RESTORE !<If .TRUE. the state is restored to the control loop, otherwise it is only checked
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: GLOBAL_ITERATION_NUMBER,IOS,ITERATION_NUMBER,LOOP_TYPE,loop_idx
+    REAL(DP) :: CURRENT_TIME
+    CHARACTER(LEN=32) :: KEYWORD
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("CHECKPOINT_CONTROL_LOOP_READ",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(CONTROL_LOOP)) THEN
+      READ(INDEX_UNIT,*,IOSTAT=IOS) KEYWORD,LOOP_TYPE,ITERATION_NUMBER,GLOBAL_ITERATION_NUMBER,CURRENT_TIME
+      IF(IOS/=0.OR.KEYWORD/="LOOP") CALL FlagError("Could not read a control loop from the checkpoint index.",ERR,ERROR,*999)
+      IF(LOOP_TYPE/=CONTROL_LOOP%LOOP_TYPE) THEN
+        LOCAL_ERROR="The checkpoint control loop type of "//TRIM(NUMBER_TO_VSTRING(LOOP_TYPE,"*",ERR,ERROR))// &
+          & " does not match the problem control loop type of "// &
+          & TRIM(NUMBER_TO_VSTRING(CONTROL_LOOP%LOOP_TYPE,"*",ERR,ERROR))//"."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      ENDIF
+      IF(RESTORE) THEN
+        SELECT CASE(CONTROL_LOOP%LOOP_TYPE)
+        CASE(PROBLEM_CONTROL_SIMPLE_TYPE)
+          !Do nothing
+        CASE(PROBLEM_CONTROL_FIXED_LOOP_TYPE)
+          CONTROL_LOOP%FIXED_LOOP%ITERATION_NUMBER=ITERATION_NUMBER
+        CASE(PROBLEM_CONTROL_TIME_LOOP_TYPE)
+          CONTROL_LOOP%TIME_LOOP%ITERATION_NUMBER=ITERATION_NUMBER
+          CONTROL_LOOP%TIME_LOOP%GLOBAL_ITERATION_NUMBER=GLOBAL_ITERATION_NUMBER
+          CONTROL_LOOP%TIME_LOOP%CURRENT_TIME=CURRENT_TIME
+          CONTROL_LOOP%TIME_LOOP%START_TIME=CURRENT_TIME
+        CASE(PROBLEM_CONTROL_WHILE_LOOP_TYPE)
+          CONTROL_LOOP%WHILE_LOOP%ITERATION_NUMBER=ITERATION_NUMBER
+        CASE(PROBLEM_CONTROL_LOAD_INCREMENT_LOOP_TYPE)
+          CONTROL_LOOP%LOAD_INCREMENT_LOOP%ITERATION_NUMBER=ITERATION_NUMBER
+        CASE DEFAULT
+          LOCAL_ERROR="The control loop type of "//TRIM(NUMBER_TO_VSTRING(CONTROL_LOOP%LOOP_TYPE,"*",ERR,ERROR))// &
+            & " is invalid."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        END SELECT
+      ENDIF
+      DO loop_idx=1,CONTROL_LOOP%NUMBER_OF_SUB_LOOPS
+        CALL CHECKPOINT_CONTROL_LOOP_READ(CONTROL_LOOP%SUB_LOOPS(loop_idx)%PTR,INDEX_UNIT,RESTORE,ERR,ERROR,*999)
+      ENDDO !loop_idx
+    ELSE
+      CALL FlagError("Control loop is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("CHECKPOINT_CONTROL_LOOP_READ")
+    RETURN
+999 ERRORSEXITS("CHECKPOINT_CONTROL_LOOP_READ",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE CHECKPOINT_CONTROL_LOOP_READ
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Writes the state of a control loop and its sub loops, depth first, to a checkpoint index.
+  RECURSIVE SUBROUTINE CHECKPOINT_CONTROL_LOOP_WRITE(CONTROL_LOOP,INDEX_UNIT,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(CONTROL_LOOP_TYPE), POINTER :: CONTROL_LOOP !<A pointer to the control loop to write the state for
+    INTEGER(INTG), INTENT(IN) :: INDEX_UNIT !<The unit the checkpoint index is open on
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: GLOBAL_ITERATION_NUMBER,IOS,ITERATION_NUMBER,loop_idx
+    REAL(DP) :: CURRENT_TIME
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("CHECKPOINT_CONTROL_LOOP_WRITE",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(CONTROL_LOOP)) THEN
+      ITERATION_NUMBER=0
+      GLOBAL_ITERATION_NUMBER=0
+      CURRENT_TIME=0.0_DP
+      SELECT CASE(CONTROL_LOOP%LOOP_TYPE)
+      CASE(PROBLEM_CONTROL_SIMPLE_TYPE)
+        !Do nothing
+      CASE(PROBLEM_CONTROL_FIXED_LOOP_TYPE)
+        ITERATION_NUMBER=CONTROL_LOOP%FIXED_LOOP%ITERATION_NUMBER
+      CASE(PROBLEM_CONTROL_TIME_LOOP_TYPE)
+        ITERATION_NUMBER=CONTROL_LOOP%TIME_LOOP%ITERATION_NUMBER
+        GLOBAL_ITERATION_NUMBER=CONTROL_LOOP%TIME_LOOP%GLOBAL_ITERATION_NUMBER
+        CURRENT_TIME=CONTROL_LOOP%TIME_LOOP%CURRENT_TIME
+      CASE(PROBLEM_CONTROL_WHILE_LOOP_TYPE)
+        ITERATION_NUMBER=CONTROL_LOOP%WHILE_LOOP%ITERATION_NUMBER
+      CASE(PROBLEM_CONTROL_LOAD_INCREMENT_LOOP_TYPE)
+        ITERATION_NUMBER=CONTROL_LOOP%LOAD_INCREMENT_LOOP%ITERATION_NUMBER
+      CASE DEFAULT
+        LOCAL_ERROR="The control loop type of "//TRIM(NUMBER_TO_VSTRING(CONTROL_LOOP%LOOP_TYPE,"*",ERR,ERROR))// &
+          & " is invalid."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      END SELECT
+      !17 significant digits so the time reads back exactly
+      WRITE(INDEX_UNIT,'("LOOP ",I0," ",I0," ",I0," ",ES24.16E3)',IOSTAT=IOS) CONTROL_LOOP%LOOP_TYPE,ITERATION_NUMBER, &
+        & GLOBAL_ITERATION_NUMBER,CURRENT_TIME
+      IF(IOS/=0) CALL FlagError("Could not write to the checkpoint index.",ERR,ERROR,*999)
+      DO loop_idx=1,CONTROL_LOOP%NUMBER_OF_SUB_LOOPS
+        CALL CHECKPOINT_CONTROL_LOOP_WRITE(CONTROL_LOOP%SUB_LOOPS(loop_idx)%PTR,INDEX_UNIT,ERR,ERROR,*999)
+      ENDDO !loop_idx
+    ELSE
+      CALL FlagError("Control loop is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("CHECKPOINT_CONTROL_LOOP_WRITE")
+    RETURN
+999 ERRORSEXITS("CHECKPOINT_CONTROL_LOOP_WRITE",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE CHECKPOINT_CONTROL_LOOP_WRITE
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Adds a record for every parameter set of every finished field in a list of fields.
+  SUBROUTINE CHECKPOINT_FIELDS_RECORDS_ADD(FIELDS,CONTAINER,RECORDS_LIST,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(FIELDS_TYPE), POINTER :: FIELDS !<A pointer to the fields to add the records for
+    INTEGER(INTG), INTENT(IN) :: CONTAINER(3) !<The first three key values identifying the region or interface containing the fields
+    TYPE(LIST_TYPE), POINTER :: RECORDS_LIST !<The list to add the records, each the key followed by the number of local values, to
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: field_idx,RECORD(CHECKPOINT_KEY_SIZE+1),set_idx,variable_idx
+    TYPE(FIELD_TYPE), POINTER :: FIELD
+    TYPE(FIELD_PARAMETER_SET_TYPE), POINTER :: PARAMETER_SET
+    TYPE(FIELD_VARIABLE_TYPE), POINTER :: FIELD_VARIABLE
+
+    ENTERS("CHECKPOINT_FIELDS_RECORDS_ADD",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(FIELDS)) THEN
+      DO field_idx=1,FIELDS%NUMBER_OF_FIELDS
+        FIELD=>FIELDS%FIELDS(field_idx)%PTR
+        IF(ASSOCIATED(FIELD)) THEN
+          IF(FIELD%FIELD_FINISHED) THEN
+            DO variable_idx=1,FIELD%NUMBER_OF_VARIABLES
+              FIELD_VARIABLE=>FIELD%VARIABLES(variable_idx)
+              DO set_idx=1,FIELD_VARIABLE%PARAMETER_SETS%NUMBER_OF_PARAMETER_SETS
+                PARAMETER_SET=>FIELD_VARIABLE%PARAMETER_SETS%PARAMETER_SETS(set_idx)%PTR
+                IF(ASSOCIATED(PARAMETER_SET)) THEN
+                  RECORD(1:3)=CONTAINER
+                  RECORD(4)=FIELD%USER_NUMBER
+                  RECORD(5)=FIELD_VARIABLE%VARIABLE_TYPE
+                  RECORD(6)=PARAMETER_SET%SET_TYPE
+                  RECORD(7)=FIELD_VARIABLE%DATA_TYPE
+                  RECORD(8)=FIELD_VARIABLE%NUMBER_OF_DOFS
+                  CALL LIST_ITEM_ADD(RECORDS_LIST,RECORD,ERR,ERROR,*999)
+                ENDIF
+              ENDDO !set_idx
+            ENDDO !variable_idx
+          ENDIF
+        ENDIF
+      ENDDO !field_idx
+    ENDIF
+
+    EXITS("CHECKPOINT_FIELDS_RECORDS_ADD")
+    RETURN
+999 ERRORSEXITS("CHECKPOINT_FIELDS_RECORDS_ADD",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE CHECKPOINT_FIELDS_RECORDS_ADD
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads and checks a checkpoint index. On return the index is positioned at the control loop states, ready for
+  !>CHECKPOINT_ROUTINES::CHECKPOINT_CONTROL_LOOP_READ to restore them.
+  SUBROUTINE CHECKPOINT_INDEX_READ(PROBLEM,PATH,INDEX_UNIT,NUMBER_OF_RECORDS,KEYS,LOCAL_COUNTS,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(PROBLEM_TYPE), POINTER :: PROBLEM !<A pointer to the problem to check the checkpoint against
+    TYPE(VARYING_STRING), INTENT(IN) :: PATH !<The path of the checkpoint
+    INTEGER(INTG), INTENT(INOUT) :: INDEX_UNIT !<On return, the unit the checkpoint index is open on
+    INTEGER(INTG), INTENT(OUT) :: NUMBER_OF_RECORDS !<On return, the number of records in the checkpoint
+    INTEGER(INTG), ALLOCATABLE, INTENT(INOUT) :: KEYS(:,:) !<On return, KEYS(:,record_idx) is the key of the record_idx'th record
+    INTEGER(INTG), ALLOCATABLE, INTENT(INOUT) :: LOCAL_COUNTS(:) !<On return, the number of values in each record for this rank
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: header_idx,HEADER(3),IOS,MY_RANK,NUMBER_OF_RANKS,record_idx
+    INTEGER(INTG), ALLOCATABLE :: COUNTS(:)
+    CHARACTER(LEN=32) :: KEYWORD
+    CHARACTER(LEN=*), PARAMETER :: HEADER_KEYWORDS(3)=[CHARACTER(LEN=18) :: "CHECKPOINT_VERSION","NUMBER_OF_RANKS","PROBLEM"]
+    TYPE(FIELD_TYPE), POINTER :: FIELD
+    TYPE(FIELD_PARAMETER_SET_TYPE), POINTER :: PARAMETER_SET
+    TYPE(FIELD_VARIABLE_TYPE), POINTER :: FIELD_VARIABLE
+    TYPE(VARYING_STRING) :: FILE_NAME,LOCAL_ERROR
+
+    ENTERS("CHECKPOINT_INDEX_READ",ERR,ERROR,*999)
+
+    MY_RANK=COMPUTATIONAL_NODE_NUMBER_GET(ERR,ERROR)
+    IF(ERR/=0) GOTO 999
+    NUMBER_OF_RANKS=COMPUTATIONAL_NODES_NUMBER_GET(ERR,ERROR)
+    IF(ERR/=0) GOTO 999
+    FILE_NAME=PATH//".index"
+    OPEN(NEWUNIT=INDEX_UNIT,FILE=CHAR(FILE_NAME),STATUS="OLD",FORM="FORMATTED",ACTION="READ",IOSTAT=IOS)
+    IF(IOS/=0) THEN
+      INDEX_UNIT=-1
+      CALL FlagError("Could not open checkpoint index "//FILE_NAME//".",ERR,ERROR,*999)
+    ENDIF
+    DO header_idx=1,3
+      READ(INDEX_UNIT,*,IOSTAT=IOS) KEYWORD,HEADER(header_idx)
+      IF(IOS/=0.OR.KEYWORD/=HEADER_KEYWORDS(header_idx)) THEN
+        LOCAL_ERROR="Could not read "//TRIM(HEADER_KEYWORDS(header_idx))//" from checkpoint index "//FILE_NAME//"."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      ENDIF
+    ENDDO !header_idx
+    IF(HEADER(1)/=CHECKPOINT_VERSION) THEN
+      LOCAL_ERROR="The checkpoint version of "//TRIM(NUMBER_TO_VSTRING(HEADER(1),"*",ERR,ERROR))// &
+        & " is not supported. The supported version is "//TRIM(NUMBER_TO_VSTRING(CHECKPOINT_VERSION,"*",ERR,ERROR))//"."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+    IF(HEADER(2)/=NUMBER_OF_RANKS) THEN
+      LOCAL_ERROR="The checkpoint was written on "//TRIM(NUMBER_TO_VSTRING(HEADER(2),"*",ERR,ERROR))// &
+        & " ranks and cannot be read on "//TRIM(NUMBER_TO_VSTRING(NUMBER_OF_RANKS,"*",ERR,ERROR))//" ranks."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+    IF(HEADER(3)/=PROBLEM%USER_NUMBER) THEN
+      LOCAL_ERROR="The checkpoint is for problem number "//TRIM(NUMBER_TO_VSTRING(HEADER(3),"*",ERR,ERROR))// &
+        & " and not for problem number "//TRIM(NUMBER_TO_VSTRING(PROBLEM%USER_NUMBER,"*",ERR,ERROR))//"."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+    CALL CHECKPOINT_CONTROL_LOOP_READ(PROBLEM%CONTROL_LOOP,INDEX_UNIT,.FALSE.,ERR,ERROR,*999)
+    READ(INDEX_UNIT,*,IOSTAT=IOS) KEYWORD,NUMBER_OF_RECORDS
+    IF(IOS/=0.OR.KEYWORD/="NUMBER_OF_RECORDS") &
+      & CALL FlagError("Could not read NUMBER_OF_RECORDS from checkpoint index "//FILE_NAME//".",ERR,ERROR,*999)
+    ALLOCATE(KEYS(CHECKPOINT_KEY_SIZE,NUMBER_OF_RECORDS),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate keys.",ERR,ERROR,*999)
+    ALLOCATE(LOCAL_COUNTS(NUMBER_OF_RECORDS),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate local counts.",ERR,ERROR,*999)
+    ALLOCATE(COUNTS(0:NUMBER_OF_RANKS-1),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate counts.",ERR,ERROR,*999)
+    DO record_idx=1,NUMBER_OF_RECORDS
+      READ(INDEX_UNIT,*,IOSTAT=IOS) KEYWORD,KEYS(:,record_idx),COUNTS
+      IF(IOS/=0.OR.KEYWORD/="RECORD") THEN
+        LOCAL_ERROR="Could not read record "//TRIM(NUMBER_TO_VSTRING(record_idx,"*",ERR,ERROR))// &
+          & " from checkpoint index "//FILE_NAME//"."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      ENDIF
+      CALL CHECKPOINT_PARAMETER_SET_FIND(KEYS(:,record_idx),FIELD,FIELD_VARIABLE,PARAMETER_SET,ERR,ERROR,*999)
+      IF(COUNTS(MY_RANK)/=FIELD_VARIABLE%NUMBER_OF_DOFS) THEN
+        LOCAL_ERROR="The checkpoint has "//TRIM(NUMBER_TO_VSTRING(COUNTS(MY_RANK),"*",ERR,ERROR))// &
+          & " local values for variable type "//TRIM(NUMBER_TO_VSTRING(KEYS(5,record_idx),"*",ERR,ERROR))// &
+          & " of field number "//TRIM(NUMBER_TO_VSTRING(FIELD%USER_NUMBER,"*",ERR,ERROR))//" but the field has "// &
+          & TRIM(NUMBER_TO_VSTRING(FIELD_VARIABLE%NUMBER_OF_DOFS,"*",ERR,ERROR))// &
+          & " local dofs. The decomposition must be the same as when the checkpoint was written."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      ENDIF
+      LOCAL_COUNTS(record_idx)=COUNTS(MY_RANK)
+    ENDDO !record_idx
+    DEALLOCATE(COUNTS)
+    !Go back to the control loop states
+    REWIND(INDEX_UNIT)
+    DO header_idx=1,3
+      READ(INDEX_UNIT,*)
+    ENDDO !header_idx
+
+    EXITS("CHECKPOINT_INDEX_READ")
+    RETURN
+999 IF(ALLOCATED(COUNTS)) DEALLOCATE(COUNTS)
+    ERRORSEXITS("CHECKPOINT_INDEX_READ",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE CHECKPOINT_INDEX_READ
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Writes a checkpoint index. Only called on the first rank.
+  SUBROUTINE CHECKPOINT_INDEX_WRITE(PROBLEM,PATH,NUMBER_OF_RANKS,NUMBER_OF_RECORDS,RECORDS,ALL_COUNTS,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(PROBLEM_TYPE), POINTER :: PROBLEM !<A pointer to the problem the checkpoint is for
+    TYPE(VARYING_STRING), INTENT(IN) :: PATH !<The path of the checkpoint
+    INTEGER(INTG), INTENT(IN) :: NUMBER_OF_RANKS !<The number of ranks
+    INTEGER(INTG), INTENT(IN) :: NUMBER_OF_RECORDS !<The number of records
+    INTEGER(INTG), INTENT(IN) :: RECORDS(:,:) !<RECORDS(:,record_idx). The key of the record_idx'th record
+    INTEGER(INTG), INTENT(IN) :: ALL_COUNTS(:,:) !<ALL_COUNTS(record_idx,rank+1). The number of values in each record for each rank
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: INDEX_UNIT,IOS,record_idx
+    TYPE(VARYING_STRING) :: FILE_NAME
+
+    ENTERS("CHECKPOINT_INDEX_WRITE",ERR,ERROR,*999)
+
+    FILE_NAME=PATH//".index"
+    OPEN(NEWUNIT=INDEX_UNIT,FILE=CHAR(FILE_NAME),STATUS="REPLACE",FORM="FORMATTED",ACTION="WRITE",IOSTAT=IOS)
+    IF(IOS/=0) CALL FlagError("Could not open checkpoint index "//FILE_NAME//".",ERR,ERROR,*999)
+    WRITE(INDEX_UNIT,'("CHECKPOINT_VERSION ",I0)',IOSTAT=IOS) CHECKPOINT_VERSION
+    IF(IOS==0) WRITE(INDEX_UNIT,'("NUMBER_OF_RANKS ",I0)',IOSTAT=IOS) NUMBER_OF_RANKS
+    IF(IOS==0) WRITE(INDEX_UNIT,'("PROBLEM ",I0)',IOSTAT=IOS) PROBLEM%USER_NUMBER
+    IF(IOS/=0) CALL FlagError("Could not write to checkpoint index "//FILE_NAME//".",ERR,ERROR,*998)
+    CALL CHECKPOINT_CONTROL_LOOP_WRITE(PROBLEM%CONTROL_LOOP,INDEX_UNIT,ERR,ERROR,*998)
+    WRITE(INDEX_UNIT,'("NUMBER_OF_RECORDS ",I0)',IOSTAT=IOS) NUMBER_OF_RECORDS
+    DO record_idx=1,NUMBER_OF_RECORDS
+      IF(IOS==0) WRITE(INDEX_UNIT,'("RECORD",*(:," ",I0))',IOSTAT=IOS) RECORDS(1:CHECKPOINT_KEY_SIZE,record_idx), &
+        & ALL_COUNTS(record_idx,1:NUMBER_OF_RANKS)
+    ENDDO !record_idx
+    IF(IOS/=0) CALL FlagError("Could not write to checkpoint index "//FILE_NAME//".",ERR,ERROR,*998)
+    CLOSE(INDEX_UNIT,IOSTAT=IOS)
+    IF(IOS/=0) CALL FlagError("Could not close checkpoint index "//FILE_NAME//".",ERR,ERROR,*999)
+
+    EXITS("CHECKPOINT_INDEX_WRITE")
+    RETURN
+998 CLOSE(INDEX_UNIT)
+999 ERRORSEXITS("CHECKPOINT_INDEX_WRITE",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE CHECKPOINT_INDEX_WRITE
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Finds the field, field variable and parameter set identified by a checkpoint record key.
+  SUBROUTINE CHECKPOINT_PARAMETER_SET_FIND(KEY,FIELD,FIELD_VARIABLE,PARAMETER_SET,ERR,ERROR,*)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: KEY(CHECKPOINT_KEY_SIZE) !<The record key
+    TYPE(FIELD_TYPE), POINTER :: FIELD !<On return, a pointer to the field
+    TYPE(FIELD_VARIABLE_TYPE), POINTER :: FIELD_VARIABLE !<On return, a pointer to the field variable
+    TYPE(FIELD_PARAMETER_SET_TYPE), POINTER :: PARAMETER_SET !<On return, a pointer to the parameter set
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(INTERFACE_TYPE), POINTER :: INTERFACE
+    TYPE(REGION_TYPE), POINTER :: REGION
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("CHECKPOINT_PARAMETER_SET_FIND",ERR,ERROR,*999)
+
+    NULLIFY(FIELD)
+    NULLIFY(FIELD_VARIABLE)
+    NULLIFY(PARAMETER_SET)
+    NULLIFY(REGION)
+    CALL REGION_USER_NUMBER_FIND(KEY(1),REGION,ERR,ERROR,*999)
+    IF(.NOT.ASSOCIATED(REGION)) THEN
+      LOCAL_ERROR="A region with a user number of "//TRIM(NUMBER_TO_VSTRING(KEY(1),"*",ERR,ERROR))//" does not exist."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+    IF(KEY(2)==0) THEN
+      CALL FIELD_USER_NUMBER_FIND(KEY(4),REGION,FIELD,ERR,ERROR,*999)
+    ELSE
+      NULLIFY(INTERFACE)
+      CALL INTERFACE_USER_NUMBER_FIND(KEY(3),REGION,INTERFACE,ERR,ERROR,*999)
+      IF(.NOT.ASSOCIATED(INTERFACE)) THEN
+        LOCAL_ERROR="An interface with a user number of "//TRIM(NUMBER_TO_VSTRING(KEY(3),"*",ERR,ERROR))// &
+          & " does not exist in region number "//TRIM(NUMBER_TO_VSTRING(KEY(1),"*",ERR,ERROR))//"."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      ENDIF
+      CALL FIELD_USER_NUMBER_FIND(KEY(4),INTERFACE,FIELD,ERR,ERROR,*999)
+    ENDIF
+    IF(.NOT.ASSOCIATED(FIELD)) THEN
+      LOCAL_ERROR="A field with a user number of "//TRIM(NUMBER_TO_VSTRING(KEY(4),"*",ERR,ERROR))// &
+        & " does not exist in region number "//TRIM(NUMBER_TO_VSTRING(KEY(1),"*",ERR,ERROR))//"."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+    IF(.NOT.FIELD%FIELD_FINISHED) THEN
+      LOCAL_ERROR="Field number "//TRIM(NUMBER_TO_VSTRING(KEY(4),"*",ERR,ERROR))//" has not been finished."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+    IF(KEY(5)<1.OR.KEY(5)>FIELD_NUMBER_OF_VARIABLE_TYPES) THEN
+      LOCAL_ERROR="The checkpoint variable type of "//TRIM(NUMBER_TO_VSTRING(KEY(5),"*",ERR,ERROR))//" is invalid."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+    FIELD_VARIABLE=>FIELD%VARIABLE_TYPE_MAP(KEY(5))%PTR
+    IF(.NOT.ASSOCIATED(FIELD_VARIABLE)) THEN
+      LOCAL_ERROR="Variable type "//TRIM(NUMBER_TO_VSTRING(KEY(5),"*",ERR,ERROR))//" has not been defined on field number "// &
+        & TRIM(NUMBER_TO_VSTRING(KEY(4),"*",ERR,ERROR))//"."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+    IF(KEY(7)/=FIELD_VARIABLE%DATA_TYPE) THEN
+      LOCAL_ERROR="The checkpoint data type of "//TRIM(NUMBER_TO_VSTRING(KEY(7),"*",ERR,ERROR))// &
+        & " does not match the data type of "//TRIM(NUMBER_TO_VSTRING(FIELD_VARIABLE%DATA_TYPE,"*",ERR,ERROR))// &
+        & " for variable type "//TRIM(NUMBER_TO_VSTRING(KEY(5),"*",ERR,ERROR))//" of field number "// &
+        & TRIM(NUMBER_TO_VSTRING(KEY(4),"*",ERR,ERROR))//"."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+    IF(KEY(6)>=1.AND.KEY(6)<=FIELD_NUMBER_OF_SET_TYPES) PARAMETER_SET=>FIELD_VARIABLE%PARAMETER_SETS%SET_TYPE(KEY(6))%PTR
+    IF(.NOT.ASSOCIATED(PARAMETER_SET)) THEN
+      LOCAL_ERROR="Parameter set type "//TRIM(NUMBER_TO_VSTRING(KEY(6),"*",ERR,ERROR))// &
+        & " has not been created for variable type "//TRIM(NUMBER_TO_VSTRING(KEY(5),"*",ERR,ERROR))//" of field number "// &
+        & TRIM(NUMBER_TO_VSTRING(KEY(4),"*",ERR,ERROR))//"."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("CHECKPOINT_PARAMETER_SET_FIND")
+    RETURN
+999 ERRORSEXITS("CHECKPOINT_PARAMETER_SET_FIND",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE CHECKPOINT_PARAMETER_SET_FIND
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads the values of a record from a rank file into the locally owned dofs of a parameter set. The ghost values must
+  !>be updated afterwards.
+  SUBROUTINE CHECKPOINT_RECORD_READ(FILE_UNIT,PARAMETER_SET,DATA_TYPE,NUMBER_OF_VALUES,ERR,ERROR,*)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: FILE_UNIT !<The unit the rank file is open on
+    TYPE(FIELD_PARAMETER_SET_TYPE), POINTER :: PARAMETER_SET !<A pointer to the parameter set to read the values into
+    INTEGER(INTG), INTENT(IN) :: DATA_TYPE !<The data type of the values \see FIELD_ROUTINES_DataTypes,FIELD_ROUTINES
+    INTEGER(INTG), INTENT(IN) :: NUMBER_OF_VALUES !<The number of values to read
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: dof_idx,IOS
+    INTEGER(INTG), ALLOCATABLE :: DOFS(:),INTG_VALUES(:)
+    REAL(SP), ALLOCATABLE :: SP_VALUES(:)
+    REAL(DP), ALLOCATABLE :: DP_VALUES(:)
+    LOGICAL, ALLOCATABLE :: L_VALUES(:)
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("CHECKPOINT_RECORD_READ",ERR,ERROR,*999)
+
+    ALLOCATE(DOFS(NUMBER_OF_VALUES),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate dofs.",ERR,ERROR,*999)
+    DOFS=[(dof_idx,dof_idx=1,NUMBER_OF_VALUES)]
+    SELECT CASE(DATA_TYPE)
+    CASE(FIELD_INTG_TYPE)
+      ALLOCATE(INTG_VALUES(NUMBER_OF_VALUES),STAT=ERR)
+      IF(ERR/=0) CALL FlagError("Could not allocate integer values.",ERR,ERROR,*999)
+      READ(FILE_UNIT,IOSTAT=IOS) INTG_VALUES
+      IF(IOS/=0) CALL FlagError("Could not read values from the checkpoint file.",ERR,ERROR,*999)
+      CALL DISTRIBUTED_VECTOR_VALUES_SET(PARAMETER_SET%PARAMETERS,DOFS,INTG_VALUES,ERR,ERROR,*999)
+      DEALLOCATE(INTG_VALUES)
+    CASE(FIELD_SP_TYPE)
+      ALLOCATE(SP_VALUES(NUMBER_OF_VALUES),STAT=ERR)
+      IF(ERR/=0) CALL FlagError("Could not allocate single precision values.",ERR,ERROR,*999)
+      READ(FILE_UNIT,IOSTAT=IOS) SP_VALUES
+      IF(IOS/=0) CALL FlagError("Could not read values from the checkpoint file.",ERR,ERROR,*999)
+      CALL DISTRIBUTED_VECTOR_VALUES_SET(PARAMETER_SET%PARAMETERS,DOFS,SP_VALUES,ERR,ERROR,*999)
+      DEALLOCATE(SP_VALUES)
+    CASE(FIELD_DP_TYPE)
+      ALLOCATE(DP_VALUES(NUMBER_OF_VALUES),STAT=ERR)
+      IF(ERR/=0) CALL FlagError("Could not allocate double precision values.",ERR,ERROR,*999)
+      READ(FILE_UNIT,IOSTAT=IOS) DP_VALUES
+      IF(IOS/=0) CALL FlagError("Could not read values from the checkpoint file.",ERR,ERROR,*999)
+      CALL DISTRIBUTED_VECTOR_VALUES_SET(PARAMETER_SET%PARAMETERS,DOFS,DP_VALUES,ERR,ERROR,*999)
+      DEALLOCATE(DP_VALUES)
+    CASE(FIELD_L_TYPE)
+      ALLOCATE(L_VALUES(NUMBER_OF_VALUES),STAT=ERR)
+      IF(ERR/=0) CALL FlagError("Could not allocate logical values.",ERR,ERROR,*999)
+      READ(FILE_UNIT,IOSTAT=IOS) L_VALUES
+      IF(IOS/=0) CALL FlagError("Could not read values from the checkpoint file.",ERR,ERROR,*999)
+      CALL DISTRIBUTED_VECTOR_VALUES_SET(PARAMETER_SET%PARAMETERS,DOFS,L_VALUES,ERR,ERROR,*999)
+      DEALLOCATE(L_VALUES)
+    CASE DEFAULT
+      LOCAL_ERROR="The data type of "//TRIM(NUMBER_TO_VSTRING(DATA_TYPE,"*",ERR,ERROR))//" is invalid."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    END SELECT
+    DEALLOCATE(DOFS)
+
+    EXITS("CHECKPOINT_RECORD_READ")
+    RETURN
+999 IF(ALLOCATED(DOFS)) DEALLOCATE(DOFS)
+    IF(ALLOCATED(INTG_VALUES)) DEALLOCATE(INTG_VALUES)
+    IF(ALLOCATED(SP_VALUES)) DEALLOCATE(SP_VALUES)
+    IF(ALLOCATED(DP_VALUES)) DEALLOCATE(DP_VALUES)
+    IF(ALLOCATED(L_VALUES)) DEALLOCATE(L_VALUES)
+    ERRORSEXITS("CHECKPOINT_RECORD_READ",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE CHECKPOINT_RECORD_READ
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Writes a record, its key and number of values followed by the values of the locally owned dofs, to a rank file.
+  SUBROUTINE CHECKPOINT_RECORD_WRITE(FILE_UNIT,RECORD,ERR,ERROR,*)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: FILE_UNIT !<The unit the rank file is open on
+    INTEGER(INTG), INTENT(IN) :: RECORD(CHECKPOINT_KEY_SIZE+1) !<The record key followed by the number of local values
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: IOS,NUMBER_OF_VALUES
+    INTEGER(INTG), POINTER :: INTG_DATA(:)
+    REAL(SP), POINTER :: SP_DATA(:)
+    REAL(DP), POINTER :: DP_DATA(:)
+    LOGICAL, POINTER :: L_DATA(:)
+    TYPE(FIELD_TYPE), POINTER :: FIELD
+    TYPE(FIELD_PARAMETER_SET_TYPE), POINTER :: PARAMETER_SET
+    TYPE(FIELD_VARIABLE_TYPE), POINTER :: FIELD_VARIABLE
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("CHECKPOINT_RECORD_WRITE",ERR,ERROR,*999)
+
+    CALL CHECKPOINT_PARAMETER_SET_FIND(RECORD(1:CHECKPOINT_KEY_SIZE),FIELD,FIELD_VARIABLE,PARAMETER_SET,ERR,ERROR,*999)
+    NUMBER_OF_VALUES=RECORD(CHECKPOINT_KEY_SIZE+1)
+    WRITE(FILE_UNIT,IOSTAT=IOS) RECORD
+    IF(IOS/=0) CALL FlagError("Could not write to the checkpoint file.",ERR,ERROR,*999)
+    !The locally owned dofs come first in the local parameter set data
+    SELECT CASE(RECORD(7))
+    CASE(FIELD_INTG_TYPE)
+      NULLIFY(INTG_DATA)
+      CALL FIELD_PARAMETER_SET_DATA_GET(FIELD,RECORD(5),RECORD(6),INTG_DATA,ERR,ERROR,*999)
+      WRITE(FILE_UNIT,IOSTAT=IOS) INTG_DATA(1:NUMBER_OF_VALUES)
+      CALL FIELD_PARAMETER_SET_DATA_RESTORE(FIELD,RECORD(5),RECORD(6),INTG_DATA,ERR,ERROR,*999)
+    CASE(FIELD_SP_TYPE)
+      NULLIFY(SP_DATA)
+      CALL FIELD_PARAMETER_SET_DATA_GET(FIELD,RECORD(5),RECORD(6),SP_DATA,ERR,ERROR,*999)
+      WRITE(FILE_UNIT,IOSTAT=IOS) SP_DATA(1:NUMBER_OF_VALUES)
+      CALL FIELD_PARAMETER_SET_DATA_RESTORE(FIELD,RECORD(5),RECORD(6),SP_DATA,ERR,ERROR,*999)
+    CASE(FIELD_DP_TYPE)
+      NULLIFY(DP_DATA)
+      CALL FIELD_PARAMETER_SET_DATA_GET(FIELD,RECORD(5),RECORD(6),DP_DATA,ERR,ERROR,*999)
+      WRITE(FILE_UNIT,IOSTAT=IOS) DP_DATA(1:NUMBER_OF_VALUES)
+      CALL FIELD_PARAMETER_SET_DATA_RESTORE(FIELD,RECORD(5),RECORD(6),DP_DATA,ERR,ERROR,*999)
+    CASE(FIELD_L_TYPE)
+      NULLIFY(L_DATA)
+      CALL FIELD_PARAMETER_SET_DATA_GET(FIELD,RECORD(5),RECORD(6),L_DATA,ERR,ERROR,*999)
+      WRITE(FILE_UNIT,IOSTAT=IOS) L_DATA(1:NUMBER_OF_VALUES)
+      CALL FIELD_PARAMETER_SET_DATA_RESTORE(FIELD,RECORD(5),RECORD(6),L_DATA,ERR,ERROR,*999)
+    CASE DEFAULT
+      LOCAL_ERROR="The data type of "//TRIM(NUMBER_TO_VSTRING(RECORD(7),"*",ERR,ERROR))//" is invalid."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    END SELECT
+    IF(IOS/=0) CALL FlagError("Could not write to the checkpoint file.",ERR,ERROR,*999)
+
+    EXITS("CHECKPOINT_RECORD_WRITE")
+    RETURN
+999 ERRORSEXITS("CHECKPOINT_RECORD_WRITE",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE CHECKPOINT_RECORD_WRITE
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Adds the records for the fields in a region, the fields in its interfaces and, recursively, its sub regions.
+  RECURSIVE SUBROUTINE CHECKPOINT_REGION_RECORDS_ADD(REGION,RECORDS_LIST,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(REGION_TYPE), POINTER :: REGION !<A pointer to the region to add the records for
+    TYPE(LIST_TYPE), POINTER :: RECORDS_LIST !<The list to add the records to
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: interface_idx,region_idx
+    TYPE(INTERFACE_TYPE), POINTER :: INTERFACE
+
+    ENTERS("CHECKPOINT_REGION_RECORDS_ADD",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(REGION)) THEN
+      CALL CHECKPOINT_FIELDS_RECORDS_ADD(REGION%FIELDS,[REGION%USER_NUMBER,0,0],RECORDS_LIST,ERR,ERROR,*999)
+      IF(ASSOCIATED(REGION%INTERFACES)) THEN
+        DO interface_idx=1,REGION%INTERFACES%NUMBER_OF_INTERFACES
+          INTERFACE=>REGION%INTERFACES%INTERFACES(interface_idx)%PTR
+          IF(ASSOCIATED(INTERFACE)) CALL CHECKPOINT_FIELDS_RECORDS_ADD(INTERFACE%FIELDS,[REGION%USER_NUMBER,1, &
+            & INTERFACE%USER_NUMBER],RECORDS_LIST,ERR,ERROR,*999)
+        ENDDO !interface_idx
+      ENDIF
+      DO region_idx=1,REGION%NUMBER_OF_SUB_REGIONS
+        CALL CHECKPOINT_REGION_RECORDS_ADD(REGION%SUB_REGIONS(region_idx)%PTR,RECORDS_LIST,ERR,ERROR,*999)
+      ENDDO !region_idx
+    ELSE
+      CALL FlagError("Region is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("CHECKPOINT_REGION_RECORDS_ADD")
+    RETURN
+999 ERRORSEXITS("CHECKPOINT_REGION_RECORDS_ADD",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE CHECKPOINT_REGION_RECORDS_ADD
+
+  !
+  !================================================================================================================================
+  !
+
+END MODULE CHECKPOINT_ROUTINES
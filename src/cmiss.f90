@@ -57,6 +57,7 @@ MODULE Cmiss
   USE COMP_ENVIRONMENT
   USE CONSTANTS
   USE COORDINATE_ROUTINES
+  USE FIELD_IO_ROUTINES
   USE GENERATED_MESH_ROUTINES
   USE ISO_VARYING_STRING
   USE KINDS
@@ -207,6 +208,8 @@ CONTAINS
     TYPE(VARYING_STRING), INTENT(INOUT) :: error !<The error code
     !Local Variables
 
+    !Make sure any asynchronous exports have been written out
+    CALL FIELD_IO_EXPORT_WAIT(err,error,*999)
     !Finalise the problems
     CALL PROBLEMS_FINALISE(err,error,*999)
     !Finalise the regions
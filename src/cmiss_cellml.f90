@@ -110,6 +110,23 @@ MODULE CMISS_CELLML
  
   !Interfaces
 
+  !>Interface for a batched CellML RHS routine. The routine evaluates the rates and intermediates for numberOfCells cells
+  !>that share a model. The cell data is laid out structure-of-arrays with a leading dimension of batchSize, i.e., the
+  !>state_idx'th state of the cell_idx'th cell is states((state_idx-1)*batchSize+cell_idx), so that the evaluation can be
+  !>vectorised across the cells.
+  ABSTRACT INTERFACE
+    SUBROUTINE CellML_BatchRHSRoutine(numberOfCells,batchSize,time,states,rates,intermediates,parameters) BIND(C)
+      USE ISO_C_BINDING
+      INTEGER(C_INT), VALUE :: numberOfCells !<The number of cells in the batch to evaluate
+      INTEGER(C_INT), VALUE :: batchSize !<The leading dimension of the batch arrays
+      REAL(C_DOUBLE), VALUE :: time !<The time to evaluate the RHS at
+      REAL(C_DOUBLE), INTENT(IN) :: states(*) !<The states for the batch of cells
+      REAL(C_DOUBLE), INTENT(OUT) :: rates(*) !<On return, the rates for the batch of cells
+      REAL(C_DOUBLE), INTENT(OUT) :: intermediates(*) !<On return, the intermediates for the batch of cells
+      REAL(C_DOUBLE), INTENT(IN) :: parameters(*) !<The parameters for the batch of cells
+    END SUBROUTINE CellML_BatchRHSRoutine
+  END INTERFACE
+
   !> Map a CellML variable type from OpenCMISS(cellml) to a CellML field type \see CELLML_FieldTypes,CMISS_CELLML
   INTERFACE MAP_CELLML_VARIABLE_TYPE_TO_FIELD_TYPE
     MODULE PROCEDURE MAP_CELLML_VARIABLE_TYPE_TO_FIELD_TYPE_INTG
@@ -166,6 +183,10 @@ MODULE CMISS_CELLML
   
   PUBLIC CELLML_MODEL_IMPORT
 
+  PUBLIC CellML_ModelBatchRHSRoutineSet,CellML_ModelRHSBatchEvaluate
+
+  PUBLIC CellML_ModelGatingVariableSet
+
   PUBLIC CELLML_VARIABLE_SET_AS_KNOWN,CELLML_VARIABLE_SET_AS_WANTED
 
   PUBLIC CELLML_FIELD_MAPS_CREATE_START,CELLML_FIELD_MAPS_CREATE_FINISH
@@ -176,6 +197,8 @@ MODULE CMISS_CELLML
 
   PUBLIC CELLML_MODELS_FIELD_CREATE_START,CELLML_MODELS_FIELD_CREATE_FINISH,CELLML_MODELS_FIELD_GET
 
+  PUBLIC CellML_ModelsFieldDofsSort
+
   PUBLIC CELLML_STATE_FIELD_CREATE_START,CELLML_STATE_FIELD_CREATE_FINISH,CELLML_STATE_FIELD_GET
 
   PUBLIC CELLML_FIELD_COMPONENT_GET
@@ -1465,6 +1488,7 @@ CONTAINS
     IF(ASSOCIATED(CELLML_MODEL)) THEN
       IF(C_ASSOCIATED(CELLML_MODEL%PTR)) CALL DESTROY_CELLML_MODEL_DEFINITION(CELLML_MODEL%PTR)
       CELLML_MODEL%MODEL_ID=""
+      IF(ALLOCATED(CELLML_MODEL%GATING_STATES)) DEALLOCATE(CELLML_MODEL%GATING_STATES)
       DEALLOCATE(CELLML_MODEL)
     ENDIF
 
@@ -1508,6 +1532,7 @@ CONTAINS
       CELLML_MODEL%GLOBAL_NUMBER=0
       CELLML_MODEL%MODEL_ID=""
       CELLML_MODEL%PTR = C_NULL_PTR
+      CELLML_MODEL%BATCH_RHS_ROUTINE = C_NULL_FUNPTR
       CELLML_MODEL%NUMBER_OF_STATE=0
       CELLML_MODEL%NUMBER_OF_INTERMEDIATE=0
       CELLML_MODEL%NUMBER_OF_PARAMETERS=0
@@ -1797,6 +1822,205 @@ CONTAINS
   !=================================================================================================================================
   !
 
+  !>Sets the batched RHS routine for a CellML model. The routine must match the CellML_BatchRHSRoutine interface and is used
+  !>instead of the per cell RHS routine when the cells are integrated in structure-of-arrays batches.
+  SUBROUTINE CellML_ModelBatchRHSRoutineSet(cellml,modelIndex,batchRHSRoutine,err,error,*)
+    !Argument variables
+    TYPE(CELLML_TYPE), POINTER :: cellml !<A pointer to the CellML environment containing the model.
+    INTEGER(INTG), INTENT(IN) :: modelIndex !<The index of the model to set the batched RHS routine for.
+    TYPE(C_FUNPTR), INTENT(IN) :: batchRHSRoutine !<The C function pointer to the batched RHS routine, or C_NULL_FUNPTR to use the per cell RHS routine.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string.
+    !Local variables
+    TYPE(CELLML_MODEL_TYPE), POINTER :: model
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("CellML_ModelBatchRHSRoutineSet",err,error,*999)
+
+#ifdef WITH_CELLML
+
+    IF(ASSOCIATED(cellml)) THEN
+      IF(modelIndex>0.AND.modelIndex<=cellml%NUMBER_OF_MODELS) THEN
+        model=>cellml%MODELS(modelIndex)%PTR
+        IF(ASSOCIATED(model)) THEN
+          model%BATCH_RHS_ROUTINE=batchRHSRoutine
+        ELSE
+          localError="The CellML model is not associated for model index "// &
+            & TRIM(NUMBER_TO_VSTRING(modelIndex,"*",err,error))//"."
+          CALL FlagError(localError,err,error,*999)
+        ENDIF
+      ELSE
+        localError="The specified model index of "//TRIM(NUMBER_TO_VSTRING(modelIndex,"*",err,error))// &
+          & " is invalid. The model index should be between 1 and "// &
+          & TRIM(NUMBER_TO_VSTRING(cellml%NUMBER_OF_MODELS,"*",err,error))//"."
+        CALL FlagError(localError,err,error,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("CellML environment is not associated.",err,error,*999)
+    ENDIF
+
+#else
+
+    CALL FlagError("Must compile with WITH_CELLML ON to use CellML functionality.",err,error,*999)
+
+#endif
+
+    EXITS("CellML_ModelBatchRHSRoutineSet")
+    RETURN
+999 ERRORSEXITS("CellML_ModelBatchRHSRoutineSet",err,error)
+    RETURN 1
+  END SUBROUTINE CellML_ModelBatchRHSRoutineSet
+
+  !
+  !=================================================================================================================================
+  !
+
+  !>Sets a CellML model state variable to be a gating variable, i.e., a variable with a rate of the form (y_inf-y)/tau that
+  !>the Rush-Larsen differential-algebraic equation solver integrates exactly over each time step.
+  SUBROUTINE CellML_ModelGatingVariableSet(cellml,modelIndex,variableId,err,error,*)
+    !Argument variables
+    TYPE(CELLML_TYPE), POINTER :: cellml !<A pointer to the CellML environment containing the model.
+    INTEGER(INTG), INTENT(IN) :: modelIndex !<The index of the model containing the gating variable.
+    CHARACTER(LEN=*), INTENT(IN) :: variableId !<The state variable to set as a gating variable (in the format 'component_name/variable_name').
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string.
+    !Local variables
+    CHARACTER(LEN=1,KIND=C_CHAR) :: cName(MAXSTRLEN)
+    INTEGER(C_INT) :: errorC
+    INTEGER(INTG) :: cellmlFieldType,cellmlVariableType,stateIdx
+    TYPE(CELLML_MODEL_TYPE), POINTER :: model
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("CellML_ModelGatingVariableSet",err,error,*999)
+
+#ifdef WITH_CELLML
+
+    IF(.NOT.ASSOCIATED(cellml)) CALL FlagError("CellML environment is not associated.",err,error,*999)
+    IF(.NOT.cellml%CELLML_FINISHED) CALL FlagError("CellML environment has not been finished.",err,error,*999)
+    IF(modelIndex<1.OR.modelIndex>cellml%NUMBER_OF_MODELS) THEN
+      localError="The specified model index of "//TRIM(NUMBER_TO_VSTRING(modelIndex,"*",err,error))// &
+        & " is invalid. The model index should be between 1 and "// &
+        & TRIM(NUMBER_TO_VSTRING(cellml%NUMBER_OF_MODELS,"*",err,error))//"."
+      CALL FlagError(localError,err,error,*999)
+    ENDIF
+    model=>cellml%MODELS(modelIndex)%PTR
+    IF(.NOT.ASSOCIATED(model)) THEN
+      localError="The CellML model is not associated for model index "// &
+        & TRIM(NUMBER_TO_VSTRING(modelIndex,"*",err,error))//"."
+      CALL FlagError(localError,err,error,*999)
+    ENDIF
+    CALL CMISSF2CString(variableId,cName)
+    errorC=CELLML_MODEL_DEFINITION_GET_VARIABLE_TYPE(model%PTR,cName,cellmlVariableType)
+    IF(errorC/=0) THEN
+      localError="Failed to get the type of CellML variable: "//variableId// &
+        & "; with the error code: "//TRIM(NUMBER_TO_VSTRING(errorC,"*",err,error))
+      CALL FlagError(localError,err,error,*999)
+    ENDIF
+    cellmlFieldType=MAP_CELLML_VARIABLE_TYPE_TO_FIELD_TYPE(cellmlVariableType,err,error)
+    IF(err/=0) GOTO 999
+    IF(cellmlFieldType/=CELLML_STATE_FIELD) THEN
+      localError="The CellML variable "//variableId//" is not a state variable. Only state variables can be gating variables."
+      CALL FlagError(localError,err,error,*999)
+    ENDIF
+    CALL CELLML_FIELD_COMPONENT_GET(cellml,modelIndex,CELLML_STATE_FIELD,variableId,stateIdx,err,error,*999)
+    IF(stateIdx<1.OR.stateIdx>model%NUMBER_OF_STATE) THEN
+      localError="The state index of "//TRIM(NUMBER_TO_VSTRING(stateIdx,"*",err,error))//" for CellML variable "// &
+        & variableId//" is invalid."
+      CALL FlagError(localError,err,error,*999)
+    ENDIF
+    IF(.NOT.ALLOCATED(model%GATING_STATES)) THEN
+      ALLOCATE(model%GATING_STATES(model%NUMBER_OF_STATE),STAT=err)
+      IF(err/=0) CALL FlagError("Could not allocate model gating states.",err,error,*999)
+      model%GATING_STATES=.FALSE.
+    ENDIF
+    model%GATING_STATES(stateIdx)=.TRUE.
+
+#else
+
+    CALL FlagError("Must compile with WITH_CELLML ON to use CellML functionality.",err,error,*999)
+
+#endif
+
+    EXITS("CellML_ModelGatingVariableSet")
+    RETURN
+999 ERRORSEXITS("CellML_ModelGatingVariableSet",err,error)
+    RETURN 1
+  END SUBROUTINE CellML_ModelGatingVariableSet
+
+  !
+  !=================================================================================================================================
+  !
+
+  !>Evaluates the RHS of a CellML model for a batch of cells laid out structure-of-arrays, i.e., states(cell_idx,state_idx).
+  !>If the model has a batched RHS routine it is called once for the whole batch, otherwise each cell is gathered and the per
+  !>cell RHS routine is called.
+  SUBROUTINE CellML_ModelRHSBatchEvaluate(model,time,numberOfCells,states,rates,intermediates,parameters,err,error,*)
+    !Argument variables
+    TYPE(CELLML_MODEL_TYPE), POINTER :: model !<A pointer to the CellML model shared by the cells in the batch.
+    REAL(DP), INTENT(IN) :: time !<The time to evaluate the RHS at.
+    INTEGER(INTG), INTENT(IN) :: numberOfCells !<The number of cells in the batch. Must be <= the leading dimension of the arrays.
+    REAL(DP), INTENT(IN) :: states(:,:) !<states(cell_idx,state_idx). The states of the batch of cells.
+    REAL(DP), INTENT(OUT) :: rates(:,:) !<rates(cell_idx,state_idx). On return, the rates of the batch of cells.
+    REAL(DP), INTENT(INOUT) :: intermediates(:,:) !<intermediates(cell_idx,intermediate_idx). On return, the intermediates of the batch of cells. Must have at least one column.
+    REAL(DP), INTENT(IN) :: parameters(:,:) !<parameters(cell_idx,parameter_idx). The parameters of the batch of cells. Must have at least one column.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string.
+    !Local variables
+    INTEGER(INTG) :: cellIdx,numberOfIntermediates,numberOfParameters,numberOfStates
+    REAL(DP) :: cellIntermediates(SIZE(intermediates,2)),cellParameters(SIZE(parameters,2)),cellRates(SIZE(rates,2)), &
+      & cellStates(SIZE(states,2))
+    PROCEDURE(CellML_BatchRHSRoutine), POINTER :: batchRHSRoutine
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("CellML_ModelRHSBatchEvaluate",err,error,*999)
+
+#ifdef WITH_CELLML
+
+    IF(.NOT.ASSOCIATED(model)) CALL FlagError("CellML model is not associated.",err,error,*999)
+    IF(numberOfCells<0.OR.numberOfCells>SIZE(states,1)) THEN
+      localError="The number of cells of "//TRIM(NUMBER_TO_VSTRING(numberOfCells,"*",err,error))// &
+        & " is invalid. The number of cells should be between 0 and the batch size of "// &
+        & TRIM(NUMBER_TO_VSTRING(SIZE(states,1),"*",err,error))//"."
+      CALL FlagError(localError,err,error,*999)
+    ENDIF
+    numberOfStates=model%NUMBER_OF_STATE
+    numberOfIntermediates=model%NUMBER_OF_INTERMEDIATE
+    numberOfParameters=model%NUMBER_OF_PARAMETERS
+    IF(SIZE(states,2)<numberOfStates.OR.SIZE(rates,2)<numberOfStates.OR.SIZE(rates,1)<SIZE(states,1).OR. &
+      & SIZE(intermediates,2)<MAX(1,numberOfIntermediates).OR.SIZE(intermediates,1)<SIZE(states,1).OR. &
+      & SIZE(parameters,2)<MAX(1,numberOfParameters).OR.SIZE(parameters,1)<SIZE(states,1)) &
+      & CALL FlagError("The batch arrays are too small for the CellML model.",err,error,*999)
+
+    IF(C_ASSOCIATED(model%BATCH_RHS_ROUTINE)) THEN
+      !The batch arrays are passed without copying so they must be contiguous.
+      CALL C_F_PROCPOINTER(model%BATCH_RHS_ROUTINE,batchRHSRoutine)
+      CALL batchRHSRoutine(INT(numberOfCells,C_INT),INT(SIZE(states,1),C_INT),time,states,rates,intermediates,parameters)
+    ELSE
+      DO cellIdx=1,numberOfCells
+        cellStates(1:numberOfStates)=states(cellIdx,1:numberOfStates)
+        IF(numberOfParameters>0) cellParameters(1:numberOfParameters)=parameters(cellIdx,1:numberOfParameters)
+        CALL CELLML_MODEL_DEFINITION_CALL_RHS_ROUTINE(model%PTR,time,cellStates,cellRates,cellIntermediates,cellParameters)
+        rates(cellIdx,1:numberOfStates)=cellRates(1:numberOfStates)
+        IF(numberOfIntermediates>0) intermediates(cellIdx,1:numberOfIntermediates)=cellIntermediates(1:numberOfIntermediates)
+      ENDDO !cellIdx
+    ENDIF
+
+#else
+
+    CALL FlagError("Must compile with WITH_CELLML ON to use CellML functionality.",err,error,*999)
+
+#endif
+
+    EXITS("CellML_ModelRHSBatchEvaluate")
+    RETURN
+999 ERRORSEXITS("CellML_ModelRHSBatchEvaluate",err,error)
+    RETURN 1
+  END SUBROUTINE CellML_ModelRHSBatchEvaluate
+
+  !
+  !=================================================================================================================================
+  !
+
   !>Sets a CellML model variable to be known - i.e., the variable's value will be set by an OpenCMISS field
   SUBROUTINE CELLML_VARIABLE_SET_AS_KNOWN_C(CELLML,MODEL_INDEX,VARIABLE_ID,ERR,ERROR,*)
 
@@ -2658,6 +2882,83 @@ CONTAINS
   !=================================================================================================================================
   !
 
+  !>Groups the dofs of a CellML environment models field by model so that dofs sharing a model can be evaluated in batches.
+  !>On return the dofs using the model_idx'th model are modelDofs(modelDofsOffsets(model_idx):modelDofsOffsets(model_idx+1)-1),
+  !>in increasing dof order. Dofs with a zero model index are not included.
+  SUBROUTINE CellML_ModelsFieldDofsSort(cellml,numberOfDofs,modelsData,modelDofsOffsets,modelDofs,err,error,*)
+    !Argument variables
+    TYPE(CELLML_TYPE), POINTER :: cellml !<A pointer to the CellML environment
+    INTEGER(INTG), INTENT(IN) :: numberOfDofs !<The number of dofs in the models data
+    INTEGER(INTG), INTENT(IN) :: modelsData(:) !<modelsData(dof_idx). The model index for the dof_idx'th dof.
+    INTEGER(INTG), ALLOCATABLE, INTENT(INOUT) :: modelDofsOffsets(:) !<On return, modelDofsOffsets(model_idx). The start of the dofs for the model_idx'th model in modelDofs. Of size number of models+1.
+    INTEGER(INTG), ALLOCATABLE, INTENT(INOUT) :: modelDofs(:) !<On return, the dofs grouped by model.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !< The error string
+    !Local variables
+    INTEGER(INTG) :: dofIdx,modelIdx,numberOfModels
+    INTEGER(INTG), ALLOCATABLE :: nextDof(:)
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("CellML_ModelsFieldDofsSort",err,error,*999)
+
+    IF(.NOT.ASSOCIATED(cellml)) CALL FlagError("CellML environment is not associated.",err,error,*999)
+    IF(SIZE(modelsData,1)<numberOfDofs) THEN
+      localError="The size of the models data of "//TRIM(NUMBER_TO_VSTRING(SIZE(modelsData,1),"*",err,error))// &
+        & " is less than the number of dofs of "//TRIM(NUMBER_TO_VSTRING(numberOfDofs,"*",err,error))//"."
+      CALL FlagError(localError,err,error,*999)
+    ENDIF
+    numberOfModels=cellml%NUMBER_OF_MODELS
+
+    IF(ALLOCATED(modelDofsOffsets)) DEALLOCATE(modelDofsOffsets)
+    IF(ALLOCATED(modelDofs)) DEALLOCATE(modelDofs)
+    ALLOCATE(modelDofsOffsets(numberOfModels+1),STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate model dofs offsets.",err,error,*999)
+    ALLOCATE(nextDof(numberOfModels),STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate next dof.",err,error,*999)
+
+    !Count the dofs for each model
+    modelDofsOffsets=0
+    DO dofIdx=1,numberOfDofs
+      modelIdx=modelsData(dofIdx)
+      IF(modelIdx>0.AND.modelIdx<=numberOfModels) THEN
+        modelDofsOffsets(modelIdx+1)=modelDofsOffsets(modelIdx+1)+1
+      ELSE IF(modelIdx/=0) THEN
+        localError="The model index of "//TRIM(NUMBER_TO_VSTRING(modelIdx,"*",err,error))// &
+          & " is invalid for dof "//TRIM(NUMBER_TO_VSTRING(dofIdx,"*",err,error))// &
+          & ". The model index must be >= 0 and <= "//TRIM(NUMBER_TO_VSTRING(numberOfModels,"*",err,error))//"."
+        CALL FlagError(localError,err,error,*999)
+      ENDIF
+    ENDDO !dofIdx
+    modelDofsOffsets(1)=1
+    DO modelIdx=1,numberOfModels
+      modelDofsOffsets(modelIdx+1)=modelDofsOffsets(modelIdx+1)+modelDofsOffsets(modelIdx)
+    ENDDO !modelIdx
+
+    !Place the dofs
+    ALLOCATE(modelDofs(MAX(1,modelDofsOffsets(numberOfModels+1)-1)),STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate model dofs.",err,error,*999)
+    nextDof=modelDofsOffsets(1:numberOfModels)
+    DO dofIdx=1,numberOfDofs
+      modelIdx=modelsData(dofIdx)
+      IF(modelIdx>0) THEN
+        modelDofs(nextDof(modelIdx))=dofIdx
+        nextDof(modelIdx)=nextDof(modelIdx)+1
+      ENDIF
+    ENDDO !dofIdx
+
+    DEALLOCATE(nextDof)
+
+    EXITS("CellML_ModelsFieldDofsSort")
+    RETURN
+999 IF(ALLOCATED(nextDof)) DEALLOCATE(nextDof)
+    ERRORSEXITS("CellML_ModelsFieldDofsSort",err,error)
+    RETURN 1
+  END SUBROUTINE CellML_ModelsFieldDofsSort
+
+  !
+  !=================================================================================================================================
+  !
+
   !>Start the creation of the models field for the given CellML environment.
   SUBROUTINE CELLML_MODELS_FIELD_CREATE_START(MODEL_FIELD_USER_NUMBER,CELLML,MODELS_FIELD,ERR,ERROR,*)
     !Argument variables
@@ -94,6 +94,16 @@ MODULE DATA_PROJECTION_ROUTINES
   INTEGER(INTG), PARAMETER :: DATA_PROJECTION_EXIT_TAG_NO_ELEMENT=4 !<Data projection exited due to no local element found, this happens when none of the candidate elements are within this computational node, and before MPI communication with other nodes. \see DATA_PROJECTION_ROUTINES     
   !>@}
 
+  !> \addtogroup DATA_POINT_PROJECTION_ROUTINES_DataProjectionSpatialIndexTypes DATA_POINT_PROJECTION_ROUTINES::DataProjectionSpatialIndexTypes
+  !> \brief Datapoint projection spatial index types for finding the closest candidates
+  !> \see DATA_POINT_PROJECTION_ROUTINES,OPENCMISS_DataProjectionSpatialIndexTypes
+  !>@{ 
+  INTEGER(INTG), PARAMETER :: DATA_PROJECTION_NO_SPATIAL_INDEX=0 !<No spatial index, the distance to every candidate is evaluated for each data point. \see DATA_PROJECTION_ROUTINES 
+  INTEGER(INTG), PARAMETER :: DATA_PROJECTION_GRID_SPATIAL_INDEX=1 !<A uniform grid of the candidate positions at the starting xi is used to find the closest candidates for each data point. \see DATA_PROJECTION_ROUTINES 
+  !>@}
+
+  INTEGER(INTG), PARAMETER :: DATA_PROJECTION_PARAMETERS_CACHE_MEMORY=67108864 !<The maximum memory in bytes used by the interpolation parameters cache during a data projection evaluation.
+
   !Module types
 
   !Module variables
@@ -115,6 +125,8 @@ MODULE DATA_PROJECTION_ROUTINES
   PUBLIC DATA_PROJECTION_BOUNDARY_LINES_PROJECTION_TYPE,DATA_PROJECTION_BOUNDARY_FACES_PROJECTION_TYPE, &
     & DATA_PROJECTION_ALL_ELEMENTS_PROJECTION_TYPE
   
+  PUBLIC DATA_PROJECTION_NO_SPATIAL_INDEX,DATA_PROJECTION_GRID_SPATIAL_INDEX
+  
   PUBLIC DATA_PROJECTION_ABSOLUTE_TOLERANCE_GET,DATA_PROJECTION_ABSOLUTE_TOLERANCE_SET
 
   PUBLIC DATA_PROJECTION_CREATE_FINISH,DATA_PROJECTION_CREATE_START_DATA_POINTS
@@ -130,6 +142,8 @@ MODULE DATA_PROJECTION_ROUTINES
   PUBLIC DataProjection_MaximumNumberOfIterationsGet,DataProjection_MaximumNumberOfIterationsSet
   
   PUBLIC DataProjection_NumberOfClosestElementsGet,DataProjection_NumberOfClosestElementsSet
+
+  PUBLIC DataProjection_ParametersCacheEnabledSet,DataProjection_ParametersCacheStatisticsGet
   
   PUBLIC DataProjection_ProjectionCandidatesSet
   
@@ -137,6 +151,8 @@ MODULE DATA_PROJECTION_ROUTINES
   
   PUBLIC DATA_PROJECTION_RELATIVE_TOLERANCE_GET,DATA_PROJECTION_RELATIVE_TOLERANCE_SET
   
+  PUBLIC DataProjection_SpatialIndexGet,DataProjection_SpatialIndexSet
+  
   PUBLIC DATA_PROJECTION_STARTING_XI_GET,DATA_PROJECTION_STARTING_XI_SET
 
   PUBLIC DATA_PROJECTION_RESULT_XI_GET, DATA_PROJECTION_RESULT_XI_SET
@@ -263,8 +279,8 @@ CONTAINS
         !loop through the first few elements
         DO nce=1,NUMBER_OF_CLOSEST_CANDIDATES
           ELEMENT_NUMBER=CANDIDATE_ELEMENTS(nce)
-          CALL FIELD_INTERPOLATION_PARAMETERS_ELEMENT_GET(FIELD_VALUES_SET_TYPE,ELEMENT_NUMBER, &
-            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
+          CALL DataProjection_ParametersCacheGet(DATA_PROJECTION,FIELD_VALUES_SET_TYPE,ELEMENT_NUMBER, &
+            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999)
           CALL FIELD_INTERPOLATE_XI(NO_PART_DERIV,DATA_PROJECTION%STARTING_XI,INTERPOLATED_POINT,ERR,ERROR,*999, &
             & FIELD_GEOMETRIC_COMPONENTS_TYPE)
           DISTANCE_VECTOR(1:REGION_DIMENSIONS) = POINT_VALUES-INTERPOLATED_POINT%VALUES(:,1)
@@ -286,8 +302,8 @@ CONTAINS
         !Loop through the rest of the elements
         DO nce=NUMBER_OF_CLOSEST_CANDIDATES+1,NUMBER_OF_CANDIDATES
           ELEMENT_NUMBER=CANDIDATE_ELEMENTS(nce)
-          CALL FIELD_INTERPOLATION_PARAMETERS_ELEMENT_GET(FIELD_VALUES_SET_TYPE,ELEMENT_NUMBER, &
-            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
+          CALL DataProjection_ParametersCacheGet(DATA_PROJECTION,FIELD_VALUES_SET_TYPE,ELEMENT_NUMBER, &
+            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999)
           CALL FIELD_INTERPOLATE_XI(NO_PART_DERIV,DATA_PROJECTION%STARTING_XI,INTERPOLATED_POINT,ERR,ERROR,*999, &
             & FIELD_GEOMETRIC_COMPONENTS_TYPE) 
           DISTANCE_VECTOR(1:REGION_DIMENSIONS)=POINT_VALUES - INTERPOLATED_POINT%VALUES(:,1)
@@ -364,8 +380,8 @@ CONTAINS
           ELEMENT_FACE_NUMBER=CANDIDATE_ELEMENT_FACES(nce)
           FACE_NUMBER=INTERPOLATED_POINT%INTERPOLATION_PARAMETERS%FIELD%DECOMPOSITION%TOPOLOGY%ELEMENTS%ELEMENTS( &
             & ELEMENT_NUMBER)%ELEMENT_FACES(ELEMENT_FACE_NUMBER)
-          CALL FIELD_INTERPOLATION_PARAMETERS_FACE_GET(FIELD_VALUES_SET_TYPE,FACE_NUMBER, &
-            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
+          CALL DataProjection_ParametersCacheGet(DATA_PROJECTION,FIELD_VALUES_SET_TYPE,FACE_NUMBER, &
+            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999)
           CALL FIELD_INTERPOLATE_XI(NO_PART_DERIV,DATA_PROJECTION%STARTING_XI,INTERPOLATED_POINT,ERR,ERROR,*999, &
             & FIELD_GEOMETRIC_COMPONENTS_TYPE)
           DISTANCE_VECTOR(1:REGION_DIMENSIONS) = POINT_VALUES-INTERPOLATED_POINT%VALUES(:,1)
@@ -392,8 +408,8 @@ CONTAINS
           ELEMENT_FACE_NUMBER=CANDIDATE_ELEMENT_FACES(nce)
           FACE_NUMBER=INTERPOLATED_POINT%INTERPOLATION_PARAMETERS%FIELD%DECOMPOSITION%TOPOLOGY%ELEMENTS%ELEMENTS( &
             & ELEMENT_NUMBER)%ELEMENT_FACES(ELEMENT_FACE_NUMBER)          
-          CALL FIELD_INTERPOLATION_PARAMETERS_FACE_GET(FIELD_VALUES_SET_TYPE,FACE_NUMBER, &
-            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
+          CALL DataProjection_ParametersCacheGet(DATA_PROJECTION,FIELD_VALUES_SET_TYPE,FACE_NUMBER, &
+            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999)
           CALL FIELD_INTERPOLATE_XI(NO_PART_DERIV,DATA_PROJECTION%STARTING_XI,INTERPOLATED_POINT,ERR,ERROR,*999, &
             & FIELD_GEOMETRIC_COMPONENTS_TYPE) 
           DISTANCE_VECTOR(1:REGION_DIMENSIONS)=POINT_VALUES - INTERPOLATED_POINT%VALUES(:,1)
@@ -473,8 +489,8 @@ CONTAINS
           ELEMENT_LINE_NUMBER=CANDIDATE_ELEMENT_LINES(nce)
           LINE_NUMBER=INTERPOLATED_POINT%INTERPOLATION_PARAMETERS%FIELD%DECOMPOSITION%TOPOLOGY%ELEMENTS%ELEMENTS( &
             & ELEMENT_NUMBER)%ELEMENT_LINES(ELEMENT_LINE_NUMBER)
-          CALL FIELD_INTERPOLATION_PARAMETERS_LINE_GET(FIELD_VALUES_SET_TYPE,LINE_NUMBER, &
-            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
+          CALL DataProjection_ParametersCacheGet(DATA_PROJECTION,FIELD_VALUES_SET_TYPE,LINE_NUMBER, &
+            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999)
           CALL FIELD_INTERPOLATE_XI(NO_PART_DERIV,DATA_PROJECTION%STARTING_XI,INTERPOLATED_POINT,ERR,ERROR,*999, &
             & FIELD_GEOMETRIC_COMPONENTS_TYPE)
           DISTANCE_VECTOR(1:REGION_DIMENSIONS) = POINT_VALUES-INTERPOLATED_POINT%VALUES(:,1)
@@ -501,8 +517,8 @@ CONTAINS
           ELEMENT_LINE_NUMBER=CANDIDATE_ELEMENT_LINES(nce)
           LINE_NUMBER=INTERPOLATED_POINT%INTERPOLATION_PARAMETERS%FIELD%DECOMPOSITION%TOPOLOGY%ELEMENTS%ELEMENTS( &
             & ELEMENT_NUMBER)%ELEMENT_LINES(ELEMENT_LINE_NUMBER)          
-          CALL FIELD_INTERPOLATION_PARAMETERS_LINE_GET(FIELD_VALUES_SET_TYPE,LINE_NUMBER, &
-            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
+          CALL DataProjection_ParametersCacheGet(DATA_PROJECTION,FIELD_VALUES_SET_TYPE,LINE_NUMBER, &
+            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999)
           CALL FIELD_INTERPOLATE_XI(NO_PART_DERIV,DATA_PROJECTION%STARTING_XI,INTERPOLATED_POINT,ERR,ERROR,*999, &
             & FIELD_GEOMETRIC_COMPONENTS_TYPE) 
           DISTANCE_VECTOR(1:REGION_DIMENSIONS)=POINT_VALUES - INTERPOLATED_POINT%VALUES(:,1)
@@ -677,6 +693,12 @@ CONTAINS
               ENDDO !xi_idx              
               DATA_PROJECTION%ABSOLUTE_TOLERANCE=1.0E-8_DP
               DATA_PROJECTION%RELATIVE_TOLERANCE=1.0E-6_DP
+              DATA_PROJECTION%spatialIndexType=DATA_PROJECTION_NO_SPATIAL_INDEX
+              NULLIFY(DATA_PROJECTION%spatialIndex)
+              DATA_PROJECTION%parametersCacheEnabled=.TRUE.
+              NULLIFY(DATA_PROJECTION%parametersCache)
+              DATA_PROJECTION%parametersCacheHits=0
+              DATA_PROJECTION%parametersCacheMisses=0
               IF(DATA_POINTS%NUMBER_OF_DATA_PROJECTIONS>0) THEN
                 ALLOCATE(NEW_DATA_PROJECTIONS_PTR(DATA_POINTS%NUMBER_OF_DATA_PROJECTIONS+1),STAT=ERR)
                 IF(ERR/=0) CALL FLAG_ERROR("Could not allocate new data projections.",ERR,ERROR,*999)
@@ -890,6 +912,8 @@ CONTAINS
         ENDDO !dataPointIdx
         DEALLOCATE(DATA_PROJECTION%DATA_PROJECTION_RESULTS)
       ENDIF
+      CALL DataProjection_SpatialIndexFinalise(DATA_PROJECTION%spatialIndex,ERR,ERROR,*999)
+      CALL DataProjection_ParametersCacheFinalise(DATA_PROJECTION%parametersCache,ERR,ERROR,*999)
       DEALLOCATE(DATA_PROJECTION)
     ELSE
       CALL FLAG_ERROR("Data projection is not associated.",ERR,ERROR,*999)
@@ -975,6 +999,7 @@ CONTAINS
     INTEGER(INTG) :: NUMBER_OF_CLOSEST_CANDIDATES,TOTAL_NUMBER_OF_CLOSEST_CANDIDATES,REDUCED_NUMBER_OF_CLOSEST_CANDIDATES
     INTEGER(INTG), ALLOCATABLE :: GLOBAL_TO_LOCAL_NUMBER_OF_CLOSEST_CANDIDATES(:) 
     INTEGER(INTG), ALLOCATABLE :: CANDIDATE_ELEMENTS(:),CLOSEST_ELEMENTS(:,:),CANDIDATE_FACES(:),CLOSEST_FACES(:,:)
+    INTEGER(INTG), ALLOCATABLE :: CLOSEST_CANDIDATES(:),closestEntities(:),dataPointOrder(:)
     !INTEGER(INTG) :: NUMBER_OF_CANDIDATE_LINES
     REAL(DP), ALLOCATABLE :: CLOSEST_DISTANCES(:,:),GLOBAL_CLOSEST_DISTANCES(:,:)
     INTEGER(INTG), ALLOCATABLE :: GLOBAL_NUMBER_OF_CLOSEST_CANDIDATES(:)
@@ -988,9 +1013,10 @@ CONTAINS
     REAL(DP), ALLOCATABLE :: PROJECTED_DISTANCE(:,:),PROJECTED_XI(:,:), PROJECTION_VECTORS(:,:)
     
     INTEGER(INTG) :: ne,nse,ncn,ni,localElementNumber
-    INTEGER(INTG) :: temp_number,start_idx,finish_idx,data_point_idx
+    INTEGER(INTG) :: temp_number,start_idx,finish_idx,data_point_idx,order_idx,dummyErr
     
     LOGICAL :: BOUNDARY_PROJECTION,elementExists,ghostElement    
+    TYPE(VARYING_STRING) :: dummyError
     
     !INTEGER(INTG) :: NUMBER_OF_PROJECTED_POINTS,NUMBER_OF_PROJECTED_POINTS_2
   
@@ -1148,31 +1174,80 @@ CONTAINS
               ENDIF
               ALLOCATE(CLOSEST_DISTANCES(NUMBER_OF_DATA_POINTS,NUMBER_OF_CLOSEST_CANDIDATES),STAT=ERR)!the information for each data point has to be stored in the corresponding rows for them to be contiguous in memory for easy MPI access
               IF(ERR/=0) CALL FLAG_ERROR("Could not allocate closest distances.",ERR,ERROR,*999) 
-              SELECT CASE(DATA_PROJECTION%PROJECTION_TYPE)
-                CASE (DATA_PROJECTION_BOUNDARY_LINES_PROJECTION_TYPE) !find closest candidate lines
-                  DO data_point_idx=1,NUMBER_OF_DATA_POINTS
-                    CALL DATA_PROJECTION_CLOSEST_LINES_FIND(DATA_PROJECTION,INTERPOLATED_POINT, &
-                      & DATA_POINTS%DATA_POINTS(data_point_idx)%position,CANDIDATE_ELEMENTS, &
-                      & CANDIDATE_FACES,NUMBER_OF_CANDIDATES,CLOSEST_ELEMENTS(data_point_idx,:),CLOSEST_FACES( &
-                      & data_point_idx,:),CLOSEST_DISTANCES(data_point_idx,:),ERR,ERROR,*999)
-                  ENDDO !data_point_idx
-                CASE (DATA_PROJECTION_BOUNDARY_FACES_PROJECTION_TYPE) !find closest candidate faces      
+              !cache the interpolation parameters of the candidates as they are retrieved for every data point
+              IF(DATA_PROJECTION%parametersCacheEnabled) &
+                & CALL DataProjection_ParametersCacheCreate(DATA_PROJECTION,INTERPOLATED_POINT%INTERPOLATION_PARAMETERS, &
+                & FIELD_VALUES_SET_TYPE,ERR,ERROR,*999)
+              SELECT CASE(DATA_PROJECTION%spatialIndexType)
+              CASE(DATA_PROJECTION_NO_SPATIAL_INDEX)
+                SELECT CASE(DATA_PROJECTION%PROJECTION_TYPE)
+                  CASE (DATA_PROJECTION_BOUNDARY_LINES_PROJECTION_TYPE) !find closest candidate lines
+                    DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                      CALL DATA_PROJECTION_CLOSEST_LINES_FIND(DATA_PROJECTION,INTERPOLATED_POINT, &
+                        & DATA_POINTS%DATA_POINTS(data_point_idx)%position,CANDIDATE_ELEMENTS, &
+                        & CANDIDATE_FACES,NUMBER_OF_CANDIDATES,CLOSEST_ELEMENTS(data_point_idx,:),CLOSEST_FACES( &
+                        & data_point_idx,:),CLOSEST_DISTANCES(data_point_idx,:),ERR,ERROR,*999)
+                    ENDDO !data_point_idx
+                  CASE (DATA_PROJECTION_BOUNDARY_FACES_PROJECTION_TYPE) !find closest candidate faces      
+                    DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                      CALL DATA_PROJECTION_CLOSEST_FACES_FIND(DATA_PROJECTION,INTERPOLATED_POINT, &
+                        & DATA_POINTS%DATA_POINTS(data_point_idx)%position,CANDIDATE_ELEMENTS, &
+                        & CANDIDATE_FACES,NUMBER_OF_CANDIDATES,CLOSEST_ELEMENTS(data_point_idx,:),CLOSEST_FACES( &
+                        & data_point_idx,:),CLOSEST_DISTANCES(data_point_idx,:),ERR,ERROR,*999)
+                    ENDDO !data_point_idx
+                  CASE (DATA_PROJECTION_ALL_ELEMENTS_PROJECTION_TYPE) !find closest candidate elements
+                    DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                      CALL DATA_PROJECTION_CLOSEST_ELEMENTS_FIND(DATA_PROJECTION,INTERPOLATED_POINT,DATA_POINTS%DATA_POINTS( &
+                        & data_point_idx)%position,CANDIDATE_ELEMENTS,NUMBER_OF_CANDIDATES,CLOSEST_ELEMENTS(data_point_idx,:), &
+                        & CLOSEST_DISTANCES(data_point_idx,:),ERR,ERROR,*999)
+                      !CLOSEST_ELEMENTS(data_point_idx,:)=DOMAIN%MAPPINGS%ELEMENTS%LOCAL_TO_GLOBAL_MAP(CLOSEST_ELEMENTS(data_point_idx,:)) !local to global element number mapping
+                    ENDDO !data_point_idx
+                  CASE DEFAULT
+                    CALL FLAG_ERROR("No match for data projection type found",ERR,ERROR,*999)
+                END SELECT
+              CASE(DATA_PROJECTION_GRID_SPATIAL_INDEX) !find the closest candidates in the grid around each data point
+                CALL DataProjection_SpatialIndexCreate(DATA_PROJECTION,INTERPOLATED_POINT,CANDIDATE_ELEMENTS,CANDIDATE_FACES, &
+                  & NUMBER_OF_CANDIDATES,ERR,ERROR,*999)
+                ALLOCATE(CLOSEST_CANDIDATES(NUMBER_OF_CLOSEST_CANDIDATES),STAT=ERR)
+                IF(ERR/=0) CALL FLAG_ERROR("Could not allocate closest candidates.",ERR,ERROR,*999)
+                DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                  CALL DataProjection_SpatialIndexClosestFind(DATA_PROJECTION%spatialIndex,DATA_POINTS% &
+                    & DATA_POINTS(data_point_idx)%position,CLOSEST_CANDIDATES,CLOSEST_DISTANCES(data_point_idx,:),ERR,ERROR,*999)
+                  CLOSEST_ELEMENTS(data_point_idx,:)=CANDIDATE_ELEMENTS(CLOSEST_CANDIDATES)
+                  IF(BOUNDARY_PROJECTION) CLOSEST_FACES(data_point_idx,:)=CANDIDATE_FACES(CLOSEST_CANDIDATES)
+                ENDDO !data_point_idx
+              CASE DEFAULT
+                CALL FLAG_ERROR("No match for data projection spatial index type found",ERR,ERROR,*999)
+              END SELECT
+              !#####################################################################################################################
+              !group the data points by their closest element/face/line so that data points projected onto the same candidates
+              !follow each other and the candidates' interpolation parameters are found in the cache
+              ALLOCATE(dataPointOrder(NUMBER_OF_DATA_POINTS),STAT=ERR)
+              IF(ERR/=0) CALL FLAG_ERROR("Could not allocate data point order.",ERR,ERROR,*999)
+              IF(NUMBER_OF_CLOSEST_CANDIDATES>0) THEN
+                ALLOCATE(closestEntities(NUMBER_OF_DATA_POINTS),STAT=ERR)
+                IF(ERR/=0) CALL FLAG_ERROR("Could not allocate closest entities.",ERR,ERROR,*999)
+                SELECT CASE(DATA_PROJECTION%PROJECTION_TYPE)
+                CASE(DATA_PROJECTION_BOUNDARY_LINES_PROJECTION_TYPE)
                   DO data_point_idx=1,NUMBER_OF_DATA_POINTS
-                    CALL DATA_PROJECTION_CLOSEST_FACES_FIND(DATA_PROJECTION,INTERPOLATED_POINT, &
-                      & DATA_POINTS%DATA_POINTS(data_point_idx)%position,CANDIDATE_ELEMENTS, &
-                      & CANDIDATE_FACES,NUMBER_OF_CANDIDATES,CLOSEST_ELEMENTS(data_point_idx,:),CLOSEST_FACES( &
-                      & data_point_idx,:),CLOSEST_DISTANCES(data_point_idx,:),ERR,ERROR,*999)
+                    closestEntities(data_point_idx)=DECOMPOSITION%TOPOLOGY%ELEMENTS%ELEMENTS(CLOSEST_ELEMENTS(data_point_idx,1))% &
+                      & ELEMENT_LINES(CLOSEST_FACES(data_point_idx,1))
                   ENDDO !data_point_idx
-                CASE (DATA_PROJECTION_ALL_ELEMENTS_PROJECTION_TYPE) !find closest candidate elements
+                CASE(DATA_PROJECTION_BOUNDARY_FACES_PROJECTION_TYPE)
                   DO data_point_idx=1,NUMBER_OF_DATA_POINTS
-                    CALL DATA_PROJECTION_CLOSEST_ELEMENTS_FIND(DATA_PROJECTION,INTERPOLATED_POINT,DATA_POINTS%DATA_POINTS( &
-                      & data_point_idx)%position,CANDIDATE_ELEMENTS,NUMBER_OF_CANDIDATES,CLOSEST_ELEMENTS(data_point_idx,:), &
-                      & CLOSEST_DISTANCES(data_point_idx,:),ERR,ERROR,*999)
-                    !CLOSEST_ELEMENTS(data_point_idx,:)=DOMAIN%MAPPINGS%ELEMENTS%LOCAL_TO_GLOBAL_MAP(CLOSEST_ELEMENTS(data_point_idx,:)) !local to global element number mapping
+                    closestEntities(data_point_idx)=DECOMPOSITION%TOPOLOGY%ELEMENTS%ELEMENTS(CLOSEST_ELEMENTS(data_point_idx,1))% &
+                      & ELEMENT_FACES(CLOSEST_FACES(data_point_idx,1))
                   ENDDO !data_point_idx
                 CASE DEFAULT
-                  CALL FLAG_ERROR("No match for data projection type found",ERR,ERROR,*999)
-              END SELECT
+                  closestEntities=CLOSEST_ELEMENTS(:,1)
+                END SELECT
+                CALL INTRO_ISORT(closestEntities,dataPointOrder,ERR,ERROR,*999)
+                DEALLOCATE(closestEntities)
+              ELSE
+                DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                  dataPointOrder(data_point_idx)=data_point_idx
+                ENDDO !data_point_idx
+              ENDIF
               !#####################################################################################################################
               !Newton project data point to the list of closest elements, faces or lines
               !project the data points to each of the closest elements, use MPI if number of computational nodes is greater than 1
@@ -1231,8 +1306,10 @@ CONTAINS
                 PROJECTED_DISTANCE(2,:)=MY_COMPUTATIONAL_NODE
                 ! find the globally closest distances in the current domain
                 DO data_point_idx=1,NUMBER_OF_DATA_POINTS
-                  CALL BUBBLE_ISORT(GLOBAL_CLOSEST_DISTANCES(data_point_idx,:),SORTING_IND_1,ERR,ERROR,*999)
-                  SORTING_IND_1(1:TOTAL_NUMBER_OF_CLOSEST_CANDIDATES)=SORTING_IND_1(1:TOTAL_NUMBER_OF_CLOSEST_CANDIDATES)- &
+                  !only the globally closest candidates are needed so select them rather than sorting all candidates
+                  CALL INTRO_ISELECT(GLOBAL_CLOSEST_DISTANCES(data_point_idx,:),REDUCED_NUMBER_OF_CLOSEST_CANDIDATES, &
+                    & SORTING_IND_1,ERR,ERROR,*999)
+                  SORTING_IND_1(1:REDUCED_NUMBER_OF_CLOSEST_CANDIDATES)=SORTING_IND_1(1:REDUCED_NUMBER_OF_CLOSEST_CANDIDATES)- &
                     & GLOBAL_MPI_DISPLACEMENTS(MY_COMPUTATIONAL_NODE+1) !shift the index to current computational node
                   GLOBAL_TO_LOCAL_NUMBER_OF_CLOSEST_CANDIDATES(data_point_idx)=0
                   DO ne=1,REDUCED_NUMBER_OF_CLOSEST_CANDIDATES
@@ -1241,11 +1318,12 @@ CONTAINS
                       & +1)))GLOBAL_TO_LOCAL_NUMBER_OF_CLOSEST_CANDIDATES(data_point_idx)= &
                       & GLOBAL_TO_LOCAL_NUMBER_OF_CLOSEST_CANDIDATES(data_point_idx)+1
                   ENDDO
-                  PROJECTED_DISTANCE(1,data_point_idx)=GLOBAL_CLOSEST_DISTANCES(data_point_idx,TOTAL_NUMBER_OF_CLOSEST_CANDIDATES) !assign initial distance to something large                           
+                  PROJECTED_DISTANCE(1,data_point_idx)=MAXVAL(GLOBAL_CLOSEST_DISTANCES(data_point_idx,:)) !assign initial distance to something large                           
                 ENDDO
                 SELECT CASE(DATA_PROJECTION%PROJECTION_TYPE)
                   CASE (DATA_PROJECTION_BOUNDARY_LINES_PROJECTION_TYPE) !Newton project to closest lines, and find miminum projection
-                    DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                    DO order_idx=1,NUMBER_OF_DATA_POINTS
+                      data_point_idx=dataPointOrder(order_idx)
                       NUMBER_OF_CLOSEST_CANDIDATES=GLOBAL_TO_LOCAL_NUMBER_OF_CLOSEST_CANDIDATES(data_point_idx)
                       IF(NUMBER_OF_CLOSEST_CANDIDATES>0) THEN 
                         CALL DATA_PROJECTION_NEWTON_LINES_EVALUATE(DATA_PROJECTION,INTERPOLATED_POINT, &
@@ -1257,9 +1335,10 @@ CONTAINS
                         PROJECTED_ELEMENT(data_point_idx)=DOMAIN%MAPPINGS%ELEMENTS%LOCAL_TO_GLOBAL_MAP(PROJECTED_ELEMENT( &
                           & data_point_idx)) !map the element number to global number
                       ENDIF
-                    ENDDO
+                    ENDDO !order_idx
                   CASE (DATA_PROJECTION_BOUNDARY_FACES_PROJECTION_TYPE) !find closest candidate faces
-                    DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                    DO order_idx=1,NUMBER_OF_DATA_POINTS
+                      data_point_idx=dataPointOrder(order_idx)
                       NUMBER_OF_CLOSEST_CANDIDATES=GLOBAL_TO_LOCAL_NUMBER_OF_CLOSEST_CANDIDATES(data_point_idx)
                       IF(NUMBER_OF_CLOSEST_CANDIDATES>0) THEN 
                         CALL DATA_PROJECTION_NEWTON_FACES_EVALUATE(DATA_PROJECTION,INTERPOLATED_POINT, &
@@ -1271,11 +1350,12 @@ CONTAINS
                         PROJECTED_ELEMENT(data_point_idx)=DOMAIN%MAPPINGS%ELEMENTS%LOCAL_TO_GLOBAL_MAP(PROJECTED_ELEMENT( &
                           & data_point_idx)) !map the element number to global number
                       ENDIF
-                    ENDDO
+                    ENDDO !order_idx
                   CASE (DATA_PROJECTION_ALL_ELEMENTS_PROJECTION_TYPE) !find closest candidate elements
                     SELECT CASE(DATA_PROJECTION%NUMBER_OF_XI)
                       CASE (1) !1D element
-                        DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                        DO order_idx=1,NUMBER_OF_DATA_POINTS
+                          data_point_idx=dataPointOrder(order_idx)
                           NUMBER_OF_CLOSEST_CANDIDATES=GLOBAL_TO_LOCAL_NUMBER_OF_CLOSEST_CANDIDATES(data_point_idx)
                           IF(NUMBER_OF_CLOSEST_CANDIDATES>0) THEN 
                             CALL DATA_PROJECTION_NEWTON_ELEMENTS_EVALUATE_1(DATA_PROJECTION,INTERPOLATED_POINT,DATA_POINTS% &
@@ -1287,9 +1367,10 @@ CONTAINS
                               & data_point_idx)) !map the element number to global number
 
                           ENDIF
-                        ENDDO
+                        ENDDO !order_idx
                       CASE (2) !2D element
-                        DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                        DO order_idx=1,NUMBER_OF_DATA_POINTS
+                          data_point_idx=dataPointOrder(order_idx)
                           NUMBER_OF_CLOSEST_CANDIDATES=GLOBAL_TO_LOCAL_NUMBER_OF_CLOSEST_CANDIDATES(data_point_idx)
                           IF(NUMBER_OF_CLOSEST_CANDIDATES>0) THEN 
                             CALL DATA_PROJECTION_NEWTON_ELEMENTS_EVALUATE_2(DATA_PROJECTION,INTERPOLATED_POINT,DATA_POINTS% &
@@ -1301,9 +1382,10 @@ CONTAINS
                             PROJECTED_ELEMENT(data_point_idx)=DOMAIN%MAPPINGS%ELEMENTS%LOCAL_TO_GLOBAL_MAP(PROJECTED_ELEMENT( &
                               & data_point_idx)) !map the element number to global number
                           ENDIF
-                        ENDDO
+                        ENDDO !order_idx
                       CASE (3) !3D element
-                        DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                        DO order_idx=1,NUMBER_OF_DATA_POINTS
+                          data_point_idx=dataPointOrder(order_idx)
                           NUMBER_OF_CLOSEST_CANDIDATES=GLOBAL_TO_LOCAL_NUMBER_OF_CLOSEST_CANDIDATES(data_point_idx)
                           IF(NUMBER_OF_CLOSEST_CANDIDATES>0) THEN 
                             CALL DATA_PROJECTION_NEWTON_ELEMENTS_EVALUATE_3(DATA_PROJECTION,INTERPOLATED_POINT,DATA_POINTS% &
@@ -1314,7 +1396,7 @@ CONTAINS
                             PROJECTED_ELEMENT(data_point_idx)=DOMAIN%MAPPINGS%ELEMENTS%LOCAL_TO_GLOBAL_MAP(PROJECTED_ELEMENT( &
                               & data_point_idx)) !map the element number to global number
                           ENDIF
-                        ENDDO
+                        ENDDO !order_idx
                       CASE DEFAULT
                         CALL FLAG_ERROR("Data projection number of xi is invalid",ERR,ERROR,*999)
                     END SELECT
@@ -1326,7 +1408,7 @@ CONTAINS
                   & COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
                 CALL MPI_ERROR_CHECK("MPI_ALLREDUCE",MPI_IERROR,ERR,ERROR,*999)
                 !sort the computational node/rank from 0 to number of computational node
-                CALL BUBBLE_ISORT(PROJECTED_DISTANCE(2,:),SORTING_IND_2,ERR,ERROR,*999)
+                CALL INTRO_ISORT(PROJECTED_DISTANCE(2,:),SORTING_IND_2,ERR,ERROR,*999)
                 DO ncn=0,(NUMBER_COMPUTATIONAL_NODES-1)
                   GLOBAL_NUMBER_OF_PROJECTED_POINTS(ncn+1)=COUNT(ABS(PROJECTED_DISTANCE(2,:)-REAL(ncn))<ZERO_TOLERANCE)
                 ENDDO !ncn
@@ -1393,7 +1475,8 @@ CONTAINS
               ELSE !no need to use mpi
                 SELECT CASE(DATA_PROJECTION%PROJECTION_TYPE)
                   CASE (DATA_PROJECTION_BOUNDARY_LINES_PROJECTION_TYPE) !Newton project to closest lines, and find miminum projection
-                    DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                    DO order_idx=1,NUMBER_OF_DATA_POINTS
+                      data_point_idx=dataPointOrder(order_idx)
                       CALL DATA_PROJECTION_NEWTON_LINES_EVALUATE(DATA_PROJECTION,INTERPOLATED_POINT,DATA_POINTS%DATA_POINTS( &
                         & data_point_idx)%position,CLOSEST_ELEMENTS(data_point_idx,:),CLOSEST_FACES(data_point_idx,:), &
                         & DATA_PROJECTION%DATA_PROJECTION_RESULTS(data_point_idx)%EXIT_TAG,DATA_PROJECTION% &
@@ -1401,9 +1484,10 @@ CONTAINS
                         & DATA_PROJECTION_RESULTS(data_point_idx)%ELEMENT_LINE_NUMBER,DATA_PROJECTION%DATA_PROJECTION_RESULTS( &
                         & data_point_idx)%DISTANCE,DATA_PROJECTION%DATA_PROJECTION_RESULTS(data_point_idx)%XI, &
                         & DATA_PROJECTION%DATA_PROJECTION_RESULTS(data_point_idx)%projectionVector,ERR,ERROR,*999)
-                    ENDDO
+                    ENDDO !order_idx
                   CASE (DATA_PROJECTION_BOUNDARY_FACES_PROJECTION_TYPE) !find closest candidate faces
-                    DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                    DO order_idx=1,NUMBER_OF_DATA_POINTS
+                      data_point_idx=dataPointOrder(order_idx)
                       CALL DATA_PROJECTION_NEWTON_FACES_EVALUATE(DATA_PROJECTION,INTERPOLATED_POINT,DATA_POINTS%DATA_POINTS( &
                         & data_point_idx)%position,CLOSEST_ELEMENTS(data_point_idx,:),CLOSEST_FACES(data_point_idx,:), &
                         & DATA_PROJECTION%DATA_PROJECTION_RESULTS(data_point_idx)%EXIT_TAG,DATA_PROJECTION% &
@@ -1411,11 +1495,12 @@ CONTAINS
                         & DATA_PROJECTION_RESULTS(data_point_idx)%ELEMENT_FACE_NUMBER,DATA_PROJECTION%DATA_PROJECTION_RESULTS( &
                         & data_point_idx)%DISTANCE,DATA_PROJECTION%DATA_PROJECTION_RESULTS(data_point_idx)%XI, &
                         & DATA_PROJECTION%DATA_PROJECTION_RESULTS(data_point_idx)%projectionVector,ERR,ERROR,*999)
-                    ENDDO
+                    ENDDO !order_idx
                   CASE (DATA_PROJECTION_ALL_ELEMENTS_PROJECTION_TYPE) !find closest candidate elements        
                     SELECT CASE(DATA_PROJECTION%NUMBER_OF_XI)
                       CASE (1) !1D mesh
-                        DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                        DO order_idx=1,NUMBER_OF_DATA_POINTS
+                          data_point_idx=dataPointOrder(order_idx)
                           CALL DATA_PROJECTION_NEWTON_ELEMENTS_EVALUATE_1(DATA_PROJECTION,INTERPOLATED_POINT,DATA_POINTS% &
                             & DATA_POINTS(data_point_idx)%position,CLOSEST_ELEMENTS(data_point_idx,:),DATA_PROJECTION% &
                             & DATA_PROJECTION_RESULTS(data_point_idx)%EXIT_TAG,DATA_PROJECTION%DATA_PROJECTION_RESULTS( &
@@ -1423,9 +1508,10 @@ CONTAINS
                             & DATA_PROJECTION%DATA_PROJECTION_RESULTS(data_point_idx)%XI, &
                             & DATA_PROJECTION%DATA_PROJECTION_RESULTS(data_point_idx)%projectionVector,&
                             & ERR,ERROR,*999)
-                        ENDDO
+                        ENDDO !order_idx
                       CASE (2) !2D mesh
-                        DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                        DO order_idx=1,NUMBER_OF_DATA_POINTS
+                          data_point_idx=dataPointOrder(order_idx)
                           CALL DATA_PROJECTION_NEWTON_ELEMENTS_EVALUATE_2(DATA_PROJECTION,INTERPOLATED_POINT,DATA_POINTS% &
                             & DATA_POINTS(data_point_idx)%position,CLOSEST_ELEMENTS(data_point_idx,:),DATA_PROJECTION% &
                             & DATA_PROJECTION_RESULTS(data_point_idx)%EXIT_TAG,DATA_PROJECTION%DATA_PROJECTION_RESULTS( &
@@ -1433,9 +1519,10 @@ CONTAINS
                             & DATA_PROJECTION%DATA_PROJECTION_RESULTS(data_point_idx)%XI, &
                             & DATA_PROJECTION%DATA_PROJECTION_RESULTS(data_point_idx)%projectionVector, &
 			    & ERR,ERROR,*999)
-                        ENDDO
+                        ENDDO !order_idx
                       CASE (3) !3D mesh
-                        DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+                        DO order_idx=1,NUMBER_OF_DATA_POINTS
+                          data_point_idx=dataPointOrder(order_idx)
                           CALL DATA_PROJECTION_NEWTON_ELEMENTS_EVALUATE_3(DATA_PROJECTION,INTERPOLATED_POINT,DATA_POINTS% &
                             & DATA_POINTS(data_point_idx)%position,CLOSEST_ELEMENTS(data_point_idx,:),DATA_PROJECTION% &
                             & DATA_PROJECTION_RESULTS(data_point_idx)%EXIT_TAG,DATA_PROJECTION%DATA_PROJECTION_RESULTS( &
@@ -1443,7 +1530,7 @@ CONTAINS
                             & DATA_PROJECTION%DATA_PROJECTION_RESULTS(data_point_idx)%XI, &
                             & DATA_PROJECTION%DATA_PROJECTION_RESULTS(data_point_idx)%projectionVector, &
  			    & ERR,ERROR,*999)
-                        ENDDO
+                        ENDDO !order_idx
                       CASE DEFAULT
                         CALL FLAG_ERROR("Data projection number of xi is invalid",ERR,ERROR,*999)
                     END SELECT !DATA_PROJECTION%NUMBER_OF_XI
@@ -1451,6 +1538,14 @@ CONTAINS
                     CALL FLAG_ERROR("No match for data projection type found",ERR,ERROR,*999)
                 END SELECT                  
               ENDIF !NUMBER_COMPUTATIONAL_NODES>1
+              IF(ASSOCIATED(DATA_PROJECTION%parametersCache)) THEN
+                DATA_PROJECTION%parametersCacheHits=DATA_PROJECTION%parametersCache%numberOfHits
+                DATA_PROJECTION%parametersCacheMisses=DATA_PROJECTION%parametersCache%numberOfMisses
+                CALL DataProjection_ParametersCacheFinalise(DATA_PROJECTION%parametersCache,ERR,ERROR,*999)
+              ELSE
+                DATA_PROJECTION%parametersCacheHits=0
+                DATA_PROJECTION%parametersCacheMisses=0
+              ENDIF
               DATA_PROJECTION%DATA_PROJECTION_PROJECTED=.TRUE.
             ELSE
               CALL FLAG_ERROR("Data projection and projection field are not sharing the same mesh.",ERR,ERROR,*999)
@@ -1472,6 +1567,9 @@ CONTAINS
     IF(ALLOCATED(CANDIDATE_ELEMENTS)) DEALLOCATE(CANDIDATE_ELEMENTS)
     IF(ALLOCATED(CANDIDATE_FACES)) DEALLOCATE(CANDIDATE_FACES)
     IF(ALLOCATED(CLOSEST_ELEMENTS)) DEALLOCATE(CLOSEST_ELEMENTS)
+    IF(ALLOCATED(CLOSEST_CANDIDATES)) DEALLOCATE(CLOSEST_CANDIDATES)
+    IF(ALLOCATED(closestEntities)) DEALLOCATE(closestEntities)
+    IF(ALLOCATED(dataPointOrder)) DEALLOCATE(dataPointOrder)
     IF(ALLOCATED(CLOSEST_FACES)) DEALLOCATE(CLOSEST_FACES)
     IF(ALLOCATED(CLOSEST_DISTANCES)) DEALLOCATE(CLOSEST_DISTANCES)
     IF(ALLOCATED(GLOBAL_TO_LOCAL_NUMBER_OF_CLOSEST_CANDIDATES)) DEALLOCATE(GLOBAL_TO_LOCAL_NUMBER_OF_CLOSEST_CANDIDATES)
@@ -1493,6 +1591,9 @@ CONTAINS
 999 IF(ALLOCATED(CANDIDATE_ELEMENTS)) DEALLOCATE(CANDIDATE_ELEMENTS)
     IF(ALLOCATED(CANDIDATE_FACES)) DEALLOCATE(CANDIDATE_FACES)
     IF(ALLOCATED(CLOSEST_ELEMENTS)) DEALLOCATE(CLOSEST_ELEMENTS)
+    IF(ALLOCATED(CLOSEST_CANDIDATES)) DEALLOCATE(CLOSEST_CANDIDATES)
+    IF(ALLOCATED(closestEntities)) DEALLOCATE(closestEntities)
+    IF(ALLOCATED(dataPointOrder)) DEALLOCATE(dataPointOrder)
     IF(ALLOCATED(CLOSEST_FACES)) DEALLOCATE(CLOSEST_FACES)
     IF(ALLOCATED(CLOSEST_DISTANCES)) DEALLOCATE(CLOSEST_DISTANCES)
     IF(ALLOCATED(GLOBAL_TO_LOCAL_NUMBER_OF_CLOSEST_CANDIDATES)) DEALLOCATE(GLOBAL_TO_LOCAL_NUMBER_OF_CLOSEST_CANDIDATES)
@@ -1508,6 +1609,8 @@ CONTAINS
     IF(ALLOCATED(SORTING_IND_2)) DEALLOCATE(SORTING_IND_2)
     IF(ALLOCATED(GLOBAL_CLOSEST_DISTANCES)) DEALLOCATE(GLOBAL_CLOSEST_DISTANCES)
     IF(ALLOCATED(SORTING_IND_1)) DEALLOCATE(SORTING_IND_1)
+    IF(ASSOCIATED(DATA_PROJECTION)) &
+      & CALL DataProjection_ParametersCacheFinalise(DATA_PROJECTION%parametersCache,dummyErr,dummyError,*998)
 998 ERRORSEXITS("DataProjection_DataPointsProjectionEvaluate",ERR,ERROR)
     RETURN 1
 
@@ -1768,8 +1871,8 @@ CONTAINS
           EXIT_TAG=DATA_PROJECTION_EXIT_TAG_NO_ELEMENT
           CONVERGED=.FALSE.
           DELTA=0.5_DP*MAXIMUM_DELTA !start at half the MAXIMUM_DELTA as we do not know if quadratic model is a good approximation yet
-          CALL FIELD_INTERPOLATION_PARAMETERS_ELEMENT_GET(FIELD_VALUES_SET_TYPE,ELEMENT_NUMBER,INTERPOLATED_POINT% &
-            & INTERPOLATION_PARAMETERS,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
+          CALL DataProjection_ParametersCacheGet(DATA_PROJECTION,FIELD_VALUES_SET_TYPE,ELEMENT_NUMBER, &
+            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999)
           XI=DATA_PROJECTION%STARTING_XI
           CALL FIELD_INTERPOLATE_XI(SECOND_PART_DERIV,XI,INTERPOLATED_POINT,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
           DISTANCE_VECTOR(1:REGION_DIMENSIONS)=POINT_VALUES-INTERPOLATED_POINT%VALUES(:,NO_PART_DERIV)
@@ -1929,8 +2032,8 @@ CONTAINS
           EXIT_TAG=DATA_PROJECTION_EXIT_TAG_NO_ELEMENT
           CONVERGED=.FALSE.
           DELTA=0.5_DP*MAXIMUM_DELTA !start at half the MAXIMUM_DELTA as we do not know if quadratic model is a good approximation yet            
-          CALL FIELD_INTERPOLATION_PARAMETERS_ELEMENT_GET(FIELD_VALUES_SET_TYPE,ELEMENT_NUMBER, &
-            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
+          CALL DataProjection_ParametersCacheGet(DATA_PROJECTION,FIELD_VALUES_SET_TYPE,ELEMENT_NUMBER, &
+            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999)
           XI=DATA_PROJECTION%STARTING_XI
           CALL FIELD_INTERPOLATE_XI(SECOND_PART_DERIV,XI,INTERPOLATED_POINT,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
           DISTANCE_VECTOR(1:REGION_DIMENSIONS)=POINT_VALUES-INTERPOLATED_POINT%VALUES(:,NO_PART_DERIV)
@@ -2143,8 +2246,8 @@ CONTAINS
           EXIT_TAG=DATA_PROJECTION_EXIT_TAG_NO_ELEMENT
           CONVERGED=.FALSE.
           DELTA=0.5_DP*MAXIMUM_DELTA !start at half the MAXIMUM_DELTA as we do not know if quadratic model is a good approximation yet            
-          CALL FIELD_INTERPOLATION_PARAMETERS_ELEMENT_GET(FIELD_VALUES_SET_TYPE,ELEMENT_NUMBER, &
-            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
+          CALL DataProjection_ParametersCacheGet(DATA_PROJECTION,FIELD_VALUES_SET_TYPE,ELEMENT_NUMBER, &
+            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999)
           XI=DATA_PROJECTION%STARTING_XI
           CALL FIELD_INTERPOLATE_XI(SECOND_PART_DERIV,XI,INTERPOLATED_POINT,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
           DISTANCE_VECTOR=POINT_VALUES-INTERPOLATED_POINT%VALUES(:,NO_PART_DERIV)
@@ -2466,8 +2569,8 @@ CONTAINS
           EXIT_TAG=DATA_PROJECTION_EXIT_TAG_NO_ELEMENT
           CONVERGED=.FALSE.
           DELTA=0.5_DP*MAXIMUM_DELTA !start at half the MAXIMUM_DELTA as we do not know if quadratic model is a good approximation yet            
-          CALL FIELD_INTERPOLATION_PARAMETERS_FACE_GET(FIELD_VALUES_SET_TYPE,FACE_NUMBER, &
-            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
+          CALL DataProjection_ParametersCacheGet(DATA_PROJECTION,FIELD_VALUES_SET_TYPE,FACE_NUMBER, &
+            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999)
           XI=DATA_PROJECTION%STARTING_XI
           CALL FIELD_INTERPOLATE_XI(SECOND_PART_DERIV,XI,INTERPOLATED_POINT,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
           DISTANCE_VECTOR(1:REGION_DIMENSIONS)=POINT_VALUES-INTERPOLATED_POINT%VALUES(:,NO_PART_DERIV)
@@ -2687,8 +2790,8 @@ CONTAINS
           EXIT_TAG=DATA_PROJECTION_EXIT_TAG_NO_ELEMENT
           CONVERGED=.FALSE.
           DELTA=0.5_DP*MAXIMUM_DELTA !start at half the MAXIMUM_DELTA as we do not know if quadratic model is a good approximation yet
-          CALL FIELD_INTERPOLATION_PARAMETERS_LINE_GET(FIELD_VALUES_SET_TYPE,LINE_NUMBER,INTERPOLATED_POINT% &
-            & INTERPOLATION_PARAMETERS,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
+          CALL DataProjection_ParametersCacheGet(DATA_PROJECTION,FIELD_VALUES_SET_TYPE,LINE_NUMBER, &
+            & INTERPOLATED_POINT%INTERPOLATION_PARAMETERS,ERR,ERROR,*999)
           XI=DATA_PROJECTION%STARTING_XI
           CALL FIELD_INTERPOLATE_XI(SECOND_PART_DERIV,XI,INTERPOLATED_POINT,ERR,ERROR,*999,FIELD_GEOMETRIC_COMPONENTS_TYPE)
           DISTANCE_VECTOR(1:REGION_DIMENSIONS)=POINT_VALUES-INTERPOLATED_POINT%VALUES(:,NO_PART_DERIV)
@@ -2862,6 +2965,321 @@ CONTAINS
     RETURN 1
 
   END SUBROUTINE DataProjection_NumberOfClosestElementsSet
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Creates the interpolation parameters cache for a data projection evaluation. The number of cache entries is limited so that the cache uses no more than DATA_PROJECTION_PARAMETERS_CACHE_MEMORY bytes.
+  SUBROUTINE DataProjection_ParametersCacheCreate(dataProjection,interpolationParameters,parameterSetType,err,error,*)
+
+    !Argument variables
+    TYPE(DATA_PROJECTION_TYPE), POINTER :: dataProjection !<A pointer to the data projection to create the parameters cache for
+    TYPE(FIELD_INTERPOLATION_PARAMETERS_TYPE), POINTER :: interpolationParameters !<A pointer to the interpolation parameters of the projection field the cached parameters are retrieved into
+    INTEGER(INTG), INTENT(IN) :: parameterSetType !<The field parameter set type of the parameters to cache
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    INTEGER(INTG) :: dummyErr,entryBytes,numberOfEntities,numberOfParameterArrays
+    TYPE(DataProjectionParametersCacheType), POINTER :: parametersCache
+    TYPE(DECOMPOSITION_TOPOLOGY_TYPE), POINTER :: decompositionTopology
+    TYPE(VARYING_STRING) :: dummyError
+
+    ENTERS("DataProjection_ParametersCacheCreate",err,error,*998)
+
+    IF(ASSOCIATED(dataProjection)) THEN
+      IF(ASSOCIATED(interpolationParameters)) THEN
+        CALL DataProjection_ParametersCacheFinalise(dataProjection%parametersCache,err,error,*999)
+        decompositionTopology=>interpolationParameters%FIELD%DECOMPOSITION%TOPOLOGY
+        SELECT CASE(dataProjection%PROJECTION_TYPE)
+        CASE(DATA_PROJECTION_BOUNDARY_LINES_PROJECTION_TYPE)
+          numberOfEntities=decompositionTopology%LINES%NUMBER_OF_LINES
+        CASE(DATA_PROJECTION_BOUNDARY_FACES_PROJECTION_TYPE)
+          numberOfEntities=decompositionTopology%FACES%NUMBER_OF_FACES
+        CASE(DATA_PROJECTION_ALL_ELEMENTS_PROJECTION_TYPE)
+          numberOfEntities=decompositionTopology%ELEMENTS%TOTAL_NUMBER_OF_ELEMENTS
+        CASE DEFAULT
+          CALL FLAG_ERROR("No match for data projection type found",err,error,*998)
+        END SELECT
+        ALLOCATE(dataProjection%parametersCache,STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate data projection parameters cache.",err,error,*999)
+        parametersCache=>dataProjection%parametersCache
+        parametersCache%field=>interpolationParameters%FIELD
+        parametersCache%parameterSetType=parameterSetType
+        parametersCache%projectionType=dataProjection%PROJECTION_TYPE
+        parametersCache%numberOfComponents=SIZE(interpolationParameters%PARAMETERS,2)
+        parametersCache%maximumNumberOfParameters=SIZE(interpolationParameters%PARAMETERS,1)
+        parametersCache%numberOfEntries=0
+        parametersCache%mostRecentEntry=0
+        parametersCache%leastRecentEntry=0
+        parametersCache%numberOfHits=0
+        parametersCache%numberOfMisses=0
+        !Limit the number of entries by the memory used by the parameters, scale factors, bases and entry bookkeeping
+        numberOfParameterArrays=1
+        IF(ALLOCATED(interpolationParameters%SCALE_FACTORS)) numberOfParameterArrays=2
+        entryBytes=parametersCache%numberOfComponents*(numberOfParameterArrays*parametersCache%maximumNumberOfParameters*8+12)+20
+        parametersCache%maximumNumberOfEntries=MAX(MIN(numberOfEntities,DATA_PROJECTION_PARAMETERS_CACHE_MEMORY/entryBytes),1)
+        ALLOCATE(parametersCache%entryNumbers(numberOfEntities),STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate parameters cache entry numbers.",err,error,*999)
+        parametersCache%entryNumbers=0
+        ALLOCATE(parametersCache%entityNumbers(parametersCache%maximumNumberOfEntries),STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate parameters cache entity numbers.",err,error,*999)
+        ALLOCATE(parametersCache%previousEntries(parametersCache%maximumNumberOfEntries),STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate parameters cache previous entries.",err,error,*999)
+        ALLOCATE(parametersCache%nextEntries(parametersCache%maximumNumberOfEntries),STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate parameters cache next entries.",err,error,*999)
+        ALLOCATE(parametersCache%numberOfXi(parametersCache%maximumNumberOfEntries),STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate parameters cache number of xi.",err,error,*999)
+        ALLOCATE(parametersCache%bases(parametersCache%numberOfComponents,parametersCache%maximumNumberOfEntries),STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate parameters cache bases.",err,error,*999)
+        ALLOCATE(parametersCache%numberOfParameters(parametersCache%numberOfComponents,parametersCache%maximumNumberOfEntries), &
+          & STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate parameters cache number of parameters.",err,error,*999)
+        ALLOCATE(parametersCache%parameters(parametersCache%maximumNumberOfParameters,parametersCache%numberOfComponents, &
+          & parametersCache%maximumNumberOfEntries),STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate parameters cache parameters.",err,error,*999)
+        IF(ALLOCATED(interpolationParameters%SCALE_FACTORS)) THEN
+          ALLOCATE(parametersCache%scaleFactors(parametersCache%maximumNumberOfParameters,parametersCache%numberOfComponents, &
+            & parametersCache%maximumNumberOfEntries),STAT=err)
+          IF(err/=0) CALL FLAG_ERROR("Could not allocate parameters cache scale factors.",err,error,*999)
+        ENDIF
+      ELSE
+        CALL FLAG_ERROR("Interpolation parameters is not associated.",err,error,*998)
+      ENDIF
+    ELSE
+      CALL FLAG_ERROR("Data projection is not associated.",err,error,*998)
+    ENDIF
+
+    EXITS("DataProjection_ParametersCacheCreate")
+    RETURN
+999 CALL DataProjection_ParametersCacheFinalise(dataProjection%parametersCache,dummyErr,dummyError,*998)
+998 ERRORSEXITS("DataProjection_ParametersCacheCreate",err,error)
+    RETURN 1
+
+  END SUBROUTINE DataProjection_ParametersCacheCreate
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Finalises a data projection interpolation parameters cache and deallocates all memory.
+  SUBROUTINE DataProjection_ParametersCacheFinalise(parametersCache,err,error,*)
+
+    !Argument variables
+    TYPE(DataProjectionParametersCacheType), POINTER :: parametersCache !<A pointer to the parameters cache to finalise
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+
+    ENTERS("DataProjection_ParametersCacheFinalise",err,error,*999)
+
+    IF(ASSOCIATED(parametersCache)) THEN
+      IF(ALLOCATED(parametersCache%entryNumbers)) DEALLOCATE(parametersCache%entryNumbers)
+      IF(ALLOCATED(parametersCache%entityNumbers)) DEALLOCATE(parametersCache%entityNumbers)
+      IF(ALLOCATED(parametersCache%previousEntries)) DEALLOCATE(parametersCache%previousEntries)
+      IF(ALLOCATED(parametersCache%nextEntries)) DEALLOCATE(parametersCache%nextEntries)
+      IF(ALLOCATED(parametersCache%numberOfXi)) DEALLOCATE(parametersCache%numberOfXi)
+      IF(ALLOCATED(parametersCache%bases)) DEALLOCATE(parametersCache%bases)
+      IF(ALLOCATED(parametersCache%numberOfParameters)) DEALLOCATE(parametersCache%numberOfParameters)
+      IF(ALLOCATED(parametersCache%parameters)) DEALLOCATE(parametersCache%parameters)
+      IF(ALLOCATED(parametersCache%scaleFactors)) DEALLOCATE(parametersCache%scaleFactors)
+      DEALLOCATE(parametersCache)
+    ENDIF
+
+    EXITS("DataProjection_ParametersCacheFinalise")
+    RETURN
+999 ERRORSEXITS("DataProjection_ParametersCacheFinalise",err,error)
+    RETURN 1
+
+  END SUBROUTINE DataProjection_ParametersCacheFinalise
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Gets the interpolation parameters of an element/face/line for a data projection evaluation. The parameters are copied from the parameters cache if they are cached, otherwise they are retrieved from the field and added to the cache in place of the least recently used entry. The cache is bypassed if the field or parameter set are not the ones cached.
+  SUBROUTINE DataProjection_ParametersCacheGet(dataProjection,parameterSetType,entityNumber,interpolationParameters,err,error,*)
+
+    !Argument variables
+    TYPE(DATA_PROJECTION_TYPE), POINTER :: dataProjection !<A pointer to the data projection being evaluated
+    INTEGER(INTG), INTENT(IN) :: parameterSetType !<The field parameter set type to get the parameters for
+    INTEGER(INTG), INTENT(IN) :: entityNumber !<The local element number, or the decomposition face/line number for boundary projections, to get the parameters for
+    TYPE(FIELD_INTERPOLATION_PARAMETERS_TYPE), POINTER :: interpolationParameters !<A pointer to the interpolation parameters to get the parameters into
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    INTEGER(INTG) :: componentIdx,entryIdx,nextEntry,numberOfComponents,previousEntry
+    LOGICAL :: cached
+    TYPE(DataProjectionParametersCacheType), POINTER :: parametersCache
+
+    ENTERS("DataProjection_ParametersCacheGet",err,error,*999)
+
+    IF(ASSOCIATED(dataProjection)) THEN
+      IF(ASSOCIATED(interpolationParameters)) THEN
+        parametersCache=>dataProjection%parametersCache
+        cached=.FALSE.
+        IF(ASSOCIATED(parametersCache)) cached=ASSOCIATED(parametersCache%field,interpolationParameters%FIELD).AND. &
+          & parametersCache%parameterSetType==parameterSetType.AND.entityNumber>=1.AND. &
+          & entityNumber<=SIZE(parametersCache%entryNumbers,1)
+        entryIdx=0
+        IF(cached) entryIdx=parametersCache%entryNumbers(entityNumber)
+        IF(entryIdx/=0) THEN
+          !Move the entry to the front of the recently used list and copy the cached parameters
+          parametersCache%numberOfHits=parametersCache%numberOfHits+1
+          IF(entryIdx/=parametersCache%mostRecentEntry) THEN
+            previousEntry=parametersCache%previousEntries(entryIdx)
+            nextEntry=parametersCache%nextEntries(entryIdx)
+            parametersCache%nextEntries(previousEntry)=nextEntry
+            IF(nextEntry==0) THEN
+              parametersCache%leastRecentEntry=previousEntry
+            ELSE
+              parametersCache%previousEntries(nextEntry)=previousEntry
+            ENDIF
+            parametersCache%previousEntries(entryIdx)=0
+            parametersCache%nextEntries(entryIdx)=parametersCache%mostRecentEntry
+            parametersCache%previousEntries(parametersCache%mostRecentEntry)=entryIdx
+            parametersCache%mostRecentEntry=entryIdx
+          ENDIF
+          numberOfComponents=parametersCache%numberOfComponents
+          interpolationParameters%NUMBER_OF_XI=parametersCache%numberOfXi(entryIdx)
+          DO componentIdx=1,numberOfComponents
+            interpolationParameters%BASES(componentIdx)%PTR=>parametersCache%bases(componentIdx,entryIdx)%PTR
+          ENDDO !componentIdx
+          interpolationParameters%NUMBER_OF_PARAMETERS(1:numberOfComponents)= &
+            & parametersCache%numberOfParameters(:,entryIdx)
+          interpolationParameters%PARAMETERS(:,1:numberOfComponents)=parametersCache%parameters(:,:,entryIdx)
+          IF(ALLOCATED(parametersCache%scaleFactors)) &
+            & interpolationParameters%SCALE_FACTORS(:,1:numberOfComponents)=parametersCache%scaleFactors(:,:,entryIdx)
+        ELSE
+          SELECT CASE(dataProjection%PROJECTION_TYPE)
+          CASE(DATA_PROJECTION_BOUNDARY_LINES_PROJECTION_TYPE)
+            CALL FIELD_INTERPOLATION_PARAMETERS_LINE_GET(parameterSetType,entityNumber,interpolationParameters,err,error,*999, &
+              & FIELD_GEOMETRIC_COMPONENTS_TYPE)
+          CASE(DATA_PROJECTION_BOUNDARY_FACES_PROJECTION_TYPE)
+            CALL FIELD_INTERPOLATION_PARAMETERS_FACE_GET(parameterSetType,entityNumber,interpolationParameters,err,error,*999, &
+              & FIELD_GEOMETRIC_COMPONENTS_TYPE)
+          CASE(DATA_PROJECTION_ALL_ELEMENTS_PROJECTION_TYPE)
+            CALL FIELD_INTERPOLATION_PARAMETERS_ELEMENT_GET(parameterSetType,entityNumber,interpolationParameters,err,error,*999, &
+              & FIELD_GEOMETRIC_COMPONENTS_TYPE)
+          CASE DEFAULT
+            CALL FLAG_ERROR("No match for data projection type found",err,error,*999)
+          END SELECT
+          IF(cached) THEN
+            !Add the parameters to the cache, evicting the least recently used entry if the cache is full
+            parametersCache%numberOfMisses=parametersCache%numberOfMisses+1
+            IF(parametersCache%numberOfEntries<parametersCache%maximumNumberOfEntries) THEN
+              parametersCache%numberOfEntries=parametersCache%numberOfEntries+1
+              entryIdx=parametersCache%numberOfEntries
+            ELSE
+              entryIdx=parametersCache%leastRecentEntry
+              parametersCache%entryNumbers(parametersCache%entityNumbers(entryIdx))=0
+              parametersCache%leastRecentEntry=parametersCache%previousEntries(entryIdx)
+              IF(parametersCache%leastRecentEntry==0) THEN
+                parametersCache%mostRecentEntry=0
+              ELSE
+                parametersCache%nextEntries(parametersCache%leastRecentEntry)=0
+              ENDIF
+            ENDIF
+            parametersCache%previousEntries(entryIdx)=0
+            parametersCache%nextEntries(entryIdx)=parametersCache%mostRecentEntry
+            IF(parametersCache%mostRecentEntry/=0) parametersCache%previousEntries(parametersCache%mostRecentEntry)=entryIdx
+            parametersCache%mostRecentEntry=entryIdx
+            IF(parametersCache%leastRecentEntry==0) parametersCache%leastRecentEntry=entryIdx
+            parametersCache%entryNumbers(entityNumber)=entryIdx
+            parametersCache%entityNumbers(entryIdx)=entityNumber
+            numberOfComponents=parametersCache%numberOfComponents
+            parametersCache%numberOfXi(entryIdx)=interpolationParameters%NUMBER_OF_XI
+            DO componentIdx=1,numberOfComponents
+              parametersCache%bases(componentIdx,entryIdx)%PTR=>interpolationParameters%BASES(componentIdx)%PTR
+            ENDDO !componentIdx
+            parametersCache%numberOfParameters(:,entryIdx)= &
+              & interpolationParameters%NUMBER_OF_PARAMETERS(1:numberOfComponents)
+            parametersCache%parameters(:,:,entryIdx)=interpolationParameters%PARAMETERS(:,1:numberOfComponents)
+            IF(ALLOCATED(parametersCache%scaleFactors)) &
+              & parametersCache%scaleFactors(:,:,entryIdx)=interpolationParameters%SCALE_FACTORS(:,1:numberOfComponents)
+          ENDIF
+        ENDIF
+      ELSE
+        CALL FLAG_ERROR("Interpolation parameters is not associated.",err,error,*999)
+      ENDIF
+    ELSE
+      CALL FLAG_ERROR("Data projection is not associated.",err,error,*999)
+    ENDIF
+
+    EXITS("DataProjection_ParametersCacheGet")
+    RETURN
+999 ERRORSEXITS("DataProjection_ParametersCacheGet",err,error)
+    RETURN 1
+
+  END SUBROUTINE DataProjection_ParametersCacheGet
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets whether the interpolation parameters are cached during the evaluation of a data projection. The cache is enabled by default. \see OPENCMISS::Iron::cmfe_DataProjection_ParametersCacheEnabledSet
+  SUBROUTINE DataProjection_ParametersCacheEnabledSet(dataProjection,cacheEnabled,err,error,*)
+
+    !Argument variables
+    TYPE(DATA_PROJECTION_TYPE), POINTER :: dataProjection !<A pointer to the data projection to set the parameters cache for
+    LOGICAL, INTENT(IN) :: cacheEnabled !<.TRUE. if the interpolation parameters are to be cached, .FALSE. if not
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+
+    ENTERS("DataProjection_ParametersCacheEnabledSet",err,error,*999)
+
+    IF(ASSOCIATED(dataProjection)) THEN
+      dataProjection%parametersCacheEnabled=cacheEnabled
+    ELSE
+      CALL FLAG_ERROR("Data projection is not associated.",err,error,*999)
+    ENDIF
+
+    EXITS("DataProjection_ParametersCacheEnabledSet")
+    RETURN
+999 ERRORSEXITS("DataProjection_ParametersCacheEnabledSet",err,error)
+    RETURN 1
+
+  END SUBROUTINE DataProjection_ParametersCacheEnabledSet
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Gets the number of interpolation parameter retrievals that were and were not found in the parameters cache during the last evaluation of a data projection. \see OPENCMISS::Iron::cmfe_DataProjection_ParametersCacheStatisticsGet
+  SUBROUTINE DataProjection_ParametersCacheStatisticsGet(dataProjection,numberOfHits,numberOfMisses,err,error,*)
+
+    !Argument variables
+    TYPE(DATA_PROJECTION_TYPE), POINTER :: dataProjection !<A pointer to the data projection to get the parameters cache statistics for
+    INTEGER(INTG), INTENT(OUT) :: numberOfHits !<On exit, the number of interpolation parameter retrievals found in the cache
+    INTEGER(INTG), INTENT(OUT) :: numberOfMisses !<On exit, the number of interpolation parameter retrievals not found in the cache
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+
+    ENTERS("DataProjection_ParametersCacheStatisticsGet",err,error,*999)
+
+    IF(ASSOCIATED(dataProjection)) THEN
+      IF(dataProjection%DATA_PROJECTION_FINISHED) THEN
+        IF(dataProjection%DATA_PROJECTION_PROJECTED) THEN
+          numberOfHits=dataProjection%parametersCacheHits
+          numberOfMisses=dataProjection%parametersCacheMisses
+        ELSE
+          CALL FLAG_ERROR("Data projection have not been projected.",err,error,*999)
+        ENDIF
+      ELSE
+        CALL FLAG_ERROR("Data projection have not been finished.",err,error,*999)
+      ENDIF
+    ELSE
+      CALL FLAG_ERROR("Data projection is not associated.",err,error,*999)
+    ENDIF
+
+    EXITS("DataProjection_ParametersCacheStatisticsGet")
+    RETURN
+999 ERRORSEXITS("DataProjection_ParametersCacheStatisticsGet",err,error)
+    RETURN 1
+
+  END SUBROUTINE DataProjection_ParametersCacheStatisticsGet
   
   !
   !================================================================================================================================
@@ -3079,7 +3497,395 @@ CONTAINS
     RETURN 1
 
   END SUBROUTINE DATA_PROJECTION_RELATIVE_TOLERANCE_SET
-  
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Finds the closest candidates to a data point using the spatial index of a data projection. The grid cells are searched in rings of increasing size around the cell containing the data point until no unsearched cell can hold a closer candidate. The closest candidates are sorted by increasing distance with ties in candidate order, i.e., they are the same candidates as found by evaluating the distance to every candidate.
+  SUBROUTINE DataProjection_SpatialIndexClosestFind(spatialIndex,pointValues,closestCandidates,closestDistances,err,error,*)
+
+    !Argument variables
+    TYPE(DataProjectionSpatialIndexType), POINTER :: spatialIndex !<A pointer to the spatial index to search
+    REAL(DP), INTENT(IN) :: pointValues(:) !<The position of the data point to find the closest candidates for
+    INTEGER(INTG), INTENT(OUT) :: closestCandidates(:) !<closestCandidates(closestIdx). On exit, the indices of the closest candidates
+    REAL(DP), INTENT(OUT) :: closestDistances(:) !<closestDistances(closestIdx). On exit, the squared distances to the closest candidates
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    INTEGER(INTG) :: candidateIdx,cellIdx,coordinateIdx,idx,insertIdx,numberOfClosestCandidates,numberOfFoundCandidates, &
+      & ringIdx,xIdx,xStep,yIdx,zIdx
+    INTEGER(INTG) :: highCell(3),lowCell(3),pointCell(3)
+    REAL(DP) :: boundaryDistance,distance2,distanceVector(3)
+    LOGICAL :: gridSearched
+
+    ENTERS("DataProjection_SpatialIndexClosestFind",err,error,*999)
+
+    IF(ASSOCIATED(spatialIndex)) THEN
+      numberOfClosestCandidates=MIN(SIZE(closestCandidates,1),spatialIndex%numberOfCandidates)
+      IF(numberOfClosestCandidates>0) THEN
+        !Find the grid cell containing the data point. Points outside the grid are moved to the closest cell.
+        pointCell=0
+        DO coordinateIdx=1,spatialIndex%numberOfDimensions
+          pointCell(coordinateIdx)=INT(MIN(MAX((pointValues(coordinateIdx)-spatialIndex%minimumBounds(coordinateIdx))/ &
+            & spatialIndex%cellSize(coordinateIdx),0.0_DP),REAL(spatialIndex%numberOfCells(coordinateIdx)-1,DP)))
+        ENDDO !coordinateIdx
+        numberOfFoundCandidates=0
+        ringIdx=0
+        DO
+          lowCell=MAX(pointCell-ringIdx,0)
+          highCell=MIN(pointCell+ringIdx,spatialIndex%numberOfCells-1)
+          !Search the cells in the ring at a distance of ringIdx cells from the data point cell
+          DO zIdx=lowCell(3),highCell(3)
+            DO yIdx=lowCell(2),highCell(2)
+              IF(ABS(zIdx-pointCell(3))==ringIdx.OR.ABS(yIdx-pointCell(2))==ringIdx) THEN
+                xStep=1
+              ELSE
+                xStep=2*ringIdx
+              ENDIF
+              DO xIdx=pointCell(1)-ringIdx,pointCell(1)+ringIdx,xStep
+                IF(xIdx<lowCell(1).OR.xIdx>highCell(1)) CYCLE
+                cellIdx=1+xIdx+spatialIndex%numberOfCells(1)*(yIdx+spatialIndex%numberOfCells(2)*zIdx)
+                DO idx=spatialIndex%cellCandidatesStart(cellIdx),spatialIndex%cellCandidatesStart(cellIdx+1)-1
+                  candidateIdx=spatialIndex%cellCandidates(idx)
+                  distanceVector(1:spatialIndex%numberOfDimensions)=pointValues(1:spatialIndex%numberOfDimensions)- &
+                    & spatialIndex%candidatePoints(:,candidateIdx)
+                  distance2=DOT_PRODUCT(distanceVector(1:spatialIndex%numberOfDimensions), &
+                    & distanceVector(1:spatialIndex%numberOfDimensions))
+                  IF(numberOfFoundCandidates<numberOfClosestCandidates) THEN
+                    numberOfFoundCandidates=numberOfFoundCandidates+1
+                    insertIdx=numberOfFoundCandidates
+                  ELSE IF(distance2<closestDistances(numberOfClosestCandidates).OR. &
+                    & (distance2==closestDistances(numberOfClosestCandidates).AND. &
+                    & candidateIdx<closestCandidates(numberOfClosestCandidates))) THEN
+                    insertIdx=numberOfClosestCandidates
+                  ELSE
+                    CYCLE
+                  ENDIF
+                  !Insert the candidate into the correct position
+                  DO WHILE(insertIdx>1)
+                    IF(closestDistances(insertIdx-1)<distance2.OR.(closestDistances(insertIdx-1)==distance2.AND. &
+                      & closestCandidates(insertIdx-1)<candidateIdx)) EXIT
+                    closestDistances(insertIdx)=closestDistances(insertIdx-1)
+                    closestCandidates(insertIdx)=closestCandidates(insertIdx-1)
+                    insertIdx=insertIdx-1
+                  ENDDO
+                  closestDistances(insertIdx)=distance2
+                  closestCandidates(insertIdx)=candidateIdx
+                ENDDO !idx
+              ENDDO !xIdx
+            ENDDO !yIdx
+          ENDDO !zIdx
+          !Find the distance from the data point to the closest unsearched cell
+          gridSearched=.TRUE.
+          boundaryDistance=HUGE(1.0_DP)
+          DO coordinateIdx=1,spatialIndex%numberOfDimensions
+            IF(pointCell(coordinateIdx)-ringIdx>0) THEN
+              gridSearched=.FALSE.
+              boundaryDistance=MIN(boundaryDistance,pointValues(coordinateIdx)-(spatialIndex%minimumBounds(coordinateIdx)+ &
+                & REAL(pointCell(coordinateIdx)-ringIdx,DP)*spatialIndex%cellSize(coordinateIdx)))
+            ENDIF
+            IF(pointCell(coordinateIdx)+ringIdx<spatialIndex%numberOfCells(coordinateIdx)-1) THEN
+              gridSearched=.FALSE.
+              boundaryDistance=MIN(boundaryDistance,spatialIndex%minimumBounds(coordinateIdx)+ &
+                & REAL(pointCell(coordinateIdx)+ringIdx+1,DP)*spatialIndex%cellSize(coordinateIdx)-pointValues(coordinateIdx))
+            ENDIF
+          ENDDO !coordinateIdx
+          IF(gridSearched) EXIT
+          IF(numberOfFoundCandidates==numberOfClosestCandidates.AND.boundaryDistance>0.0_DP) THEN
+            IF(closestDistances(numberOfClosestCandidates)<boundaryDistance*boundaryDistance) EXIT
+          ENDIF
+          ringIdx=ringIdx+1
+        ENDDO
+      ENDIF
+    ELSE
+      CALL FLAG_ERROR("Spatial index is not associated.",err,error,*999)
+    ENDIF
+
+    EXITS("DataProjection_SpatialIndexClosestFind")
+    RETURN
+999 ERRORSEXITS("DataProjection_SpatialIndexClosestFind",err,error)
+    RETURN 1
+
+  END SUBROUTINE DataProjection_SpatialIndexClosestFind
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Creates the spatial index of the candidates for a data projection. Each candidate element/face/line is evaluated once at the starting xi and placed into a uniform grid with about one candidate per cell.
+  SUBROUTINE DataProjection_SpatialIndexCreate(dataProjection,interpolatedPoint,candidateElements,candidateFaces, &
+    & numberOfCandidates,err,error,*)
+
+    !Argument variables
+    TYPE(DATA_PROJECTION_TYPE), POINTER :: dataProjection !<A pointer to the data projection to create the spatial index for
+    TYPE(FIELD_INTERPOLATED_POINT_TYPE), POINTER :: interpolatedPoint !<A pointer to the interpolated point of the projection field
+    INTEGER(INTG), INTENT(IN) :: candidateElements(:) !<candidateElements(candidateIdx). The local element number of the candidateIdx'th candidate
+    INTEGER(INTG), ALLOCATABLE, INTENT(IN) :: candidateFaces(:) !<candidateFaces(candidateIdx). The element face/line number of the candidateIdx'th candidate for boundary projections.
+    INTEGER(INTG), INTENT(IN) :: numberOfCandidates !<The number of candidates
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    INTEGER(INTG) :: candidateIdx,cellIdx,coordinateIdx,dummyErr,elementNumber,faceNumber,lineNumber,numberOfDimensions, &
+      & numberOfSpreadDimensions,totalNumberOfCells
+    INTEGER(INTG) :: candidateCell(3)
+    INTEGER(INTG), ALLOCATABLE :: candidateCells(:),cellPositions(:)
+    INTEGER(LINTG) :: longTotalNumberOfCells
+    REAL(DP) :: cellScale,extent(3),maximumBounds(3),maximumExtent,spreadCellSize,spreadVolume
+    LOGICAL :: flatDimensionFound,spreadDimensions(3)
+    TYPE(DataProjectionSpatialIndexType), POINTER :: spatialIndex
+    TYPE(DECOMPOSITION_ELEMENTS_TYPE), POINTER :: decompositionElements
+    TYPE(VARYING_STRING) :: dummyError
+
+    ENTERS("DataProjection_SpatialIndexCreate",err,error,*998)
+
+    IF(ASSOCIATED(dataProjection)) THEN
+      IF(ASSOCIATED(interpolatedPoint)) THEN
+        CALL DataProjection_SpatialIndexFinalise(dataProjection%spatialIndex,err,error,*999)
+        ALLOCATE(dataProjection%spatialIndex,STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate data projection spatial index.",err,error,*999)
+        spatialIndex=>dataProjection%spatialIndex
+        numberOfDimensions=dataProjection%COORDINATE_SYSTEM_DIMENSIONS
+        spatialIndex%numberOfCandidates=numberOfCandidates
+        spatialIndex%numberOfDimensions=numberOfDimensions
+        spatialIndex%numberOfCells=1
+        spatialIndex%minimumBounds=0.0_DP
+        spatialIndex%cellSize=1.0_DP
+        ALLOCATE(spatialIndex%candidatePoints(numberOfDimensions,numberOfCandidates),STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate spatial index candidate points.",err,error,*999)
+        !Evaluate the candidates at the starting xi
+        decompositionElements=>interpolatedPoint%INTERPOLATION_PARAMETERS%FIELD%DECOMPOSITION%TOPOLOGY%ELEMENTS
+        SELECT CASE(dataProjection%PROJECTION_TYPE)
+        CASE(DATA_PROJECTION_BOUNDARY_LINES_PROJECTION_TYPE)
+          DO candidateIdx=1,numberOfCandidates
+            elementNumber=candidateElements(candidateIdx)
+            lineNumber=decompositionElements%ELEMENTS(elementNumber)%ELEMENT_LINES(candidateFaces(candidateIdx))
+            CALL DataProjection_ParametersCacheGet(dataProjection,FIELD_VALUES_SET_TYPE,lineNumber, &
+              & interpolatedPoint%INTERPOLATION_PARAMETERS,err,error,*999)
+            CALL FIELD_INTERPOLATE_XI(NO_PART_DERIV,dataProjection%STARTING_XI,interpolatedPoint,err,error,*999, &
+              & FIELD_GEOMETRIC_COMPONENTS_TYPE)
+            spatialIndex%candidatePoints(:,candidateIdx)=interpolatedPoint%VALUES(1:numberOfDimensions,1)
+          ENDDO !candidateIdx
+        CASE(DATA_PROJECTION_BOUNDARY_FACES_PROJECTION_TYPE)
+          DO candidateIdx=1,numberOfCandidates
+            elementNumber=candidateElements(candidateIdx)
+            faceNumber=decompositionElements%ELEMENTS(elementNumber)%ELEMENT_FACES(candidateFaces(candidateIdx))
+            CALL DataProjection_ParametersCacheGet(dataProjection,FIELD_VALUES_SET_TYPE,faceNumber, &
+              & interpolatedPoint%INTERPOLATION_PARAMETERS,err,error,*999)
+            CALL FIELD_INTERPOLATE_XI(NO_PART_DERIV,dataProjection%STARTING_XI,interpolatedPoint,err,error,*999, &
+              & FIELD_GEOMETRIC_COMPONENTS_TYPE)
+            spatialIndex%candidatePoints(:,candidateIdx)=interpolatedPoint%VALUES(1:numberOfDimensions,1)
+          ENDDO !candidateIdx
+        CASE(DATA_PROJECTION_ALL_ELEMENTS_PROJECTION_TYPE)
+          DO candidateIdx=1,numberOfCandidates
+            elementNumber=candidateElements(candidateIdx)
+            CALL DataProjection_ParametersCacheGet(dataProjection,FIELD_VALUES_SET_TYPE,elementNumber, &
+              & interpolatedPoint%INTERPOLATION_PARAMETERS,err,error,*999)
+            CALL FIELD_INTERPOLATE_XI(NO_PART_DERIV,dataProjection%STARTING_XI,interpolatedPoint,err,error,*999, &
+              & FIELD_GEOMETRIC_COMPONENTS_TYPE)
+            spatialIndex%candidatePoints(:,candidateIdx)=interpolatedPoint%VALUES(1:numberOfDimensions,1)
+          ENDDO !candidateIdx
+        CASE DEFAULT
+          CALL FLAG_ERROR("No match for data projection type found",err,error,*999)
+        END SELECT
+        !Size the grid cells so that there is about one candidate per cell over the directions the candidates are spread in
+        IF(numberOfCandidates>0) THEN
+          spatialIndex%minimumBounds(1:numberOfDimensions)=MINVAL(spatialIndex%candidatePoints,2)
+          maximumBounds(1:numberOfDimensions)=MAXVAL(spatialIndex%candidatePoints,2)
+          extent(1:numberOfDimensions)=maximumBounds(1:numberOfDimensions)-spatialIndex%minimumBounds(1:numberOfDimensions)
+          maximumExtent=MAXVAL(extent(1:numberOfDimensions))
+          IF(maximumExtent>ZERO_TOLERANCE) THEN
+            spreadDimensions=.FALSE.
+            spreadDimensions(1:numberOfDimensions)=extent(1:numberOfDimensions)>ZERO_TOLERANCE*maximumExtent
+            !A direction thinner than a cell is flat, so size the cells again over the remaining directions
+            flatDimensionFound=.TRUE.
+            DO WHILE(flatDimensionFound)
+              numberOfSpreadDimensions=COUNT(spreadDimensions)
+              spreadVolume=PRODUCT(extent,MASK=spreadDimensions)
+              spreadCellSize=(spreadVolume/REAL(numberOfCandidates,DP))**(1.0_DP/REAL(numberOfSpreadDimensions,DP))
+              flatDimensionFound=.FALSE.
+              DO coordinateIdx=1,numberOfDimensions
+                IF(spreadDimensions(coordinateIdx).AND.extent(coordinateIdx)<spreadCellSize) THEN
+                  spreadDimensions(coordinateIdx)=.FALSE.
+                  flatDimensionFound=.TRUE.
+                ENDIF
+              ENDDO !coordinateIdx
+            ENDDO
+            DO coordinateIdx=1,numberOfDimensions
+              IF(spreadDimensions(coordinateIdx)) spatialIndex%numberOfCells(coordinateIdx)= &
+                & INT(MIN(MAX(extent(coordinateIdx)/spreadCellSize,1.0_DP),REAL(numberOfCandidates,DP)))
+            ENDDO !coordinateIdx
+            !Keep the total number of cells to about the number of candidates
+            longTotalNumberOfCells=PRODUCT(INT(spatialIndex%numberOfCells,LINTG))
+            IF(longTotalNumberOfCells>numberOfCandidates) THEN
+              cellScale=(REAL(numberOfCandidates,DP)/REAL(longTotalNumberOfCells,DP))**(1.0_DP/REAL(numberOfSpreadDimensions,DP))
+              DO coordinateIdx=1,numberOfDimensions
+                IF(spreadDimensions(coordinateIdx)) spatialIndex%numberOfCells(coordinateIdx)= &
+                  & MAX(INT(REAL(spatialIndex%numberOfCells(coordinateIdx),DP)*cellScale),1)
+              ENDDO !coordinateIdx
+            ENDIF
+            DO coordinateIdx=1,numberOfDimensions
+              IF(spreadDimensions(coordinateIdx)) spatialIndex%cellSize(coordinateIdx)=extent(coordinateIdx)/ &
+                & REAL(spatialIndex%numberOfCells(coordinateIdx),DP)
+            ENDDO !coordinateIdx
+          ENDIF
+        ENDIF
+        !Store the candidates cell by cell
+        totalNumberOfCells=PRODUCT(spatialIndex%numberOfCells)
+        ALLOCATE(spatialIndex%cellCandidatesStart(totalNumberOfCells+1),STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate spatial index cell candidates start.",err,error,*999)
+        ALLOCATE(spatialIndex%cellCandidates(numberOfCandidates),STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate spatial index cell candidates.",err,error,*999)
+        ALLOCATE(candidateCells(numberOfCandidates),STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate candidate cells.",err,error,*999)
+        ALLOCATE(cellPositions(totalNumberOfCells),STAT=err)
+        IF(err/=0) CALL FLAG_ERROR("Could not allocate cell positions.",err,error,*999)
+        spatialIndex%cellCandidatesStart=0
+        DO candidateIdx=1,numberOfCandidates
+          candidateCell=0
+          DO coordinateIdx=1,numberOfDimensions
+            candidateCell(coordinateIdx)=INT(MIN(MAX((spatialIndex%candidatePoints(coordinateIdx,candidateIdx)- &
+              & spatialIndex%minimumBounds(coordinateIdx))/spatialIndex%cellSize(coordinateIdx),0.0_DP), &
+              & REAL(spatialIndex%numberOfCells(coordinateIdx)-1,DP)))
+          ENDDO !coordinateIdx
+          cellIdx=1+candidateCell(1)+spatialIndex%numberOfCells(1)*(candidateCell(2)+spatialIndex%numberOfCells(2)* &
+            & candidateCell(3))
+          candidateCells(candidateIdx)=cellIdx
+          spatialIndex%cellCandidatesStart(cellIdx+1)=spatialIndex%cellCandidatesStart(cellIdx+1)+1
+        ENDDO !candidateIdx
+        spatialIndex%cellCandidatesStart(1)=1
+        DO cellIdx=1,totalNumberOfCells
+          spatialIndex%cellCandidatesStart(cellIdx+1)=spatialIndex%cellCandidatesStart(cellIdx+1)+ &
+            & spatialIndex%cellCandidatesStart(cellIdx)
+        ENDDO !cellIdx
+        cellPositions=spatialIndex%cellCandidatesStart(1:totalNumberOfCells)
+        DO candidateIdx=1,numberOfCandidates
+          cellIdx=candidateCells(candidateIdx)
+          spatialIndex%cellCandidates(cellPositions(cellIdx))=candidateIdx
+          cellPositions(cellIdx)=cellPositions(cellIdx)+1
+        ENDDO !candidateIdx
+        DEALLOCATE(candidateCells)
+        DEALLOCATE(cellPositions)
+      ELSE
+        CALL FLAG_ERROR("Interpolated point is not associated.",err,error,*998)
+      ENDIF
+    ELSE
+      CALL FLAG_ERROR("Data projection is not associated.",err,error,*998)
+    ENDIF
+
+    EXITS("DataProjection_SpatialIndexCreate")
+    RETURN
+999 IF(ALLOCATED(candidateCells)) DEALLOCATE(candidateCells)
+    IF(ALLOCATED(cellPositions)) DEALLOCATE(cellPositions)
+    CALL DataProjection_SpatialIndexFinalise(dataProjection%spatialIndex,dummyErr,dummyError,*998)
+998 ERRORSEXITS("DataProjection_SpatialIndexCreate",err,error)
+    RETURN 1
+
+  END SUBROUTINE DataProjection_SpatialIndexCreate
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Finalises a data projection spatial index and deallocates all memory.
+  SUBROUTINE DataProjection_SpatialIndexFinalise(spatialIndex,err,error,*)
+
+    !Argument variables
+    TYPE(DataProjectionSpatialIndexType), POINTER :: spatialIndex !<A pointer to the spatial index to finalise
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+
+    ENTERS("DataProjection_SpatialIndexFinalise",err,error,*999)
+
+    IF(ASSOCIATED(spatialIndex)) THEN
+      IF(ALLOCATED(spatialIndex%candidatePoints)) DEALLOCATE(spatialIndex%candidatePoints)
+      IF(ALLOCATED(spatialIndex%cellCandidatesStart)) DEALLOCATE(spatialIndex%cellCandidatesStart)
+      IF(ALLOCATED(spatialIndex%cellCandidates)) DEALLOCATE(spatialIndex%cellCandidates)
+      DEALLOCATE(spatialIndex)
+    ENDIF
+
+    EXITS("DataProjection_SpatialIndexFinalise")
+    RETURN
+999 ERRORSEXITS("DataProjection_SpatialIndexFinalise",err,error)
+    RETURN 1
+
+  END SUBROUTINE DataProjection_SpatialIndexFinalise
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Gets the spatial index type used to find the closest candidates for a data projection.
+  SUBROUTINE DataProjection_SpatialIndexGet(dataProjection,spatialIndexType,err,error,*)
+
+    !Argument variables
+    TYPE(DATA_PROJECTION_TYPE), POINTER :: dataProjection !<A pointer to the data projection to get the spatial index type for
+    INTEGER(INTG), INTENT(OUT) :: spatialIndexType !<On exit, the spatial index type of the data projection \see DATA_PROJECTION_ROUTINES_DataProjectionSpatialIndexTypes,DATA_PROJECTION_ROUTINES
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+
+    ENTERS("DataProjection_SpatialIndexGet",err,error,*999)
+
+    IF(ASSOCIATED(dataProjection)) THEN
+      IF(dataProjection%DATA_PROJECTION_FINISHED) THEN
+        spatialIndexType=dataProjection%spatialIndexType
+      ELSE
+        CALL FLAG_ERROR("Data projection have not been finished.",err,error,*999)
+      ENDIF
+    ELSE
+      CALL FLAG_ERROR("Data projection is not associated.",err,error,*999)
+    ENDIF
+
+    EXITS("DataProjection_SpatialIndexGet")
+    RETURN
+999 ERRORSEXITS("DataProjection_SpatialIndexGet",err,error)
+    RETURN 1
+
+  END SUBROUTINE DataProjection_SpatialIndexGet
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets the spatial index type used to find the closest candidates for a data projection.
+  SUBROUTINE DataProjection_SpatialIndexSet(dataProjection,spatialIndexType,err,error,*)
+
+    !Argument variables
+    TYPE(DATA_PROJECTION_TYPE), POINTER :: dataProjection !<A pointer to the data projection to set the spatial index type for
+    INTEGER(INTG), INTENT(IN) :: spatialIndexType !<The spatial index type to set \see DATA_PROJECTION_ROUTINES_DataProjectionSpatialIndexTypes,DATA_PROJECTION_ROUTINES
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("DataProjection_SpatialIndexSet",err,error,*999)
+
+    IF(ASSOCIATED(dataProjection)) THEN
+      IF(dataProjection%DATA_PROJECTION_FINISHED) THEN
+        CALL FLAG_ERROR("Data projection have been finished.",err,error,*999)
+      ELSE
+        SELECT CASE(spatialIndexType)
+        CASE(DATA_PROJECTION_NO_SPATIAL_INDEX,DATA_PROJECTION_GRID_SPATIAL_INDEX)
+          dataProjection%spatialIndexType=spatialIndexType
+        CASE DEFAULT
+          localError="The specified spatial index type of "//TRIM(NUMBER_TO_VSTRING(spatialIndexType,"*",err,error))// &
+            & " is invalid."
+          CALL FLAG_ERROR(localError,err,error,*999)
+        END SELECT
+      ENDIF
+    ELSE
+      CALL FLAG_ERROR("Data projection is not associated.",err,error,*999)
+    ENDIF
+
+    EXITS("DataProjection_SpatialIndexSet")
+    RETURN
+999 ERRORSEXITS("DataProjection_SpatialIndexSet",err,error)
+    RETURN 1
+
+  END SUBROUTINE DataProjection_SpatialIndexSet
+
 
   !
   !================================================================================================================================
@@ -572,7 +572,7 @@ MODULE DISTRIBUTED_MATRIX_VECTOR
 
   PUBLIC DISTRIBUTED_MATRIX_LIBRARY_TYPE_SET
 
-  PUBLIC DistributedMatrix_LibraryTypeSet
+  PUBLIC DistributedMatrix_LibraryTypeGet,DistributedMatrix_LibraryTypeSet
 
   PUBLIC DISTRIBUTED_MATRIX_LINKLIST_SET,DISTRIBUTED_MATRIX_LINKLIST_GET
 
@@ -596,6 +596,8 @@ MODULE DISTRIBUTED_MATRIX_VECTOR
 
   PUBLIC DistributedMatrix_StorageLocationsGet,DistributedMatrix_StorageLocationsSet
 
+  PUBLIC DistributedMatrix_StorageLocationsFind,DistributedMatrix_StorageLocationsValuesAdd
+
   PUBLIC DISTRIBUTED_MATRIX_STORAGE_TYPE_GET,DISTRIBUTED_MATRIX_STORAGE_TYPE_SET
 
   PUBLIC DistributedMatrix_StorageTypeGet,DistributedMatrix_StorageTypeSet
@@ -654,7 +656,7 @@ MODULE DISTRIBUTED_MATRIX_VECTOR
 
   PUBLIC DISTRIBUTED_VECTOR_LIBRARY_TYPE_SET
 
-  PUBLIC DistributedVector_LibraryTypeSet
+  PUBLIC DistributedVector_LibraryTypeGet,DistributedVector_LibraryTypeSet
 
   PUBLIC DistributedVector_L2Norm
 
@@ -2083,6 +2085,34 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Gets the library type for a distributed matrix
+  SUBROUTINE DistributedMatrix_LibraryTypeGet(distributedMatrix,libraryType,err,error,*)
+
+    !Argument variables
+    TYPE(DISTRIBUTED_MATRIX_TYPE), POINTER :: distributedMatrix !<A pointer to the distributed matrix
+    INTEGER(INTG), INTENT(OUT) :: libraryType !<On return, the library type of the distributed matrix \see DISTRIBUTED_MATRIX_VECTOR_LibraryTypes,DISTRIBUTED_MATRIX_VECTOR
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+
+    ENTERS("DistributedMatrix_LibraryTypeGet",err,error,*999)
+
+    IF(ASSOCIATED(distributedMatrix)) THEN
+      libraryType=distributedMatrix%LIBRARY_TYPE
+    ELSE
+      CALL FlagError("Distributed matrix is not associated.",err,error,*999)
+    ENDIF
+
+    EXITS("DistributedMatrix_LibraryTypeGet")
+    RETURN
+999 ERRORSEXITS("DistributedMatrix_LibraryTypeGet",err,error)
+    RETURN 1
+  END SUBROUTINE DistributedMatrix_LibraryTypeGet
+
+  !
+  !================================================================================================================================
+  !
+
   !>Sets/changes the library type for a distributed matrix
   SUBROUTINE DISTRIBUTED_MATRIX_LIBRARY_TYPE_SET(DISTRIBUTED_MATRIX,LIBRARY_TYPE,ERR,ERROR,*)
 
@@ -3179,6 +3209,102 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Finds the storage locations in the local matrix data of the entries in the given local rows and columns of a distributed matrix. The locations can be used with DistributedMatrix_StorageLocationsValuesAdd to add values without searching the sparsity structure.
+  SUBROUTINE DistributedMatrix_StorageLocationsFind(distributedMatrix,rowIndices,columnIndices,locations,err,error,*)
+
+    !Argument variables
+    TYPE(DISTRIBUTED_MATRIX_TYPE), POINTER :: distributedMatrix !<A pointer to the distributed matrix
+    INTEGER(INTG), INTENT(IN) :: rowIndices(:) !<rowIndices(i). The i'th local row index to find the storage locations for
+    INTEGER(INTG), INTENT(IN) :: columnIndices(:) !<columnIndices(j). The j'th column index to find the storage locations for
+    INTEGER(INTG), INTENT(OUT) :: locations(:,:) !<locations(i,j). On return, the storage location of the ij'th entry
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("DistributedMatrix_StorageLocationsFind",err,error,*999)
+
+    IF(ASSOCIATED(distributedMatrix)) THEN
+      IF(distributedMatrix%MATRIX_FINISHED) THEN
+        SELECT CASE(distributedMatrix%LIBRARY_TYPE)
+        CASE(DISTRIBUTED_MATRIX_VECTOR_CMISS_TYPE)
+          IF(ASSOCIATED(distributedMatrix%CMISS)) THEN
+            CALL Matrix_StorageLocationsFind(distributedMatrix%CMISS%MATRIX,rowIndices,columnIndices,locations,err,error,*999)
+          ELSE
+            CALL FlagError("Distributed matrix CMISS is not associated.",err,error,*999)
+          ENDIF
+        CASE(DISTRIBUTED_MATRIX_VECTOR_PETSC_TYPE)
+          CALL FlagError("Finding storage locations is not implemented for PETSc distributed matrices.",err,error,*999)
+        CASE DEFAULT
+          localError="The distributed matrix library type of "// &
+            & TRIM(NumberToVString(distributedMatrix%LIBRARY_TYPE,"*",err,error))//" is invalid."
+          CALL FlagError(localError,err,error,*999)
+        END SELECT
+      ELSE
+        CALL FlagError("The distributed matrix has not been finished.",err,error,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("Distributed matrix is not associated.",err,error,*999)
+    ENDIF
+
+    EXITS("DistributedMatrix_StorageLocationsFind")
+    RETURN
+999 ERRORSEXITS("DistributedMatrix_StorageLocationsFind",err,error)
+    RETURN 1
+  END SUBROUTINE DistributedMatrix_StorageLocationsFind
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Adds a matrix of values to a distributed double precision matrix at storage locations found with DistributedMatrix_StorageLocationsFind.
+  SUBROUTINE DistributedMatrix_StorageLocationsValuesAdd(distributedMatrix,locations,values,err,error,*)
+
+    !Argument variables
+    TYPE(DISTRIBUTED_MATRIX_TYPE), POINTER :: distributedMatrix !<A pointer to the distributed matrix
+    INTEGER(INTG), INTENT(IN) :: locations(:,:) !<locations(i,j). The storage location to add the ij'th value to
+    REAL(DP), INTENT(IN) :: values(:,:) !<values(i,j). The ij'th value to add
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("DistributedMatrix_StorageLocationsValuesAdd",err,error,*999)
+
+    IF(ASSOCIATED(distributedMatrix)) THEN
+      IF(distributedMatrix%MATRIX_FINISHED) THEN
+        SELECT CASE(distributedMatrix%LIBRARY_TYPE)
+        CASE(DISTRIBUTED_MATRIX_VECTOR_CMISS_TYPE)
+          IF(ASSOCIATED(distributedMatrix%CMISS)) THEN
+            CALL Matrix_StorageLocationsValuesAdd(distributedMatrix%CMISS%MATRIX,locations,values,err,error,*999)
+          ELSE
+            CALL FlagError("Distributed matrix CMISS is not associated.",err,error,*999)
+          ENDIF
+        CASE(DISTRIBUTED_MATRIX_VECTOR_PETSC_TYPE)
+          CALL FlagError("Adding values by storage location is not implemented for PETSc distributed matrices.", &
+            & err,error,*999)
+        CASE DEFAULT
+          localError="The distributed matrix library type of "// &
+            & TRIM(NumberToVString(distributedMatrix%LIBRARY_TYPE,"*",err,error))//" is invalid."
+          CALL FlagError(localError,err,error,*999)
+        END SELECT
+      ELSE
+        CALL FlagError("The distributed matrix has not been finished.",err,error,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("Distributed matrix is not associated.",err,error,*999)
+    ENDIF
+
+    EXITS("DistributedMatrix_StorageLocationsValuesAdd")
+    RETURN
+999 ERRORSEXITS("DistributedMatrix_StorageLocationsValuesAdd",err,error)
+    RETURN 1
+  END SUBROUTINE DistributedMatrix_StorageLocationsValuesAdd
+
+  !
+  !================================================================================================================================
+  !
+
   !>Gets the storage type of a distributed matrix.
   SUBROUTINE DISTRIBUTED_MATRIX_STORAGE_TYPE_GET(DISTRIBUTED_MATRIX,STORAGE_TYPE,ERR,ERROR,*)
 
@@ -7355,6 +7481,34 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Gets the library type for a distributed vector
+  SUBROUTINE DistributedVector_LibraryTypeGet(distributedVector,libraryType,err,error,*)
+
+    !Argument variables
+    TYPE(DISTRIBUTED_VECTOR_TYPE), POINTER :: distributedVector !<A pointer to the distributed vector
+    INTEGER(INTG), INTENT(OUT) :: libraryType !<On return, the library type of the distributed vector \see DISTRIBUTED_MATRIX_VECTOR_LibraryTypes,DISTRIBUTED_MATRIX_VECTOR
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+
+    ENTERS("DistributedVector_LibraryTypeGet",err,error,*999)
+
+    IF(ASSOCIATED(distributedVector)) THEN
+      libraryType=distributedVector%LIBRARY_TYPE
+    ELSE
+      CALL FlagError("Distributed vector is not associated.",err,error,*999)
+    ENDIF
+
+    EXITS("DistributedVector_LibraryTypeGet")
+    RETURN
+999 ERRORSEXITS("DistributedVector_LibraryTypeGet",err,error)
+    RETURN 1
+  END SUBROUTINE DistributedVector_LibraryTypeGet
+
+  !
+  !================================================================================================================================
+  !
+
   !>Sets/changes the library type for a distributed vector
   SUBROUTINE DISTRIBUTED_VECTOR_LIBRARY_TYPE_SET(DISTRIBUTED_VECTOR,LIBRARY_TYPE,ERR,ERROR,*)
 
@@ -231,6 +231,8 @@ MODULE EQUATIONS_MATRICES_ROUTINES
 
   PUBLIC EQUATIONS_MATRICES_CREATE_FINISH,EQUATIONS_MATRICES_CREATE_START
 
+  PUBLIC EquationsMatrices_AssemblyCopyCreate,EquationsMatrices_AssemblyCopyDestroy
+
   PUBLIC EquationsMatrices_CreateFinish,EquationsMatrices_CreateStart
 
   PUBLIC EQUATIONS_MATRICES_DESTROY
@@ -270,6 +272,8 @@ MODULE EQUATIONS_MATRICES_ROUTINES
 
   PUBLIC EquationsMatrices_JacobianTypesSet
 
+  PUBLIC EquationsMatrices_ThreadedAssemblyCheck
+
   PUBLIC EQUATIONS_MATRICES_LINEAR_STORAGE_TYPE_SET
 
   PUBLIC EquationsMatrices_LinearStorageTypeSet,EquationsMatrices_LinearStructureTypeSet
@@ -313,6 +317,7 @@ CONTAINS
       IF(ASSOCIATED(EQUATIONS_JACOBIAN%JACOBIAN)) CALL DISTRIBUTED_MATRIX_DESTROY(EQUATIONS_JACOBIAN%JACOBIAN,ERR,ERROR,*999)
       CALL EQUATIONS_MATRICES_ELEMENT_MATRIX_FINALISE(EQUATIONS_JACOBIAN%ELEMENT_JACOBIAN,ERR,ERROR,*999)
       CALL EquationsMatrices_NodalMatrixFinalise(EQUATIONS_JACOBIAN%NodalJacobian,ERR,ERROR,*999)
+      IF(ASSOCIATED(EQUATIONS_JACOBIAN%elementScatterMaps)) DEALLOCATE(EQUATIONS_JACOBIAN%elementScatterMaps)
     ENDIF
     
     EXITS("EQUATIONS_JACOBIAN_FINALISE")
@@ -365,6 +370,7 @@ CONTAINS
                 NONLINEAR_MATRICES%JACOBIANS(MATRIX_NUMBER)%PTR%FIRST_ASSEMBLY=.TRUE.
                 NONLINEAR_MAPPING%JACOBIAN_TO_VAR_MAP(MATRIX_NUMBER)%JACOBIAN=>NONLINEAR_MATRICES%JACOBIANS(MATRIX_NUMBER)%PTR
                 NULLIFY(NONLINEAR_MATRICES%JACOBIANS(MATRIX_NUMBER)%PTR%JACOBIAN)
+                NULLIFY(NONLINEAR_MATRICES%JACOBIANS(MATRIX_NUMBER)%PTR%elementScatterMaps)
                 CALL EquationsMatrices_ElementMatrixInitialise(NONLINEAR_MATRICES%JACOBIANS(MATRIX_NUMBER)%PTR% &
                     & ELEMENT_JACOBIAN,ERR,ERROR,*999)
                 CALL EquationsMatrices_NodalMatrixInitialise(NONLINEAR_MATRICES%JACOBIANS(MATRIX_NUMBER)%PTR% &
@@ -465,6 +471,8 @@ CONTAINS
                         IF(ASSOCIATED(COLUMN_INDICES)) DEALLOCATE(COLUMN_INDICES)
                       ENDIF
                       CALL DISTRIBUTED_MATRIX_CREATE_FINISH(EQUATIONS_MATRIX%MATRIX,ERR,ERROR,*999)
+                      CALL EquationsMatrices_ElementScatterMapsInitialise(EQUATIONS_MATRIX%MATRIX,DYNAMIC_MAPPING% &
+                        & EQUATIONS_MATRIX_TO_VAR_MAPS(matrix_idx)%VARIABLE,EQUATIONS_MATRIX%elementScatterMaps,ERR,ERROR,*999)
                     ELSE
                       LOCAL_ERROR="Column domain map for dynamic matrix number "// &
                         & TRIM(NumberToVString(matrix_idx,"*",ERR,ERROR))//" is not associated."
@@ -509,6 +517,8 @@ CONTAINS
                         IF(ASSOCIATED(COLUMN_INDICES)) DEALLOCATE(COLUMN_INDICES)
                       ENDIF
                       CALL DISTRIBUTED_MATRIX_CREATE_FINISH(EQUATIONS_MATRIX%MATRIX,ERR,ERROR,*999)
+                      CALL EquationsMatrices_ElementScatterMapsInitialise(EQUATIONS_MATRIX%MATRIX,LINEAR_MAPPING% &
+                        & EQUATIONS_MATRIX_TO_VAR_MAPS(matrix_idx)%VARIABLE,EQUATIONS_MATRIX%elementScatterMaps,ERR,ERROR,*999)
                     ELSE
                       LOCAL_ERROR="Column domain map for linear matrix number "// &
                         & TRIM(NumberToVString(matrix_idx,"*",ERR,ERROR))//" is not associated."
@@ -552,6 +562,8 @@ CONTAINS
                         IF(ASSOCIATED(COLUMN_INDICES)) DEALLOCATE(COLUMN_INDICES)
                       ENDIF
                       CALL DISTRIBUTED_MATRIX_CREATE_FINISH(JACOBIAN_MATRIX%JACOBIAN,ERR,ERROR,*999)
+                      CALL EquationsMatrices_ElementScatterMapsInitialise(JACOBIAN_MATRIX%JACOBIAN,NONLINEAR_MAPPING% &
+                        & JACOBIAN_TO_VAR_MAP(matrix_idx)%VARIABLE,JACOBIAN_MATRIX%elementScatterMaps,ERR,ERROR,*999)
                     ELSE
                       CALL FlagError("Column domain map is not associated.",ERR,ERROR,*999)
                     ENDIF
@@ -707,7 +719,12 @@ CONTAINS
       IF(ASSOCIATED(COLS_FIELD_VARIABLE)) THEN
         ELEMENT_MATRIX%NUMBER_OF_ROWS=0
         ELEMENT_MATRIX%NUMBER_OF_COLUMNS=0
+        ELEMENT_MATRIX%elementNumber=0
         IF(UPDATE_MATRIX) THEN
+          !Record the element so that the storage locations for the element can be cached when the matrix is assembled
+          IF(SIZE(ROW_ELEMENT_NUMBERS)==1.AND.SIZE(COLUMN_ELEMENT_NUMBERS)==1) THEN
+            IF(ROW_ELEMENT_NUMBERS(1)==COLUMN_ELEMENT_NUMBERS(1)) ELEMENT_MATRIX%elementNumber=ROW_ELEMENT_NUMBERS(1)
+          ENDIF
           IF(ASSOCIATED(ROWS_FIELD_VARIABLE,COLS_FIELD_VARIABLE)) THEN
             !Row and columns variable is the same.
             DO component_idx=1,ROWS_FIELD_VARIABLE%NUMBER_OF_COMPONENTS
@@ -979,6 +996,7 @@ CONTAINS
     ELEMENT_MATRIX%EQUATIONS_MATRIX_NUMBER=0
     ELEMENT_MATRIX%NUMBER_OF_ROWS=0
     ELEMENT_MATRIX%NUMBER_OF_COLUMNS=0
+    ELEMENT_MATRIX%elementNumber=0
     ELEMENT_MATRIX%MAX_NUMBER_OF_ROWS=0
     ELEMENT_MATRIX%MAX_NUMBER_OF_COLUMNS=0
        
@@ -1255,6 +1273,128 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Initialises the element scatter maps for a finished distributed equations matrix. The maps are only set up for sparse CMISS matrices, for which finding the storage location of each entry requires a search of the sparsity structure. The storage locations for each element are found when the element is first added to the matrix.
+  SUBROUTINE EquationsMatrices_ElementScatterMapsInitialise(distributedMatrix,fieldVariable,elementScatterMaps,err,error,*)
+
+    !Argument variables
+    TYPE(DISTRIBUTED_MATRIX_TYPE), POINTER :: distributedMatrix !<A pointer to the distributed matrix
+    TYPE(FIELD_VARIABLE_TYPE), POINTER :: fieldVariable !<A pointer to a field variable on the decomposition the matrix is assembled over
+    TYPE(ElementScatterMapType), POINTER :: elementScatterMaps(:) !<On return, the initialised element scatter maps.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    INTEGER(INTG) :: elementIdx,libraryType,numberOfElements,storageType
+    TYPE(DECOMPOSITION_TYPE), POINTER :: decomposition
+
+    ENTERS("EquationsMatrices_ElementScatterMapsInitialise",err,error,*999)
+
+    IF(ASSOCIATED(elementScatterMaps)) DEALLOCATE(elementScatterMaps)
+    IF(.NOT.ASSOCIATED(fieldVariable)) CALL FlagError("Field variable is not associated.",err,error,*999)
+    IF(.NOT.ASSOCIATED(fieldVariable%FIELD)) CALL FlagError("Field variable field is not associated.",err,error,*999)
+    CALL DistributedMatrix_LibraryTypeGet(distributedMatrix,libraryType,err,error,*999)
+    CALL DISTRIBUTED_MATRIX_STORAGE_TYPE_GET(distributedMatrix,storageType,err,error,*999)
+    IF(libraryType==DISTRIBUTED_MATRIX_VECTOR_CMISS_TYPE.AND. &
+      & (storageType==DISTRIBUTED_MATRIX_COMPRESSED_ROW_STORAGE_TYPE.OR. &
+      & storageType==DISTRIBUTED_MATRIX_COMPRESSED_COLUMN_STORAGE_TYPE)) THEN
+      decomposition=>fieldVariable%FIELD%DECOMPOSITION
+      IF(.NOT.ASSOCIATED(decomposition)) CALL FlagError("Field decomposition is not associated.",err,error,*999)
+      IF(.NOT.ASSOCIATED(decomposition%TOPOLOGY)) &
+        & CALL FlagError("Field decomposition topology is not associated.",err,error,*999)
+      IF(.NOT.ASSOCIATED(decomposition%TOPOLOGY%ELEMENTS)) &
+        & CALL FlagError("Field decomposition topology elements is not associated.",err,error,*999)
+      numberOfElements=decomposition%TOPOLOGY%ELEMENTS%TOTAL_NUMBER_OF_ELEMENTS
+      ALLOCATE(elementScatterMaps(numberOfElements),STAT=err)
+      IF(err/=0) CALL FlagError("Could not allocate element scatter maps.",err,error,*999)
+      DO elementIdx=1,numberOfElements
+        elementScatterMaps(elementIdx)%numberOfRows=0
+        elementScatterMaps(elementIdx)%numberOfColumns=0
+      ENDDO !elementIdx
+    ENDIF
+
+    EXITS("EquationsMatrices_ElementScatterMapsInitialise")
+    RETURN
+999 IF(ASSOCIATED(elementScatterMaps)) DEALLOCATE(elementScatterMaps)
+    ERRORSEXITS("EquationsMatrices_ElementScatterMapsInitialise",err,error)
+    RETURN 1
+  END SUBROUTINE EquationsMatrices_ElementScatterMapsInitialise
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Adds an element matrix into a distributed equations matrix. If the distributed matrix has element scatter maps the storage locations of the element in the matrix data are found on the first addition of the element and cached so that later additions of the element are a direct indexed add.
+  SUBROUTINE EquationsMatrices_ElementMatrixAdd(distributedMatrix,elementMatrix,elementScatterMaps,err,error,*)
+
+    !Argument variables
+    TYPE(DISTRIBUTED_MATRIX_TYPE), POINTER :: distributedMatrix !<A pointer to the distributed matrix to add the element matrix to
+    TYPE(ELEMENT_MATRIX_TYPE) :: elementMatrix !<The element matrix to add
+    TYPE(ElementScatterMapType), POINTER :: elementScatterMaps(:) !<elementScatterMaps(elementIdx). The cached storage locations for the elements of the distributed matrix. Not associated if the storage locations are not cached.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    INTEGER(INTG) :: elementNumber,numberOfColumns,numberOfRows
+    LOGICAL :: validMap
+
+    ENTERS("EquationsMatrices_ElementMatrixAdd",err,error,*999)
+
+    numberOfRows=elementMatrix%NUMBER_OF_ROWS
+    numberOfColumns=elementMatrix%NUMBER_OF_COLUMNS
+    elementNumber=0
+    IF(ASSOCIATED(elementScatterMaps)) THEN
+      IF(elementMatrix%elementNumber>=1.AND.elementMatrix%elementNumber<=SIZE(elementScatterMaps,1)) &
+        & elementNumber=elementMatrix%elementNumber
+    ENDIF
+    IF(elementNumber/=0) THEN
+      !Check the cached storage locations are for the current element dofs
+      validMap=elementScatterMaps(elementNumber)%numberOfRows==numberOfRows.AND. &
+        & elementScatterMaps(elementNumber)%numberOfColumns==numberOfColumns
+      IF(validMap) validMap=ALL(elementScatterMaps(elementNumber)%rowDofs(1:numberOfRows)== &
+        & elementMatrix%ROW_DOFS(1:numberOfRows)).AND.ALL(elementScatterMaps(elementNumber)% &
+        & columnDofs(1:numberOfColumns)==elementMatrix%COLUMN_DOFS(1:numberOfColumns))
+      IF(.NOT.validMap) THEN
+        elementScatterMaps(elementNumber)%numberOfRows=0
+        elementScatterMaps(elementNumber)%numberOfColumns=0
+        IF(ALLOCATED(elementScatterMaps(elementNumber)%locations)) THEN
+          IF(SIZE(elementScatterMaps(elementNumber)%locations,1)/=numberOfRows.OR. &
+            & SIZE(elementScatterMaps(elementNumber)%locations,2)/=numberOfColumns) THEN
+            DEALLOCATE(elementScatterMaps(elementNumber)%rowDofs)
+            DEALLOCATE(elementScatterMaps(elementNumber)%columnDofs)
+            DEALLOCATE(elementScatterMaps(elementNumber)%locations)
+          ENDIF
+        ENDIF
+        IF(.NOT.ALLOCATED(elementScatterMaps(elementNumber)%locations)) THEN
+          ALLOCATE(elementScatterMaps(elementNumber)%rowDofs(numberOfRows),STAT=err)
+          IF(err/=0) CALL FlagError("Could not allocate element scatter map row dofs.",err,error,*999)
+          ALLOCATE(elementScatterMaps(elementNumber)%columnDofs(numberOfColumns),STAT=err)
+          IF(err/=0) CALL FlagError("Could not allocate element scatter map column dofs.",err,error,*999)
+          ALLOCATE(elementScatterMaps(elementNumber)%locations(numberOfRows,numberOfColumns),STAT=err)
+          IF(err/=0) CALL FlagError("Could not allocate element scatter map locations.",err,error,*999)
+        ENDIF
+        elementScatterMaps(elementNumber)%rowDofs=elementMatrix%ROW_DOFS(1:numberOfRows)
+        elementScatterMaps(elementNumber)%columnDofs=elementMatrix%COLUMN_DOFS(1:numberOfColumns)
+        CALL DistributedMatrix_StorageLocationsFind(distributedMatrix,elementMatrix%ROW_DOFS(1:numberOfRows), &
+          & elementMatrix%COLUMN_DOFS(1:numberOfColumns),elementScatterMaps(elementNumber)%locations,err,error,*999)
+        elementScatterMaps(elementNumber)%numberOfRows=numberOfRows
+        elementScatterMaps(elementNumber)%numberOfColumns=numberOfColumns
+      ENDIF
+      CALL DistributedMatrix_StorageLocationsValuesAdd(distributedMatrix,elementScatterMaps(elementNumber)%locations, &
+        & elementMatrix%MATRIX(1:numberOfRows,1:numberOfColumns),err,error,*999)
+    ELSE
+      CALL DISTRIBUTED_MATRIX_VALUES_ADD(distributedMatrix,elementMatrix%ROW_DOFS(1:numberOfRows), &
+        & elementMatrix%COLUMN_DOFS(1:numberOfColumns),elementMatrix%MATRIX(1:numberOfRows,1:numberOfColumns), &
+        & err,error,*999)
+    ENDIF
+
+    EXITS("EquationsMatrices_ElementMatrixAdd")
+    RETURN
+999 ERRORSEXITS("EquationsMatrices_ElementMatrixAdd",err,error)
+    RETURN 1
+  END SUBROUTINE EquationsMatrices_ElementMatrixAdd
+
+  !
+  !================================================================================================================================
+  !
+
   !>Adds the element matrices and rhs vector into the equations matrices and rhs vector.
   SUBROUTINE EQUATIONS_MATRICES_ELEMENT_ADD(EQUATIONS_MATRICES,ERR,ERROR,*)
 
@@ -1303,11 +1443,8 @@ CONTAINS
                 ENDDO !row_idx
               ELSE
                 !Add the element matrice into the distributed equations matrix
-                CALL DISTRIBUTED_MATRIX_VALUES_ADD(EQUATIONS_MATRIX%MATRIX,EQUATIONS_MATRIX%ELEMENT_MATRIX%ROW_DOFS(1: &
-                  & EQUATIONS_MATRIX%ELEMENT_MATRIX%NUMBER_OF_ROWS),EQUATIONS_MATRIX%ELEMENT_MATRIX%COLUMN_DOFS(1: &
-                  & EQUATIONS_MATRIX%ELEMENT_MATRIX%NUMBER_OF_COLUMNS),EQUATIONS_MATRIX%ELEMENT_MATRIX%MATRIX(1: &
-                  & EQUATIONS_MATRIX%ELEMENT_MATRIX%NUMBER_OF_ROWS,1:EQUATIONS_MATRIX%ELEMENT_MATRIX%NUMBER_OF_COLUMNS), &
-                  & ERR,ERROR,*999)
+                CALL EquationsMatrices_ElementMatrixAdd(EQUATIONS_MATRIX%MATRIX,EQUATIONS_MATRIX%ELEMENT_MATRIX, &
+                  & EQUATIONS_MATRIX%elementScatterMaps,ERR,ERROR,*999)
               ENDIF
             ENDIF
           ELSE
@@ -1340,11 +1477,8 @@ CONTAINS
                 ENDDO !row_idx
               ELSE
                 !Add the element matrice into the distributed equations matrix
-                CALL DISTRIBUTED_MATRIX_VALUES_ADD(EQUATIONS_MATRIX%MATRIX,EQUATIONS_MATRIX%ELEMENT_MATRIX%ROW_DOFS(1: &
-                  & EQUATIONS_MATRIX%ELEMENT_MATRIX%NUMBER_OF_ROWS),EQUATIONS_MATRIX%ELEMENT_MATRIX%COLUMN_DOFS(1: &
-                  & EQUATIONS_MATRIX%ELEMENT_MATRIX%NUMBER_OF_COLUMNS),EQUATIONS_MATRIX%ELEMENT_MATRIX%MATRIX(1: &
-                  & EQUATIONS_MATRIX%ELEMENT_MATRIX%NUMBER_OF_ROWS,1:EQUATIONS_MATRIX%ELEMENT_MATRIX%NUMBER_OF_COLUMNS), &
-                  & ERR,ERROR,*999)
+                CALL EquationsMatrices_ElementMatrixAdd(EQUATIONS_MATRIX%MATRIX,EQUATIONS_MATRIX%ELEMENT_MATRIX, &
+                  & EQUATIONS_MATRIX%elementScatterMaps,ERR,ERROR,*999)
               ENDIF
             ENDIF
           ELSE
@@ -1550,6 +1684,217 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Creates a copy of finished equations matrices so that elements can be calculated and added on a separate thread. The copy has its own element matrices and vectors but shares the distributed matrices and vectors, and the element scatter maps, with the equations matrices being copied. The element matrices and vectors must have been initialised before the copy is created.
+  SUBROUTINE EquationsMatrices_AssemblyCopyCreate(equationsMatrices,equations,matricesCopy,err,error,*)
+
+    !Argument variables
+    TYPE(EQUATIONS_MATRICES_TYPE), POINTER :: equationsMatrices !<A pointer to the equations matrices to copy
+    TYPE(EQUATIONS_TYPE), POINTER :: equations !<A pointer to the equations that the copy belongs to
+    TYPE(EQUATIONS_MATRICES_TYPE), POINTER :: matricesCopy !<On return, a pointer to the copy of the equations matrices. Must not be associated on entry.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    INTEGER(INTG) :: dummyErr,matrixIdx
+    TYPE(VARYING_STRING) :: dummyError
+
+    ENTERS("EquationsMatrices_AssemblyCopyCreate",err,error,*998)
+
+    IF(.NOT.ASSOCIATED(equationsMatrices)) CALL FlagError("Equations matrices is not associated.",err,error,*998)
+    IF(.NOT.equationsMatrices%EQUATIONS_MATRICES_FINISHED) &
+      & CALL FlagError("Equations matrices have not been finished.",err,error,*998)
+    IF(ASSOCIATED(matricesCopy)) CALL FlagError("Equations matrices copy is already associated.",err,error,*998)
+
+    ALLOCATE(matricesCopy,STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate equations matrices copy.",err,error,*998)
+    matricesCopy=equationsMatrices
+    matricesCopy%EQUATIONS=>equations
+    NULLIFY(matricesCopy%DYNAMIC_MATRICES)
+    NULLIFY(matricesCopy%LINEAR_MATRICES)
+    NULLIFY(matricesCopy%NONLINEAR_MATRICES)
+    NULLIFY(matricesCopy%RHS_VECTOR)
+    NULLIFY(matricesCopy%SOURCE_VECTOR)
+    !Dynamic matrices
+    IF(ASSOCIATED(equationsMatrices%DYNAMIC_MATRICES)) THEN
+      ALLOCATE(matricesCopy%DYNAMIC_MATRICES,STAT=err)
+      IF(err/=0) CALL FlagError("Could not allocate dynamic matrices copy.",err,error,*999)
+      matricesCopy%DYNAMIC_MATRICES=equationsMatrices%DYNAMIC_MATRICES
+      matricesCopy%DYNAMIC_MATRICES%EQUATIONS_MATRICES=>matricesCopy
+      DO matrixIdx=1,matricesCopy%DYNAMIC_MATRICES%NUMBER_OF_DYNAMIC_MATRICES
+        NULLIFY(matricesCopy%DYNAMIC_MATRICES%MATRICES(matrixIdx)%PTR)
+      ENDDO !matrixIdx
+      DO matrixIdx=1,matricesCopy%DYNAMIC_MATRICES%NUMBER_OF_DYNAMIC_MATRICES
+        ALLOCATE(matricesCopy%DYNAMIC_MATRICES%MATRICES(matrixIdx)%PTR,STAT=err)
+        IF(err/=0) CALL FlagError("Could not allocate dynamic matrix copy.",err,error,*999)
+        matricesCopy%DYNAMIC_MATRICES%MATRICES(matrixIdx)%PTR=equationsMatrices%DYNAMIC_MATRICES%MATRICES(matrixIdx)%PTR
+        matricesCopy%DYNAMIC_MATRICES%MATRICES(matrixIdx)%PTR%DYNAMIC_MATRICES=>matricesCopy%DYNAMIC_MATRICES
+      ENDDO !matrixIdx
+    ENDIF
+    !Linear matrices
+    IF(ASSOCIATED(equationsMatrices%LINEAR_MATRICES)) THEN
+      ALLOCATE(matricesCopy%LINEAR_MATRICES,STAT=err)
+      IF(err/=0) CALL FlagError("Could not allocate linear matrices copy.",err,error,*999)
+      matricesCopy%LINEAR_MATRICES=equationsMatrices%LINEAR_MATRICES
+      matricesCopy%LINEAR_MATRICES%EQUATIONS_MATRICES=>matricesCopy
+      DO matrixIdx=1,matricesCopy%LINEAR_MATRICES%NUMBER_OF_LINEAR_MATRICES
+        NULLIFY(matricesCopy%LINEAR_MATRICES%MATRICES(matrixIdx)%PTR)
+      ENDDO !matrixIdx
+      DO matrixIdx=1,matricesCopy%LINEAR_MATRICES%NUMBER_OF_LINEAR_MATRICES
+        ALLOCATE(matricesCopy%LINEAR_MATRICES%MATRICES(matrixIdx)%PTR,STAT=err)
+        IF(err/=0) CALL FlagError("Could not allocate linear matrix copy.",err,error,*999)
+        matricesCopy%LINEAR_MATRICES%MATRICES(matrixIdx)%PTR=equationsMatrices%LINEAR_MATRICES%MATRICES(matrixIdx)%PTR
+        matricesCopy%LINEAR_MATRICES%MATRICES(matrixIdx)%PTR%LINEAR_MATRICES=>matricesCopy%LINEAR_MATRICES
+      ENDDO !matrixIdx
+    ENDIF
+    !Nonlinear matrices and vectors
+    IF(ASSOCIATED(equationsMatrices%NONLINEAR_MATRICES)) THEN
+      ALLOCATE(matricesCopy%NONLINEAR_MATRICES,STAT=err)
+      IF(err/=0) CALL FlagError("Could not allocate nonlinear matrices copy.",err,error,*999)
+      matricesCopy%NONLINEAR_MATRICES=equationsMatrices%NONLINEAR_MATRICES
+      matricesCopy%NONLINEAR_MATRICES%EQUATIONS_MATRICES=>matricesCopy
+      DO matrixIdx=1,matricesCopy%NONLINEAR_MATRICES%NUMBER_OF_JACOBIANS
+        NULLIFY(matricesCopy%NONLINEAR_MATRICES%JACOBIANS(matrixIdx)%PTR)
+      ENDDO !matrixIdx
+      DO matrixIdx=1,matricesCopy%NONLINEAR_MATRICES%NUMBER_OF_JACOBIANS
+        ALLOCATE(matricesCopy%NONLINEAR_MATRICES%JACOBIANS(matrixIdx)%PTR,STAT=err)
+        IF(err/=0) CALL FlagError("Could not allocate Jacobian matrix copy.",err,error,*999)
+        matricesCopy%NONLINEAR_MATRICES%JACOBIANS(matrixIdx)%PTR=equationsMatrices%NONLINEAR_MATRICES%JACOBIANS(matrixIdx)%PTR
+        matricesCopy%NONLINEAR_MATRICES%JACOBIANS(matrixIdx)%PTR%NONLINEAR_MATRICES=>matricesCopy%NONLINEAR_MATRICES
+      ENDDO !matrixIdx
+    ENDIF
+    !RHS vector
+    IF(ASSOCIATED(equationsMatrices%RHS_VECTOR)) THEN
+      ALLOCATE(matricesCopy%RHS_VECTOR,STAT=err)
+      IF(err/=0) CALL FlagError("Could not allocate RHS vector copy.",err,error,*999)
+      matricesCopy%RHS_VECTOR=equationsMatrices%RHS_VECTOR
+      matricesCopy%RHS_VECTOR%EQUATIONS_MATRICES=>matricesCopy
+    ENDIF
+    !Source vector
+    IF(ASSOCIATED(equationsMatrices%SOURCE_VECTOR)) THEN
+      ALLOCATE(matricesCopy%SOURCE_VECTOR,STAT=err)
+      IF(err/=0) CALL FlagError("Could not allocate source vector copy.",err,error,*999)
+      matricesCopy%SOURCE_VECTOR=equationsMatrices%SOURCE_VECTOR
+      matricesCopy%SOURCE_VECTOR%EQUATIONS_MATRICES=>matricesCopy
+    ENDIF
+
+    EXITS("EquationsMatrices_AssemblyCopyCreate")
+    RETURN
+999 CALL EquationsMatrices_AssemblyCopyDestroy(matricesCopy,dummyErr,dummyError,*998)
+998 ERRORSEXITS("EquationsMatrices_AssemblyCopyCreate",err,error)
+    RETURN 1
+  END SUBROUTINE EquationsMatrices_AssemblyCopyCreate
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Destroys a copy of equations matrices created for threaded assembly. The distributed matrices and vectors and element scatter maps shared with the original equations matrices are not destroyed.
+  SUBROUTINE EquationsMatrices_AssemblyCopyDestroy(matricesCopy,err,error,*)
+
+    !Argument variables
+    TYPE(EQUATIONS_MATRICES_TYPE), POINTER :: matricesCopy !<A pointer to the copy of the equations matrices to destroy
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    INTEGER(INTG) :: matrixIdx
+
+    ENTERS("EquationsMatrices_AssemblyCopyDestroy",err,error,*999)
+
+    IF(ASSOCIATED(matricesCopy)) THEN
+      IF(ASSOCIATED(matricesCopy%DYNAMIC_MATRICES)) THEN
+        IF(ALLOCATED(matricesCopy%DYNAMIC_MATRICES%MATRICES)) THEN
+          DO matrixIdx=1,SIZE(matricesCopy%DYNAMIC_MATRICES%MATRICES,1)
+            IF(ASSOCIATED(matricesCopy%DYNAMIC_MATRICES%MATRICES(matrixIdx)%PTR)) &
+              & DEALLOCATE(matricesCopy%DYNAMIC_MATRICES%MATRICES(matrixIdx)%PTR)
+          ENDDO !matrixIdx
+        ENDIF
+        DEALLOCATE(matricesCopy%DYNAMIC_MATRICES)
+      ENDIF
+      IF(ASSOCIATED(matricesCopy%LINEAR_MATRICES)) THEN
+        IF(ALLOCATED(matricesCopy%LINEAR_MATRICES%MATRICES)) THEN
+          DO matrixIdx=1,SIZE(matricesCopy%LINEAR_MATRICES%MATRICES,1)
+            IF(ASSOCIATED(matricesCopy%LINEAR_MATRICES%MATRICES(matrixIdx)%PTR)) &
+              & DEALLOCATE(matricesCopy%LINEAR_MATRICES%MATRICES(matrixIdx)%PTR)
+          ENDDO !matrixIdx
+        ENDIF
+        DEALLOCATE(matricesCopy%LINEAR_MATRICES)
+      ENDIF
+      IF(ASSOCIATED(matricesCopy%NONLINEAR_MATRICES)) THEN
+        IF(ALLOCATED(matricesCopy%NONLINEAR_MATRICES%JACOBIANS)) THEN
+          DO matrixIdx=1,SIZE(matricesCopy%NONLINEAR_MATRICES%JACOBIANS,1)
+            IF(ASSOCIATED(matricesCopy%NONLINEAR_MATRICES%JACOBIANS(matrixIdx)%PTR)) &
+              & DEALLOCATE(matricesCopy%NONLINEAR_MATRICES%JACOBIANS(matrixIdx)%PTR)
+          ENDDO !matrixIdx
+        ENDIF
+        DEALLOCATE(matricesCopy%NONLINEAR_MATRICES)
+      ENDIF
+      IF(ASSOCIATED(matricesCopy%RHS_VECTOR)) DEALLOCATE(matricesCopy%RHS_VECTOR)
+      IF(ASSOCIATED(matricesCopy%SOURCE_VECTOR)) DEALLOCATE(matricesCopy%SOURCE_VECTOR)
+      DEALLOCATE(matricesCopy)
+    ENDIF
+
+    EXITS("EquationsMatrices_AssemblyCopyDestroy")
+    RETURN
+999 ERRORSEXITS("EquationsMatrices_AssemblyCopyDestroy",err,error)
+    RETURN 1
+  END SUBROUTINE EquationsMatrices_AssemblyCopyDestroy
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Determines if the elements of equations matrices can be added on multiple threads at once. This is only possible if all the distributed matrices and vectors that elements are added to are CMISS matrices and vectors, as adding values to these does not modify any shared state other than the values themselves.
+  SUBROUTINE EquationsMatrices_ThreadedAssemblyCheck(equationsMatrices,threadedAssembly,err,error,*)
+
+    !Argument variables
+    TYPE(EQUATIONS_MATRICES_TYPE), POINTER :: equationsMatrices !<A pointer to the equations matrices to check
+    LOGICAL, INTENT(OUT) :: threadedAssembly !<On return, .TRUE. if the elements can be added on multiple threads, .FALSE. if not.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    INTEGER(INTG) :: libraryType,matrixIdx
+
+    ENTERS("EquationsMatrices_ThreadedAssemblyCheck",err,error,*999)
+
+    IF(.NOT.ASSOCIATED(equationsMatrices)) CALL FlagError("Equations matrices is not associated.",err,error,*999)
+
+    threadedAssembly=.TRUE.
+    IF(ASSOCIATED(equationsMatrices%DYNAMIC_MATRICES)) THEN
+      DO matrixIdx=1,equationsMatrices%DYNAMIC_MATRICES%NUMBER_OF_DYNAMIC_MATRICES
+        CALL DistributedMatrix_LibraryTypeGet(equationsMatrices%DYNAMIC_MATRICES%MATRICES(matrixIdx)%PTR%MATRIX, &
+          & libraryType,err,error,*999)
+        IF(libraryType/=DISTRIBUTED_MATRIX_VECTOR_CMISS_TYPE) threadedAssembly=.FALSE.
+      ENDDO !matrixIdx
+    ENDIF
+    IF(ASSOCIATED(equationsMatrices%LINEAR_MATRICES)) THEN
+      DO matrixIdx=1,equationsMatrices%LINEAR_MATRICES%NUMBER_OF_LINEAR_MATRICES
+        CALL DistributedMatrix_LibraryTypeGet(equationsMatrices%LINEAR_MATRICES%MATRICES(matrixIdx)%PTR%MATRIX, &
+          & libraryType,err,error,*999)
+        IF(libraryType/=DISTRIBUTED_MATRIX_VECTOR_CMISS_TYPE) threadedAssembly=.FALSE.
+      ENDDO !matrixIdx
+    ENDIF
+    IF(ASSOCIATED(equationsMatrices%NONLINEAR_MATRICES)) THEN
+      CALL DistributedVector_LibraryTypeGet(equationsMatrices%NONLINEAR_MATRICES%RESIDUAL,libraryType,err,error,*999)
+      IF(libraryType/=DISTRIBUTED_MATRIX_VECTOR_CMISS_TYPE) threadedAssembly=.FALSE.
+    ENDIF
+    IF(ASSOCIATED(equationsMatrices%RHS_VECTOR)) THEN
+      CALL DistributedVector_LibraryTypeGet(equationsMatrices%RHS_VECTOR%VECTOR,libraryType,err,error,*999)
+      IF(libraryType/=DISTRIBUTED_MATRIX_VECTOR_CMISS_TYPE) threadedAssembly=.FALSE.
+    ENDIF
+    IF(ASSOCIATED(equationsMatrices%SOURCE_VECTOR)) THEN
+      CALL DistributedVector_LibraryTypeGet(equationsMatrices%SOURCE_VECTOR%VECTOR,libraryType,err,error,*999)
+      IF(libraryType/=DISTRIBUTED_MATRIX_VECTOR_CMISS_TYPE) threadedAssembly=.FALSE.
+    ENDIF
+
+    EXITS("EquationsMatrices_ThreadedAssemblyCheck")
+    RETURN
+999 ERRORSEXITS("EquationsMatrices_ThreadedAssemblyCheck",err,error)
+    RETURN 1
+  END SUBROUTINE EquationsMatrices_ThreadedAssemblyCheck
+
+  !
+  !================================================================================================================================
+  !
+
   !>Calculate the positions in the equations matrices and rhs of the nodal matrices and rhs vector. Old CMISS name MELGE.
   SUBROUTINE EquationsMatrices_NodalCalculate(equationsMatrices,nodeNumber,err,error,*)
 
@@ -2912,6 +3257,7 @@ CONTAINS
       IF(ASSOCIATED(EQUATIONS_MATRIX%MATRIX)) CALL DISTRIBUTED_MATRIX_DESTROY(EQUATIONS_MATRIX%MATRIX,ERR,ERROR,*999)
       CALL EQUATIONS_MATRICES_ELEMENT_MATRIX_FINALISE(EQUATIONS_MATRIX%ELEMENT_MATRIX,ERR,ERROR,*999)
       CALL EquationsMatrices_NodalMatrixFinalise(EQUATIONS_MATRIX%NodalMatrix,ERR,ERROR,*999)
+      IF(ASSOCIATED(EQUATIONS_MATRIX%elementScatterMaps)) DEALLOCATE(EQUATIONS_MATRIX%elementScatterMaps)
       IF(ASSOCIATED(EQUATIONS_MATRIX%TEMP_VECTOR)) CALL DISTRIBUTED_VECTOR_DESTROY(EQUATIONS_MATRIX%TEMP_VECTOR,ERR,ERROR,*999)
     ENDIF
     
@@ -2973,6 +3319,7 @@ CONTAINS
                 CALL EquationsMatrices_ElementMatrixInitialise(EQUATIONS_MATRIX%ELEMENT_MATRIX,ERR,ERROR,*999)
                 CALL EquationsMatrices_NodalMatrixInitialise(EQUATIONS_MATRIX%NodalMatrix,ERR,ERROR,*999)
                 NULLIFY(EQUATIONS_MATRIX%TEMP_VECTOR)
+                NULLIFY(EQUATIONS_MATRIX%elementScatterMaps)
               ENDIF
             ELSE
               CALL FlagError("Equations mapping dynamic mapping is not associated.",ERR,ERROR,*998)
@@ -3052,6 +3399,7 @@ CONTAINS
                 CALL EquationsMatrices_ElementMatrixInitialise(EQUATIONS_MATRIX%ELEMENT_MATRIX,ERR,ERROR,*999)
                 CALL EquationsMatrices_NodalMatrixInitialise(EQUATIONS_MATRIX%NodalMatrix,ERR,ERROR,*999)
                 NULLIFY(EQUATIONS_MATRIX%TEMP_VECTOR)
+                NULLIFY(EQUATIONS_MATRIX%elementScatterMaps)
               ENDIF
             ELSE
               CALL FlagError("Equations mapping linear mapping is not associated.",ERR,ERROR,*998)
@@ -3197,11 +3545,8 @@ CONTAINS
           IF(ASSOCIATED(JACOBIAN_MATRIX)) THEN
             IF(JACOBIAN_MATRIX%UPDATE_JACOBIAN) THEN
               !Add in Jacobian element matrices
-              CALL DISTRIBUTED_MATRIX_VALUES_ADD(JACOBIAN_MATRIX%JACOBIAN,JACOBIAN_MATRIX%ELEMENT_JACOBIAN%ROW_DOFS(1: &
-                & JACOBIAN_MATRIX%ELEMENT_JACOBIAN%NUMBER_OF_ROWS),JACOBIAN_MATRIX%ELEMENT_JACOBIAN%COLUMN_DOFS(1: &
-                & JACOBIAN_MATRIX%ELEMENT_JACOBIAN%NUMBER_OF_COLUMNS),JACOBIAN_MATRIX%ELEMENT_JACOBIAN%MATRIX(1: &
-                & JACOBIAN_MATRIX%ELEMENT_JACOBIAN%NUMBER_OF_ROWS,1:JACOBIAN_MATRIX%ELEMENT_JACOBIAN%NUMBER_OF_COLUMNS), &
-                & ERR,ERROR,*999)
+              CALL EquationsMatrices_ElementMatrixAdd(JACOBIAN_MATRIX%JACOBIAN,JACOBIAN_MATRIX%ELEMENT_JACOBIAN, &
+                & JACOBIAN_MATRIX%elementScatterMaps,ERR,ERROR,*999)
             ENDIF
           ELSE
             LOCAL_ERROR="Jacobian matrix for Jacobian matrix index "// &
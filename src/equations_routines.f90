@@ -108,6 +108,8 @@ MODULE EQUATIONS_ROUTINES
 
   PUBLIC EQUATIONS_INITIALISE,EQUATIONS_FINALISE
 
+  PUBLIC EQUATIONS_INTERPOLATION_INITIALISE,EQUATIONS_INTERPOLATION_FINALISE
+
   PUBLIC EQUATIONS_LINEARITY_TYPE_GET,EQUATIONS_LINEARITY_TYPE_SET
 
   PUBLIC EQUATIONS_LUMPING_TYPE_GET,EQUATIONS_LUMPING_TYPE_SET
@@ -71,6 +71,9 @@ MODULE EQUATIONS_SET_ROUTINES
   USE MONODOMAIN_EQUATIONS_ROUTINES
 #ifndef NOMPIMOD
   USE MPI
+#endif
+#ifdef _OPENMP
+  USE OMP_LIB
 #endif
   USE MULTI_PHYSICS_ROUTINES
   USE NODE_ROUTINES
@@ -106,6 +109,8 @@ MODULE EQUATIONS_SET_ROUTINES
   PUBLIC EQUATIONS_SET_ANALYTIC_TIME_GET,EQUATIONS_SET_ANALYTIC_TIME_SET
   
   PUBLIC EQUATIONS_SET_ASSEMBLE
+
+  PUBLIC EquationsSet_AssemblyThreadsSet
   
   PUBLIC EQUATIONS_SET_BACKSUBSTITUTE,EQUATIONS_SET_NONLINEAR_RHS_UPDATE
   
@@ -984,6 +989,294 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Sets/changes the number of threads used to assemble the finite element equations of an equations set. The elements are coloured so that elements assembled at the same time do not share any nodes, and each thread calculates its elements with its own copy of the equations interpolation and element matrices. The equations set element calculation routines must therefore be thread safe, i.e., only write to the equations set element matrices and vectors. As the elements are summed in a different order the assembled values may differ from a single threaded assembly by rounding errors.
+  SUBROUTINE EquationsSet_AssemblyThreadsSet(equationsSet,numberOfThreads,err,error,*)
+
+    !Argument variables
+    TYPE(EQUATIONS_SET_TYPE), POINTER :: equationsSet !<A pointer to the equations set to set the number of assembly threads for
+    INTEGER(INTG), INTENT(IN) :: numberOfThreads !<The number of threads to assemble the equations set elements with
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("EquationsSet_AssemblyThreadsSet",err,error,*999)
+
+    IF(ASSOCIATED(equationsSet)) THEN
+      IF(numberOfThreads>=1) THEN
+        equationsSet%numberOfAssemblyThreads=numberOfThreads
+#ifndef _OPENMP
+        IF(numberOfThreads>1) CALL FlagWarning("OpenCMISS was not compiled with OpenMP. "// &
+          & "The equations set elements will be assembled on one thread.",err,error,*999)
+#endif
+      ELSE
+        localError="The specified number of threads of "//TRIM(NumberToVString(numberOfThreads,"*",err,error))// &
+          & " is invalid. The number of threads must be >= 1."
+        CALL FlagError(localError,err,error,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("Equations set is not associated.",err,error,*999)
+    ENDIF
+
+    EXITS("EquationsSet_AssemblyThreadsSet")
+    RETURN
+999 ERRORSEXITS("EquationsSet_AssemblyThreadsSet",err,error)
+    RETURN 1
+
+  END SUBROUTINE EquationsSet_AssemblyThreadsSet
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Determines whether the finite element equations of an equations set are to be assembled on multiple threads. Elements are assembled on a single thread if only one assembly thread has been set, if OpenCMISS was not compiled with OpenMP, if diagnostics or timing are on, if elements are added to PETSc matrices or vectors, if element matrices are output or if the elements could not be coloured.
+  SUBROUTINE EquationsSet_AssemblyThreadedCheck(equationsSet,threadedAssembly,err,error,*)
+
+    !Argument variables
+    TYPE(EQUATIONS_SET_TYPE), POINTER :: equationsSet !<A pointer to the equations set to check
+    LOGICAL, INTENT(OUT) :: threadedAssembly !<On return, .TRUE. if the elements are to be assembled on multiple threads, .FALSE. if not.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    LOGICAL :: diagnosticsOrTiming
+    TYPE(EQUATIONS_TYPE), POINTER :: equations
+
+    ENTERS("EquationsSet_AssemblyThreadedCheck",err,error,*999)
+
+    IF(.NOT.ASSOCIATED(equationsSet)) CALL FlagError("Equations set is not associated.",err,error,*999)
+    equations=>equationsSet%EQUATIONS
+    IF(.NOT.ASSOCIATED(equations)) CALL FlagError("Equations set equations is not associated.",err,error,*999)
+
+    !When diagnostics or timing are on every routine entry and exit updates the one routine stack, which the threads would corrupt
+    diagnosticsOrTiming=.FALSE.
+#ifdef WITH_DIAGNOSTICS
+    diagnosticsOrTiming=DIAG_OR_TIMING
+#endif
+    threadedAssembly=.FALSE.
+#ifdef _OPENMP
+    IF(equationsSet%numberOfAssemblyThreads>1.AND.equations%OUTPUT_TYPE<EQUATIONS_ELEMENT_MATRIX_OUTPUT.AND. &
+      & .NOT.diagnosticsOrTiming) THEN
+      CALL EquationsMatrices_ThreadedAssemblyCheck(equations%EQUATIONS_MATRICES,threadedAssembly,err,error,*999)
+      IF(threadedAssembly) THEN
+        IF(.NOT.ASSOCIATED(equationsSet%elementColouring)) &
+          & CALL EquationsSet_ElementColouringCalculate(equationsSet,err,error,*999)
+        threadedAssembly=equationsSet%elementColouring%numberOfColours>0
+      ENDIF
+    ENDIF
+#endif
+
+    EXITS("EquationsSet_AssemblyThreadedCheck")
+    RETURN
+999 ERRORSEXITS("EquationsSet_AssemblyThreadedCheck",err,error)
+    RETURN 1
+
+  END SUBROUTINE EquationsSet_AssemblyThreadedCheck
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Assembles the elements of a finite element equations set on multiple threads. The elements of each colour are shared between the threads, with each thread calculating and adding its elements using its own copy of the equations set.
+  SUBROUTINE EquationsSet_AssembleElementsThreaded(equationsSet,residualEvaluate,numberOfElements,err,error,*)
+
+    !Argument variables
+    TYPE(EQUATIONS_SET_TYPE), POINTER :: equationsSet !<A pointer to the equations set to assemble the elements for
+    LOGICAL, INTENT(IN) :: residualEvaluate !<If .TRUE. the element residuals are evaluated, otherwise the element matrices and vectors are calculated.
+    INTEGER(INTG), INTENT(OUT) :: numberOfElements !<On return, the number of elements that were assembled.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    INTEGER(INTG) :: colourIdx,dummyErr,elementIdx,numberOfThreads,threadErr,threadIdx
+    LOGICAL :: assemblyFailed,threadFailed
+    TYPE(EquationsSetElementColouringType), POINTER :: colouring
+    TYPE(EQUATIONS_SET_PTR_TYPE), ALLOCATABLE :: setCopies(:)
+    TYPE(VARYING_STRING) :: assemblyError,dummyError,threadError
+
+    ENTERS("EquationsSet_AssembleElementsThreaded",err,error,*998)
+
+    IF(.NOT.ASSOCIATED(equationsSet)) CALL FlagError("Equations set is not associated.",err,error,*998)
+    colouring=>equationsSet%elementColouring
+    IF(.NOT.ASSOCIATED(colouring)) CALL FlagError("Equations set element colouring is not associated.",err,error,*998)
+
+    numberOfThreads=equationsSet%numberOfAssemblyThreads
+    numberOfElements=colouring%colourStarts(colouring%numberOfColours+1)-1
+    !Set up the thread copies of the equations set before starting the threads so that errors can be handled normally
+    ALLOCATE(setCopies(numberOfThreads),STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate equations set copies.",err,error,*998)
+    DO threadIdx=1,numberOfThreads
+      NULLIFY(setCopies(threadIdx)%PTR)
+    ENDDO !threadIdx
+    DO threadIdx=1,numberOfThreads
+      CALL EquationsSet_AssemblyCopyCreate(equationsSet,setCopies(threadIdx)%PTR,err,error,*999)
+    ENDDO !threadIdx
+
+    !Errors can not be flagged inside the parallel region. A thread that fails skips its remaining elements but must still
+    !take part in each worksharing loop. The first error is flagged once all the threads have finished.
+    assemblyFailed=.FALSE.
+    !$OMP PARALLEL NUM_THREADS(numberOfThreads) DEFAULT(SHARED) &
+    !$OMP & PRIVATE(colourIdx,elementIdx,threadErr,threadError,threadFailed,threadIdx)
+    threadIdx=1
+#ifdef _OPENMP
+    threadIdx=OMP_GET_THREAD_NUM()+1
+#endif
+    threadFailed=.FALSE.
+    DO colourIdx=1,colouring%numberOfColours
+      !Elements of the same colour do not share any rows so can be added concurrently. The end of each worksharing loop
+      !is a barrier so the elements of the next colour are not started until all the elements of this colour are added.
+      !$OMP DO SCHEDULE(STATIC)
+      DO elementIdx=colouring%colourStarts(colourIdx),colouring%colourStarts(colourIdx+1)-1
+        IF(.NOT.threadFailed) THEN
+          threadFailed=.TRUE.
+          CALL EquationsSet_AssemblyElementEvaluate(setCopies(threadIdx)%PTR,colouring%elements(elementIdx),residualEvaluate, &
+            & threadErr,threadError,*10)
+          threadFailed=.FALSE.
+        ENDIF
+10    ENDDO !elementIdx
+      !$OMP END DO
+    ENDDO !colourIdx
+    IF(threadFailed) THEN
+      !$OMP CRITICAL(EQUATIONSSET_ASSEMBLEELEMENTSTHREADED_1)
+      IF(.NOT.assemblyFailed) THEN
+        assemblyFailed=.TRUE.
+        assemblyError=threadError
+      ENDIF
+      !$OMP END CRITICAL(EQUATIONSSET_ASSEMBLEELEMENTSTHREADED_1)
+    ENDIF
+    !$OMP END PARALLEL
+    IF(assemblyFailed) CALL FlagError(assemblyError,err,error,*999)
+
+    DO threadIdx=1,numberOfThreads
+      CALL EquationsSet_AssemblyCopyDestroy(setCopies(threadIdx)%PTR,err,error,*999)
+    ENDDO !threadIdx
+    DEALLOCATE(setCopies)
+
+    EXITS("EquationsSet_AssembleElementsThreaded")
+    RETURN
+999 DO threadIdx=1,SIZE(setCopies,1)
+      CALL EquationsSet_AssemblyCopyDestroy(setCopies(threadIdx)%PTR,dummyErr,dummyError,*997)
+997 ENDDO !threadIdx
+    DEALLOCATE(setCopies)
+998 ERRORSEXITS("EquationsSet_AssembleElementsThreaded",err,error)
+    RETURN 1
+
+  END SUBROUTINE EquationsSet_AssembleElementsThreaded
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Calculates the element matrices and vectors, or evaluates the element residual, for an element and adds them to the equations matrices and vectors.
+  SUBROUTINE EquationsSet_AssemblyElementEvaluate(equationsSet,elementNumber,residualEvaluate,err,error,*)
+
+    !Argument variables
+    TYPE(EQUATIONS_SET_TYPE), POINTER :: equationsSet !<A pointer to the equations set to assemble the element for
+    INTEGER(INTG), INTENT(IN) :: elementNumber !<The local element number to assemble
+    LOGICAL, INTENT(IN) :: residualEvaluate !<If .TRUE. the element residual is evaluated, otherwise the element matrices and vectors are calculated.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    TYPE(EQUATIONS_MATRICES_TYPE), POINTER :: equationsMatrices
+
+    ENTERS("EquationsSet_AssemblyElementEvaluate",err,error,*999)
+
+    equationsMatrices=>equationsSet%EQUATIONS%EQUATIONS_MATRICES
+    CALL EQUATIONS_MATRICES_ELEMENT_CALCULATE(equationsMatrices,elementNumber,err,error,*999)
+    IF(residualEvaluate) THEN
+      CALL EquationsSet_FiniteElementResidualEvaluate(equationsSet,elementNumber,err,error,*999)
+    ELSE
+      CALL EQUATIONS_SET_FINITE_ELEMENT_CALCULATE(equationsSet,elementNumber,err,error,*999)
+    ENDIF
+    CALL EQUATIONS_MATRICES_ELEMENT_ADD(equationsMatrices,err,error,*999)
+
+    EXITS("EquationsSet_AssemblyElementEvaluate")
+    RETURN
+999 ERRORSEXITS("EquationsSet_AssemblyElementEvaluate",err,error)
+    RETURN 1
+
+  END SUBROUTINE EquationsSet_AssemblyElementEvaluate
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Creates a copy of an equations set for assembling elements on a thread. The copy has its own equations interpolation and element matrices and vectors but shares the fields, equations mapping and distributed matrices and vectors of the equations set. The element matrices and vectors of the equations set must have been initialised.
+  SUBROUTINE EquationsSet_AssemblyCopyCreate(equationsSet,setCopy,err,error,*)
+
+    !Argument variables
+    TYPE(EQUATIONS_SET_TYPE), POINTER :: equationsSet !<A pointer to the equations set to copy
+    TYPE(EQUATIONS_SET_TYPE), POINTER :: setCopy !<On return, a pointer to the copy of the equations set. Must not be associated on entry.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    INTEGER(INTG) :: dummyErr
+    TYPE(EQUATIONS_TYPE), POINTER :: equations
+    TYPE(VARYING_STRING) :: dummyError
+
+    ENTERS("EquationsSet_AssemblyCopyCreate",err,error,*998)
+
+    IF(.NOT.ASSOCIATED(equationsSet)) CALL FlagError("Equations set is not associated.",err,error,*998)
+    IF(ASSOCIATED(setCopy)) CALL FlagError("Equations set copy is already associated.",err,error,*998)
+    equations=>equationsSet%EQUATIONS
+    IF(.NOT.ASSOCIATED(equations)) CALL FlagError("Equations set equations is not associated.",err,error,*998)
+
+    ALLOCATE(setCopy,STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate equations set copy.",err,error,*998)
+    setCopy=equationsSet
+    NULLIFY(setCopy%EQUATIONS)
+    NULLIFY(setCopy%elementColouring)
+    ALLOCATE(setCopy%EQUATIONS,STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate equations copy.",err,error,*999)
+    setCopy%EQUATIONS=equations
+    setCopy%EQUATIONS%EQUATIONS_SET=>setCopy
+    NULLIFY(setCopy%EQUATIONS%INTERPOLATION)
+    NULLIFY(setCopy%EQUATIONS%EQUATIONS_MATRICES)
+    CALL EquationsMatrices_AssemblyCopyCreate(equations%EQUATIONS_MATRICES,setCopy%EQUATIONS, &
+      & setCopy%EQUATIONS%EQUATIONS_MATRICES,err,error,*999)
+    CALL EQUATIONS_INTERPOLATION_INITIALISE(setCopy%EQUATIONS,err,error,*999)
+
+    EXITS("EquationsSet_AssemblyCopyCreate")
+    RETURN
+999 CALL EquationsSet_AssemblyCopyDestroy(setCopy,dummyErr,dummyError,*998)
+998 ERRORSEXITS("EquationsSet_AssemblyCopyCreate",err,error)
+    RETURN 1
+
+  END SUBROUTINE EquationsSet_AssemblyCopyCreate
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Destroys a copy of an equations set created for threaded assembly.
+  SUBROUTINE EquationsSet_AssemblyCopyDestroy(setCopy,err,error,*)
+
+    !Argument variables
+    TYPE(EQUATIONS_SET_TYPE), POINTER :: setCopy !<A pointer to the copy of the equations set to destroy
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+
+    ENTERS("EquationsSet_AssemblyCopyDestroy",err,error,*999)
+
+    IF(ASSOCIATED(setCopy)) THEN
+      IF(ASSOCIATED(setCopy%EQUATIONS)) THEN
+        CALL EQUATIONS_INTERPOLATION_FINALISE(setCopy%EQUATIONS%INTERPOLATION,err,error,*999)
+        CALL EquationsMatrices_AssemblyCopyDestroy(setCopy%EQUATIONS%EQUATIONS_MATRICES,err,error,*999)
+        DEALLOCATE(setCopy%EQUATIONS)
+      ENDIF
+      DEALLOCATE(setCopy)
+    ENDIF
+
+    EXITS("EquationsSet_AssemblyCopyDestroy")
+    RETURN
+999 ERRORSEXITS("EquationsSet_AssemblyCopyDestroy",err,error)
+    RETURN 1
+
+  END SUBROUTINE EquationsSet_AssemblyCopyDestroy
+
+  !
+  !================================================================================================================================
+  !
+
   !>Assembles the equations for an equations set.
   SUBROUTINE EQUATIONS_SET_ASSEMBLE(EQUATIONS_SET,ERR,ERROR,*)
 
@@ -1154,6 +1447,7 @@ CONTAINS
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
     INTEGER(INTG) :: element_idx,ne,NUMBER_OF_TIMES
+    LOGICAL :: threadedAssembly
     REAL(SP) :: ELEMENT_USER_ELAPSED,ELEMENT_SYSTEM_ELAPSED,USER_ELAPSED,USER_TIME1(1),USER_TIME2(1),USER_TIME3(1),USER_TIME4(1), &
       & USER_TIME5(1),USER_TIME6(1),SYSTEM_ELAPSED,SYSTEM_TIME1(1),SYSTEM_TIME2(1),SYSTEM_TIME3(1),SYSTEM_TIME4(1), &
       & SYSTEM_TIME5(1),SYSTEM_TIME6(1)
@@ -1269,24 +1563,30 @@ CONTAINS
             ENDIF
             
             !Loop over the internal elements
-            DO element_idx=ELEMENTS_MAPPING%INTERNAL_START, ELEMENTS_MAPPING%INTERNAL_FINISH
-              !here only the internal elements are considered
+            CALL EquationsSet_AssemblyThreadedCheck(EQUATIONS_SET,threadedAssembly,ERR,ERROR,*999)
+            IF(threadedAssembly) THEN
+              !Assemble the internal, boundary and ghost elements together, one element colour at a time
+              CALL EquationsSet_AssembleElementsThreaded(EQUATIONS_SET,.FALSE.,NUMBER_OF_TIMES,ERR,ERROR,*999)
+            ELSE
+              DO element_idx=ELEMENTS_MAPPING%INTERNAL_START, ELEMENTS_MAPPING%INTERNAL_FINISH
+                !here only the internal elements are considered
               
-              ne=ELEMENTS_MAPPING%DOMAIN_LIST(element_idx)
-              IF (DEBUGGING) PRINT*, "element index ", element_idx,", ne=",ne
+                ne=ELEMENTS_MAPPING%DOMAIN_LIST(element_idx)
+                IF (DEBUGGING) PRINT*, "element index ", element_idx,", ne=",ne
               
-              !CALL Print_EQUATIONS_MATRICES(EQUATIONS_MATRICES, 4, 5)
-              !PRINT*, "======================"
-              !CALL Print_EQUATIONS_SET(EQUATIONS_SET, 4, 5)
-              !STOP
+                !CALL Print_EQUATIONS_MATRICES(EQUATIONS_MATRICES, 4, 5)
+                !PRINT*, "======================"
+                !CALL Print_EQUATIONS_SET(EQUATIONS_SET, 4, 5)
+                !STOP
               
-              NUMBER_OF_TIMES=NUMBER_OF_TIMES+1
-              CALL EQUATIONS_MATRICES_ELEMENT_CALCULATE(EQUATIONS_MATRICES,ne,ERR,ERROR,*999)
+                NUMBER_OF_TIMES=NUMBER_OF_TIMES+1
+                CALL EQUATIONS_MATRICES_ELEMENT_CALCULATE(EQUATIONS_MATRICES,ne,ERR,ERROR,*999)
               
-              CALL EQUATIONS_SET_FINITE_ELEMENT_CALCULATE(EQUATIONS_SET,ne,ERR,ERROR,*999)
+                CALL EQUATIONS_SET_FINITE_ELEMENT_CALCULATE(EQUATIONS_SET,ne,ERR,ERROR,*999)
               
-              CALL EQUATIONS_MATRICES_ELEMENT_ADD(EQUATIONS_MATRICES,ERR,ERROR,*999)
-            ENDDO !element_idx
+                CALL EQUATIONS_MATRICES_ELEMENT_ADD(EQUATIONS_MATRICES,ERR,ERROR,*999)
+              ENDDO !element_idx
+            ENDIF
             
             !PRINT*, "Stop execution in equations_set_routines.f90:1257"
             !STOP
@@ -1317,13 +1617,15 @@ CONTAINS
                 & ERR,ERROR,*999)
             ENDIF
             !Loop over the boundary and ghost elements
-            DO element_idx=ELEMENTS_MAPPING%BOUNDARY_START,ELEMENTS_MAPPING%GHOST_FINISH
-              ne=ELEMENTS_MAPPING%DOMAIN_LIST(element_idx)
-              NUMBER_OF_TIMES=NUMBER_OF_TIMES+1
-              CALL EQUATIONS_MATRICES_ELEMENT_CALCULATE(EQUATIONS_MATRICES,ne,ERR,ERROR,*999)
-              CALL EQUATIONS_SET_FINITE_ELEMENT_CALCULATE(EQUATIONS_SET,ne,ERR,ERROR,*999)
-              CALL EQUATIONS_MATRICES_ELEMENT_ADD(EQUATIONS_MATRICES,ERR,ERROR,*999)
-            ENDDO !element_idx
+            IF(.NOT.threadedAssembly) THEN
+              DO element_idx=ELEMENTS_MAPPING%BOUNDARY_START,ELEMENTS_MAPPING%GHOST_FINISH
+                ne=ELEMENTS_MAPPING%DOMAIN_LIST(element_idx)
+                NUMBER_OF_TIMES=NUMBER_OF_TIMES+1
+                CALL EQUATIONS_MATRICES_ELEMENT_CALCULATE(EQUATIONS_MATRICES,ne,ERR,ERROR,*999)
+                CALL EQUATIONS_SET_FINITE_ELEMENT_CALCULATE(EQUATIONS_SET,ne,ERR,ERROR,*999)
+                CALL EQUATIONS_MATRICES_ELEMENT_ADD(EQUATIONS_MATRICES,ERR,ERROR,*999)
+              ENDDO !element_idx
+            ENDIF
             !Output timing information if required
             IF(EQUATIONS%OUTPUT_TYPE>=EQUATIONS_TIMING_OUTPUT) THEN
               CALL CPU_TIMER(USER_CPU,USER_TIME5,ERR,ERROR,*999)
@@ -1393,6 +1695,7 @@ CONTAINS
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
     INTEGER(INTG) :: element_idx,ne,NUMBER_OF_TIMES
+    LOGICAL :: threadedAssembly
     REAL(SP) :: ELEMENT_USER_ELAPSED,ELEMENT_SYSTEM_ELAPSED,USER_ELAPSED,USER_TIME1(1),USER_TIME2(1),USER_TIME3(1),USER_TIME4(1), &
       & USER_TIME5(1),USER_TIME6(1),SYSTEM_ELAPSED,SYSTEM_TIME1(1),SYSTEM_TIME2(1),SYSTEM_TIME3(1),SYSTEM_TIME4(1), &
       & SYSTEM_TIME5(1),SYSTEM_TIME6(1)
@@ -1458,21 +1761,27 @@ CONTAINS
 #ifdef TAUPROF
             CALL TAU_STATIC_PHASE_START("Internal Elements Loop")
 #endif
-            DO element_idx=ELEMENTS_MAPPING%INTERNAL_START,ELEMENTS_MAPPING%INTERNAL_FINISH
+            CALL EquationsSet_AssemblyThreadedCheck(EQUATIONS_SET,threadedAssembly,ERR,ERROR,*999)
+            IF(threadedAssembly) THEN
+              !Assemble the internal, boundary and ghost elements together, one element colour at a time
+              CALL EquationsSet_AssembleElementsThreaded(EQUATIONS_SET,.FALSE.,NUMBER_OF_TIMES,ERR,ERROR,*999)
+            ELSE
+              DO element_idx=ELEMENTS_MAPPING%INTERNAL_START,ELEMENTS_MAPPING%INTERNAL_FINISH
 !#ifdef TAUPROF
 !              WRITE (CVAR,'(a23,i3)') 'Internal Elements Loop ',element_idx
 !              CALL TAU_PHASE_CREATE_DYNAMIC(PHASE,CVAR)
 !              CALL TAU_PHASE_START(PHASE)
 !#endif
-              ne=ELEMENTS_MAPPING%DOMAIN_LIST(element_idx)
-              NUMBER_OF_TIMES=NUMBER_OF_TIMES+1
-              CALL EQUATIONS_MATRICES_ELEMENT_CALCULATE(EQUATIONS_MATRICES,ne,ERR,ERROR,*999)
-              CALL EQUATIONS_SET_FINITE_ELEMENT_CALCULATE(EQUATIONS_SET,ne,ERR,ERROR,*999)
-              CALL EQUATIONS_MATRICES_ELEMENT_ADD(EQUATIONS_MATRICES,ERR,ERROR,*999)
+                ne=ELEMENTS_MAPPING%DOMAIN_LIST(element_idx)
+                NUMBER_OF_TIMES=NUMBER_OF_TIMES+1
+                CALL EQUATIONS_MATRICES_ELEMENT_CALCULATE(EQUATIONS_MATRICES,ne,ERR,ERROR,*999)
+                CALL EQUATIONS_SET_FINITE_ELEMENT_CALCULATE(EQUATIONS_SET,ne,ERR,ERROR,*999)
+                CALL EQUATIONS_MATRICES_ELEMENT_ADD(EQUATIONS_MATRICES,ERR,ERROR,*999)
 !#ifdef TAUPROF
 !              CALL TAU_PHASE_STOP(PHASE)
 !#endif
-            ENDDO !element_idx
+              ENDDO !element_idx
+            ENDIF
 #ifdef TAUPROF
             CALL TAU_STATIC_PHASE_STOP("Internal Elements Loop")
 #endif
@@ -1506,13 +1815,15 @@ CONTAINS
 #ifdef TAUPROF
             CALL TAU_STATIC_PHASE_START("Boundary and Ghost Elements Loop")
 #endif
-            DO element_idx=ELEMENTS_MAPPING%BOUNDARY_START,ELEMENTS_MAPPING%GHOST_FINISH
-              ne=ELEMENTS_MAPPING%DOMAIN_LIST(element_idx)
-              NUMBER_OF_TIMES=NUMBER_OF_TIMES+1
-              CALL EQUATIONS_MATRICES_ELEMENT_CALCULATE(EQUATIONS_MATRICES,ne,ERR,ERROR,*999)
-              CALL EQUATIONS_SET_FINITE_ELEMENT_CALCULATE(EQUATIONS_SET,ne,ERR,ERROR,*999)
-              CALL EQUATIONS_MATRICES_ELEMENT_ADD(EQUATIONS_MATRICES,ERR,ERROR,*999)
-            ENDDO !element_idx
+            IF(.NOT.threadedAssembly) THEN
+              DO element_idx=ELEMENTS_MAPPING%BOUNDARY_START,ELEMENTS_MAPPING%GHOST_FINISH
+                ne=ELEMENTS_MAPPING%DOMAIN_LIST(element_idx)
+                NUMBER_OF_TIMES=NUMBER_OF_TIMES+1
+                CALL EQUATIONS_MATRICES_ELEMENT_CALCULATE(EQUATIONS_MATRICES,ne,ERR,ERROR,*999)
+                CALL EQUATIONS_SET_FINITE_ELEMENT_CALCULATE(EQUATIONS_SET,ne,ERR,ERROR,*999)
+                CALL EQUATIONS_MATRICES_ELEMENT_ADD(EQUATIONS_MATRICES,ERR,ERROR,*999)
+              ENDDO !element_idx
+            ENDIF
 #ifdef TAUPROF
             CALL TAU_STATIC_PHASE_STOP("Boundary and Ghost Elements Loop")
 #endif
@@ -1591,6 +1902,7 @@ CONTAINS
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
     INTEGER(INTG) :: element_idx,ne,NUMBER_OF_TIMES
+    LOGICAL :: threadedAssembly
     REAL(SP) :: ELEMENT_USER_ELAPSED,ELEMENT_SYSTEM_ELAPSED,USER_ELAPSED,USER_TIME1(1),USER_TIME2(1),USER_TIME3(1),USER_TIME4(1), &
       & USER_TIME5(1),USER_TIME6(1),SYSTEM_ELAPSED,SYSTEM_TIME1(1),SYSTEM_TIME2(1),SYSTEM_TIME3(1),SYSTEM_TIME4(1), &
       & SYSTEM_TIME5(1),SYSTEM_TIME6(1)
@@ -1671,18 +1983,24 @@ CONTAINS
             END IF
 
             !Loop over the internal elements
-            DO element_idx = ELEMENTS_MAPPING%INTERNAL_START, ELEMENTS_MAPPING%INTERNAL_FINISH
-              ne = ELEMENTS_MAPPING%DOMAIN_LIST(element_idx)
-              NUMBER_OF_TIMES = NUMBER_OF_TIMES+1
-              CALL EQUATIONS_MATRICES_ELEMENT_CALCULATE(EQUATIONS_MATRICES,ne,ERR,ERROR,*999)
-              !PRINT*, "EquationsSet_FiniteElementResidualEvaluate(equation_set_routines.f90:1591)"
-              CALL EquationsSet_FiniteElementResidualEvaluate(EQUATIONS_SET,ne,ERR,ERROR,*999)
+            CALL EquationsSet_AssemblyThreadedCheck(EQUATIONS_SET,threadedAssembly,ERR,ERROR,*999)
+            IF(threadedAssembly) THEN
+              !Assemble the internal, boundary and ghost elements together, one element colour at a time
+              CALL EquationsSet_AssembleElementsThreaded(EQUATIONS_SET,.TRUE.,NUMBER_OF_TIMES,ERR,ERROR,*999)
+            ELSE
+              DO element_idx = ELEMENTS_MAPPING%INTERNAL_START, ELEMENTS_MAPPING%INTERNAL_FINISH
+                ne = ELEMENTS_MAPPING%DOMAIN_LIST(element_idx)
+                NUMBER_OF_TIMES = NUMBER_OF_TIMES+1
+                CALL EQUATIONS_MATRICES_ELEMENT_CALCULATE(EQUATIONS_MATRICES,ne,ERR,ERROR,*999)
+                !PRINT*, "EquationsSet_FiniteElementResidualEvaluate(equation_set_routines.f90:1591)"
+                CALL EquationsSet_FiniteElementResidualEvaluate(EQUATIONS_SET,ne,ERR,ERROR,*999)
               
-              !PRINT*, "Equations_SET"
-              !CALL Print_EQUATIONS_SET(EQUATIONS_SET, 2, 10)
+                !PRINT*, "Equations_SET"
+                !CALL Print_EQUATIONS_SET(EQUATIONS_SET, 2, 10)
               
-              CALL EQUATIONS_MATRICES_ELEMENT_ADD(EQUATIONS_MATRICES,ERR,ERROR,*999)
-            ENDDO !element_idx
+                CALL EQUATIONS_MATRICES_ELEMENT_ADD(EQUATIONS_MATRICES,ERR,ERROR,*999)
+              ENDDO !element_idx
+            ENDIF
 
             !Output timing information if required
             IF(EQUATIONS%OUTPUT_TYPE>=EQUATIONS_TIMING_OUTPUT) THEN
@@ -1711,14 +2029,16 @@ CONTAINS
             ENDIF
 
             !Loop over the boundary and ghost elements
-            DO element_idx = ELEMENTS_MAPPING%BOUNDARY_START, ELEMENTS_MAPPING%GHOST_FINISH
-              ne = ELEMENTS_MAPPING%DOMAIN_LIST(element_idx)
-              NUMBER_OF_TIMES = NUMBER_OF_TIMES+1
-              CALL EQUATIONS_MATRICES_ELEMENT_CALCULATE(EQUATIONS_MATRICES,ne,ERR,ERROR,*999)
-              !PRINT*, "EquationsSet_FiniteElementResidualEvaluate(1624)"
-              CALL EquationsSet_FiniteElementResidualEvaluate(EQUATIONS_SET,ne,ERR,ERROR,*999)
-              CALL EQUATIONS_MATRICES_ELEMENT_ADD(EQUATIONS_MATRICES,ERR,ERROR,*999)
-            ENDDO !element_idx
+            IF(.NOT.threadedAssembly) THEN
+              DO element_idx = ELEMENTS_MAPPING%BOUNDARY_START, ELEMENTS_MAPPING%GHOST_FINISH
+                ne = ELEMENTS_MAPPING%DOMAIN_LIST(element_idx)
+                NUMBER_OF_TIMES = NUMBER_OF_TIMES+1
+                CALL EQUATIONS_MATRICES_ELEMENT_CALCULATE(EQUATIONS_MATRICES,ne,ERR,ERROR,*999)
+                !PRINT*, "EquationsSet_FiniteElementResidualEvaluate(1624)"
+                CALL EquationsSet_FiniteElementResidualEvaluate(EQUATIONS_SET,ne,ERR,ERROR,*999)
+                CALL EQUATIONS_MATRICES_ELEMENT_ADD(EQUATIONS_MATRICES,ERR,ERROR,*999)
+              ENDDO !element_idx
+            ENDIF
 
             !Output timing information if required
             IF(EQUATIONS%OUTPUT_TYPE>=EQUATIONS_TIMING_OUTPUT) THEN
@@ -2827,6 +3147,187 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Calculates a colouring of the local elements of an equations set for threaded assembly. The elements are coloured greedily so that no two elements of the same colour share a node of the dependent field. If the dependent field has components that are not node or element based, e.g., constant components whose dofs are shared by all the elements, the elements can not be coloured and the number of colours is set to zero.
+  SUBROUTINE EquationsSet_ElementColouringCalculate(equationsSet,err,error,*)
+
+    !Argument variables
+    TYPE(EQUATIONS_SET_TYPE), POINTER :: equationsSet !<A pointer to the equations set to calculate the element colouring for
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+    INTEGER(INTG) :: colour,colourIdx,componentIdx,elementIdx,meshComponentIdx,ne,nodeIdx,np,numberOfElements, &
+      & numberOfLocalElements,surroundingElementIdx,variableIdx
+    INTEGER(INTG), ALLOCATABLE :: colourMarks(:),elementColours(:),elementList(:)
+    LOGICAL :: colourable
+    LOGICAL, ALLOCATABLE :: meshComponentsUsed(:)
+    TYPE(DECOMPOSITION_TYPE), POINTER :: decomposition
+    TYPE(DOMAIN_ELEMENTS_TYPE), POINTER :: domainElements
+    TYPE(DOMAIN_MAPPING_TYPE), POINTER :: elementsMapping
+    TYPE(DOMAIN_NODES_TYPE), POINTER :: domainNodes
+    TYPE(EquationsSetElementColouringType), POINTER :: colouring
+    TYPE(FIELD_TYPE), POINTER :: dependentField
+    TYPE(FIELD_VARIABLE_TYPE), POINTER :: fieldVariable
+
+    ENTERS("EquationsSet_ElementColouringCalculate",err,error,*999)
+
+    IF(.NOT.ASSOCIATED(equationsSet)) CALL FlagError("Equations set is not associated.",err,error,*999)
+    IF(ASSOCIATED(equationsSet%elementColouring)) &
+      & CALL FlagError("Equations set element colouring is already associated.",err,error,*999)
+    dependentField=>equationsSet%DEPENDENT%DEPENDENT_FIELD
+    IF(.NOT.ASSOCIATED(dependentField)) CALL FlagError("Dependent field is not associated.",err,error,*999)
+    decomposition=>dependentField%DECOMPOSITION
+    IF(.NOT.ASSOCIATED(decomposition)) CALL FlagError("Dependent field decomposition is not associated.",err,error,*999)
+    elementsMapping=>decomposition%DOMAIN(decomposition%MESH_COMPONENT_NUMBER)%PTR%MAPPINGS%ELEMENTS
+    IF(.NOT.ASSOCIATED(elementsMapping)) CALL FlagError("Decomposition elements mapping is not associated.",err,error,*999)
+
+    ALLOCATE(equationsSet%elementColouring,STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate equations set element colouring.",err,error,*999)
+    colouring=>equationsSet%elementColouring
+    colouring%numberOfColours=0
+
+    !Find the mesh components whose nodes the dependent field dofs are on. Element based dofs are only added to by their own
+    !element. Any other dofs may be added to by elements that do not share a node.
+    ALLOCATE(meshComponentsUsed(decomposition%MESH%NUMBER_OF_COMPONENTS),STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate mesh components used.",err,error,*999)
+    meshComponentsUsed=.FALSE.
+    colourable=.TRUE.
+    DO variableIdx=1,dependentField%NUMBER_OF_VARIABLES
+      fieldVariable=>dependentField%VARIABLES(variableIdx)
+      DO componentIdx=1,fieldVariable%NUMBER_OF_COMPONENTS
+        SELECT CASE(fieldVariable%COMPONENTS(componentIdx)%INTERPOLATION_TYPE)
+        CASE(FIELD_NODE_BASED_INTERPOLATION)
+          meshComponentsUsed(fieldVariable%COMPONENTS(componentIdx)%MESH_COMPONENT_NUMBER)=.TRUE.
+        CASE(FIELD_ELEMENT_BASED_INTERPOLATION)
+          !Do nothing
+        CASE DEFAULT
+          colourable=.FALSE.
+        END SELECT
+      ENDDO !componentIdx
+    ENDDO !variableIdx
+    DO meshComponentIdx=1,SIZE(meshComponentsUsed,1)
+      IF(meshComponentsUsed(meshComponentIdx)) THEN
+        domainNodes=>decomposition%DOMAIN(meshComponentIdx)%PTR%TOPOLOGY%NODES
+        DO np=1,domainNodes%TOTAL_NUMBER_OF_NODES
+          IF(domainNodes%NODES(np)%NUMBER_OF_SURROUNDING_ELEMENTS>0.AND. &
+            & .NOT.ASSOCIATED(domainNodes%NODES(np)%SURROUNDING_ELEMENTS)) colourable=.FALSE.
+        ENDDO !np
+      ENDIF
+    ENDDO !meshComponentIdx
+
+    IF(colourable) THEN
+      !List the elements in the order they are assembled
+      numberOfElements=(elementsMapping%INTERNAL_FINISH-elementsMapping%INTERNAL_START+1)+ &
+        & (elementsMapping%GHOST_FINISH-elementsMapping%BOUNDARY_START+1)
+      numberOfLocalElements=decomposition%TOPOLOGY%ELEMENTS%TOTAL_NUMBER_OF_ELEMENTS
+      ALLOCATE(elementList(numberOfElements),STAT=err)
+      IF(err/=0) CALL FlagError("Could not allocate element list.",err,error,*999)
+      elementList(1:elementsMapping%INTERNAL_FINISH-elementsMapping%INTERNAL_START+1)= &
+        & elementsMapping%DOMAIN_LIST(elementsMapping%INTERNAL_START:elementsMapping%INTERNAL_FINISH)
+      elementList(elementsMapping%INTERNAL_FINISH-elementsMapping%INTERNAL_START+2:numberOfElements)= &
+        & elementsMapping%DOMAIN_LIST(elementsMapping%BOUNDARY_START:elementsMapping%GHOST_FINISH)
+      !Give each element the lowest colour not used by an element it shares a node with
+      ALLOCATE(elementColours(numberOfLocalElements),STAT=err)
+      IF(err/=0) CALL FlagError("Could not allocate element colours.",err,error,*999)
+      ALLOCATE(colourMarks(numberOfElements+1),STAT=err)
+      IF(err/=0) CALL FlagError("Could not allocate colour marks.",err,error,*999)
+      elementColours=0
+      colourMarks=0
+      DO elementIdx=1,numberOfElements
+        ne=elementList(elementIdx)
+        DO meshComponentIdx=1,SIZE(meshComponentsUsed,1)
+          IF(meshComponentsUsed(meshComponentIdx)) THEN
+            domainElements=>decomposition%DOMAIN(meshComponentIdx)%PTR%TOPOLOGY%ELEMENTS
+            domainNodes=>decomposition%DOMAIN(meshComponentIdx)%PTR%TOPOLOGY%NODES
+            DO nodeIdx=1,domainElements%ELEMENTS(ne)%BASIS%NUMBER_OF_NODES
+              np=domainElements%ELEMENTS(ne)%ELEMENT_NODES(nodeIdx)
+              DO surroundingElementIdx=1,domainNodes%NODES(np)%NUMBER_OF_SURROUNDING_ELEMENTS
+                colour=elementColours(domainNodes%NODES(np)%SURROUNDING_ELEMENTS(surroundingElementIdx))
+                IF(colour>0) colourMarks(colour)=elementIdx
+              ENDDO !surroundingElementIdx
+            ENDDO !nodeIdx
+          ENDIF
+        ENDDO !meshComponentIdx
+        colour=1
+        DO WHILE(colourMarks(colour)==elementIdx)
+          colour=colour+1
+        ENDDO
+        elementColours(ne)=colour
+        colouring%numberOfColours=MAX(colouring%numberOfColours,colour)
+      ENDDO !elementIdx
+      !Sort the elements by colour, keeping the assembly order within each colour
+      ALLOCATE(colouring%colourStarts(colouring%numberOfColours+1),STAT=err)
+      IF(err/=0) CALL FlagError("Could not allocate element colouring colour starts.",err,error,*999)
+      ALLOCATE(colouring%elements(numberOfElements),STAT=err)
+      IF(err/=0) CALL FlagError("Could not allocate element colouring elements.",err,error,*999)
+      colouring%colourStarts=0
+      DO elementIdx=1,numberOfElements
+        colour=elementColours(elementList(elementIdx))
+        colouring%colourStarts(colour+1)=colouring%colourStarts(colour+1)+1
+      ENDDO !elementIdx
+      colouring%colourStarts(1)=1
+      DO colourIdx=1,colouring%numberOfColours
+        colouring%colourStarts(colourIdx+1)=colouring%colourStarts(colourIdx+1)+colouring%colourStarts(colourIdx)
+      ENDDO !colourIdx
+      colourMarks(1:colouring%numberOfColours)=colouring%colourStarts(1:colouring%numberOfColours)
+      DO elementIdx=1,numberOfElements
+        colour=elementColours(elementList(elementIdx))
+        colouring%elements(colourMarks(colour))=elementList(elementIdx)
+        colourMarks(colour)=colourMarks(colour)+1
+      ENDDO !elementIdx
+      IF(DIAGNOSTICS1) THEN
+        CALL WRITE_STRING(DIAGNOSTIC_OUTPUT_TYPE,"Equations set element colouring:",err,error,*999)
+        CALL WRITE_STRING_VALUE(DIAGNOSTIC_OUTPUT_TYPE,"  Number of elements = ",numberOfElements,err,error,*999)
+        CALL WRITE_STRING_VALUE(DIAGNOSTIC_OUTPUT_TYPE,"  Number of colours = ",colouring%numberOfColours,err,error,*999)
+      ENDIF
+      DEALLOCATE(colourMarks)
+      DEALLOCATE(elementColours)
+      DEALLOCATE(elementList)
+    ENDIF
+    DEALLOCATE(meshComponentsUsed)
+
+    EXITS("EquationsSet_ElementColouringCalculate")
+    RETURN
+999 IF(ALLOCATED(colourMarks)) DEALLOCATE(colourMarks)
+    IF(ALLOCATED(elementColours)) DEALLOCATE(elementColours)
+    IF(ALLOCATED(elementList)) DEALLOCATE(elementList)
+    IF(ALLOCATED(meshComponentsUsed)) DEALLOCATE(meshComponentsUsed)
+    ERRORSEXITS("EquationsSet_ElementColouringCalculate",err,error)
+    RETURN 1
+
+  END SUBROUTINE EquationsSet_ElementColouringCalculate
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Finalises the element colouring of an equations set and deallocates all memory.
+  SUBROUTINE EquationsSet_ElementColouringFinalise(elementColouring,err,error,*)
+
+    !Argument variables
+    TYPE(EquationsSetElementColouringType), POINTER :: elementColouring !<A pointer to the element colouring to finalise
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local Variables
+
+    ENTERS("EquationsSet_ElementColouringFinalise",err,error,*999)
+
+    IF(ASSOCIATED(elementColouring)) THEN
+      IF(ALLOCATED(elementColouring%colourStarts)) DEALLOCATE(elementColouring%colourStarts)
+      IF(ALLOCATED(elementColouring%elements)) DEALLOCATE(elementColouring%elements)
+      DEALLOCATE(elementColouring)
+    ENDIF
+
+    EXITS("EquationsSet_ElementColouringFinalise")
+    RETURN
+999 ERRORSEXITS("EquationsSet_ElementColouringFinalise",err,error)
+    RETURN 1
+
+  END SUBROUTINE EquationsSet_ElementColouringFinalise
+
+  !
+  !================================================================================================================================
+  !
+
   !>Finalise the equations set and deallocate all memory.
   SUBROUTINE EQUATIONS_SET_FINALISE(EQUATIONS_SET,ERR,ERROR,*)
 
@@ -2848,6 +3349,7 @@ CONTAINS
       CALL EQUATIONS_SET_EQUATIONS_SET_FIELD_FINALISE(EQUATIONS_SET%EQUATIONS_SET_FIELD,ERR,ERROR,*999)
       CALL EquationsSet_DerivedFinalise(EQUATIONS_SET%derived,ERR,ERROR,*999)
       IF(ASSOCIATED(EQUATIONS_SET%EQUATIONS)) CALL EQUATIONS_DESTROY(EQUATIONS_SET%EQUATIONS,ERR,ERROR,*999)
+      CALL EquationsSet_ElementColouringFinalise(EQUATIONS_SET%elementColouring,ERR,ERROR,*999)
       IF(ALLOCATED(EQUATIONS_SET%SPECIFICATION)) DEALLOCATE(EQUATIONS_SET%SPECIFICATION)
       DEALLOCATE(EQUATIONS_SET)
     ENDIF
@@ -3770,6 +4272,8 @@ CONTAINS
       NULLIFY(EQUATIONS_SET%derived)
       NULLIFY(EQUATIONS_SET%EQUATIONS)
       NULLIFY(EQUATIONS_SET%BOUNDARY_CONDITIONS)
+      EQUATIONS_SET%numberOfAssemblyThreads=1
+      NULLIFY(EQUATIONS_SET%elementColouring)
     ENDIF
        
     EXITS("EQUATIONS_SET_INITIALISE")
@@ -45,6 +45,7 @@
 !> Implements lists of Field IO operation
 MODULE FIELD_IO_ROUTINES
   USE BASE_ROUTINES
+  USE BINARY_FILE
   USE LISTS
   USE BASIS_ROUTINES
   USE MESH_ROUTINES
@@ -65,6 +66,7 @@ MODULE FIELD_IO_ROUTINES
 #endif
   USE CMISS_MPI
   USE INPUT_OUTPUT
+  USE SORTING
   USE DISTRIBUTED_MATRIX_VECTOR
 
 #include "macros.h"  
@@ -93,6 +95,14 @@ MODULE FIELD_IO_ROUTINES
   INTEGER(INTG), PARAMETER :: FIELD_IO_SCALE_FACTORS_NUMBER_TYPE=5
   INTEGER(INTG), PARAMETER :: FIELD_IO_SCALE_FACTORS_PROPERTY_TYPE=6
 
+  !>Tags of the CMISS binary node files
+  INTEGER(INTG), PARAMETER :: FIELD_IO_BINARY_HEADER_TAG=1 !<The exnode header text before the first node
+  INTEGER(INTG), PARAMETER :: FIELD_IO_BINARY_NODE_NUMBERS_TAG=2 !<The node numbers
+  INTEGER(INTG), PARAMETER :: FIELD_IO_BINARY_VALUE_COUNTS_TAG=3 !<The number of values of each node
+  INTEGER(INTG), PARAMETER :: FIELD_IO_BINARY_VALUES_TAG=4 !<The values of all the nodes, one node after another
+  INTEGER(INTG), PARAMETER :: FIELD_IO_BINARY_NUMBER_OF_TAGS=4
+  INTEGER(INTG), PARAMETER :: FIELD_IO_BINARY_NODE_FILE_VERSION(3)=[1,0,0]
+
   !Module types
 
   !>field variable component type pointer for IO
@@ -378,6 +388,62 @@ MODULE FIELD_IO_ROUTINES
       INTEGER(C_INT) :: FieldExport_VersionInfo
     END FUNCTION FieldExport_VersionInfo
 
+    FUNCTION FieldExport_AsynchronousSet(isAsynchronous) BIND(C,NAME="FieldExport_AsynchronousSet")
+      USE ISO_C_BINDING
+      INTEGER(C_INT), VALUE :: isAsynchronous
+      INTEGER(C_INT) :: FieldExport_AsynchronousSet
+    END FUNCTION FieldExport_AsynchronousSet
+
+    FUNCTION FieldExport_Wait() BIND(C,NAME="FieldExport_Wait")
+      USE ISO_C_BINDING
+      INTEGER(C_INT) :: FieldExport_Wait
+    END FUNCTION FieldExport_Wait
+
+    FUNCTION FieldImport_OpenSession( importType, filename, rank, numberOfRanks, handle ) &
+      & BIND(C,NAME="FieldImport_OpenSession")
+      USE ISO_C_BINDING
+      INTEGER(C_INT), VALUE :: importType
+      CHARACTER(C_CHAR), INTENT(IN) :: filename(*)
+      INTEGER(C_INT), VALUE :: rank
+      INTEGER(C_INT), VALUE :: numberOfRanks
+      INTEGER(C_INT), INTENT(OUT) :: handle
+      INTEGER(C_INT) :: FieldImport_OpenSession
+    END FUNCTION FieldImport_OpenSession
+
+    FUNCTION FieldImport_RecordCounts( handle, recordCount, entryCount ) BIND(C,NAME="FieldImport_RecordCounts")
+      USE ISO_C_BINDING
+      INTEGER(C_INT), VALUE :: handle
+      INTEGER(C_INT), INTENT(OUT) :: recordCount
+      INTEGER(C_INT), INTENT(OUT) :: entryCount
+      INTEGER(C_INT) :: FieldImport_RecordCounts
+    END FUNCTION FieldImport_RecordCounts
+
+    FUNCTION FieldImport_ElementRecords( handle, elementNumbers, nodeCounts, nodes ) &
+      & BIND(C,NAME="FieldImport_ElementRecords")
+      USE ISO_C_BINDING
+      INTEGER(C_INT), VALUE :: handle
+      INTEGER(C_INT), INTENT(OUT) :: elementNumbers(*)
+      INTEGER(C_INT), INTENT(OUT) :: nodeCounts(*)
+      INTEGER(C_INT), INTENT(OUT) :: nodes(*)
+      INTEGER(C_INT) :: FieldImport_ElementRecords
+    END FUNCTION FieldImport_ElementRecords
+
+    FUNCTION FieldImport_NodeRecords( handle, nodeNumbers, valueCounts, values ) &
+      & BIND(C,NAME="FieldImport_NodeRecords")
+      USE ISO_C_BINDING
+      INTEGER(C_INT), VALUE :: handle
+      INTEGER(C_INT), INTENT(OUT) :: nodeNumbers(*)
+      INTEGER(C_INT), INTENT(OUT) :: valueCounts(*)
+      REAL(C_DOUBLE), INTENT(OUT) :: values(*)
+      INTEGER(C_INT) :: FieldImport_NodeRecords
+    END FUNCTION FieldImport_NodeRecords
+
+    FUNCTION FieldImport_CloseSession( handle ) BIND(C,NAME="FieldImport_CloseSession")
+      USE ISO_C_BINDING
+      INTEGER(C_INT), VALUE :: handle
+      INTEGER(C_INT) :: FieldImport_CloseSession
+    END FUNCTION FieldImport_CloseSession
+
   END INTERFACE
 
   INTERFACE REALLOCATE
@@ -409,6 +475,10 @@ MODULE FIELD_IO_ROUTINES
 
   PUBLIC :: FIELD_IO_FIELDS_IMPORT, FIELD_IO_NODES_EXPORT, FIELD_IO_ELEMENTS_EXPORT
 
+  PUBLIC :: FIELD_IO_EXPORT_ASYNCHRONOUS_SET, FIELD_IO_EXPORT_WAIT
+
+  PUBLIC :: FIELD_IO_EXNODE_TO_BINARY, FIELD_IO_BINARY_NODES_READ
+
 
 CONTAINS
 
@@ -919,9 +989,9 @@ CONTAINS
       FIELD_IO_DERIVATIVE_INFO=PART_DERIV_S2
     ELSE IF("d2/ds2ds2"==LINE) THEN
       FIELD_IO_DERIVATIVE_INFO=PART_DERIV_S2_S2
-    ELSE IF("d/ds3"==LINE) THEN
+    ELSE IF("d2/ds1ds2"==LINE) THEN
       FIELD_IO_DERIVATIVE_INFO=PART_DERIV_S1_S2
-    ELSE IF("d2/ds3ds3"==LINE) THEN
+    ELSE IF("d/ds3"==LINE) THEN
       FIELD_IO_DERIVATIVE_INFO=PART_DERIV_S3
     ELSE IF("d2/ds3ds3"==LINE) THEN
       FIELD_IO_DERIVATIVE_INFO=PART_DERIV_S3_S3
@@ -955,6 +1025,8 @@ CONTAINS
       FIELD_IO_DERIVATIVE_INFO=PART_DERIV_S3_S4_S4
     ELSE IF("d3/ds4ds4ds4"==LINE) THEN
       FIELD_IO_DERIVATIVE_INFO=PART_DERIV_S4_S4_S4
+    ELSE IF("d4/ds1ds2ds3ds4"==LINE) THEN
+      FIELD_IO_DERIVATIVE_INFO=PART_DERIV_S1_S2_S3_S4
     ELSE
       FIELD_IO_DERIVATIVE_INFO=-1
       CALL FlagError("Could not recognize derivatives from input string",ERR,ERROR,*999)
@@ -1532,6 +1604,12 @@ CONTAINS
           &MESH_COMPONENTS_OF_FIELD_COMPONENTS, COMPONENTS_IN_FIELDS, &
           & NUMBER_OF_EXNODE_FILES, MASTER_COMPUTATIONAL_NUMBER, my_computational_node_number, FIELD_SCALING_TYPE, &
           & ERR, ERROR, *999)
+    ELSE IF(METHOD=="PARALLEL") THEN
+      CALL FieldIO_ImportParallel(NAME, .FALSE., REGION, MESH, MESH_USER_NUMBER, DECOMPOSITION, DECOMPOSITION_USER_NUMBER, &
+        & DECOMPOSITION_METHOD, FIELD_VALUES_SET_TYPE, FIELD_SCALING_TYPE, ERR, ERROR, *999)
+    ELSE IF(METHOD=="BINARY") THEN
+      CALL FieldIO_ImportParallel(NAME, .TRUE., REGION, MESH, MESH_USER_NUMBER, DECOMPOSITION, DECOMPOSITION_USER_NUMBER, &
+        & DECOMPOSITION_METHOD, FIELD_VALUES_SET_TYPE, FIELD_SCALING_TYPE, ERR, ERROR, *999)
     ELSE IF(METHOD=="MPIIO") THEN
       CALL FlagError("MPI IO has not been implemented",ERR,ERROR,*999)
     ELSE
@@ -1553,6 +1631,878 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Imports a mesh and the fields on it from exelem and exnode files. Every rank reads and parses its own byte range of each
+  !>file, so the files are read in parallel instead of through one rank. The elements and the node numbers are then gathered
+  !>on all ranks to create the mesh and the decomposition, and the node values are sent to the ranks whose domains hold the
+  !>nodes. All the elements must use one basis, and all the fields are interpolated on the same single mesh component. With
+  !>BINARY_NODES the nodes are read from .partN.binnode files written by FIELD_IO_EXNODE_TO_BINARY instead of the exnode files.
+  SUBROUTINE FieldIO_ImportParallel(NAME, BINARY_NODES, REGION, MESH, MESH_USER_NUMBER, DECOMPOSITION, &
+    & DECOMPOSITION_USER_NUMBER, DECOMPOSITION_METHOD, FIELD_VALUES_SET_TYPE, FIELD_SCALING_TYPE, ERR, ERROR, *)
+    !Argument variables
+    TYPE(VARYING_STRING), INTENT(IN) :: NAME !<The name of the files to import, without the .partN.exelem and .partN.exnode
+    LOGICAL, INTENT(IN) :: BINARY_NODES !<If .TRUE. read the nodes from the .partN.binnode files, otherwise from the exnode files
+    TYPE(REGION_TYPE), POINTER :: REGION !<The region to import into
+    TYPE(MESH_TYPE), POINTER :: MESH !<On exit, the imported mesh. Must not be associated on entry.
+    INTEGER(INTG), INTENT(IN) :: MESH_USER_NUMBER !<The user number for the mesh
+    TYPE(DECOMPOSITION_TYPE), POINTER :: DECOMPOSITION !<On exit, the decomposition of the imported mesh
+    INTEGER(INTG), INTENT(IN) :: DECOMPOSITION_USER_NUMBER !<The user number for the decomposition
+    INTEGER(INTG), INTENT(IN) :: DECOMPOSITION_METHOD !<The decomposition method
+    INTEGER(INTG), INTENT(IN) :: FIELD_VALUES_SET_TYPE !<The parameter set to import the node values into
+    INTEGER(INTG), INTENT(IN) :: FIELD_SCALING_TYPE !<The scaling type for the imported fields
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(BASIS_TYPE), POINTER :: BASIS
+    TYPE(FIELD_PTR_TYPE), ALLOCATABLE :: FIELDS(:)
+    TYPE(MeshElementsType), POINTER :: ELEMENTS
+    TYPE(NODES_TYPE), POINTER :: NODES
+    TYPE(VARYING_STRING) :: LOCAL_ERROR, NODE_EXTENSION
+    TYPE(VARYING_STRING), ALLOCATABLE :: FIELD_LABELS(:)
+    INTEGER(INTG), ALLOCATABLE :: COMPONENTS_IN_FIELDS(:), VALUE_COMPONENTS(:), VALUE_DERIVATIVES(:), VALUE_VERSIONS(:)
+    INTEGER(INTG), ALLOCATABLE :: LOCAL_NUMBERS(:), LOCAL_COUNTS(:), LOCAL_NODES(:), NODE_NUMBERS(:), NODE_VALUE_COUNTS(:)
+    INTEGER(INTG), ALLOCATABLE :: ELEMENT_NUMBERS(:), ELEMENT_NODE_COUNTS(:), ELEMENT_NODES(:), ELEMENT_INDICES(:)
+    INTEGER(INTG) :: NUMBER_OF_EXELEM_FILES, NUMBER_OF_NODE_FILES, NUMBER_OF_ELEMENTS, NUMBER_OF_NODES
+    INTEGER(INTG) :: NUMBER_OF_DIMENSIONS, NUMBER_OF_ELEMENT_NODES, NUMBER_OF_COMPUTATIONAL_NODES, FIELDTYPE, BASIS_USER_NUMBER
+    INTEGER(INTG) :: basis_idx, comp_idx, element_idx, field_idx, first_idx, node_idx
+    REAL(DP), ALLOCATABLE :: NODE_VALUES(:), LOCAL_VALUES(:)
+
+    ENTERS("FieldIO_ImportParallel",ERR,ERROR,*999)
+
+    IF(.NOT.ASSOCIATED(REGION)) CALL FlagError("Region is not associated.",ERR,ERROR,*999)
+    IF(.NOT.REGION%REGION_FINISHED) CALL FlagError("Region has not been finished.",ERR,ERROR,*999)
+    IF(ASSOCIATED(MESH)) CALL FlagError("Mesh is already associated.",ERR,ERROR,*999)
+    IF(ASSOCIATED(DECOMPOSITION)) CALL FlagError("Decomposition is already associated.",ERR,ERROR,*999)
+    NUMBER_OF_COMPUTATIONAL_NODES=COMPUTATIONAL_NODES_NUMBER_GET(ERR,ERROR)
+    IF(ERR/=0) GOTO 999
+    NUMBER_OF_DIMENSIONS=REGION%COORDINATE_SYSTEM%NUMBER_OF_DIMENSIONS
+
+    !The part files are numbered from zero without a break
+    CALL FieldIO_ImportFilesCount(NAME, ".exelem", NUMBER_OF_EXELEM_FILES, ERR, ERROR, *999)
+    IF(BINARY_NODES) THEN
+      NODE_EXTENSION=".binnode"
+    ELSE
+      NODE_EXTENSION=".exnode"
+    ENDIF
+    CALL FieldIO_ImportFilesCount(NAME, CHAR(NODE_EXTENSION), NUMBER_OF_NODE_FILES, ERR, ERROR, *999)
+    IF(NUMBER_OF_EXELEM_FILES==0) CALL FlagError("Could not find "//NAME//".part0.exelem.",ERR,ERROR,*999)
+    IF(NUMBER_OF_NODE_FILES==0) CALL FlagError("Could not find "//NAME//".part0"//NODE_EXTENSION//".",ERR,ERROR,*999)
+
+    !The node header is small, so every rank reads it rather than having it broadcast.
+    CALL FieldIO_ImportNodeHeaderRead(NAME//".part0", BINARY_NODES, FIELD_LABELS, COMPONENTS_IN_FIELDS, VALUE_COMPONENTS, &
+      & VALUE_DERIVATIVES, VALUE_VERSIONS, ERR, ERROR, *999)
+    CALL FieldIO_ImportNodeHeadersCheck(NAME, NUMBER_OF_NODE_FILES, BINARY_NODES, FIELD_LABELS, COMPONENTS_IN_FIELDS, &
+      & VALUE_COMPONENTS, VALUE_DERIVATIVES, VALUE_VERSIONS, ERR, ERROR, *999)
+
+    !Elements. Each rank parses its own part of the files, and the elements are gathered on every rank as the mesh topology
+    !is needed in full to decompose the mesh.
+    CALL FieldIO_ImportRecordsRead(NAME, IMPORT_TYPE_ELEMENTS, NUMBER_OF_EXELEM_FILES, LOCAL_NUMBERS, LOCAL_COUNTS, &
+      & LOCAL_NODES, LOCAL_VALUES, ERR, ERROR, *999)
+    CALL FieldIO_ImportIntegersAllGather(LOCAL_NUMBERS, ELEMENT_NUMBERS, ERR, ERROR, *999)
+    CALL FieldIO_ImportIntegersAllGather(LOCAL_COUNTS, ELEMENT_NODE_COUNTS, ERR, ERROR, *999)
+    CALL FieldIO_ImportIntegersAllGather(LOCAL_NODES, ELEMENT_NODES, ERR, ERROR, *999)
+    DEALLOCATE(LOCAL_NUMBERS, LOCAL_COUNTS, LOCAL_NODES, LOCAL_VALUES)
+    NUMBER_OF_ELEMENTS=SIZE(ELEMENT_NUMBERS,1)
+    IF(NUMBER_OF_ELEMENTS==0) CALL FlagError("No elements were found in the exelem files.",ERR,ERROR,*999)
+    NUMBER_OF_ELEMENT_NODES=ELEMENT_NODE_COUNTS(1)
+    IF(ANY(ELEMENT_NODE_COUNTS/=NUMBER_OF_ELEMENT_NODES)) &
+      & CALL FlagError("All the imported elements must have the same number of nodes.",ERR,ERROR,*999)
+    !Number the elements in order of their user numbers
+    ALLOCATE(ELEMENT_INDICES(NUMBER_OF_ELEMENTS),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate element indices.",ERR,ERROR,*999)
+    CALL INTRO_ISORT(ELEMENT_NUMBERS, ELEMENT_INDICES, ERR, ERROR, *999)
+    DO element_idx=2,NUMBER_OF_ELEMENTS
+      IF(ELEMENT_NUMBERS(element_idx)==ELEMENT_NUMBERS(element_idx-1)) THEN
+        LOCAL_ERROR="Element "//TRIM(NUMBER_TO_VSTRING(ELEMENT_NUMBERS(element_idx),"*",ERR,ERROR))// &
+          & " is defined more than once in the exelem files."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      ENDIF
+    ENDDO !element_idx
+
+    !Nodes. Only the node numbers are gathered, the values stay on the rank that read them until the decomposition is known.
+    IF(BINARY_NODES) THEN
+      CALL FieldIO_ImportBinaryRecordsRead(NAME, NUMBER_OF_NODE_FILES, LOCAL_NUMBERS, NODE_VALUE_COUNTS, NODE_VALUES, &
+        & ERR, ERROR, *999)
+      ALLOCATE(LOCAL_NODES(0),STAT=ERR)
+      IF(ERR/=0) CALL FlagError("Could not allocate local nodes.",ERR,ERROR,*999)
+    ELSE
+      CALL FieldIO_ImportRecordsRead(NAME, IMPORT_TYPE_NODES, NUMBER_OF_NODE_FILES, LOCAL_NUMBERS, NODE_VALUE_COUNTS, &
+        & LOCAL_NODES, NODE_VALUES, ERR, ERROR, *999)
+    ENDIF
+    CALL FieldIO_ImportIntegersAllGather(LOCAL_NUMBERS, NODE_NUMBERS, ERR, ERROR, *999)
+    NUMBER_OF_NODES=SIZE(NODE_NUMBERS,1)
+    IF(NUMBER_OF_NODES==0) CALL FlagError("No nodes were found in the exnode files.",ERR,ERROR,*999)
+    CALL INTRO_SORT(NODE_NUMBERS, ERR, ERROR, *999)
+    DO node_idx=2,NUMBER_OF_NODES
+      IF(NODE_NUMBERS(node_idx)==NODE_NUMBERS(node_idx-1)) THEN
+        LOCAL_ERROR="Node "//TRIM(NUMBER_TO_VSTRING(NODE_NUMBERS(node_idx),"*",ERR,ERROR))// &
+          & " is defined more than once in the exnode files."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      ENDIF
+    ENDDO !node_idx
+    NULLIFY(NODES)
+    CALL NODES_CREATE_START(REGION,NUMBER_OF_NODES,NODES,ERR,ERROR,*999)
+    !Set the user numbers from the last node back, so that no user number is still in use when it is set. The sorted user
+    !numbers are never less than the global numbers.
+    DO node_idx=NUMBER_OF_NODES,1,-1
+      IF(NODE_NUMBERS(node_idx)/=node_idx) CALL NODES_USER_NUMBER_SET(NODES,node_idx,NODE_NUMBERS(node_idx),ERR,ERROR,*999)
+    ENDDO !node_idx
+    CALL NODES_CREATE_FINISH(NODES,ERR,ERROR,*999)
+    DEALLOCATE(NODE_NUMBERS)
+
+    !Find a basis with the right number of nodes, or create the default linear Lagrange basis if it fits.
+    NULLIFY(BASIS)
+    BASIS_USER_NUMBER=0
+    DO basis_idx=1,BASIS_FUNCTIONS%NUMBER_BASIS_FUNCTIONS
+      BASIS_USER_NUMBER=MAX(BASIS_USER_NUMBER,BASIS_FUNCTIONS%BASES(basis_idx)%PTR%USER_NUMBER)
+    ENDDO !basis_idx
+    DO basis_idx=1,BASIS_FUNCTIONS%NUMBER_BASIS_FUNCTIONS
+      IF(BASIS_FUNCTIONS%BASES(basis_idx)%PTR%BASIS_FINISHED.AND. &
+        & BASIS_FUNCTIONS%BASES(basis_idx)%PTR%NUMBER_OF_XI==NUMBER_OF_DIMENSIONS.AND. &
+        & BASIS_FUNCTIONS%BASES(basis_idx)%PTR%NUMBER_OF_NODES==NUMBER_OF_ELEMENT_NODES) THEN
+        BASIS=>BASIS_FUNCTIONS%BASES(basis_idx)%PTR
+        EXIT
+      ENDIF
+    ENDDO !basis_idx
+    IF(.NOT.ASSOCIATED(BASIS)) THEN
+      IF(NUMBER_OF_ELEMENT_NODES/=2**NUMBER_OF_DIMENSIONS) THEN
+        LOCAL_ERROR="There is no basis with "//TRIM(NUMBER_TO_VSTRING(NUMBER_OF_DIMENSIONS,"*",ERR,ERROR))// &
+          & " xi directions and "//TRIM(NUMBER_TO_VSTRING(NUMBER_OF_ELEMENT_NODES,"*",ERR,ERROR))// &
+          & " nodes for the imported elements. Create the basis before importing."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      ENDIF
+      CALL BASIS_CREATE_START(BASIS_USER_NUMBER+1,BASIS,ERR,ERROR,*999)
+      CALL BASIS_NUMBER_OF_XI_SET(BASIS,NUMBER_OF_DIMENSIONS,ERR,ERROR,*999)
+      CALL BASIS_CREATE_FINISH(BASIS,ERR,ERROR,*999)
+    ENDIF
+
+    CALL MESH_CREATE_START(MESH_USER_NUMBER,REGION,NUMBER_OF_DIMENSIONS,MESH,ERR,ERROR,*999)
+    CALL MESH_NUMBER_OF_ELEMENTS_SET(MESH,NUMBER_OF_ELEMENTS,ERR,ERROR,*999)
+    CALL MESH_NUMBER_OF_COMPONENTS_SET(MESH,1,ERR,ERROR,*999)
+    NULLIFY(ELEMENTS)
+    CALL MESH_TOPOLOGY_ELEMENTS_CREATE_START(MESH,1,BASIS,ELEMENTS,ERR,ERROR,*999)
+    DO element_idx=1,NUMBER_OF_ELEMENTS
+      first_idx=(ELEMENT_INDICES(element_idx)-1)*NUMBER_OF_ELEMENT_NODES
+      CALL MESH_TOPOLOGY_ELEMENTS_ELEMENT_NODES_SET(element_idx,ELEMENTS, &
+        & ELEMENT_NODES(first_idx+1:first_idx+NUMBER_OF_ELEMENT_NODES),ERR,ERROR,*999)
+    ENDDO !element_idx
+    !As for the nodes, set the user numbers from the last element back.
+    DO element_idx=NUMBER_OF_ELEMENTS,1,-1
+      IF(ELEMENT_NUMBERS(element_idx)/=element_idx) &
+        & CALL MeshElements_ElementUserNumberSet(element_idx,ELEMENT_NUMBERS(element_idx),ELEMENTS,ERR,ERROR,*999)
+    ENDDO !element_idx
+    CALL MESH_TOPOLOGY_ELEMENTS_CREATE_FINISH(ELEMENTS,ERR,ERROR,*999)
+    CALL MESH_CREATE_FINISH(MESH,ERR,ERROR,*999)
+    DEALLOCATE(ELEMENT_NUMBERS, ELEMENT_NODE_COUNTS, ELEMENT_NODES, ELEMENT_INDICES)
+
+    CALL FIELD_IO_CREATE_DECOMPISTION(DECOMPOSITION, DECOMPOSITION_USER_NUMBER, DECOMPOSITION_METHOD, MESH, &
+      & NUMBER_OF_COMPUTATIONAL_NODES, ERR, ERROR, *999)
+
+    ALLOCATE(FIELDS(SIZE(COMPONENTS_IN_FIELDS,1)),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate fields.",ERR,ERROR,*999)
+    DO field_idx=1,SIZE(COMPONENTS_IN_FIELDS,1)
+      NULLIFY(FIELDS(field_idx)%PTR)
+      CALL FIELD_CREATE_START(field_idx,REGION,FIELDS(field_idx)%PTR,ERR,ERROR,*999)
+      CALL FIELD_NUMBER_OF_VARIABLES_SET(FIELDS(field_idx)%PTR,1,ERR,ERROR,*999)
+      CALL FIELD_MESH_DECOMPOSITION_SET(FIELDS(field_idx)%PTR,DECOMPOSITION,ERR,ERROR,*999)
+      CALL FIELD_NUMBER_OF_COMPONENTS_SET(FIELDS(field_idx)%PTR,FIELD_U_VARIABLE_TYPE,COMPONENTS_IN_FIELDS(field_idx), &
+        & ERR,ERROR,*999)
+      DO comp_idx=1,COMPONENTS_IN_FIELDS(field_idx)
+        CALL FIELD_COMPONENT_MESH_COMPONENT_SET(FIELDS(field_idx)%PTR,FIELD_U_VARIABLE_TYPE,comp_idx,1,ERR,ERROR,*999)
+      ENDDO !comp_idx
+      CALL FIELD_SCALING_TYPE_SET(FIELDS(field_idx)%PTR,FIELD_SCALING_TYPE,ERR,ERROR,*999)
+      CALL FIELD_IO_FIELD_INFO(FIELD_LABELS(field_idx),FIELD_IO_FIELD_LABEL,FIELDTYPE,ERR,ERROR,*999)
+      CALL FIELD_TYPE_SET(FIELDS(field_idx)%PTR,FIELDTYPE,ERR,ERROR,*999)
+      CALL FIELD_CREATE_FINISH(FIELDS(field_idx)%PTR,ERR,ERROR,*999)
+    ENDDO !field_idx
+
+    CALL FieldIO_ImportNodeValuesSet(FIELDS, COMPONENTS_IN_FIELDS, VALUE_COMPONENTS, VALUE_DERIVATIVES, VALUE_VERSIONS, &
+      & FIELD_VALUES_SET_TYPE, MESH, DECOMPOSITION, LOCAL_NUMBERS, NODE_VALUE_COUNTS, NODE_VALUES, ERR, ERROR, *999)
+
+    DEALLOCATE(FIELDS, FIELD_LABELS, COMPONENTS_IN_FIELDS, VALUE_COMPONENTS, VALUE_DERIVATIVES, VALUE_VERSIONS)
+    DEALLOCATE(LOCAL_NUMBERS, NODE_VALUE_COUNTS, LOCAL_NODES, NODE_VALUES)
+
+    EXITS("FieldIO_ImportParallel")
+    RETURN
+999 IF(ALLOCATED(FIELDS)) DEALLOCATE(FIELDS)
+    IF(ALLOCATED(FIELD_LABELS)) DEALLOCATE(FIELD_LABELS)
+    CALL CHECKED_DEALLOCATE(COMPONENTS_IN_FIELDS)
+    CALL CHECKED_DEALLOCATE(VALUE_COMPONENTS)
+    CALL CHECKED_DEALLOCATE(VALUE_DERIVATIVES)
+    CALL CHECKED_DEALLOCATE(VALUE_VERSIONS)
+    CALL CHECKED_DEALLOCATE(LOCAL_NUMBERS)
+    CALL CHECKED_DEALLOCATE(LOCAL_COUNTS)
+    CALL CHECKED_DEALLOCATE(LOCAL_NODES)
+    CALL CHECKED_DEALLOCATE(LOCAL_VALUES)
+    CALL CHECKED_DEALLOCATE(NODE_NUMBERS)
+    CALL CHECKED_DEALLOCATE(NODE_VALUE_COUNTS)
+    CALL CHECKED_DEALLOCATE(NODE_VALUES)
+    CALL CHECKED_DEALLOCATE(ELEMENT_NUMBERS)
+    CALL CHECKED_DEALLOCATE(ELEMENT_NODE_COUNTS)
+    CALL CHECKED_DEALLOCATE(ELEMENT_NODES)
+    CALL CHECKED_DEALLOCATE(ELEMENT_INDICES)
+    ERRORSEXITS("FieldIO_ImportParallel",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FieldIO_ImportParallel
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Counts the NAME.partN files with the given extension, numbered from zero without a break.
+  SUBROUTINE FieldIO_ImportFilesCount(NAME, EXTENSION, NUMBER_OF_FILES, ERR, ERROR, *)
+    !Argument variables
+    TYPE(VARYING_STRING), INTENT(IN) :: NAME !<The name of the files
+    CHARACTER(LEN=*), INTENT(IN) :: EXTENSION !<The file extension, including the dot
+    INTEGER(INTG), INTENT(OUT) :: NUMBER_OF_FILES !<On exit, the number of files
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: FILE_NAME
+    LOGICAL :: FILE_EXISTS
+
+    ENTERS("FieldIO_ImportFilesCount",ERR,ERROR,*999)
+
+    NUMBER_OF_FILES=0
+    DO
+      FILE_NAME=NAME//".part"//TRIM(NUMBER_TO_VSTRING(NUMBER_OF_FILES,"*",ERR,ERROR))//EXTENSION
+      INQUIRE(FILE=CHAR(FILE_NAME),EXIST=FILE_EXISTS)
+      IF(.NOT.FILE_EXISTS) EXIT
+      NUMBER_OF_FILES=NUMBER_OF_FILES+1
+    ENDDO
+
+    EXITS("FieldIO_ImportFilesCount")
+    RETURN
+999 ERRORSEXITS("FieldIO_ImportFilesCount",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FieldIO_ImportFilesCount
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads the field header at the top of an exnode file, or the exnode header kept in a binary node file. For each value of a
+  !>node record the field component, derivative and version it belongs to is returned, with the components numbered across all
+  !>the fields.
+  SUBROUTINE FieldIO_ImportNodeHeaderRead(NAME, BINARY_NODES, FIELD_LABELS, COMPONENTS_IN_FIELDS, VALUE_COMPONENTS, &
+    & VALUE_DERIVATIVES, VALUE_VERSIONS, ERR, ERROR, *)
+    !Argument variables
+    TYPE(VARYING_STRING), INTENT(IN) :: NAME !<The node file to read the header of, without the .exnode or .binnode extension
+    LOGICAL, INTENT(IN) :: BINARY_NODES !<If .TRUE. read NAME.binnode, otherwise read NAME.exnode
+    TYPE(VARYING_STRING), ALLOCATABLE, INTENT(OUT) :: FIELD_LABELS(:) !<On exit, FIELD_LABELS(field_idx). The header line of the field_idx'th field.
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: COMPONENTS_IN_FIELDS(:) !<On exit, COMPONENTS_IN_FIELDS(field_idx). The number of components of the field_idx'th field.
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: VALUE_COMPONENTS(:) !<On exit, VALUE_COMPONENTS(value_idx). The component the value_idx'th node value is for.
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: VALUE_DERIVATIVES(:) !<On exit, VALUE_DERIVATIVES(value_idx). The derivative the value_idx'th node value is for.
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: VALUE_VERSIONS(:) !<On exit, VALUE_VERSIONS(value_idx). The version the value_idx'th node value is for.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    CHARACTER(LEN=MAXSTRLEN) :: LINE
+    CHARACTER(LEN=MAXSTRLEN), ALLOCATABLE :: LINES(:)
+    TYPE(VARYING_STRING) :: FILE_NAME, HEADER, LOCAL_ERROR
+    INTEGER(INTG), PARAMETER :: MAX_NUMBER_OF_DERIVATIVES=8
+    INTEGER(INTG) :: DERIVATIVES(MAX_NUMBER_OF_DERIVATIVES)
+    INTEGER(INTG) :: IOS, NUMBER_OF_FIELDS, NUMBER_OF_COMPONENTS, NUMBER_OF_DERIVATIVES, NUMBER_OF_VERSIONS, NUMBER_OF_LINES
+    INTEGER(INTG) :: NUMBER_OF_VALUES, VALUE_INDEX, comp_idx, derivative_idx, field_idx, line_idx, pos, pos1, value_idx
+    INTEGER(INTG) :: version_idx
+    INTEGER(INTG), ALLOCATABLE :: NEW_VALUES(:)
+
+    ENTERS("FieldIO_ImportNodeHeaderRead",ERR,ERROR,*999)
+
+    IF(BINARY_NODES) THEN
+      FILE_NAME=NAME//".binnode"
+      CALL FieldIO_BinaryNodesHeaderRead(NAME,HEADER,ERR,ERROR,*999)
+    ELSE
+      FILE_NAME=NAME//".exnode"
+      CALL FieldIO_ExnodeHeaderRead(FILE_NAME,HEADER,ERR,ERROR,*999)
+    ENDIF
+    !Split the header text into its lines
+    NUMBER_OF_LINES=1
+    pos=1
+    DO
+      pos1=INDEX(EXTRACT(HEADER,pos),CHAR(10))
+      IF(pos1==0) EXIT
+      NUMBER_OF_LINES=NUMBER_OF_LINES+1
+      pos=pos+pos1
+    ENDDO
+    ALLOCATE(LINES(NUMBER_OF_LINES),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate header lines.",ERR,ERROR,*999)
+    pos=1
+    DO line_idx=1,SIZE(LINES,1)
+      pos1=INDEX(EXTRACT(HEADER,pos),CHAR(10))
+      IF(pos1==0) THEN
+        LINES(line_idx)=CHAR(EXTRACT(HEADER,pos))
+      ELSE
+        LINES(line_idx)=CHAR(EXTRACT(HEADER,pos,pos+pos1-2))
+        pos=pos+pos1
+      ENDIF
+    ENDDO !line_idx
+    line_idx=0
+    DO
+      CALL FieldIO_HeaderLineNext(LINES,line_idx,LINE,IOS)
+      IF(IOS/=0) CALL FlagError("Could not find the field header in "//FILE_NAME//".",ERR,ERROR,*999)
+      pos=INDEX(LINE,"#Fields=")
+      IF(pos/=0) EXIT
+    ENDDO
+    NUMBER_OF_FIELDS=STRING_TO_INTEGER(LINE(pos+8:),ERR,ERROR)
+    IF(ERR/=0) GOTO 999
+    IF(NUMBER_OF_FIELDS<1) CALL FlagError("Invalid number of fields in "//FILE_NAME//".",ERR,ERROR,*999)
+    ALLOCATE(FIELD_LABELS(NUMBER_OF_FIELDS),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate field labels.",ERR,ERROR,*999)
+    ALLOCATE(COMPONENTS_IN_FIELDS(NUMBER_OF_FIELDS),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate components in fields.",ERR,ERROR,*999)
+    ALLOCATE(VALUE_COMPONENTS(0),VALUE_DERIVATIVES(0),VALUE_VERSIONS(0),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate value information.",ERR,ERROR,*999)
+    NUMBER_OF_COMPONENTS=0
+    DO field_idx=1,NUMBER_OF_FIELDS
+      CALL FieldIO_HeaderLineNext(LINES,line_idx,LINE,IOS)
+      pos=INDEX(LINE,"#Components=")
+      IF(IOS/=0.OR.pos==0) CALL FlagError("Invalid field header in "//FILE_NAME//".",ERR,ERROR,*999)
+      FIELD_LABELS(field_idx)=TRIM(LINE)
+      COMPONENTS_IN_FIELDS(field_idx)=STRING_TO_INTEGER(LINE(pos+12:),ERR,ERROR)
+      IF(ERR/=0) GOTO 999
+      DO comp_idx=1,COMPONENTS_IN_FIELDS(field_idx)
+        NUMBER_OF_COMPONENTS=NUMBER_OF_COMPONENTS+1
+        CALL FieldIO_HeaderLineNext(LINES,line_idx,LINE,IOS)
+        pos=INDEX(LINE,"Value index=")
+        pos1=INDEX(LINE,"#Derivatives=")
+        IF(IOS/=0.OR.pos==0.OR.pos1==0) CALL FlagError("Invalid field component header in "//FILE_NAME//".",ERR,ERROR,*999)
+        VALUE_INDEX=STRING_TO_INTEGER(LINE(pos+12:pos1-1),ERR,ERROR)
+        IF(ERR/=0) GOTO 999
+        NUMBER_OF_DERIVATIVES=STRING_TO_INTEGER(LINE(pos1+13:),ERR,ERROR)+1
+        IF(ERR/=0) GOTO 999
+        IF(NUMBER_OF_DERIVATIVES<1.OR.NUMBER_OF_DERIVATIVES>MAX_NUMBER_OF_DERIVATIVES) THEN
+          LOCAL_ERROR="Invalid number of derivatives in "//FILE_NAME//": "//TRIM(LINE)
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        ENDIF
+        DERIVATIVES(1)=NO_PART_DERIV
+        IF(NUMBER_OF_DERIVATIVES>1) THEN
+          !The derivative labels are listed in brackets, e.g. (d/ds1,d/ds2,d2/ds1ds2)
+          pos=INDEX(LINE,"(")
+          pos1=INDEX(LINE,")")
+          IF(pos==0.OR.pos1<pos) CALL FlagError("Invalid derivative labels in "//FILE_NAME//".",ERR,ERROR,*999)
+          DO derivative_idx=2,NUMBER_OF_DERIVATIVES
+            IF(derivative_idx<NUMBER_OF_DERIVATIVES) THEN
+              pos1=pos+INDEX(LINE(pos+1:),",")
+            ELSE
+              pos1=INDEX(LINE,")")
+            ENDIF
+            DERIVATIVES(derivative_idx)=FIELD_IO_DERIVATIVE_INFO(VAR_STR(TRIM(ADJUSTL(LINE(pos+1:pos1-1)))),ERR,ERROR)
+            IF(ERR/=0) GOTO 999
+            pos=pos1
+          ENDDO !derivative_idx
+        ENDIF
+        NUMBER_OF_VERSIONS=1
+        pos=INDEX(LINE,"#Versions=")
+        IF(pos/=0) THEN
+          NUMBER_OF_VERSIONS=STRING_TO_INTEGER(LINE(pos+10:),ERR,ERROR)
+          IF(ERR/=0) GOTO 999
+        ENDIF
+        !The values for each version follow each other, with all the derivatives for a version together.
+        NUMBER_OF_VALUES=VALUE_INDEX-1+NUMBER_OF_VERSIONS*NUMBER_OF_DERIVATIVES
+        IF(VALUE_INDEX<1.OR.NUMBER_OF_VERSIONS<1) CALL FlagError("Invalid value index in "//FILE_NAME//".",ERR,ERROR,*999)
+        IF(NUMBER_OF_VALUES>SIZE(VALUE_COMPONENTS,1)) THEN
+          ALLOCATE(NEW_VALUES(NUMBER_OF_VALUES),STAT=ERR)
+          IF(ERR/=0) CALL FlagError("Could not allocate value information.",ERR,ERROR,*999)
+          NEW_VALUES=0
+          NEW_VALUES(1:SIZE(VALUE_COMPONENTS,1))=VALUE_COMPONENTS
+          CALL MOVE_ALLOC(NEW_VALUES,VALUE_COMPONENTS)
+          ALLOCATE(NEW_VALUES(NUMBER_OF_VALUES),STAT=ERR)
+          IF(ERR/=0) CALL FlagError("Could not allocate value information.",ERR,ERROR,*999)
+          NEW_VALUES(1:SIZE(VALUE_DERIVATIVES,1))=VALUE_DERIVATIVES
+          CALL MOVE_ALLOC(NEW_VALUES,VALUE_DERIVATIVES)
+          ALLOCATE(NEW_VALUES(NUMBER_OF_VALUES),STAT=ERR)
+          IF(ERR/=0) CALL FlagError("Could not allocate value information.",ERR,ERROR,*999)
+          NEW_VALUES(1:SIZE(VALUE_VERSIONS,1))=VALUE_VERSIONS
+          CALL MOVE_ALLOC(NEW_VALUES,VALUE_VERSIONS)
+        ENDIF
+        value_idx=VALUE_INDEX
+        DO version_idx=1,NUMBER_OF_VERSIONS
+          DO derivative_idx=1,NUMBER_OF_DERIVATIVES
+            IF(VALUE_COMPONENTS(value_idx)/=0) CALL FlagError("Overlapping value indices in "//FILE_NAME//".", &
+              & ERR,ERROR,*999)
+            VALUE_COMPONENTS(value_idx)=NUMBER_OF_COMPONENTS
+            VALUE_DERIVATIVES(value_idx)=DERIVATIVES(derivative_idx)
+            VALUE_VERSIONS(value_idx)=version_idx
+            value_idx=value_idx+1
+          ENDDO !derivative_idx
+        ENDDO !version_idx
+      ENDDO !comp_idx
+    ENDDO !field_idx
+    IF(ANY(VALUE_COMPONENTS==0)) CALL FlagError("The value indices in "//FILE_NAME//" have gaps.",ERR,ERROR,*999)
+    DEALLOCATE(LINES)
+
+    EXITS("FieldIO_ImportNodeHeaderRead")
+    RETURN
+999 IF(ALLOCATED(LINES)) DEALLOCATE(LINES)
+    ERRORSEXITS("FieldIO_ImportNodeHeaderRead",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FieldIO_ImportNodeHeaderRead
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Returns the next of the header LINES in LINE, with IOS non-zero when there are no more lines, as for a formatted read.
+  SUBROUTINE FieldIO_HeaderLineNext(LINES, LINE_INDEX, LINE, IOS)
+    !Argument variables
+    CHARACTER(LEN=*), INTENT(IN) :: LINES(:) !<The header lines
+    INTEGER(INTG), INTENT(INOUT) :: LINE_INDEX !<The index of the last line returned. On exit, the index of LINE.
+    CHARACTER(LEN=*), INTENT(OUT) :: LINE !<On exit, the next line
+    INTEGER(INTG), INTENT(OUT) :: IOS !<On exit, zero if a line was returned, otherwise -1
+
+    IF(LINE_INDEX<SIZE(LINES,1)) THEN
+      LINE_INDEX=LINE_INDEX+1
+      LINE=LINES(LINE_INDEX)
+      IOS=0
+    ELSE
+      LINE=" "
+      IOS=-1
+    ENDIF
+
+  END SUBROUTINE FieldIO_HeaderLineNext
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Checks the field headers of the NAME.part1 onwards node files against the header of the NAME.part0 node file, as the
+  !>node values of all the part files are set with the part0 header. The files are shared out over the ranks.
+  SUBROUTINE FieldIO_ImportNodeHeadersCheck(NAME, NUMBER_OF_FILES, BINARY_NODES, FIELD_LABELS, COMPONENTS_IN_FIELDS, &
+    & VALUE_COMPONENTS, VALUE_DERIVATIVES, VALUE_VERSIONS, ERR, ERROR, *)
+    !Argument variables
+    TYPE(VARYING_STRING), INTENT(IN) :: NAME !<The name of the files
+    INTEGER(INTG), INTENT(IN) :: NUMBER_OF_FILES !<The number of node part files
+    LOGICAL, INTENT(IN) :: BINARY_NODES !<If .TRUE. the node files are .binnode files, otherwise .exnode files
+    TYPE(VARYING_STRING), INTENT(IN) :: FIELD_LABELS(:) !<FIELD_LABELS(field_idx). The part0 header line of the field_idx'th field.
+    INTEGER(INTG), INTENT(IN) :: COMPONENTS_IN_FIELDS(:) !<COMPONENTS_IN_FIELDS(field_idx). The part0 number of components of the field_idx'th field.
+    INTEGER(INTG), INTENT(IN) :: VALUE_COMPONENTS(:) !<VALUE_COMPONENTS(value_idx). The part0 component of the value_idx'th node value.
+    INTEGER(INTG), INTENT(IN) :: VALUE_DERIVATIVES(:) !<VALUE_DERIVATIVES(value_idx). The part0 derivative of the value_idx'th node value.
+    INTEGER(INTG), INTENT(IN) :: VALUE_VERSIONS(:) !<VALUE_VERSIONS(value_idx). The part0 version of the value_idx'th node value.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: EXTENSION, FILE_NAME
+    TYPE(VARYING_STRING), ALLOCATABLE :: PART_FIELD_LABELS(:)
+    INTEGER(INTG), ALLOCATABLE :: PART_COMPONENTS_IN_FIELDS(:), PART_VALUE_COMPONENTS(:), PART_VALUE_DERIVATIVES(:)
+    INTEGER(INTG), ALLOCATABLE :: PART_VALUE_VERSIONS(:)
+    INTEGER(INTG) :: MY_RANK, NUMBER_OF_RANKS, MPI_IERROR, field_idx, file_idx
+    LOGICAL :: ANY_FAILED, FAILED
+
+    ENTERS("FieldIO_ImportNodeHeadersCheck",ERR,ERROR,*999)
+
+    MY_RANK=COMPUTATIONAL_NODE_NUMBER_GET(ERR,ERROR)
+    IF(ERR/=0) GOTO 999
+    NUMBER_OF_RANKS=COMPUTATIONAL_NODES_NUMBER_GET(ERR,ERROR)
+    IF(ERR/=0) GOTO 999
+    IF(BINARY_NODES) THEN
+      EXTENSION=".binnode"
+    ELSE
+      EXTENSION=".exnode"
+    ENDIF
+    !A bad header on one rank must stop all the ranks before they go on to the collective reads.
+    FAILED=.TRUE.
+    DO file_idx=2+MY_RANK,NUMBER_OF_FILES,NUMBER_OF_RANKS
+      FILE_NAME=NAME//".part"//TRIM(NUMBER_TO_VSTRING(file_idx-1,"*",ERR,ERROR))
+      CALL FieldIO_ImportNodeHeaderRead(FILE_NAME, BINARY_NODES, PART_FIELD_LABELS, PART_COMPONENTS_IN_FIELDS, &
+        & PART_VALUE_COMPONENTS, PART_VALUE_DERIVATIVES, PART_VALUE_VERSIONS, ERR, ERROR, *10)
+      FILE_NAME=FILE_NAME//EXTENSION
+      IF(SIZE(PART_FIELD_LABELS,1)/=SIZE(FIELD_LABELS,1).OR.SIZE(PART_VALUE_COMPONENTS,1)/=SIZE(VALUE_COMPONENTS,1)) &
+        & CALL FlagError("The field header in "//FILE_NAME//" does not match the header in "//NAME//".part0"//EXTENSION//".", &
+        & ERR,ERROR,*10)
+      DO field_idx=1,SIZE(FIELD_LABELS,1)
+        IF(PART_FIELD_LABELS(field_idx)/=FIELD_LABELS(field_idx)) &
+          & CALL FlagError("The field header in "//FILE_NAME//" does not match the header in "//NAME//".part0"//EXTENSION//".", &
+          & ERR,ERROR,*10)
+      ENDDO !field_idx
+      IF(ANY(PART_COMPONENTS_IN_FIELDS/=COMPONENTS_IN_FIELDS).OR.ANY(PART_VALUE_COMPONENTS/=VALUE_COMPONENTS).OR. &
+        & ANY(PART_VALUE_DERIVATIVES/=VALUE_DERIVATIVES).OR.ANY(PART_VALUE_VERSIONS/=VALUE_VERSIONS)) &
+        & CALL FlagError("The field header in "//FILE_NAME//" does not match the header in "//NAME//".part0"//EXTENSION//".", &
+        & ERR,ERROR,*10)
+    ENDDO !file_idx
+    FAILED=.FALSE.
+10  IF(ALLOCATED(PART_FIELD_LABELS)) DEALLOCATE(PART_FIELD_LABELS)
+    CALL CHECKED_DEALLOCATE(PART_COMPONENTS_IN_FIELDS)
+    CALL CHECKED_DEALLOCATE(PART_VALUE_COMPONENTS)
+    CALL CHECKED_DEALLOCATE(PART_VALUE_DERIVATIVES)
+    CALL CHECKED_DEALLOCATE(PART_VALUE_VERSIONS)
+    CALL MPI_ALLREDUCE(FAILED,ANY_FAILED,1,MPI_LOGICAL,MPI_LOR,COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
+    IF(FAILED) GOTO 999
+    CALL MPI_ERROR_CHECK("MPI_ALLREDUCE",MPI_IERROR,ERR,ERROR,*999)
+    IF(ANY_FAILED) CALL FlagError("Checking the "//NAME//EXTENSION//" headers failed on another rank.",ERR,ERROR,*999)
+
+    EXITS("FieldIO_ImportNodeHeadersCheck")
+    RETURN
+999 ERRORSEXITS("FieldIO_ImportNodeHeadersCheck",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FieldIO_ImportNodeHeadersCheck
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads this rank's records from all the NAME.partN.exelem or NAME.partN.exnode files. Each file is split into as many byte
+  !>ranges as there are ranks, so every rank parses a similar amount of text whatever the number of files.
+  SUBROUTINE FieldIO_ImportRecordsRead(NAME, IMPORT_TYPE, NUMBER_OF_FILES, RECORD_NUMBERS, ENTRY_COUNTS, INTG_ENTRIES, &
+    & DP_ENTRIES, ERR, ERROR, *)
+    !Argument variables
+    TYPE(VARYING_STRING), INTENT(IN) :: NAME !<The name of the files
+    INTEGER(INTG), INTENT(IN) :: IMPORT_TYPE !<IMPORT_TYPE_ELEMENTS to read the exelem files, IMPORT_TYPE_NODES to read the exnode files
+    INTEGER(INTG), INTENT(IN) :: NUMBER_OF_FILES !<The number of part files
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: RECORD_NUMBERS(:) !<On exit, the element or node numbers of the records read
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: ENTRY_COUNTS(:) !<On exit, the number of element nodes or node values in each record
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: INTG_ENTRIES(:) !<On exit, the element nodes of the records, one element after another
+    REAL(DP), ALLOCATABLE, INTENT(OUT) :: DP_ENTRIES(:) !<On exit, the node values of the records, one node after another
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: EXTENSION, FILE_NAME, LOCAL_ERROR
+    INTEGER(INTG), ALLOCATABLE :: HANDLES(:), RECORD_COUNTS(:), FILE_ENTRY_COUNTS(:)
+    INTEGER(INTG) :: IMPORT_ERROR, MY_RANK, NUMBER_OF_RANKS, MPI_IERROR, NUMBER_OF_RECORDS, NUMBER_OF_ENTRIES, file_idx
+    LOGICAL :: ANY_FAILED, FAILED
+
+    ENTERS("FieldIO_ImportRecordsRead",ERR,ERROR,*999)
+
+    MY_RANK=COMPUTATIONAL_NODE_NUMBER_GET(ERR,ERROR)
+    IF(ERR/=0) GOTO 999
+    NUMBER_OF_RANKS=COMPUTATIONAL_NODES_NUMBER_GET(ERR,ERROR)
+    IF(ERR/=0) GOTO 999
+    IF(IMPORT_TYPE==IMPORT_TYPE_ELEMENTS) THEN
+      EXTENSION=".exelem"
+    ELSE
+      EXTENSION=".exnode"
+    ENDIF
+    ALLOCATE(HANDLES(NUMBER_OF_FILES),RECORD_COUNTS(NUMBER_OF_FILES),FILE_ENTRY_COUNTS(NUMBER_OF_FILES),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate import sessions.",ERR,ERROR,*999)
+    HANDLES=-1
+    !A bad file on one rank must stop all the ranks before they go on to the collective mesh creation.
+    FAILED=.TRUE.
+    DO file_idx=1,NUMBER_OF_FILES
+      FILE_NAME=NAME//".part"//TRIM(NUMBER_TO_VSTRING(file_idx-1,"*",ERR,ERROR))//EXTENSION
+      IMPORT_ERROR=FieldImport_OpenSession(IMPORT_TYPE,CHAR(FILE_NAME)//C_NULL_CHAR,MY_RANK,NUMBER_OF_RANKS,HANDLES(file_idx))
+      IF(IMPORT_ERROR==FIELD_IMPORT_ERROR_BAD_RECORD) THEN
+        HANDLES(file_idx)=-1
+        CALL FlagError("Invalid record in "//FILE_NAME//".",ERR,ERROR,*10)
+      ELSE IF(IMPORT_ERROR/=FIELD_IMPORT_NO_ERROR) THEN
+        HANDLES(file_idx)=-1
+        LOCAL_ERROR="Could not read "//FILE_NAME//". Import error "//TRIM(NUMBER_TO_VSTRING(IMPORT_ERROR,"*",ERR,ERROR))//"."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*10)
+      ENDIF
+      ERR=FieldImport_RecordCounts(HANDLES(file_idx),RECORD_COUNTS(file_idx),FILE_ENTRY_COUNTS(file_idx))
+      IF(ERR/=FIELD_IMPORT_NO_ERROR) CALL FlagError("Invalid import session.",ERR,ERROR,*10)
+    ENDDO !file_idx
+    ALLOCATE(RECORD_NUMBERS(SUM(RECORD_COUNTS)),ENTRY_COUNTS(SUM(RECORD_COUNTS)),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate records.",ERR,ERROR,*10)
+    IF(IMPORT_TYPE==IMPORT_TYPE_ELEMENTS) THEN
+      ALLOCATE(INTG_ENTRIES(SUM(FILE_ENTRY_COUNTS)),DP_ENTRIES(0),STAT=ERR)
+    ELSE
+      ALLOCATE(INTG_ENTRIES(0),DP_ENTRIES(SUM(FILE_ENTRY_COUNTS)),STAT=ERR)
+    ENDIF
+    IF(ERR/=0) CALL FlagError("Could not allocate record entries.",ERR,ERROR,*10)
+    NUMBER_OF_RECORDS=0
+    NUMBER_OF_ENTRIES=0
+    DO file_idx=1,NUMBER_OF_FILES
+      IF(IMPORT_TYPE==IMPORT_TYPE_ELEMENTS) THEN
+        ERR=FieldImport_ElementRecords(HANDLES(file_idx),RECORD_NUMBERS(NUMBER_OF_RECORDS+1:), &
+          & ENTRY_COUNTS(NUMBER_OF_RECORDS+1:),INTG_ENTRIES(NUMBER_OF_ENTRIES+1:))
+      ELSE
+        ERR=FieldImport_NodeRecords(HANDLES(file_idx),RECORD_NUMBERS(NUMBER_OF_RECORDS+1:), &
+          & ENTRY_COUNTS(NUMBER_OF_RECORDS+1:),DP_ENTRIES(NUMBER_OF_ENTRIES+1:))
+      ENDIF
+      IF(ERR/=FIELD_IMPORT_NO_ERROR) CALL FlagError("Invalid import session.",ERR,ERROR,*10)
+      ERR=FieldImport_CloseSession(HANDLES(file_idx))
+      HANDLES(file_idx)=-1
+      NUMBER_OF_RECORDS=NUMBER_OF_RECORDS+RECORD_COUNTS(file_idx)
+      NUMBER_OF_ENTRIES=NUMBER_OF_ENTRIES+FILE_ENTRY_COUNTS(file_idx)
+    ENDDO !file_idx
+    FAILED=.FALSE.
+10  DO file_idx=1,NUMBER_OF_FILES
+      IF(HANDLES(file_idx)/=-1) MPI_IERROR=FieldImport_CloseSession(HANDLES(file_idx))
+    ENDDO !file_idx
+    CALL MPI_ALLREDUCE(FAILED,ANY_FAILED,1,MPI_LOGICAL,MPI_LOR,COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
+    IF(FAILED) GOTO 999
+    CALL MPI_ERROR_CHECK("MPI_ALLREDUCE",MPI_IERROR,ERR,ERROR,*999)
+    IF(ANY_FAILED) CALL FlagError("Reading "//NAME//EXTENSION//" files failed on another rank.",ERR,ERROR,*999)
+    DEALLOCATE(HANDLES,RECORD_COUNTS,FILE_ENTRY_COUNTS)
+
+    EXITS("FieldIO_ImportRecordsRead")
+    RETURN
+999 CALL CHECKED_DEALLOCATE(HANDLES)
+    CALL CHECKED_DEALLOCATE(RECORD_COUNTS)
+    CALL CHECKED_DEALLOCATE(FILE_ENTRY_COUNTS)
+    ERRORSEXITS("FieldIO_ImportRecordsRead",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FieldIO_ImportRecordsRead
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads this rank's node records from all the NAME.partN.binnode files. The nodes of each file are shared out evenly over
+  !>the ranks, and as the files are mapped into memory each rank only reads its own share.
+  SUBROUTINE FieldIO_ImportBinaryRecordsRead(NAME, NUMBER_OF_FILES, RECORD_NUMBERS, ENTRY_COUNTS, DP_ENTRIES, ERR, ERROR, *)
+    !Argument variables
+    TYPE(VARYING_STRING), INTENT(IN) :: NAME !<The name of the files
+    INTEGER(INTG), INTENT(IN) :: NUMBER_OF_FILES !<The number of part files
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: RECORD_NUMBERS(:) !<On exit, the node numbers of the records read
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: ENTRY_COUNTS(:) !<On exit, the number of node values in each record
+    REAL(DP), ALLOCATABLE, INTENT(OUT) :: DP_ENTRIES(:) !<On exit, the node values of the records, one node after another
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: FILE_NAME, HEADER
+    INTEGER(INTG), ALLOCATABLE :: FILE_NUMBERS(:), FILE_COUNTS(:), NEW_INTG(:)
+    INTEGER(INTG) :: MY_RANK, NUMBER_OF_RANKS, MPI_IERROR, file_idx
+    REAL(DP), ALLOCATABLE :: FILE_VALUES(:), NEW_DP(:)
+    LOGICAL :: ANY_FAILED, FAILED
+
+    ENTERS("FieldIO_ImportBinaryRecordsRead",ERR,ERROR,*999)
+
+    MY_RANK=COMPUTATIONAL_NODE_NUMBER_GET(ERR,ERROR)
+    IF(ERR/=0) GOTO 999
+    NUMBER_OF_RANKS=COMPUTATIONAL_NODES_NUMBER_GET(ERR,ERROR)
+    IF(ERR/=0) GOTO 999
+    !A bad file on one rank must stop all the ranks before they go on to the collective mesh creation.
+    FAILED=.TRUE.
+    ALLOCATE(RECORD_NUMBERS(0),ENTRY_COUNTS(0),DP_ENTRIES(0),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate records.",ERR,ERROR,*10)
+    DO file_idx=1,NUMBER_OF_FILES
+      FILE_NAME=NAME//".part"//TRIM(NUMBER_TO_VSTRING(file_idx-1,"*",ERR,ERROR))
+      CALL FIELD_IO_BINARY_NODES_READ(FILE_NAME,MY_RANK,NUMBER_OF_RANKS,HEADER,FILE_NUMBERS,FILE_COUNTS,FILE_VALUES, &
+        & ERR,ERROR,*10)
+      ALLOCATE(NEW_INTG(SIZE(RECORD_NUMBERS,1)+SIZE(FILE_NUMBERS,1)),STAT=ERR)
+      IF(ERR/=0) CALL FlagError("Could not allocate records.",ERR,ERROR,*10)
+      NEW_INTG(1:SIZE(RECORD_NUMBERS,1))=RECORD_NUMBERS
+      NEW_INTG(SIZE(RECORD_NUMBERS,1)+1:)=FILE_NUMBERS
+      CALL MOVE_ALLOC(NEW_INTG,RECORD_NUMBERS)
+      ALLOCATE(NEW_INTG(SIZE(ENTRY_COUNTS,1)+SIZE(FILE_COUNTS,1)),STAT=ERR)
+      IF(ERR/=0) CALL FlagError("Could not allocate records.",ERR,ERROR,*10)
+      NEW_INTG(1:SIZE(ENTRY_COUNTS,1))=ENTRY_COUNTS
+      NEW_INTG(SIZE(ENTRY_COUNTS,1)+1:)=FILE_COUNTS
+      CALL MOVE_ALLOC(NEW_INTG,ENTRY_COUNTS)
+      ALLOCATE(NEW_DP(SIZE(DP_ENTRIES,1)+SIZE(FILE_VALUES,1)),STAT=ERR)
+      IF(ERR/=0) CALL FlagError("Could not allocate record entries.",ERR,ERROR,*10)
+      NEW_DP(1:SIZE(DP_ENTRIES,1))=DP_ENTRIES
+      NEW_DP(SIZE(DP_ENTRIES,1)+1:)=FILE_VALUES
+      CALL MOVE_ALLOC(NEW_DP,DP_ENTRIES)
+      DEALLOCATE(FILE_NUMBERS,FILE_COUNTS,FILE_VALUES)
+    ENDDO !file_idx
+    FAILED=.FALSE.
+10  CALL CHECKED_DEALLOCATE(FILE_NUMBERS)
+    CALL CHECKED_DEALLOCATE(FILE_COUNTS)
+    CALL CHECKED_DEALLOCATE(FILE_VALUES)
+    CALL MPI_ALLREDUCE(FAILED,ANY_FAILED,1,MPI_LOGICAL,MPI_LOR,COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
+    IF(FAILED) GOTO 999
+    CALL MPI_ERROR_CHECK("MPI_ALLREDUCE",MPI_IERROR,ERR,ERROR,*999)
+    IF(ANY_FAILED) CALL FlagError("Reading "//NAME//".binnode files failed on another rank.",ERR,ERROR,*999)
+
+    EXITS("FieldIO_ImportBinaryRecordsRead")
+    RETURN
+999 CALL CHECKED_DEALLOCATE(RECORD_NUMBERS)
+    CALL CHECKED_DEALLOCATE(ENTRY_COUNTS)
+    CALL CHECKED_DEALLOCATE(DP_ENTRIES)
+    ERRORSEXITS("FieldIO_ImportBinaryRecordsRead",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FieldIO_ImportBinaryRecordsRead
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Gathers the integers from all the ranks, in rank order, on every rank.
+  SUBROUTINE FieldIO_ImportIntegersAllGather(LOCAL_VALUES, GLOBAL_VALUES, ERR, ERROR, *)
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: LOCAL_VALUES(:) !<The integers on this rank
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: GLOBAL_VALUES(:) !<On exit, the integers from all the ranks
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG), ALLOCATABLE :: COUNTS(:), DISPLACEMENTS(:)
+    INTEGER(INTG) :: NUMBER_OF_RANKS, MPI_IERROR, rank_idx
+
+    ENTERS("FieldIO_ImportIntegersAllGather",ERR,ERROR,*999)
+
+    NUMBER_OF_RANKS=COMPUTATIONAL_NODES_NUMBER_GET(ERR,ERROR)
+    IF(ERR/=0) GOTO 999
+    ALLOCATE(COUNTS(NUMBER_OF_RANKS),DISPLACEMENTS(NUMBER_OF_RANKS),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate gather counts.",ERR,ERROR,*999)
+    CALL MPI_ALLGATHER(SIZE(LOCAL_VALUES,1),1,MPI_INTEGER,COUNTS,1,MPI_INTEGER,COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
+    CALL MPI_ERROR_CHECK("MPI_ALLGATHER",MPI_IERROR,ERR,ERROR,*999)
+    DISPLACEMENTS(1)=0
+    DO rank_idx=2,NUMBER_OF_RANKS
+      DISPLACEMENTS(rank_idx)=DISPLACEMENTS(rank_idx-1)+COUNTS(rank_idx-1)
+    ENDDO !rank_idx
+    ALLOCATE(GLOBAL_VALUES(SUM(COUNTS)),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate gathered values.",ERR,ERROR,*999)
+    CALL MPI_ALLGATHERV(LOCAL_VALUES,SIZE(LOCAL_VALUES,1),MPI_INTEGER,GLOBAL_VALUES,COUNTS,DISPLACEMENTS,MPI_INTEGER, &
+      & COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
+    CALL MPI_ERROR_CHECK("MPI_ALLGATHERV",MPI_IERROR,ERR,ERROR,*999)
+    DEALLOCATE(COUNTS,DISPLACEMENTS)
+
+    EXITS("FieldIO_ImportIntegersAllGather")
+    RETURN
+999 CALL CHECKED_DEALLOCATE(COUNTS)
+    CALL CHECKED_DEALLOCATE(DISPLACEMENTS)
+    ERRORSEXITS("FieldIO_ImportIntegersAllGather",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FieldIO_ImportIntegersAllGather
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets the imported node values. Each rank sends the nodes it read to every rank whose domain has the node, ghosts
+  !>included, and then sets the values it is sent.
+  SUBROUTINE FieldIO_ImportNodeValuesSet(FIELDS, COMPONENTS_IN_FIELDS, VALUE_COMPONENTS, VALUE_DERIVATIVES, VALUE_VERSIONS, &
+    & FIELD_VALUES_SET_TYPE, MESH, DECOMPOSITION, NODE_NUMBERS, NODE_VALUE_COUNTS, NODE_VALUES, ERR, ERROR, *)
+    !Argument variables
+    TYPE(FIELD_PTR_TYPE), INTENT(IN) :: FIELDS(:) !<The imported fields
+    INTEGER(INTG), INTENT(IN) :: COMPONENTS_IN_FIELDS(:) !<COMPONENTS_IN_FIELDS(field_idx). The number of components of the field_idx'th field.
+    INTEGER(INTG), INTENT(IN) :: VALUE_COMPONENTS(:) !<VALUE_COMPONENTS(value_idx). The component, numbered across the fields, of the value_idx'th node value.
+    INTEGER(INTG), INTENT(IN) :: VALUE_DERIVATIVES(:) !<VALUE_DERIVATIVES(value_idx). The derivative of the value_idx'th node value.
+    INTEGER(INTG), INTENT(IN) :: VALUE_VERSIONS(:) !<VALUE_VERSIONS(value_idx). The version of the value_idx'th node value.
+    INTEGER(INTG), INTENT(IN) :: FIELD_VALUES_SET_TYPE !<The parameter set to set the values in
+    TYPE(MESH_TYPE), POINTER :: MESH !<The imported mesh
+    TYPE(DECOMPOSITION_TYPE), POINTER :: DECOMPOSITION !<The decomposition of the imported mesh
+    INTEGER(INTG), INTENT(IN) :: NODE_NUMBERS(:) !<The user numbers of the nodes read on this rank
+    INTEGER(INTG), INTENT(IN) :: NODE_VALUE_COUNTS(:) !<The number of values of each of the nodes read on this rank
+    REAL(DP), INTENT(IN) :: NODE_VALUES(:) !<The values of the nodes read on this rank, one node after another
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(DOMAIN_MAPPING_TYPE), POINTER :: NODES_MAPPING
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+    INTEGER(INTG), ALLOCATABLE :: COMPONENT_FIELDS(:), COMPONENT_NUMBERS(:), MESH_NODE_NUMBERS(:)
+    INTEGER(INTG), ALLOCATABLE :: SEND_COUNTS(:), SEND_DISPLACEMENTS(:), RECEIVE_COUNTS(:), RECEIVE_DISPLACEMENTS(:)
+    INTEGER(INTG), ALLOCATABLE :: SEND_NODES(:), RECEIVE_NODES(:)
+    INTEGER(INTG) :: NUMBER_OF_RANKS, NUMBER_OF_VALUES, MPI_IERROR, MESH_NODE_NUMBER, DOMAIN_NUMBER, LOCAL_NODE_NUMBER
+    INTEGER(INTG) :: comp_idx, component_idx, domain_idx, field_idx, node_idx, rank_idx, send_idx, value_idx, first_idx
+    REAL(DP), ALLOCATABLE :: SEND_VALUES(:), RECEIVE_VALUES(:)
+    LOGICAL :: ANY_FAILED, FAILED, NODE_EXISTS
+
+    ENTERS("FieldIO_ImportNodeValuesSet",ERR,ERROR,*999)
+
+    NUMBER_OF_RANKS=COMPUTATIONAL_NODES_NUMBER_GET(ERR,ERROR)
+    IF(ERR/=0) GOTO 999
+    NUMBER_OF_VALUES=SIZE(VALUE_COMPONENTS,1)
+    NODES_MAPPING=>DECOMPOSITION%DOMAIN(1)%PTR%MAPPINGS%NODES
+    IF(.NOT.ASSOCIATED(NODES_MAPPING)) CALL FlagError("Decomposition node mapping is not associated.",ERR,ERROR,*999)
+    ALLOCATE(COMPONENT_FIELDS(SUM(COMPONENTS_IN_FIELDS)),COMPONENT_NUMBERS(SUM(COMPONENTS_IN_FIELDS)),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate component information.",ERR,ERROR,*999)
+    component_idx=0
+    DO field_idx=1,SIZE(COMPONENTS_IN_FIELDS,1)
+      DO comp_idx=1,COMPONENTS_IN_FIELDS(field_idx)
+        component_idx=component_idx+1
+        COMPONENT_FIELDS(component_idx)=field_idx
+        COMPONENT_NUMBERS(component_idx)=comp_idx
+      ENDDO !comp_idx
+    ENDDO !field_idx
+
+    !Count the nodes to send to each rank. Nodes that are not used by any element are skipped.
+    ALLOCATE(SEND_COUNTS(NUMBER_OF_RANKS),SEND_DISPLACEMENTS(NUMBER_OF_RANKS),RECEIVE_COUNTS(NUMBER_OF_RANKS), &
+      & RECEIVE_DISPLACEMENTS(NUMBER_OF_RANKS),MESH_NODE_NUMBERS(SIZE(NODE_NUMBERS,1)),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate node value exchange counts.",ERR,ERROR,*999)
+    SEND_COUNTS=0
+    !A bad node on one rank must stop all the ranks before they go on to the collective exchange.
+    FAILED=.TRUE.
+    DO node_idx=1,SIZE(NODE_NUMBERS,1)
+      IF(NODE_VALUE_COUNTS(node_idx)/=NUMBER_OF_VALUES) THEN
+        LOCAL_ERROR="Node "//TRIM(NUMBER_TO_VSTRING(NODE_NUMBERS(node_idx),"*",ERR,ERROR))//" has "// &
+          & TRIM(NUMBER_TO_VSTRING(NODE_VALUE_COUNTS(node_idx),"*",ERR,ERROR))//" values but the exnode header has "// &
+          & TRIM(NUMBER_TO_VSTRING(NUMBER_OF_VALUES,"*",ERR,ERROR))//"."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*10)
+      ENDIF
+      CALL MeshTopologyNodeCheckExists(MESH,1,NODE_NUMBERS(node_idx),NODE_EXISTS,MESH_NODE_NUMBER,ERR,ERROR,*10)
+      MESH_NODE_NUMBERS(node_idx)=MESH_NODE_NUMBER
+      IF(NODE_EXISTS) THEN
+        DO domain_idx=1,NODES_MAPPING%GLOBAL_TO_LOCAL_MAP(MESH_NODE_NUMBER)%NUMBER_OF_DOMAINS
+          DOMAIN_NUMBER=NODES_MAPPING%GLOBAL_TO_LOCAL_MAP(MESH_NODE_NUMBER)%DOMAIN_NUMBER(domain_idx)
+          SEND_COUNTS(DOMAIN_NUMBER+1)=SEND_COUNTS(DOMAIN_NUMBER+1)+1
+        ENDDO !domain_idx
+      ENDIF
+    ENDDO !node_idx
+    FAILED=.FALSE.
+10  CALL MPI_ALLREDUCE(FAILED,ANY_FAILED,1,MPI_LOGICAL,MPI_LOR,COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
+    IF(FAILED) GOTO 999
+    CALL MPI_ERROR_CHECK("MPI_ALLREDUCE",MPI_IERROR,ERR,ERROR,*999)
+    IF(ANY_FAILED) CALL FlagError("Setting the imported node values failed on another rank.",ERR,ERROR,*999)
+    CALL MPI_ALLTOALL(SEND_COUNTS,1,MPI_INTEGER,RECEIVE_COUNTS,1,MPI_INTEGER,COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
+    CALL MPI_ERROR_CHECK("MPI_ALLTOALL",MPI_IERROR,ERR,ERROR,*999)
+    SEND_DISPLACEMENTS(1)=0
+    RECEIVE_DISPLACEMENTS(1)=0
+    DO rank_idx=2,NUMBER_OF_RANKS
+      SEND_DISPLACEMENTS(rank_idx)=SEND_DISPLACEMENTS(rank_idx-1)+SEND_COUNTS(rank_idx-1)
+      RECEIVE_DISPLACEMENTS(rank_idx)=RECEIVE_DISPLACEMENTS(rank_idx-1)+RECEIVE_COUNTS(rank_idx-1)
+    ENDDO !rank_idx
+
+    !Pack the local node numbers on the receiving rank and the node values
+    ALLOCATE(SEND_NODES(SUM(SEND_COUNTS)),SEND_VALUES(SUM(SEND_COUNTS)*NUMBER_OF_VALUES),RECEIVE_NODES(SUM(RECEIVE_COUNTS)), &
+      & RECEIVE_VALUES(SUM(RECEIVE_COUNTS)*NUMBER_OF_VALUES),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate node value exchange buffers.",ERR,ERROR,*999)
+    SEND_COUNTS=0
+    DO node_idx=1,SIZE(NODE_NUMBERS,1)
+      MESH_NODE_NUMBER=MESH_NODE_NUMBERS(node_idx)
+      IF(MESH_NODE_NUMBER/=0) THEN
+        DO domain_idx=1,NODES_MAPPING%GLOBAL_TO_LOCAL_MAP(MESH_NODE_NUMBER)%NUMBER_OF_DOMAINS
+          DOMAIN_NUMBER=NODES_MAPPING%GLOBAL_TO_LOCAL_MAP(MESH_NODE_NUMBER)%DOMAIN_NUMBER(domain_idx)
+          send_idx=SEND_DISPLACEMENTS(DOMAIN_NUMBER+1)+SEND_COUNTS(DOMAIN_NUMBER+1)+1
+          SEND_NODES(send_idx)=NODES_MAPPING%GLOBAL_TO_LOCAL_MAP(MESH_NODE_NUMBER)%LOCAL_NUMBER(domain_idx)
+          SEND_VALUES((send_idx-1)*NUMBER_OF_VALUES+1:send_idx*NUMBER_OF_VALUES)= &
+            & NODE_VALUES((node_idx-1)*NUMBER_OF_VALUES+1:node_idx*NUMBER_OF_VALUES)
+          SEND_COUNTS(DOMAIN_NUMBER+1)=SEND_COUNTS(DOMAIN_NUMBER+1)+1
+        ENDDO !domain_idx
+      ENDIF
+    ENDDO !node_idx
+    CALL MPI_ALLTOALLV(SEND_NODES,SEND_COUNTS,SEND_DISPLACEMENTS,MPI_INTEGER,RECEIVE_NODES,RECEIVE_COUNTS, &
+      & RECEIVE_DISPLACEMENTS,MPI_INTEGER,COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
+    CALL MPI_ERROR_CHECK("MPI_ALLTOALLV",MPI_IERROR,ERR,ERROR,*999)
+    SEND_COUNTS=SEND_COUNTS*NUMBER_OF_VALUES
+    SEND_DISPLACEMENTS=SEND_DISPLACEMENTS*NUMBER_OF_VALUES
+    RECEIVE_COUNTS=RECEIVE_COUNTS*NUMBER_OF_VALUES
+    RECEIVE_DISPLACEMENTS=RECEIVE_DISPLACEMENTS*NUMBER_OF_VALUES
+    CALL MPI_ALLTOALLV(SEND_VALUES,SEND_COUNTS,SEND_DISPLACEMENTS,MPI_DOUBLE_PRECISION,RECEIVE_VALUES,RECEIVE_COUNTS, &
+      & RECEIVE_DISPLACEMENTS,MPI_DOUBLE_PRECISION,COMPUTATIONAL_ENVIRONMENT%MPI_COMM,MPI_IERROR)
+    CALL MPI_ERROR_CHECK("MPI_ALLTOALLV",MPI_IERROR,ERR,ERROR,*999)
+    DEALLOCATE(SEND_NODES,SEND_VALUES)
+
+    DO node_idx=1,SIZE(RECEIVE_NODES,1)
+      LOCAL_NODE_NUMBER=RECEIVE_NODES(node_idx)
+      first_idx=(node_idx-1)*NUMBER_OF_VALUES
+      DO value_idx=1,NUMBER_OF_VALUES
+        component_idx=VALUE_COMPONENTS(value_idx)
+        CALL FIELD_PARAMETER_SET_UPDATE_LOCAL_NODE(FIELDS(COMPONENT_FIELDS(component_idx))%PTR,FIELD_U_VARIABLE_TYPE, &
+          & FIELD_VALUES_SET_TYPE,VALUE_VERSIONS(value_idx),VALUE_DERIVATIVES(value_idx),LOCAL_NODE_NUMBER, &
+          & COMPONENT_NUMBERS(component_idx),RECEIVE_VALUES(first_idx+value_idx),ERR,ERROR,*999)
+      ENDDO !value_idx
+    ENDDO !node_idx
+    DO field_idx=1,SIZE(FIELDS,1)
+      CALL FIELD_PARAMETER_SET_UPDATE_START(FIELDS(field_idx)%PTR,FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE,ERR,ERROR,*999)
+      CALL FIELD_PARAMETER_SET_UPDATE_FINISH(FIELDS(field_idx)%PTR,FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE,ERR,ERROR,*999)
+    ENDDO !field_idx
+
+    DEALLOCATE(COMPONENT_FIELDS,COMPONENT_NUMBERS,MESH_NODE_NUMBERS,SEND_COUNTS,SEND_DISPLACEMENTS,RECEIVE_COUNTS, &
+      & RECEIVE_DISPLACEMENTS,RECEIVE_NODES,RECEIVE_VALUES)
+
+    EXITS("FieldIO_ImportNodeValuesSet")
+    RETURN
+999 CALL CHECKED_DEALLOCATE(COMPONENT_FIELDS)
+    CALL CHECKED_DEALLOCATE(COMPONENT_NUMBERS)
+    CALL CHECKED_DEALLOCATE(MESH_NODE_NUMBERS)
+    CALL CHECKED_DEALLOCATE(SEND_COUNTS)
+    CALL CHECKED_DEALLOCATE(SEND_DISPLACEMENTS)
+    CALL CHECKED_DEALLOCATE(RECEIVE_COUNTS)
+    CALL CHECKED_DEALLOCATE(RECEIVE_DISPLACEMENTS)
+    CALL CHECKED_DEALLOCATE(SEND_NODES)
+    CALL CHECKED_DEALLOCATE(RECEIVE_NODES)
+    CALL CHECKED_DEALLOCATE(SEND_VALUES)
+    CALL CHECKED_DEALLOCATE(RECEIVE_VALUES)
+    ERRORSEXITS("FieldIO_ImportNodeValuesSet",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FieldIO_ImportNodeValuesSet
+
+  !
+  !================================================================================================================================
+  !
+
   !>Finding basis information
   SUBROUTINE FIELD_IO_FILL_BASIS_INFO(INTERPOLATION_XI, LIST_STR, NUMBER_OF_COMPONENTS, ERR, ERROR, *)
     !Argument variables
@@ -5356,12 +6306,14 @@ CONTAINS
   !
 
   !>Write all the nodal information from NODAL_INFO_SET to local exnode files
-  SUBROUTINE FIELD_IO_EXPORT_NODES_INTO_LOCAL_FILE(NODAL_INFO_SET, NAME, my_computational_node_number,ERR, ERROR, *)
+  SUBROUTINE FIELD_IO_EXPORT_NODES_INTO_LOCAL_FILE(NODAL_INFO_SET, NAME, my_computational_node_number, exportType, &
+    & ERR, ERROR, *)
     !the reason that my_computational_node_number is used in the argument is for future extension
     !Argument variables
     TYPE(FIELD_IO_INFO_SET), INTENT(INOUT):: NODAL_INFO_SET !<nodal information in this process
     TYPE(VARYING_STRING), INTENT(IN) :: NAME !<the prefix name of file.
     INTEGER(INTG), INTENT(IN):: my_computational_node_number !<local process number
+    INTEGER(INTG), INTENT(IN) :: exportType !<The type of export session to write the nodes with, EXPORT_TYPE_FILE for a text exnode file or EXPORT_TYPE_BINARY_FILE for a JSON index and binary values file.
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
@@ -5406,7 +6358,7 @@ CONTAINS
       CALL FlagError("the first header flag of nodal information set should be false",ERR,ERROR,*999)
     ENDIF
 
-    ERR = FieldExport_OpenSession( EXPORT_TYPE_FILE, char(FILE_NAME)//C_NULL_CHAR, sessionHandle )
+    ERR = FieldExport_OpenSession( exportType, char(FILE_NAME)//C_NULL_CHAR, sessionHandle )
     IF(ERR/=0) THEN
       CALL FlagError( "Cannot open file export session", ERR, ERROR,*999 )
     ENDIF
@@ -5811,6 +6763,507 @@ CONTAINS
     RETURN 1
   END SUBROUTINE FIELD_IO_FORTRAN_FILE_CLOSE
 
+  !
+  !================================================================================================================================
+  !
+
+  !>Opens a CMISS binary node file FILE_NAME.binnode for reading or writing. The machine header of the file records the byte
+  !>order and number formats it was written with, and reads byte swap the values when they differ from this machine.
+  SUBROUTINE FIELD_IO_BINARY_FILE_OPEN(FILE_ID, FILE_NAME, COMMAND, NUMBER_OF_TAGS, ERR, ERROR, *)
+
+    !Argument variables
+    TYPE(BINARY_FILE_TYPE), INTENT(INOUT) :: FILE_ID !<On exit, the opened binary file
+    TYPE(VARYING_STRING), INTENT(IN) :: FILE_NAME !<The name of the file, without the .binnode extension
+    CHARACTER(LEN=*), INTENT(IN) :: COMMAND !<"READ" to open the file for reading, "READ_MAPPED" to also map it into memory, "WRITE" to create it
+    INTEGER(INTG), INTENT(INOUT) :: NUMBER_OF_TAGS !<The number of top level tags to write. On exit when reading, the number of top level tags in the file.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: FILE_VERSION(3)
+
+    ENTERS("FIELD_IO_BINARY_FILE_OPEN",ERR,ERROR,*999)
+
+    IF(INQUIRE_OPEN_BINARY_FILE(FILE_ID)) CALL FlagError("Binary file is already open.",ERR,ERROR,*999)
+    CALL OPEN_CMISS_BINARY_FILE(FILE_ID,CMISS_BINARY_NODE_FILE,NUMBER_OF_TAGS,FIELD_IO_BINARY_NODE_FILE_VERSION, &
+      & FILE_VERSION,COMMAND,"node",CHAR(FILE_NAME),ERR,ERROR,*999)
+
+    EXITS("FIELD_IO_BINARY_FILE_OPEN")
+    RETURN
+999 ERRORSEXITS("FIELD_IO_BINARY_FILE_OPEN",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FIELD_IO_BINARY_FILE_OPEN
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Closes a CMISS binary node file
+  SUBROUTINE FIELD_IO_BINARY_FILE_CLOSE(FILE_ID, ERR, ERROR, *)
+
+    !Argument variables
+    TYPE(BINARY_FILE_TYPE), INTENT(INOUT) :: FILE_ID !<The binary file to close
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+
+    ENTERS("FIELD_IO_BINARY_FILE_CLOSE",ERR,ERROR,*999)
+
+    CALL CLOSE_CMISS_BINARY_FILE(FILE_ID,ERR,ERROR,*999)
+
+    EXITS("FIELD_IO_BINARY_FILE_CLOSE")
+    RETURN
+999 ERRORSEXITS("FIELD_IO_BINARY_FILE_CLOSE",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FIELD_IO_BINARY_FILE_CLOSE
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Writes a leaf tag holding integer data to a binary file. The data is written in a single block.
+  SUBROUTINE FIELD_IO_BINARY_FILE_WRITE_INTG(FILE_ID, TAG_INDEX, TAG_HEADER, INTG_DATA, ERR, ERROR, *)
+
+    !Argument variables
+    TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILE_ID !<The binary file to write to
+    INTEGER(INTG), INTENT(IN) :: TAG_INDEX !<The index of the tag
+    CHARACTER(LEN=*), INTENT(IN) :: TAG_HEADER !<The heading of the tag
+    INTEGER(INTG), INTENT(IN) :: INTG_DATA(:) !<The data to write
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(BINARY_TAG_TYPE) :: TAG
+
+    ENTERS("FIELD_IO_BINARY_FILE_WRITE_INTG",ERR,ERROR,*999)
+
+    IF(SIZE(INTG_DATA,1)>HUGE(TAG%NUM_BYTES)/INTEGER_SIZE) &
+      & CALL FlagError("Too much data to write to one binary tag.",ERR,ERROR,*999)
+    TAG%INDEX=TAG_INDEX
+    TAG%HEADER=TAG_HEADER
+    TAG%NUM_SUBTAGS=0
+    TAG%NUM_BYTES=SIZE(INTG_DATA,1)*INTEGER_SIZE
+    CALL WRITE_BINARY_TAG_HEADER(FILE_ID,TAG,ERR,ERROR,*999)
+    IF(SIZE(INTG_DATA,1)>0) CALL WRITE_BINARY_FILE(FILE_ID,SIZE(INTG_DATA,1),INTG_DATA,ERR,ERROR,*999)
+
+    EXITS("FIELD_IO_BINARY_FILE_WRITE_INTG")
+    RETURN
+999 ERRORSEXITS("FIELD_IO_BINARY_FILE_WRITE_INTG",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FIELD_IO_BINARY_FILE_WRITE_INTG
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Writes a leaf tag holding double precision data to a binary file. The data is written in a single block.
+  SUBROUTINE FIELD_IO_BINARY_FILE_WRITE_DP(FILE_ID, TAG_INDEX, TAG_HEADER, REAL_DATA, ERR, ERROR, *)
+
+    !Argument variables
+    TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILE_ID !<The binary file to write to
+    INTEGER(INTG), INTENT(IN) :: TAG_INDEX !<The index of the tag
+    CHARACTER(LEN=*), INTENT(IN) :: TAG_HEADER !<The heading of the tag
+    REAL(DP), INTENT(IN) :: REAL_DATA(:) !<The data to write
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(BINARY_TAG_TYPE) :: TAG
+
+    ENTERS("FIELD_IO_BINARY_FILE_WRITE_DP",ERR,ERROR,*999)
+
+    IF(SIZE(REAL_DATA,1)>HUGE(TAG%NUM_BYTES)/DOUBLE_REAL_SIZE) &
+      & CALL FlagError("Too much data to write to one binary tag.",ERR,ERROR,*999)
+    TAG%INDEX=TAG_INDEX
+    TAG%HEADER=TAG_HEADER
+    TAG%NUM_SUBTAGS=0
+    TAG%NUM_BYTES=SIZE(REAL_DATA,1)*DOUBLE_REAL_SIZE
+    CALL WRITE_BINARY_TAG_HEADER(FILE_ID,TAG,ERR,ERROR,*999)
+    IF(SIZE(REAL_DATA,1)>0) CALL WRITE_BINARY_FILE(FILE_ID,SIZE(REAL_DATA,1),REAL_DATA,ERR,ERROR,*999)
+
+    EXITS("FIELD_IO_BINARY_FILE_WRITE_DP")
+    RETURN
+999 ERRORSEXITS("FIELD_IO_BINARY_FILE_WRITE_DP",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FIELD_IO_BINARY_FILE_WRITE_DP
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Writes a leaf tag holding a string to a binary file.
+  SUBROUTINE FIELD_IO_BINARY_FILE_WRITE_STRING(FILE_ID, TAG_INDEX, TAG_HEADER, STRING_DATA, ERR, ERROR, *)
+
+    !Argument variables
+    TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILE_ID !<The binary file to write to
+    INTEGER(INTG), INTENT(IN) :: TAG_INDEX !<The index of the tag
+    CHARACTER(LEN=*), INTENT(IN) :: TAG_HEADER !<The heading of the tag
+    TYPE(VARYING_STRING), INTENT(IN) :: STRING_DATA !<The string to write
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(BINARY_TAG_TYPE) :: TAG
+
+    ENTERS("FIELD_IO_BINARY_FILE_WRITE_STRING",ERR,ERROR,*999)
+
+    TAG%INDEX=TAG_INDEX
+    TAG%HEADER=TAG_HEADER
+    TAG%NUM_SUBTAGS=0
+    TAG%NUM_BYTES=LEN(STRING_DATA)*CHARACTER_SIZE
+    CALL WRITE_BINARY_TAG_HEADER(FILE_ID,TAG,ERR,ERROR,*999)
+    IF(LEN(STRING_DATA)>0) CALL WRITE_BINARY_FILE(FILE_ID,LEN(STRING_DATA),CHAR(STRING_DATA),ERR,ERROR,*999)
+
+    EXITS("FIELD_IO_BINARY_FILE_WRITE_STRING")
+    RETURN
+999 ERRORSEXITS("FIELD_IO_BINARY_FILE_WRITE_STRING",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FIELD_IO_BINARY_FILE_WRITE_STRING
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads the header of the next tag in a binary file and checks it is a leaf tag with the expected index holding a whole number
+  !>of items of ITEM_SIZE bytes.
+  SUBROUTINE FIELD_IO_BINARY_FILE_TAG_READ(FILE_ID, TAG_INDEX, ITEM_SIZE, NUMBER_OF_ITEMS, ERR, ERROR, *)
+
+    !Argument variables
+    TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILE_ID !<The binary file to read from
+    INTEGER(INTG), INTENT(IN) :: TAG_INDEX !<The expected index of the tag
+    INTEGER(INTG), INTENT(IN) :: ITEM_SIZE !<The number of bytes in each item of the tag
+    INTEGER(INTG), INTENT(OUT) :: NUMBER_OF_ITEMS !<On exit, the number of items in the tag
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(BINARY_TAG_TYPE) :: TAG
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("FIELD_IO_BINARY_FILE_TAG_READ",ERR,ERROR,*999)
+
+    CALL READ_BINARY_TAG_HEADER(FILE_ID,TAG,ERR,ERROR,*999)
+    IF(TAG%INDEX/=TAG_INDEX) THEN
+      LOCAL_ERROR="Binary tag index "//TRIM(NUMBER_TO_VSTRING(TAG%INDEX,"*",ERR,ERROR))// &
+        & " does not match the expected tag index of "//TRIM(NUMBER_TO_VSTRING(TAG_INDEX,"*",ERR,ERROR))//"."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+    IF(TAG%NUM_SUBTAGS/=0.OR.MOD(TAG%NUM_BYTES,ITEM_SIZE)/=0) THEN
+      LOCAL_ERROR="Binary tag index "//TRIM(NUMBER_TO_VSTRING(TAG%INDEX,"*",ERR,ERROR))//" has an invalid size."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+    NUMBER_OF_ITEMS=TAG%NUM_BYTES/ITEM_SIZE
+
+    EXITS("FIELD_IO_BINARY_FILE_TAG_READ")
+    RETURN
+999 ERRORSEXITS("FIELD_IO_BINARY_FILE_TAG_READ",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FIELD_IO_BINARY_FILE_TAG_READ
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads a leaf tag holding integer data from a binary file
+  SUBROUTINE FIELD_IO_BINARY_FILE_READ_INTG(FILE_ID, TAG_INDEX, INTG_DATA, ERR, ERROR, *)
+
+    !Argument variables
+    TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILE_ID !<The binary file to read from
+    INTEGER(INTG), INTENT(IN) :: TAG_INDEX !<The expected index of the tag
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: INTG_DATA(:) !<On exit, the data of the tag
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: NUMBER_OF_ITEMS
+
+    ENTERS("FIELD_IO_BINARY_FILE_READ_INTG",ERR,ERROR,*999)
+
+    CALL FIELD_IO_BINARY_FILE_TAG_READ(FILE_ID,TAG_INDEX,INTEGER_SIZE,NUMBER_OF_ITEMS,ERR,ERROR,*999)
+    ALLOCATE(INTG_DATA(NUMBER_OF_ITEMS),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate binary tag data.",ERR,ERROR,*999)
+    IF(NUMBER_OF_ITEMS>0) CALL READ_BINARY_FILE(FILE_ID,NUMBER_OF_ITEMS,INTG_DATA,ERR,ERROR,*999)
+
+    EXITS("FIELD_IO_BINARY_FILE_READ_INTG")
+    RETURN
+999 ERRORSEXITS("FIELD_IO_BINARY_FILE_READ_INTG",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FIELD_IO_BINARY_FILE_READ_INTG
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads a leaf tag holding double precision data from a binary file
+  SUBROUTINE FIELD_IO_BINARY_FILE_READ_DP(FILE_ID, TAG_INDEX, REAL_DATA, ERR, ERROR, *)
+
+    !Argument variables
+    TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILE_ID !<The binary file to read from
+    INTEGER(INTG), INTENT(IN) :: TAG_INDEX !<The expected index of the tag
+    REAL(DP), ALLOCATABLE, INTENT(OUT) :: REAL_DATA(:) !<On exit, the data of the tag
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: NUMBER_OF_ITEMS
+
+    ENTERS("FIELD_IO_BINARY_FILE_READ_DP",ERR,ERROR,*999)
+
+    CALL FIELD_IO_BINARY_FILE_TAG_READ(FILE_ID,TAG_INDEX,DOUBLE_REAL_SIZE,NUMBER_OF_ITEMS,ERR,ERROR,*999)
+    ALLOCATE(REAL_DATA(NUMBER_OF_ITEMS),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate binary tag data.",ERR,ERROR,*999)
+    IF(NUMBER_OF_ITEMS>0) CALL READ_BINARY_FILE(FILE_ID,NUMBER_OF_ITEMS,REAL_DATA,ERR,ERROR,*999)
+
+    EXITS("FIELD_IO_BINARY_FILE_READ_DP")
+    RETURN
+999 ERRORSEXITS("FIELD_IO_BINARY_FILE_READ_DP",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FIELD_IO_BINARY_FILE_READ_DP
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads a leaf tag holding a string from a binary file
+  SUBROUTINE FIELD_IO_BINARY_FILE_READ_STRING(FILE_ID, TAG_INDEX, STRING_DATA, ERR, ERROR, *)
+
+    !Argument variables
+    TYPE(BINARY_FILE_TYPE), INTENT(IN) :: FILE_ID !<The binary file to read from
+    INTEGER(INTG), INTENT(IN) :: TAG_INDEX !<The expected index of the tag
+    TYPE(VARYING_STRING), INTENT(OUT) :: STRING_DATA !<On exit, the string of the tag
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    CHARACTER(LEN=MAXSTRLEN) :: BUFFER
+    INTEGER(INTG) :: NUMBER_OF_ITEMS, NUMBER_READ, block_size
+
+    ENTERS("FIELD_IO_BINARY_FILE_READ_STRING",ERR,ERROR,*999)
+
+    CALL FIELD_IO_BINARY_FILE_TAG_READ(FILE_ID,TAG_INDEX,CHARACTER_SIZE,NUMBER_OF_ITEMS,ERR,ERROR,*999)
+    STRING_DATA=""
+    NUMBER_READ=0
+    DO WHILE(NUMBER_READ<NUMBER_OF_ITEMS)
+      block_size=MIN(MAXSTRLEN,NUMBER_OF_ITEMS-NUMBER_READ)
+      CALL READ_BINARY_FILE(FILE_ID,block_size,BUFFER,ERR,ERROR,*999)
+      STRING_DATA=STRING_DATA//BUFFER(1:block_size)
+      NUMBER_READ=NUMBER_READ+block_size
+    ENDDO
+
+    EXITS("FIELD_IO_BINARY_FILE_READ_STRING")
+    RETURN
+999 ERRORSEXITS("FIELD_IO_BINARY_FILE_READ_STRING",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FIELD_IO_BINARY_FILE_READ_STRING
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads the header text of an exnode file, which is every line before the first node.
+  SUBROUTINE FieldIO_ExnodeHeaderRead(FILE_NAME, HEADER, ERR, ERROR, *)
+
+    !Argument variables
+    TYPE(VARYING_STRING), INTENT(IN) :: FILE_NAME !<The name of the exnode file, including the extension
+    TYPE(VARYING_STRING), INTENT(OUT) :: HEADER !<On exit, the header text, one line after another separated by new lines
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    CHARACTER(LEN=MAXSTRLEN) :: LINE
+    INTEGER(INTG) :: FILE_UNIT, IOS
+
+    ENTERS("FieldIO_ExnodeHeaderRead",ERR,ERROR,*999)
+
+    FILE_UNIT=-1
+    OPEN(NEWUNIT=FILE_UNIT,FILE=CHAR(FILE_NAME),STATUS="OLD",ACTION="READ",FORM="FORMATTED",IOSTAT=IOS)
+    IF(IOS/=0) THEN
+      FILE_UNIT=-1
+      CALL FlagError("Could not open "//FILE_NAME//".",ERR,ERROR,*999)
+    ENDIF
+    HEADER=""
+    DO
+      READ(FILE_UNIT,"(A)",IOSTAT=IOS) LINE
+      IF(IOS/=0) EXIT
+      IF(INDEX(ADJUSTL(LINE),"Node:")==1) EXIT
+      HEADER=HEADER//TRIM(LINE)//CHAR(10)
+    ENDDO
+    CLOSE(FILE_UNIT)
+
+    EXITS("FieldIO_ExnodeHeaderRead")
+    RETURN
+999 ERRORSEXITS("FieldIO_ExnodeHeaderRead",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FieldIO_ExnodeHeaderRead
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Converts an exnode text file into a CMISS binary node file BINARY_FILE_NAME.binnode. The header text before the first node is
+  !>kept verbatim, and the node numbers, value counts and values are stored as blocks of native integers and doubles, so reading
+  !>them back is exact and needs no parsing.
+  SUBROUTINE FIELD_IO_EXNODE_TO_BINARY(EXNODE_FILE_NAME, BINARY_FILE_NAME, ERR, ERROR, *)
+
+    !Argument variables
+    TYPE(VARYING_STRING), INTENT(IN) :: EXNODE_FILE_NAME !<The name of the exnode file to convert, including the extension
+    TYPE(VARYING_STRING), INTENT(IN) :: BINARY_FILE_NAME !<The name of the binary file to write, without the .binnode extension
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(BINARY_FILE_TYPE) :: FILE_ID
+    TYPE(VARYING_STRING) :: DUMMY_ERROR, HEADER, LOCAL_ERROR
+    INTEGER(INTG) :: DUMMY_ERR, HANDLE, IMPORT_ERROR, NUMBER_OF_NODES, NUMBER_OF_TAGS, NUMBER_OF_VALUES
+    INTEGER(INTG), ALLOCATABLE :: NODE_NUMBERS(:), VALUE_COUNTS(:)
+    REAL(DP), ALLOCATABLE :: VALUES(:)
+
+    ENTERS("FIELD_IO_EXNODE_TO_BINARY",ERR,ERROR,*999)
+
+    HANDLE=-1
+    CALL FieldIO_ExnodeHeaderRead(EXNODE_FILE_NAME,HEADER,ERR,ERROR,*999)
+    !The node records are read by the same parser as the parallel import, as a single rank.
+    IMPORT_ERROR=FieldImport_OpenSession(IMPORT_TYPE_NODES,CHAR(EXNODE_FILE_NAME)//C_NULL_CHAR,0,1,HANDLE)
+    IF(IMPORT_ERROR/=FIELD_IMPORT_NO_ERROR) THEN
+      HANDLE=-1
+      LOCAL_ERROR="Could not read "//EXNODE_FILE_NAME//". Import error "// &
+        & TRIM(NUMBER_TO_VSTRING(IMPORT_ERROR,"*",ERR,ERROR))//"."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+    IMPORT_ERROR=FieldImport_RecordCounts(HANDLE,NUMBER_OF_NODES,NUMBER_OF_VALUES)
+    IF(IMPORT_ERROR/=FIELD_IMPORT_NO_ERROR) CALL FlagError("Invalid import session.",ERR,ERROR,*999)
+    ALLOCATE(NODE_NUMBERS(NUMBER_OF_NODES),VALUE_COUNTS(NUMBER_OF_NODES),VALUES(NUMBER_OF_VALUES),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate node records.",ERR,ERROR,*999)
+    IMPORT_ERROR=FieldImport_NodeRecords(HANDLE,NODE_NUMBERS,VALUE_COUNTS,VALUES)
+    IF(IMPORT_ERROR/=FIELD_IMPORT_NO_ERROR) CALL FlagError("Invalid import session.",ERR,ERROR,*999)
+    IMPORT_ERROR=FieldImport_CloseSession(HANDLE)
+    HANDLE=-1
+
+    NUMBER_OF_TAGS=FIELD_IO_BINARY_NUMBER_OF_TAGS
+    CALL FIELD_IO_BINARY_FILE_OPEN(FILE_ID,BINARY_FILE_NAME,"WRITE",NUMBER_OF_TAGS,ERR,ERROR,*999)
+    CALL FIELD_IO_BINARY_FILE_WRITE_STRING(FILE_ID,FIELD_IO_BINARY_HEADER_TAG,"Exnode header",HEADER,ERR,ERROR,*999)
+    CALL FIELD_IO_BINARY_FILE_WRITE_INTG(FILE_ID,FIELD_IO_BINARY_NODE_NUMBERS_TAG,"Node numbers",NODE_NUMBERS, &
+      & ERR,ERROR,*999)
+    CALL FIELD_IO_BINARY_FILE_WRITE_INTG(FILE_ID,FIELD_IO_BINARY_VALUE_COUNTS_TAG,"Node value counts",VALUE_COUNTS, &
+      & ERR,ERROR,*999)
+    CALL FIELD_IO_BINARY_FILE_WRITE_DP(FILE_ID,FIELD_IO_BINARY_VALUES_TAG,"Node values",VALUES,ERR,ERROR,*999)
+    CALL FIELD_IO_BINARY_FILE_CLOSE(FILE_ID,ERR,ERROR,*999)
+    DEALLOCATE(NODE_NUMBERS,VALUE_COUNTS,VALUES)
+
+    EXITS("FIELD_IO_EXNODE_TO_BINARY")
+    RETURN
+999 IF(HANDLE/=-1) IMPORT_ERROR=FieldImport_CloseSession(HANDLE)
+    IF(INQUIRE_OPEN_BINARY_FILE(FILE_ID)) CALL CLOSE_CMISS_BINARY_FILE(FILE_ID,DUMMY_ERR,DUMMY_ERROR,*998)
+998 CALL CHECKED_DEALLOCATE(NODE_NUMBERS)
+    CALL CHECKED_DEALLOCATE(VALUE_COUNTS)
+    CALL CHECKED_DEALLOCATE(VALUES)
+    ERRORSEXITS("FIELD_IO_EXNODE_TO_BINARY",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FIELD_IO_EXNODE_TO_BINARY
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads the exnode header text kept in a CMISS binary node file BINARY_FILE_NAME.binnode, without reading the node records.
+  SUBROUTINE FieldIO_BinaryNodesHeaderRead(BINARY_FILE_NAME, HEADER, ERR, ERROR, *)
+
+    !Argument variables
+    TYPE(VARYING_STRING), INTENT(IN) :: BINARY_FILE_NAME !<The name of the binary file to read, without the .binnode extension
+    TYPE(VARYING_STRING), INTENT(OUT) :: HEADER !<On exit, the exnode header text, one line after another separated by new lines
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(BINARY_FILE_TYPE) :: FILE_ID
+    TYPE(VARYING_STRING) :: DUMMY_ERROR
+    INTEGER(INTG) :: DUMMY_ERR, NUMBER_OF_TAGS
+
+    ENTERS("FieldIO_BinaryNodesHeaderRead",ERR,ERROR,*999)
+
+    NUMBER_OF_TAGS=0
+    CALL FIELD_IO_BINARY_FILE_OPEN(FILE_ID,BINARY_FILE_NAME,"READ",NUMBER_OF_TAGS,ERR,ERROR,*999)
+    IF(NUMBER_OF_TAGS/=FIELD_IO_BINARY_NUMBER_OF_TAGS) &
+      & CALL FlagError("Invalid number of tags in "//BINARY_FILE_NAME//".binnode.",ERR,ERROR,*999)
+    CALL FIELD_IO_BINARY_FILE_READ_STRING(FILE_ID,FIELD_IO_BINARY_HEADER_TAG,HEADER,ERR,ERROR,*999)
+    CALL FIELD_IO_BINARY_FILE_CLOSE(FILE_ID,ERR,ERROR,*999)
+
+    EXITS("FieldIO_BinaryNodesHeaderRead")
+    RETURN
+999 IF(INQUIRE_OPEN_BINARY_FILE(FILE_ID)) CALL CLOSE_CMISS_BINARY_FILE(FILE_ID,DUMMY_ERR,DUMMY_ERROR,*998)
+998 ERRORSEXITS("FieldIO_BinaryNodesHeaderRead",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FieldIO_BinaryNodesHeaderRead
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads the header text and a share of the node records of a CMISS binary node file BINARY_FILE_NAME.binnode written by
+  !>FIELD_IO_EXNODE_TO_BINARY. The node records are split into NUMBER_OF_PARTS shares of nearly equal numbers of nodes, and the
+  !>PART_NUMBER'th share is returned in the same layout as the exnode import reads the records. Use a PART_NUMBER of 0 and a
+  !>NUMBER_OF_PARTS of 1 to read all the nodes. The file is mapped into memory where the system allows it, so only the pages
+  !>holding the share are read from disk and copied.
+  SUBROUTINE FIELD_IO_BINARY_NODES_READ(BINARY_FILE_NAME, PART_NUMBER, NUMBER_OF_PARTS, HEADER, NODE_NUMBERS, VALUE_COUNTS, &
+    & VALUES, ERR, ERROR, *)
+
+    !Argument variables
+    TYPE(VARYING_STRING), INTENT(IN) :: BINARY_FILE_NAME !<The name of the binary file to read, without the .binnode extension
+    INTEGER(INTG), INTENT(IN) :: PART_NUMBER !<The share of the nodes to read, from 0 to NUMBER_OF_PARTS-1
+    INTEGER(INTG), INTENT(IN) :: NUMBER_OF_PARTS !<The number of shares to split the nodes into
+    TYPE(VARYING_STRING), INTENT(OUT) :: HEADER !<On exit, the exnode header text, one line after another separated by new lines
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: NODE_NUMBERS(:) !<On exit, the node numbers of the records in the share
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: VALUE_COUNTS(:) !<On exit, the number of values of each node in the share
+    REAL(DP), ALLOCATABLE, INTENT(OUT) :: VALUES(:) !<On exit, the values of the nodes in the share, one node after another
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(BINARY_FILE_TYPE) :: FILE_ID
+    TYPE(VARYING_STRING) :: DUMMY_ERROR
+    INTEGER(INTG) :: DUMMY_ERR, NUMBER_OF_ITEMS, NUMBER_OF_NODES, NUMBER_OF_TAGS, NUMBER_OF_VALUES
+    INTEGER(INTG) :: first_node, first_value, last_node, last_value
+    INTEGER(INTG), POINTER :: FILE_NODE_NUMBERS(:), FILE_VALUE_COUNTS(:)
+    REAL(DP), POINTER :: FILE_VALUES(:)
+
+    ENTERS("FIELD_IO_BINARY_NODES_READ",ERR,ERROR,*999)
+
+    NULLIFY(FILE_NODE_NUMBERS)
+    NULLIFY(FILE_VALUE_COUNTS)
+    NULLIFY(FILE_VALUES)
+    IF(NUMBER_OF_PARTS<1.OR.PART_NUMBER<0.OR.PART_NUMBER>=NUMBER_OF_PARTS) &
+      & CALL FlagError("Invalid part number or number of parts.",ERR,ERROR,*999)
+    NUMBER_OF_TAGS=0
+    CALL FIELD_IO_BINARY_FILE_OPEN(FILE_ID,BINARY_FILE_NAME,"READ_MAPPED",NUMBER_OF_TAGS,ERR,ERROR,*999)
+    IF(NUMBER_OF_TAGS/=FIELD_IO_BINARY_NUMBER_OF_TAGS) &
+      & CALL FlagError("Invalid number of tags in "//BINARY_FILE_NAME//".binnode.",ERR,ERROR,*999)
+    CALL FIELD_IO_BINARY_FILE_READ_STRING(FILE_ID,FIELD_IO_BINARY_HEADER_TAG,HEADER,ERR,ERROR,*999)
+    CALL FIELD_IO_BINARY_FILE_TAG_READ(FILE_ID,FIELD_IO_BINARY_NODE_NUMBERS_TAG,INTEGER_SIZE,NUMBER_OF_NODES,ERR,ERROR,*999)
+    CALL READ_BINARY_FILE_POINTER(FILE_ID,NUMBER_OF_NODES,FILE_NODE_NUMBERS,ERR,ERROR,*999)
+    CALL FIELD_IO_BINARY_FILE_TAG_READ(FILE_ID,FIELD_IO_BINARY_VALUE_COUNTS_TAG,INTEGER_SIZE,NUMBER_OF_ITEMS,ERR,ERROR,*999)
+    IF(NUMBER_OF_ITEMS/=NUMBER_OF_NODES) &
+      & CALL FlagError("The node records in "//BINARY_FILE_NAME//".binnode are inconsistent.",ERR,ERROR,*999)
+    CALL READ_BINARY_FILE_POINTER(FILE_ID,NUMBER_OF_NODES,FILE_VALUE_COUNTS,ERR,ERROR,*999)
+    CALL FIELD_IO_BINARY_FILE_TAG_READ(FILE_ID,FIELD_IO_BINARY_VALUES_TAG,DOUBLE_REAL_SIZE,NUMBER_OF_VALUES,ERR,ERROR,*999)
+    IF(ANY(FILE_VALUE_COUNTS<0).OR.SUM(FILE_VALUE_COUNTS)/=NUMBER_OF_VALUES) &
+      & CALL FlagError("The node records in "//BINARY_FILE_NAME//".binnode are inconsistent.",ERR,ERROR,*999)
+    CALL READ_BINARY_FILE_POINTER(FILE_ID,NUMBER_OF_VALUES,FILE_VALUES,ERR,ERROR,*999)
+    first_node=INT(INT(PART_NUMBER,LINTG)*NUMBER_OF_NODES/NUMBER_OF_PARTS,INTG)+1
+    last_node=INT(INT(PART_NUMBER+1,LINTG)*NUMBER_OF_NODES/NUMBER_OF_PARTS,INTG)
+    first_value=SUM(FILE_VALUE_COUNTS(1:first_node-1))+1
+    last_value=first_value+SUM(FILE_VALUE_COUNTS(first_node:last_node))-1
+    ALLOCATE(NODE_NUMBERS(last_node-first_node+1),VALUE_COUNTS(last_node-first_node+1),VALUES(last_value-first_value+1), &
+      & STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate node records.",ERR,ERROR,*999)
+    NODE_NUMBERS=FILE_NODE_NUMBERS(first_node:last_node)
+    VALUE_COUNTS=FILE_VALUE_COUNTS(first_node:last_node)
+    VALUES=FILE_VALUES(first_value:last_value)
+    CALL RELEASE_BINARY_FILE_POINTER(FILE_ID,FILE_NODE_NUMBERS,ERR,ERROR,*999)
+    CALL RELEASE_BINARY_FILE_POINTER(FILE_ID,FILE_VALUE_COUNTS,ERR,ERROR,*999)
+    CALL RELEASE_BINARY_FILE_POINTER(FILE_ID,FILE_VALUES,ERR,ERROR,*999)
+    CALL FIELD_IO_BINARY_FILE_CLOSE(FILE_ID,ERR,ERROR,*999)
+
+    EXITS("FIELD_IO_BINARY_NODES_READ")
+    RETURN
+999 IF(ASSOCIATED(FILE_NODE_NUMBERS)) CALL RELEASE_BINARY_FILE_POINTER(FILE_ID,FILE_NODE_NUMBERS,DUMMY_ERR,DUMMY_ERROR,*997)
+997 IF(ASSOCIATED(FILE_VALUE_COUNTS)) CALL RELEASE_BINARY_FILE_POINTER(FILE_ID,FILE_VALUE_COUNTS,DUMMY_ERR,DUMMY_ERROR,*996)
+996 IF(ASSOCIATED(FILE_VALUES)) CALL RELEASE_BINARY_FILE_POINTER(FILE_ID,FILE_VALUES,DUMMY_ERR,DUMMY_ERROR,*995)
+995 IF(INQUIRE_OPEN_BINARY_FILE(FILE_ID)) CALL CLOSE_CMISS_BINARY_FILE(FILE_ID,DUMMY_ERR,DUMMY_ERROR,*998)
+998 CALL CHECKED_DEALLOCATE(NODE_NUMBERS)
+    CALL CHECKED_DEALLOCATE(VALUE_COUNTS)
+    CALL CHECKED_DEALLOCATE(VALUES)
+    ERRORSEXITS("FIELD_IO_BINARY_NODES_READ",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FIELD_IO_BINARY_NODES_READ
+
   SUBROUTINE STRING_TO_MUTI_INTEGERS_VS(STRING, NUMBER_OF_INTEGERS, INTG_DATA, ERR, ERROR, *)
 
     !#### Function: STRING_TO_INTEGER_VS
@@ -6170,6 +7623,7 @@ CONTAINS
     TYPE(FIELD_IO_INFO_SET) :: NODAL_INFO_SET !<nodal information in this process
     INTEGER(INTG):: my_computational_node_number !<local process number
     INTEGER(INTG):: computational_node_numbers   !<total process number
+    INTEGER(INTG) :: exportType
 
     ENTERS("FIELD_IO_NODES_EXPORT", ERR,ERROR,*999)
 
@@ -6179,11 +7633,18 @@ CONTAINS
     !Get my computational node number
     my_computational_node_number=COMPUTATIONAL_NODE_NUMBER_GET(ERR,ERROR)
     IF(ERR/=0) GOTO 999
-    IF(METHOD=="FORTRAN") THEN
+    IF(METHOD=="FORTRAN".OR.METHOD=="BINARY") THEN
+      !The binary method writes the same headers as the text exnode file to a <name>.part<rank>.exnode.json index, with the
+      !node values written as raw doubles to <name>.part<rank>.exnode.bin
+      IF(METHOD=="BINARY") THEN
+        exportType=EXPORT_TYPE_BINARY_FILE
+      ELSE
+        exportType=EXPORT_TYPE_FILE
+      ENDIF
       CALL FIELD_IO_INFO_SET_INITIALISE(NODAL_INFO_SET, ERR,ERROR,*999)
       CALL FieldIO_NodelInfoSetAttachLocalProcess(NODAL_INFO_SET, FIELDS, my_computational_node_number, ERR,ERROR,*999)
       CALL FIELD_IO_NODAL_INFO_SET_SORT(NODAL_INFO_SET, my_computational_node_number, ERR,ERROR,*999)
-      CALL FIELD_IO_EXPORT_NODES_INTO_LOCAL_FILE(NODAL_INFO_SET, FILE_NAME, my_computational_node_number, &
+      CALL FIELD_IO_EXPORT_NODES_INTO_LOCAL_FILE(NODAL_INFO_SET, FILE_NAME, my_computational_node_number, exportType, &
           & ERR, ERROR, *999)
       CALL FIELD_IO_INFO_SET_INITIALISE(NODAL_INFO_SET, ERR,ERROR,*999)
     ELSE IF(METHOD=="MPIIO") THEN
@@ -6229,7 +7690,8 @@ CONTAINS
     !Get my computational node number
     my_computational_node_number=COMPUTATIONAL_NODE_NUMBER_GET(ERR,ERROR)
     IF(ERR/=0) GOTO 999
-    IF(METHOD=="FORTRAN") THEN
+    !The element topology is always written as text. The binary method only changes how the nodal values are written.
+    IF(METHOD=="FORTRAN".OR.METHOD=="BINARY") THEN
       CALL FIELD_IO_INFO_SET_INITIALISE( LOCAL_PROCESS_ELEMENTAL_INFO_SET, ERR, ERROR, *999 )
       CALL FieldIO_ElementalInfoSetAttachLocalProcess( LOCAL_PROCESS_ELEMENTAL_INFO_SET, FIELDS, ERR, ERROR, *999 )
       CALL FIELD_IO_ELEMENTAL_INFO_SET_SORT(LOCAL_PROCESS_ELEMENTAL_INFO_SET, my_computational_node_number, ERR,ERROR,*999)
@@ -6252,4 +7714,61 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Sets whether the node and element exports started from now on are written asynchronously. An asynchronous export
+  !>returns once its output has been formatted into buffers, which a background thread then writes out, so that the
+  !>calculation can carry on while the files are written. The number of buffers waiting to be written is bounded, beyond
+  !>which an export waits for the writer. \see OPENCMISS::cmfe_Fields_ExportAsynchronousSet
+  SUBROUTINE FIELD_IO_EXPORT_ASYNCHRONOUS_SET(ASYNCHRONOUS, ERR,ERROR,*)
+    !Argument variables
+    LOGICAL, INTENT(IN) :: ASYNCHRONOUS !<If .TRUE. the exports are written asynchronously
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+
+    ENTERS("FIELD_IO_EXPORT_ASYNCHRONOUS_SET", ERR,ERROR,*999)
+
+    IF(ASYNCHRONOUS) THEN
+      ERR = FieldExport_AsynchronousSet( 1_C_INT )
+    ELSE
+      ERR = FieldExport_AsynchronousSet( 0_C_INT )
+    ENDIF
+    IF(ERR/=0) THEN
+      CALL FlagError( "Cannot set the asynchronous export mode", ERR, ERROR,*999 )
+    ENDIF
+
+    EXITS("FIELD_IO_EXPORT_ASYNCHRONOUS_SET")
+    RETURN
+999 ERRORSEXITS("FIELD_IO_EXPORT_ASYNCHRONOUS_SET",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FIELD_IO_EXPORT_ASYNCHRONOUS_SET
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Waits until all asynchronous exports have been written and their files closed. Errors writing the files are reported
+  !>here rather than by the exports themselves. \see OPENCMISS::cmfe_Fields_ExportWait
+  SUBROUTINE FIELD_IO_EXPORT_WAIT(ERR,ERROR,*)
+    !Argument variables
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+
+    ENTERS("FIELD_IO_EXPORT_WAIT", ERR,ERROR,*999)
+
+    ERR = FieldExport_Wait()
+    IF(ERR/=0) THEN
+      CALL FlagError( "Cannot write an asynchronously exported file", ERR, ERROR,*999 )
+    ENDIF
+
+    EXITS("FIELD_IO_EXPORT_WAIT")
+    RETURN
+999 ERRORSEXITS("FIELD_IO_EXPORT_WAIT",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE FIELD_IO_EXPORT_WAIT
+
+  !
+  !================================================================================================================================
+  !
+
 END MODULE FIELD_IO_ROUTINES
@@ -60,6 +60,7 @@ MODULE FIELDML_INPUT_ROUTINES
   USE MESH_ROUTINES
   USE NODE_ROUTINES
   USE REGION_ROUTINES
+  USE SORTING
   USE STRINGS
 
 #include "macros.h"  
@@ -78,6 +79,8 @@ MODULE FIELDML_INPUT_ROUTINES
     & FieldmlInput_CoordinateSystemCreateStart, FIELDML_INPUT_BASIS_CREATE_START, FIELDML_INPUT_CREATE_MESH_COMPONENT, &
     & FIELDML_INPUT_FIELD_CREATE_START, FIELDML_INPUT_FIELD_PARAMETERS_UPDATE, FIELDML_INPUT_NODES_CREATE_START
 
+  PUBLIC :: FieldmlInput_ReadCacheSet
+
 CONTAINS
 
   !
@@ -1183,7 +1186,7 @@ CONTAINS
   SUBROUTINE FIELDML_INPUT_FIELD_PARAMETERS_UPDATE(FIELDML_INFO, EVALUATOR_NAME, FIELD, VARIABLE_TYPE, SET_TYPE, &
     & ERR, ERROR, * )
     !Argument variables
-    TYPE(FIELDML_IO_TYPE), INTENT(INOUT) :: FIELDML_INFO !<The FieldML parsing state.
+    TYPE(FIELDML_IO_TYPE), POINTER :: FIELDML_INFO !<The FieldML parsing state.
     TYPE(VARYING_STRING), INTENT(IN) :: EVALUATOR_NAME !<The name of the nodal dofs evaluator.
     TYPE(FIELD_TYPE), POINTER, INTENT(INOUT) :: FIELD !<The field whose parameters are to be updated.
     INTEGER(INTG), INTENT(IN) :: VARIABLE_TYPE !<The OpenCMISS variable type.
@@ -1196,6 +1199,8 @@ CONTAINS
 
     ENTERS("FIELDML_INPUT_FIELD_PARAMETERS_UPDATE",ERR,ERROR,*999)
 
+    CALL FIELDML_ASSERT_IS_IN( FIELDML_INFO, ERR, ERROR, *999 )
+
     IF(ASSOCIATED(FIELD)) THEN
       CALL FIELD_NUMBER_OF_COMPONENTS_GET(FIELD,VARIABLE_TYPE,NUMBER_OF_COMPONENTS,ERR,ERROR,*999)
       IF(NUMBER_OF_COMPONENTS>0) THEN
@@ -1239,11 +1244,12 @@ CONTAINS
   !================================================================================================================================
   !
 
-  !>Update the given field's nodal parameters using the given parameter evaluator.
+  !>Update the given field's nodal parameters using the given parameter evaluator. Only the rows of the nodal dofs array for the
+  !>local and ghost nodes of this computational node's domain are read, through the FieldML input read cache.
   SUBROUTINE FieldmlInput_FieldNodalParametersUpdate( FIELDML_INFO, EVALUATOR_NAME, FIELD, VARIABLE_TYPE, SET_TYPE, &
     & ERR, ERROR, * )
     !Arguments
-    TYPE(FIELDML_IO_TYPE), INTENT(INOUT) :: FIELDML_INFO !<The FieldML parsing state.
+    TYPE(FIELDML_IO_TYPE), POINTER :: FIELDML_INFO !<The FieldML parsing state.
     TYPE(VARYING_STRING), INTENT(IN) :: EVALUATOR_NAME !<The name of the nodal dofs evaluator.
     TYPE(FIELD_TYPE), POINTER, INTENT(INOUT) :: FIELD !<The field whose parameters are to be updated.
     INTEGER(INTG), INTENT(IN) :: VARIABLE_TYPE !<The OpenCMISS variable type.
@@ -1254,12 +1260,13 @@ CONTAINS
     !Locals
     TYPE(MESH_TYPE), POINTER :: MESH
     TYPE(NODES_TYPE), POINTER :: NODES
-    INTEGER(INTG) :: NODAL_DOFS_HANDLE, DATA_SOURCE, FML_ERR, RANK
-    INTEGER(INTG) :: VERSION_NUMBER,COMPONENT_NUMBER, NODE_NUMBER, FIELD_DIMENSIONS, MESH_NODE_COUNT
-    INTEGER(INTG), TARGET :: OFFSETS(2), SIZES(2)
-    REAL(C_DOUBLE), ALLOCATABLE, TARGET :: BUFFER(:)
-    INTEGER(INTG) :: READER
-    INTEGER(INTG) :: myComputationalNodeNumber,nodeDomain,meshComponentNumber
+    TYPE(DOMAIN_TYPE), POINTER :: DOMAIN
+    TYPE(DOMAIN_NODES_TYPE), POINTER :: DOMAIN_NODES
+    INTEGER(INTG) :: NODAL_DOFS_HANDLE, DATA_SOURCE, RANK
+    INTEGER(INTG) :: VERSION_NUMBER,COMPONENT_NUMBER, FIELD_DIMENSIONS, MESH_NODE_COUNT
+    INTEGER(INTG) :: meshComponentNumber,node_idx,numberOfLocalNodes
+    INTEGER(INTG), ALLOCATABLE :: ROW_NUMBERS(:),ROW_LOCAL_NODES(:)
+    REAL(DP), ALLOCATABLE :: ROW_VALUES(:)
     
     ENTERS( "FieldmlInput_FieldNodalParametersUpdate", ERR, ERROR, *999 )
     
@@ -1278,62 +1285,62 @@ CONTAINS
       CALL FlagError( "Invalid rank for nodal dofs.", err, ERROR, *999 )
     ENDIF
 
-    READER = Fieldml_OpenReader( FIELDML_INFO%FML_HANDLE, DATA_SOURCE )
-    CALL FIELDML_UTIL_CHECK_FIELDML_ERROR( "Cannot open nodal dofs reader for "//EVALUATOR_NAME//".", &
-      & FIELDML_INFO%FML_HANDLE, ERR, ERROR, *999 )
-    
     CALL FIELD_NUMBER_OF_COMPONENTS_GET( FIELD, VARIABLE_TYPE, FIELD_DIMENSIONS, ERR, ERROR, *999 )
     
-    ALLOCATE( BUFFER( FIELD_DIMENSIONS ), STAT = ERR )
-    IF( ERR /= 0 ) CALL FlagError( "Could not allocate raw nodes buffer for "//EVALUATOR_NAME//".", ERR, ERROR, *999 )
-      
     !TODO Code assumes that the data is dense in both node and component indexes.
     NULLIFY( NODES )
     CALL REGION_NODES_GET( MESH%REGION, NODES, ERR, ERROR, *999 )
     CALL NODES_NUMBER_OF_NODES_GET( NODES, MESH_NODE_COUNT, ERR, ERROR, *999 )
     CALL FIELDML_UTIL_CHECK_FIELDML_ERROR( var_str("Cannot get mesh nodes count for mesh ")//mesh%USER_NUMBER//".", &
       & FIELDML_INFO%FML_HANDLE, ERR, ERROR, *999 )
-    
-    OFFSETS(:) = 0
-    SIZES(1) = 1
-    SIZES(2) = FIELD_DIMENSIONS
-    
-    DO NODE_NUMBER = 1, MESH_NODE_COUNT
-      FML_ERR = Fieldml_ReadDoubleSlab( READER, C_LOC(OFFSETS), C_LOC(SIZES), C_LOC(BUFFER) )
-      OFFSETS(1) = OFFSETS(1) + 1
-      IF( FML_ERR /= FML_ERR_NO_ERROR ) THEN
-        CALL FlagError( "Cannot read nodal dofs from "//EVALUATOR_NAME//"("&
-          & // TRIM(NUMBER_TO_VSTRING(FML_ERR,"*",ERR,ERROR)) //").", ERR, ERROR, *999 )
-      ENDIF
 
+    CALL DECOMPOSITION_MESH_COMPONENT_NUMBER_GET(FIELD%DECOMPOSITION,meshComponentNumber,err,error,*999)
+    DOMAIN=>FIELD%DECOMPOSITION%DOMAIN(meshComponentNumber)%PTR
+    IF(.NOT.ASSOCIATED(DOMAIN)) CALL FlagError("Decomposition domain is not associated.",ERR,ERROR,*999)
+    IF(.NOT.ASSOCIATED(DOMAIN%TOPOLOGY)) CALL FlagError("Domain topology is not associated.",ERR,ERROR,*999)
+    DOMAIN_NODES=>DOMAIN%TOPOLOGY%NODES
+    IF(.NOT.ASSOCIATED(DOMAIN_NODES)) CALL FlagError("Domain topology nodes is not associated.",ERR,ERROR,*999)
+
+    CALL FieldmlInput_ReadCacheOpen( FIELDML_INFO, DATA_SOURCE, MESH_NODE_COUNT, FIELD_DIMENSIONS, ERR, ERROR, *999 )
+
+    numberOfLocalNodes = DOMAIN_NODES%TOTAL_NUMBER_OF_NODES
+    ALLOCATE( ROW_NUMBERS( numberOfLocalNodes ), STAT = ERR )
+    IF( ERR /= 0 ) CALL FlagError( "Could not allocate row numbers for "//EVALUATOR_NAME//".", ERR, ERROR, *999 )
+    ALLOCATE( ROW_LOCAL_NODES( numberOfLocalNodes ), STAT = ERR )
+    IF( ERR /= 0 ) CALL FlagError( "Could not allocate row local nodes for "//EVALUATOR_NAME//".", ERR, ERROR, *999 )
+    ALLOCATE( ROW_VALUES( FIELD_DIMENSIONS ), STAT = ERR )
+    IF( ERR /= 0 ) CALL FlagError( "Could not allocate row values for "//EVALUATOR_NAME//".", ERR, ERROR, *999 )
+
+    !Row n of the nodal dofs array holds the dofs of the node with user number n. Visit the local and ghost nodes in row order
+    !so that each block of rows is read at most once.
+    DO node_idx = 1, numberOfLocalNodes
+      ROW_NUMBERS( node_idx ) = DOMAIN_NODES%NODES( node_idx )%USER_NUMBER
+    ENDDO
+    CALL INTRO_ISORT( ROW_NUMBERS, ROW_LOCAL_NODES, ERR, ERROR, *999 )
+
+    DO node_idx = 1, numberOfLocalNodes
+      CALL FieldmlInput_ReadCacheRowGet( FIELDML_INFO, ROW_NUMBERS( node_idx ), ROW_VALUES, ERR, ERROR, *999 )
       DO COMPONENT_NUMBER = 1, FIELD_DIMENSIONS
         !Default to version 1 of each node derivative (value hardcoded in loop)
         VERSION_NUMBER = 1
-
-        myComputationalNodeNumber = COMPUTATIONAL_NODE_NUMBER_GET(err,error)
-        CALL DECOMPOSITION_MESH_COMPONENT_NUMBER_GET(FIELD%DECOMPOSITION,meshComponentNumber,err,error,*999)
-        CALL DECOMPOSITION_NODE_DOMAIN_GET(FIELD%DECOMPOSITION,NODE_NUMBER,meshComponentNumber,nodeDomain,err,error,*999)
-        IF(nodeDomain==myComputationalNodeNumber) THEN
-          CALL FIELD_PARAMETER_SET_UPDATE_NODE( FIELD, VARIABLE_TYPE, SET_TYPE, VERSION_NUMBER, &
-            & NO_GLOBAL_DERIV, NODE_NUMBER, COMPONENT_NUMBER, BUFFER( COMPONENT_NUMBER ), ERR, ERROR, *999 )
-        ENDIF
-
+        CALL FIELD_PARAMETER_SET_UPDATE_LOCAL_NODE( FIELD, VARIABLE_TYPE, SET_TYPE, VERSION_NUMBER, &
+          & NO_GLOBAL_DERIV, ROW_LOCAL_NODES( node_idx ), COMPONENT_NUMBER, ROW_VALUES( COMPONENT_NUMBER ), &
+          & ERR, ERROR, *999 )
       ENDDO
     ENDDO
     
-    DEALLOCATE( BUFFER )
-  
-    FML_ERR = Fieldml_CloseReader( READER )
-    IF( FML_ERR /= FML_ERR_NO_ERROR ) THEN
-      CALL FlagError( "Error closing nodal dofs reader for "//EVALUATOR_NAME//"("&
-        & // TRIM(NUMBER_TO_VSTRING(FML_ERR,"*",ERR,ERROR)) //").", ERR, ERROR, *999 )
-    ENDIF
+    DEALLOCATE( ROW_NUMBERS )
+    DEALLOCATE( ROW_LOCAL_NODES )
+    DEALLOCATE( ROW_VALUES )
 
     !TODO Set element and constant parameters
     
     EXITS( "FieldmlInput_FieldNodalParametersUpdate" )
     RETURN
-999 ERRORSEXITS( "FieldmlInput_FieldNodalParametersUpdate", ERR, ERROR )
+999 IF( ALLOCATED( ROW_NUMBERS ) ) DEALLOCATE( ROW_NUMBERS )
+    IF( ALLOCATED( ROW_LOCAL_NODES ) ) DEALLOCATE( ROW_LOCAL_NODES )
+    IF( ALLOCATED( ROW_VALUES ) ) DEALLOCATE( ROW_VALUES )
+    ERRORSEXITS( "FieldmlInput_FieldNodalParametersUpdate", ERR, ERROR )
     RETURN 1
   
   END SUBROUTINE FieldmlInput_FieldNodalParametersUpdate
@@ -1342,4 +1349,216 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Sets the size of the read cache used to read FieldML array data sources on demand. Any cached blocks are discarded.
+  SUBROUTINE FieldmlInput_ReadCacheSet( FIELDML_INFO, BLOCK_SIZE, NUMBER_OF_BLOCKS, ERR, ERROR, * )
+    !Arguments
+    TYPE(FIELDML_IO_TYPE), POINTER :: FIELDML_INFO !<The FieldML parsing state.
+    INTEGER(INTG), INTENT(IN) :: BLOCK_SIZE !<The number of array rows to read at a time.
+    INTEGER(INTG), INTENT(IN) :: NUMBER_OF_BLOCKS !<The number of row blocks to hold in the cache.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code.
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
+
+    !Locals
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS( "FieldmlInput_ReadCacheSet", ERR, ERROR, *999 )
+
+    CALL FIELDML_ASSERT_IS_IN( FIELDML_INFO, ERR, ERROR, *999 )
+    IF( BLOCK_SIZE < 1 ) THEN
+      LOCAL_ERROR = "The specified read cache block size of "//TRIM(NUMBER_TO_VSTRING(BLOCK_SIZE,"*",ERR,ERROR))// &
+        & " is invalid. The block size must be >= 1."
+      CALL FlagError( LOCAL_ERROR, ERR, ERROR, *999 )
+    ENDIF
+    IF( NUMBER_OF_BLOCKS < 1 ) THEN
+      LOCAL_ERROR = "The specified number of read cache blocks of "//TRIM(NUMBER_TO_VSTRING(NUMBER_OF_BLOCKS,"*",ERR,ERROR))// &
+        & " is invalid. The number of blocks must be >= 1."
+      CALL FlagError( LOCAL_ERROR, ERR, ERROR, *999 )
+    ENDIF
+
+    CALL FieldmlInput_ReadCacheClose( FIELDML_INFO, ERR, ERROR, *999 )
+    FIELDML_INFO%READ_CACHE_BLOCK_SIZE = BLOCK_SIZE
+    FIELDML_INFO%READ_CACHE_NUMBER_OF_BLOCKS = NUMBER_OF_BLOCKS
+
+    EXITS( "FieldmlInput_ReadCacheSet" )
+    RETURN
+999 ERRORSEXITS( "FieldmlInput_ReadCacheSet", ERR, ERROR )
+    RETURN 1
+
+  END SUBROUTINE FieldmlInput_ReadCacheSet
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Prepares the read cache for reading rows of the given rank 2 array data source. The cached blocks are kept if the cache is
+  !>already open on the data source, so that fields sharing a data source do not read it again.
+  SUBROUTINE FieldmlInput_ReadCacheOpen( FIELDML_INFO, DATA_SOURCE, NUMBER_OF_ROWS, NUMBER_OF_COLUMNS, ERR, ERROR, * )
+    !Arguments
+    TYPE(FIELDML_IO_TYPE), POINTER :: FIELDML_INFO !<The FieldML parsing state.
+    INTEGER(INTG), INTENT(IN) :: DATA_SOURCE !<The FieldML array data source to read.
+    INTEGER(INTG), INTENT(IN) :: NUMBER_OF_ROWS !<The number of rows in the data source.
+    INTEGER(INTG), INTENT(IN) :: NUMBER_OF_COLUMNS !<The number of columns to read from each row.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code.
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
+
+    !Locals
+    INTEGER(INTG) :: entry_idx
+
+    ENTERS( "FieldmlInput_ReadCacheOpen", ERR, ERROR, *999 )
+
+    IF( FIELDML_INFO%READ_CACHE%DATA_SOURCE_HANDLE == DATA_SOURCE .AND. &
+      & FIELDML_INFO%READ_CACHE%NUMBER_OF_ROWS == NUMBER_OF_ROWS .AND. &
+      & FIELDML_INFO%READ_CACHE%NUMBER_OF_COLUMNS == NUMBER_OF_COLUMNS .AND. &
+      & FIELDML_INFO%READ_CACHE%READER_HANDLE /= FML_INVALID_HANDLE ) THEN
+      EXITS( "FieldmlInput_ReadCacheOpen" )
+      RETURN
+    ENDIF
+
+    CALL FieldmlInput_ReadCacheClose( FIELDML_INFO, ERR, ERROR, *999 )
+
+    FIELDML_INFO%READ_CACHE%READER_HANDLE = Fieldml_OpenReader( FIELDML_INFO%FML_HANDLE, DATA_SOURCE )
+    CALL FIELDML_UTIL_CHECK_FIELDML_ERROR( "Cannot open array data source reader.", FIELDML_INFO%FML_HANDLE, &
+      & ERR, ERROR, *999 )
+    FIELDML_INFO%READ_CACHE%DATA_SOURCE_HANDLE = DATA_SOURCE
+    FIELDML_INFO%READ_CACHE%NUMBER_OF_ROWS = NUMBER_OF_ROWS
+    FIELDML_INFO%READ_CACHE%NUMBER_OF_COLUMNS = NUMBER_OF_COLUMNS
+    FIELDML_INFO%READ_CACHE%ACCESS_COUNT = 0
+    FIELDML_INFO%READ_CACHE%NUMBER_OF_BLOCK_READS = 0
+    ALLOCATE( FIELDML_INFO%READ_CACHE%BLOCKS( FIELDML_INFO%READ_CACHE_NUMBER_OF_BLOCKS ), STAT = ERR )
+    IF( ERR /= 0 ) CALL FlagError( "Could not allocate read cache blocks.", ERR, ERROR, *999 )
+    DO entry_idx = 1, FIELDML_INFO%READ_CACHE_NUMBER_OF_BLOCKS
+      FIELDML_INFO%READ_CACHE%BLOCKS( entry_idx )%BLOCK_NUMBER = 0
+      FIELDML_INFO%READ_CACHE%BLOCKS( entry_idx )%LAST_USED = 0
+    ENDDO
+
+    EXITS( "FieldmlInput_ReadCacheOpen" )
+    RETURN
+999 ERRORSEXITS( "FieldmlInput_ReadCacheOpen", ERR, ERROR )
+    RETURN 1
+
+  END SUBROUTINE FieldmlInput_ReadCacheOpen
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Closes the read cache reader and discards the cached blocks.
+  SUBROUTINE FieldmlInput_ReadCacheClose( FIELDML_INFO, ERR, ERROR, * )
+    !Arguments
+    TYPE(FIELDML_IO_TYPE), POINTER :: FIELDML_INFO !<The FieldML parsing state.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code.
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
+
+    !Locals
+    INTEGER(INTG) :: FML_ERR
+
+    ENTERS( "FieldmlInput_ReadCacheClose", ERR, ERROR, *999 )
+
+    IF( FIELDML_INFO%READ_CACHE%READER_HANDLE /= FML_INVALID_HANDLE ) THEN
+      FML_ERR = Fieldml_CloseReader( FIELDML_INFO%READ_CACHE%READER_HANDLE )
+      FIELDML_INFO%READ_CACHE%READER_HANDLE = FML_INVALID_HANDLE
+      IF( FML_ERR /= FML_ERR_NO_ERROR ) THEN
+        CALL FlagError( "Error closing array data source reader ("// &
+          & TRIM(NUMBER_TO_VSTRING(FML_ERR,"*",ERR,ERROR)) //").", ERR, ERROR, *999 )
+      ENDIF
+    ENDIF
+    IF( ALLOCATED( FIELDML_INFO%READ_CACHE%BLOCKS ) ) DEALLOCATE( FIELDML_INFO%READ_CACHE%BLOCKS )
+    FIELDML_INFO%READ_CACHE%DATA_SOURCE_HANDLE = FML_INVALID_HANDLE
+    FIELDML_INFO%READ_CACHE%NUMBER_OF_ROWS = 0
+    FIELDML_INFO%READ_CACHE%NUMBER_OF_COLUMNS = 0
+
+    EXITS( "FieldmlInput_ReadCacheClose" )
+    RETURN
+999 ERRORSEXITS( "FieldmlInput_ReadCacheClose", ERR, ERROR )
+    RETURN 1
+
+  END SUBROUTINE FieldmlInput_ReadCacheClose
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Gets the values of a row of the array data source the read cache is open on. If the block containing the row is not cached
+  !>it is read from the data source, replacing the least recently used block.
+  SUBROUTINE FieldmlInput_ReadCacheRowGet( FIELDML_INFO, ROW_NUMBER, VALUES, ERR, ERROR, * )
+    !Arguments
+    TYPE(FIELDML_IO_TYPE), POINTER :: FIELDML_INFO !<The FieldML parsing state.
+    INTEGER(INTG), INTENT(IN) :: ROW_NUMBER !<The row number to get, starting from 1.
+    REAL(DP), INTENT(OUT) :: VALUES(:) !<VALUES(column_idx). On return, the values of the row.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code.
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
+
+    !Locals
+    INTEGER(INTG) :: BLOCK_NUMBER, BLOCK_SIZE, entry_idx, CACHE_IDX, FIRST_ROW, FML_ERR
+    INTEGER(INTG), TARGET :: OFFSETS(2), SIZES(2)
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS( "FieldmlInput_ReadCacheRowGet", ERR, ERROR, *999 )
+
+    IF( FIELDML_INFO%READ_CACHE%READER_HANDLE == FML_INVALID_HANDLE ) THEN
+      CALL FlagError( "The read cache is not open.", ERR, ERROR, *999 )
+    ENDIF
+    IF( ROW_NUMBER < 1 .OR. ROW_NUMBER > FIELDML_INFO%READ_CACHE%NUMBER_OF_ROWS ) THEN
+      LOCAL_ERROR = "The specified row number of "//TRIM(NUMBER_TO_VSTRING(ROW_NUMBER,"*",ERR,ERROR))// &
+        & " is invalid. The row number must be between 1 and "// &
+        & TRIM(NUMBER_TO_VSTRING(FIELDML_INFO%READ_CACHE%NUMBER_OF_ROWS,"*",ERR,ERROR))//"."
+      CALL FlagError( LOCAL_ERROR, ERR, ERROR, *999 )
+    ENDIF
+    IF( SIZE( VALUES, 1 ) < FIELDML_INFO%READ_CACHE%NUMBER_OF_COLUMNS ) THEN
+      CALL FlagError( "The values array is too small for a row.", ERR, ERROR, *999 )
+    ENDIF
+
+    BLOCK_SIZE = FIELDML_INFO%READ_CACHE_BLOCK_SIZE
+    BLOCK_NUMBER = ( ROW_NUMBER - 1 ) / BLOCK_SIZE + 1
+    FIRST_ROW = ( BLOCK_NUMBER - 1 ) * BLOCK_SIZE + 1
+    FIELDML_INFO%READ_CACHE%ACCESS_COUNT = FIELDML_INFO%READ_CACHE%ACCESS_COUNT + 1
+
+    !Find the block, or else the least recently used entry to read it into.
+    CACHE_IDX = 1
+    DO entry_idx = 1, SIZE( FIELDML_INFO%READ_CACHE%BLOCKS, 1 )
+      IF( FIELDML_INFO%READ_CACHE%BLOCKS( entry_idx )%BLOCK_NUMBER == BLOCK_NUMBER ) THEN
+        CACHE_IDX = entry_idx
+        EXIT
+      ENDIF
+      IF( FIELDML_INFO%READ_CACHE%BLOCKS( entry_idx )%LAST_USED < &
+        & FIELDML_INFO%READ_CACHE%BLOCKS( CACHE_IDX )%LAST_USED ) CACHE_IDX = entry_idx
+    ENDDO
+
+    IF( FIELDML_INFO%READ_CACHE%BLOCKS( CACHE_IDX )%BLOCK_NUMBER /= BLOCK_NUMBER ) THEN
+      IF( .NOT. ALLOCATED( FIELDML_INFO%READ_CACHE%BLOCKS( CACHE_IDX )%VALUES ) ) THEN
+        ALLOCATE( FIELDML_INFO%READ_CACHE%BLOCKS( CACHE_IDX )%VALUES( FIELDML_INFO%READ_CACHE%NUMBER_OF_COLUMNS, &
+          & BLOCK_SIZE ), STAT = ERR )
+        IF( ERR /= 0 ) CALL FlagError( "Could not allocate read cache block values.", ERR, ERROR, *999 )
+      ENDIF
+      !Mark the entry empty until the read succeeds.
+      FIELDML_INFO%READ_CACHE%BLOCKS( CACHE_IDX )%BLOCK_NUMBER = 0
+      OFFSETS(1) = FIRST_ROW - 1
+      OFFSETS(2) = 0
+      SIZES(1) = MIN( BLOCK_SIZE, FIELDML_INFO%READ_CACHE%NUMBER_OF_ROWS - FIRST_ROW + 1 )
+      SIZES(2) = FIELDML_INFO%READ_CACHE%NUMBER_OF_COLUMNS
+      FML_ERR = Fieldml_ReadDoubleSlab( FIELDML_INFO%READ_CACHE%READER_HANDLE, C_LOC(OFFSETS), C_LOC(SIZES), &
+        & C_LOC(FIELDML_INFO%READ_CACHE%BLOCKS( CACHE_IDX )%VALUES) )
+      IF( FML_ERR /= FML_ERR_NO_ERROR ) THEN
+        CALL FlagError( "Cannot read array data source rows ("// &
+          & TRIM(NUMBER_TO_VSTRING(FML_ERR,"*",ERR,ERROR)) //").", ERR, ERROR, *999 )
+      ENDIF
+      FIELDML_INFO%READ_CACHE%BLOCKS( CACHE_IDX )%BLOCK_NUMBER = BLOCK_NUMBER
+      FIELDML_INFO%READ_CACHE%NUMBER_OF_BLOCK_READS = FIELDML_INFO%READ_CACHE%NUMBER_OF_BLOCK_READS + 1
+    ENDIF
+
+    FIELDML_INFO%READ_CACHE%BLOCKS( CACHE_IDX )%LAST_USED = FIELDML_INFO%READ_CACHE%ACCESS_COUNT
+    VALUES( 1:FIELDML_INFO%READ_CACHE%NUMBER_OF_COLUMNS ) = &
+      & FIELDML_INFO%READ_CACHE%BLOCKS( CACHE_IDX )%VALUES( :, ROW_NUMBER - FIRST_ROW + 1 )
+
+    EXITS( "FieldmlInput_ReadCacheRowGet" )
+    RETURN
+999 ERRORSEXITS( "FieldmlInput_ReadCacheRowGet", ERR, ERROR )
+    RETURN 1
+
+  END SUBROUTINE FieldmlInput_ReadCacheRowGet
+
+  !
+  !================================================================================================================================
+  !
+
 END MODULE FIELDML_INPUT_ROUTINES
@@ -62,13 +62,25 @@ MODULE FIELDML_OUTPUT_ROUTINES
   USE REGION_ROUTINES
   USE STRINGS
   USE TYPES
+#ifndef NOMPIMOD
+  USE MPI
+#endif
+  USE CMISS_MPI
 
 #include "macros.h"  
 
   IMPLICIT NONE
 
+#ifdef NOMPIMOD
+#include "mpif.h"
+#endif
+
   PRIVATE
 
+  !Module parameters
+
+  INTEGER(INTG), PARAMETER :: FIELDML_OUTPUT_SLAB_ROWS=4096 !<The number of array rows written by each call to a FieldML array writer.
+
   !Interfaces
   TYPE CONNECTIVITY_INFO_TYPE
     INTEGER(INTG) :: CONNECTIVITY_HANDLE !<The basis connectivity evaluator handle.
@@ -1501,7 +1513,50 @@ CONTAINS
   !================================================================================================================================
   !
   
+  !>Gets the block of node rows of a nodal dofs array that a rank writes. With a parallel format the rows are split evenly
+  !>over the ranks, otherwise the first rank writes them all.
+  SUBROUTINE FieldmlOutputNodeRowBlockGet( rank, nodeCount, numberOfRanks, isParallelFormat, blockStart, blockCount, &
+    & err, error, * )
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: rank !<The rank to get the block of rows for.
+    INTEGER(INTG), INTENT(IN) :: nodeCount !<The number of node rows in the array.
+    INTEGER(INTG), INTENT(IN) :: numberOfRanks !<The number of ranks.
+    LOGICAL, INTENT(IN) :: isParallelFormat !<If .TRUE. every rank writes a block of rows, if .FALSE. the first rank writes all of them.
+    INTEGER(INTG), INTENT(OUT) :: blockStart !<On return, the number of rows before the rank's block.
+    INTEGER(INTG), INTENT(OUT) :: blockCount !<On return, the number of rows in the rank's block.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string.
+
+    ENTERS( "FieldmlOutputNodeRowBlockGet", err, error, *999 )
+
+    IF( rank < 0 .OR. rank >= numberOfRanks ) CALL FlagError( "Invalid rank for a block of node rows.", err, error, *999 )
+    IF( isParallelFormat ) THEN
+      blockStart = ( nodeCount / numberOfRanks ) * rank + MIN( rank, MOD( nodeCount, numberOfRanks ) )
+      blockCount = nodeCount / numberOfRanks
+      IF( rank < MOD( nodeCount, numberOfRanks ) ) blockCount = blockCount + 1
+    ELSE IF( rank == 0 ) THEN
+      blockStart = 0
+      blockCount = nodeCount
+    ELSE
+      blockStart = nodeCount
+      blockCount = 0
+    ENDIF
+
+    EXITS( "FieldmlOutputNodeRowBlockGet" )
+    RETURN
+999 ERRORSEXITS( "FieldmlOutputNodeRowBlockGet", err, error )
+    RETURN 1
+
+  END SUBROUTINE FieldmlOutputNodeRowBlockGet
+
+  !
+  !================================================================================================================================
+  !
+
   !>Create a parameter evaluator and associated data source containing the nodal dofs for the given field components.
+  !>The dofs are written in slabs of FIELDML_OUTPUT_SLAB_ROWS nodes. With the "PHDF5" format every rank writes its own
+  !>contiguous block of node rows to the shared file, other formats are written by the first rank only. In both cases the
+  !>node values are first sent from the ranks that own them to the rank writing their rows.
   SUBROUTINE FIELDML_OUTPUT_ADD_FIELD_NODE_DOFS( FIELDML_INFO, BASE_NAME, DOF_FORMAT, TYPE_HANDLE, FIELD, &
     & FIELD_COMPONENT_NUMBERS, VARIABLE_TYPE, SET_TYPE, NODE_DOFS_HANDLE, ERR, ERROR, * )
     !Argument variables
@@ -1524,13 +1579,18 @@ CONTAINS
     INTEGER(INTG), ALLOCATABLE :: MESH_COMPONENT_NUMBERS(:)
     INTEGER(INTG), TARGET :: SIZES(2), OFFSETS(2), SINGLE_SIZE
     INTEGER(INTG) :: WRITER, FML_ERR
-    REAL(C_DOUBLE), ALLOCATABLE, TARGET :: DBUFFER(:)
     REAL(C_DOUBLE) :: DVALUE
     LOGICAL :: NODE_EXISTS
     LOGICAL, ALLOCATABLE :: IS_NODE_BASED(:)
     TYPE(C_PTR) :: SIZE_POINTER
     TYPE(VARYING_STRING) :: ARRAY_LOCATION
     INTEGER(INTG) :: myComputationalNodeNumber,nodeDomain,meshComponentNumber
+    INTEGER(INTG) :: numberOfComputationalNodes,numberOfOwnedNodes,blockStart,blockCount,rowCount,rowOffset,rankIdx,mpiIError
+    INTEGER(INTG), ALLOCATABLE :: ownedNodes(:),receiveNodes(:),sendCounts(:),sendDisplacements(:),receiveCounts(:), &
+      & receiveDisplacements(:)
+    REAL(C_DOUBLE), ALLOCATABLE :: sendValues(:),receiveValues(:)
+    REAL(C_DOUBLE), ALLOCATABLE, TARGET :: blockValues(:)
+    LOGICAL :: isParallelFormat
 
     ENTERS( "FIELDML_OUTPUT_ADD_FIELD_NODE_DOFS", ERR, ERROR, *999 )
     
@@ -1608,55 +1668,137 @@ CONTAINS
         & FIELDML_INFO%FML_HANDLE, ERR, ERROR, *999 )
     ENDIF
 
-    ALLOCATE( DBUFFER( COMPONENT_COUNT ), STAT = ERR )
-    IF( ERR /= 0 ) CALL FlagError( "Could not allocate nodal dofs array.", ERR, ERROR, *999 )
-    WRITER = Fieldml_OpenArrayWriter( FIELDML_INFO%FML_HANDLE, SOURCE_HANDLE, REAL_1D_HANDLE, 0, SIZE_POINTER, RANK )
-    CALL FIELDML_UTIL_CHECK_FIELDML_ERROR( "Cannot open nodal parameter writer for "//BASE_NAME//".dofs.node.data.", &
-      & FIELDML_INFO%FML_HANDLE, ERR, ERROR, *999 )
-      
-    OFFSETS(:) = 0
-    SIZES(1) = 1
-    SIZES(2) = COMPONENT_COUNT
+    numberOfComputationalNodes = COMPUTATIONAL_NODES_NUMBER_GET( ERR, ERROR )
+    IF(ERR/=0) GOTO 999
+    myComputationalNodeNumber = COMPUTATIONAL_NODE_NUMBER_GET( ERR, ERROR )
+    IF(ERR/=0) GOTO 999
+    CALL DECOMPOSITION_MESH_COMPONENT_NUMBER_GET( FIELD%DECOMPOSITION, meshComponentNumber, ERR, ERROR, *999 )
+    isParallelFormat = ( DOF_FORMAT == "PHDF5" )
+
+    !Find the nodes owned by this rank, in node order so they are also grouped by the rank writing them.
+    ALLOCATE( ownedNodes( NODE_COUNT ), STAT = ERR )
+    IF( ERR /= 0 ) CALL FlagError( "Could not allocate owned nodes array.", ERR, ERROR, *999 )
+    ALLOCATE( sendCounts( numberOfComputationalNodes ), sendDisplacements( numberOfComputationalNodes ), &
+      & receiveCounts( numberOfComputationalNodes ), receiveDisplacements( numberOfComputationalNodes ), STAT = ERR )
+    IF( ERR /= 0 ) CALL FlagError( "Could not allocate nodal dofs exchange counts.", ERR, ERROR, *999 )
+    sendCounts = 0
+    numberOfOwnedNodes = 0
+    rankIdx = 0
+    CALL FieldmlOutputNodeRowBlockGet( rankIdx, NODE_COUNT, numberOfComputationalNodes, isParallelFormat, &
+      & blockStart, blockCount, ERR, ERROR, *999 )
     DO I = 1, NODE_COUNT
+      CALL MeshTopologyNodeCheckExists( MESH, meshComponentNumber, I, NODE_EXISTS, GLOBAL_NODE_NUMBER, ERR, ERROR, *999 )
+      IF( NODE_EXISTS ) THEN
+        CALL DECOMPOSITION_NODE_DOMAIN_GET( FIELD%DECOMPOSITION, I, meshComponentNumber, nodeDomain, ERR, ERROR, *999 )
+        IF( nodeDomain == myComputationalNodeNumber ) THEN
+          numberOfOwnedNodes = numberOfOwnedNodes + 1
+          ownedNodes( numberOfOwnedNodes ) = I
+          DO WHILE( I > blockStart + blockCount )
+            rankIdx = rankIdx + 1
+            CALL FieldmlOutputNodeRowBlockGet( rankIdx, NODE_COUNT, numberOfComputationalNodes, isParallelFormat, &
+              & blockStart, blockCount, ERR, ERROR, *999 )
+          ENDDO
+          sendCounts( rankIdx + 1 ) = sendCounts( rankIdx + 1 ) + 1
+        ENDIF
+      ENDIF
+    ENDDO
+
+    ALLOCATE( sendValues( numberOfOwnedNodes * COMPONENT_COUNT ), STAT = ERR )
+    IF( ERR /= 0 ) CALL FlagError( "Could not allocate nodal dofs send buffer.", ERR, ERROR, *999 )
+    DO I = 1, numberOfOwnedNodes
       DO J = 1, COMPONENT_COUNT
         DVALUE = 0
         IF( IS_NODE_BASED(J) ) THEN
-          CALL MeshTopologyNodeCheckExists( MESH, MESH_COMPONENT_NUMBERS(J), I, NODE_EXISTS, GLOBAL_NODE_NUMBER, &
+          CALL MeshTopologyNodeCheckExists( MESH, MESH_COMPONENT_NUMBERS(J), ownedNodes(I), NODE_EXISTS, GLOBAL_NODE_NUMBER, &
             & ERR, ERROR, *999 )
           IF( NODE_EXISTS ) THEN
             !Default to version 1 of each node derivative (value hardcoded in loop)
             VERSION_NUMBER = 1
-
-            myComputationalNodeNumber = COMPUTATIONAL_NODE_NUMBER_GET(err,error)
-            CALL DECOMPOSITION_MESH_COMPONENT_NUMBER_GET(FIELD%DECOMPOSITION,meshComponentNumber,err,error,*999)
-            CALL DECOMPOSITION_NODE_DOMAIN_GET(FIELD%DECOMPOSITION,I,meshComponentNumber,nodeDomain,err,error,*999)
-            IF(nodeDomain==myComputationalNodeNumber) THEN
-              CALL FIELD_PARAMETER_SET_GET_NODE( FIELD, VARIABLE_TYPE, SET_TYPE, VERSION_NUMBER, &
-                & NO_GLOBAL_DERIV, I, FIELD_COMPONENT_NUMBERS(J), DVALUE, ERR, ERROR, *999 )
-            ENDIF
-
+            CALL FIELD_PARAMETER_SET_GET_NODE( FIELD, VARIABLE_TYPE, SET_TYPE, VERSION_NUMBER, &
+              & NO_GLOBAL_DERIV, ownedNodes(I), FIELD_COMPONENT_NUMBERS(J), DVALUE, ERR, ERROR, *999 )
           ENDIF
         ENDIF
-        DBUFFER( J ) = DVALUE
+        sendValues( ( I - 1 ) * COMPONENT_COUNT + J ) = DVALUE
       ENDDO
-      FML_ERR = Fieldml_WriteDoubleSlab( WRITER, C_LOC(OFFSETS), C_LOC(SIZES), C_LOC(DBUFFER) )
-      IF( FML_ERR /= FML_ERR_NO_ERROR ) THEN
-        CALL FlagError( var_str("I/O error while writing nodal parameter values for ")//BASE_NAME//"("// &
-          & TRIM(NUMBER_TO_VSTRING(FML_ERR,"*",ERR,ERROR)) //").", err, ERROR, *999 )
-      ENDIF
-      OFFSETS(1) = OFFSETS(1) + 1
     ENDDO
-    FML_ERR = Fieldml_CloseWriter( WRITER )
-    CALL FIELDML_UTIL_CHECK_FIELDML_ERROR( "Cannot close nodal parameter writer for "//BASE_NAME//".dofs.node.data.", &
-      & FIELDML_INFO%FML_HANDLE, ERR, ERROR, *999 )
-    DEALLOCATE( DBUFFER )
+
+    !Send the owned node values to the ranks writing their rows
+    CALL MPI_ALLTOALL( sendCounts, 1, MPI_INTEGER, receiveCounts, 1, MPI_INTEGER, COMPUTATIONAL_ENVIRONMENT%MPI_COMM, &
+      & mpiIError )
+    CALL MPI_ERROR_CHECK( "MPI_ALLTOALL", mpiIError, ERR, ERROR, *999 )
+    sendDisplacements( 1 ) = 0
+    receiveDisplacements( 1 ) = 0
+    DO rankIdx = 2, numberOfComputationalNodes
+      sendDisplacements( rankIdx ) = sendDisplacements( rankIdx - 1 ) + sendCounts( rankIdx - 1 )
+      receiveDisplacements( rankIdx ) = receiveDisplacements( rankIdx - 1 ) + receiveCounts( rankIdx - 1 )
+    ENDDO
+    ALLOCATE( receiveNodes( SUM( receiveCounts ) ), receiveValues( SUM( receiveCounts ) * COMPONENT_COUNT ), STAT = ERR )
+    IF( ERR /= 0 ) CALL FlagError( "Could not allocate nodal dofs receive buffers.", ERR, ERROR, *999 )
+    CALL MPI_ALLTOALLV( ownedNodes, sendCounts, sendDisplacements, MPI_INTEGER, receiveNodes, receiveCounts, &
+      & receiveDisplacements, MPI_INTEGER, COMPUTATIONAL_ENVIRONMENT%MPI_COMM, mpiIError )
+    CALL MPI_ERROR_CHECK( "MPI_ALLTOALLV", mpiIError, ERR, ERROR, *999 )
+    sendCounts = sendCounts * COMPONENT_COUNT
+    sendDisplacements = sendDisplacements * COMPONENT_COUNT
+    receiveCounts = receiveCounts * COMPONENT_COUNT
+    receiveDisplacements = receiveDisplacements * COMPONENT_COUNT
+    CALL MPI_ALLTOALLV( sendValues, sendCounts, sendDisplacements, MPI_DOUBLE_PRECISION, receiveValues, receiveCounts, &
+      & receiveDisplacements, MPI_DOUBLE_PRECISION, COMPUTATIONAL_ENVIRONMENT%MPI_COMM, mpiIError )
+    CALL MPI_ERROR_CHECK( "MPI_ALLTOALLV", mpiIError, ERR, ERROR, *999 )
+    DEALLOCATE( ownedNodes, sendValues, sendCounts, sendDisplacements, receiveCounts, receiveDisplacements )
+
+    !Rows of nodes that no rank owns are left as zero
+    CALL FieldmlOutputNodeRowBlockGet( myComputationalNodeNumber, NODE_COUNT, numberOfComputationalNodes, isParallelFormat, &
+      & blockStart, blockCount, ERR, ERROR, *999 )
+    ALLOCATE( blockValues( MAX( blockCount, 1 ) * COMPONENT_COUNT ), STAT = ERR )
+    IF( ERR /= 0 ) CALL FlagError( "Could not allocate nodal dofs array.", ERR, ERROR, *999 )
+    blockValues = 0
+    DO I = 1, SIZE( receiveNodes, 1 )
+      rowOffset = ( receiveNodes(I) - blockStart - 1 ) * COMPONENT_COUNT
+      blockValues( rowOffset + 1:rowOffset + COMPONENT_COUNT ) = &
+        & receiveValues( ( I - 1 ) * COMPONENT_COUNT + 1:I * COMPONENT_COUNT )
+    ENDDO
+    DEALLOCATE( receiveNodes, receiveValues )
+
+    !Opening and closing a parallel HDF5 writer is collective, so every rank does so even if it has no rows to write.
+    IF( isParallelFormat .OR. myComputationalNodeNumber == 0 ) THEN
+      WRITER = Fieldml_OpenArrayWriter( FIELDML_INFO%FML_HANDLE, SOURCE_HANDLE, REAL_1D_HANDLE, 0, SIZE_POINTER, RANK )
+      CALL FIELDML_UTIL_CHECK_FIELDML_ERROR( "Cannot open nodal parameter writer for "//BASE_NAME//".dofs.node.data.", &
+        & FIELDML_INFO%FML_HANDLE, ERR, ERROR, *999 )
+
+      OFFSETS(:) = 0
+      SIZES(2) = COMPONENT_COUNT
+      DO rowOffset = 0, blockCount - 1, FIELDML_OUTPUT_SLAB_ROWS
+        rowCount = MIN( FIELDML_OUTPUT_SLAB_ROWS, blockCount - rowOffset )
+        OFFSETS(1) = blockStart + rowOffset
+        SIZES(1) = rowCount
+        FML_ERR = Fieldml_WriteDoubleSlab( WRITER, C_LOC(OFFSETS), C_LOC(SIZES), &
+          & C_LOC(blockValues( rowOffset * COMPONENT_COUNT + 1 )) )
+        IF( FML_ERR /= FML_ERR_NO_ERROR ) THEN
+          CALL FlagError( var_str("I/O error while writing nodal parameter values for ")//BASE_NAME//"("// &
+            & TRIM(NUMBER_TO_VSTRING(FML_ERR,"*",ERR,ERROR)) //").", err, ERROR, *999 )
+        ENDIF
+      ENDDO
+      FML_ERR = Fieldml_CloseWriter( WRITER )
+      CALL FIELDML_UTIL_CHECK_FIELDML_ERROR( "Cannot close nodal parameter writer for "//BASE_NAME//".dofs.node.data.", &
+        & FIELDML_INFO%FML_HANDLE, ERR, ERROR, *999 )
+    ENDIF
+    DEALLOCATE( blockValues )
     
     DEALLOCATE( MESH_COMPONENT_NUMBERS )
     DEALLOCATE( IS_NODE_BASED )
 
     EXITS( "FIELDML_OUTPUT_ADD_FIELD_NODE_DOFS" )
     RETURN
-999 ERRORSEXITS( "FIELDML_OUTPUT_ADD_FIELD_NODE_DOFS", ERR, ERROR )
+999 IF( ALLOCATED( ownedNodes ) ) DEALLOCATE( ownedNodes )
+    IF( ALLOCATED( receiveNodes ) ) DEALLOCATE( receiveNodes )
+    IF( ALLOCATED( sendCounts ) ) DEALLOCATE( sendCounts )
+    IF( ALLOCATED( sendDisplacements ) ) DEALLOCATE( sendDisplacements )
+    IF( ALLOCATED( receiveCounts ) ) DEALLOCATE( receiveCounts )
+    IF( ALLOCATED( receiveDisplacements ) ) DEALLOCATE( receiveDisplacements )
+    IF( ALLOCATED( sendValues ) ) DEALLOCATE( sendValues )
+    IF( ALLOCATED( receiveValues ) ) DEALLOCATE( receiveValues )
+    IF( ALLOCATED( blockValues ) ) DEALLOCATE( blockValues )
+    ERRORSEXITS( "FIELDML_OUTPUT_ADD_FIELD_NODE_DOFS", ERR, ERROR )
     RETURN 1
     
   END SUBROUTINE FIELDML_OUTPUT_ADD_FIELD_NODE_DOFS
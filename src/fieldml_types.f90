@@ -55,6 +55,24 @@ MODULE FIELDML_TYPES
   !
   ! FieldML types
 
+  !>A block of consecutive rows read from a rank 2 FieldML array data source.
+  TYPE FIELDML_READ_BLOCK_TYPE
+    INTEGER(INTG) :: BLOCK_NUMBER !<The number of the block held in this cache entry, or 0 if the entry is empty.
+    INTEGER(INTG) :: LAST_USED !<The cache access count when this entry was last used. The least recently used entry is replaced first.
+    REAL(DP), ALLOCATABLE :: VALUES(:,:) !<VALUES(column_idx,row_idx). The values of the rows in the block.
+  END TYPE FIELDML_READ_BLOCK_TYPE
+
+  !>A least recently used cache of row blocks read on demand from a rank 2 FieldML array data source.
+  TYPE FIELDML_READ_CACHE_TYPE
+    INTEGER(INTG) :: DATA_SOURCE_HANDLE !<The FieldML data source the cached blocks have been read from.
+    INTEGER(INTG) :: READER_HANDLE !<The FieldML reader open on the data source.
+    INTEGER(INTG) :: NUMBER_OF_ROWS !<The number of rows in the data source.
+    INTEGER(INTG) :: NUMBER_OF_COLUMNS !<The number of columns in the data source.
+    INTEGER(INTG) :: ACCESS_COUNT !<The number of row accesses made through the cache.
+    INTEGER(INTG) :: NUMBER_OF_BLOCK_READS !<The number of blocks read from the data source.
+    TYPE(FIELDML_READ_BLOCK_TYPE), ALLOCATABLE :: BLOCKS(:) !<BLOCKS(entry_idx). The cache entries.
+  END TYPE FIELDML_READ_CACHE_TYPE
+
   !>Contains information on the current FieldML parsing state.
   TYPE FIELDML_IO_TYPE
     INTEGER(INTG) :: FML_HANDLE !<The FieldML session handle.
@@ -73,11 +91,14 @@ MODULE FIELDML_TYPES
     TYPE(LIST_TYPE), POINTER :: BASIS_HANDLES
     TYPE(LIST_TYPE), POINTER :: BASIS_CONNECTIVITY_HANDLES
     TYPE(LIST_TYPE), POINTER :: BASIS_LAYOUT_HANDLES
+    INTEGER(INTG) :: READ_CACHE_BLOCK_SIZE !<The number of array rows read from a data source at a time on input.
+    INTEGER(INTG) :: READ_CACHE_NUMBER_OF_BLOCKS !<The number of row blocks held in the input read cache.
+    TYPE(FIELDML_READ_CACHE_TYPE) :: READ_CACHE !<The cache of row blocks read from the current input data source.
   END TYPE FIELDML_IO_TYPE
 
   !Interfaces
   
-  PUBLIC :: FIELDML_IO_TYPE
+  PUBLIC :: FIELDML_READ_BLOCK_TYPE,FIELDML_READ_CACHE_TYPE,FIELDML_IO_TYPE
 
 CONTAINS
 
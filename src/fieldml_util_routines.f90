@@ -65,6 +65,11 @@ MODULE FIELDML_UTIL_ROUTINES
 
   PRIVATE
 
+  !Module parameters
+
+  INTEGER(INTG), PARAMETER :: FIELDML_READ_CACHE_DEFAULT_BLOCK_SIZE=1024 !<The default number of array rows read at a time on input.
+  INTEGER(INTG), PARAMETER :: FIELDML_READ_CACHE_DEFAULT_NUMBER_OF_BLOCKS=16 !<The default number of row blocks held in the input read cache.
+
   !Interfaces
   
   INTERFACE FIELDML_UTIL_CHECK_FIELDML_ERROR
@@ -171,6 +176,14 @@ CONTAINS
     NULLIFY( FIELDML_INFO%BASIS_HANDLES )
     NULLIFY( FIELDML_INFO%BASIS_CONNECTIVITY_HANDLES )
     NULLIFY( FIELDML_INFO%BASIS_LAYOUT_HANDLES )
+    FIELDML_INFO%READ_CACHE_BLOCK_SIZE = FIELDML_READ_CACHE_DEFAULT_BLOCK_SIZE
+    FIELDML_INFO%READ_CACHE_NUMBER_OF_BLOCKS = FIELDML_READ_CACHE_DEFAULT_NUMBER_OF_BLOCKS
+    FIELDML_INFO%READ_CACHE%DATA_SOURCE_HANDLE = FML_INVALID_HANDLE
+    FIELDML_INFO%READ_CACHE%READER_HANDLE = FML_INVALID_HANDLE
+    FIELDML_INFO%READ_CACHE%NUMBER_OF_ROWS = 0
+    FIELDML_INFO%READ_CACHE%NUMBER_OF_COLUMNS = 0
+    FIELDML_INFO%READ_CACHE%ACCESS_COUNT = 0
+    FIELDML_INFO%READ_CACHE%NUMBER_OF_BLOCK_READS = 0
     
     CALL LIST_CREATE_START( FIELDML_INFO%COMPONENT_HANDLES, ERR, ERROR, *999 )
     CALL LIST_DATA_TYPE_SET( FIELDML_INFO%COMPONENT_HANDLES, LIST_INTG_TYPE, ERR, ERROR, *999 )
@@ -215,6 +228,9 @@ CONTAINS
     ENTERS( "FIELDML_IO_FINALISE", ERR, ERROR, *999 )
 
     IF(ASSOCIATED(FIELDML_INFO)) THEN
+      IF( FIELDML_INFO%READ_CACHE%READER_HANDLE /= FML_INVALID_HANDLE ) THEN
+        FML_ERR = Fieldml_CloseReader( FIELDML_INFO%READ_CACHE%READER_HANDLE )
+      ENDIF
       FML_ERR = Fieldml_Destroy( FIELDML_INFO%FML_HANDLE )
       CALL LIST_DESTROY( FIELDML_INFO%COMPONENT_HANDLES, ERR, ERROR, *999 )
       CALL LIST_DESTROY( FIELDML_INFO%BASIS_HANDLES, ERR, ERROR, *999 )
@@ -0,0 +1,602 @@
+!> \file
+!> \brief This module contains open addressing hash sets of integers and the set operations built on them.
+!>
+!> \section LICENSE
+!>
+!> Version: MPL 1.1/GPL 2.0/LGPL 2.1
+!>
+!> The contents of this file are subject to the Mozilla Public License
+!> Version 1.1 (the "License"); you may not use this file except in
+!> compliance with the License. You may obtain a copy of the License at
+!> http://www.mozilla.org/MPL/
+!>
+!> Software distributed under the License is distributed on an "AS IS"
+!> basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+!> License for the specific language governing rights and limitations
+!> under the License.
+!>
+!> The Original Code is OpenCMISS
+!>
+!> The Initial Developer of the Original Code is University of Auckland,
+!> Auckland, New Zealand, the University of Oxford, Oxford, United
+!> Kingdom and King's College, London, United Kingdom. Portions created
+!> by the University of Auckland, the University of Oxford and King's
+!> College, London are Copyright (C) 2007-2010 by the University of
+!> Auckland, the University of Oxford and King's College, London.
+!> All Rights Reserved.
+!>
+!> Contributor(s):
+!>
+!> Alternatively, the contents of this file may be used under the terms of
+!> either the GNU General Public License Version 2 or later (the "GPL"), or
+!> the GNU Lesser General Public License Version 2.1 or later (the "LGPL"),
+!> in which case the provisions of the GPL or the LGPL are applicable instead
+!> of those above. If you wish to allow use of your version of this file only
+!> under the terms of either the GPL or the LGPL, and not to allow others to
+!> use your version of this file under the terms of the MPL, indicate your
+!> decision by deleting the provisions above and replace them with the notice
+!> and other provisions required by the GPL or the LGPL. If you do not delete
+!> the provisions above, a recipient may use your version of this file under
+!> the terms of any one of the MPL, the GPL or the LGPL.
+!>
+
+!> This module contains open addressing hash sets of integers and the set operations built on them. The hash sets use linear
+!> probing and are kept at most half full, so adding an item and testing for an item take constant time on average and the
+!> duplicate removal and set operations are linear in the number of items rather than requiring the items to be sorted.
+MODULE HASH_SETS
+
+  USE BASE_ROUTINES
+  USE CONSTANTS
+  USE KINDS
+  USE ISO_VARYING_STRING
+  USE STRINGS
+  USE TYPES
+
+#include "macros.h"  
+  
+  IMPLICIT NONE
+
+  PRIVATE
+
+  !Module parameters
+
+  INTEGER(INTG), PARAMETER :: HASH_SETS_MINIMUM_TABLE_SIZE=16 !<The smallest number of slots in a hash table
+  INTEGER(INTG), PARAMETER :: HASH_SETS_LINEAR_THRESHOLD=32 !<Arrays of up to this many items have their duplicates removed by direct comparison rather than with a hash table
+  INTEGER(LINTG), PARAMETER :: HASH_SETS_32BIT_MASK=4294967295_LINTG !<Mask for the low 32 bits of a hash value
+  INTEGER(LINTG), PARAMETER :: HASH_SETS_MULTIPLIER=73244475_LINTG !<Multiplier used to mix the bits of a hash value
+
+  !Module types
+
+  !Interfaces
+
+  !>Removes the duplicate items from an array, keeping the first occurrence of each item.
+  INTERFACE HashSet_RemoveDuplicates
+    MODULE PROCEDURE HashSet_RemoveDuplicatesIntg1
+    MODULE PROCEDURE HashSet_RemoveDuplicatesIntg2
+  END INTERFACE HashSet_RemoveDuplicates
+
+  PUBLIC HashSet_Finalise,HashSet_Initialise
+
+  PUBLIC HashSet_ItemAdd,HashSet_ItemInSet
+
+  PUBLIC HashSet_NumberOfItemsGet
+
+  PUBLIC HashSet_RemoveDuplicates
+
+  PUBLIC HashSet_Intersection,HashSet_SubsetOf,HashSet_Union
+
+CONTAINS
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Finalises a hash set and deallocates all memory.
+  SUBROUTINE HashSet_Finalise(hashSet,err,error,*)
+
+    !Argument variables
+    TYPE(HashSetType), INTENT(INOUT) :: hashSet !<The hash set to finalise
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local variables
+
+    ENTERS("HashSet_Finalise",err,error,*999)
+
+    IF(ALLOCATED(hashSet%occupied)) DEALLOCATE(hashSet%occupied)
+    IF(ALLOCATED(hashSet%items)) DEALLOCATE(hashSet%items)
+    hashSet%numberOfItems=0
+    hashSet%tableSize=0
+
+    EXITS("HashSet_Finalise")
+    RETURN
+999 ERRORSEXITS("HashSet_Finalise",err,error)
+    RETURN 1
+  END SUBROUTINE HashSet_Finalise
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Doubles the size of the hash table of a hash set and re-inserts the items.
+  SUBROUTINE HashSet_Grow(hashSet,err,error,*)
+
+    !Argument variables
+    TYPE(HashSetType), INTENT(INOUT) :: hashSet !<The hash set to grow
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local variables
+    INTEGER(INTG) :: slotIdx
+    INTEGER(INTG), ALLOCATABLE :: oldItems(:)
+    LOGICAL :: itemAdded
+    LOGICAL, ALLOCATABLE :: oldOccupied(:)
+
+    ENTERS("HashSet_Grow",err,error,*999)
+
+    CALL MOVE_ALLOC(hashSet%occupied,oldOccupied)
+    CALL MOVE_ALLOC(hashSet%items,oldItems)
+    hashSet%tableSize=2*hashSet%tableSize
+    ALLOCATE(hashSet%occupied(0:hashSet%tableSize-1),STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate hash set occupied slots.",err,error,*999)
+    ALLOCATE(hashSet%items(0:hashSet%tableSize-1),STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate hash set items.",err,error,*999)
+    hashSet%occupied=.FALSE.
+    hashSet%numberOfItems=0
+    DO slotIdx=LBOUND(oldOccupied,1),UBOUND(oldOccupied,1)
+      IF(oldOccupied(slotIdx)) CALL HashSet_Insert(hashSet,oldItems(slotIdx),itemAdded)
+    ENDDO !slotIdx
+    DEALLOCATE(oldOccupied)
+    DEALLOCATE(oldItems)
+
+    EXITS("HashSet_Grow")
+    RETURN
+999 ERRORSEXITS("HashSet_Grow",err,error)
+    RETURN 1
+  END SUBROUTINE HashSet_Grow
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Returns the home slot of an item in a hash table with the given number of slots.
+  PURE FUNCTION HashSet_Hash(item,tableSize)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: item !<The item to hash
+    INTEGER(INTG), INTENT(IN) :: tableSize !<The number of slots in the hash table. Must be a power of two.
+    !Function variable
+    INTEGER(INTG) :: HashSet_Hash
+    !Local variables
+    INTEGER(LINTG) :: hash
+
+    !Mix the bits so that consecutive item numbers are spread over the table. The products stay below 2^59 so cannot overflow.
+    hash=IAND(INT(item,LINTG),HASH_SETS_32BIT_MASK)
+    hash=IAND(IEOR(hash,ISHFT(hash,-16))*HASH_SETS_MULTIPLIER,HASH_SETS_32BIT_MASK)
+    hash=IAND(IEOR(hash,ISHFT(hash,-16))*HASH_SETS_MULTIPLIER,HASH_SETS_32BIT_MASK)
+    hash=IEOR(hash,ISHFT(hash,-16))
+    HashSet_Hash=INT(IAND(hash,INT(tableSize-1,LINTG)),INTG)
+
+  END FUNCTION HashSet_Hash
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Initialises a hash set with enough slots to hold the expected number of items without growing.
+  SUBROUTINE HashSet_Initialise(hashSet,expectedNumberOfItems,err,error,*)
+
+    !Argument variables
+    TYPE(HashSetType), INTENT(OUT) :: hashSet !<On exit, the initialised empty hash set
+    INTEGER(INTG), INTENT(IN) :: expectedNumberOfItems !<The number of items expected to be added to the hash set. Must be >= 0.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local variables
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("HashSet_Initialise",err,error,*999)
+
+    IF(expectedNumberOfItems<0) THEN
+      localError="The expected number of items of "//TRIM(NumberToVString(expectedNumberOfItems,"*",err,error))// &
+        & " is invalid. The number must be >= 0."
+      CALL FlagError(localError,err,error,*999)
+    ENDIF
+    hashSet%numberOfItems=0
+    hashSet%tableSize=HASH_SETS_MINIMUM_TABLE_SIZE
+    DO WHILE(hashSet%tableSize/2<expectedNumberOfItems)
+      hashSet%tableSize=2*hashSet%tableSize
+    ENDDO
+    ALLOCATE(hashSet%occupied(0:hashSet%tableSize-1),STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate hash set occupied slots.",err,error,*999)
+    ALLOCATE(hashSet%items(0:hashSet%tableSize-1),STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate hash set items.",err,error,*999)
+    hashSet%occupied=.FALSE.
+
+    EXITS("HashSet_Initialise")
+    RETURN
+999 ERRORSEXITS("HashSet_Initialise",err,error)
+    RETURN 1
+  END SUBROUTINE HashSet_Initialise
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Inserts an item into a hash set that has room for it.
+  PURE SUBROUTINE HashSet_Insert(hashSet,item,itemAdded)
+
+    !Argument variables
+    TYPE(HashSetType), INTENT(INOUT) :: hashSet !<The hash set to insert the item into. Must have at least one free slot.
+    INTEGER(INTG), INTENT(IN) :: item !<The item to insert
+    LOGICAL, INTENT(OUT) :: itemAdded !<On exit, .TRUE. if the item was added, .FALSE. if it was already in the hash set
+    !Local variables
+    INTEGER(INTG) :: slotIdx
+
+    slotIdx=HashSet_SlotFind(hashSet,item)
+    itemAdded=.NOT.hashSet%occupied(slotIdx)
+    IF(itemAdded) THEN
+      hashSet%occupied(slotIdx)=.TRUE.
+      hashSet%items(slotIdx)=item
+      hashSet%numberOfItems=hashSet%numberOfItems+1
+    ENDIF
+
+  END SUBROUTINE HashSet_Insert
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Finds the intersection of two arrays using hash sets, leaving the arrays intact.
+  SUBROUTINE HashSet_Intersection(a,b,c,err,error,*)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: a(:) !<The first array to find the intersection for
+    INTEGER(INTG), INTENT(IN) :: b(:) !<The second array to find the intersection for
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: c(:) !<On exit, the items of a that are also in b without duplicates, in the order they first occur in a
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local variables
+    INTEGER(INTG) :: itemIdx,numberOfMatches
+    INTEGER(INTG), ALLOCATABLE :: matches(:)
+    LOGICAL :: itemAdded
+    TYPE(HashSetType) :: bSet,matchesSet
+
+    ENTERS("HashSet_Intersection",err,error,*999)
+
+    CALL HashSet_Initialise(bSet,SIZE(b,1),err,error,*999)
+    DO itemIdx=1,SIZE(b,1)
+      CALL HashSet_Insert(bSet,b(itemIdx),itemAdded)
+    ENDDO !itemIdx
+    CALL HashSet_Initialise(matchesSet,MIN(SIZE(a,1),bSet%numberOfItems),err,error,*999)
+    ALLOCATE(matches(MIN(SIZE(a,1),bSet%numberOfItems)),STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate matches.",err,error,*999)
+    numberOfMatches=0
+    DO itemIdx=1,SIZE(a,1)
+      IF(bSet%occupied(HashSet_SlotFind(bSet,a(itemIdx)))) THEN
+        CALL HashSet_Insert(matchesSet,a(itemIdx),itemAdded)
+        IF(itemAdded) THEN
+          numberOfMatches=numberOfMatches+1
+          matches(numberOfMatches)=a(itemIdx)
+        ENDIF
+      ENDIF
+    ENDDO !itemIdx
+    ALLOCATE(c(numberOfMatches),STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate intersection.",err,error,*999)
+    c(1:numberOfMatches)=matches(1:numberOfMatches)
+    DEALLOCATE(matches)
+    CALL HashSet_Finalise(matchesSet,err,error,*999)
+    CALL HashSet_Finalise(bSet,err,error,*999)
+
+    EXITS("HashSet_Intersection")
+    RETURN
+999 ERRORSEXITS("HashSet_Intersection",err,error)
+    RETURN 1
+  END SUBROUTINE HashSet_Intersection
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Adds an item to a hash set, growing the hash table if needed.
+  SUBROUTINE HashSet_ItemAdd(hashSet,item,itemAdded,err,error,*)
+
+    !Argument variables
+    TYPE(HashSetType), INTENT(INOUT) :: hashSet !<The hash set to add the item to
+    INTEGER(INTG), INTENT(IN) :: item !<The item to add
+    LOGICAL, INTENT(OUT) :: itemAdded !<On exit, .TRUE. if the item was added, .FALSE. if it was already in the hash set
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local variables
+
+    ENTERS("HashSet_ItemAdd",err,error,*999)
+
+    IF(.NOT.ALLOCATED(hashSet%occupied)) CALL FlagError("Hash set has not been initialised.",err,error,*999)
+    IF(2*(hashSet%numberOfItems+1)>hashSet%tableSize) CALL HashSet_Grow(hashSet,err,error,*999)
+    CALL HashSet_Insert(hashSet,item,itemAdded)
+
+    EXITS("HashSet_ItemAdd")
+    RETURN
+999 ERRORSEXITS("HashSet_ItemAdd",err,error)
+    RETURN 1
+  END SUBROUTINE HashSet_ItemAdd
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Determines if an item is in a hash set.
+  SUBROUTINE HashSet_ItemInSet(hashSet,item,itemInSet,err,error,*)
+
+    !Argument variables
+    TYPE(HashSetType), INTENT(IN) :: hashSet !<The hash set to search
+    INTEGER(INTG), INTENT(IN) :: item !<The item to search for
+    LOGICAL, INTENT(OUT) :: itemInSet !<On exit, .TRUE. if the item is in the hash set, .FALSE. if not
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local variables
+
+    ENTERS("HashSet_ItemInSet",err,error,*999)
+
+    IF(.NOT.ALLOCATED(hashSet%occupied)) CALL FlagError("Hash set has not been initialised.",err,error,*999)
+    itemInSet=hashSet%occupied(HashSet_SlotFind(hashSet,item))
+
+    EXITS("HashSet_ItemInSet")
+    RETURN
+999 ERRORSEXITS("HashSet_ItemInSet",err,error)
+    RETURN 1
+  END SUBROUTINE HashSet_ItemInSet
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Gets the number of items in a hash set.
+  SUBROUTINE HashSet_NumberOfItemsGet(hashSet,numberOfItems,err,error,*)
+
+    !Argument variables
+    TYPE(HashSetType), INTENT(IN) :: hashSet !<The hash set to get the number of items for
+    INTEGER(INTG), INTENT(OUT) :: numberOfItems !<On exit, the number of items in the hash set
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local variables
+
+    ENTERS("HashSet_NumberOfItemsGet",err,error,*999)
+
+    IF(.NOT.ALLOCATED(hashSet%occupied)) CALL FlagError("Hash set has not been initialised.",err,error,*999)
+    numberOfItems=hashSet%numberOfItems
+
+    EXITS("HashSet_NumberOfItemsGet")
+    RETURN
+999 ERRORSEXITS("HashSet_NumberOfItemsGet",err,error)
+    RETURN 1
+  END SUBROUTINE HashSet_NumberOfItemsGet
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Removes the duplicate items from an integer array, keeping the first occurrence of each item in its original order.
+  SUBROUTINE HashSet_RemoveDuplicatesIntg1(items,numberOfItems,err,error,*)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: items(:) !<The array to remove the duplicates from. On exit, the unique items are in items(1:numberOfItems).
+    INTEGER(INTG), INTENT(OUT) :: numberOfItems !<On exit, the number of unique items
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local variables
+    INTEGER(INTG) :: itemIdx,uniqueIdx
+    LOGICAL :: itemAdded
+    TYPE(HashSetType) :: hashSet
+
+    ENTERS("HashSet_RemoveDuplicatesIntg1",err,error,*999)
+
+    numberOfItems=0
+    IF(SIZE(items,1)<=HASH_SETS_LINEAR_THRESHOLD) THEN
+      !Not worth setting up a hash table, just compare with the unique items found so far
+      DO itemIdx=1,SIZE(items,1)
+        itemAdded=.TRUE.
+        DO uniqueIdx=1,numberOfItems
+          IF(items(uniqueIdx)==items(itemIdx)) THEN
+            itemAdded=.FALSE.
+            EXIT
+          ENDIF
+        ENDDO !uniqueIdx
+        IF(itemAdded) THEN
+          numberOfItems=numberOfItems+1
+          items(numberOfItems)=items(itemIdx)
+        ENDIF
+      ENDDO !itemIdx
+    ELSE
+      CALL HashSet_Initialise(hashSet,SIZE(items,1),err,error,*999)
+      DO itemIdx=1,SIZE(items,1)
+        CALL HashSet_Insert(hashSet,items(itemIdx),itemAdded)
+        IF(itemAdded) THEN
+          numberOfItems=numberOfItems+1
+          items(numberOfItems)=items(itemIdx)
+        ENDIF
+      ENDDO !itemIdx
+      CALL HashSet_Finalise(hashSet,err,error,*999)
+    ENDIF
+
+    EXITS("HashSet_RemoveDuplicatesIntg1")
+    RETURN
+999 ERRORSEXITS("HashSet_RemoveDuplicatesIntg1",err,error)
+    RETURN 1
+  END SUBROUTINE HashSet_RemoveDuplicatesIntg1
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Removes the items with duplicate keys from a two dimensional integer array, keeping the first occurrence of each key in its
+  !>original order.
+  SUBROUTINE HashSet_RemoveDuplicatesIntg2(items,keyDimension,numberOfItems,err,error,*)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: items(:,:) !<items(dataIdx,itemIdx). The array to remove the duplicates from. On exit, the unique items are in items(:,1:numberOfItems).
+    INTEGER(INTG), INTENT(IN) :: keyDimension !<The index of the data in each item that is used as the key
+    INTEGER(INTG), INTENT(OUT) :: numberOfItems !<On exit, the number of unique items
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local variables
+    INTEGER(INTG) :: itemIdx,uniqueIdx
+    LOGICAL :: itemAdded
+    TYPE(HashSetType) :: hashSet
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("HashSet_RemoveDuplicatesIntg2",err,error,*999)
+
+    IF(keyDimension<1.OR.keyDimension>SIZE(items,1)) THEN
+      localError="The key dimension of "//TRIM(NumberToVString(keyDimension,"*",err,error))// &
+        & " is invalid. The key dimension must be > 0 and <= "//TRIM(NumberToVString(SIZE(items,1),"*",err,error))//"."
+      CALL FlagError(localError,err,error,*999)
+    ENDIF
+    numberOfItems=0
+    IF(SIZE(items,2)<=HASH_SETS_LINEAR_THRESHOLD) THEN
+      !Not worth setting up a hash table, just compare with the unique items found so far
+      DO itemIdx=1,SIZE(items,2)
+        itemAdded=.TRUE.
+        DO uniqueIdx=1,numberOfItems
+          IF(items(keyDimension,uniqueIdx)==items(keyDimension,itemIdx)) THEN
+            itemAdded=.FALSE.
+            EXIT
+          ENDIF
+        ENDDO !uniqueIdx
+        IF(itemAdded) THEN
+          numberOfItems=numberOfItems+1
+          items(:,numberOfItems)=items(:,itemIdx)
+        ENDIF
+      ENDDO !itemIdx
+    ELSE
+      CALL HashSet_Initialise(hashSet,SIZE(items,2),err,error,*999)
+      DO itemIdx=1,SIZE(items,2)
+        CALL HashSet_Insert(hashSet,items(keyDimension,itemIdx),itemAdded)
+        IF(itemAdded) THEN
+          numberOfItems=numberOfItems+1
+          items(:,numberOfItems)=items(:,itemIdx)
+        ENDIF
+      ENDDO !itemIdx
+      CALL HashSet_Finalise(hashSet,err,error,*999)
+    ENDIF
+
+    EXITS("HashSet_RemoveDuplicatesIntg2")
+    RETURN
+999 ERRORSEXITS("HashSet_RemoveDuplicatesIntg2",err,error)
+    RETURN 1
+  END SUBROUTINE HashSet_RemoveDuplicatesIntg2
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Returns the slot holding an item in a hash set, or the empty slot where the item would be inserted if it is not in the set.
+  PURE FUNCTION HashSet_SlotFind(hashSet,item)
+
+    !Argument variables
+    TYPE(HashSetType), INTENT(IN) :: hashSet !<The hash set to search. Must have at least one free slot.
+    INTEGER(INTG), INTENT(IN) :: item !<The item to search for
+    !Function variable
+    INTEGER(INTG) :: HashSet_SlotFind
+    !Local variables
+
+    HashSet_SlotFind=HashSet_Hash(item,hashSet%tableSize)
+    DO WHILE(hashSet%occupied(HashSet_SlotFind))
+      IF(hashSet%items(HashSet_SlotFind)==item) EXIT
+      HashSet_SlotFind=IAND(HashSet_SlotFind+1,hashSet%tableSize-1)
+    ENDDO
+
+  END FUNCTION HashSet_SlotFind
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Finds out whether every item of array a is in array b using a hash set.
+  SUBROUTINE HashSet_SubsetOf(a,b,subset,err,error,*)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: a(:) !<The supposed subset
+    INTEGER(INTG), INTENT(IN) :: b(:) !<The supposed superset
+    LOGICAL, INTENT(OUT) :: subset !<On exit, .TRUE. if every item of a is in b
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local variables
+    INTEGER(INTG) :: itemIdx
+    LOGICAL :: itemAdded
+    TYPE(HashSetType) :: bSet
+
+    ENTERS("HashSet_SubsetOf",err,error,*999)
+
+    CALL HashSet_Initialise(bSet,SIZE(b,1),err,error,*999)
+    DO itemIdx=1,SIZE(b,1)
+      CALL HashSet_Insert(bSet,b(itemIdx),itemAdded)
+    ENDDO !itemIdx
+    subset=.TRUE.
+    DO itemIdx=1,SIZE(a,1)
+      IF(.NOT.bSet%occupied(HashSet_SlotFind(bSet,a(itemIdx)))) THEN
+        subset=.FALSE.
+        EXIT
+      ENDIF
+    ENDDO !itemIdx
+    CALL HashSet_Finalise(bSet,err,error,*999)
+
+    EXITS("HashSet_SubsetOf")
+    RETURN
+999 ERRORSEXITS("HashSet_SubsetOf",err,error)
+    RETURN 1
+  END SUBROUTINE HashSet_SubsetOf
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Finds the union of two arrays using a hash set, leaving the arrays intact.
+  SUBROUTINE HashSet_Union(a,b,c,err,error,*)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: a(:) !<The first array to find the union for
+    INTEGER(INTG), INTENT(IN) :: b(:) !<The second array to find the union for
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: c(:) !<On exit, the items of a followed by the items of b without duplicates, in the order they first occur
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local variables
+    INTEGER(INTG) :: itemIdx,numberOfItems
+    INTEGER(INTG), ALLOCATABLE :: items(:)
+    LOGICAL :: itemAdded
+    TYPE(HashSetType) :: hashSet
+
+    ENTERS("HashSet_Union",err,error,*999)
+
+    CALL HashSet_Initialise(hashSet,SIZE(a,1)+SIZE(b,1),err,error,*999)
+    ALLOCATE(items(SIZE(a,1)+SIZE(b,1)),STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate union items.",err,error,*999)
+    numberOfItems=0
+    DO itemIdx=1,SIZE(a,1)
+      CALL HashSet_Insert(hashSet,a(itemIdx),itemAdded)
+      IF(itemAdded) THEN
+        numberOfItems=numberOfItems+1
+        items(numberOfItems)=a(itemIdx)
+      ENDIF
+    ENDDO !itemIdx
+    DO itemIdx=1,SIZE(b,1)
+      CALL HashSet_Insert(hashSet,b(itemIdx),itemAdded)
+      IF(itemAdded) THEN
+        numberOfItems=numberOfItems+1
+        items(numberOfItems)=b(itemIdx)
+      ENDIF
+    ENDDO !itemIdx
+    ALLOCATE(c(numberOfItems),STAT=err)
+    IF(err/=0) CALL FlagError("Could not allocate union.",err,error,*999)
+    c(1:numberOfItems)=items(1:numberOfItems)
+    DEALLOCATE(items)
+    CALL HashSet_Finalise(hashSet,err,error,*999)
+
+    EXITS("HashSet_Union")
+    RETURN
+999 ERRORSEXITS("HashSet_Union",err,error)
+    RETURN 1
+  END SUBROUTINE HashSet_Union
+
+  !
+  !================================================================================================================================
+  !
+
+END MODULE HASH_SETS
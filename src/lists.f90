@@ -47,8 +47,12 @@ MODULE LISTS
 
   USE BASE_ROUTINES
   USE CONSTANTS
+  USE HASH_SETS
+  USE INPUT_OUTPUT
   USE ISO_VARYING_STRING
   USE KINDS
+  USE MACHINE_CONSTANTS
+  USE SORTING
   USE STRINGS
   USE TYPES
 
@@ -85,6 +89,15 @@ MODULE LISTS
   INTEGER(INTG), PARAMETER :: LIST_BUBBLE_SORT_METHOD=1 !<Bubble sort method \see LISTS_SortingMethod,LISTS
   INTEGER(INTG), PARAMETER :: LIST_SHELL_SORT_METHOD=2 !<Shell sort method \see LISTS_SortingMethod,LISTS
   INTEGER(INTG), PARAMETER :: LIST_HEAP_SORT_METHOD=3 !<Heap sort method \see LISTS_SortingMethod,LISTS
+  INTEGER(INTG), PARAMETER :: LIST_INTRO_SORT_METHOD=4 !<Introsort (quicksort falling back to heap sort) method \see LISTS_SortingMethod,LISTS
+  !>@}
+
+  !> \addtogroup LISTS_DuplicatesMethod LISTS::DuplicatesMethod
+  !> \brief Duplicate removal method parameters for a list.
+  !> \see LISTS
+  !>@{
+  INTEGER(INTG), PARAMETER :: LIST_SORT_DUPLICATES_METHOD=1 !<Duplicates are removed by sorting the list. The list is left sorted. \see LISTS_DuplicatesMethod,LISTS
+  INTEGER(INTG), PARAMETER :: LIST_HASH_DUPLICATES_METHOD=2 !<Duplicates are removed with a hash set in linear time, keeping the first occurrence of each item in order. Real lists are still sorted. \see LISTS_DuplicatesMethod,LISTS
   !>@}
 
   !Module types
@@ -108,7 +121,25 @@ MODULE LISTS
   INTERFACE List_DataTypeSet
     MODULE PROCEDURE LIST_DATA_TYPE_SET
   END INTERFACE List_DataTypeSet
+
+  INTERFACE List_DuplicatesMethodSet
+    MODULE PROCEDURE LIST_DUPLICATES_METHOD_SET
+  END INTERFACE List_DuplicatesMethodSet
+
+  INTERFACE List_GrowthFactorSet
+    MODULE PROCEDURE LIST_GROWTH_FACTOR_SET
+  END INTERFACE List_GrowthFactorSet
   
+  !>Detaches the list values from a list and returns them as an array of base type without copying them, leaving the list empty \see LISTS.
+  INTERFACE List_Detach
+    MODULE PROCEDURE LIST_DETACH_INTG1
+    MODULE PROCEDURE LIST_DETACH_INTG2
+    MODULE PROCEDURE LIST_DETACH_SP1
+    MODULE PROCEDURE LIST_DETACH_SP2
+    MODULE PROCEDURE LIST_DETACH_DP1
+    MODULE PROCEDURE LIST_DETACH_DP2
+  END INTERFACE List_Detach
+
   !>Detaches the list values from a list and returns them as a pointer to a array of base type before destroying the list \see LISTS.
   INTERFACE LIST_DETACH_AND_DESTROY
     MODULE PROCEDURE LIST_DETACH_AND_DESTROY_INTG1
@@ -149,6 +180,26 @@ MODULE LISTS
     MODULE PROCEDURE LIST_ITEM_ADD_DP2
   END INTERFACE List_ItemAdd
   
+  !>Adds an array of items to the end of a list \see LISTS.
+  INTERFACE LIST_ITEMS_ADD
+    MODULE PROCEDURE LIST_ITEMS_ADD_INTG1
+    MODULE PROCEDURE LIST_ITEMS_ADD_INTG2
+    MODULE PROCEDURE LIST_ITEMS_ADD_SP1
+    MODULE PROCEDURE LIST_ITEMS_ADD_SP2
+    MODULE PROCEDURE LIST_ITEMS_ADD_DP1
+    MODULE PROCEDURE LIST_ITEMS_ADD_DP2
+  END INTERFACE LIST_ITEMS_ADD
+
+  !>Adds an array of items to the end of a list \see LISTS.
+  INTERFACE List_ItemsAdd
+    MODULE PROCEDURE LIST_ITEMS_ADD_INTG1
+    MODULE PROCEDURE LIST_ITEMS_ADD_INTG2
+    MODULE PROCEDURE LIST_ITEMS_ADD_SP1
+    MODULE PROCEDURE LIST_ITEMS_ADD_SP2
+    MODULE PROCEDURE LIST_ITEMS_ADD_DP1
+    MODULE PROCEDURE LIST_ITEMS_ADD_DP2
+  END INTERFACE List_ItemsAdd
+
   INTERFACE List_ItemDelete
     MODULE PROCEDURE LIST_ITEM_DELETE
   END INTERFACE List_ItemDelete
@@ -303,6 +354,26 @@ MODULE LISTS
     MODULE PROCEDURE LIST_SORT_HEAP_DP2_ARRAY
   END INTERFACE List_SortHeap
 
+  !>Sorts a list into assending order using the introsort method.
+  INTERFACE LIST_SORT_INTRO
+    MODULE PROCEDURE LIST_SORT_INTRO_INTG1_ARRAY
+    MODULE PROCEDURE LIST_SORT_INTRO_INTG2_ARRAY
+    MODULE PROCEDURE LIST_SORT_INTRO_SP1_ARRAY
+    MODULE PROCEDURE LIST_SORT_INTRO_SP2_ARRAY
+    MODULE PROCEDURE LIST_SORT_INTRO_DP1_ARRAY
+    MODULE PROCEDURE LIST_SORT_INTRO_DP2_ARRAY
+  END INTERFACE LIST_SORT_INTRO
+
+  !>Sorts a list into assending order using the introsort method.
+  INTERFACE List_SortIntro
+    MODULE PROCEDURE LIST_SORT_INTRO_INTG1_ARRAY
+    MODULE PROCEDURE LIST_SORT_INTRO_INTG2_ARRAY
+    MODULE PROCEDURE LIST_SORT_INTRO_SP1_ARRAY
+    MODULE PROCEDURE LIST_SORT_INTRO_SP2_ARRAY
+    MODULE PROCEDURE LIST_SORT_INTRO_DP1_ARRAY
+    MODULE PROCEDURE LIST_SORT_INTRO_DP2_ARRAY
+  END INTERFACE List_SortIntro
+
   !>Sorts a list into either assending or descending order using the shell sort method.
   INTERFACE LIST_SORT_SHELL
     MODULE PROCEDURE LIST_SORT_SHELL_INTG1_ARRAY
@@ -328,6 +399,11 @@ MODULE LISTS
     MODULE PROCEDURE LIST_INTERSECTION_INTG_ARRAY
   END INTERFACE List_Itersection
 
+  !>Calculates the union of two arrays
+  INTERFACE List_Union
+    MODULE PROCEDURE LIST_UNION_INTG_ARRAY
+  END INTERFACE List_Union
+
   !>Checks whether an array is a subset of another array
   INTERFACE LIST_SUBSET_OF
     MODULE PROCEDURE LISTS_SUBSET_OF_INTG_ARRAY
@@ -340,6 +416,8 @@ MODULE LISTS
 
   PUBLIC LIST_INTG_TYPE,LIST_SP_TYPE,LIST_DP_TYPE
 
+  PUBLIC LIST_SORT_DUPLICATES_METHOD,LIST_HASH_DUPLICATES_METHOD
+
   PUBLIC List_AppendList
 
   PUBLIC List_ClearItems
@@ -356,13 +434,21 @@ MODULE LISTS
 
   PUBLIC List_DataTypeSet
 
+  PUBLIC LIST_DUPLICATES_METHOD_SET
+
+  PUBLIC List_DuplicatesMethodSet
+
+  PUBLIC LIST_GROWTH_FACTOR_SET
+
+  PUBLIC List_GrowthFactorSet
+
   PUBLIC LIST_DETACH_AND_DESTROY
 
-  PUBLIC List_Destroy,List_DetachAndDestroy
+  PUBLIC List_Destroy,List_Detach,List_DetachAndDestroy
 
-  PUBLIC LIST_ITEM_ADD
+  PUBLIC LIST_ITEM_ADD,LIST_ITEMS_ADD
 
-  PUBLIC List_ItemAdd
+  PUBLIC List_ItemAdd,List_ItemsAdd
   
   PUBLIC LIST_ITEM_DELETE
 
@@ -404,12 +490,14 @@ MODULE LISTS
   
   PUBLIC List_Search,List_SearchLinear
   
-  PUBLIC LIST_SORT_BUBBLE,LIST_SORT_HEAP,LIST_SORT_SHELL
+  PUBLIC LIST_SORT_BUBBLE,LIST_SORT_HEAP,LIST_SORT_INTRO,LIST_SORT_SHELL
   
-  PUBLIC List_Sort,List_SortBubble,List_SortHeap,List_SortShell
+  PUBLIC List_Sort,List_SortBubble,List_SortHeap,List_SortIntro,List_SortShell
 
   PUBLIC List_Itersection
 
+  PUBLIC List_Union
+
   PUBLIC LIST_SUBSET_OF
   
   PUBLIC List_SubsetOf
@@ -623,6 +711,47 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Sets/changes the method used to remove duplicates from a list.
+  SUBROUTINE LIST_DUPLICATES_METHOD_SET(LIST,DUPLICATES_METHOD,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list 
+    INTEGER(INTG), INTENT(IN) :: DUPLICATES_METHOD !<The duplicate removal method of the list to set \see LISTS_DuplicatesMethod,LISTS
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("LIST_DUPLICATES_METHOD_SET",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(LIST%LIST_FINISHED) THEN
+        CALL FlagError("List has been finished.",ERR,ERROR,*999)
+      ELSE
+        SELECT CASE(DUPLICATES_METHOD)
+        CASE(LIST_SORT_DUPLICATES_METHOD)
+          LIST%DUPLICATES_METHOD=LIST_SORT_DUPLICATES_METHOD
+        CASE(LIST_HASH_DUPLICATES_METHOD)
+          LIST%DUPLICATES_METHOD=LIST_HASH_DUPLICATES_METHOD
+        CASE DEFAULT
+          LOCAL_ERROR="The duplicates method of "//TRIM(NumberToVString(DUPLICATES_METHOD,"*",ERR,ERROR))//" is invalid."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        END SELECT
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_DUPLICATES_METHOD_SET")
+    RETURN
+999 ERRORSEXITS("LIST_DUPLICATES_METHOD_SET",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_DUPLICATES_METHOD_SET
+
+  !
+  !================================================================================================================================
+  !
+
   !>Destroys a list.
   SUBROUTINE LIST_DESTROY(LIST,ERR,ERROR,*)
 
@@ -662,6 +791,14 @@ CONTAINS
     ENTERS("LIST_FINALISE",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
+      IF(DIAGNOSTICS1) THEN
+        CALL WRITE_STRING_VALUE(DIAGNOSTIC_OUTPUT_TYPE,"  Number in list = ",LIST%NUMBER_IN_LIST,ERR,ERROR,*999)
+        CALL WRITE_STRING_VALUE(DIAGNOSTIC_OUTPUT_TYPE,"  List size = ",LIST%SIZE,ERR,ERROR,*999)
+        CALL WRITE_STRING_VALUE(DIAGNOSTIC_OUTPUT_TYPE,"  Number of reallocations = ",LIST%NUMBER_OF_REALLOCATIONS, &
+          & ERR,ERROR,*999)
+        CALL WRITE_STRING_VALUE(DIAGNOSTIC_OUTPUT_TYPE,"  Number of bytes copied = ",LIST%NUMBER_OF_BYTES_COPIED, &
+          & ERR,ERROR,*999)
+      ENDIF
       IF(ALLOCATED(LIST%LIST_INTG)) DEALLOCATE(LIST%LIST_INTG)
       IF(ALLOCATED(LIST%LIST_INTG2)) DEALLOCATE(LIST%LIST_INTG2)
       IF(ALLOCATED(LIST%LIST_SP)) DEALLOCATE(LIST%LIST_SP)
@@ -689,11 +826,6 @@ CONTAINS
     INTEGER(INTG), INTENT(OUT) :: err !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
     !Local Variables
-    INTEGER(INTG) :: newSize
-    INTEGER(INTG), ALLOCATABLE :: newListIntg(:)
-    REAL(SP), ALLOCATABLE :: newListSP(:)
-    REAL(DP), ALLOCATABLE :: newListDP(:)
-    INTEGER(C_INT), ALLOCATABLE :: newListCInt(:)
     TYPE(VARYING_STRING) :: localError
 
     ENTERS("List_AppendList",err,error,*999)
@@ -708,41 +840,20 @@ CONTAINS
                 CASE(1)
                   SELECT CASE(list%DATA_TYPE)
                   CASE(LIST_INTG_TYPE)
-                    IF(list%SIZE<list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST) THEN
-                      !Reallocate
-                      newSize=MAX(2*list%NUMBER_IN_LIST,list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST*2)
-                      ALLOCATE(newListIntg(newSize),stat=err)
-                      IF(err/=0) CALL FlagError("Could not allocate new list.",err,ERROR,*999)
-                      newListIntg(1:list%NUMBER_IN_LIST)=list%LIST_INTG(1:list%NUMBER_IN_LIST)
-                      CALL MOVE_ALLOC(newListIntg,list%LIST_INTG)
-                      list%SIZE=newSize
-                    END IF
+                    IF(list%SIZE<list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST) &
+                      & CALL LIST_GROW(list,list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST,err,error,*999)
                     list%LIST_INTG(list%NUMBER_IN_LIST+1:list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST)= &
                       & appendedList%LIST_INTG(1:appendedList%NUMBER_IN_LIST)
                     list%NUMBER_IN_LIST=list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST
                   CASE(LIST_SP_TYPE)
-                    IF(list%SIZE<list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST) THEN
-                      !Reallocate
-                      newSize=MAX(2*list%NUMBER_IN_LIST,list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST*2)
-                      ALLOCATE(newListSP(newSize),stat=err)
-                      IF(err/=0) CALL FlagError("Could not allocate new list.",err,ERROR,*999)
-                      newListSP(1:list%NUMBER_IN_LIST)=list%LIST_SP(1:list%NUMBER_IN_LIST)
-                      CALL MOVE_ALLOC(newListSP,list%LIST_SP)
-                      list%SIZE=newSize
-                    END IF
+                    IF(list%SIZE<list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST) &
+                      & CALL LIST_GROW(list,list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST,err,error,*999)
                     list%LIST_SP(list%NUMBER_IN_LIST+1:list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST)= &
                       & appendedList%LIST_SP(1:appendedList%NUMBER_IN_LIST)
                     list%NUMBER_IN_LIST=list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST
                   CASE(LIST_DP_TYPE)
-                    IF(list%SIZE<list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST) THEN
-                      !Reallocate
-                      newSize=MAX(2*list%NUMBER_IN_LIST,list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST*2)
-                      ALLOCATE(newListDP(newSize),stat=err)
-                      IF(err/=0) CALL FlagError("Could not allocate new list.",err,ERROR,*999)
-                      newListDP(1:list%NUMBER_IN_LIST)=list%LIST_DP(1:list%NUMBER_IN_LIST)
-                      CALL MOVE_ALLOC(newListDP,list%LIST_DP)
-                      list%SIZE=newSize
-                    END IF
+                    IF(list%SIZE<list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST) &
+                      & CALL LIST_GROW(list,list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST,err,error,*999)
                     list%LIST_DP(list%NUMBER_IN_LIST+1:list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST)= &
                       & appendedList%LIST_DP(1:appendedList%NUMBER_IN_LIST)
                     list%NUMBER_IN_LIST=list%NUMBER_IN_LIST+appendedList%NUMBER_IN_LIST
@@ -779,11 +890,7 @@ CONTAINS
 
     EXITS("List_AppendList")
     RETURN
-999 IF(ALLOCATED(newListIntg)) DEALLOCATE(newListIntg)
-    IF(ALLOCATED(newListSP)) DEALLOCATE(newListSP)
-    IF(ALLOCATED(newListDP)) DEALLOCATE(newListDP)
-    IF(ALLOCATED(newListCInt)) DEALLOCATE(newListCInt)
-    ERRORSEXITS("List_AppendList",err,error)
+999 ERRORSEXITS("List_AppendList",err,error)
     RETURN 1
   END SUBROUTINE List_AppendList
 
@@ -823,6 +930,146 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Grows the data of a list so that it can hold at least MINIMUM_SIZE items. The list size is multiplied by the growth
+  !>factor of the list so that the number of reallocations only grows logarithmically with the number of items added.
+  SUBROUTINE LIST_GROW(LIST,MINIMUM_SIZE,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(INOUT) :: LIST !<A pointer to the list to grow
+    INTEGER(INTG), INTENT(IN) :: MINIMUM_SIZE !<The minimum number of items the list must be able to hold on exit
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: ITEM_SIZE,NEW_SIZE
+    INTEGER(INTG), ALLOCATABLE :: NEW_LIST_INTG(:),NEW_LIST_INTG2(:,:)
+    REAL(SP), ALLOCATABLE :: NEW_LIST_SP(:),NEW_LIST_SP2(:,:)
+    REAL(DP), ALLOCATABLE :: NEW_LIST_DP(:),NEW_LIST_DP2(:,:)
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("LIST_GROW",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(LIST%SIZE<MINIMUM_SIZE) THEN
+        IF(LIST%SIZE>0) THEN
+          NEW_SIZE=INT(MIN(REAL(LIST%SIZE,DP)*LIST%GROWTH_FACTOR,REAL(HUGE(NEW_SIZE),DP)),INTG)
+        ELSE
+          !The list data has been detached so start again from the initial size
+          NEW_SIZE=LIST%INITIAL_SIZE
+        ENDIF
+        NEW_SIZE=MAX(NEW_SIZE,LIST%SIZE+1,MINIMUM_SIZE)
+        IF(LIST%DATA_DIMENSION==1) THEN
+          SELECT CASE(LIST%DATA_TYPE)
+          CASE(LIST_INTG_TYPE)
+            ALLOCATE(NEW_LIST_INTG(NEW_SIZE),STAT=ERR)
+            IF(ERR/=0) CALL FlagError("Could not allocate new list.",ERR,ERROR,*999)
+            IF(LIST%NUMBER_IN_LIST>0) NEW_LIST_INTG(1:LIST%NUMBER_IN_LIST)=LIST%LIST_INTG(1:LIST%NUMBER_IN_LIST)
+            CALL MOVE_ALLOC(NEW_LIST_INTG,LIST%LIST_INTG)
+            ITEM_SIZE=INTEGER_SIZE
+          CASE(LIST_SP_TYPE)
+            ALLOCATE(NEW_LIST_SP(NEW_SIZE),STAT=ERR)
+            IF(ERR/=0) CALL FlagError("Could not allocate new list.",ERR,ERROR,*999)
+            IF(LIST%NUMBER_IN_LIST>0) NEW_LIST_SP(1:LIST%NUMBER_IN_LIST)=LIST%LIST_SP(1:LIST%NUMBER_IN_LIST)
+            CALL MOVE_ALLOC(NEW_LIST_SP,LIST%LIST_SP)
+            ITEM_SIZE=SINGLE_REAL_SIZE
+          CASE(LIST_DP_TYPE)
+            ALLOCATE(NEW_LIST_DP(NEW_SIZE),STAT=ERR)
+            IF(ERR/=0) CALL FlagError("Could not allocate new list.",ERR,ERROR,*999)
+            IF(LIST%NUMBER_IN_LIST>0) NEW_LIST_DP(1:LIST%NUMBER_IN_LIST)=LIST%LIST_DP(1:LIST%NUMBER_IN_LIST)
+            CALL MOVE_ALLOC(NEW_LIST_DP,LIST%LIST_DP)
+            ITEM_SIZE=DOUBLE_REAL_SIZE
+          CASE DEFAULT
+            LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))//" is invalid."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          END SELECT
+        ELSE
+          SELECT CASE(LIST%DATA_TYPE)
+          CASE(LIST_INTG_TYPE)
+            ALLOCATE(NEW_LIST_INTG2(LIST%DATA_DIMENSION,NEW_SIZE),STAT=ERR)
+            IF(ERR/=0) CALL FlagError("Could not allocate new list.",ERR,ERROR,*999)
+            IF(LIST%NUMBER_IN_LIST>0) NEW_LIST_INTG2(:,1:LIST%NUMBER_IN_LIST)=LIST%LIST_INTG2(:,1:LIST%NUMBER_IN_LIST)
+            CALL MOVE_ALLOC(NEW_LIST_INTG2,LIST%LIST_INTG2)
+            ITEM_SIZE=INTEGER_SIZE
+          CASE(LIST_SP_TYPE)
+            ALLOCATE(NEW_LIST_SP2(LIST%DATA_DIMENSION,NEW_SIZE),STAT=ERR)
+            IF(ERR/=0) CALL FlagError("Could not allocate new list.",ERR,ERROR,*999)
+            IF(LIST%NUMBER_IN_LIST>0) NEW_LIST_SP2(:,1:LIST%NUMBER_IN_LIST)=LIST%LIST_SP2(:,1:LIST%NUMBER_IN_LIST)
+            CALL MOVE_ALLOC(NEW_LIST_SP2,LIST%LIST_SP2)
+            ITEM_SIZE=SINGLE_REAL_SIZE
+          CASE(LIST_DP_TYPE)
+            ALLOCATE(NEW_LIST_DP2(LIST%DATA_DIMENSION,NEW_SIZE),STAT=ERR)
+            IF(ERR/=0) CALL FlagError("Could not allocate new list.",ERR,ERROR,*999)
+            IF(LIST%NUMBER_IN_LIST>0) NEW_LIST_DP2(:,1:LIST%NUMBER_IN_LIST)=LIST%LIST_DP2(:,1:LIST%NUMBER_IN_LIST)
+            CALL MOVE_ALLOC(NEW_LIST_DP2,LIST%LIST_DP2)
+            ITEM_SIZE=DOUBLE_REAL_SIZE
+          CASE DEFAULT
+            LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))//" is invalid."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          END SELECT
+        ENDIF
+        LIST%SIZE=NEW_SIZE
+        LIST%NUMBER_OF_REALLOCATIONS=LIST%NUMBER_OF_REALLOCATIONS+1
+        LIST%NUMBER_OF_BYTES_COPIED=LIST%NUMBER_OF_BYTES_COPIED+ &
+          & INT(LIST%NUMBER_IN_LIST,LINTG)*INT(LIST%DATA_DIMENSION,LINTG)*INT(ITEM_SIZE,LINTG)
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_GROW")
+    RETURN
+999 IF(ALLOCATED(NEW_LIST_INTG)) DEALLOCATE(NEW_LIST_INTG)
+    IF(ALLOCATED(NEW_LIST_INTG2)) DEALLOCATE(NEW_LIST_INTG2)
+    IF(ALLOCATED(NEW_LIST_SP)) DEALLOCATE(NEW_LIST_SP)
+    IF(ALLOCATED(NEW_LIST_SP2)) DEALLOCATE(NEW_LIST_SP2)
+    IF(ALLOCATED(NEW_LIST_DP)) DEALLOCATE(NEW_LIST_DP)
+    IF(ALLOCATED(NEW_LIST_DP2)) DEALLOCATE(NEW_LIST_DP2)
+    ERRORSEXITS("LIST_GROW",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_GROW
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the growth factor for a list. When a full list is reallocated its size is multiplied by this factor.
+  SUBROUTINE LIST_GROWTH_FACTOR_SET(LIST,GROWTH_FACTOR,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
+    REAL(DP), INTENT(IN) :: GROWTH_FACTOR !<The growth factor of the list to set. Must be greater than one.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("LIST_GROWTH_FACTOR_SET",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(LIST%LIST_FINISHED) THEN
+        CALL FlagError("List has been finished.",ERR,ERROR,*999)
+      ELSE
+        IF(GROWTH_FACTOR>1.0_DP) THEN
+          LIST%GROWTH_FACTOR=GROWTH_FACTOR
+        ELSE
+          LOCAL_ERROR="The growth factor of "//TRIM(NumberToVString(GROWTH_FACTOR,"*",ERR,ERROR))// &
+            & " is invalid. The growth factor must be > 1."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        ENDIF
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_GROWTH_FACTOR_SET")
+    RETURN
+999 ERRORSEXITS("LIST_GROWTH_FACTOR_SET",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_GROWTH_FACTOR_SET
+
+  !
+  !================================================================================================================================
+  !
+
   !>Initialises a list and all its components
   SUBROUTINE LIST_INITIALISE(LIST,ERR,ERROR,*)
 
@@ -850,7 +1097,11 @@ CONTAINS
       LIST%DATA_TYPE=LIST_INTG_TYPE
       LIST%KEY_DIMENSION=1
       LIST%SORT_ORDER=LIST_SORT_ASCENDING_TYPE
-      LIST%SORT_METHOD=LIST_HEAP_SORT_METHOD
+      LIST%SORT_METHOD=LIST_INTRO_SORT_METHOD
+      LIST%DUPLICATES_METHOD=LIST_SORT_DUPLICATES_METHOD
+      LIST%GROWTH_FACTOR=2.0_DP
+      LIST%NUMBER_OF_REALLOCATIONS=0
+      LIST%NUMBER_OF_BYTES_COPIED=0_LINTG
     ENDIF
 
     EXITS("LIST_INITIALISE")
@@ -911,8 +1162,6 @@ CONTAINS
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
-    INTEGER(INTG) :: NEW_SIZE
-    INTEGER(INTG), ALLOCATABLE :: NEW_LIST(:)
     TYPE(VARYING_STRING) :: LOCAL_ERROR
 
     ENTERS("LIST_ITEM_ADD_INTG1",ERR,ERROR,*999)
@@ -921,15 +1170,7 @@ CONTAINS
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_INTG_TYPE) THEN
           IF(LIST%DATA_DIMENSION==1) THEN
-            IF(LIST%NUMBER_IN_LIST==LIST%SIZE) THEN
-              !Reallocate
-              NEW_SIZE=MAX(2*LIST%NUMBER_IN_LIST,1)
-              ALLOCATE(NEW_LIST(NEW_SIZE),STAT=ERR)
-              IF(ERR/=0) CALL FlagError("Could not allocate new list.",ERR,ERROR,*999)
-              NEW_LIST(1:LIST%NUMBER_IN_LIST)=LIST%LIST_INTG(1:LIST%NUMBER_IN_LIST)
-              CALL MOVE_ALLOC(NEW_LIST,LIST%LIST_INTG)
-              LIST%SIZE=NEW_SIZE
-            ENDIF
+            IF(LIST%NUMBER_IN_LIST==LIST%SIZE) CALL LIST_GROW(LIST,LIST%NUMBER_IN_LIST+1,ERR,ERROR,*999)
             LIST%LIST_INTG(LIST%NUMBER_IN_LIST+1)=ITEM
             LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST+1
           ELSE
@@ -951,8 +1192,7 @@ CONTAINS
     
     EXITS("LIST_ITEM_ADD_INTG1")
     RETURN
-999 IF(ALLOCATED(NEW_LIST)) DEALLOCATE(NEW_LIST)
-    ERRORSEXITS("LIST_ITEM_ADD_INTG1",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_ADD_INTG1",ERR,ERROR)
     RETURN 1
   END SUBROUTINE LIST_ITEM_ADD_INTG1
   
@@ -968,8 +1208,6 @@ CONTAINS
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
-    INTEGER(INTG) :: NEW_SIZE
-    INTEGER(INTG), ALLOCATABLE :: NEW_LIST(:,:)
     TYPE(VARYING_STRING) :: LOCAL_ERROR
 
     ENTERS("LIST_ITEM_ADD_INTG2",ERR,ERROR,*999)
@@ -978,15 +1216,7 @@ CONTAINS
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_INTG_TYPE) THEN
           IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
-            IF(LIST%NUMBER_IN_LIST==LIST%SIZE) THEN
-              !Reallocate
-              NEW_SIZE=MAX(2*LIST%NUMBER_IN_LIST,1)
-              ALLOCATE(NEW_LIST(LIST%DATA_DIMENSION,NEW_SIZE),STAT=ERR)
-              IF(ERR/=0) CALL FlagError("Could not allocate new list.",ERR,ERROR,*999)
-              NEW_LIST(:,1:LIST%NUMBER_IN_LIST)=LIST%LIST_INTG2(:,1:LIST%NUMBER_IN_LIST)
-              CALL MOVE_ALLOC(NEW_LIST,LIST%LIST_INTG2)
-              LIST%SIZE=NEW_SIZE
-            ENDIF
+            IF(LIST%NUMBER_IN_LIST==LIST%SIZE) CALL LIST_GROW(LIST,LIST%NUMBER_IN_LIST+1,ERR,ERROR,*999)
             LIST%LIST_INTG2(:,LIST%NUMBER_IN_LIST+1)=ITEM
             LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST+1
           ELSE
@@ -1009,8 +1239,7 @@ CONTAINS
     
     EXITS("LIST_ITEM_ADD_INTG2")
     RETURN
-999 IF(ALLOCATED(NEW_LIST)) DEALLOCATE(NEW_LIST)
-    ERRORSEXITS("LIST_ITEM_ADD_INTG2",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_ADD_INTG2",ERR,ERROR)
     RETURN 1
     
   END SUBROUTINE LIST_ITEM_ADD_INTG2
@@ -1028,8 +1257,6 @@ CONTAINS
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
-    INTEGER(INTG) :: NEW_SIZE
-    REAL(SP), ALLOCATABLE :: NEW_LIST(:)
     TYPE(VARYING_STRING) :: LOCAL_ERROR
     
     ENTERS("LIST_ITEM_ADD_SP1",ERR,ERROR,*999)
@@ -1038,15 +1265,7 @@ CONTAINS
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_SP_TYPE) THEN
           IF(LIST%DATA_DIMENSION==1) THEN
-            IF(LIST%NUMBER_IN_LIST==LIST%SIZE) THEN
-              !Reallocate
-              NEW_SIZE=MAX(2*LIST%NUMBER_IN_LIST,1)
-              ALLOCATE(NEW_LIST(NEW_SIZE),STAT=ERR)
-              IF(ERR/=0) CALL FlagError("Could not allocate new list.",ERR,ERROR,*999)
-              NEW_LIST(1:LIST%NUMBER_IN_LIST)=LIST%LIST_SP(1:LIST%NUMBER_IN_LIST)
-              CALL MOVE_ALLOC(NEW_LIST,LIST%LIST_SP)
-              LIST%SIZE=NEW_SIZE
-            ENDIF
+            IF(LIST%NUMBER_IN_LIST==LIST%SIZE) CALL LIST_GROW(LIST,LIST%NUMBER_IN_LIST+1,ERR,ERROR,*999)
             LIST%LIST_SP(LIST%NUMBER_IN_LIST+1)=ITEM
             LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST+1
           ELSE
@@ -1066,8 +1285,7 @@ CONTAINS
     ENDIF
     EXITS("LIST_ITEM_ADD_SP1")
     RETURN
-999 IF(ALLOCATED(NEW_LIST)) DEALLOCATE(NEW_LIST)
-    ERRORSEXITS("LIST_ITEM_ADD_SP1",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_ADD_SP1",ERR,ERROR)
     RETURN 1
   END SUBROUTINE LIST_ITEM_ADD_SP1
   
@@ -1084,8 +1302,6 @@ CONTAINS
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
-    INTEGER(INTG) :: NEW_SIZE
-    REAL(SP), ALLOCATABLE :: NEW_LIST(:,:)
     TYPE(VARYING_STRING) :: LOCAL_ERROR
     
     ENTERS("LIST_ITEM_ADD_SP2",ERR,ERROR,*999)
@@ -1094,15 +1310,7 @@ CONTAINS
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_SP_TYPE) THEN
           IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
-            IF(LIST%NUMBER_IN_LIST==LIST%SIZE) THEN
-              !Reallocate
-              NEW_SIZE=MAX(2*LIST%NUMBER_IN_LIST,1)
-              ALLOCATE(NEW_LIST(LIST%DATA_DIMENSION,NEW_SIZE),STAT=ERR)
-              IF(ERR/=0) CALL FlagError("Could not allocate new list.",ERR,ERROR,*999)
-              NEW_LIST(:,1:LIST%NUMBER_IN_LIST)=LIST%LIST_SP2(:,1:LIST%NUMBER_IN_LIST)
-              CALL MOVE_ALLOC(NEW_LIST,LIST%LIST_SP2)
-              LIST%SIZE=NEW_SIZE
-            ENDIF
+            IF(LIST%NUMBER_IN_LIST==LIST%SIZE) CALL LIST_GROW(LIST,LIST%NUMBER_IN_LIST+1,ERR,ERROR,*999)
             LIST%LIST_SP2(:,LIST%NUMBER_IN_LIST+1)=ITEM
             LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST+1
           ELSE
@@ -1124,8 +1332,7 @@ CONTAINS
     ENDIF
     EXITS("LIST_ITEM_ADD_SP2")
     RETURN
-999 IF(ALLOCATED(NEW_LIST)) DEALLOCATE(NEW_LIST)
-    ERRORSEXITS("LIST_ITEM_ADD_SP2",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_ADD_SP2",ERR,ERROR)
     RETURN 1
   END SUBROUTINE LIST_ITEM_ADD_SP2
   
@@ -1142,8 +1349,6 @@ CONTAINS
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
-    INTEGER(INTG) :: NEW_SIZE
-    REAL(DP), ALLOCATABLE :: NEW_LIST(:)
     TYPE(VARYING_STRING) :: LOCAL_ERROR
 
     ENTERS("LIST_ITEM_ADD_DP1",ERR,ERROR,*999)
@@ -1152,15 +1357,7 @@ CONTAINS
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
           IF(LIST%DATA_DIMENSION==1) THEN
-            IF(LIST%NUMBER_IN_LIST==LIST%SIZE) THEN
-              !Reallocate
-              NEW_SIZE=MAX(2*LIST%NUMBER_IN_LIST,1)
-              ALLOCATE(NEW_LIST(NEW_SIZE),STAT=ERR)
-              IF(ERR/=0) CALL FlagError("Could not allocate new list.",ERR,ERROR,*999)
-              NEW_LIST(1:LIST%NUMBER_IN_LIST)=LIST%LIST_DP(1:LIST%NUMBER_IN_LIST)
-              CALL MOVE_ALLOC(NEW_LIST,LIST%LIST_DP)
-              LIST%SIZE=NEW_SIZE
-            ENDIF
+            IF(LIST%NUMBER_IN_LIST==LIST%SIZE) CALL LIST_GROW(LIST,LIST%NUMBER_IN_LIST+1,ERR,ERROR,*999)
             LIST%LIST_DP(LIST%NUMBER_IN_LIST+1)=ITEM
             LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST+1
           ELSE
@@ -1181,8 +1378,7 @@ CONTAINS
     ENDIF
     EXITS("LIST_ITEM_ADD_DP1")
     RETURN
-999 IF(ALLOCATED(NEW_LIST)) DEALLOCATE(NEW_LIST)
-    ERRORSEXITS("LIST_ITEM_ADD_DP1",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_ADD_DP1",ERR,ERROR)
     RETURN 1
   END SUBROUTINE LIST_ITEM_ADD_DP1
   
@@ -1199,8 +1395,6 @@ CONTAINS
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
-    INTEGER(INTG) :: NEW_SIZE
-    REAL(DP), ALLOCATABLE :: NEW_LIST(:,:)
     TYPE(VARYING_STRING) :: LOCAL_ERROR
 
     ENTERS("LIST_ITEM_ADD_DP2",ERR,ERROR,*999)
@@ -1209,15 +1403,7 @@ CONTAINS
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
           IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
-            IF(LIST%NUMBER_IN_LIST==LIST%SIZE) THEN
-              !Reallocate
-              NEW_SIZE=MAX(2*LIST%NUMBER_IN_LIST,1)
-              ALLOCATE(NEW_LIST(LIST%DATA_DIMENSION,NEW_SIZE),STAT=ERR)
-              IF(ERR/=0) CALL FlagError("Could not allocate new list.",ERR,ERROR,*999)
-              NEW_LIST(:,1:LIST%NUMBER_IN_LIST)=LIST%LIST_DP2(:,1:LIST%NUMBER_IN_LIST)
-              CALL MOVE_ALLOC(NEW_LIST,LIST%LIST_DP2)
-              LIST%SIZE=NEW_SIZE
-            ENDIF
+            IF(LIST%NUMBER_IN_LIST==LIST%SIZE) CALL LIST_GROW(LIST,LIST%NUMBER_IN_LIST+1,ERR,ERROR,*999)
             LIST%LIST_DP2(:,LIST%NUMBER_IN_LIST+1)=ITEM
             LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST+1
           ELSE
@@ -1239,44 +1425,37 @@ CONTAINS
     ENDIF
     EXITS("LIST_ITEM_ADD_DP2")
     RETURN
-999 IF(ALLOCATED(NEW_LIST)) DEALLOCATE(NEW_LIST)
-    ERRORSEXITS("LIST_ITEM_ADD_DP2",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_ADD_DP2",ERR,ERROR)
     RETURN 1
   END SUBROUTINE LIST_ITEM_ADD_DP2
-  
+
   !
   !================================================================================================================================
   !
 
-  !>Sets an item in an integer list of data dimension 1. 
-  SUBROUTINE LIST_ITEM_SET_INTG1(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
-   !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
-    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The index of the item to set
-    INTEGER(INTG), INTENT(IN) :: ITEM !<The item to set
+  !>Adds an array of items to the end of an integer list of data dimension 1.
+  SUBROUTINE LIST_ITEMS_ADD_INTG1(LIST,ITEMS,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(INOUT) :: LIST !<A pointer to the list
+    INTEGER(INTG), INTENT(IN) :: ITEMS(:) !<The items to add
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
+    INTEGER(INTG) :: NUMBER_OF_ITEMS
     TYPE(VARYING_STRING) :: LOCAL_ERROR
 
-    ENTERS("LIST_ITEM_SET_INTG1",ERR,ERROR,*999)
+    ENTERS("LIST_ITEMS_ADD_INTG1",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_INTG_TYPE) THEN
           IF(LIST%DATA_DIMENSION==1) THEN
-            IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
-              IF(LIST%MUTABLE) THEN
-                LIST%LIST_INTG(LIST_ITEM)=ITEM
-              ELSE
-                CALL FlagError("Cannot modify an immutable list.",ERR,ERROR,*999)
-              ENDIF
-            ELSE
-              LOCAL_ERROR="Invalid list index. The supplied index is "// &
-                & TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))//" and that list entry count is"// &
-                & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
-              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
-            ENDIF
+            NUMBER_OF_ITEMS=SIZE(ITEMS,1)
+            IF(LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS>LIST%SIZE) &
+              & CALL LIST_GROW(LIST,LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS,ERR,ERROR,*999)
+            LIST%LIST_INTG(LIST%NUMBER_IN_LIST+1:LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS)=ITEMS
+            LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS
           ELSE
             LOCAL_ERROR="Invalid data dimension. The supplied data dimension is 1 and the list data dimension is "// &
               & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
@@ -1284,64 +1463,58 @@ CONTAINS
           ENDIF
         ELSE
           LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
-            & " does not match the integer type of the supplied list item"
+            & " does not match the integer type of the supplied list items."
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
         ENDIF
       ELSE
-        CALL FlagError("The list has not been finished",ERR,ERROR,*999)
+        CALL FlagError("The list has not been finished.",ERR,ERROR,*999)
       ENDIF
     ELSE
-      CALL FlagError("List is not associated",ERR,ERROR,*999)
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
-    
-    EXITS("LIST_ITEM_SET_INTG1")
+
+    EXITS("LIST_ITEMS_ADD_INTG1")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_SET_INTG1",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEMS_ADD_INTG1",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_SET_INTG1
-  
+  END SUBROUTINE LIST_ITEMS_ADD_INTG1
+
   !
   !================================================================================================================================
   !
 
-  !>Set an item in an integer list of data dimension > 1. 
-  SUBROUTINE LIST_ITEM_SET_INTG2(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
-   !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
-    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The index of the item to set
-    INTEGER(INTG), INTENT(IN) :: ITEM(:) !<The item to set
+  !>Adds an array of items to the end of an integer list of data dimension > 1.
+  SUBROUTINE LIST_ITEMS_ADD_INTG2(LIST,ITEMS,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(INOUT) :: LIST !<A pointer to the list
+    INTEGER(INTG), INTENT(IN) :: ITEMS(:,:) !<ITEMS(:,itemIdx). The itemIdx'th item to add
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
+    INTEGER(INTG) :: NUMBER_OF_ITEMS
     TYPE(VARYING_STRING) :: LOCAL_ERROR
 
-    ENTERS("LIST_ITEM_SET_INTG2",ERR,ERROR,*999)
+    ENTERS("LIST_ITEMS_ADD_INTG2",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_INTG_TYPE) THEN
-          IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
-            IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
-              IF(LIST%MUTABLE) THEN
-                LIST%LIST_INTG2(:,LIST_ITEM)=ITEM
-              ELSE
-                CALL FlagError("Cannot modify an immutable list.",ERR,ERROR,*999)
-              ENDIF
-            ELSE
-              LOCAL_ERROR="Invalid list index. The supplied index is "//&
-                & TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))//" and that list entry count is"//&
-                & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
-              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
-            ENDIF
+          IF(LIST%DATA_DIMENSION==SIZE(ITEMS,1)) THEN
+            NUMBER_OF_ITEMS=SIZE(ITEMS,2)
+            IF(LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS>LIST%SIZE) &
+              & CALL LIST_GROW(LIST,LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS,ERR,ERROR,*999)
+            LIST%LIST_INTG2(:,LIST%NUMBER_IN_LIST+1:LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS)=ITEMS
+            LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS
           ELSE
             LOCAL_ERROR="Invalid data dimension. The supplied data dimension is "// &
-              & TRIM(NumberToVString(SIZE(ITEM,1),"*",ERR,ERROR))//" and the list data dimension is "// &
+              & TRIM(NumberToVString(SIZE(ITEMS,1),"*",ERR,ERROR))//" and the list data dimension is "// &
               & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
             CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
           ENDIF
         ELSE
           LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
-            & " does not match the integer type of the supplied list item."
+            & " does not match the integer type of the supplied list items."
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
         ENDIF
       ELSE
@@ -1350,55 +1523,48 @@ CONTAINS
     ELSE
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
-    
-    EXITS("LIST_ITEM_SET_INTG2")
+
+    EXITS("LIST_ITEMS_ADD_INTG2")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_SET_INTG2",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEMS_ADD_INTG2",ERR,ERROR)
     RETURN 1
-    
-  END SUBROUTINE LIST_ITEM_SET_INTG2
-  
+  END SUBROUTINE LIST_ITEMS_ADD_INTG2
+
   !
   !================================================================================================================================
   !
 
-  !>Sets an item in a single precision real list of data dimension 1. 
-  SUBROUTINE LIST_ITEM_SET_SP1(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
+  !>Adds an array of items to the end of a single precision real list of data dimension 1.
+  SUBROUTINE LIST_ITEMS_ADD_SP1(LIST,ITEMS,ERR,ERROR,*)
 
     !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
-    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The index of the item to set
-    REAL(SP), INTENT(IN) :: ITEM !<The item to set
+    TYPE(LIST_TYPE), POINTER, INTENT(INOUT) :: LIST !<A pointer to the list
+    REAL(SP), INTENT(IN) :: ITEMS(:) !<The items to add
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
+    INTEGER(INTG) :: NUMBER_OF_ITEMS
     TYPE(VARYING_STRING) :: LOCAL_ERROR
-    
-    ENTERS("LIST_ITEM_SET_SP1",ERR,ERROR,*999)
+
+    ENTERS("LIST_ITEMS_ADD_SP1",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_SP_TYPE) THEN
           IF(LIST%DATA_DIMENSION==1) THEN
-            IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
-              IF(LIST%MUTABLE) THEN
-                LIST%LIST_SP(LIST_ITEM)=ITEM
-              ELSE
-                CALL FlagError("Cannot modify an immutable list.",ERR,ERROR,*999)
-              ENDIF
-            ELSE
-              LOCAL_ERROR="Invalid list index. The supplied index is "//&
-                & TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))//" and that list entry count is"//&
-                & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
-              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
-            ENDIF
+            NUMBER_OF_ITEMS=SIZE(ITEMS,1)
+            IF(LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS>LIST%SIZE) &
+              & CALL LIST_GROW(LIST,LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS,ERR,ERROR,*999)
+            LIST%LIST_SP(LIST%NUMBER_IN_LIST+1:LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS)=ITEMS
+            LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS
           ELSE
             LOCAL_ERROR="Invalid data dimension. The supplied data dimension is 1 and the list data dimension is "// &
               & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
           ENDIF
         ELSE
           LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
-            & " does not match the single precision type of the supplied list item."
+            & " does not match the single precision type of the supplied list items."
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
         ENDIF
       ELSE
@@ -1407,55 +1573,49 @@ CONTAINS
     ELSE
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
-    EXITS("LIST_ITEM_SET_SP1")
+
+    EXITS("LIST_ITEMS_ADD_SP1")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_SET_SP1",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEMS_ADD_SP1",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_SET_SP1
-  
+  END SUBROUTINE LIST_ITEMS_ADD_SP1
+
   !
   !================================================================================================================================
   !
 
-  !>Sets an item in a single precision real list of data dimension > 1. 
-  SUBROUTINE LIST_ITEM_SET_SP2(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
+  !>Adds an array of items to the end of a single precision real list of data dimension > 1.
+  SUBROUTINE LIST_ITEMS_ADD_SP2(LIST,ITEMS,ERR,ERROR,*)
 
     !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
-    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The index of the item to set
-    REAL(SP), INTENT(IN) :: ITEM(:) !<The item to set
+    TYPE(LIST_TYPE), POINTER, INTENT(INOUT) :: LIST !<A pointer to the list
+    REAL(SP), INTENT(IN) :: ITEMS(:,:) !<ITEMS(:,itemIdx). The itemIdx'th item to add
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
+    INTEGER(INTG) :: NUMBER_OF_ITEMS
     TYPE(VARYING_STRING) :: LOCAL_ERROR
-    
-    ENTERS("LIST_ITEM_SET_SP2",ERR,ERROR,*999)
+
+    ENTERS("LIST_ITEMS_ADD_SP2",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_SP_TYPE) THEN
-          IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
-            IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
-              IF(LIST%MUTABLE) THEN
-                LIST%LIST_SP2(:,LIST_ITEM)=ITEM
-              ELSE
-                CALL FlagError("Cannot modify an immutable list.",ERR,ERROR,*999)
-              ENDIF
-            ELSE
-              LOCAL_ERROR="Invalid list index. The supplied index is "//&
-                & TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))//" and that list entry count is"//&
-                & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
-              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
-            ENDIF
+          IF(LIST%DATA_DIMENSION==SIZE(ITEMS,1)) THEN
+            NUMBER_OF_ITEMS=SIZE(ITEMS,2)
+            IF(LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS>LIST%SIZE) &
+              & CALL LIST_GROW(LIST,LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS,ERR,ERROR,*999)
+            LIST%LIST_SP2(:,LIST%NUMBER_IN_LIST+1:LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS)=ITEMS
+            LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS
           ELSE
             LOCAL_ERROR="Invalid data dimension. The supplied data dimension is "// &
-              & TRIM(NumberToVString(SIZE(ITEM,1),"*",ERR,ERROR))//" and the list data dimension is "// &
+              & TRIM(NumberToVString(SIZE(ITEMS,1),"*",ERR,ERROR))//" and the list data dimension is "// &
               & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
             CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
           ENDIF
         ELSE
           LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
-            & " does not match the single precision type of the supplied list item."
+            & " does not match the single precision type of the supplied list items."
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
         ENDIF
       ELSE
@@ -1464,46 +1624,40 @@ CONTAINS
     ELSE
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
-    EXITS("LIST_ITEM_SET_SP2")
+
+    EXITS("LIST_ITEMS_ADD_SP2")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_SET_SP2",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEMS_ADD_SP2",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_SET_SP2
-  
+  END SUBROUTINE LIST_ITEMS_ADD_SP2
+
   !
   !================================================================================================================================
   !
 
-  !>Sets an item in a double precision real list of data dimension 1.
-  SUBROUTINE LIST_ITEM_SET_DP1(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
+  !>Adds an array of items to the end of a double precision real list of data dimension 1.
+  SUBROUTINE LIST_ITEMS_ADD_DP1(LIST,ITEMS,ERR,ERROR,*)
 
     !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
-    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The index of the item to set. 
-    REAL(DP), INTENT(IN) :: ITEM !<The item to set
+    TYPE(LIST_TYPE), POINTER, INTENT(INOUT) :: LIST !<A pointer to the list
+    REAL(DP), INTENT(IN) :: ITEMS(:) !<The items to add
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
+    INTEGER(INTG) :: NUMBER_OF_ITEMS
     TYPE(VARYING_STRING) :: LOCAL_ERROR
 
-    ENTERS("LIST_ITEM_SET_DP1",ERR,ERROR,*999)
+    ENTERS("LIST_ITEMS_ADD_DP1",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
           IF(LIST%DATA_DIMENSION==1) THEN
-            IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
-              IF(LIST%MUTABLE) THEN
-                LIST%LIST_DP(LIST_ITEM)=ITEM
-              ELSE
-                CALL FlagError("Cannot modify an immutable list.",ERR,ERROR,*999)
-              ENDIF
-            ELSE
-              LOCAL_ERROR="Invalid list index. The supplied index is "//&
-                & TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))//" and that list entry count is"//&
-                & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
-              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
-            ENDIF
+            NUMBER_OF_ITEMS=SIZE(ITEMS,1)
+            IF(LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS>LIST%SIZE) &
+              & CALL LIST_GROW(LIST,LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS,ERR,ERROR,*999)
+            LIST%LIST_DP(LIST%NUMBER_IN_LIST+1:LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS)=ITEMS
+            LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS
           ELSE
             LOCAL_ERROR="Invalid data dimension. The supplied data dimension is 1 and the list data dimension is "// &
               & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
@@ -1511,7 +1665,7 @@ CONTAINS
           ENDIF
         ELSE
           LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
-            & " does not match the double precision type of the supplied list item."
+            & " does not match the double precision type of the supplied list items."
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
         ENDIF
       ELSE
@@ -1520,55 +1674,49 @@ CONTAINS
     ELSE
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
-    EXITS("LIST_ITEM_SET_DP1")
+
+    EXITS("LIST_ITEMS_ADD_DP1")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_SET_DP1",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEMS_ADD_DP1",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_SET_DP1
-  
+  END SUBROUTINE LIST_ITEMS_ADD_DP1
+
   !
   !================================================================================================================================
   !
 
-  !>Sets an item in a double precision real list of data dimension > 1.
-  SUBROUTINE LIST_ITEM_SET_DP2(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
+  !>Adds an array of items to the end of a double precision real list of data dimension > 1.
+  SUBROUTINE LIST_ITEMS_ADD_DP2(LIST,ITEMS,ERR,ERROR,*)
 
     !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
-    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The index of the item to set.
-    REAL(DP), INTENT(IN) :: ITEM(:) !<The item to set
+    TYPE(LIST_TYPE), POINTER, INTENT(INOUT) :: LIST !<A pointer to the list
+    REAL(DP), INTENT(IN) :: ITEMS(:,:) !<ITEMS(:,itemIdx). The itemIdx'th item to add
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
+    INTEGER(INTG) :: NUMBER_OF_ITEMS
     TYPE(VARYING_STRING) :: LOCAL_ERROR
 
-    ENTERS("LIST_ITEM_SET_DP2",ERR,ERROR,*999)
+    ENTERS("LIST_ITEMS_ADD_DP2",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
-          IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
-            IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
-              IF(LIST%MUTABLE) THEN
-                LIST%LIST_DP2(:,LIST_ITEM)=ITEM
-              ELSE
-                CALL FlagError("Cannot modify an immutable list.",ERR,ERROR,*999)
-              ENDIF
-            ELSE
-              LOCAL_ERROR="Invalid list index. The supplied index is "//&
-                & TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))//" and that list entry count is"//&
-                & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
-              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
-            ENDIF
+          IF(LIST%DATA_DIMENSION==SIZE(ITEMS,1)) THEN
+            NUMBER_OF_ITEMS=SIZE(ITEMS,2)
+            IF(LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS>LIST%SIZE) &
+              & CALL LIST_GROW(LIST,LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS,ERR,ERROR,*999)
+            LIST%LIST_DP2(:,LIST%NUMBER_IN_LIST+1:LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS)=ITEMS
+            LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST+NUMBER_OF_ITEMS
           ELSE
             LOCAL_ERROR="Invalid data dimension. The supplied data dimension is "// &
-              & TRIM(NumberToVString(SIZE(ITEM,1),"*",ERR,ERROR))//" and the list data dimension is "// &
+              & TRIM(NumberToVString(SIZE(ITEMS,1),"*",ERR,ERROR))//" and the list data dimension is "// &
               & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
             CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
           ENDIF
         ELSE
           LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
-            & " does not match the double precision type of the supplied list item."
+            & " does not match the double precision type of the supplied list items."
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
         ENDIF
       ELSE
@@ -1577,99 +1725,106 @@ CONTAINS
     ELSE
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
-    EXITS("LIST_ITEM_SET_DP2")
+
+    EXITS("LIST_ITEMS_ADD_DP2")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_SET_DP2",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEMS_ADD_DP2",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_SET_DP2
-  
+  END SUBROUTINE LIST_ITEMS_ADD_DP2
+
   !
   !================================================================================================================================
   !
 
-  !>Returns the ITEM in a list at position LIST_ITEM in the given integer LIST. 
-  SUBROUTINE LIST_ITEM_GET_INTG1(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
-
-    !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
-    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The position of the item to get
-    INTEGER(INTG), INTENT(OUT) :: ITEM !<On exit, the item at the specified position
+  !>Sets an item in an integer list of data dimension 1. 
+  SUBROUTINE LIST_ITEM_SET_INTG1(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
+   !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
+    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The index of the item to set
+    INTEGER(INTG), INTENT(IN) :: ITEM !<The item to set
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
-    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
     TYPE(VARYING_STRING) :: LOCAL_ERROR
-    
-    ENTERS("LIST_ITEM_GET_INTG1",ERR,ERROR,*999)
+
+    ENTERS("LIST_ITEM_SET_INTG1",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_INTG_TYPE) THEN
-          IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
-            IF(LIST%DATA_DIMENSION==1) THEN
-              ITEM=LIST%LIST_INTG(LIST_ITEM)
+          IF(LIST%DATA_DIMENSION==1) THEN
+            IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
+              IF(LIST%MUTABLE) THEN
+                LIST%LIST_INTG(LIST_ITEM)=ITEM
+              ELSE
+                CALL FlagError("Cannot modify an immutable list.",ERR,ERROR,*999)
+              ENDIF
             ELSE
-              LOCAL_ERROR="Invalid item dimension. The specified item has dimension 1 and the list is of dimension "// &
-                & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))
+              LOCAL_ERROR="Invalid list index. The supplied index is "// &
+                & TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))//" and that list entry count is"// &
+                & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
               CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
             ENDIF
           ELSE
-            LOCAL_ERROR="The specified list item position of "//TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))// &
-              & " is invalid. The list item position must be > 0 and <= "// &
-              & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
+            LOCAL_ERROR="Invalid data dimension. The supplied data dimension is 1 and the list data dimension is "// &
+              & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
             CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
           ENDIF
         ELSE
           LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
-            & " does not match the integer type of the supplied list item."
+            & " does not match the integer type of the supplied list item"
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
         ENDIF
       ELSE
-        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+        CALL FlagError("The list has not been finished",ERR,ERROR,*999)
       ENDIF
     ELSE
-      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+      CALL FlagError("List is not associated",ERR,ERROR,*999)
     ENDIF
-
-    EXITS("LIST_ITEM_GET_INTG1")
+    
+    EXITS("LIST_ITEM_SET_INTG1")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_GET_INTG1",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_SET_INTG1",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_GET_INTG1
+  END SUBROUTINE LIST_ITEM_SET_INTG1
   
   !
   !================================================================================================================================
   !
 
-  !>Returns the ITEM in a list at position LIST_ITEM in the given integer LIST. 
-  SUBROUTINE LIST_ITEM_GET_INTG2(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
-
-    !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
-    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The position of the item to get
-    INTEGER(INTG), INTENT(OUT) :: ITEM(:) !<On exit, the item at the specified position
+  !>Set an item in an integer list of data dimension > 1. 
+  SUBROUTINE LIST_ITEM_SET_INTG2(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
+   !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
+    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The index of the item to set
+    INTEGER(INTG), INTENT(IN) :: ITEM(:) !<The item to set
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
-    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
     TYPE(VARYING_STRING) :: LOCAL_ERROR
-    
-    ENTERS("LIST_ITEM_GET_INTG2",ERR,ERROR,*999)
+
+    ENTERS("LIST_ITEM_SET_INTG2",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_INTG_TYPE) THEN
-          IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
-            IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
-              ITEM=LIST%LIST_INTG2(:,LIST_ITEM)
+          IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
+            IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
+              IF(LIST%MUTABLE) THEN
+                LIST%LIST_INTG2(:,LIST_ITEM)=ITEM
+              ELSE
+                CALL FlagError("Cannot modify an immutable list.",ERR,ERROR,*999)
+              ENDIF
             ELSE
-              LOCAL_ERROR="Invalid item dimension. The specified item has dimension "// &
-                & TRIM(NumberToVString(SIZE(ITEM,1),"*",ERR,ERROR))//" and the list is of dimension "// &
-                & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))
+              LOCAL_ERROR="Invalid list index. The supplied index is "//&
+                & TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))//" and that list entry count is"//&
+                & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
               CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
             ENDIF
           ELSE
-            LOCAL_ERROR="The specified list item position of "//TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))// &
-              & " is invalid. The list item position must be > 0 and <= "// &
-              & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
+            LOCAL_ERROR="Invalid data dimension. The supplied data dimension is "// &
+              & TRIM(NumberToVString(SIZE(ITEM,1),"*",ERR,ERROR))//" and the list data dimension is "// &
+              & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
             CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
           ENDIF
         ELSE
@@ -1678,52 +1833,56 @@ CONTAINS
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
         ENDIF
       ELSE
-        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+        CALL FlagError("The list has not been finished.",ERR,ERROR,*999)
       ENDIF
     ELSE
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
-
-    EXITS("LIST_ITEM_GET_INTG2")
+    
+    EXITS("LIST_ITEM_SET_INTG2")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_GET_INTG2",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_SET_INTG2",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_GET_INTG2
+    
+  END SUBROUTINE LIST_ITEM_SET_INTG2
   
   !
   !================================================================================================================================
   !
 
-  !>Returns the ITEM in a list at position LIST_ITEM in the given single precision LIST. 
-  SUBROUTINE LIST_ITEM_GET_SP1(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
+  !>Sets an item in a single precision real list of data dimension 1. 
+  SUBROUTINE LIST_ITEM_SET_SP1(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
 
     !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
-    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The position of the item to get
-    REAL(SP), INTENT(OUT) :: ITEM !<On exit, the item at the specified position.
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
+    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The index of the item to set
+    REAL(SP), INTENT(IN) :: ITEM !<The item to set
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
-    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
     TYPE(VARYING_STRING) :: LOCAL_ERROR
     
-    ENTERS("LIST_ITEM_GET_SP1",ERR,ERROR,*999)
+    ENTERS("LIST_ITEM_SET_SP1",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_SP_TYPE) THEN
-          IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
-            IF(LIST%DATA_DIMENSION==1) THEN
-              ITEM=LIST%LIST_SP(LIST_ITEM)
+          IF(LIST%DATA_DIMENSION==1) THEN
+            IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
+              IF(LIST%MUTABLE) THEN
+                LIST%LIST_SP(LIST_ITEM)=ITEM
+              ELSE
+                CALL FlagError("Cannot modify an immutable list.",ERR,ERROR,*999)
+              ENDIF
             ELSE
-              LOCAL_ERROR="Invalid item dimension. The specified item has dimension 1 and the list is of dimension "// &
-                & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))
+              LOCAL_ERROR="Invalid list index. The supplied index is "//&
+                & TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))//" and that list entry count is"//&
+                & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
               CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
             ENDIF
           ELSE
-            LOCAL_ERROR="The specified list item position of "//TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))// &
-              & " is invalid. The list item position must be > 0 and <= "// &
-              & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
-            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            LOCAL_ERROR="Invalid data dimension. The supplied data dimension is 1 and the list data dimension is "// &
+              & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
           ENDIF
         ELSE
           LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
@@ -1731,52 +1890,55 @@ CONTAINS
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
         ENDIF
       ELSE
-        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+        CALL FlagError("The list has not been finished.",ERR,ERROR,*999)
       ENDIF
     ELSE
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
-
-    EXITS("LIST_ITEM_GET_SP1")
+    EXITS("LIST_ITEM_SET_SP1")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_GET_SP1",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_SET_SP1",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_GET_SP1
+  END SUBROUTINE LIST_ITEM_SET_SP1
   
   !
   !================================================================================================================================
   !
 
-  !>Returns the ITEM in a list at position LIST_ITEM in the given single precision LIST. 
-  SUBROUTINE LIST_ITEM_GET_SP2(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
+  !>Sets an item in a single precision real list of data dimension > 1. 
+  SUBROUTINE LIST_ITEM_SET_SP2(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
 
     !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
-    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The position of the item to get
-    REAL(SP), INTENT(OUT) :: ITEM(:) !<On exit, the item at the specified position
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
+    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The index of the item to set
+    REAL(SP), INTENT(IN) :: ITEM(:) !<The item to set
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
-    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
     TYPE(VARYING_STRING) :: LOCAL_ERROR
     
-    ENTERS("LIST_ITEM_GET_SP2",ERR,ERROR,*999)
+    ENTERS("LIST_ITEM_SET_SP2",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_SP_TYPE) THEN
-          IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
-            IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
-              ITEM=LIST%LIST_SP2(:,LIST_ITEM)
+          IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
+            IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
+              IF(LIST%MUTABLE) THEN
+                LIST%LIST_SP2(:,LIST_ITEM)=ITEM
+              ELSE
+                CALL FlagError("Cannot modify an immutable list.",ERR,ERROR,*999)
+              ENDIF
             ELSE
-              LOCAL_ERROR="Invalid item dimension. The specified item has dimension "// &
-                & TRIM(NumberToVString(SIZE(ITEM,1),"*",ERR,ERROR))//" and the list is of dimension "// &
-                & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))
+              LOCAL_ERROR="Invalid list index. The supplied index is "//&
+                & TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))//" and that list entry count is"//&
+                & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
               CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
             ENDIF
           ELSE
-            LOCAL_ERROR="The specified list item position of "//TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))// &
-              & " is invalid. The list item position must be > 0 and <= "// &
-              & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
+            LOCAL_ERROR="Invalid data dimension. The supplied data dimension is "// &
+              & TRIM(NumberToVString(SIZE(ITEM,1),"*",ERR,ERROR))//" and the list data dimension is "// &
+              & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
             CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
           ENDIF
         ELSE
@@ -1785,51 +1947,54 @@ CONTAINS
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
         ENDIF
       ELSE
-        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+        CALL FlagError("The list has not been finished.",ERR,ERROR,*999)
       ENDIF
     ELSE
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
-
-    EXITS("LIST_ITEM_GET_SP2")
+    EXITS("LIST_ITEM_SET_SP2")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_GET_SP2",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_SET_SP2",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_GET_SP2
+  END SUBROUTINE LIST_ITEM_SET_SP2
   
   !
   !================================================================================================================================
   !
 
-  !>Returns the ITEM in a list at position LIST_ITEM in the given double precision LIST. 
-  SUBROUTINE LIST_ITEM_GET_DP1(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
+  !>Sets an item in a double precision real list of data dimension 1.
+  SUBROUTINE LIST_ITEM_SET_DP1(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
 
     !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
-    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The position of the item to get
-    REAL(DP), INTENT(OUT) :: ITEM !<On exit, the item at the specified position.
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
+    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The index of the item to set. 
+    REAL(DP), INTENT(IN) :: ITEM !<The item to set
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
-    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
     TYPE(VARYING_STRING) :: LOCAL_ERROR
-    
-    ENTERS("LIST_ITEM_GET_DP1",ERR,ERROR,*999)
 
-    IF(ASSOCIATED(LIST)) THEN
+    ENTERS("LIST_ITEM_SET_DP1",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
-          IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
-            IF(LIST%DATA_DIMENSION==1) THEN
-              ITEM=LIST%LIST_DP(LIST_ITEM)
+          IF(LIST%DATA_DIMENSION==1) THEN
+            IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
+              IF(LIST%MUTABLE) THEN
+                LIST%LIST_DP(LIST_ITEM)=ITEM
+              ELSE
+                CALL FlagError("Cannot modify an immutable list.",ERR,ERROR,*999)
+              ENDIF
             ELSE
-              LOCAL_ERROR="Invalid item dimension. The specified item has dimension 1 and the list is of dimension "// &
-                & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))
+              LOCAL_ERROR="Invalid list index. The supplied index is "//&
+                & TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))//" and that list entry count is"//&
+                & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
               CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
             ENDIF
           ELSE
-            LOCAL_ERROR="The specified list item position of "//TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))// &
-              & " is invalid. The list item position must be > 0 and <= "// &
-              & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
+            LOCAL_ERROR="Invalid data dimension. The supplied data dimension is 1 and the list data dimension is "// &
+              & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
             CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
           ENDIF
         ELSE
@@ -1838,45 +2003,100 @@ CONTAINS
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
         ENDIF
       ELSE
-        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+        CALL FlagError("The list has not been finished.",ERR,ERROR,*999)
       ENDIF
     ELSE
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
+    EXITS("LIST_ITEM_SET_DP1")
+    RETURN
+999 ERRORSEXITS("LIST_ITEM_SET_DP1",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_ITEM_SET_DP1
+  
+  !
+  !================================================================================================================================
+  !
 
-    EXITS("LIST_ITEM_GET_DP1")
+  !>Sets an item in a double precision real list of data dimension > 1.
+  SUBROUTINE LIST_ITEM_SET_DP2(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
+    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The index of the item to set.
+    REAL(DP), INTENT(IN) :: ITEM(:) !<The item to set
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("LIST_ITEM_SET_DP2",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(LIST%LIST_FINISHED) THEN
+        IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
+          IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
+            IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
+              IF(LIST%MUTABLE) THEN
+                LIST%LIST_DP2(:,LIST_ITEM)=ITEM
+              ELSE
+                CALL FlagError("Cannot modify an immutable list.",ERR,ERROR,*999)
+              ENDIF
+            ELSE
+              LOCAL_ERROR="Invalid list index. The supplied index is "//&
+                & TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))//" and that list entry count is"//&
+                & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            ENDIF
+          ELSE
+            LOCAL_ERROR="Invalid data dimension. The supplied data dimension is "// &
+              & TRIM(NumberToVString(SIZE(ITEM,1),"*",ERR,ERROR))//" and the list data dimension is "// &
+              & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          ENDIF
+        ELSE
+          LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
+            & " does not match the double precision type of the supplied list item."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("The list has not been finished.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+    EXITS("LIST_ITEM_SET_DP2")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_GET_DP1",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_SET_DP2",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_GET_DP1
+  END SUBROUTINE LIST_ITEM_SET_DP2
   
   !
   !================================================================================================================================
   !
 
-  !>Returns the ITEM in a list at position LIST_ITEM in the given double precision LIST. 
-  SUBROUTINE LIST_ITEM_GET_DP2(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
+  !>Returns the ITEM in a list at position LIST_ITEM in the given integer LIST. 
+  SUBROUTINE LIST_ITEM_GET_INTG1(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
 
     !Argument Variables
     TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
     INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The position of the item to get
-    REAL(DP), INTENT(OUT) :: ITEM(:) !<On exit, the item at the specified position
+    INTEGER(INTG), INTENT(OUT) :: ITEM !<On exit, the item at the specified position
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
     !Local Variables
     TYPE(VARYING_STRING) :: LOCAL_ERROR
     
-    ENTERS("LIST_ITEM_GET_DP2",ERR,ERROR,*999)
+    ENTERS("LIST_ITEM_GET_INTG1",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
-        IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
+        IF(LIST%DATA_TYPE==LIST_INTG_TYPE) THEN
           IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
-            IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
-              ITEM=LIST%LIST_DP2(:,LIST_ITEM)
+            IF(LIST%DATA_DIMENSION==1) THEN
+              ITEM=LIST%LIST_INTG(LIST_ITEM)
             ELSE
-              LOCAL_ERROR="Invalid item dimension. The specified item has dimension "// &
-                & TRIM(NumberToVString(SIZE(ITEM,1),"*",ERR,ERROR))//" and the list is of dimension "// &
+              LOCAL_ERROR="Invalid item dimension. The specified item has dimension 1 and the list is of dimension "// &
                 & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))
               CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
             ENDIF
@@ -1888,7 +2108,7 @@ CONTAINS
           ENDIF
         ELSE
           LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
-            & " does not match the double precision type of the supplied list item."
+            & " does not match the integer type of the supplied list item."
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
         ENDIF
       ELSE
@@ -1898,38 +2118,47 @@ CONTAINS
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
 
-    EXITS("LIST_ITEM_GET_DP2")
+    EXITS("LIST_ITEM_GET_INTG1")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_GET_DP2",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_GET_INTG1",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_GET_DP2
+  END SUBROUTINE LIST_ITEM_GET_INTG1
   
   !
   !================================================================================================================================
   !
 
-  !>Determines if ITEM is in the given integer LIST. If it is LIST_ITEM is the index in the list. If not LIST_ITEM is 0.
-  SUBROUTINE LIST_ITEM_IN_LIST_INTG1(LIST,ITEM,LIST_ITEM,ERR,ERROR,*)
+  !>Returns the ITEM in a list at position LIST_ITEM in the given integer LIST. 
+  SUBROUTINE LIST_ITEM_GET_INTG2(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
 
     !Argument Variables
     TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
-    INTEGER(INTG), INTENT(IN) :: ITEM !<The item to find.
-    INTEGER(INTG), INTENT(OUT) :: LIST_ITEM !<On exit, the position of the item in the list. If the item does not exist then the value of 0 is returned.
+    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The position of the item to get
+    INTEGER(INTG), INTENT(OUT) :: ITEM(:) !<On exit, the item at the specified position
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
     !Local Variables
     TYPE(VARYING_STRING) :: LOCAL_ERROR
     
-    ENTERS("LIST_ITEM_IN_LIST_INTG1",ERR,ERROR,*999)
+    ENTERS("LIST_ITEM_GET_INTG2",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_INTG_TYPE) THEN
-!!TODO: Could search better but requires list to be sorted.
-          IF(LIST%DATA_DIMENSION==1) THEN
-            CALL LIST_SEARCH_LINEAR(LIST%LIST_INTG(1:LIST%NUMBER_IN_LIST),ITEM,LIST_ITEM,ERR,ERROR,*999)
+          IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
+            IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
+              ITEM=LIST%LIST_INTG2(:,LIST_ITEM)
+            ELSE
+              LOCAL_ERROR="Invalid item dimension. The specified item has dimension "// &
+                & TRIM(NumberToVString(SIZE(ITEM,1),"*",ERR,ERROR))//" and the list is of dimension "// &
+                & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            ENDIF
           ELSE
-            CALL LIST_SEARCH_LINEAR(LIST%LIST_INTG2(LIST%KEY_DIMENSION,1:LIST%NUMBER_IN_LIST),ITEM,LIST_ITEM,ERR,ERROR,*999)
+            LOCAL_ERROR="The specified list item position of "//TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))// &
+              & " is invalid. The list item position must be > 0 and <= "// &
+              & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
           ENDIF
         ELSE
           LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
@@ -1943,43 +2172,50 @@ CONTAINS
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
 
-    EXITS("LIST_ITEM_IN_LIST_INTG1")
+    EXITS("LIST_ITEM_GET_INTG2")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_IN_LIST_INTG1",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_GET_INTG2",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_IN_LIST_INTG1
+  END SUBROUTINE LIST_ITEM_GET_INTG2
   
   !
   !================================================================================================================================
   !
 
-  !>Determines if ITEM is in the given integer LIST. If it is LIST_ITEM is the index in the list. If not LIST_ITEM is 0.
-  SUBROUTINE LIST_ITEM_IN_LIST_INTG2(LIST,ITEM,LIST_ITEM,ERR,ERROR,*)
+  !>Returns the ITEM in a list at position LIST_ITEM in the given single precision LIST. 
+  SUBROUTINE LIST_ITEM_GET_SP1(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
 
     !Argument Variables
     TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
-    INTEGER(INTG), INTENT(IN) :: ITEM(:) !<The item to find.
-    INTEGER(INTG), INTENT(OUT) :: LIST_ITEM !<On exit, the position of the item in the list. If the item does not exist then the value of 0 is returned.
+    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The position of the item to get
+    REAL(SP), INTENT(OUT) :: ITEM !<On exit, the item at the specified position.
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
     !Local Variables
     TYPE(VARYING_STRING) :: LOCAL_ERROR
     
-    ENTERS("LIST_ITEM_IN_LIST_INTG2",ERR,ERROR,*999)
+    ENTERS("LIST_ITEM_GET_SP1",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
-        IF(LIST%DATA_TYPE==LIST_INTG_TYPE) THEN
-!!TODO: Could search better but requires list to be sorted.
-          IF(LIST%DATA_DIMENSION==1) THEN
-            CALL LIST_SEARCH_LINEAR(LIST%LIST_INTG(1:LIST%NUMBER_IN_LIST),ITEM(LIST%KEY_DIMENSION),LIST_ITEM,ERR,ERROR,*999)
+        IF(LIST%DATA_TYPE==LIST_SP_TYPE) THEN
+          IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
+            IF(LIST%DATA_DIMENSION==1) THEN
+              ITEM=LIST%LIST_SP(LIST_ITEM)
+            ELSE
+              LOCAL_ERROR="Invalid item dimension. The specified item has dimension 1 and the list is of dimension "// &
+                & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            ENDIF
           ELSE
-            CALL LIST_SEARCH_LINEAR(LIST%LIST_INTG2(LIST%KEY_DIMENSION,1:LIST%NUMBER_IN_LIST),ITEM(LIST%KEY_DIMENSION), &
-              & LIST_ITEM,ERR,ERROR,*999)
+            LOCAL_ERROR="The specified list item position of "//TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))// &
+              & " is invalid. The list item position must be > 0 and <= "// &
+              & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
           ENDIF
         ELSE
           LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
-            & " does not match the integer type of the supplied list item."
+            & " does not match the single precision type of the supplied list item."
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
         ENDIF
       ELSE
@@ -1989,39 +2225,47 @@ CONTAINS
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
 
-    EXITS("LIST_ITEM_IN_LIST_INTG2")
+    EXITS("LIST_ITEM_GET_SP1")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_IN_LIST_INTG2",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_GET_SP1",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_IN_LIST_INTG2
+  END SUBROUTINE LIST_ITEM_GET_SP1
   
   !
   !================================================================================================================================
   !
 
-  !> Determines if ITEM is in the given single precision real LIST. If it is LIST_ITEM is the index in the list. If not
-  !> LIST_ITEM is 0.
-  SUBROUTINE LIST_ITEM_IN_LIST_SP1(LIST,ITEM,LIST_ITEM,ERR,ERROR,*)
+  !>Returns the ITEM in a list at position LIST_ITEM in the given single precision LIST. 
+  SUBROUTINE LIST_ITEM_GET_SP2(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
 
-    !Argument Variables    
+    !Argument Variables
     TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
-    REAL(SP), INTENT(IN) :: ITEM !<The item to find.
-    INTEGER(INTG), INTENT(OUT) :: LIST_ITEM !<On exit, the position of the item in the list. If the item does not exist then the value of 0 is returned.     
-    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code    
-    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The position of the item to get
+    REAL(SP), INTENT(OUT) :: ITEM(:) !<On exit, the item at the specified position
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
     !Local Variables
     TYPE(VARYING_STRING) :: LOCAL_ERROR
     
-    ENTERS("LIST_ITEM_IN_LIST_SP1",ERR,ERROR,*999)
+    ENTERS("LIST_ITEM_GET_SP2",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%DATA_TYPE==LIST_SP_TYPE) THEN
-!!TODO: Could search better but requires list to be sorted.
-          IF(LIST%DATA_DIMENSION==1) THEN
-            CALL LIST_SEARCH_LINEAR(LIST%LIST_SP(1:LIST%NUMBER_IN_LIST),ITEM,LIST_ITEM,ERR,ERROR,*999)
+          IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
+            IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
+              ITEM=LIST%LIST_SP2(:,LIST_ITEM)
+            ELSE
+              LOCAL_ERROR="Invalid item dimension. The specified item has dimension "// &
+                & TRIM(NumberToVString(SIZE(ITEM,1),"*",ERR,ERROR))//" and the list is of dimension "// &
+                & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            ENDIF
           ELSE
-            CALL LIST_SEARCH_LINEAR(LIST%LIST_SP2(lIST%KEY_DIMENSION,1:LIST%NUMBER_IN_LIST),ITEM,LIST_ITEM,ERR,ERROR,*999)
+            LOCAL_ERROR="The specified list item position of "//TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))// &
+              & " is invalid. The list item position must be > 0 and <= "// &
+              & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
           ENDIF
         ELSE
           LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
@@ -2035,42 +2279,379 @@ CONTAINS
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
 
-    EXITS("LIST_ITEM_IN_LIST_SP1")
+    EXITS("LIST_ITEM_GET_SP2")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_IN_LIST_SP1",ERR,ERROR)
+999 ERRORSEXITS("LIST_ITEM_GET_SP2",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_IN_LIST_SP1
+  END SUBROUTINE LIST_ITEM_GET_SP2
   
   !
   !================================================================================================================================
   !
 
-  !> Determines if ITEM is in the given single precision real LIST. If it is LIST_ITEM is the index in the list. If not
-  !> LIST_ITEM is 0.
-  SUBROUTINE LIST_ITEM_IN_LIST_SP2(LIST,ITEM,LIST_ITEM,ERR,ERROR,*)
+  !>Returns the ITEM in a list at position LIST_ITEM in the given double precision LIST. 
+  SUBROUTINE LIST_ITEM_GET_DP1(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
 
-    !Argument Variables    
+    !Argument Variables
     TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
-    REAL(SP), INTENT(IN) :: ITEM(:) !<The item to find.
-    INTEGER(INTG), INTENT(OUT) :: LIST_ITEM !<On exit, the position of the item in the list. If the item does not exist then the value of 0 is returned.     
-    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code    
-    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The position of the item to get
+    REAL(DP), INTENT(OUT) :: ITEM !<On exit, the item at the specified position.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
     !Local Variables
     TYPE(VARYING_STRING) :: LOCAL_ERROR
     
-    ENTERS("LIST_ITEM_IN_LIST_SP2",ERR,ERROR,*999)
+    ENTERS("LIST_ITEM_GET_DP1",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
-        IF(LIST%DATA_TYPE==LIST_SP_TYPE) THEN
-!!TODO: Could search better but requires list to be sorted.
-          IF(LIST%DATA_DIMENSION==1) THEN
-            CALL LIST_SEARCH_LINEAR(LIST%LIST_SP(1:LIST%NUMBER_IN_LIST),ITEM(LIST%KEY_DIMENSION),LIST_ITEM,ERR,ERROR,*999)
+        IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
+          IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
+            IF(LIST%DATA_DIMENSION==1) THEN
+              ITEM=LIST%LIST_DP(LIST_ITEM)
+            ELSE
+              LOCAL_ERROR="Invalid item dimension. The specified item has dimension 1 and the list is of dimension "// &
+                & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            ENDIF
           ELSE
-            CALL LIST_SEARCH_LINEAR(LIST%LIST_SP2(lIST%KEY_DIMENSION,1:LIST%NUMBER_IN_LIST),ITEM(LIST%KEY_DIMENSION), &
-              & LIST_ITEM,ERR,ERROR,*999)
-          ENDIF
-        ELSE
+            LOCAL_ERROR="The specified list item position of "//TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))// &
+              & " is invalid. The list item position must be > 0 and <= "// &
+              & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          ENDIF
+        ELSE
+          LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
+            & " does not match the double precision type of the supplied list item."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_ITEM_GET_DP1")
+    RETURN
+999 ERRORSEXITS("LIST_ITEM_GET_DP1",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_ITEM_GET_DP1
+  
+  !
+  !================================================================================================================================
+  !
+
+  !>Returns the ITEM in a list at position LIST_ITEM in the given double precision LIST. 
+  SUBROUTINE LIST_ITEM_GET_DP2(LIST,LIST_ITEM,ITEM,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
+    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The position of the item to get
+    REAL(DP), INTENT(OUT) :: ITEM(:) !<On exit, the item at the specified position
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+    
+    ENTERS("LIST_ITEM_GET_DP2",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(LIST%LIST_FINISHED) THEN
+        IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
+          IF(LIST_ITEM>0.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
+            IF(LIST%DATA_DIMENSION==SIZE(ITEM,1)) THEN
+              ITEM=LIST%LIST_DP2(:,LIST_ITEM)
+            ELSE
+              LOCAL_ERROR="Invalid item dimension. The specified item has dimension "// &
+                & TRIM(NumberToVString(SIZE(ITEM,1),"*",ERR,ERROR))//" and the list is of dimension "// &
+                & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            ENDIF
+          ELSE
+            LOCAL_ERROR="The specified list item position of "//TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))// &
+              & " is invalid. The list item position must be > 0 and <= "// &
+              & TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          ENDIF
+        ELSE
+          LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
+            & " does not match the double precision type of the supplied list item."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_ITEM_GET_DP2")
+    RETURN
+999 ERRORSEXITS("LIST_ITEM_GET_DP2",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_ITEM_GET_DP2
+  
+  !
+  !================================================================================================================================
+  !
+
+  !>Determines if ITEM is in the given integer LIST. If it is LIST_ITEM is the index in the list. If not LIST_ITEM is 0.
+  SUBROUTINE LIST_ITEM_IN_LIST_INTG1(LIST,ITEM,LIST_ITEM,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
+    INTEGER(INTG), INTENT(IN) :: ITEM !<The item to find.
+    INTEGER(INTG), INTENT(OUT) :: LIST_ITEM !<On exit, the position of the item in the list. If the item does not exist then the value of 0 is returned.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+    
+    ENTERS("LIST_ITEM_IN_LIST_INTG1",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(LIST%LIST_FINISHED) THEN
+        IF(LIST%DATA_TYPE==LIST_INTG_TYPE) THEN
+!!TODO: Could search better but requires list to be sorted.
+          IF(LIST%DATA_DIMENSION==1) THEN
+            CALL LIST_SEARCH_LINEAR(LIST%LIST_INTG(1:LIST%NUMBER_IN_LIST),ITEM,LIST_ITEM,ERR,ERROR,*999)
+          ELSE
+            CALL LIST_SEARCH_LINEAR(LIST%LIST_INTG2(LIST%KEY_DIMENSION,1:LIST%NUMBER_IN_LIST),ITEM,LIST_ITEM,ERR,ERROR,*999)
+          ENDIF
+        ELSE
+          LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
+            & " does not match the integer type of the supplied list item."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_ITEM_IN_LIST_INTG1")
+    RETURN
+999 ERRORSEXITS("LIST_ITEM_IN_LIST_INTG1",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_ITEM_IN_LIST_INTG1
+  
+  !
+  !================================================================================================================================
+  !
+
+  !>Determines if ITEM is in the given integer LIST. If it is LIST_ITEM is the index in the list. If not LIST_ITEM is 0.
+  SUBROUTINE LIST_ITEM_IN_LIST_INTG2(LIST,ITEM,LIST_ITEM,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
+    INTEGER(INTG), INTENT(IN) :: ITEM(:) !<The item to find.
+    INTEGER(INTG), INTENT(OUT) :: LIST_ITEM !<On exit, the position of the item in the list. If the item does not exist then the value of 0 is returned.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string.
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+    
+    ENTERS("LIST_ITEM_IN_LIST_INTG2",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(LIST%LIST_FINISHED) THEN
+        IF(LIST%DATA_TYPE==LIST_INTG_TYPE) THEN
+!!TODO: Could search better but requires list to be sorted.
+          IF(LIST%DATA_DIMENSION==1) THEN
+            CALL LIST_SEARCH_LINEAR(LIST%LIST_INTG(1:LIST%NUMBER_IN_LIST),ITEM(LIST%KEY_DIMENSION),LIST_ITEM,ERR,ERROR,*999)
+          ELSE
+            CALL LIST_SEARCH_LINEAR(LIST%LIST_INTG2(LIST%KEY_DIMENSION,1:LIST%NUMBER_IN_LIST),ITEM(LIST%KEY_DIMENSION), &
+              & LIST_ITEM,ERR,ERROR,*999)
+          ENDIF
+        ELSE
+          LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
+            & " does not match the integer type of the supplied list item."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_ITEM_IN_LIST_INTG2")
+    RETURN
+999 ERRORSEXITS("LIST_ITEM_IN_LIST_INTG2",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_ITEM_IN_LIST_INTG2
+  
+  !
+  !================================================================================================================================
+  !
+
+  !> Determines if ITEM is in the given single precision real LIST. If it is LIST_ITEM is the index in the list. If not
+  !> LIST_ITEM is 0.
+  SUBROUTINE LIST_ITEM_IN_LIST_SP1(LIST,ITEM,LIST_ITEM,ERR,ERROR,*)
+
+    !Argument Variables    
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
+    REAL(SP), INTENT(IN) :: ITEM !<The item to find.
+    INTEGER(INTG), INTENT(OUT) :: LIST_ITEM !<On exit, the position of the item in the list. If the item does not exist then the value of 0 is returned.     
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code    
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+    
+    ENTERS("LIST_ITEM_IN_LIST_SP1",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(LIST%LIST_FINISHED) THEN
+        IF(LIST%DATA_TYPE==LIST_SP_TYPE) THEN
+!!TODO: Could search better but requires list to be sorted.
+          IF(LIST%DATA_DIMENSION==1) THEN
+            CALL LIST_SEARCH_LINEAR(LIST%LIST_SP(1:LIST%NUMBER_IN_LIST),ITEM,LIST_ITEM,ERR,ERROR,*999)
+          ELSE
+            CALL LIST_SEARCH_LINEAR(LIST%LIST_SP2(lIST%KEY_DIMENSION,1:LIST%NUMBER_IN_LIST),ITEM,LIST_ITEM,ERR,ERROR,*999)
+          ENDIF
+        ELSE
+          LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
+            & " does not match the single precision type of the supplied list item."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_ITEM_IN_LIST_SP1")
+    RETURN
+999 ERRORSEXITS("LIST_ITEM_IN_LIST_SP1",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_ITEM_IN_LIST_SP1
+  
+  !
+  !================================================================================================================================
+  !
+
+  !> Determines if ITEM is in the given single precision real LIST. If it is LIST_ITEM is the index in the list. If not
+  !> LIST_ITEM is 0.
+  SUBROUTINE LIST_ITEM_IN_LIST_SP2(LIST,ITEM,LIST_ITEM,ERR,ERROR,*)
+
+    !Argument Variables    
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
+    REAL(SP), INTENT(IN) :: ITEM(:) !<The item to find.
+    INTEGER(INTG), INTENT(OUT) :: LIST_ITEM !<On exit, the position of the item in the list. If the item does not exist then the value of 0 is returned.     
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code    
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+    
+    ENTERS("LIST_ITEM_IN_LIST_SP2",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(LIST%LIST_FINISHED) THEN
+        IF(LIST%DATA_TYPE==LIST_SP_TYPE) THEN
+!!TODO: Could search better but requires list to be sorted.
+          IF(LIST%DATA_DIMENSION==1) THEN
+            CALL LIST_SEARCH_LINEAR(LIST%LIST_SP(1:LIST%NUMBER_IN_LIST),ITEM(LIST%KEY_DIMENSION),LIST_ITEM,ERR,ERROR,*999)
+          ELSE
+            CALL LIST_SEARCH_LINEAR(LIST%LIST_SP2(lIST%KEY_DIMENSION,1:LIST%NUMBER_IN_LIST),ITEM(LIST%KEY_DIMENSION), &
+              & LIST_ITEM,ERR,ERROR,*999)
+          ENDIF
+        ELSE
+          LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
+            & " does not match the single precision type of the supplied list item."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_ITEM_IN_LIST_SP2")
+    RETURN
+999 ERRORSEXITS("LIST_ITEM_IN_LIST_SP2",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_ITEM_IN_LIST_SP2
+  
+  !
+  !================================================================================================================================
+  !
+
+  !> Determines if ITEM is in the given double precision real LIST. If it is LIST_ITEM is the index in the list. If not
+  !> LIST_ITEM is 0.
+  SUBROUTINE LIST_ITEM_IN_LIST_DP1(LIST,ITEM,LIST_ITEM,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
+    REAL(DP), INTENT(IN) :: ITEM  !<The item to find.
+    INTEGER(INTG), INTENT(OUT) :: LIST_ITEM !<On exit, the position of the item in the list. If the item does not exist then the value of 0 is returned.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+    
+    ENTERS("LIST_ITEM_IN_LIST_DP1",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(LIST%LIST_FINISHED) THEN
+        IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
+!!TODO: Could search better but requires list to be sorted.
+          IF(LIST%DATA_DIMENSION==1) THEN
+            CALL LIST_SEARCH_LINEAR(LIST%LIST_DP(1:LIST%NUMBER_IN_LIST),ITEM,LIST_ITEM,ERR,ERROR,*999)
+          ELSE
+            CALL LIST_SEARCH_LINEAR(LIST%LIST_DP2(LIST%KEY_DIMENSION,1:LIST%NUMBER_IN_LIST),ITEM,LIST_ITEM,ERR,ERROR,*999)
+         ENDIF
+        ELSE
+          LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
+            & " does not match the single precision type of the supplied list item."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_ITEM_IN_LIST_DP1")
+    RETURN
+999 ERRORSEXITS("LIST_ITEM_IN_LIST_DP1",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_ITEM_IN_LIST_DP1
+
+  !
+  !================================================================================================================================
+  !
+
+  !> Determines if ITEM is in the given double precision real LIST. If it is LIST_ITEM is the index in the list. If not
+  !> LIST_ITEM is 0.
+  SUBROUTINE LIST_ITEM_IN_LIST_DP2(LIST,ITEM,LIST_ITEM,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
+    REAL(DP), INTENT(IN) :: ITEM(:)  !<The item to find.
+    INTEGER(INTG), INTENT(OUT) :: LIST_ITEM !<On exit, the position of the item in the list. If the item does not exist then the value of 0 is returned.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+    
+    ENTERS("LIST_ITEM_IN_LIST_DP2",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(LIST%LIST_FINISHED) THEN
+        IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
+!!TODO: Could search better but requires list to be sorted.
+          IF(LIST%DATA_DIMENSION==1) THEN
+            CALL LIST_SEARCH_LINEAR(LIST%LIST_DP(1:LIST%NUMBER_IN_LIST),ITEM(LIST%KEY_DIMENSION),LIST_ITEM,ERR,ERROR,*999)
+          ELSE
+            CALL LIST_SEARCH_LINEAR(LIST%LIST_DP2(LIST%KEY_DIMENSION,1:LIST%NUMBER_IN_LIST),ITEM(LIST%KEY_DIMENSION), &
+              & LIST_ITEM,ERR,ERROR,*999)
+         ENDIF
+        ELSE
           LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
             & " does not match the single precision type of the supplied list item."
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
@@ -2081,45 +2662,246 @@ CONTAINS
     ELSE
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
-
-    EXITS("LIST_ITEM_IN_LIST_SP2")
+
+    EXITS("LIST_ITEM_IN_LIST_DP2")
+    RETURN
+999 ERRORSEXITS("LIST_ITEM_IN_LIST_DP2",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_ITEM_IN_LIST_DP2
+
+  !
+  !================================================================================================================================
+  !
+  
+  !>Deletes the item given by the LIST_ITEM index from the given list.
+  SUBROUTINE LIST_ITEM_DELETE(LIST,LIST_ITEM,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
+    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The position in the list to delete.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("LIST_ITEM_DELETE",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(LIST%LIST_FINISHED) THEN
+        IF(LIST_ITEM>=1.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
+          IF(LIST%DATA_DIMENSION==1) THEN
+            SELECT CASE(LIST%DATA_TYPE)
+            CASE(LIST_INTG_TYPE)
+              LIST%LIST_INTG(1:LIST_ITEM-1)=LIST%LIST_INTG(1:LIST_ITEM-1)
+              LIST%LIST_INTG(LIST_ITEM:LIST%NUMBER_IN_LIST-1)=LIST%LIST_INTG(LIST_ITEM+1:LIST%NUMBER_IN_LIST)
+            CASE(LIST_SP_TYPE)
+              LIST%LIST_SP(1:LIST_ITEM-1)=LIST%LIST_SP(1:LIST_ITEM-1)
+              LIST%LIST_SP(LIST_ITEM:LIST%NUMBER_IN_LIST-1)=LIST%LIST_SP(LIST_ITEM+1:LIST%NUMBER_IN_LIST)
+            CASE(LIST_DP_TYPE)
+              LIST%LIST_DP(1:LIST_ITEM-1)=LIST%LIST_DP(1:LIST_ITEM-1)
+              LIST%LIST_DP(LIST_ITEM:LIST%NUMBER_IN_LIST-1)=LIST%LIST_DP(LIST_ITEM+1:LIST%NUMBER_IN_LIST)
+            CASE DEFAULT
+              LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))//" is invalid."
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            END SELECT
+          ELSE
+            SELECT CASE(LIST%DATA_TYPE)
+            CASE(LIST_INTG_TYPE)
+              LIST%LIST_INTG2(:,1:LIST_ITEM-1)=LIST%LIST_INTG2(:,1:LIST_ITEM-1)
+              LIST%LIST_INTG2(:,LIST_ITEM:LIST%NUMBER_IN_LIST-1)=LIST%LIST_INTG2(:,LIST_ITEM+1:LIST%NUMBER_IN_LIST)
+            CASE(LIST_SP_TYPE)
+              LIST%LIST_SP2(:,1:LIST_ITEM-1)=LIST%LIST_SP2(:,1:LIST_ITEM-1)
+              LIST%LIST_SP2(:,LIST_ITEM:LIST%NUMBER_IN_LIST-1)=LIST%LIST_SP2(:,LIST_ITEM+1:LIST%NUMBER_IN_LIST)
+            CASE(LIST_DP_TYPE)
+              LIST%LIST_DP2(:,1:LIST_ITEM-1)=LIST%LIST_DP2(:,1:LIST_ITEM-1)
+              LIST%LIST_DP2(:,LIST_ITEM:LIST%NUMBER_IN_LIST-1)=LIST%LIST_DP2(:,LIST_ITEM+1:LIST%NUMBER_IN_LIST)
+            CASE DEFAULT
+              LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))//" is invalid."
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            END SELECT
+          ENDIF
+          LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST-1
+        ELSE
+          LOCAL_ERROR="The specified list item of "//TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))// &
+            & " is invalid. The item must be >= 1 and <= "//TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_ITEM_DELETE")
+    RETURN
+999 ERRORSEXITS("LIST_ITEM_DELETE",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_ITEM_DELETE
+  
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the key dimension (i.e., the dimension for searching and sorting) for a list
+  SUBROUTINE LIST_KEY_DIMENSION_SET(LIST,KEY_DIMENSION,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
+    INTEGER(INTG), INTENT(IN) :: KEY_DIMENSION !<The key dimension to set. Must be greater than zero and <= the data dimension.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("LIST_KEY_DIMENSION_SET",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(KEY_DIMENSION>0.AND.KEY_DIMENSION<=LIST%DATA_DIMENSION) THEN
+        LIST%KEY_DIMENSION=KEY_DIMENSION
+      ELSE
+        LOCAL_ERROR="The specified key dimension of "//TRIM(NumberToVString(KEY_DIMENSION,"*",ERR,ERROR))// &
+          & " is invalid. The key dimension must be > 0 and <= "// &
+          & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_KEY_DIMENSION_SET")
+    RETURN
+999 ERRORSEXITS("LIST_KEY_DIMENSION_SET",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_KEY_DIMENSION_SET
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Gets the current number of items in a list
+  SUBROUTINE LIST_NUMBER_OF_ITEMS_GET(LIST,NUMBER_OF_ITEMS,ERR,ERROR,*)
+      
+    !Argument variables
+    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list 
+    INTEGER(INTG), INTENT(OUT) :: NUMBER_OF_ITEMS !<On exit, the current number of items in the list
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+    
+    ENTERS("LIST_NUMBER_OF_ITEMS_GET",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(LIST%LIST_FINISHED) THEN
+        NUMBER_OF_ITEMS=LIST%NUMBER_IN_LIST
+      ELSE
+        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+    
+    EXITS("LIST_NUMBER_OF_ITEMS_GET")
+    RETURN
+999 ERRORSEXITS("LIST_NUMBER_OF_ITEMS_GET",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_NUMBER_OF_ITEMS_GET
+  
+  !
+  !================================================================================================================================
+  !
+
+  !>Detaches the list values from an integer list of data dimension 1 and returns them as an array of base type without
+  !>copying them. The list is left empty and can continue to be used. The LIST_VALUES array must not be allocated on entry.
+  !>It is up to the user to then deallocate the returned list memory.
+  SUBROUTINE LIST_DETACH_INTG1(LIST,NUMBER_IN_LIST,LIST_VALUES,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(INOUT) :: LIST !<The pointer to the list
+    INTEGER(INTG), INTENT(OUT) :: NUMBER_IN_LIST !<On exit, the number in the list that has been detached.
+    INTEGER(INTG), ALLOCATABLE, INTENT(INOUT) :: LIST_VALUES(:) !<On exit, the detached list. Must not be allocated on entry.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("LIST_DETACH_INTG1",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(LIST)) THEN
+      IF(LIST%LIST_FINISHED) THEN
+        IF(ALLOCATED(LIST_VALUES)) THEN
+          CALL FlagError("List values is allocated.",ERR,ERROR,*999)
+        ELSE
+          IF(LIST%DATA_TYPE==LIST_INTG_TYPE) THEN
+            IF(LIST%DATA_DIMENSION==1) THEN
+              NUMBER_IN_LIST=LIST%NUMBER_IN_LIST
+              CALL MOVE_ALLOC(LIST%LIST_INTG,LIST_VALUES)
+              LIST%NUMBER_IN_LIST=0
+              LIST%SIZE=0
+            ELSE
+              LOCAL_ERROR="Invalid data dimension. The supplied data dimension is 1 and the list data dimension is "// &
+                & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            ENDIF
+          ELSE
+            LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
+              & " does not match the integer type of the supplied list values item."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          ENDIF
+        ENDIF
+      ELSE
+        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("List is not associated.",ERR,ERROR,*999)
+    ENDIF
+    
+    EXITS("LIST_DETACH_INTG1")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_IN_LIST_SP2",ERR,ERROR)
+999 ERRORSEXITS("LIST_DETACH_INTG1",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_IN_LIST_SP2
-  
+  END SUBROUTINE LIST_DETACH_INTG1
+
   !
   !================================================================================================================================
   !
 
-  !> Determines if ITEM is in the given double precision real LIST. If it is LIST_ITEM is the index in the list. If not
-  !> LIST_ITEM is 0.
-  SUBROUTINE LIST_ITEM_IN_LIST_DP1(LIST,ITEM,LIST_ITEM,ERR,ERROR,*)
+  !>Detaches the list values from an integer list of data dimension > 1 and returns them as an array of base type without
+  !>copying them. The list is left empty and can continue to be used. The LIST_VALUES array must not be allocated on entry.
+  !>It is up to the user to then deallocate the returned list memory.
+  SUBROUTINE LIST_DETACH_INTG2(LIST,NUMBER_IN_LIST,LIST_VALUES,ERR,ERROR,*)
 
     !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
-    REAL(DP), INTENT(IN) :: ITEM  !<The item to find.
-    INTEGER(INTG), INTENT(OUT) :: LIST_ITEM !<On exit, the position of the item in the list. If the item does not exist then the value of 0 is returned.
+    TYPE(LIST_TYPE), POINTER, INTENT(INOUT) :: LIST !<The pointer to the list
+    INTEGER(INTG), INTENT(OUT) :: NUMBER_IN_LIST !<On exit, the number in the list that has been detached.
+    INTEGER(INTG), ALLOCATABLE, INTENT(INOUT) :: LIST_VALUES(:,:) !<On exit, the detached list. Must not be allocated on entry.
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
     TYPE(VARYING_STRING) :: LOCAL_ERROR
-    
-    ENTERS("LIST_ITEM_IN_LIST_DP1",ERR,ERROR,*999)
+
+    ENTERS("LIST_DETACH_INTG2",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
-        IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
-!!TODO: Could search better but requires list to be sorted.
-          IF(LIST%DATA_DIMENSION==1) THEN
-            CALL LIST_SEARCH_LINEAR(LIST%LIST_DP(1:LIST%NUMBER_IN_LIST),ITEM,LIST_ITEM,ERR,ERROR,*999)
-          ELSE
-            CALL LIST_SEARCH_LINEAR(LIST%LIST_DP2(LIST%KEY_DIMENSION,1:LIST%NUMBER_IN_LIST),ITEM,LIST_ITEM,ERR,ERROR,*999)
-         ENDIF
+        IF(ALLOCATED(LIST_VALUES)) THEN
+          CALL FlagError("List values is allocated.",ERR,ERROR,*999)
         ELSE
-          LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
-            & " does not match the single precision type of the supplied list item."
-          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          IF(LIST%DATA_TYPE==LIST_INTG_TYPE) THEN
+            IF(LIST%DATA_DIMENSION>1) THEN
+              NUMBER_IN_LIST=LIST%NUMBER_IN_LIST
+              CALL MOVE_ALLOC(LIST%LIST_INTG2,LIST_VALUES)
+              LIST%NUMBER_IN_LIST=0
+              LIST%SIZE=0
+            ELSE
+              CALL FlagError("Invalid data dimension. The supplied data dimension is > 1 and the list data dimension is 1.", &
+                & ERR,ERROR,*999)
+            ENDIF
+          ELSE
+            LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
+              & " does not match the integer type of the supplied list values item."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          ENDIF
         ENDIF
       ELSE
         CALL FlagError("List has not been finished.",ERR,ERROR,*999)
@@ -2127,46 +2909,54 @@ CONTAINS
     ELSE
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
-
-    EXITS("LIST_ITEM_IN_LIST_DP1")
+    
+    EXITS("LIST_DETACH_INTG2")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_IN_LIST_DP1",ERR,ERROR)
+999 ERRORSEXITS("LIST_DETACH_INTG2",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_IN_LIST_DP1
+  END SUBROUTINE LIST_DETACH_INTG2
 
   !
   !================================================================================================================================
   !
 
-  !> Determines if ITEM is in the given double precision real LIST. If it is LIST_ITEM is the index in the list. If not
-  !> LIST_ITEM is 0.
-  SUBROUTINE LIST_ITEM_IN_LIST_DP2(LIST,ITEM,LIST_ITEM,ERR,ERROR,*)
+  !>Detaches the list values from a single precision real list of data dimension 1 and returns them as an array of base type without
+  !>copying them. The list is left empty and can continue to be used. The LIST_VALUES array must not be allocated on entry.
+  !>It is up to the user to then deallocate the returned list memory.
+  SUBROUTINE LIST_DETACH_SP1(LIST,NUMBER_IN_LIST,LIST_VALUES,ERR,ERROR,*)
 
     !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
-    REAL(DP), INTENT(IN) :: ITEM(:)  !<The item to find.
-    INTEGER(INTG), INTENT(OUT) :: LIST_ITEM !<On exit, the position of the item in the list. If the item does not exist then the value of 0 is returned.
+    TYPE(LIST_TYPE), POINTER, INTENT(INOUT) :: LIST !<The pointer to the list
+    INTEGER(INTG), INTENT(OUT) :: NUMBER_IN_LIST !<On exit, the number in the list that has been detached.
+    REAL(SP), ALLOCATABLE, INTENT(INOUT) :: LIST_VALUES(:) !<On exit, the detached list. Must not be allocated on entry.
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
     TYPE(VARYING_STRING) :: LOCAL_ERROR
-    
-    ENTERS("LIST_ITEM_IN_LIST_DP2",ERR,ERROR,*999)
+
+    ENTERS("LIST_DETACH_SP1",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
-        IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
-!!TODO: Could search better but requires list to be sorted.
-          IF(LIST%DATA_DIMENSION==1) THEN
-            CALL LIST_SEARCH_LINEAR(LIST%LIST_DP(1:LIST%NUMBER_IN_LIST),ITEM(LIST%KEY_DIMENSION),LIST_ITEM,ERR,ERROR,*999)
-          ELSE
-            CALL LIST_SEARCH_LINEAR(LIST%LIST_DP2(LIST%KEY_DIMENSION,1:LIST%NUMBER_IN_LIST),ITEM(LIST%KEY_DIMENSION), &
-              & LIST_ITEM,ERR,ERROR,*999)
-         ENDIF
+        IF(ALLOCATED(LIST_VALUES)) THEN
+          CALL FlagError("List values is allocated.",ERR,ERROR,*999)
         ELSE
-          LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
-            & " does not match the single precision type of the supplied list item."
-          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          IF(LIST%DATA_TYPE==LIST_SP_TYPE) THEN
+            IF(LIST%DATA_DIMENSION==1) THEN
+              NUMBER_IN_LIST=LIST%NUMBER_IN_LIST
+              CALL MOVE_ALLOC(LIST%LIST_SP,LIST_VALUES)
+              LIST%NUMBER_IN_LIST=0
+              LIST%SIZE=0
+            ELSE
+              LOCAL_ERROR="Invalid data dimension. The supplied data dimension is 1 and the list data dimension is "// &
+                & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            ENDIF
+          ELSE
+            LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
+              & " does not match the single precision type of the supplied list values item."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          ENDIF
         ENDIF
       ELSE
         CALL FlagError("List has not been finished.",ERR,ERROR,*999)
@@ -2174,69 +2964,53 @@ CONTAINS
     ELSE
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
-
-    EXITS("LIST_ITEM_IN_LIST_DP2")
+    
+    EXITS("LIST_DETACH_SP1")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_IN_LIST_DP2",ERR,ERROR)
+999 ERRORSEXITS("LIST_DETACH_SP1",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_IN_LIST_DP2
+  END SUBROUTINE LIST_DETACH_SP1
 
   !
   !================================================================================================================================
   !
-  
-  !>Deletes the item given by the LIST_ITEM index from the given list.
-  SUBROUTINE LIST_ITEM_DELETE(LIST,LIST_ITEM,ERR,ERROR,*)
+
+  !>Detaches the list values from a single precision real list of data dimension > 1 and returns them as an array of base type without
+  !>copying them. The list is left empty and can continue to be used. The LIST_VALUES array must not be allocated on entry.
+  !>It is up to the user to then deallocate the returned list memory.
+  SUBROUTINE LIST_DETACH_SP2(LIST,NUMBER_IN_LIST,LIST_VALUES,ERR,ERROR,*)
 
     !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<The pointer to the list
-    INTEGER(INTG), INTENT(IN) :: LIST_ITEM !<The position in the list to delete.
+    TYPE(LIST_TYPE), POINTER, INTENT(INOUT) :: LIST !<The pointer to the list
+    INTEGER(INTG), INTENT(OUT) :: NUMBER_IN_LIST !<On exit, the number in the list that has been detached.
+    REAL(SP), ALLOCATABLE, INTENT(INOUT) :: LIST_VALUES(:,:) !<On exit, the detached list. Must not be allocated on entry.
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
     TYPE(VARYING_STRING) :: LOCAL_ERROR
 
-    ENTERS("LIST_ITEM_DELETE",ERR,ERROR,*999)
+    ENTERS("LIST_DETACH_SP2",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
-        IF(LIST_ITEM>=1.AND.LIST_ITEM<=LIST%NUMBER_IN_LIST) THEN
-          IF(LIST%DATA_DIMENSION==1) THEN
-            SELECT CASE(LIST%DATA_TYPE)
-            CASE(LIST_INTG_TYPE)
-              LIST%LIST_INTG(1:LIST_ITEM-1)=LIST%LIST_INTG(1:LIST_ITEM-1)
-              LIST%LIST_INTG(LIST_ITEM:LIST%NUMBER_IN_LIST-1)=LIST%LIST_INTG(LIST_ITEM+1:LIST%NUMBER_IN_LIST)
-            CASE(LIST_SP_TYPE)
-              LIST%LIST_SP(1:LIST_ITEM-1)=LIST%LIST_SP(1:LIST_ITEM-1)
-              LIST%LIST_SP(LIST_ITEM:LIST%NUMBER_IN_LIST-1)=LIST%LIST_SP(LIST_ITEM+1:LIST%NUMBER_IN_LIST)
-            CASE(LIST_DP_TYPE)
-              LIST%LIST_DP(1:LIST_ITEM-1)=LIST%LIST_DP(1:LIST_ITEM-1)
-              LIST%LIST_DP(LIST_ITEM:LIST%NUMBER_IN_LIST-1)=LIST%LIST_DP(LIST_ITEM+1:LIST%NUMBER_IN_LIST)
-            CASE DEFAULT
-              LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))//" is invalid."
-              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
-            END SELECT
+        IF(ALLOCATED(LIST_VALUES)) THEN
+          CALL FlagError("List values is allocated.",ERR,ERROR,*999)
+        ELSE
+          IF(LIST%DATA_TYPE==LIST_SP_TYPE) THEN
+            IF(LIST%DATA_DIMENSION>1) THEN
+              NUMBER_IN_LIST=LIST%NUMBER_IN_LIST
+              CALL MOVE_ALLOC(LIST%LIST_SP2,LIST_VALUES)
+              LIST%NUMBER_IN_LIST=0
+              LIST%SIZE=0
+            ELSE
+              CALL FlagError("Invalid data dimension. The supplied data dimension is > 1 and the list data dimension is 1.", &
+                & ERR,ERROR,*999)
+            ENDIF
           ELSE
-            SELECT CASE(LIST%DATA_TYPE)
-            CASE(LIST_INTG_TYPE)
-              LIST%LIST_INTG2(:,1:LIST_ITEM-1)=LIST%LIST_INTG2(:,1:LIST_ITEM-1)
-              LIST%LIST_INTG2(:,LIST_ITEM:LIST%NUMBER_IN_LIST-1)=LIST%LIST_INTG2(:,LIST_ITEM+1:LIST%NUMBER_IN_LIST)
-            CASE(LIST_SP_TYPE)
-              LIST%LIST_SP2(:,1:LIST_ITEM-1)=LIST%LIST_SP2(:,1:LIST_ITEM-1)
-              LIST%LIST_SP2(:,LIST_ITEM:LIST%NUMBER_IN_LIST-1)=LIST%LIST_SP2(:,LIST_ITEM+1:LIST%NUMBER_IN_LIST)
-            CASE(LIST_DP_TYPE)
-              LIST%LIST_DP2(:,1:LIST_ITEM-1)=LIST%LIST_DP2(:,1:LIST_ITEM-1)
-              LIST%LIST_DP2(:,LIST_ITEM:LIST%NUMBER_IN_LIST-1)=LIST%LIST_DP2(:,LIST_ITEM+1:LIST%NUMBER_IN_LIST)
-            CASE DEFAULT
-              LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))//" is invalid."
-              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
-            END SELECT
+            LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
+              & " does not match the single precision type of the supplied list values item."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
           ENDIF
-          LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST-1
-        ELSE
-          LOCAL_ERROR="The specified list item of "//TRIM(NumberToVString(LIST_ITEM,"*",ERR,ERROR))// &
-            & " is invalid. The item must be >= 1 and <= "//TRIM(NumberToVString(LIST%NUMBER_IN_LIST,"*",ERR,ERROR))//"."
-          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
         ENDIF
       ELSE
         CALL FlagError("List has not been finished.",ERR,ERROR,*999)
@@ -2244,68 +3018,109 @@ CONTAINS
     ELSE
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
-
-    EXITS("LIST_ITEM_DELETE")
+    
+    EXITS("LIST_DETACH_SP2")
     RETURN
-999 ERRORSEXITS("LIST_ITEM_DELETE",ERR,ERROR)
+999 ERRORSEXITS("LIST_DETACH_SP2",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_ITEM_DELETE
-  
+  END SUBROUTINE LIST_DETACH_SP2
+
   !
   !================================================================================================================================
   !
 
-  !>Sets/changes the key dimension (i.e., the dimension for searching and sorting) for a list
-  SUBROUTINE LIST_KEY_DIMENSION_SET(LIST,KEY_DIMENSION,ERR,ERROR,*)
+  !>Detaches the list values from a double precision real list of data dimension 1 and returns them as an array of base type without
+  !>copying them. The list is left empty and can continue to be used. The LIST_VALUES array must not be allocated on entry.
+  !>It is up to the user to then deallocate the returned list memory.
+  SUBROUTINE LIST_DETACH_DP1(LIST,NUMBER_IN_LIST,LIST_VALUES,ERR,ERROR,*)
 
     !Argument Variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list
-    INTEGER(INTG), INTENT(IN) :: KEY_DIMENSION !<The key dimension to set. Must be greater than zero and <= the data dimension.
+    TYPE(LIST_TYPE), POINTER, INTENT(INOUT) :: LIST !<The pointer to the list
+    INTEGER(INTG), INTENT(OUT) :: NUMBER_IN_LIST !<On exit, the number in the list that has been detached.
+    REAL(DP), ALLOCATABLE, INTENT(INOUT) :: LIST_VALUES(:) !<On exit, the detached list. Must not be allocated on entry.
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
     TYPE(VARYING_STRING) :: LOCAL_ERROR
 
-    ENTERS("LIST_KEY_DIMENSION_SET",ERR,ERROR,*999)
+    ENTERS("LIST_DETACH_DP1",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
-      IF(KEY_DIMENSION>0.AND.KEY_DIMENSION<=LIST%DATA_DIMENSION) THEN
-        LIST%KEY_DIMENSION=KEY_DIMENSION
+      IF(LIST%LIST_FINISHED) THEN
+        IF(ALLOCATED(LIST_VALUES)) THEN
+          CALL FlagError("List values is allocated.",ERR,ERROR,*999)
+        ELSE
+          IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
+            IF(LIST%DATA_DIMENSION==1) THEN
+              NUMBER_IN_LIST=LIST%NUMBER_IN_LIST
+              CALL MOVE_ALLOC(LIST%LIST_DP,LIST_VALUES)
+              LIST%NUMBER_IN_LIST=0
+              LIST%SIZE=0
+            ELSE
+              LOCAL_ERROR="Invalid data dimension. The supplied data dimension is 1 and the list data dimension is "// &
+                & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            ENDIF
+          ELSE
+            LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
+              & " does not match the double precision type of the supplied list values item."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          ENDIF
+        ENDIF
       ELSE
-        LOCAL_ERROR="The specified key dimension of "//TRIM(NumberToVString(KEY_DIMENSION,"*",ERR,ERROR))// &
-          & " is invalid. The key dimension must be > 0 and <= "// &
-          & TRIM(NumberToVString(LIST%DATA_DIMENSION,"*",ERR,ERROR))//"."
-        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        CALL FlagError("List has not been finished.",ERR,ERROR,*999)
       ENDIF
     ELSE
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
-
-    EXITS("LIST_KEY_DIMENSION_SET")
+    
+    EXITS("LIST_DETACH_DP1")
     RETURN
-999 ERRORSEXITS("LIST_KEY_DIMENSION_SET",ERR,ERROR)
+999 ERRORSEXITS("LIST_DETACH_DP1",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_KEY_DIMENSION_SET
+  END SUBROUTINE LIST_DETACH_DP1
 
   !
   !================================================================================================================================
   !
 
-  !>Gets the current number of items in a list
-  SUBROUTINE LIST_NUMBER_OF_ITEMS_GET(LIST,NUMBER_OF_ITEMS,ERR,ERROR,*)
-      
-    !Argument variables
-    TYPE(LIST_TYPE), POINTER, INTENT(IN) :: LIST !<A pointer to the list 
-    INTEGER(INTG), INTENT(OUT) :: NUMBER_OF_ITEMS !<On exit, the current number of items in the list
+  !>Detaches the list values from a double precision real list of data dimension > 1 and returns them as an array of base type without
+  !>copying them. The list is left empty and can continue to be used. The LIST_VALUES array must not be allocated on entry.
+  !>It is up to the user to then deallocate the returned list memory.
+  SUBROUTINE LIST_DETACH_DP2(LIST,NUMBER_IN_LIST,LIST_VALUES,ERR,ERROR,*)
+
+    !Argument Variables
+    TYPE(LIST_TYPE), POINTER, INTENT(INOUT) :: LIST !<The pointer to the list
+    INTEGER(INTG), INTENT(OUT) :: NUMBER_IN_LIST !<On exit, the number in the list that has been detached.
+    REAL(DP), ALLOCATABLE, INTENT(INOUT) :: LIST_VALUES(:,:) !<On exit, the detached list. Must not be allocated on entry.
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
-    !Local variables
-    
-    ENTERS("LIST_NUMBER_OF_ITEMS_GET",ERR,ERROR,*999)
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("LIST_DETACH_DP2",ERR,ERROR,*999)
 
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
-        NUMBER_OF_ITEMS=LIST%NUMBER_IN_LIST
+        IF(ALLOCATED(LIST_VALUES)) THEN
+          CALL FlagError("List values is allocated.",ERR,ERROR,*999)
+        ELSE
+          IF(LIST%DATA_TYPE==LIST_DP_TYPE) THEN
+            IF(LIST%DATA_DIMENSION>1) THEN
+              NUMBER_IN_LIST=LIST%NUMBER_IN_LIST
+              CALL MOVE_ALLOC(LIST%LIST_DP2,LIST_VALUES)
+              LIST%NUMBER_IN_LIST=0
+              LIST%SIZE=0
+            ELSE
+              CALL FlagError("Invalid data dimension. The supplied data dimension is > 1 and the list data dimension is 1.", &
+                & ERR,ERROR,*999)
+            ENDIF
+          ELSE
+            LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))// &
+              & " does not match the double precision type of the supplied list values item."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          ENDIF
+        ENDIF
       ELSE
         CALL FlagError("List has not been finished.",ERR,ERROR,*999)
       ENDIF
@@ -2313,12 +3128,12 @@ CONTAINS
       CALL FlagError("List is not associated.",ERR,ERROR,*999)
     ENDIF
     
-    EXITS("LIST_NUMBER_OF_ITEMS_GET")
+    EXITS("LIST_DETACH_DP2")
     RETURN
-999 ERRORSEXITS("LIST_NUMBER_OF_ITEMS_GET",ERR,ERROR)
+999 ERRORSEXITS("LIST_DETACH_DP2",ERR,ERROR)
     RETURN 1
-  END SUBROUTINE LIST_NUMBER_OF_ITEMS_GET
-  
+  END SUBROUTINE LIST_DETACH_DP2
+
   !
   !================================================================================================================================
   !
@@ -2649,7 +3464,9 @@ CONTAINS
   !================================================================================================================================
   !
 
-  !>Removes duplicate entries from a list. A side effect of this is that the list is sorted.
+  !>Removes duplicate entries from a list. A side effect of this is that the list is sorted, unless the list is an integer list
+  !>using the hash duplicates method in which case the first occurrence of each item is kept in its original order.
+  !>\see LISTS_DuplicatesMethod
   SUBROUTINE LIST_REMOVE_DUPLICATES(LIST,ERR,ERROR,*)
 
     !Argument Variables
@@ -2657,8 +3474,7 @@ CONTAINS
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
-    INTEGER(INTG) :: i,j,NUMBER_REMOVED
-    LOGICAL :: SAME_VALUE
+    INTEGER(INTG) :: i,j,NUMBER_UNIQUE
     TYPE(VARYING_STRING) :: LOCAL_ERROR
 
     ENTERS("LIST_REMOVE_DUPLICATES",ERR,ERROR,*999)
@@ -2666,89 +3482,49 @@ CONTAINS
     IF(ASSOCIATED(LIST)) THEN
       IF(LIST%LIST_FINISHED) THEN
         IF(LIST%NUMBER_IN_LIST>0) THEN
-          IF(LIST%DATA_DIMENSION==1) THEN
+          IF(LIST%DUPLICATES_METHOD==LIST_HASH_DUPLICATES_METHOD.AND.LIST%DATA_TYPE==LIST_INTG_TYPE) THEN
+            IF(LIST%DATA_DIMENSION==1) THEN
+              CALL HashSet_RemoveDuplicates(LIST%LIST_INTG(1:LIST%NUMBER_IN_LIST),NUMBER_UNIQUE,ERR,ERROR,*999)
+            ELSE
+              CALL HashSet_RemoveDuplicates(LIST%LIST_INTG2(:,1:LIST%NUMBER_IN_LIST),LIST%KEY_DIMENSION,NUMBER_UNIQUE, &
+                & ERR,ERROR,*999)
+            ENDIF
+            LIST%NUMBER_IN_LIST=NUMBER_UNIQUE
+          ELSE IF(LIST%DATA_DIMENSION==1) THEN
             SELECT CASE(LIST%DATA_TYPE)
             CASE(LIST_INTG_TYPE)              
               CALL LIST_SORT(LIST%LIST_INTG(1:LIST%NUMBER_IN_LIST),ERR,ERROR,*999)
-              i=1
-              DO WHILE(i<=LIST%NUMBER_IN_LIST)
-                !Find the extent of duplicate values if any
-                j=i+1
-                SAME_VALUE=.TRUE.
-                DO WHILE(j<=LIST%NUMBER_IN_LIST.AND.SAME_VALUE)
-                  IF(LIST%LIST_INTG(j)==LIST%LIST_INTG(i)) THEN
-                    j=j+1
-                  ELSE
-                    SAME_VALUE=.FALSE.
-                  ENDIF
-                ENDDO !j
-                IF(j>i+1.OR.SAME_VALUE) THEN
-                  !We have duplicates so remove them
-                  IF(SAME_VALUE) THEN
-                    !Duplicates to the end of the list so just set the number in the list
-                    LIST%NUMBER_IN_LIST=i
-                  ELSE
-                    NUMBER_REMOVED=j-i-1
-                    LIST%LIST_INTG(i+1:LIST%NUMBER_IN_LIST-NUMBER_REMOVED)=LIST%LIST_INTG(j:LIST%NUMBER_IN_LIST)
-                    LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST-NUMBER_REMOVED
-                  ENDIF
+              !Compact the sorted list in one pass, keeping the first item of each run of equal values
+              j=1
+              DO i=2,LIST%NUMBER_IN_LIST
+                IF(LIST%LIST_INTG(i)/=LIST%LIST_INTG(j)) THEN
+                  j=j+1
+                  LIST%LIST_INTG(j)=LIST%LIST_INTG(i)
                 ENDIF
-                i=i+1
               ENDDO !i
+              LIST%NUMBER_IN_LIST=j
             CASE(LIST_SP_TYPE)
               CALL LIST_SORT(LIST%LIST_SP(1:LIST%NUMBER_IN_LIST),ERR,ERROR,*999)
-              i=1
-              DO WHILE(i<=LIST%NUMBER_IN_LIST)
-                !Find the extent of duplicate values if any
-                j=i+1
-                SAME_VALUE=.TRUE.
-                DO WHILE(j<=LIST%NUMBER_IN_LIST.AND.SAME_VALUE)
-                  IF(ABS(LIST%LIST_SP(j)-LIST%LIST_SP(i))<=ZERO_TOLERANCE_SP) THEN
-                    j=j+1
-                  ELSE
-                    SAME_VALUE=.FALSE.
-                  ENDIF
-                ENDDO !j
-                IF(j>i+1.OR.SAME_VALUE) THEN
-                  !We have duplicates so remove them
-                  IF(SAME_VALUE) THEN
-                    !Duplicates to the end of the list so just set the number in the list
-                    LIST%NUMBER_IN_LIST=i
-                  ELSE
-                    NUMBER_REMOVED=j-i-1
-                    LIST%LIST_SP(i+1:LIST%NUMBER_IN_LIST-NUMBER_REMOVED)=LIST%LIST_SP(j:LIST%NUMBER_IN_LIST)
-                    LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST-NUMBER_REMOVED
-                  ENDIF
+              !Compact the sorted list in one pass, keeping the first item of each run of equal values
+              j=1
+              DO i=2,LIST%NUMBER_IN_LIST
+                IF(ABS(LIST%LIST_SP(i)-LIST%LIST_SP(j))>ZERO_TOLERANCE_SP) THEN
+                  j=j+1
+                  LIST%LIST_SP(j)=LIST%LIST_SP(i)
                 ENDIF
-                i=i+1
               ENDDO !i
+              LIST%NUMBER_IN_LIST=j
             CASE(LIST_DP_TYPE)
               CALL LIST_SORT(LIST%LIST_DP(1:LIST%NUMBER_IN_LIST),ERR,ERROR,*999)
-              i=1
-              DO WHILE(i<=LIST%NUMBER_IN_LIST)
-                !Find the extent of duplicate values if any
-                j=i+1
-                SAME_VALUE=.TRUE.
-                DO WHILE(j<=LIST%NUMBER_IN_LIST.AND.SAME_VALUE)
-                  IF(ABS(LIST%LIST_DP(j)-LIST%LIST_DP(i))<=ZERO_TOLERANCE) THEN
-                    j=j+1
-                  ELSE
-                    SAME_VALUE=.FALSE.
-                  ENDIF
-                ENDDO !j
-                IF(j>i+1.OR.SAME_VALUE) THEN
-                  !We have duplicates so remove them
-                  IF(SAME_VALUE) THEN
-                    !Duplicates to the end of the list so just set the number in the list
-                    LIST%NUMBER_IN_LIST=i
-                  ELSE
-                    NUMBER_REMOVED=j-i-1
-                    LIST%LIST_DP(i+1:LIST%NUMBER_IN_LIST-NUMBER_REMOVED)=LIST%LIST_DP(j:LIST%NUMBER_IN_LIST)
-                    LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST-NUMBER_REMOVED
-                  ENDIF
+              !Compact the sorted list in one pass, keeping the first item of each run of equal values
+              j=1
+              DO i=2,LIST%NUMBER_IN_LIST
+                IF(ABS(LIST%LIST_DP(i)-LIST%LIST_DP(j))>ZERO_TOLERANCE) THEN
+                  j=j+1
+                  LIST%LIST_DP(j)=LIST%LIST_DP(i)
                 ENDIF
-                i=i+1
               ENDDO !i
+              LIST%NUMBER_IN_LIST=j
             CASE DEFAULT
               LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))//" is invalid."
               CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
@@ -2757,85 +3533,37 @@ CONTAINS
             SELECT CASE(LIST%DATA_TYPE)
             CASE(LIST_INTG_TYPE)              
               CALL LIST_SORT(LIST%LIST_INTG2(:,1:LIST%NUMBER_IN_LIST),LIST%KEY_DIMENSION,ERR,ERROR,*999)
-              i=1
-              DO WHILE(i<=LIST%NUMBER_IN_LIST)
-                !Find the extent of duplicate values if any
-                j=i+1
-                SAME_VALUE=.TRUE.
-                DO WHILE(j<=LIST%NUMBER_IN_LIST.AND.SAME_VALUE)
-                  IF(LIST%LIST_INTG2(LIST%KEY_DIMENSION,j)==LIST%LIST_INTG2(LIST%KEY_DIMENSION,i)) THEN
-                    j=j+1
-                  ELSE
-                    SAME_VALUE=.FALSE.
-                  ENDIF
-                ENDDO !j
-                IF(j>i+1.OR.SAME_VALUE) THEN
-                  !We have duplicates so remove them
-                  IF(SAME_VALUE) THEN
-                    !Duplicates to the end of the list so just set the number in the list
-                    LIST%NUMBER_IN_LIST=i
-                  ELSE
-                    NUMBER_REMOVED=j-i-1
-                    LIST%LIST_INTG2(:,i+1:LIST%NUMBER_IN_LIST-NUMBER_REMOVED)=LIST%LIST_INTG2(:,j:LIST%NUMBER_IN_LIST)
-                    LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST-NUMBER_REMOVED
-                  ENDIF
+              !Compact the sorted list in one pass, keeping the first item of each run of equal values
+              j=1
+              DO i=2,LIST%NUMBER_IN_LIST
+                IF(LIST%LIST_INTG2(LIST%KEY_DIMENSION,i)/=LIST%LIST_INTG2(LIST%KEY_DIMENSION,j)) THEN
+                  j=j+1
+                  LIST%LIST_INTG2(:,j)=LIST%LIST_INTG2(:,i)
                 ENDIF
-                i=i+1
               ENDDO !i
+              LIST%NUMBER_IN_LIST=j
             CASE(LIST_SP_TYPE)
               CALL LIST_SORT(LIST%LIST_SP2(:,1:LIST%NUMBER_IN_LIST),LIST%KEY_DIMENSION,ERR,ERROR,*999)
-              i=1
-              DO WHILE(i<=LIST%NUMBER_IN_LIST)
-                !Find the extent of duplicate values if any
-                j=i+1
-                SAME_VALUE=.TRUE.
-                DO WHILE(j<=LIST%NUMBER_IN_LIST.AND.SAME_VALUE)
-                  IF(ABS(LIST%LIST_SP2(LIST%KEY_DIMENSION,j)-LIST%LIST_SP2(LIST%KEY_DIMENSION,i))<=ZERO_TOLERANCE_SP) THEN
-                    j=j+1
-                  ELSE
-                    SAME_VALUE=.FALSE.
-                  ENDIF
-                ENDDO !j
-                IF(j>i+1.OR.SAME_VALUE) THEN
-                  !We have duplicates so remove them
-                  IF(SAME_VALUE) THEN
-                    !Duplicates to the end of the list so just set the number in the list
-                    LIST%NUMBER_IN_LIST=i
-                  ELSE
-                    NUMBER_REMOVED=j-i-1
-                    LIST%LIST_SP2(:,i+1:LIST%NUMBER_IN_LIST-NUMBER_REMOVED)=LIST%LIST_SP2(:,j:LIST%NUMBER_IN_LIST)
-                    LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST-NUMBER_REMOVED
-                  ENDIF
+              !Compact the sorted list in one pass, keeping the first item of each run of equal values
+              j=1
+              DO i=2,LIST%NUMBER_IN_LIST
+                IF(ABS(LIST%LIST_SP2(LIST%KEY_DIMENSION,i)-LIST%LIST_SP2(LIST%KEY_DIMENSION,j))>ZERO_TOLERANCE_SP) THEN
+                  j=j+1
+                  LIST%LIST_SP2(:,j)=LIST%LIST_SP2(:,i)
                 ENDIF
-                i=i+1
               ENDDO !i
+              LIST%NUMBER_IN_LIST=j
             CASE(LIST_DP_TYPE)
               CALL LIST_SORT(LIST%LIST_DP2(:,1:LIST%NUMBER_IN_LIST),LIST%KEY_DIMENSION,ERR,ERROR,*999)
-              i=1
-              DO WHILE(i<=LIST%NUMBER_IN_LIST)
-                !Find the extent of duplicate values if any
-                j=i+1
-                SAME_VALUE=.TRUE.
-                DO WHILE(j<=LIST%NUMBER_IN_LIST.AND.SAME_VALUE)
-                  IF(ABS(LIST%LIST_DP2(LIST%KEY_DIMENSION,j)-LIST%LIST_DP2(LIST%KEY_DIMENSION,i))<=ZERO_TOLERANCE) THEN
-                    j=j+1
-                  ELSE
-                    SAME_VALUE=.FALSE.
-                  ENDIF
-                ENDDO !j
-                IF(j>i+1.OR.SAME_VALUE) THEN
-                  !We have duplicates so remove them
-                  IF(SAME_VALUE) THEN
-                    !Duplicates to the end of the list so just set the number in the list
-                    LIST%NUMBER_IN_LIST=i
-                  ELSE
-                    NUMBER_REMOVED=j-i-1
-                    LIST%LIST_DP2(:,i+1:LIST%NUMBER_IN_LIST-NUMBER_REMOVED)=LIST%LIST_DP2(:,j:LIST%NUMBER_IN_LIST)
-                    LIST%NUMBER_IN_LIST=LIST%NUMBER_IN_LIST-NUMBER_REMOVED
-                  ENDIF
+              !Compact the sorted list in one pass, keeping the first item of each run of equal values
+              j=1
+              DO i=2,LIST%NUMBER_IN_LIST
+                IF(ABS(LIST%LIST_DP2(LIST%KEY_DIMENSION,i)-LIST%LIST_DP2(LIST%KEY_DIMENSION,j))>ZERO_TOLERANCE) THEN
+                  j=j+1
+                  LIST%LIST_DP2(:,j)=LIST%LIST_DP2(:,i)
                 ENDIF
-                i=i+1
               ENDDO !i
+              LIST%NUMBER_IN_LIST=j
             CASE DEFAULT
               LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))//" is invalid."
               CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
@@ -3393,6 +4121,35 @@ CONTAINS
               CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
             END SELECT            
           ENDIF
+        CASE(LIST_INTRO_SORT_METHOD)
+          IF(LIST%DATA_DIMENSION==1) THEN
+            SELECT CASE(LIST%DATA_TYPE)
+            CASE(LIST_INTG_TYPE)
+              CALL LIST_SORT_INTRO_INTG1_ARRAY(LIST%LIST_INTG(1:LIST%NUMBER_IN_LIST),ERR,ERROR,*999)
+            CASE(LIST_SP_TYPE)
+              CALL LIST_SORT_INTRO_SP1_ARRAY(LIST%LIST_SP(1:LIST%NUMBER_IN_LIST),ERR,ERROR,*999)
+            CASE(LIST_DP_TYPE)
+              CALL LIST_SORT_INTRO_DP1_ARRAY(LIST%LIST_DP(1:LIST%NUMBER_IN_LIST),ERR,ERROR,*999)
+            CASE DEFAULT
+              LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))//" is invalid."
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            END SELECT
+          ELSE
+            SELECT CASE(LIST%DATA_TYPE)
+            CASE(LIST_INTG_TYPE)
+              CALL LIST_SORT_INTRO_INTG2_ARRAY(LIST%LIST_INTG2(:,1:LIST%NUMBER_IN_LIST),LIST%KEY_DIMENSION, &
+                & ERR,ERROR,*999)
+            CASE(LIST_SP_TYPE)
+              CALL LIST_SORT_INTRO_SP2_ARRAY(LIST%LIST_SP2(:,1:LIST%NUMBER_IN_LIST),LIST%KEY_DIMENSION, &
+                & ERR,ERROR,*999)
+            CASE(LIST_DP_TYPE)
+              CALL LIST_SORT_INTRO_DP2_ARRAY(LIST%LIST_DP2(:,1:LIST%NUMBER_IN_LIST),LIST%KEY_DIMENSION, &
+                & ERR,ERROR,*999)
+            CASE DEFAULT
+              LOCAL_ERROR="The list data type of "//TRIM(NumberToVString(LIST%DATA_TYPE,"*",ERR,ERROR))//" is invalid."
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            END SELECT
+          ENDIF
         CASE DEFAULT
           LOCAL_ERROR="The list sort method of "//TRIM(NumberToVString(LIST%SORT_METHOD,"*",ERR,ERROR))//" is invlaid."
           CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
@@ -3425,8 +4182,8 @@ CONTAINS
     
     ENTERS("LIST_SORT_INTG1_ARRAY",ERR,ERROR,*999)
 
-    !Default sort method is a heap sort
-    CALL LIST_SORT_HEAP(A,ERR,ERROR,*999)    
+    !Default sort method is an introsort
+    CALL LIST_SORT_INTRO(A,ERR,ERROR,*999)    
 
     EXITS("LIST_SORT_INTG1_ARRAY")
     RETURN
@@ -3450,8 +4207,8 @@ CONTAINS
     
     ENTERS("LIST_SORT_INTG2_ARRAY",ERR,ERROR,*999)
 
-    !Default sort method is a heap sort
-    CALL LIST_SORT_HEAP(A,KEY_DIMENSION,ERR,ERROR,*999)    
+    !Default sort method is an introsort
+    CALL LIST_SORT_INTRO(A,KEY_DIMENSION,ERR,ERROR,*999)    
 
     EXITS("LIST_SORT_INTG2_ARRAY")
     RETURN
@@ -3474,8 +4231,8 @@ CONTAINS
     
     ENTERS("LIST_SORT_C_INT1_ARRAY",ERR,ERROR,*999)
 
-    !Default sort method is a heap sort
-    CALL LIST_SORT_HEAP(A,ERR,ERROR,*999)    
+    !Default sort method is an introsort
+    CALL LIST_SORT_INTRO(A,ERR,ERROR,*999)    
 
     EXITS("LIST_SORT_C_INT1_ARRAY")
     RETURN
@@ -3499,8 +4256,8 @@ CONTAINS
     
     ENTERS("LIST_SORT_C_INT2_ARRAY",ERR,ERROR,*999)
 
-    !Default sort method is a heap sort
-    CALL LIST_SORT_HEAP(A,KEY_DIMENSION,ERR,ERROR,*999)    
+    !Default sort method is an introsort
+    CALL LIST_SORT_INTRO(A,KEY_DIMENSION,ERR,ERROR,*999)    
 
     EXITS("LIST_SORT_C_INT2_ARRAY")
     RETURN
@@ -3523,8 +4280,8 @@ CONTAINS
     
     ENTERS("LIST_SORT_SP1_ARRAY",ERR,ERROR,*999)
 
-    !Default sort method is a heap sort
-    CALL LIST_SORT_HEAP(A,ERR,ERROR,*999)    
+    !Default sort method is an introsort
+    CALL LIST_SORT_INTRO(A,ERR,ERROR,*999)    
 
     EXITS("LIST_SORT_SP1_ARRAY")
     RETURN
@@ -3548,8 +4305,8 @@ CONTAINS
     
     ENTERS("LIST_SORT_SP2_ARRAY",ERR,ERROR,*999)
 
-    !Default sort method is a heap sort
-    CALL LIST_SORT_HEAP(A,KEY_DIMENSION,ERR,ERROR,*999)    
+    !Default sort method is an introsort
+    CALL LIST_SORT_INTRO(A,KEY_DIMENSION,ERR,ERROR,*999)    
 
     EXITS("LIST_SORT_SP2_ARRAY")
     RETURN
@@ -3572,8 +4329,8 @@ CONTAINS
      
     ENTERS("LIST_SORT_DP1_ARRAY",ERR,ERROR,*999)
 
-    !Default sort method is a heap sort
-    CALL LIST_SORT_HEAP(A,ERR,ERROR,*999)    
+    !Default sort method is an introsort
+    CALL LIST_SORT_INTRO(A,ERR,ERROR,*999)    
 
     EXITS("LIST_SORT_DP1_ARRAY")
     RETURN
@@ -3597,8 +4354,8 @@ CONTAINS
      
     ENTERS("LIST_SORT_DP2_ARRAY",ERR,ERROR,*999)
 
-    !Default sort method is a heap sort
-    CALL LIST_SORT_HEAP(A,KEY_DIMENSION,ERR,ERROR,*999)    
+    !Default sort method is an introsort
+    CALL LIST_SORT_INTRO(A,KEY_DIMENSION,ERR,ERROR,*999)    
 
     EXITS("LIST_SORT_DP2_ARRAY")
     RETURN
@@ -4446,6 +5203,213 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Sorts an integer array of data dimension 1 list into assending order using the introsort method.
+  SUBROUTINE LIST_SORT_INTRO_INTG1_ARRAY(A,ERR,ERROR,*)
+  
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+    
+    ENTERS("LIST_SORT_INTRO_INTG1_ARRAY",ERR,ERROR,*999)
+
+    CALL INTRO_SORT(A,ERR,ERROR,*999)
+
+    EXITS("LIST_SORT_INTRO_INTG1_ARRAY")
+    RETURN
+999 ERRORSEXITS("LIST_SORT_INTRO_INTG1_ARRAY",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_SORT_INTRO_INTG1_ARRAY
+  
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts an integer array of data dimension > 1 list into assending order using the introsort method. The keys are sorted
+  !>with their sorting index and the items are then moved into place in one pass.
+  SUBROUTINE LIST_SORT_INTRO_INTG2_ARRAY(A,KEY_DIMENSION,ERR,ERROR,*)
+  
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: A(:,:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: KEY_DIMENSION !<The key dimension of A to do the sort on
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+    INTEGER(INTG), ALLOCATABLE :: SORTING_IND(:)
+    INTEGER(INTG), ALLOCATABLE :: KEYS(:)
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+    
+    ENTERS("LIST_SORT_INTRO_INTG2_ARRAY",ERR,ERROR,*999)
+
+    IF(KEY_DIMENSION>0.AND.KEY_DIMENSION<=SIZE(A,1)) THEN
+      IF(SIZE(A,2)>1) THEN
+        ALLOCATE(KEYS(SIZE(A,2)),STAT=ERR)
+        IF(ERR/=0) CALL FlagError("Could not allocate keys.",ERR,ERROR,*999)
+        ALLOCATE(SORTING_IND(SIZE(A,2)),STAT=ERR)
+        IF(ERR/=0) CALL FlagError("Could not allocate sorting index.",ERR,ERROR,*999)
+        KEYS=A(KEY_DIMENSION,:)
+        CALL INTRO_ISORT(KEYS,SORTING_IND,ERR,ERROR,*999)
+        A=A(:,SORTING_IND)
+        DEALLOCATE(KEYS)
+        DEALLOCATE(SORTING_IND)
+      ENDIF
+    ELSE
+      LOCAL_ERROR="The specified key dimension of "//TRIM(NumberToVString(KEY_DIMENSION,"*",ERR,ERROR))// &
+        & " is invalid. The key dimension must be > 0 and <= "//TRIM(NumberToVString(SIZE(A,1),"*",ERR,ERROR))//"."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_SORT_INTRO_INTG2_ARRAY")
+    RETURN
+999 IF(ALLOCATED(KEYS)) DEALLOCATE(KEYS)
+    IF(ALLOCATED(SORTING_IND)) DEALLOCATE(SORTING_IND)
+    ERRORSEXITS("LIST_SORT_INTRO_INTG2_ARRAY",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_SORT_INTRO_INTG2_ARRAY
+  
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts a real single precision array of data dimension 1 list into assending order using the introsort method.
+  SUBROUTINE LIST_SORT_INTRO_SP1_ARRAY(A,ERR,ERROR,*)
+  
+    !Argument variables
+    REAL(SP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+    
+    ENTERS("LIST_SORT_INTRO_SP1_ARRAY",ERR,ERROR,*999)
+
+    CALL INTRO_SORT(A,ERR,ERROR,*999)
+
+    EXITS("LIST_SORT_INTRO_SP1_ARRAY")
+    RETURN
+999 ERRORSEXITS("LIST_SORT_INTRO_SP1_ARRAY",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_SORT_INTRO_SP1_ARRAY
+  
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts a real single precision array of data dimension > 1 list into assending order using the introsort method. The keys are sorted
+  !>with their sorting index and the items are then moved into place in one pass.
+  SUBROUTINE LIST_SORT_INTRO_SP2_ARRAY(A,KEY_DIMENSION,ERR,ERROR,*)
+  
+    !Argument variables
+    REAL(SP), INTENT(INOUT) :: A(:,:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: KEY_DIMENSION !<The key dimension of A to do the sort on
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+    INTEGER(INTG), ALLOCATABLE :: SORTING_IND(:)
+    REAL(SP), ALLOCATABLE :: KEYS(:)
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+    
+    ENTERS("LIST_SORT_INTRO_SP2_ARRAY",ERR,ERROR,*999)
+
+    IF(KEY_DIMENSION>0.AND.KEY_DIMENSION<=SIZE(A,1)) THEN
+      IF(SIZE(A,2)>1) THEN
+        ALLOCATE(KEYS(SIZE(A,2)),STAT=ERR)
+        IF(ERR/=0) CALL FlagError("Could not allocate keys.",ERR,ERROR,*999)
+        ALLOCATE(SORTING_IND(SIZE(A,2)),STAT=ERR)
+        IF(ERR/=0) CALL FlagError("Could not allocate sorting index.",ERR,ERROR,*999)
+        KEYS=A(KEY_DIMENSION,:)
+        CALL INTRO_ISORT(KEYS,SORTING_IND,ERR,ERROR,*999)
+        A=A(:,SORTING_IND)
+        DEALLOCATE(KEYS)
+        DEALLOCATE(SORTING_IND)
+      ENDIF
+    ELSE
+      LOCAL_ERROR="The specified key dimension of "//TRIM(NumberToVString(KEY_DIMENSION,"*",ERR,ERROR))// &
+        & " is invalid. The key dimension must be > 0 and <= "//TRIM(NumberToVString(SIZE(A,1),"*",ERR,ERROR))//"."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_SORT_INTRO_SP2_ARRAY")
+    RETURN
+999 IF(ALLOCATED(KEYS)) DEALLOCATE(KEYS)
+    IF(ALLOCATED(SORTING_IND)) DEALLOCATE(SORTING_IND)
+    ERRORSEXITS("LIST_SORT_INTRO_SP2_ARRAY",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_SORT_INTRO_SP2_ARRAY
+  
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts a real double precision array of data dimension 1 list into assending order using the introsort method.
+  SUBROUTINE LIST_SORT_INTRO_DP1_ARRAY(A,ERR,ERROR,*)
+  
+    !Argument variables
+    REAL(DP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+    
+    ENTERS("LIST_SORT_INTRO_DP1_ARRAY",ERR,ERROR,*999)
+
+    CALL INTRO_SORT(A,ERR,ERROR,*999)
+
+    EXITS("LIST_SORT_INTRO_DP1_ARRAY")
+    RETURN
+999 ERRORSEXITS("LIST_SORT_INTRO_DP1_ARRAY",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_SORT_INTRO_DP1_ARRAY
+  
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts a real double precision array of data dimension > 1 list into assending order using the introsort method. The keys are sorted
+  !>with their sorting index and the items are then moved into place in one pass.
+  SUBROUTINE LIST_SORT_INTRO_DP2_ARRAY(A,KEY_DIMENSION,ERR,ERROR,*)
+  
+    !Argument variables
+    REAL(DP), INTENT(INOUT) :: A(:,:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: KEY_DIMENSION !<The key dimension of A to do the sort on
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+    INTEGER(INTG), ALLOCATABLE :: SORTING_IND(:)
+    REAL(DP), ALLOCATABLE :: KEYS(:)
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+    
+    ENTERS("LIST_SORT_INTRO_DP2_ARRAY",ERR,ERROR,*999)
+
+    IF(KEY_DIMENSION>0.AND.KEY_DIMENSION<=SIZE(A,1)) THEN
+      IF(SIZE(A,2)>1) THEN
+        ALLOCATE(KEYS(SIZE(A,2)),STAT=ERR)
+        IF(ERR/=0) CALL FlagError("Could not allocate keys.",ERR,ERROR,*999)
+        ALLOCATE(SORTING_IND(SIZE(A,2)),STAT=ERR)
+        IF(ERR/=0) CALL FlagError("Could not allocate sorting index.",ERR,ERROR,*999)
+        KEYS=A(KEY_DIMENSION,:)
+        CALL INTRO_ISORT(KEYS,SORTING_IND,ERR,ERROR,*999)
+        A=A(:,SORTING_IND)
+        DEALLOCATE(KEYS)
+        DEALLOCATE(SORTING_IND)
+      ENDIF
+    ELSE
+      LOCAL_ERROR="The specified key dimension of "//TRIM(NumberToVString(KEY_DIMENSION,"*",ERR,ERROR))// &
+        & " is invalid. The key dimension must be > 0 and <= "//TRIM(NumberToVString(SIZE(A,1),"*",ERR,ERROR))//"."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_SORT_INTRO_DP2_ARRAY")
+    RETURN
+999 IF(ALLOCATED(KEYS)) DEALLOCATE(KEYS)
+    IF(ALLOCATED(SORTING_IND)) DEALLOCATE(SORTING_IND)
+    ERRORSEXITS("LIST_SORT_INTRO_DP2_ARRAY",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE LIST_SORT_INTRO_DP2_ARRAY
+  
+  !
+  !================================================================================================================================
+  !
+
   !>Sorts an integer array of data dimension 1 list into either assending or descending order using the shell sort method.
   SUBROUTINE LIST_SORT_SHELL_INTG1_ARRAY(A,ERR,ERROR,*)
   
@@ -4814,83 +5778,60 @@ CONTAINS
     ! Argument variables
     INTEGER(INTG), INTENT(IN), TARGET :: A(:)   !<One of the two arrays to find the intersection for
     INTEGER(INTG), INTENT(IN), TARGET :: B(:)   !<Other array to find the intersection for
-    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: C(:) !<On exit, contains the list of common elements of the arrays
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: C(:) !<On exit, the common elements of the arrays, in ascending order for long arrays
     INTEGER(INTG), INTENT(OUT) :: ERR          !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     ! Local variables
     INTEGER(INTG) :: SIZE_SHORTER,SIZE_LONGER
-    INTEGER(INTG) :: I,J,START,NUMBER_OF_MATCHES
+    INTEGER(INTG) :: I,J,NUMBER_OF_MATCHES
     INTEGER(INTG), POINTER :: LONGER(:),SHORTER(:)
     INTEGER(INTG), ALLOCATABLE :: MATCHES(:)
-    INTEGER(INTG), ALLOCATABLE :: LONG_ARRAY(:),SHORT_ARRAY(:)   !<copies, if needed
+    INTEGER(INTG), ALLOCATABLE :: HASH_MATCHES(:)
     
     ENTERS("LIST_INTERSECTION_INTG_ARRAY",ERR,ERROR,*999)
 
     ! if the lists are small, it's probably easier to directly compare: O(n^2)
-    ! but if they're big, sort first then compare: O(n log n)*2 + 2*O(n)
-
-    IF(ALLOCATED(C)) THEN
-      ! theoretically this cannot happen?
-      CALL FlagError("Output array is already allocated.",ERR,ERROR,*999)
+    ! but if they're big, hash the longer array and look up the shorter array items: O(n)
+
+    ! start finding the intersection
+    NULLIFY(LONGER)
+    NULLIFY(SHORTER)
+    ! it's quicker to compare shorter array elements to longer ones
+    IF(SIZE(A)>SIZE(B)) THEN
+      LONGER=>A
+      SHORTER=>B
     ELSE
-      ! start finding the intersection
-      NULLIFY(LONGER)
-      NULLIFY(SHORTER)
-      ! it's quicker to compare shorter array elements to longer ones
-      IF(SIZE(A)>SIZE(B)) THEN
-        LONGER=>A
-        SHORTER=>B
-      ELSE
-        LONGER=>B
-        SHORTER=>A
-      ENDIF
-      SIZE_SHORTER=SIZE(SHORTER)
-      SIZE_LONGER=SIZE(LONGER)
-      ALLOCATE(MATCHES(SIZE_SHORTER))
-      NUMBER_OF_MATCHES=0
-
-      ! long or short lists?
-      IF(SIZE_LONGER*SIZE_SHORTER<=1E4) THEN  ! a rather arbitrary cutoff...
-        ! 'short' lists - begin comparing straight away
-        DO I=1,SIZE_SHORTER
-          DO J=1,SIZE_LONGER
-            IF(SHORTER(I)==LONGER(J)) THEN
-              NUMBER_OF_MATCHES=NUMBER_OF_MATCHES+1
-              MATCHES(NUMBER_OF_MATCHES)=SHORTER(I)
-            ENDIF
-          ENDDO
-        ENDDO
-      ELSE
-        ! 'long' lists - make copies of the arrays
-        ALLOCATE(LONG_ARRAY(SIZE_LONGER),SHORT_ARRAY(SIZE_SHORTER))
-        LONG_ARRAY(1:SIZE_LONGER)=LONGER(1:SIZE_LONGER)
-        SHORT_ARRAY(1:SIZE_SHORTER)=SHORTER(1:SIZE_SHORTER)
-        ! sort both arrays
-        CALL LIST_SORT(LONG_ARRAY,ERR,ERROR,*999)
-        CALL LIST_SORT(SHORT_ARRAY,ERR,ERROR,*999)
-        ! compare now
-        START=1
-        DO I=1,SIZE_SHORTER
-          DO J=START,SIZE_LONGER
-            IF(LONG_ARRAY(J)==SHORT_ARRAY(I)) THEN
-              NUMBER_OF_MATCHES=NUMBER_OF_MATCHES+1
-              MATCHES(NUMBER_OF_MATCHES)=SHORT_ARRAY(I)
-              START=MIN(J+1,SIZE_LONGER)
-              EXIT
-            ELSEIF(LONG_ARRAY(J)>SHORT_ARRAY(I)) THEN
-              ! can start here next time
-              START=MAX(J-1,1)
-              EXIT
-            ENDIF
-          ENDDO
-        ENDDO
-        DEALLOCATE(LONG_ARRAY,SHORT_ARRAY)
-      ENDIF ! long or short lists
-      ! cut the array down to size
-      ALLOCATE(C(NUMBER_OF_MATCHES))
-      C(1:NUMBER_OF_MATCHES)=MATCHES(1:NUMBER_OF_MATCHES)
-      DEALLOCATE(MATCHES)
+      LONGER=>B
+      SHORTER=>A
     ENDIF
+    SIZE_SHORTER=SIZE(SHORTER)
+    SIZE_LONGER=SIZE(LONGER)
+    ALLOCATE(MATCHES(SIZE_SHORTER))
+    NUMBER_OF_MATCHES=0
+
+    ! long or short lists?
+    IF(SIZE_LONGER*SIZE_SHORTER<=1E4) THEN  ! a rather arbitrary cutoff...
+      ! 'short' lists - begin comparing straight away
+      DO I=1,SIZE_SHORTER
+        DO J=1,SIZE_LONGER
+          IF(SHORTER(I)==LONGER(J)) THEN
+            NUMBER_OF_MATCHES=NUMBER_OF_MATCHES+1
+            MATCHES(NUMBER_OF_MATCHES)=SHORTER(I)
+          ENDIF
+        ENDDO
+      ENDDO
+    ELSE
+      ! 'long' lists - look up the shorter array items in a hash set of the longer array and sort the matches
+      CALL HashSet_Intersection(SHORTER,LONGER,HASH_MATCHES,ERR,ERROR,*999)
+      NUMBER_OF_MATCHES=SIZE(HASH_MATCHES,1)
+      IF(NUMBER_OF_MATCHES>1) CALL LIST_SORT(HASH_MATCHES,ERR,ERROR,*999)
+      MATCHES(1:NUMBER_OF_MATCHES)=HASH_MATCHES(1:NUMBER_OF_MATCHES)
+      DEALLOCATE(HASH_MATCHES)
+    ENDIF ! long or short lists
+    ! cut the array down to size
+    ALLOCATE(C(NUMBER_OF_MATCHES))
+    C(1:NUMBER_OF_MATCHES)=MATCHES(1:NUMBER_OF_MATCHES)
+    DEALLOCATE(MATCHES)
 
     EXITS("LIST_INTERSECTION_INTG_ARRAY")
     RETURN
@@ -5007,8 +5948,7 @@ CONTAINS
     INTEGER(INTG), INTENT(OUT) :: ERR           !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR  !<The error string
     ! Logical variables
-    INTEGER(INTG) :: SIZE_A,SIZE_B,I,J,START,SIZE_REDUCE
-    INTEGER(INTG), ALLOCATABLE :: A_SORTED(:),B_SORTED(:)
+    INTEGER(INTG) :: SIZE_A,SIZE_B,I,J,SIZE_REDUCE
 
     ENTERS("LISTS_SUBSET_OF_INTG_ARRAY",ERR,ERROR,*999)
 
@@ -5048,27 +5988,8 @@ CONTAINS
         IF(I==SIZE_A) SUBSET=.TRUE.
       ENDDO
     ELSE
-      ! 'long' arrays - sort first
-      ALLOCATE(A_SORTED(SIZE_A),B_SORTED(SIZE_B))
-      A_SORTED(1:SIZE_A)=A(1:SIZE_A)
-      B_SORTED(1:SIZE_B)=B(1:SIZE_B)
-      CALL LIST_SORT(A_SORTED,ERR,ERROR,*999)
-      CALL LIST_SORT(B_SORTED,ERR,ERROR,*999)
-      START=1
-      DO I=1,SIZE_A
-        DO J=1,SIZE_B
-          IF(A(I)==B(J)) THEN
-            START=MIN(J+1,SIZE_B)
-            EXIT
-          ELSEIF(A(I)<B(J)) THEN
-            DEALLOCATE(A_SORTED,B_SORTED)
-            EXITS("LISTS_SUBSET_OF_INTG_ARRAY")
-            RETURN
-          ENDIF
-        ENDDO
-        IF(I==SIZE_A) SUBSET=.TRUE.
-      ENDDO
-      DEALLOCATE(A_SORTED,B_SORTED)
+      ! 'long' arrays - look up the items of A in a hash set of B
+      CALL HashSet_SubsetOf(A(1:SIZE_A),B(1:SIZE_B),SUBSET,ERR,ERROR,*999)
     ENDIF
 
     EXITS("LISTS_SUBSET_OF_INTG_ARRAY")
@@ -5166,4 +6087,33 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Finds the union of two sets (arrays), leaving the original arrays intact
+  SUBROUTINE LIST_UNION_INTG_ARRAY(A,B,C,ERR,ERROR,*)
+    
+    ! Argument variables
+    INTEGER(INTG), INTENT(IN) :: A(:)   !<One of the two arrays to find the union for
+    INTEGER(INTG), INTENT(IN) :: B(:)   !<Other array to find the union for
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: C(:) !<On exit, contains the elements of both arrays without duplicates, in the order they first occur in A and then B
+    INTEGER(INTG), INTENT(OUT) :: ERR          !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    
+    ENTERS("LIST_UNION_INTG_ARRAY",ERR,ERROR,*999)
+
+    IF(ALLOCATED(C)) THEN
+      CALL FlagError("Output array is already allocated.",ERR,ERROR,*999)
+    ELSE
+      CALL HashSet_Union(A,B,C,ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("LIST_UNION_INTG_ARRAY")
+    RETURN
+999 ERRORSEXITS("LIST_UNION_INTG_ARRAY",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE LIST_UNION_INTG_ARRAY
+
+  !
+  !================================================================================================================================
+  !
+
 END MODULE LISTS
@@ -283,7 +283,8 @@ MODULE MATRIX_VECTOR
 
   PUBLIC MATRIX_CREATE_FINISH,MATRIX_CREATE_START,MATRIX_DATA_GET,Matrix_DataTypeGet,MATRIX_DATA_TYPE_SET,MATRIX_DESTROY, &
     & MATRIX_DUPLICATE,MATRIX_MAX_COLUMNS_PER_ROW_GET,MATRIX_NUMBER_NON_ZEROS_SET,MATRIX_NUMBER_NON_ZEROS_GET,MATRIX_MAX_SIZE_SET, &
-    & MATRIX_OUTPUT,MATRIX_SIZE_SET,MATRIX_STORAGE_LOCATION_FIND,MATRIX_STORAGE_LOCATIONS_SET,MATRIX_STORAGE_TYPE_GET, &
+    & MATRIX_OUTPUT,MATRIX_SIZE_SET,MATRIX_STORAGE_LOCATION_FIND,Matrix_StorageLocationsFind,MATRIX_STORAGE_LOCATIONS_SET, &
+    & Matrix_StorageLocationsValuesAdd,MATRIX_STORAGE_TYPE_GET, &
     & MATRIX_STORAGE_TYPE_SET,MATRIX_VALUES_ADD,MATRIX_VALUES_GET,MATRIX_VALUES_SET
 
   PUBLIC VECTOR_ALL_VALUES_SET,VECTOR_CREATE_FINISH,VECTOR_CREATE_START,VECTOR_DATA_GET,Vector_DataTypeGet,VECTOR_DATA_TYPE_SET, &
@@ -1566,6 +1567,108 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Finds the storage locations in the data array of a matrix of the entries in the given rows and columns. An error is flagged if any of the entries does not exist in the matrix.
+  SUBROUTINE Matrix_StorageLocationsFind(matrix,rowIndices,columnIndices,locations,err,error,*)
+
+    !Argument variables
+    TYPE(MATRIX_TYPE), POINTER :: matrix !<A pointer to the matrix
+    INTEGER(INTG), INTENT(IN) :: rowIndices(:) !<rowIndices(i). The row number of the i'th row to find the storage locations for
+    INTEGER(INTG), INTENT(IN) :: columnIndices(:) !<columnIndices(j). The column number of the j'th column to find the storage locations for
+    INTEGER(INTG), INTENT(OUT) :: locations(:,:) !<locations(i,j). On return, the storage location of the ij'th entry in the matrix data
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local variables
+    INTEGER(INTG) :: i,j
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("Matrix_StorageLocationsFind",err,error,*999)
+
+    IF(ASSOCIATED(matrix)) THEN
+      IF(SIZE(locations,1)<SIZE(rowIndices,1).OR.SIZE(locations,2)<SIZE(columnIndices,1)) THEN
+        localError="The size of the locations array ("//TRIM(NUMBER_TO_VSTRING(SIZE(locations,1),"*",err,error))// &
+          & ","//TRIM(NUMBER_TO_VSTRING(SIZE(locations,2),"*",err,error))//") is too small. The size must be >= ("// &
+          & TRIM(NUMBER_TO_VSTRING(SIZE(rowIndices,1),"*",err,error))//","// &
+          & TRIM(NUMBER_TO_VSTRING(SIZE(columnIndices,1),"*",err,error))//")."
+        CALL FlagError(localError,err,error,*999)
+      ENDIF
+      DO j=1,SIZE(columnIndices,1)
+        DO i=1,SIZE(rowIndices,1)
+          CALL MATRIX_STORAGE_LOCATION_FIND(matrix,rowIndices(i),columnIndices(j),locations(i,j),err,error,*999)
+          IF(locations(i,j)==0) THEN
+            localError="Row "//TRIM(NUMBER_TO_VSTRING(rowIndices(i),"*",err,error))//" and column "// &
+              & TRIM(NUMBER_TO_VSTRING(columnIndices(j),"*",err,error))//" does not exist in the matrix."
+            CALL FlagError(localError,err,error,*999)
+          ENDIF
+        ENDDO !i
+      ENDDO !j
+    ELSE
+      CALL FlagError("Matrix is not associated.",err,error,*999)
+    ENDIF
+
+    EXITS("Matrix_StorageLocationsFind")
+    RETURN
+999 ERRORSEXITS("Matrix_StorageLocationsFind",err,error)
+    RETURN 1
+  END SUBROUTINE Matrix_StorageLocationsFind
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Adds a matrix of values to a double precision real matrix at storage locations previously found with Matrix_StorageLocationsFind i.e., DATA(LOCATIONS(i,j))=DATA(LOCATIONS(i,j))+VALUES(i,j)
+  SUBROUTINE Matrix_StorageLocationsValuesAdd(matrix,locations,values,err,error,*)
+
+    !Argument variables
+    TYPE(MATRIX_TYPE), POINTER :: matrix !<A pointer to the matrix
+    INTEGER(INTG), INTENT(IN) :: locations(:,:) !<locations(i,j). The storage location in the matrix data to add the ij'th value to
+    REAL(DP), INTENT(IN) :: values(:,:) !<values(i,j). The ij'th value to add
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: error !<The error string
+    !Local variables
+    INTEGER(INTG) :: i,j
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("Matrix_StorageLocationsValuesAdd",err,error,*999)
+
+    IF(ASSOCIATED(matrix)) THEN
+      IF(matrix%MATRIX_FINISHED) THEN
+        IF(matrix%DATA_TYPE==MATRIX_VECTOR_DP_TYPE) THEN
+          IF(SIZE(locations,1)==SIZE(values,1).AND.SIZE(locations,2)==SIZE(values,2)) THEN
+            DO j=1,SIZE(values,2)
+              DO i=1,SIZE(values,1)
+                matrix%DATA_DP(locations(i,j))=matrix%DATA_DP(locations(i,j))+values(i,j)
+              ENDDO !i
+            ENDDO !j
+          ELSE
+            localError="The size of the locations array ("//TRIM(NUMBER_TO_VSTRING(SIZE(locations,1),"*",err,error))// &
+              & ","//TRIM(NUMBER_TO_VSTRING(SIZE(locations,2),"*",err,error))// &
+              & ") does not conform to the size of the values array ("// &
+              & TRIM(NUMBER_TO_VSTRING(SIZE(values,1),"*",err,error))//","// &
+              & TRIM(NUMBER_TO_VSTRING(SIZE(values,2),"*",err,error))//")."
+            CALL FlagError(localError,err,error,*999)
+          ENDIF
+        ELSE
+          localError="The data type of "//TRIM(NUMBER_TO_VSTRING(matrix%DATA_TYPE,"*",err,error))// &
+            & " does not correspond to the double precision data type of the given values."
+          CALL FlagError(localError,err,error,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("The matrix has not been finished.",err,error,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("Matrix is not associated.",err,error,*999)
+    ENDIF
+
+    EXITS("Matrix_StorageLocationsValuesAdd")
+    RETURN
+999 ERRORSEXITS("Matrix_StorageLocationsValuesAdd",err,error)
+    RETURN 1
+  END SUBROUTINE Matrix_StorageLocationsValuesAdd
+
+  !
+  !================================================================================================================================
+  !
+
   !>Gets the storage locations (sparsity pattern) of a matrix.
   SUBROUTINE MATRIX_STORAGE_LOCATIONS_GET(MATRIX,ROW_INDICES,COLUMN_INDICES,ERR,ERROR,*)
 
@@ -83,6 +83,23 @@ MODULE MESH_ROUTINES
   INTEGER(INTG), PARAMETER :: DECOMPOSITION_CALCULATED_TYPE=2 !<The element decomposition is calculated by graph partitioning. \see MESH_ROUTINES_DecompositionTypes,MESH_ROUTINES
   INTEGER(INTG), PARAMETER :: DECOMPOSITION_USER_DEFINED_TYPE=3 !<The user will set the element decomposition. \see MESH_ROUTINES_DecompositionTypes,MESH_ROUTINES
   !>@}
+
+  !> \addtogroup MESH_ROUTINES_DecompositionPartitionMethods MESH_ROUTINES::DecompositionPartitionMethods
+  !> \brief The graph partitioning methods for calculated decompositions
+  !> \see MESH_ROUTINES
+  !>@{
+  INTEGER(INTG), PARAMETER :: DECOMPOSITION_MESH_KWAY_PARTITION=1 !<The elements are partitioned with ParMETIS_V3_PartMeshKway, which builds the mesh dual graph itself. \see MESH_ROUTINES_DecompositionPartitionMethods,MESH_ROUTINES
+  INTEGER(INTG), PARAMETER :: DECOMPOSITION_DUAL_GRAPH_KWAY_PARTITION=2 !<The elements are partitioned with ParMETIS_V3_PartKway on the mesh dual graph with each edge weighted by the number of nodes the two elements share, so that the cut approximates the communication volume. \see MESH_ROUTINES_DecompositionPartitionMethods,MESH_ROUTINES
+  !>@}
+
+  !> \addtogroup MESH_ROUTINES_DecompositionElementWeightTypes MESH_ROUTINES::DecompositionElementWeightTypes
+  !> \brief How the element weights for a calculated decomposition are found
+  !> \see MESH_ROUTINES
+  !>@{
+  INTEGER(INTG), PARAMETER :: DECOMPOSITION_UNIFORM_ELEMENT_WEIGHTS=1 !<All elements have the same weight. \see MESH_ROUTINES_DecompositionElementWeightTypes,MESH_ROUTINES
+  INTEGER(INTG), PARAMETER :: DECOMPOSITION_BASIS_ELEMENT_WEIGHTS=2 !<The weight of an element is the number of element parameters times the number of Gauss points of its bases, summed over the mesh components. \see MESH_ROUTINES_DecompositionElementWeightTypes,MESH_ROUTINES
+  INTEGER(INTG), PARAMETER :: DECOMPOSITION_USER_ELEMENT_WEIGHTS=3 !<The element weights, for one or more balance constraints, are set by the user. \see MESH_ROUTINES_DecompositionElementWeightTypes,MESH_ROUTINES
+  !>@}
   
   !Module types
 
@@ -119,6 +136,10 @@ MODULE MESH_ROUTINES
   
   PUBLIC DECOMPOSITION_ALL_TYPE,DECOMPOSITION_CALCULATED_TYPE,DECOMPOSITION_USER_DEFINED_TYPE
 
+  PUBLIC DECOMPOSITION_MESH_KWAY_PARTITION,DECOMPOSITION_DUAL_GRAPH_KWAY_PARTITION
+
+  PUBLIC DECOMPOSITION_UNIFORM_ELEMENT_WEIGHTS,DECOMPOSITION_BASIS_ELEMENT_WEIGHTS,DECOMPOSITION_USER_ELEMENT_WEIGHTS
+
   PUBLIC DECOMPOSITIONS_INITIALISE,DECOMPOSITIONS_FINALISE
 
   PUBLIC DECOMPOSITION_CREATE_START,DECOMPOSITION_CREATE_FINISH
@@ -129,9 +150,13 @@ MODULE MESH_ROUTINES
 
   PUBLIC DECOMPOSITION_ELEMENT_DOMAIN_GET,DECOMPOSITION_ELEMENT_DOMAIN_SET
 
+  PUBLIC DECOMPOSITION_ELEMENT_WEIGHT_TYPE_SET,DECOMPOSITION_ELEMENT_WEIGHTS_SET
+
   PUBLIC DECOMPOSITION_MESH_COMPONENT_NUMBER_GET,DECOMPOSITION_MESH_COMPONENT_NUMBER_SET
   
   PUBLIC DECOMPOSITION_NUMBER_OF_DOMAINS_GET,DECOMPOSITION_NUMBER_OF_DOMAINS_SET
+
+  PUBLIC DECOMPOSITION_PARTITION_METHOD_SET
   
   PUBLIC DECOMPOSITION_TOPOLOGY_ELEMENT_CHECK_EXISTS,DecompositionTopology_DataPointCheckExists
   
@@ -368,6 +393,9 @@ CONTAINS
               ALLOCATE(NEW_DECOMPOSITION%ELEMENT_DOMAIN(MESH%NUMBER_OF_ELEMENTS),STAT=ERR)
               IF(ERR/=0) CALL FlagError("Could not allocate new decomposition element domain.",ERR,ERROR,*999)
               NEW_DECOMPOSITION%ELEMENT_DOMAIN=0          
+              NEW_DECOMPOSITION%PARTITION_METHOD=DECOMPOSITION_MESH_KWAY_PARTITION
+              NEW_DECOMPOSITION%ELEMENT_WEIGHT_TYPE=DECOMPOSITION_UNIFORM_ELEMENT_WEIGHTS
+              NEW_DECOMPOSITION%NUMBER_OF_CONSTRAINTS=1
               !Nullify the domain
               NULLIFY(NEW_DECOMPOSITION%DOMAIN)
               !Nullify the topology
@@ -404,6 +432,7 @@ CONTAINS
     RETURN
 999 IF(ASSOCIATED(NEW_DECOMPOSITION)) THEN
       IF(ALLOCATED(NEW_DECOMPOSITION%ELEMENT_DOMAIN)) DEALLOCATE(NEW_DECOMPOSITION%ELEMENT_DOMAIN)
+      IF(ALLOCATED(NEW_DECOMPOSITION%ELEMENT_WEIGHTS)) DEALLOCATE(NEW_DECOMPOSITION%ELEMENT_WEIGHTS)
       DEALLOCATE(NEW_DECOMPOSITION)
     ENDIF
     IF(ASSOCIATED(NEW_DECOMPOSITIONS)) DEALLOCATE(NEW_DECOMPOSITIONS)
@@ -452,6 +481,7 @@ CONTAINS
 
           !Destroy all the decomposition components          
           IF(ALLOCATED(DECOMPOSITION%ELEMENT_DOMAIN)) DEALLOCATE(DECOMPOSITION%ELEMENT_DOMAIN)
+          IF(ALLOCATED(DECOMPOSITION%ELEMENT_WEIGHTS)) DEALLOCATE(DECOMPOSITION%ELEMENT_WEIGHTS)
           CALL DECOMPOSITION_TOPOLOGY_FINALISE(DECOMPOSITION,ERR,ERROR,*999)
           CALL DOMAIN_FINALISE(DECOMPOSITION,ERR,ERROR,*999)
           
@@ -526,6 +556,7 @@ CONTAINS
 
         !Destroy all the decomposition components          
         IF(ALLOCATED(DECOMPOSITION%ELEMENT_DOMAIN)) DEALLOCATE(DECOMPOSITION%ELEMENT_DOMAIN)
+        IF(ALLOCATED(DECOMPOSITION%ELEMENT_WEIGHTS)) DEALLOCATE(DECOMPOSITION%ELEMENT_WEIGHTS)
         CALL DECOMPOSITION_TOPOLOGY_FINALISE(DECOMPOSITION,ERR,ERROR,*999)
         CALL DOMAIN_FINALISE(DECOMPOSITION,ERR,ERROR,*999)
         
@@ -569,6 +600,108 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Calculates the distributed dual graph of a range of the elements of a decomposition's mesh for ParMETIS. Two elements are
+  !>adjacent if they share at least the given number of nodes and the edge between them is weighted by the number of nodes they
+  !>share, so that minimising the weighted edge cut approximates minimising the communication volume between domains.
+  SUBROUTINE DECOMPOSITION_DUAL_GRAPH_CALCULATE(DECOMPOSITION,ELEMENT_START,ELEMENT_STOP,NUMBER_OF_COMMON_NODES, &
+    & ADJACENCY_PTR,ADJACENCIES,ADJACENCY_WEIGHTS,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(DECOMPOSITION_TYPE), POINTER :: DECOMPOSITION !<A pointer to the decomposition to calculate the dual graph for.
+    INTEGER(INTG), INTENT(IN) :: ELEMENT_START !<The first global element in the range to calculate the graph for.
+    INTEGER(INTG), INTENT(IN) :: ELEMENT_STOP !<The last global element in the range to calculate the graph for.
+    INTEGER(INTG), INTENT(IN) :: NUMBER_OF_COMMON_NODES !<The minimum number of shared nodes for two elements to be adjacent.
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: ADJACENCY_PTR(:) !<On exit, the start of each element's adjacencies (C numbering).
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: ADJACENCIES(:) !<On exit, the adjacent global elements (C numbering).
+    INTEGER(INTG), ALLOCATABLE, INTENT(OUT) :: ADJACENCY_WEIGHTS(:) !<On exit, the number of nodes shared with each adjacent element.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: adjacency_idx,adjacent_element,candidate_idx,first_idx,MAX_NUMBER_OF_ADJACENCIES,ne,nn,np, &
+      & NUMBER_OF_CANDIDATES,surrounding_element_idx
+    INTEGER(INTG), ALLOCATABLE :: SHARED_NODES(:)
+    TYPE(MESH_TYPE), POINTER :: MESH
+    TYPE(MeshElementsType), POINTER :: ELEMENTS
+    TYPE(MeshNodesType), POINTER :: NODES
+
+    ENTERS("DECOMPOSITION_DUAL_GRAPH_CALCULATE",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(DECOMPOSITION)) THEN
+      MESH=>DECOMPOSITION%MESH
+      IF(ASSOCIATED(MESH)) THEN
+        ELEMENTS=>MESH%TOPOLOGY(DECOMPOSITION%MESH_COMPONENT_NUMBER)%PTR%ELEMENTS
+        NODES=>MESH%TOPOLOGY(DECOMPOSITION%MESH_COMPONENT_NUMBER)%PTR%NODES
+        IF(.NOT.ASSOCIATED(ELEMENTS)) CALL FlagError("Mesh topology elements is not associated.",ERR,ERROR,*999)
+        IF(.NOT.ASSOCIATED(NODES)) CALL FlagError("Mesh topology nodes is not associated.",ERR,ERROR,*999)
+        !Bound the number of adjacencies by counting every element around every node of my elements
+        MAX_NUMBER_OF_ADJACENCIES=0
+        DO ne=ELEMENT_START,ELEMENT_STOP
+          DO nn=1,ELEMENTS%ELEMENTS(ne)%BASIS%NUMBER_OF_NODES
+            np=ELEMENTS%ELEMENTS(ne)%MESH_ELEMENT_NODES(nn)
+            MAX_NUMBER_OF_ADJACENCIES=MAX_NUMBER_OF_ADJACENCIES+NODES%NODES(np)%numberOfSurroundingElements
+          ENDDO !nn
+        ENDDO !ne
+        ALLOCATE(ADJACENCY_PTR(0:ELEMENT_STOP-ELEMENT_START+1),STAT=ERR)
+        IF(ERR/=0) CALL FlagError("Could not allocate adjacency pointer.",ERR,ERROR,*999)
+        ALLOCATE(ADJACENCIES(0:MAX(MAX_NUMBER_OF_ADJACENCIES,1)-1),STAT=ERR)
+        IF(ERR/=0) CALL FlagError("Could not allocate adjacencies.",ERR,ERROR,*999)
+        ALLOCATE(ADJACENCY_WEIGHTS(0:MAX(MAX_NUMBER_OF_ADJACENCIES,1)-1),STAT=ERR)
+        IF(ERR/=0) CALL FlagError("Could not allocate adjacency weights.",ERR,ERROR,*999)
+        ALLOCATE(SHARED_NODES(MESH%NUMBER_OF_ELEMENTS),STAT=ERR)
+        IF(ERR/=0) CALL FlagError("Could not allocate shared nodes.",ERR,ERROR,*999)
+        SHARED_NODES=0
+        ADJACENCIES=0
+        ADJACENCY_WEIGHTS=0
+        adjacency_idx=0
+        ADJACENCY_PTR(0)=0
+        DO ne=ELEMENT_START,ELEMENT_STOP
+          !Count the nodes shared with each surrounding element, listing the candidates after the adjacencies so far
+          first_idx=adjacency_idx
+          NUMBER_OF_CANDIDATES=0
+          DO nn=1,ELEMENTS%ELEMENTS(ne)%BASIS%NUMBER_OF_NODES
+            np=ELEMENTS%ELEMENTS(ne)%MESH_ELEMENT_NODES(nn)
+            DO surrounding_element_idx=1,NODES%NODES(np)%numberOfSurroundingElements
+              adjacent_element=NODES%NODES(np)%surroundingElements(surrounding_element_idx)
+              IF(adjacent_element/=ne) THEN
+                IF(SHARED_NODES(adjacent_element)==0) THEN
+                  ADJACENCIES(first_idx+NUMBER_OF_CANDIDATES)=adjacent_element
+                  NUMBER_OF_CANDIDATES=NUMBER_OF_CANDIDATES+1
+                ENDIF
+                SHARED_NODES(adjacent_element)=SHARED_NODES(adjacent_element)+1
+              ENDIF
+            ENDDO !surrounding_element_idx
+          ENDDO !nn
+          !Keep the candidates that share enough nodes. The compacted list never overtakes the candidate being read.
+          DO candidate_idx=0,NUMBER_OF_CANDIDATES-1
+            adjacent_element=ADJACENCIES(first_idx+candidate_idx)
+            IF(SHARED_NODES(adjacent_element)>=NUMBER_OF_COMMON_NODES) THEN
+              ADJACENCIES(adjacency_idx)=adjacent_element-1 !C numbering
+              ADJACENCY_WEIGHTS(adjacency_idx)=SHARED_NODES(adjacent_element)
+              adjacency_idx=adjacency_idx+1
+            ENDIF
+            SHARED_NODES(adjacent_element)=0
+          ENDDO !candidate_idx
+          ADJACENCY_PTR(ne-ELEMENT_START+1)=adjacency_idx
+        ENDDO !ne
+        DEALLOCATE(SHARED_NODES)
+      ELSE
+        CALL FlagError("Decomposition mesh is not associated.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("Decomposition is not associated.",ERR,ERROR,*999)
+    ENDIF
+    
+    EXITS("DECOMPOSITION_DUAL_GRAPH_CALCULATE")
+    RETURN
+999 IF(ALLOCATED(SHARED_NODES)) DEALLOCATE(SHARED_NODES)
+    ERRORSEXITS("DECOMPOSITION_DUAL_GRAPH_CALCULATE",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE DECOMPOSITION_DUAL_GRAPH_CALCULATE
+
+  !
+  !================================================================================================================================
+  !
+
   !>Calculates the element domains for a decomposition of a mesh. \see OPENCMISS::CMISSDecompositionElementDomainCalculate
   SUBROUTINE DECOMPOSITION_ELEMENT_DOMAIN_CALCULATE(DECOMPOSITION,ERR,ERROR,*)
 
@@ -579,16 +712,16 @@ CONTAINS
     !Local Variables
     INTEGER(INTG) :: number_elem_indicies,elem_index,elem_count,ne,nn,my_computational_node_number,number_computational_nodes, &
       & no_computational_node,ELEMENT_START,ELEMENT_STOP,MY_ELEMENT_START,MY_ELEMENT_STOP,NUMBER_OF_ELEMENTS, &
-      & MY_NUMBER_OF_ELEMENTS,MPI_IERROR,MAX_NUMBER_ELEMENTS_PER_NODE,component_idx,minNumberXi
+      & MY_NUMBER_OF_ELEMENTS,MPI_IERROR,MAX_NUMBER_ELEMENTS_PER_NODE,component_idx,minNumberXi,mesh_component_idx, &
+      & NUMBER_OF_GAUSS
     INTEGER(INTG), ALLOCATABLE :: ELEMENT_COUNT(:),ELEMENT_PTR(:),ELEMENT_INDICIES(:),ELEMENT_DISTANCE(:),DISPLACEMENTS(:), &
-      & RECEIVE_COUNTS(:)
-    INTEGER(INTG) :: ELEMENT_WEIGHT(1),WEIGHT_FLAG,NUMBER_FLAG,NUMBER_OF_CONSTRAINTS, &
+      & RECEIVE_COUNTS(:),ELEMENT_WEIGHTS(:),ADJACENCY_PTR(:),ADJACENCIES(:),ADJACENCY_WEIGHTS(:)
+    INTEGER(INTG) :: WEIGHT_FLAG,NUMBER_FLAG,NUMBER_OF_CONSTRAINTS, &
       & NUMBER_OF_COMMON_NODES,PARMETIS_OPTIONS(0:2)
     !ParMETIS now has double for these
     !REAL(SP) :: UBVEC(1)
     !REAL(SP), ALLOCATABLE :: TPWGTS(:)
-    REAL(DP) :: UBVEC(1)
-    REAL(DP), ALLOCATABLE :: TPWGTS(:)
+    REAL(DP), ALLOCATABLE :: TPWGTS(:),UBVEC(:)
     REAL(DP) :: NUMBER_ELEMENTS_PER_NODE
     TYPE(BASIS_TYPE), POINTER :: BASIS
     TYPE(MESH_TYPE), POINTER :: MESH
@@ -663,8 +796,6 @@ CONTAINS
               IF(ERR/=0) CALL FlagError("Could not allocate element pointer list.",ERR,ERROR,*999)
               ALLOCATE(ELEMENT_INDICIES(0:number_elem_indicies-1),STAT=ERR)
               IF(ERR/=0) CALL FlagError("Could not allocate element indicies list.",ERR,ERROR,*999)
-              ALLOCATE(TPWGTS(1:DECOMPOSITION%NUMBER_OF_DOMAINS),STAT=ERR)
-              IF(ERR/=0) CALL FlagError("Could not allocate tpwgts.",ERR,ERROR,*999)
               elem_index=0
               elem_count=0
               ELEMENT_PTR(0)=0
@@ -681,16 +812,57 @@ CONTAINS
                 ELEMENT_PTR(elem_count)=elem_index !C numbering
               ENDDO !ne
               
+              !Set up the element weights, one for each balance constraint in turn for each of my elements
+              NUMBER_OF_CONSTRAINTS=1
+              IF(DECOMPOSITION%ELEMENT_WEIGHT_TYPE==DECOMPOSITION_USER_ELEMENT_WEIGHTS) THEN
+                IF(.NOT.ALLOCATED(DECOMPOSITION%ELEMENT_WEIGHTS)) &
+                  & CALL FlagError("The decomposition element weights have not been set.",ERR,ERROR,*999)
+                NUMBER_OF_CONSTRAINTS=DECOMPOSITION%NUMBER_OF_CONSTRAINTS
+              ENDIF
+              ALLOCATE(ELEMENT_WEIGHTS(NUMBER_OF_CONSTRAINTS*MY_NUMBER_OF_ELEMENTS),STAT=ERR)
+              IF(ERR/=0) CALL FlagError("Could not allocate element weights.",ERR,ERROR,*999)
+              SELECT CASE(DECOMPOSITION%ELEMENT_WEIGHT_TYPE)
+              CASE(DECOMPOSITION_UNIFORM_ELEMENT_WEIGHTS)
+                WEIGHT_FLAG=0 !No weights
+                ELEMENT_WEIGHTS=1 !Isn't used due to weight flag
+              CASE(DECOMPOSITION_BASIS_ELEMENT_WEIGHTS)
+                WEIGHT_FLAG=2 !Element weights
+                elem_count=0
+                DO ne=MY_ELEMENT_START,MY_ELEMENT_STOP
+                  elem_count=elem_count+1
+                  ELEMENT_WEIGHTS(elem_count)=0
+                  DO mesh_component_idx=1,MESH%NUMBER_OF_COMPONENTS
+                    BASIS=>MESH%TOPOLOGY(mesh_component_idx)%PTR%ELEMENTS%ELEMENTS(ne)%BASIS
+                    NUMBER_OF_GAUSS=1
+                    IF(ALLOCATED(BASIS%QUADRATURE%QUADRATURE_SCHEME_MAP)) THEN
+                      IF(ASSOCIATED(BASIS%QUADRATURE%QUADRATURE_SCHEME_MAP(BASIS_DEFAULT_QUADRATURE_SCHEME)%PTR)) &
+                        & NUMBER_OF_GAUSS=BASIS%QUADRATURE%QUADRATURE_SCHEME_MAP(BASIS_DEFAULT_QUADRATURE_SCHEME)%PTR% &
+                        & NUMBER_OF_GAUSS
+                    ENDIF
+                    ELEMENT_WEIGHTS(elem_count)=ELEMENT_WEIGHTS(elem_count)+BASIS%NUMBER_OF_ELEMENT_PARAMETERS*NUMBER_OF_GAUSS
+                  ENDDO !mesh_component_idx
+                ENDDO !ne
+              CASE(DECOMPOSITION_USER_ELEMENT_WEIGHTS)
+                WEIGHT_FLAG=2 !Element weights
+                ELEMENT_WEIGHTS=RESHAPE(DECOMPOSITION%ELEMENT_WEIGHTS(:,MY_ELEMENT_START:MY_ELEMENT_STOP), &
+                  & [NUMBER_OF_CONSTRAINTS*MY_NUMBER_OF_ELEMENTS])
+              CASE DEFAULT
+                LOCAL_ERROR="The decomposition element weight type of "// &
+                  & TRIM(NUMBER_TO_VSTRING(DECOMPOSITION%ELEMENT_WEIGHT_TYPE,"*",ERR,ERROR))//" is invalid."
+                CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+              END SELECT
+
               !Set up ParMETIS variables
-              WEIGHT_FLAG=0 !No weights
-              ELEMENT_WEIGHT(1)=1 !Isn't used due to weight flag
               NUMBER_FLAG=0 !C Numbering as there is a bug with Fortran numbering
-              NUMBER_OF_CONSTRAINTS=1
               IF(minNumberXi==1) THEN
                 NUMBER_OF_COMMON_NODES=1
               ELSE
                 NUMBER_OF_COMMON_NODES=2
               ENDIF
+              ALLOCATE(TPWGTS(1:NUMBER_OF_CONSTRAINTS*DECOMPOSITION%NUMBER_OF_DOMAINS),STAT=ERR)
+              IF(ERR/=0) CALL FlagError("Could not allocate tpwgts.",ERR,ERROR,*999)
+              ALLOCATE(UBVEC(1:NUMBER_OF_CONSTRAINTS),STAT=ERR)
+              IF(ERR/=0) CALL FlagError("Could not allocate ubvec.",ERR,ERROR,*999)
               !ParMETIS now has doule precision for these
               !TPWGTS=1.0_SP/REAL(DECOMPOSITION%NUMBER_OF_DOMAINS,SP)
               !UBVEC=1.05_SP
@@ -700,11 +872,33 @@ CONTAINS
               PARMETIS_OPTIONS(1)=7 !Level of information to output
               PARMETIS_OPTIONS(2)=CMISS_RANDOM_SEEDS(1) !Seed for random number generator
               
-              !Call ParMETIS to calculate the partitioning of the mesh graph.
-              CALL PARMETIS_PARTMESHKWAY(ELEMENT_DISTANCE,ELEMENT_PTR,ELEMENT_INDICIES,ELEMENT_WEIGHT,WEIGHT_FLAG,NUMBER_FLAG, &
-                & NUMBER_OF_CONSTRAINTS,NUMBER_OF_COMMON_NODES,DECOMPOSITION%NUMBER_OF_DOMAINS,TPWGTS,UBVEC,PARMETIS_OPTIONS, &
-                & DECOMPOSITION%NUMBER_OF_EDGES_CUT,DECOMPOSITION%ELEMENT_DOMAIN(DISPLACEMENTS(my_computational_node_number)+1:), &
-                & COMPUTATIONAL_ENVIRONMENT%MPI_COMM,ERR,ERROR,*999)
+              SELECT CASE(DECOMPOSITION%PARTITION_METHOD)
+              CASE(DECOMPOSITION_MESH_KWAY_PARTITION)
+                !Call ParMETIS to calculate the partitioning of the mesh graph.
+                CALL PARMETIS_PARTMESHKWAY(ELEMENT_DISTANCE,ELEMENT_PTR,ELEMENT_INDICIES,ELEMENT_WEIGHTS,WEIGHT_FLAG, &
+                  & NUMBER_FLAG,NUMBER_OF_CONSTRAINTS,NUMBER_OF_COMMON_NODES,DECOMPOSITION%NUMBER_OF_DOMAINS,TPWGTS,UBVEC, &
+                  & PARMETIS_OPTIONS,DECOMPOSITION%NUMBER_OF_EDGES_CUT, &
+                  & DECOMPOSITION%ELEMENT_DOMAIN(DISPLACEMENTS(my_computational_node_number)+1:), &
+                  & COMPUTATIONAL_ENVIRONMENT%MPI_COMM,ERR,ERROR,*999)
+              CASE(DECOMPOSITION_DUAL_GRAPH_KWAY_PARTITION)
+                !Build the dual graph of my elements, with the edges weighted by the number of shared nodes, and call ParMETIS
+                !to calculate the partitioning of it.
+                CALL DECOMPOSITION_DUAL_GRAPH_CALCULATE(DECOMPOSITION,MY_ELEMENT_START,MY_ELEMENT_STOP,NUMBER_OF_COMMON_NODES, &
+                  & ADJACENCY_PTR,ADJACENCIES,ADJACENCY_WEIGHTS,ERR,ERROR,*999)
+                WEIGHT_FLAG=WEIGHT_FLAG+1 !Edge weights as well
+                CALL PARMETIS_PARTKWAY(ELEMENT_DISTANCE,ADJACENCY_PTR,ADJACENCIES,ELEMENT_WEIGHTS,ADJACENCY_WEIGHTS,WEIGHT_FLAG, &
+                  & NUMBER_FLAG,NUMBER_OF_CONSTRAINTS,DECOMPOSITION%NUMBER_OF_DOMAINS,TPWGTS,UBVEC,PARMETIS_OPTIONS, &
+                  & DECOMPOSITION%NUMBER_OF_EDGES_CUT, &
+                  & DECOMPOSITION%ELEMENT_DOMAIN(DISPLACEMENTS(my_computational_node_number)+1:), &
+                  & COMPUTATIONAL_ENVIRONMENT%MPI_COMM,ERR,ERROR,*999)
+                DEALLOCATE(ADJACENCY_PTR)
+                DEALLOCATE(ADJACENCIES)
+                DEALLOCATE(ADJACENCY_WEIGHTS)
+              CASE DEFAULT
+                LOCAL_ERROR="The decomposition partition method of "// &
+                  & TRIM(NUMBER_TO_VSTRING(DECOMPOSITION%PARTITION_METHOD,"*",ERR,ERROR))//" is invalid."
+                CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+              END SELECT
               
               !Transfer all the element domain information to the other computational nodes so that each rank has all the info
               IF(number_computational_nodes>1) THEN
@@ -719,7 +913,9 @@ CONTAINS
               DEALLOCATE(ELEMENT_DISTANCE)
               DEALLOCATE(ELEMENT_PTR)
               DEALLOCATE(ELEMENT_INDICIES)
+              DEALLOCATE(ELEMENT_WEIGHTS)
               DEALLOCATE(TPWGTS)
+              DEALLOCATE(UBVEC)
 
             ENDIF
             
@@ -792,7 +988,12 @@ CONTAINS
     IF(ALLOCATED(ELEMENT_DISTANCE)) DEALLOCATE(ELEMENT_DISTANCE)
     IF(ALLOCATED(ELEMENT_PTR)) DEALLOCATE(ELEMENT_PTR)
     IF(ALLOCATED(ELEMENT_INDICIES)) DEALLOCATE(ELEMENT_INDICIES)
+    IF(ALLOCATED(ELEMENT_WEIGHTS)) DEALLOCATE(ELEMENT_WEIGHTS)
+    IF(ALLOCATED(ADJACENCY_PTR)) DEALLOCATE(ADJACENCY_PTR)
+    IF(ALLOCATED(ADJACENCIES)) DEALLOCATE(ADJACENCIES)
+    IF(ALLOCATED(ADJACENCY_WEIGHTS)) DEALLOCATE(ADJACENCY_WEIGHTS)
     IF(ALLOCATED(TPWGTS)) DEALLOCATE(TPWGTS)
+    IF(ALLOCATED(UBVEC)) DEALLOCATE(UBVEC)
     ERRORSEXITS("DECOMPOSITION_ELEMENT_DOMAIN_CALCULATE",ERR,ERROR)
     RETURN 1
   END SUBROUTINE DECOMPOSITION_ELEMENT_DOMAIN_CALCULATE
@@ -930,6 +1131,107 @@ CONTAINS
 999 ERRORSEXITS("DECOMPOSITION_ELEMENT_DOMAIN_SET",ERR,ERROR)
     RETURN 1
   END SUBROUTINE DECOMPOSITION_ELEMENT_DOMAIN_SET
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the type of element weights used to balance a calculated decomposition. \see OPENCMISS::cmfe_DecompositionElementWeightTypeSet
+  SUBROUTINE DECOMPOSITION_ELEMENT_WEIGHT_TYPE_SET(DECOMPOSITION,WEIGHT_TYPE,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(DECOMPOSITION_TYPE), POINTER :: DECOMPOSITION !<A pointer to the decomposition to set the element weight type for
+    INTEGER(INTG), INTENT(IN) :: WEIGHT_TYPE !<The element weight type to set \see MESH_ROUTINES_DecompositionElementWeightTypes,MESH_ROUTINES
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("DECOMPOSITION_ELEMENT_WEIGHT_TYPE_SET",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(DECOMPOSITION)) THEN
+      IF(DECOMPOSITION%DECOMPOSITION_FINISHED) THEN
+        CALL FlagError("Decomposition has been finished.",ERR,ERROR,*999)
+      ELSE
+        SELECT CASE(WEIGHT_TYPE)
+        CASE(DECOMPOSITION_UNIFORM_ELEMENT_WEIGHTS)
+          DECOMPOSITION%ELEMENT_WEIGHT_TYPE=DECOMPOSITION_UNIFORM_ELEMENT_WEIGHTS
+        CASE(DECOMPOSITION_BASIS_ELEMENT_WEIGHTS)
+          DECOMPOSITION%ELEMENT_WEIGHT_TYPE=DECOMPOSITION_BASIS_ELEMENT_WEIGHTS
+        CASE(DECOMPOSITION_USER_ELEMENT_WEIGHTS)
+          IF(.NOT.ALLOCATED(DECOMPOSITION%ELEMENT_WEIGHTS)) &
+            & CALL FlagError("Decomposition element weights must be set before using user element weights.",ERR,ERROR,*999)
+          DECOMPOSITION%ELEMENT_WEIGHT_TYPE=DECOMPOSITION_USER_ELEMENT_WEIGHTS
+        CASE DEFAULT
+          LOCAL_ERROR="Decomposition element weight type "//TRIM(NUMBER_TO_VSTRING(WEIGHT_TYPE,"*",ERR,ERROR))// &
+            & " is not valid."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        END SELECT
+      ENDIF
+    ELSE
+      CALL FlagError("Decomposition is not associated.",ERR,ERROR,*999)
+    ENDIF
+    
+    EXITS("DECOMPOSITION_ELEMENT_WEIGHT_TYPE_SET")
+    RETURN
+999 ERRORSEXITS("DECOMPOSITION_ELEMENT_WEIGHT_TYPE_SET",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE DECOMPOSITION_ELEMENT_WEIGHT_TYPE_SET
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets the user element weights used to balance a calculated decomposition. Each element may have a weight for each of a
+  !>number of balance constraints, and the partitioner balances every constraint across the domains. Setting the weights sets
+  !>the element weight type to user weights. \see OPENCMISS::cmfe_DecompositionElementWeightsSet
+  SUBROUTINE DECOMPOSITION_ELEMENT_WEIGHTS_SET(DECOMPOSITION,ELEMENT_WEIGHTS,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(DECOMPOSITION_TYPE), POINTER :: DECOMPOSITION !<A pointer to the decomposition to set the element weights for
+    INTEGER(INTG), INTENT(IN) :: ELEMENT_WEIGHTS(:,:) !<ELEMENT_WEIGHTS(constraint_idx,ne). The weight of the constraint_idx'th balance constraint for the ne'th global element.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(MESH_TYPE), POINTER :: MESH
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("DECOMPOSITION_ELEMENT_WEIGHTS_SET",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(DECOMPOSITION)) THEN
+      IF(DECOMPOSITION%DECOMPOSITION_FINISHED) THEN
+        CALL FlagError("Decomposition has been finished.",ERR,ERROR,*999)
+      ELSE
+        MESH=>DECOMPOSITION%MESH
+        IF(ASSOCIATED(MESH)) THEN
+          IF(SIZE(ELEMENT_WEIGHTS,1)<1) CALL FlagError("At least one element weight constraint must be specified.", &
+            & ERR,ERROR,*999)
+          IF(SIZE(ELEMENT_WEIGHTS,2)/=MESH%NUMBER_OF_ELEMENTS) THEN
+            LOCAL_ERROR="The number of element weights of "//TRIM(NUMBER_TO_VSTRING(SIZE(ELEMENT_WEIGHTS,2),"*",ERR,ERROR))// &
+              & " does not match the number of elements in the mesh of "// &
+              & TRIM(NUMBER_TO_VSTRING(MESH%NUMBER_OF_ELEMENTS,"*",ERR,ERROR))//"."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          ENDIF
+          IF(ANY(ELEMENT_WEIGHTS<0)) CALL FlagError("Decomposition element weights must be non-negative.",ERR,ERROR,*999)
+          IF(ALLOCATED(DECOMPOSITION%ELEMENT_WEIGHTS)) DEALLOCATE(DECOMPOSITION%ELEMENT_WEIGHTS)
+          ALLOCATE(DECOMPOSITION%ELEMENT_WEIGHTS(SIZE(ELEMENT_WEIGHTS,1),SIZE(ELEMENT_WEIGHTS,2)),STAT=ERR)
+          IF(ERR/=0) CALL FlagError("Could not allocate decomposition element weights.",ERR,ERROR,*999)
+          DECOMPOSITION%ELEMENT_WEIGHTS=ELEMENT_WEIGHTS
+          DECOMPOSITION%NUMBER_OF_CONSTRAINTS=SIZE(ELEMENT_WEIGHTS,1)
+          DECOMPOSITION%ELEMENT_WEIGHT_TYPE=DECOMPOSITION_USER_ELEMENT_WEIGHTS
+        ELSE
+          CALL FlagError("Decomposition mesh is not associated.",ERR,ERROR,*999)
+        ENDIF
+      ENDIF
+    ELSE
+      CALL FlagError("Decomposition is not associated.",ERR,ERROR,*999)
+    ENDIF
+    
+    EXITS("DECOMPOSITION_ELEMENT_WEIGHTS_SET")
+    RETURN
+999 ERRORSEXITS("DECOMPOSITION_ELEMENT_WEIGHTS_SET",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE DECOMPOSITION_ELEMENT_WEIGHTS_SET
   
   !
   !================================================================================================================================
@@ -1123,6 +1425,48 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Sets/changes the method used to partition the elements of a calculated decomposition. \see OPENCMISS::cmfe_DecompositionPartitionMethodSet
+  SUBROUTINE DECOMPOSITION_PARTITION_METHOD_SET(DECOMPOSITION,PARTITION_METHOD,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(DECOMPOSITION_TYPE), POINTER :: DECOMPOSITION !<A pointer to the decomposition to set the partition method for
+    INTEGER(INTG), INTENT(IN) :: PARTITION_METHOD !<The partition method to set \see MESH_ROUTINES_DecompositionPartitionMethods,MESH_ROUTINES
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("DECOMPOSITION_PARTITION_METHOD_SET",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(DECOMPOSITION)) THEN
+      IF(DECOMPOSITION%DECOMPOSITION_FINISHED) THEN
+        CALL FlagError("Decomposition has been finished.",ERR,ERROR,*999)
+      ELSE
+        SELECT CASE(PARTITION_METHOD)
+        CASE(DECOMPOSITION_MESH_KWAY_PARTITION)
+          DECOMPOSITION%PARTITION_METHOD=DECOMPOSITION_MESH_KWAY_PARTITION
+        CASE(DECOMPOSITION_DUAL_GRAPH_KWAY_PARTITION)
+          DECOMPOSITION%PARTITION_METHOD=DECOMPOSITION_DUAL_GRAPH_KWAY_PARTITION
+        CASE DEFAULT
+          LOCAL_ERROR="Decomposition partition method "//TRIM(NUMBER_TO_VSTRING(PARTITION_METHOD,"*",ERR,ERROR))// &
+            & " is not valid."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        END SELECT
+      ENDIF
+    ELSE
+      CALL FlagError("Decomposition is not associated.",ERR,ERROR,*999)
+    ENDIF
+    
+    EXITS("DECOMPOSITION_PARTITION_METHOD_SET")
+    RETURN
+999 ERRORSEXITS("DECOMPOSITION_PARTITION_METHOD_SET",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE DECOMPOSITION_PARTITION_METHOD_SET
+
+  !
+  !================================================================================================================================
+  !
+
   !>Calculates the topology for a decomposition.
   SUBROUTINE DECOMPOSITION_TOPOLOGY_CALCULATE(DECOMPOSITION,ERR,ERROR,*)
 
@@ -4049,6 +4393,7 @@ CONTAINS
                 CALL LIST_DATA_TYPE_SET(ADJACENT_ELEMENTS_LIST(domain_idx)%PTR,LIST_INTG_TYPE,ERR,ERROR,*999)
                 CALL LIST_INITIAL_SIZE_SET(ADJACENT_ELEMENTS_LIST(domain_idx)%PTR,MAX(INT(MESH%NUMBER_OF_ELEMENTS/2),1), &
                   & ERR,ERROR,*999)
+                CALL LIST_DUPLICATES_METHOD_SET(ADJACENT_ELEMENTS_LIST(domain_idx)%PTR,LIST_HASH_DUPLICATES_METHOD,ERR,ERROR,*999)
                 CALL LIST_CREATE_FINISH(ADJACENT_ELEMENTS_LIST(domain_idx)%PTR,ERR,ERROR,*999)
               ENDDO !domain_idx
             
@@ -4062,6 +4407,7 @@ CONTAINS
                 CALL LIST_CREATE_START(ADJACENT_DOMAINS_LIST,ERR,ERROR,*999)
                 CALL LIST_DATA_TYPE_SET(ADJACENT_DOMAINS_LIST,LIST_INTG_TYPE,ERR,ERROR,*999)
                 CALL LIST_INITIAL_SIZE_SET(ADJACENT_DOMAINS_LIST,DECOMPOSITION%NUMBER_OF_DOMAINS,ERR,ERROR,*999)
+                CALL LIST_DUPLICATES_METHOD_SET(ADJACENT_DOMAINS_LIST,LIST_HASH_DUPLICATES_METHOD,ERR,ERROR,*999)
                 CALL LIST_CREATE_FINISH(ADJACENT_DOMAINS_LIST,ERR,ERROR,*999)
                 CALL LIST_ITEM_ADD(ADJACENT_DOMAINS_LIST,domain_no,ERR,ERROR,*999)
                 DO nn=1,BASIS%NUMBER_OF_NODES
@@ -4098,7 +4444,9 @@ CONTAINS
               
               !Compute ghost element mappings
               DO domain_idx=0,DECOMPOSITION%NUMBER_OF_DOMAINS-1
+                !Only the unique ghost elements need to be sorted so that they are numbered in ascending global order
                 CALL LIST_REMOVE_DUPLICATES(ADJACENT_ELEMENTS_LIST(domain_idx)%PTR,ERR,ERROR,*999)
+                CALL LIST_SORT(ADJACENT_ELEMENTS_LIST(domain_idx)%PTR,ERR,ERROR,*999)
                 CALL LIST_DETACH_AND_DESTROY(ADJACENT_ELEMENTS_LIST(domain_idx)%PTR,NUMBER_OF_ADJACENT_ELEMENTS, &
                   & ADJACENT_ELEMENTS,ERR,ERROR,*999)
                 DO no_adjacent_element=1,NUMBER_OF_ADJACENT_ELEMENTS
@@ -4426,6 +4774,7 @@ CONTAINS
                     CALL LIST_DATA_TYPE_SET(GHOST_NODES_LIST(domain_idx)%PTR,LIST_INTG_TYPE,ERR,ERROR,*999)
                     CALL LIST_INITIAL_SIZE_SET(GHOST_NODES_LIST(domain_idx)%PTR,INT(MESH_TOPOLOGY%NODES%numberOfNodes/2), &
                       & ERR,ERROR,*999)
+                    CALL LIST_DUPLICATES_METHOD_SET(GHOST_NODES_LIST(domain_idx)%PTR,LIST_HASH_DUPLICATES_METHOD,ERR,ERROR,*999)
                     CALL LIST_CREATE_FINISH(GHOST_NODES_LIST(domain_idx)%PTR,ERR,ERROR,*999)
                   ENDDO !domain_idx
                   ALLOCATE(NUMBER_INTERNAL_NODES(0:DECOMPOSITION%NUMBER_OF_DOMAINS-1),STAT=ERR)
@@ -4446,6 +4795,7 @@ CONTAINS
                     CALL LIST_CREATE_START(ALL_ADJACENT_DOMAINS_LIST,ERR,ERROR,*999)
                     CALL LIST_DATA_TYPE_SET(ALL_ADJACENT_DOMAINS_LIST,LIST_INTG_TYPE,ERR,ERROR,*999)
                     CALL LIST_INITIAL_SIZE_SET(ALL_ADJACENT_DOMAINS_LIST,DECOMPOSITION%NUMBER_OF_DOMAINS,ERR,ERROR,*999)
+                    CALL LIST_DUPLICATES_METHOD_SET(ALL_ADJACENT_DOMAINS_LIST,LIST_HASH_DUPLICATES_METHOD,ERR,ERROR,*999)
                     CALL LIST_CREATE_FINISH(ALL_ADJACENT_DOMAINS_LIST,ERR,ERROR,*999)
                     DO no_adjacent_element=1,MESH_TOPOLOGY%NODES%NODES(node_idx)%numberOfSurroundingElements
                       adjacent_element=MESH_TOPOLOGY%NODES%NODES(node_idx)%surroundingElements(no_adjacent_element)
@@ -4600,7 +4950,9 @@ CONTAINS
                   
                   !Calculate ghost node and dof mappings
                   DO domain_idx=0,DECOMPOSITION%NUMBER_OF_DOMAINS-1
+                    !Only the unique ghost nodes need to be sorted so that they are numbered in ascending global order
                     CALL LIST_REMOVE_DUPLICATES(GHOST_NODES_LIST(domain_idx)%PTR,ERR,ERROR,*999)
+                    CALL LIST_SORT(GHOST_NODES_LIST(domain_idx)%PTR,ERR,ERROR,*999)
                     CALL LIST_DETACH_AND_DESTROY(GHOST_NODES_LIST(domain_idx)%PTR,NUMBER_OF_GHOST_NODES,GHOST_NODES,ERR,ERROR,*999)
                     DO no_ghost_node=1,NUMBER_OF_GHOST_NODES
                       ghost_node=GHOST_NODES(no_ghost_node)
@@ -60,6 +60,7 @@ MODULE OpenCMISS_Iron
   USE BASIS_ROUTINES
   USE BIOELECTRIC_FINITE_ELASTICITY_ROUTINES
   USE BOUNDARY_CONDITIONS_ROUTINES
+  USE CHECKPOINT_ROUTINES
   USE Cmiss
   USE CMISS_CELLML
   USE COMP_ENVIRONMENT
@@ -1077,6 +1078,18 @@ MODULE OpenCMISS_Iron
     MODULE PROCEDURE cmfe_CellML_VariableSetAsKnownObjVS
   END INTERFACE cmfe_CellML_VariableSetAsKnown
 
+  !>Set a CellML model state variable as being a gating variable (integrated exactly by the Rush-Larsen DAE solver)
+  INTERFACE cmfe_CellML_GatingVariableSet
+    MODULE PROCEDURE cmfe_CellML_GatingVariableSetNumberC
+    MODULE PROCEDURE cmfe_CellML_GatingVariableSetObjC
+  END INTERFACE cmfe_CellML_GatingVariableSet
+
+  !>Set the batched RHS routine of a CellML model, used when the DAE solver integrates the cells in batches
+  INTERFACE cmfe_CellML_BatchRHSRoutineSet
+    MODULE PROCEDURE cmfe_CellML_BatchRHSRoutineSetNumber
+    MODULE PROCEDURE cmfe_CellML_BatchRHSRoutineSetObj
+  END INTERFACE cmfe_CellML_BatchRHSRoutineSet
+
   !>Set a CellML model variable as being wanted (the value will be extracted from the model to an OpenCMISS field)
   INTERFACE cmfe_CellML_VariableSetAsWanted
     MODULE PROCEDURE cmfe_CellML_VariableSetAsWantedNumberC
@@ -1229,6 +1242,10 @@ MODULE OpenCMISS_Iron
 
   PUBLIC cmfe_CellML_VariableSetAsKnown,cmfe_CellML_VariableSetAsWanted
 
+  PUBLIC cmfe_CellML_GatingVariableSet
+
+  PUBLIC cmfe_CellML_BatchRHSRoutineSet
+
   PUBLIC cmfe_CellML_CreateCellMLToFieldMap,cmfe_CellML_CreateFieldToCellMLMap
 
   PUBLIC cmfe_CellML_CreateFinish,cmfe_CellML_CreateStart
@@ -1799,6 +1816,13 @@ MODULE OpenCMISS_Iron
   INTEGER(INTG), PARAMETER :: CMFE_DATA_PROJECTION_BOUNDARY_FACES_PROJECTION_TYPE = DATA_PROJECTION_BOUNDARY_FACES_PROJECTION_TYPE!<The boundary face projection type for data projection, only projects to boundary faces of the mesh. \see OPENCMISS_DataProjectionProjectionTypes,OPENCMISS
   INTEGER(INTG), PARAMETER :: CMFE_DATA_PROJECTION_ALL_ELEMENTS_PROJECTION_TYPE = DATA_PROJECTION_ALL_ELEMENTS_PROJECTION_TYPE !<The element projection type for data projection, projects to all elements in mesh. \see OPENCMISS_DataProjectionProjectionTypes,OPENCMISS
   !>@}
+  !> \addtogroup OPENCMISS_DataProjectionSpatialIndexTypes OPENCMISS::DataProjection::SpatialIndexTypes
+  !> \brief Data projection spatial index types for finding the closest candidates
+  !> \see OPENCMISS::DataProjection,OPENCMISS
+  !>@{
+  INTEGER(INTG), PARAMETER :: CMFE_DATA_PROJECTION_NO_SPATIAL_INDEX = DATA_PROJECTION_NO_SPATIAL_INDEX !<No spatial index, the distance to every candidate is evaluated for each data point. \see OPENCMISS_DataProjectionSpatialIndexTypes,OPENCMISS
+  INTEGER(INTG), PARAMETER :: CMFE_DATA_PROJECTION_GRID_SPATIAL_INDEX = DATA_PROJECTION_GRID_SPATIAL_INDEX !<A uniform grid of the candidate positions at the starting xi is used to find the closest candidates for each data point. \see OPENCMISS_DataProjectionSpatialIndexTypes,OPENCMISS
+  !>@}
   !>@}
 
   !Module types
@@ -1885,6 +1909,18 @@ MODULE OpenCMISS_Iron
     MODULE PROCEDURE cmfe_DataProjection_NumberOfClosestElementsSetNumber
     MODULE PROCEDURE cmfe_DataProjection_NumberOfClosestElementsSetObj
   END INTERFACE cmfe_DataProjection_NumberOfClosestElementsSet
+
+  !>Sets/changes whether the interpolation parameters are cached during the evaluation of a data projection.
+  INTERFACE cmfe_DataProjection_ParametersCacheEnabledSet
+    MODULE PROCEDURE cmfe_DataProjection_ParametersCacheEnabledSetNumber
+    MODULE PROCEDURE cmfe_DataProjection_ParametersCacheEnabledSetObj
+  END INTERFACE cmfe_DataProjection_ParametersCacheEnabledSet
+
+  !>Returns the interpolation parameters cache statistics of the last evaluation of a data projection.
+  INTERFACE cmfe_DataProjection_ParametersCacheStatisticsGet
+    MODULE PROCEDURE cmfe_DataProjection_ParametersCacheStatisticsGetNumber
+    MODULE PROCEDURE cmfe_DataProjection_ParametersCacheStatisticsGetObj
+  END INTERFACE cmfe_DataProjection_ParametersCacheStatisticsGet
   
   !>Set the candidate element numbers and their local face/line numbers
   INTERFACE cmfe_DataProjection_ProjectionCandidatesSet
@@ -1917,6 +1953,18 @@ MODULE OpenCMISS_Iron
     MODULE PROCEDURE cmfe_DataProjection_RelativeToleranceSetObj
   END INTERFACE cmfe_DataProjection_RelativeToleranceSet
 
+  !>Returns the spatial index type for a data projection.
+  INTERFACE cmfe_DataProjection_SpatialIndexGet
+    MODULE PROCEDURE cmfe_DataProjection_SpatialIndexGetNumber
+    MODULE PROCEDURE cmfe_DataProjection_SpatialIndexGetObj
+  END INTERFACE cmfe_DataProjection_SpatialIndexGet
+
+  !>Sets/changes the spatial index type for a data projection.
+  INTERFACE cmfe_DataProjection_SpatialIndexSet
+    MODULE PROCEDURE cmfe_DataProjection_SpatialIndexSetNumber
+    MODULE PROCEDURE cmfe_DataProjection_SpatialIndexSetObj
+  END INTERFACE cmfe_DataProjection_SpatialIndexSet
+
   !>Returns the starting xi for a data projection.
   INTERFACE cmfe_DataProjection_StartingXiGet
     MODULE PROCEDURE cmfe_DataProjection_StartingXiGetNumber
@@ -2008,6 +2056,8 @@ MODULE OpenCMISS_Iron
 
   PUBLIC CMFE_DATA_PROJECTION_ALL_ELEMENTS_PROJECTION_TYPE
 
+  PUBLIC CMFE_DATA_PROJECTION_NO_SPATIAL_INDEX,CMFE_DATA_PROJECTION_GRID_SPATIAL_INDEX
+
   PUBLIC cmfe_DataProjection_AbsoluteToleranceGet,cmfe_DataProjection_AbsoluteToleranceSet
 
   PUBLIC cmfe_DataProjection_CreateFinish,cmfe_DataProjection_CreateStart
@@ -2026,10 +2076,14 @@ MODULE OpenCMISS_Iron
 
   PUBLIC cmfe_DataProjection_NumberOfClosestElementsGet,cmfe_DataProjection_NumberOfClosestElementsSet
 
+  PUBLIC cmfe_DataProjection_ParametersCacheEnabledSet,cmfe_DataProjection_ParametersCacheStatisticsGet
+
   PUBLIC cmfe_DataProjection_ProjectionTypeGet,cmfe_DataProjection_ProjectionTypeSet
 
   PUBLIC cmfe_DataProjection_RelativeToleranceGet,cmfe_DataProjection_RelativeToleranceSet
 
+  PUBLIC cmfe_DataProjection_SpatialIndexGet,cmfe_DataProjection_SpatialIndexSet
+
   PUBLIC cmfe_DataProjection_StartingXiGet,cmfe_DataProjection_StartingXiSet
 
   PUBLIC cmfe_DataProjection_ElementSet
@@ -3213,6 +3267,12 @@ MODULE OpenCMISS_Iron
     MODULE PROCEDURE cmfe_EquationsSet_AnalyticUserParamSetObj
   END INTERFACE cmfe_EquationsSet_AnalyticUserParamSet
 
+  !>Sets/changes the number of threads to use when assembling the element matrices and vectors of an equations set.
+  INTERFACE cmfe_EquationsSet_AssemblyThreadsSet
+    MODULE PROCEDURE cmfe_EquationsSet_AssemblyThreadsSetNumber
+    MODULE PROCEDURE cmfe_EquationsSet_AssemblyThreadsSetObj
+  END INTERFACE cmfe_EquationsSet_AssemblyThreadsSet
+
   PUBLIC cmfe_EquationsSet_AnalyticCreateFinish,cmfe_EquationsSet_AnalyticCreateStart
 
   PUBLIC cmfe_EquationsSet_AnalyticDestroy
@@ -3221,6 +3281,8 @@ MODULE OpenCMISS_Iron
 
   PUBLIC cmfe_EquationsSet_AnalyticTimeGet,cmfe_EquationsSet_AnalyticTimeSet
 
+  PUBLIC cmfe_EquationsSet_AssemblyThreadsSet
+
   PUBLIC cmfe_EquationsSet_CreateFinish,cmfe_EquationsSet_CreateStart
 
   PUBLIC cmfe_EquationsSet_Destroy
@@ -4107,7 +4169,16 @@ MODULE OpenCMISS_Iron
     MODULE PROCEDURE cmfe_Fields_NodesExportVSVSObj
   END INTERFACE cmfe_Fields_NodesExport
 
-  PUBLIC cmfe_Fields_ElementsExport,cmfe_Fields_NodesExport
+  INTERFACE cmfe_Fields_Import
+    MODULE PROCEDURE cmfe_Fields_ImportCObj
+    MODULE PROCEDURE cmfe_Fields_ImportVSObj
+  END INTERFACE cmfe_Fields_Import
+
+  PUBLIC cmfe_Fields_ElementsExport,cmfe_Fields_NodesExport,cmfe_Fields_Import
+
+  PUBLIC cmfe_Fields_ExportAsynchronousSet,cmfe_Fields_ExportWait
+
+  PUBLIC cmfe_Fields_ExnodeToBinary
 
   PUBLIC cmfe_ReadMeshInfo,cmfe_ReadMeshFiles
 
@@ -4791,6 +4862,21 @@ MODULE OpenCMISS_Iron
   INTEGER(INTG), PARAMETER :: CMFE_DECOMPOSITION_CALCULATED_TYPE = DECOMPOSITION_CALCULATED_TYPE !<The element decomposition is calculated by graph partitioning. \see OPENCMISS_DecompositionTypes,OPENCMISS
   INTEGER(INTG), PARAMETER :: CMFE_DECOMPOSITION_USER_DEFINED_TYPE = DECOMPOSITION_USER_DEFINED_TYPE !<The user will set the element decomposition. \see OPENCMISS_DecompositionTypes,OPENCMISS
   !>@}
+  !> \addtogroup OPENCMISS_DecompositionPartitionMethods OPENCMISS::Mesh::DecompositionPartitionMethods
+  !> \brief The methods used to partition the elements of a calculated decomposition.
+  !> \see OPENCMISS::Mesh,OPENCMISS
+  !>@{
+  INTEGER(INTG), PARAMETER :: CMFE_DECOMPOSITION_MESH_KWAY_PARTITION = DECOMPOSITION_MESH_KWAY_PARTITION !<The elements are partitioned by a k-way partition of the mesh. \see OPENCMISS_DecompositionPartitionMethods,OPENCMISS
+  INTEGER(INTG), PARAMETER :: CMFE_DECOMPOSITION_DUAL_GRAPH_KWAY_PARTITION = DECOMPOSITION_DUAL_GRAPH_KWAY_PARTITION !<The elements are partitioned by a k-way partition of the element dual graph with the edges weighted by the number of shared nodes. \see OPENCMISS_DecompositionPartitionMethods,OPENCMISS
+  !>@}
+  !> \addtogroup OPENCMISS_DecompositionElementWeightTypes OPENCMISS::Mesh::DecompositionElementWeightTypes
+  !> \brief The element weights used to balance a calculated decomposition.
+  !> \see OPENCMISS::Mesh,OPENCMISS
+  !>@{
+  INTEGER(INTG), PARAMETER :: CMFE_DECOMPOSITION_UNIFORM_ELEMENT_WEIGHTS = DECOMPOSITION_UNIFORM_ELEMENT_WEIGHTS !<All elements have the same weight. \see OPENCMISS_DecompositionElementWeightTypes,OPENCMISS
+  INTEGER(INTG), PARAMETER :: CMFE_DECOMPOSITION_BASIS_ELEMENT_WEIGHTS = DECOMPOSITION_BASIS_ELEMENT_WEIGHTS !<Elements are weighted by the cost of their bases. \see OPENCMISS_DecompositionElementWeightTypes,OPENCMISS
+  INTEGER(INTG), PARAMETER :: CMFE_DECOMPOSITION_USER_ELEMENT_WEIGHTS = DECOMPOSITION_USER_ELEMENT_WEIGHTS !<Elements are weighted by user set weights. \see OPENCMISS_DecompositionElementWeightTypes,OPENCMISS
+  !>@}
   !>@}
 
   !Module types
@@ -4835,6 +4921,24 @@ MODULE OpenCMISS_Iron
     MODULE PROCEDURE cmfe_Decomposition_ElementDomainSetObj
   END INTERFACE cmfe_Decomposition_ElementDomainSet
 
+  !>Sets/changes the type of element weights used to balance a calculated decomposition.
+  INTERFACE cmfe_Decomposition_ElementWeightTypeSet
+    MODULE PROCEDURE cmfe_Decomposition_ElementWeightTypeSetNumber
+    MODULE PROCEDURE cmfe_Decomposition_ElementWeightTypeSetObj
+  END INTERFACE cmfe_Decomposition_ElementWeightTypeSet
+
+  !>Sets the user element weights used to balance a calculated decomposition.
+  INTERFACE cmfe_Decomposition_ElementWeightsSet
+    MODULE PROCEDURE cmfe_Decomposition_ElementWeightsSetNumber
+    MODULE PROCEDURE cmfe_Decomposition_ElementWeightsSetObj
+  END INTERFACE cmfe_Decomposition_ElementWeightsSet
+
+  !>Sets the user element weights for a number of balance constraints used to balance a calculated decomposition.
+  INTERFACE cmfe_Decomposition_ElementConstraintWeightsSet
+    MODULE PROCEDURE cmfe_Decomposition_ElementConstraintWeightsSetNumber
+    MODULE PROCEDURE cmfe_Decomposition_ElementConstraintWeightsSetObj
+  END INTERFACE cmfe_Decomposition_ElementConstraintWeightsSet
+
   !>Returns the mesh component number used for the decomposition of a mesh.
   INTERFACE cmfe_Decomposition_MeshComponentGet
     MODULE PROCEDURE cmfe_Decomposition_MeshComponentGetNumber
@@ -4859,6 +4963,12 @@ MODULE OpenCMISS_Iron
     MODULE PROCEDURE cmfe_Decomposition_NumberOfDomainsSetObj
   END INTERFACE cmfe_Decomposition_NumberOfDomainsSet
 
+  !>Sets/changes the method used to partition the elements of a calculated decomposition.
+  INTERFACE cmfe_Decomposition_PartitionMethodSet
+    MODULE PROCEDURE cmfe_Decomposition_PartitionMethodSetNumber
+    MODULE PROCEDURE cmfe_Decomposition_PartitionMethodSetObj
+  END INTERFACE cmfe_Decomposition_PartitionMethodSet
+
   !>Returns the type of decomposition.
   INTERFACE cmfe_Decomposition_TypeGet
     MODULE PROCEDURE cmfe_Decomposition_TypeGetNumber
@@ -5087,6 +5197,11 @@ MODULE OpenCMISS_Iron
 
   PUBLIC CMFE_DECOMPOSITION_ALL_TYPE,CMFE_DECOMPOSITION_CALCULATED_TYPE,CMFE_DECOMPOSITION_USER_DEFINED_TYPE
 
+  PUBLIC CMFE_DECOMPOSITION_MESH_KWAY_PARTITION,CMFE_DECOMPOSITION_DUAL_GRAPH_KWAY_PARTITION
+
+  PUBLIC CMFE_DECOMPOSITION_UNIFORM_ELEMENT_WEIGHTS,CMFE_DECOMPOSITION_BASIS_ELEMENT_WEIGHTS, &
+    & CMFE_DECOMPOSITION_USER_ELEMENT_WEIGHTS
+
   PUBLIC cmfe_Decomposition_CreateFinish,cmfe_Decomposition_CreateStart
 
   PUBLIC cmfe_Decomposition_TopologyDataProjectionCalculate
@@ -5103,10 +5218,16 @@ MODULE OpenCMISS_Iron
 
   PUBLIC cmfe_Decomposition_ElementDomainGet,cmfe_Decomposition_ElementDomainSet
 
+  PUBLIC cmfe_Decomposition_ElementWeightTypeSet,cmfe_Decomposition_ElementWeightsSet
+
+  PUBLIC cmfe_Decomposition_ElementConstraintWeightsSet
+
   PUBLIC cmfe_Decomposition_MeshComponentGet,cmfe_Decomposition_MeshComponentSet
 
   PUBLIC cmfe_Decomposition_NumberOfDomainsGet,cmfe_Decomposition_NumberOfDomainsSet
 
+  PUBLIC cmfe_Decomposition_PartitionMethodSet
+
   PUBLIC cmfe_Decomposition_TypeGet,cmfe_Decomposition_TypeSet
 
   PUBLIC cmfe_Decomposition_NodeDomainGet
@@ -5719,6 +5840,22 @@ MODULE OpenCMISS_Iron
     MODULE PROCEDURE cmfe_Problem_CellMLEquationsGetObj1
   END INTERFACE cmfe_Problem_CellMLEquationsGet
 
+  !>Reads a checkpoint written by cmfe_Problem_CheckpointWrite back into a problem. The problem and everything it is defined on must have been set up again, on the same number of ranks with the same decomposition, before the checkpoint is read.
+  INTERFACE cmfe_Problem_CheckpointRead
+    MODULE PROCEDURE cmfe_Problem_CheckpointReadCNumber
+    MODULE PROCEDURE cmfe_Problem_CheckpointReadCObj
+    MODULE PROCEDURE cmfe_Problem_CheckpointReadVSNumber
+    MODULE PROCEDURE cmfe_Problem_CheckpointReadVSObj
+  END INTERFACE cmfe_Problem_CheckpointRead
+
+  !>Writes a checkpoint of the fields and control loop state of a problem. The checkpoint consists of path.index and one path.rankN.bin file per rank.
+  INTERFACE cmfe_Problem_CheckpointWrite
+    MODULE PROCEDURE cmfe_Problem_CheckpointWriteCNumber
+    MODULE PROCEDURE cmfe_Problem_CheckpointWriteCObj
+    MODULE PROCEDURE cmfe_Problem_CheckpointWriteVSNumber
+    MODULE PROCEDURE cmfe_Problem_CheckpointWriteVSObj
+  END INTERFACE cmfe_Problem_CheckpointWrite
+
   !>Finishes the process of creating a problem. \see OpenCMISS::Iron::cmfe_Problem_CreateStart
   INTERFACE cmfe_Problem_CreateFinish
     MODULE PROCEDURE cmfe_Problem_CreateFinishNumber
@@ -5844,6 +5981,8 @@ MODULE OpenCMISS_Iron
 
   PUBLIC cmfe_Problem_CellMLEquationsGet
 
+  PUBLIC cmfe_Problem_CheckpointRead,cmfe_Problem_CheckpointWrite
+
   PUBLIC cmfe_Problem_CreateFinish,cmfe_Problem_CreateStart
 
   PUBLIC cmfe_Problem_ControlLoopCreateFinish,cmfe_Problem_ControlLoopCreateStart
@@ -6284,6 +6423,28 @@ MODULE OpenCMISS_Iron
     MODULE PROCEDURE cmfe_Solver_DAETimeStepSetObj
   END INTERFACE cmfe_Solver_DAETimeStepSet
 
+  !>Sets/changes the number of threads used to integrate the dofs of a differential-algebraic equation solver.
+  INTERFACE cmfe_Solver_DAEThreadsSet
+    MODULE PROCEDURE cmfe_Solver_DAEThreadsSetNumber0
+    MODULE PROCEDURE cmfe_Solver_DAEThreadsSetNumber1
+    MODULE PROCEDURE cmfe_Solver_DAEThreadsSetObj
+  END INTERFACE cmfe_Solver_DAEThreadsSet
+
+  !>Sets/changes the local error tolerances for a Runge-Kutta differential-algebraic equation solver.
+  INTERFACE cmfe_Solver_DAERungeKuttaTolerancesSet
+    MODULE PROCEDURE cmfe_Solver_DAERungeKuttaTolerancesSetNumber0
+    MODULE PROCEDURE cmfe_Solver_DAERungeKuttaTolerancesSetNumber1
+    MODULE PROCEDURE cmfe_Solver_DAERungeKuttaTolerancesSetObj
+  END INTERFACE cmfe_Solver_DAERungeKuttaTolerancesSet
+
+  !>Sets/changes the number of cells a differential-algebraic equation solver integrates together in batches. Batched integration
+  !>runs on one thread so the batch size and more than one thread can not both be set.
+  INTERFACE cmfe_Solver_DAEBatchSizeSet
+    MODULE PROCEDURE cmfe_Solver_DAEBatchSizeSetNumber0
+    MODULE PROCEDURE cmfe_Solver_DAEBatchSizeSetNumber1
+    MODULE PROCEDURE cmfe_Solver_DAEBatchSizeSetObj
+  END INTERFACE cmfe_Solver_DAEBatchSizeSet
+
   !>Returns the degree of the polynomial used to interpolate time for a dynamic solver.
   INTERFACE cmfe_Solver_DynamicDegreeGet
     MODULE PROCEDURE cmfe_Solver_DynamicDegreeGetNumber0
@@ -6906,6 +7067,10 @@ MODULE OpenCMISS_Iron
 
   PUBLIC cmfe_Solver_DAETimesSet,cmfe_Solver_DAETimeStepSet,cmfe_Solver_DAEbdfSetTolerance
 
+  PUBLIC cmfe_Solver_DAEBatchSizeSet,cmfe_Solver_DAEThreadsSet
+
+  PUBLIC cmfe_Solver_DAERungeKuttaTolerancesSet
+
   PUBLIC cmfe_Solver_DynamicDegreeGet,cmfe_Solver_DynamicDegreeSet
 
   PUBLIC cmfe_Solver_DynamicLinearityTypeGet
@@ -7139,7 +7304,7 @@ MODULE OpenCMISS_Iron
   PUBLIC :: cmfe_FieldML_InputCreateFromFile,cmfe_FieldML_InputMeshCreateStart, &
     & cmfe_FieldML_InputCoordinateSystemCreateStart,cmfe_FieldML_InputCreateMeshComponent, &
     & cmfe_FieldML_InputFieldCreateStart,cmfe_FieldML_InputBasisCreateStart,cmfe_FieldML_InputNodesCreateStart, &
-    & cmfe_FieldML_InputFieldParametersUpdate
+    & cmfe_FieldML_InputFieldParametersUpdate,cmfe_FieldML_InputReadCacheSet
 
   PUBLIC :: cmfe_FieldMLIO_Finalise,cmfe_FieldMLIO_Initialise,cmfe_FieldMLIO_GetSession
 
@@ -13560,6 +13725,157 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Sets a CellML model state variable to be a gating variable by user number.
+  SUBROUTINE cmfe_CellML_GatingVariableSetNumberC(regionUserNumber,CellMLUserNumber,CellMLModelUserNumber,variableID,err)
+    !DLLEXPORT(cmfe_CellML_GatingVariableSetNumberC)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: regionUserNumber !<The user number of the region containing the CellML enviroment.
+    INTEGER(INTG), INTENT(IN) :: CellMLUserNumber !<The user number of the CellML enviroment.
+    INTEGER(INTG), INTENT(IN) :: CellMLModelUserNumber !<The user number of the CellML model in which to find the given variable.
+    CHARACTER(LEN=*), INTENT(IN) :: variableID !<The CellML state variable to set as a gating variable (in the format 'component_name/variable_name').
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(CELLML_TYPE), POINTER :: CELLML
+    TYPE(REGION_TYPE), POINTER :: REGION
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_CellML_GatingVariableSetNumberC",err,error,*999)
+
+    NULLIFY(REGION)
+    NULLIFY(CELLML)
+    CALL REGION_USER_NUMBER_FIND(regionUserNumber,REGION,err,error,*999)
+    IF(ASSOCIATED(REGION)) THEN
+      CALL CELLML_USER_NUMBER_FIND(CellMLUserNumber,REGION,CELLML,err,error,*999)
+      IF(ASSOCIATED(CELLML)) THEN
+        CALL CellML_ModelGatingVariableSet(CELLML,CellMLModelUserNumber,variableID,err,error,*999)
+      ELSE
+        localError="A CellML environment with an user number of "//TRIM(NumberToVString(CellMLUserNumber,"*",err,error))// &
+          & " does not exist in region number "//TRIM(NumberToVString(regionUserNumber,"*",err,error))//"."
+        CALL FlagError(localError,err,error,*999)
+      END IF
+    ELSE
+      localError="A region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_CellML_GatingVariableSetNumberC")
+    RETURN
+999 ERRORSEXITS("cmfe_CellML_GatingVariableSetNumberC",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_CellML_GatingVariableSetNumberC
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets a CellML model state variable to be a gating variable by object.
+  SUBROUTINE cmfe_CellML_GatingVariableSetObjC(CellML,CellMLModelUserNumber,variableID,err)
+    !DLLEXPORT(cmfe_CellML_GatingVariableSetObjC)
+
+    !Argument variables
+    TYPE(cmfe_CellMLType), INTENT(IN) :: CellML !<The CellML enviroment.
+    INTEGER(INTG), INTENT(IN) :: CellMLModelUserNumber !<The user number of the CellML model in which to find the given variable.
+    CHARACTER(LEN=*), INTENT(IN) :: variableID !<The CellML state variable to set as a gating variable (in the format 'component_name/variable_name').
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_CellML_GatingVariableSetObjC",err,error,*999)
+
+    CALL CellML_ModelGatingVariableSet(CellML%CELLML,CellMLModelUserNumber,variableID,err,error,*999)
+
+    EXITS("cmfe_CellML_GatingVariableSetObjC")
+    RETURN
+999 ERRORSEXITS("cmfe_CellML_GatingVariableSetObjC",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_CellML_GatingVariableSetObjC
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets the batched RHS routine of a CellML model by user number. The routine must be a C function matching the
+  !>CellML_BatchRHSRoutine interface. It evaluates a block of cells laid out structure-of-arrays and is used instead of the per
+  !>cell RHS routine when the DAE solver has a batch size. \see OpenCMISS::Iron::cmfe_Solver_DAEBatchSizeSet
+  SUBROUTINE cmfe_CellML_BatchRHSRoutineSetNumber(regionUserNumber,CellMLUserNumber,CellMLModelUserNumber,batchRHSRoutine, &
+    & err)
+    !DLLEXPORT(cmfe_CellML_BatchRHSRoutineSetNumber)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: regionUserNumber !<The user number of the region containing the CellML enviroment.
+    INTEGER(INTG), INTENT(IN) :: CellMLUserNumber !<The user number of the CellML enviroment.
+    INTEGER(INTG), INTENT(IN) :: CellMLModelUserNumber !<The user number of the CellML model to set the batched RHS routine for.
+    TYPE(C_FUNPTR), INTENT(IN) :: batchRHSRoutine !<The C function pointer to the batched RHS routine, or C_NULL_FUNPTR to use the per cell RHS routine.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(CELLML_TYPE), POINTER :: CELLML
+    TYPE(REGION_TYPE), POINTER :: REGION
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_CellML_BatchRHSRoutineSetNumber",err,error,*999)
+
+    NULLIFY(REGION)
+    NULLIFY(CELLML)
+    CALL REGION_USER_NUMBER_FIND(regionUserNumber,REGION,err,error,*999)
+    IF(ASSOCIATED(REGION)) THEN
+      CALL CELLML_USER_NUMBER_FIND(CellMLUserNumber,REGION,CELLML,err,error,*999)
+      IF(ASSOCIATED(CELLML)) THEN
+        CALL CellML_ModelBatchRHSRoutineSet(CELLML,CellMLModelUserNumber,batchRHSRoutine,err,error,*999)
+      ELSE
+        localError="A CellML environment with an user number of "//TRIM(NumberToVString(CellMLUserNumber,"*",err,error))// &
+          & " does not exist in region number "//TRIM(NumberToVString(regionUserNumber,"*",err,error))//"."
+        CALL FlagError(localError,err,error,*999)
+      END IF
+    ELSE
+      localError="A region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_CellML_BatchRHSRoutineSetNumber")
+    RETURN
+999 ERRORSEXITS("cmfe_CellML_BatchRHSRoutineSetNumber",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_CellML_BatchRHSRoutineSetNumber
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets the batched RHS routine of a CellML model by object. \see OpenCMISS::Iron::cmfe_CellML_BatchRHSRoutineSetNumber
+  SUBROUTINE cmfe_CellML_BatchRHSRoutineSetObj(CellML,CellMLModelUserNumber,batchRHSRoutine,err)
+    !DLLEXPORT(cmfe_CellML_BatchRHSRoutineSetObj)
+
+    !Argument variables
+    TYPE(cmfe_CellMLType), INTENT(IN) :: CellML !<The CellML enviroment.
+    INTEGER(INTG), INTENT(IN) :: CellMLModelUserNumber !<The user number of the CellML model to set the batched RHS routine for.
+    TYPE(C_FUNPTR), INTENT(IN) :: batchRHSRoutine !<The C function pointer to the batched RHS routine, or C_NULL_FUNPTR to use the per cell RHS routine.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_CellML_BatchRHSRoutineSetObj",err,error,*999)
+
+    CALL CellML_ModelBatchRHSRoutineSet(CellML%CELLML,CellMLModelUserNumber,batchRHSRoutine,err,error,*999)
+
+    EXITS("cmfe_CellML_BatchRHSRoutineSetObj")
+    RETURN
+999 ERRORSEXITS("cmfe_CellML_BatchRHSRoutineSetObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_CellML_BatchRHSRoutineSetObj
+
+  !
+  !================================================================================================================================
+  !
+
   !>Sets a CellML model variable to be known by user number.
   SUBROUTINE cmfe_CellML_VariableSetAsKnownNumberVS(regionUserNumber,CellMLUserNumber,CellMLModelUserNumber,variableID,err)
     !DLLEXPORT(cmfe_CellML_VariableSetAsKnownNumberVS)
@@ -21901,6 +22217,155 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Sets/changes whether the interpolation parameters are cached during the evaluation of a data projection identified by a region user number.
+  SUBROUTINE cmfe_DataProjection_ParametersCacheEnabledSetNumber(dataProjectionUserNumber,regionUserNumber,cacheEnabled,err)
+    !DLLEXPORT(cmfe_DataProjection_ParametersCacheEnabledSetNumber)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: dataProjectionUserNumber !<The data projection user number of the data projection to set the parameters cache for.
+    INTEGER(INTG), INTENT(IN) :: regionUserNumber !<The region user number of the data projection to set the parameters cache for.
+    LOGICAL, INTENT(IN) :: cacheEnabled !<.TRUE. if the interpolation parameters are to be cached, .FALSE. if not.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(REGION_TYPE), POINTER :: REGION
+    TYPE(DATA_POINTS_TYPE), POINTER :: DATA_POINTS
+    TYPE(DATA_PROJECTION_TYPE), POINTER :: DATA_PROJECTION
+    TYPE(VARYING_STRING) :: localError
+    INTEGER(INTG) :: GLOBAL_NUMBER !<The data projection global number.
+
+    ENTERS("cmfe_DataProjection_ParametersCacheEnabledSetNumber",err,error,*999)
+
+    NULLIFY(REGION)
+    NULLIFY(DATA_POINTS)
+    NULLIFY(DATA_PROJECTION)
+    CALL REGION_USER_NUMBER_FIND(regionUserNumber,REGION,err,error,*999)
+    IF(ASSOCIATED(REGION)) THEN
+      CALL REGION_DATA_POINTS_GET(REGION,DATA_POINTS,err,error,*999)
+      CALL DataPoints_DataProjectionGlobalNumberGet(DATA_POINTS,DataProjectionUserNumber,GLOBAL_NUMBER,err,error,*999)
+      CALL DATA_POINTS_DATA_PROJECTION_GET(DATA_POINTS,GLOBAL_NUMBER,DATA_PROJECTION,err,error,*999)
+      CALL DataProjection_ParametersCacheEnabledSet(DATA_PROJECTION,cacheEnabled,err,error,*999)
+    ELSE
+      localError="A region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_DataProjection_ParametersCacheEnabledSetNumber")
+    RETURN
+999 ERRORS("cmfe_DataProjection_ParametersCacheEnabledSetNumber",err,error)
+    EXITS("cmfe_DataProjection_ParametersCacheEnabledSetNumber")
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_DataProjection_ParametersCacheEnabledSetNumber
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes whether the interpolation parameters are cached during the evaluation of a data projection identified an object.
+  SUBROUTINE cmfe_DataProjection_ParametersCacheEnabledSetObj(dataProjection,cacheEnabled,err)
+    !DLLEXPORT(cmfe_DataProjection_ParametersCacheEnabledSetObj)
+
+    !Argument variables
+    TYPE(cmfe_DataProjectionType), INTENT(INOUT) :: dataProjection !<The data projection to set the parameters cache for.
+    LOGICAL, INTENT(IN) :: cacheEnabled !<.TRUE. if the interpolation parameters are to be cached, .FALSE. if not.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_DataProjection_ParametersCacheEnabledSetObj",err,error,*999)
+
+    CALL DataProjection_ParametersCacheEnabledSet(dataProjection%dataProjection,cacheEnabled,err,error,*999)
+
+    EXITS("cmfe_DataProjection_ParametersCacheEnabledSetObj")
+    RETURN
+999 ERRORS("cmfe_DataProjection_ParametersCacheEnabledSetObj",err,error)
+    EXITS("cmfe_DataProjection_ParametersCacheEnabledSetObj")
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_DataProjection_ParametersCacheEnabledSetObj
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Returns the number of interpolation parameter retrievals found and not found in the parameters cache during the last evaluation of a data projection identified by a region user number.
+  SUBROUTINE cmfe_DataProjection_ParametersCacheStatisticsGetNumber(dataProjectionUserNumber,regionUserNumber, &
+      & numberOfHits,numberOfMisses,err)
+    !DLLEXPORT(cmfe_DataProjection_ParametersCacheStatisticsGetNumber)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: dataProjectionUserNumber !<The data projection user number of the data projection to get the parameters cache statistics for.
+    INTEGER(INTG), INTENT(IN) :: regionUserNumber !<The region user number of the data projection to get the parameters cache statistics for.
+    INTEGER(INTG), INTENT(OUT) :: numberOfHits !<On exit, the number of interpolation parameter retrievals found in the cache.
+    INTEGER(INTG), INTENT(OUT) :: numberOfMisses !<On exit, the number of interpolation parameter retrievals not found in the cache.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(REGION_TYPE), POINTER :: REGION
+    TYPE(DATA_POINTS_TYPE), POINTER :: DATA_POINTS
+    TYPE(DATA_PROJECTION_TYPE), POINTER :: DATA_PROJECTION
+    TYPE(VARYING_STRING) :: localError
+    INTEGER(INTG) :: GLOBAL_NUMBER !<The data projection global number.
+
+    ENTERS("cmfe_DataProjection_ParametersCacheStatisticsGetNumber",err,error,*999)
+
+    NULLIFY(REGION)
+    NULLIFY(DATA_POINTS)
+    NULLIFY(DATA_PROJECTION)
+    CALL REGION_USER_NUMBER_FIND(regionUserNumber,REGION,err,error,*999)
+    IF(ASSOCIATED(REGION)) THEN
+      CALL REGION_DATA_POINTS_GET(REGION,DATA_POINTS,err,error,*999)
+      CALL DataPoints_DataProjectionGlobalNumberGet(DATA_POINTS,DataProjectionUserNumber,GLOBAL_NUMBER,err,error,*999)
+      CALL DATA_POINTS_DATA_PROJECTION_GET(DATA_POINTS,GLOBAL_NUMBER,DATA_PROJECTION,err,error,*999)
+      CALL DataProjection_ParametersCacheStatisticsGet(DATA_PROJECTION,numberOfHits,numberOfMisses,err,error,*999)
+    ELSE
+      localError="A region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_DataProjection_ParametersCacheStatisticsGetNumber")
+    RETURN
+999 ERRORS("cmfe_DataProjection_ParametersCacheStatisticsGetNumber",err,error)
+    EXITS("cmfe_DataProjection_ParametersCacheStatisticsGetNumber")
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_DataProjection_ParametersCacheStatisticsGetNumber
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Returns the number of interpolation parameter retrievals found and not found in the parameters cache during the last evaluation of a data projection identified an object.
+  SUBROUTINE cmfe_DataProjection_ParametersCacheStatisticsGetObj(dataProjection,numberOfHits,numberOfMisses,err)
+    !DLLEXPORT(cmfe_DataProjection_ParametersCacheStatisticsGetObj)
+
+    !Argument variables
+    TYPE(cmfe_DataProjectionType), INTENT(INOUT) :: dataProjection !<The data projection to get the parameters cache statistics for.
+    INTEGER(INTG), INTENT(OUT) :: numberOfHits !<On exit, the number of interpolation parameter retrievals found in the cache.
+    INTEGER(INTG), INTENT(OUT) :: numberOfMisses !<On exit, the number of interpolation parameter retrievals not found in the cache.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_DataProjection_ParametersCacheStatisticsGetObj",err,error,*999)
+
+    CALL DataProjection_ParametersCacheStatisticsGet(dataProjection%dataProjection,numberOfHits,numberOfMisses,err,error,*999)
+
+    EXITS("cmfe_DataProjection_ParametersCacheStatisticsGetObj")
+    RETURN
+999 ERRORS("cmfe_DataProjection_ParametersCacheStatisticsGetObj",err,error)
+    EXITS("cmfe_DataProjection_ParametersCacheStatisticsGetObj")
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_DataProjection_ParametersCacheStatisticsGetObj
+
+  !
+  !================================================================================================================================
+  !
+
   !>Returns the projection type of data projection identified by a region user number.
   SUBROUTINE cmfe_DataProjection_ProjectionTypeGetNumber(dataProjectionUserNumber,regionUserNumber,projectionType,err)
     !DLLEXPORT(cmfe_DataProjection_ProjectionTypeGetNumber)
@@ -22187,6 +22652,148 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Returns the spatial index type of data projection identified by a region user number.
+  SUBROUTINE cmfe_DataProjection_SpatialIndexGetNumber(dataProjectionUserNumber,regionUserNumber,spatialIndexType,err)
+    !DLLEXPORT(cmfe_DataProjection_SpatialIndexGetNumber)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: dataProjectionUserNumber !<The data projection user number of the data projection to get spatial index type for.
+    INTEGER(INTG), INTENT(IN) :: regionUserNumber !<The region user number of the data projection to get spatial index type for.
+    INTEGER(INTG), INTENT(OUT) :: spatialIndexType !<On exit, the spatial index type of the specified data projection \see OPENCMISS_DataProjectionSpatialIndexTypes,OPENCMISS
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(REGION_TYPE), POINTER :: REGION
+    TYPE(DATA_POINTS_TYPE), POINTER :: DATA_POINTS
+    TYPE(DATA_PROJECTION_TYPE), POINTER :: DATA_PROJECTION
+    TYPE(VARYING_STRING) :: localError
+    INTEGER(INTG) :: GLOBAL_NUMBER !<The data projection global number.
+
+    ENTERS("cmfe_DataProjection_SpatialIndexGetNumber",err,error,*999)
+
+    NULLIFY(REGION)
+    NULLIFY(DATA_POINTS)
+    NULLIFY(DATA_PROJECTION)
+    CALL REGION_USER_NUMBER_FIND(regionUserNumber,REGION,err,error,*999)
+    IF(ASSOCIATED(REGION)) THEN
+      CALL REGION_DATA_POINTS_GET(REGION,DATA_POINTS,err,error,*999)
+      CALL DataPoints_DataProjectionGlobalNumberGet(DATA_POINTS,DataProjectionUserNumber,GLOBAL_NUMBER,err,error,*999)
+      CALL DATA_POINTS_DATA_PROJECTION_GET(DATA_POINTS,GLOBAL_NUMBER,DATA_PROJECTION,err,error,*999)
+      CALL DataProjection_SpatialIndexGet(DATA_PROJECTION,spatialIndexType,err,error,*999)
+    ELSE
+      localError="A region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_DataProjection_SpatialIndexGetNumber")
+    RETURN
+999 ERRORSEXITS("cmfe_DataProjection_SpatialIndexGetNumber",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_DataProjection_SpatialIndexGetNumber
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Returns the spatial index type of data projection identified an object.
+  SUBROUTINE cmfe_DataProjection_SpatialIndexGetObj(dataProjection,spatialIndexType,err)
+    !DLLEXPORT(cmfe_DataProjection_SpatialIndexGetObj)
+
+    !Argument variables
+    TYPE(cmfe_DataProjectionType), INTENT(INOUT) :: dataProjection !<The data projection to get spatial index type for.
+    INTEGER(INTG), INTENT(OUT) :: spatialIndexType !<On exit, the spatial index type of the specified data projection \see OPENCMISS_DataProjectionSpatialIndexTypes,OPENCMISS
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_DataProjection_SpatialIndexGetObj",err,error,*999)
+
+    CALL DataProjection_SpatialIndexGet(dataProjection%dataProjection,spatialIndexType,err,error,*999)
+
+    EXITS("cmfe_DataProjection_SpatialIndexGetObj")
+    RETURN
+999 ERRORSEXITS("cmfe_DataProjection_SpatialIndexGetObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_DataProjection_SpatialIndexGetObj
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the spatial index type of data projection identified by a region user number.
+  SUBROUTINE cmfe_DataProjection_SpatialIndexSetNumber(dataProjectionUserNumber,regionUserNumber,spatialIndexType,err)
+    !DLLEXPORT(cmfe_DataProjection_SpatialIndexSetNumber)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: dataProjectionUserNumber !<The data projection user number of the data projection to set spatial index type for.
+    INTEGER(INTG), INTENT(IN) :: regionUserNumber !<The region use number of data projection to set spatial index type for.
+    INTEGER(INTG), INTENT(IN) :: spatialIndexType !<the spatial index type to set \see OPENCMISS_DataProjectionSpatialIndexTypes,OPENCMISS
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(REGION_TYPE), POINTER :: REGION
+    TYPE(DATA_POINTS_TYPE), POINTER :: DATA_POINTS
+    TYPE(DATA_PROJECTION_TYPE), POINTER :: DATA_PROJECTION
+    TYPE(VARYING_STRING) :: localError
+    INTEGER(INTG) :: GLOBAL_NUMBER !<The data projection global number.
+
+    ENTERS("cmfe_DataProjection_SpatialIndexSetNumber",err,error,*999)
+
+    NULLIFY(REGION)
+    NULLIFY(DATA_POINTS)
+    NULLIFY(DATA_PROJECTION)
+    CALL REGION_USER_NUMBER_FIND(regionUserNumber,REGION,err,error,*999)
+    IF(ASSOCIATED(REGION)) THEN
+      CALL REGION_DATA_POINTS_GET(REGION,DATA_POINTS,err,error,*999)
+      CALL DataPoints_DataProjectionGlobalNumberGet(DATA_POINTS,DataProjectionUserNumber,GLOBAL_NUMBER,err,error,*999)
+      CALL DATA_POINTS_DATA_PROJECTION_GET(DATA_POINTS,GLOBAL_NUMBER,DATA_PROJECTION,err,error,*999)
+      CALL DataProjection_SpatialIndexSet(DATA_PROJECTION,spatialIndexType,err,error,*999)
+    ELSE
+      localError="A region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_DataProjection_SpatialIndexSetNumber")
+    RETURN
+999 ERRORSEXITS("cmfe_DataProjection_SpatialIndexSetNumber",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_DataProjection_SpatialIndexSetNumber
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the spatial index type of data projection identified an object.
+  SUBROUTINE cmfe_DataProjection_SpatialIndexSetObj(dataProjection,spatialIndexType,err)
+    !DLLEXPORT(cmfe_DataProjection_SpatialIndexSetObj)
+
+    !Argument variables
+    TYPE(cmfe_DataProjectionType), INTENT(INOUT) :: dataProjection !<The data projection to set spatial index type for.
+    INTEGER(INTG), INTENT(IN) :: spatialIndexType !<the spatial index type to set \see OPENCMISS_DataProjectionSpatialIndexTypes,OPENCMISS
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_DataProjection_SpatialIndexSetObj",err,error,*999)
+
+    CALL DataProjection_SpatialIndexSet(dataProjection%dataProjection,spatialIndexType,err,error,*999)
+
+    EXITS("cmfe_DataProjection_SpatialIndexSetObj")
+    RETURN
+999 ERRORSEXITS("cmfe_DataProjection_SpatialIndexSetObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_DataProjection_SpatialIndexSetObj
+
+  !
+  !================================================================================================================================
+  !
+
   !>Returns the starting xi of data projection identified by a data projection user number and region user number.
   SUBROUTINE cmfe_DataProjection_StartingXiGetNumber(dataProjectionUserNumber,regionUserNumber,startingXi,err)
     !DLLEXPORT(cmfe_DataProjection_StartingXiGetNumber)
@@ -24873,6 +25480,77 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Sets/changes the number of threads to use when assembling an equations set identified by a user number.
+  SUBROUTINE cmfe_EquationsSet_AssemblyThreadsSetNumber(regionUserNumber,equationsSetUserNumber,numberOfThreads,err)
+    !DLLEXPORT(cmfe_EquationsSet_AssemblyThreadsSetNumber)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: regionUserNumber !<The user number of the Region containing the equations set to set the number of assembly threads for.
+    INTEGER(INTG), INTENT(IN) :: equationsSetUserNumber !<The user number of the equations set to set the number of assembly threads for.
+    INTEGER(INTG), INTENT(IN) :: numberOfThreads !<The number of threads to assemble the equations set with.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(EQUATIONS_SET_TYPE), POINTER :: EQUATIONS_SET
+    TYPE(REGION_TYPE), POINTER :: REGION
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_EquationsSet_AssemblyThreadsSetNumber",err,error,*999)
+
+    NULLIFY(REGION)
+    NULLIFY(EQUATIONS_SET)
+    CALL REGION_USER_NUMBER_FIND(regionUserNumber,REGION,err,error,*999)
+    IF(ASSOCIATED(REGION)) THEN
+      CALL EQUATIONS_SET_USER_NUMBER_FIND(equationsSetUserNumber,REGION,EQUATIONS_SET,err,error,*999)
+      IF(ASSOCIATED(EQUATIONS_SET)) THEN
+        CALL EquationsSet_AssemblyThreadsSet(EQUATIONS_SET,numberOfThreads,err,error,*999)
+      ELSE
+        localError="An equations set with an user number of "//TRIM(NumberToVString(equationsSetUserNumber,"*",err,error))// &
+          & " does not exist on region number "//TRIM(NumberToVString(regionUserNumber,"*",err,error))//"."
+        CALL FlagError(localError,err,error,*999)
+      END IF
+    ELSE
+      localError="A region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))//" does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_EquationsSet_AssemblyThreadsSetNumber")
+    RETURN
+999 ERRORSEXITS("cmfe_EquationsSet_AssemblyThreadsSetNumber",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_EquationsSet_AssemblyThreadsSetNumber
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the number of threads to use when assembling an equations set identified by an object.
+  SUBROUTINE cmfe_EquationsSet_AssemblyThreadsSetObj(equationsSet,numberOfThreads,err)
+    !DLLEXPORT(cmfe_EquationsSet_AssemblyThreadsSetObj)
+
+    !Argument variables
+    TYPE(cmfe_EquationsSetType), INTENT(INOUT) :: equationsSet !<The equations set to set the number of assembly threads for.
+    INTEGER(INTG), INTENT(IN) :: numberOfThreads !<The number of threads to assemble the equations set with.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_EquationsSet_AssemblyThreadsSetObj",err,error,*999)
+
+    CALL EquationsSet_AssemblyThreadsSet(equationsSet%equationsSet,numberOfThreads,err,error,*999)
+
+    EXITS("cmfe_EquationsSet_AssemblyThreadsSetObj")
+    RETURN
+999 ERRORSEXITS("cmfe_EquationsSet_AssemblyThreadsSetObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_EquationsSet_AssemblyThreadsSetObj
+
+  !
+  !================================================================================================================================
+  !
+
   !>Finish the creation of an equations set identified by a user number.
   SUBROUTINE cmfe_EquationsSet_CreateFinishNumber(regionUserNumber,equationsSetUserNumber,err)
     !DLLEXPORT(cmfe_EquationsSet_CreateFinishNumber)
@@ -36668,7 +37346,7 @@ CONTAINS
     !Argument variables
     TYPE(cmfe_FieldsType), INTENT(INOUT) :: fields !<The fields to export the nodes for.
     CHARACTER(LEN=*), INTENT(IN) :: fileName !<The file name to export the nodes to
-    CHARACTER(LEN=*), INTENT(IN):: method !<The export method to use.
+    CHARACTER(LEN=*), INTENT(IN):: method !<The export method to use, "FORTRAN" for text exnode files or "BINARY" for JSON indexed binary node values.
     INTEGER(INTG), INTENT(OUT) :: err !<The error code.
     !Local variables
     TYPE(VARYING_STRING) :: VFileName
@@ -36704,7 +37382,7 @@ CONTAINS
     !Argument variables
     TYPE(cmfe_FieldsType), INTENT(INOUT) :: fields !<The fields to export the nodes for.
     TYPE(VARYING_STRING), INTENT(IN) :: fileName !<The file name to export the nodes to
-    CHARACTER(LEN=*), INTENT(IN):: method !<The export method to use.
+    CHARACTER(LEN=*), INTENT(IN):: method !<The export method to use, "FORTRAN" for text exnode files or "BINARY" for JSON indexed binary node values.
     INTEGER(INTG), INTENT(OUT) :: err !<The error code.
     !Local variables
     TYPE(VARYING_STRING) :: VMethod
@@ -36736,7 +37414,7 @@ CONTAINS
     !Argument variables
     TYPE(cmfe_FieldsType), INTENT(INOUT) :: fields !<The fields to export the nodes for.
     CHARACTER(LEN=*), INTENT(IN) :: fileName !<The file name to export the nodes to
-    TYPE(VARYING_STRING), INTENT(IN):: method !<The export method to use.
+    TYPE(VARYING_STRING), INTENT(IN):: method !<The export method to use, "FORTRAN" for text exnode files or "BINARY" for JSON indexed binary node values.
     INTEGER(INTG), INTENT(OUT) :: err !<The error code.
     !Local variables
     TYPE(VARYING_STRING) :: VFileName
@@ -36768,7 +37446,7 @@ CONTAINS
     !Argument variables
     TYPE(cmfe_FieldsType), INTENT(INOUT) :: fields !<The fields to export the nodes for.
     TYPE(VARYING_STRING), INTENT(IN) :: fileName !<The file name to export the nodes to
-    TYPE(VARYING_STRING), INTENT(IN):: method !<The export method to use.
+    TYPE(VARYING_STRING), INTENT(IN):: method !<The export method to use, "FORTRAN" for text exnode files or "BINARY" for JSON indexed binary node values.
     INTEGER(INTG), INTENT(OUT) :: err !<The error code.
     !Local variables
 
@@ -36784,6 +37462,156 @@ CONTAINS
 
   END SUBROUTINE cmfe_Fields_NodesExportVSVSObj
 
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets whether fields exports started from now on are written asynchronously. An asynchronous export returns as soon as the
+  !>values have been copied into its output buffers, with the files written by a background thread. Call cmfe_Fields_ExportWait
+  !>before reading the files back.
+  SUBROUTINE cmfe_Fields_ExportAsynchronousSet(asynchronous,err)
+    !DLLEXPORT(cmfe_Fields_ExportAsynchronousSet)
+
+    !Argument variables
+    LOGICAL, INTENT(IN) :: asynchronous !<If .TRUE. the exports are written asynchronously, if .FALSE. they are written before returning.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_Fields_ExportAsynchronousSet",err,error,*999)
+
+    CALL FIELD_IO_EXPORT_ASYNCHRONOUS_SET(asynchronous,err,error,*999)
+
+    EXITS("cmfe_Fields_ExportAsynchronousSet")
+    RETURN
+999 ERRORSEXITS("cmfe_Fields_ExportAsynchronousSet",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Fields_ExportAsynchronousSet
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Waits until all asynchronous fields exports have been written and their files closed.
+  SUBROUTINE cmfe_Fields_ExportWait(err)
+    !DLLEXPORT(cmfe_Fields_ExportWait)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_Fields_ExportWait",err,error,*999)
+
+    CALL FIELD_IO_EXPORT_WAIT(err,error,*999)
+
+    EXITS("cmfe_Fields_ExportWait")
+    RETURN
+999 ERRORSEXITS("cmfe_Fields_ExportWait",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Fields_ExportWait
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Converts an exnode file into a binary CMISS node file holding the node numbers and nodal values as blocks.
+  SUBROUTINE cmfe_Fields_ExnodeToBinary(exnodeFileName,binaryFileName,err)
+    !DLLEXPORT(cmfe_Fields_ExnodeToBinary)
+
+    !Argument variables
+    CHARACTER(LEN=*), INTENT(IN) :: exnodeFileName !<The name of the exnode file to convert.
+    CHARACTER(LEN=*), INTENT(IN) :: binaryFileName !<The name of the binary node file to write, without the .binnode extension.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_Fields_ExnodeToBinary",err,error,*999)
+
+    CALL FIELD_IO_EXNODE_TO_BINARY(VAR_STR(exnodeFileName),VAR_STR(binaryFileName),err,error,*999)
+
+    EXITS("cmfe_Fields_ExnodeToBinary")
+    RETURN
+999 ERRORSEXITS("cmfe_Fields_ExnodeToBinary",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Fields_ExnodeToBinary
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Imports a mesh, its decomposition and the fields on it from the fileName.partN.exelem and fileName.partN.exnode files.
+  SUBROUTINE cmfe_Fields_ImportCObj(fileName,method,region,mesh,meshUserNumber,decomposition,decompositionUserNumber, &
+    & decompositionMethod,fieldValuesSetType,fieldScalingType,err)
+    !DLLEXPORT(cmfe_Fields_ImportCObj)
+
+    !Argument variables
+    CHARACTER(LEN=*), INTENT(IN) :: fileName !<The name of the files to import, without the .partN.exelem and .partN.exnode
+    CHARACTER(LEN=*), INTENT(IN) :: method !<The import method to use, "FORTRAN" to read the files on one rank, "PARALLEL" for every rank to read a part of each file or "BINARY" to read the nodes from .partN.binnode files in parallel.
+    TYPE(cmfe_RegionType), INTENT(IN) :: region !<The region to import into.
+    TYPE(cmfe_MeshType), INTENT(INOUT) :: mesh !<On return, the imported mesh.
+    INTEGER(INTG), INTENT(IN) :: meshUserNumber !<The user number for the imported mesh.
+    TYPE(cmfe_DecompositionType), INTENT(INOUT) :: decomposition !<On return, the decomposition of the imported mesh.
+    INTEGER(INTG), INTENT(IN) :: decompositionUserNumber !<The user number for the decomposition.
+    INTEGER(INTG), INTENT(IN) :: decompositionMethod !<The decomposition method to use. \see OPENCMISS_DecompositionTypes
+    INTEGER(INTG), INTENT(IN) :: fieldValuesSetType !<The parameter set to import the node values into. \see OPENCMISS_FieldParameterSetTypes
+    INTEGER(INTG), INTENT(IN) :: fieldScalingType !<The scaling type for the imported fields. \see OPENCMISS_FieldScalingTypes
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_Fields_ImportCObj",err,error,*999)
+
+    CALL FIELD_IO_FIELDS_IMPORT(VAR_STR(TRIM(fileName)),VAR_STR(TRIM(method)),region%region,mesh%mesh,meshUserNumber, &
+      & decomposition%decomposition,decompositionUserNumber,decompositionMethod,fieldValuesSetType,fieldScalingType, &
+      & err,error,*999)
+
+    EXITS("cmfe_Fields_ImportCObj")
+    RETURN
+999 ERRORSEXITS("cmfe_Fields_ImportCObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Fields_ImportCObj
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Imports a mesh, its decomposition and the fields on it from the fileName.partN.exelem and fileName.partN.exnode files.
+  SUBROUTINE cmfe_Fields_ImportVSObj(fileName,method,region,mesh,meshUserNumber,decomposition,decompositionUserNumber, &
+    & decompositionMethod,fieldValuesSetType,fieldScalingType,err)
+    !DLLEXPORT(cmfe_Fields_ImportVSObj)
+
+    !Argument variables
+    TYPE(VARYING_STRING), INTENT(IN) :: fileName !<The name of the files to import, without the .partN.exelem and .partN.exnode
+    TYPE(VARYING_STRING), INTENT(IN) :: method !<The import method to use, "FORTRAN" to read the files on one rank, "PARALLEL" for every rank to read a part of each file or "BINARY" to read the nodes from .partN.binnode files in parallel.
+    TYPE(cmfe_RegionType), INTENT(IN) :: region !<The region to import into.
+    TYPE(cmfe_MeshType), INTENT(INOUT) :: mesh !<On return, the imported mesh.
+    INTEGER(INTG), INTENT(IN) :: meshUserNumber !<The user number for the imported mesh.
+    TYPE(cmfe_DecompositionType), INTENT(INOUT) :: decomposition !<On return, the decomposition of the imported mesh.
+    INTEGER(INTG), INTENT(IN) :: decompositionUserNumber !<The user number for the decomposition.
+    INTEGER(INTG), INTENT(IN) :: decompositionMethod !<The decomposition method to use. \see OPENCMISS_DecompositionTypes
+    INTEGER(INTG), INTENT(IN) :: fieldValuesSetType !<The parameter set to import the node values into. \see OPENCMISS_FieldParameterSetTypes
+    INTEGER(INTG), INTENT(IN) :: fieldScalingType !<The scaling type for the imported fields. \see OPENCMISS_FieldScalingTypes
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_Fields_ImportVSObj",err,error,*999)
+
+    CALL FIELD_IO_FIELDS_IMPORT(fileName,method,region%region,mesh%mesh,meshUserNumber,decomposition%decomposition, &
+      & decompositionUserNumber,decompositionMethod,fieldValuesSetType,fieldScalingType,err,error,*999)
+
+    EXITS("cmfe_Fields_ImportVSObj")
+    RETURN
+999 ERRORSEXITS("cmfe_Fields_ImportVSObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Fields_ImportVSObj
+
 !!==================================================================================================================================
 !!
 !! GENERATED_MESH_ROUTINES
@@ -43473,6 +44301,338 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Sets/changes the element weight type for a decomposition identified by a user number.
+  SUBROUTINE cmfe_Decomposition_ElementWeightTypeSetNumber(regionUserNumber,meshUserNumber,decompositionUserNumber,weightType,err)
+    !DLLEXPORT(cmfe_Decomposition_ElementWeightTypeSetNumber)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: regionUserNumber !<The user number of the region containing the mesh to set the element weight type for.
+    INTEGER(INTG), INTENT(IN) :: meshUserNumber !<The user number of the mesh to set the element weight type for.
+    INTEGER(INTG), INTENT(IN) :: decompositionUserNumber !<The user number of the decomposition to set the element weight type for.
+    INTEGER(INTG), INTENT(IN) :: weightType !<The element weight type to set. \see OPENCMISS_DecompositionElementWeightTypes
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(DECOMPOSITION_TYPE), POINTER :: DECOMPOSITION
+    TYPE(MESH_TYPE), POINTER :: MESH
+    TYPE(REGION_TYPE), POINTER :: REGION
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_Decomposition_ElementWeightTypeSetNumber",err,error,*999)
+
+    NULLIFY(REGION)
+    NULLIFY(MESH)
+    NULLIFY(DECOMPOSITION)
+    CALL REGION_USER_NUMBER_FIND(regionUserNumber,REGION,err,error,*999)
+    IF(ASSOCIATED(REGION)) THEN
+      CALL MESH_USER_NUMBER_FIND(meshUserNumber,REGION,MESH,err,error,*999)
+      IF(ASSOCIATED(MESH)) THEN
+        CALL DECOMPOSITION_USER_NUMBER_FIND(decompositionUserNumber,MESH,DECOMPOSITION,err,error,*999)
+        IF(ASSOCIATED(DECOMPOSITION)) THEN
+          CALL DECOMPOSITION_ELEMENT_WEIGHT_TYPE_SET(DECOMPOSITION,weightType,err,error,*999)
+        ELSE
+          localError="A decomposition with an user number of "//TRIM(NumberToVString(decompositionUserNumber,"*",err,error))// &
+            & " does not exist on the mesh with an user number of "//TRIM(NumberToVString(meshUserNumber,"*",err,error))//"."
+          CALL FlagError(localError,err,error,*999)
+        END IF
+      ELSE
+        localError="A mesh with an user number of "//TRIM(NumberToVString(meshUserNumber,"*",err,error))// &
+          & " does not exist on the region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))//"."
+        CALL FlagError(localError,err,error,*999)
+      END IF
+    ELSE
+      localError="A region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_Decomposition_ElementWeightTypeSetNumber")
+    RETURN
+999 ERRORSEXITS("cmfe_Decomposition_ElementWeightTypeSetNumber",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Decomposition_ElementWeightTypeSetNumber
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the element weight type for a decomposition identified by an object.
+  SUBROUTINE cmfe_Decomposition_ElementWeightTypeSetObj(decomposition,weightType,err)
+    !DLLEXPORT(cmfe_Decomposition_ElementWeightTypeSetObj)
+
+    !Argument variables
+    TYPE(cmfe_DecompositionType), INTENT(IN) :: decomposition !<The decomposition to set the element weight type for.
+    INTEGER(INTG), INTENT(IN) :: weightType !<The element weight type to set. \see OPENCMISS_DecompositionElementWeightTypes
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_Decomposition_ElementWeightTypeSetObj",err,error,*999)
+
+    CALL DECOMPOSITION_ELEMENT_WEIGHT_TYPE_SET(decomposition%decomposition,weightType,err,error,*999)
+
+    EXITS("cmfe_Decomposition_ElementWeightTypeSetObj")
+    RETURN
+999 ERRORSEXITS("cmfe_Decomposition_ElementWeightTypeSetObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Decomposition_ElementWeightTypeSetObj
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the user element weights for a decomposition identified by a user number.
+  SUBROUTINE cmfe_Decomposition_ElementWeightsSetNumber(regionUserNumber,meshUserNumber,decompositionUserNumber,elementWeights,err)
+    !DLLEXPORT(cmfe_Decomposition_ElementWeightsSetNumber)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: regionUserNumber !<The user number of the region containing the mesh to set the user element weights for.
+    INTEGER(INTG), INTENT(IN) :: meshUserNumber !<The user number of the mesh to set the user element weights for.
+    INTEGER(INTG), INTENT(IN) :: decompositionUserNumber !<The user number of the decomposition to set the user element weights for.
+    INTEGER(INTG), INTENT(IN) :: elementWeights(:) !<elementWeights(elementIdx). The weight of the elementIdx'th global element.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(DECOMPOSITION_TYPE), POINTER :: DECOMPOSITION
+    TYPE(MESH_TYPE), POINTER :: MESH
+    TYPE(REGION_TYPE), POINTER :: REGION
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_Decomposition_ElementWeightsSetNumber",err,error,*999)
+
+    NULLIFY(REGION)
+    NULLIFY(MESH)
+    NULLIFY(DECOMPOSITION)
+    CALL REGION_USER_NUMBER_FIND(regionUserNumber,REGION,err,error,*999)
+    IF(ASSOCIATED(REGION)) THEN
+      CALL MESH_USER_NUMBER_FIND(meshUserNumber,REGION,MESH,err,error,*999)
+      IF(ASSOCIATED(MESH)) THEN
+        CALL DECOMPOSITION_USER_NUMBER_FIND(decompositionUserNumber,MESH,DECOMPOSITION,err,error,*999)
+        IF(ASSOCIATED(DECOMPOSITION)) THEN
+          CALL DECOMPOSITION_ELEMENT_WEIGHTS_SET(DECOMPOSITION,RESHAPE(elementWeights,[1,SIZE(elementWeights,1)]), &
+            & err,error,*999)
+        ELSE
+          localError="A decomposition with an user number of "//TRIM(NumberToVString(decompositionUserNumber,"*",err,error))// &
+            & " does not exist on the mesh with an user number of "//TRIM(NumberToVString(meshUserNumber,"*",err,error))//"."
+          CALL FlagError(localError,err,error,*999)
+        END IF
+      ELSE
+        localError="A mesh with an user number of "//TRIM(NumberToVString(meshUserNumber,"*",err,error))// &
+          & " does not exist on the region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))//"."
+        CALL FlagError(localError,err,error,*999)
+      END IF
+    ELSE
+      localError="A region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_Decomposition_ElementWeightsSetNumber")
+    RETURN
+999 ERRORSEXITS("cmfe_Decomposition_ElementWeightsSetNumber",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Decomposition_ElementWeightsSetNumber
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the user element weights for a decomposition identified by an object.
+  SUBROUTINE cmfe_Decomposition_ElementWeightsSetObj(decomposition,elementWeights,err)
+    !DLLEXPORT(cmfe_Decomposition_ElementWeightsSetObj)
+
+    !Argument variables
+    TYPE(cmfe_DecompositionType), INTENT(IN) :: decomposition !<The decomposition to set the user element weights for.
+    INTEGER(INTG), INTENT(IN) :: elementWeights(:) !<elementWeights(elementIdx). The weight of the elementIdx'th global element.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_Decomposition_ElementWeightsSetObj",err,error,*999)
+
+    CALL DECOMPOSITION_ELEMENT_WEIGHTS_SET(decomposition%decomposition,RESHAPE(elementWeights,[1,SIZE(elementWeights,1)]), &
+      & err,error,*999)
+
+    EXITS("cmfe_Decomposition_ElementWeightsSetObj")
+    RETURN
+999 ERRORSEXITS("cmfe_Decomposition_ElementWeightsSetObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Decomposition_ElementWeightsSetObj
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the user element constraint weights for a decomposition identified by a user number.
+  SUBROUTINE cmfe_Decomposition_ElementConstraintWeightsSetNumber(regionUserNumber,meshUserNumber,decompositionUserNumber, &
+    & elementWeights,err)
+    !DLLEXPORT(cmfe_Decomposition_ElementConstraintWeightsSetNumber)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: regionUserNumber !<The user number of the region containing the mesh to set the user element constraint weights for.
+    INTEGER(INTG), INTENT(IN) :: meshUserNumber !<The user number of the mesh to set the user element constraint weights for.
+    INTEGER(INTG), INTENT(IN) :: decompositionUserNumber !<The user number of the decomposition to set the user element constraint weights for.
+    INTEGER(INTG), INTENT(IN) :: elementWeights(:,:) !<elementWeights(constraintIdx,elementIdx). The weight of the constraintIdx'th balance constraint for the elementIdx'th global element.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(DECOMPOSITION_TYPE), POINTER :: DECOMPOSITION
+    TYPE(MESH_TYPE), POINTER :: MESH
+    TYPE(REGION_TYPE), POINTER :: REGION
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_Decomposition_ElementConstraintWeightsSetNumber",err,error,*999)
+
+    NULLIFY(REGION)
+    NULLIFY(MESH)
+    NULLIFY(DECOMPOSITION)
+    CALL REGION_USER_NUMBER_FIND(regionUserNumber,REGION,err,error,*999)
+    IF(ASSOCIATED(REGION)) THEN
+      CALL MESH_USER_NUMBER_FIND(meshUserNumber,REGION,MESH,err,error,*999)
+      IF(ASSOCIATED(MESH)) THEN
+        CALL DECOMPOSITION_USER_NUMBER_FIND(decompositionUserNumber,MESH,DECOMPOSITION,err,error,*999)
+        IF(ASSOCIATED(DECOMPOSITION)) THEN
+          CALL DECOMPOSITION_ELEMENT_WEIGHTS_SET(DECOMPOSITION,elementWeights,err,error,*999)
+        ELSE
+          localError="A decomposition with an user number of "//TRIM(NumberToVString(decompositionUserNumber,"*",err,error))// &
+            & " does not exist on the mesh with an user number of "//TRIM(NumberToVString(meshUserNumber,"*",err,error))//"."
+          CALL FlagError(localError,err,error,*999)
+        END IF
+      ELSE
+        localError="A mesh with an user number of "//TRIM(NumberToVString(meshUserNumber,"*",err,error))// &
+          & " does not exist on the region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))//"."
+        CALL FlagError(localError,err,error,*999)
+      END IF
+    ELSE
+      localError="A region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_Decomposition_ElementConstraintWeightsSetNumber")
+    RETURN
+999 ERRORSEXITS("cmfe_Decomposition_ElementConstraintWeightsSetNumber",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Decomposition_ElementConstraintWeightsSetNumber
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the user element constraint weights for a decomposition identified by an object.
+  SUBROUTINE cmfe_Decomposition_ElementConstraintWeightsSetObj(decomposition,elementWeights,err)
+    !DLLEXPORT(cmfe_Decomposition_ElementConstraintWeightsSetObj)
+
+    !Argument variables
+    TYPE(cmfe_DecompositionType), INTENT(IN) :: decomposition !<The decomposition to set the user element constraint weights for.
+    INTEGER(INTG), INTENT(IN) :: elementWeights(:,:) !<elementWeights(constraintIdx,elementIdx). The weight of the constraintIdx'th balance constraint for the elementIdx'th global element.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_Decomposition_ElementConstraintWeightsSetObj",err,error,*999)
+
+    CALL DECOMPOSITION_ELEMENT_WEIGHTS_SET(decomposition%decomposition,elementWeights,err,error,*999)
+
+    EXITS("cmfe_Decomposition_ElementConstraintWeightsSetObj")
+    RETURN
+999 ERRORSEXITS("cmfe_Decomposition_ElementConstraintWeightsSetObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Decomposition_ElementConstraintWeightsSetObj
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the partition method for a decomposition identified by a user number.
+  SUBROUTINE cmfe_Decomposition_PartitionMethodSetNumber(regionUserNumber,meshUserNumber,decompositionUserNumber, &
+    & partitionMethod,err)
+    !DLLEXPORT(cmfe_Decomposition_PartitionMethodSetNumber)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: regionUserNumber !<The user number of the region containing the mesh to set the partition method for.
+    INTEGER(INTG), INTENT(IN) :: meshUserNumber !<The user number of the mesh to set the partition method for.
+    INTEGER(INTG), INTENT(IN) :: decompositionUserNumber !<The user number of the decomposition to set the partition method for.
+    INTEGER(INTG), INTENT(IN) :: partitionMethod !<The partition method to set. \see OPENCMISS_DecompositionPartitionMethods
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(DECOMPOSITION_TYPE), POINTER :: DECOMPOSITION
+    TYPE(MESH_TYPE), POINTER :: MESH
+    TYPE(REGION_TYPE), POINTER :: REGION
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_Decomposition_PartitionMethodSetNumber",err,error,*999)
+
+    NULLIFY(REGION)
+    NULLIFY(MESH)
+    NULLIFY(DECOMPOSITION)
+    CALL REGION_USER_NUMBER_FIND(regionUserNumber,REGION,err,error,*999)
+    IF(ASSOCIATED(REGION)) THEN
+      CALL MESH_USER_NUMBER_FIND(meshUserNumber,REGION,MESH,err,error,*999)
+      IF(ASSOCIATED(MESH)) THEN
+        CALL DECOMPOSITION_USER_NUMBER_FIND(decompositionUserNumber,MESH,DECOMPOSITION,err,error,*999)
+        IF(ASSOCIATED(DECOMPOSITION)) THEN
+          CALL DECOMPOSITION_PARTITION_METHOD_SET(DECOMPOSITION,partitionMethod,err,error,*999)
+        ELSE
+          localError="A decomposition with an user number of "//TRIM(NumberToVString(decompositionUserNumber,"*",err,error))// &
+            & " does not exist on the mesh with an user number of "//TRIM(NumberToVString(meshUserNumber,"*",err,error))//"."
+          CALL FlagError(localError,err,error,*999)
+        END IF
+      ELSE
+        localError="A mesh with an user number of "//TRIM(NumberToVString(meshUserNumber,"*",err,error))// &
+          & " does not exist on the region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))//"."
+        CALL FlagError(localError,err,error,*999)
+      END IF
+    ELSE
+      localError="A region with an user number of "//TRIM(NumberToVString(regionUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_Decomposition_PartitionMethodSetNumber")
+    RETURN
+999 ERRORSEXITS("cmfe_Decomposition_PartitionMethodSetNumber",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Decomposition_PartitionMethodSetNumber
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the partition method for a decomposition identified by an object.
+  SUBROUTINE cmfe_Decomposition_PartitionMethodSetObj(decomposition,partitionMethod,err)
+    !DLLEXPORT(cmfe_Decomposition_PartitionMethodSetObj)
+
+    !Argument variables
+    TYPE(cmfe_DecompositionType), INTENT(IN) :: decomposition !<The decomposition to set the partition method for.
+    INTEGER(INTG), INTENT(IN) :: partitionMethod !<The partition method to set. \see OPENCMISS_DecompositionPartitionMethods
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_Decomposition_PartitionMethodSetObj",err,error,*999)
+
+    CALL DECOMPOSITION_PARTITION_METHOD_SET(decomposition%decomposition,partitionMethod,err,error,*999)
+
+    EXITS("cmfe_Decomposition_PartitionMethodSetObj")
+    RETURN
+999 ERRORSEXITS("cmfe_Decomposition_PartitionMethodSetObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Decomposition_PartitionMethodSetObj
+
+  !
+  !================================================================================================================================
+  !
+
   !>Sets whether lines should be calculated
   SUBROUTINE cmfe_Decomposition_CalculateLinesSetNumber(regionUserNumber,meshUserNumber,&
                                                      & decompositionUserNumber,calculateLinesFlag,err)
@@ -47732,6 +48892,266 @@ CONTAINS
 
   END SUBROUTINE cmfe_Problem_CellMLEquationsGetObj1
 
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads a checkpoint written by cmfe_Problem_CheckpointWrite back into a problem identified by user number.
+  SUBROUTINE cmfe_Problem_CheckpointReadCNumber(problemUserNumber,path,err)
+    !DLLEXPORT(cmfe_Problem_CheckpointReadCNumber)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: problemUserNumber !<The user number of the problem to read the checkpoint into.
+    CHARACTER(LEN=*), INTENT(IN) :: path !<The path of the checkpoint, without the .index or .rankN.bin extensions.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(PROBLEM_TYPE), POINTER :: PROBLEM
+    TYPE(VARYING_STRING) :: vPath
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_Problem_CheckpointReadCNumber",err,error,*999)
+
+    vPath=path(1:LEN_TRIM(path))
+
+    NULLIFY(PROBLEM)
+    CALL PROBLEM_USER_NUMBER_FIND(problemUserNumber,PROBLEM,err,error,*999)
+    IF(ASSOCIATED(PROBLEM)) THEN
+      CALL CHECKPOINT_READ(PROBLEM,vPath,err,error,*999)
+    ELSE
+      localError="A problem with an user number of "//TRIM(NumberToVString(problemUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_Problem_CheckpointReadCNumber")
+    RETURN
+999 ERRORSEXITS("cmfe_Problem_CheckpointReadCNumber",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Problem_CheckpointReadCNumber
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads a checkpoint written by cmfe_Problem_CheckpointWrite back into a problem identified by an object.
+  SUBROUTINE cmfe_Problem_CheckpointReadCObj(problem,path,err)
+    !DLLEXPORT(cmfe_Problem_CheckpointReadCObj)
+
+    !Argument variables
+    TYPE(cmfe_ProblemType), INTENT(IN) :: problem !<The problem to read the checkpoint into.
+    CHARACTER(LEN=*), INTENT(IN) :: path !<The path of the checkpoint, without the .index or .rankN.bin extensions.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(VARYING_STRING) :: vPath
+
+    ENTERS("cmfe_Problem_CheckpointReadCObj",err,error,*999)
+
+    vPath=path(1:LEN_TRIM(path))
+
+    CALL CHECKPOINT_READ(problem%problem,vPath,err,error,*999)
+
+    EXITS("cmfe_Problem_CheckpointReadCObj")
+    RETURN
+999 ERRORSEXITS("cmfe_Problem_CheckpointReadCObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Problem_CheckpointReadCObj
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads a checkpoint written by cmfe_Problem_CheckpointWrite back into a problem identified by user number.
+  SUBROUTINE cmfe_Problem_CheckpointReadVSNumber(problemUserNumber,path,err)
+    !DLLEXPORT(cmfe_Problem_CheckpointReadVSNumber)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: problemUserNumber !<The user number of the problem to read the checkpoint into.
+    TYPE(VARYING_STRING), INTENT(IN) :: path !<The path of the checkpoint, without the .index or .rankN.bin extensions.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(PROBLEM_TYPE), POINTER :: PROBLEM
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_Problem_CheckpointReadVSNumber",err,error,*999)
+
+    NULLIFY(PROBLEM)
+    CALL PROBLEM_USER_NUMBER_FIND(problemUserNumber,PROBLEM,err,error,*999)
+    IF(ASSOCIATED(PROBLEM)) THEN
+      CALL CHECKPOINT_READ(PROBLEM,path,err,error,*999)
+    ELSE
+      localError="A problem with an user number of "//TRIM(NumberToVString(problemUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_Problem_CheckpointReadVSNumber")
+    RETURN
+999 ERRORSEXITS("cmfe_Problem_CheckpointReadVSNumber",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Problem_CheckpointReadVSNumber
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Reads a checkpoint written by cmfe_Problem_CheckpointWrite back into a problem identified by an object.
+  SUBROUTINE cmfe_Problem_CheckpointReadVSObj(problem,path,err)
+    !DLLEXPORT(cmfe_Problem_CheckpointReadVSObj)
+
+    !Argument variables
+    TYPE(cmfe_ProblemType), INTENT(IN) :: problem !<The problem to read the checkpoint into.
+    TYPE(VARYING_STRING), INTENT(IN) :: path !<The path of the checkpoint, without the .index or .rankN.bin extensions.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_Problem_CheckpointReadVSObj",err,error,*999)
+
+    CALL CHECKPOINT_READ(problem%problem,path,err,error,*999)
+
+    EXITS("cmfe_Problem_CheckpointReadVSObj")
+    RETURN
+999 ERRORSEXITS("cmfe_Problem_CheckpointReadVSObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Problem_CheckpointReadVSObj
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Writes a checkpoint of the fields and control loop state of a problem identified by user number.
+  SUBROUTINE cmfe_Problem_CheckpointWriteCNumber(problemUserNumber,path,err)
+    !DLLEXPORT(cmfe_Problem_CheckpointWriteCNumber)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: problemUserNumber !<The user number of the problem to write the checkpoint for.
+    CHARACTER(LEN=*), INTENT(IN) :: path !<The path of the checkpoint, without the .index or .rankN.bin extensions.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(PROBLEM_TYPE), POINTER :: PROBLEM
+    TYPE(VARYING_STRING) :: vPath
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_Problem_CheckpointWriteCNumber",err,error,*999)
+
+    vPath=path(1:LEN_TRIM(path))
+
+    NULLIFY(PROBLEM)
+    CALL PROBLEM_USER_NUMBER_FIND(problemUserNumber,PROBLEM,err,error,*999)
+    IF(ASSOCIATED(PROBLEM)) THEN
+      CALL CHECKPOINT_WRITE(PROBLEM,vPath,err,error,*999)
+    ELSE
+      localError="A problem with an user number of "//TRIM(NumberToVString(problemUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_Problem_CheckpointWriteCNumber")
+    RETURN
+999 ERRORSEXITS("cmfe_Problem_CheckpointWriteCNumber",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Problem_CheckpointWriteCNumber
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Writes a checkpoint of the fields and control loop state of a problem identified by an object.
+  SUBROUTINE cmfe_Problem_CheckpointWriteCObj(problem,path,err)
+    !DLLEXPORT(cmfe_Problem_CheckpointWriteCObj)
+
+    !Argument variables
+    TYPE(cmfe_ProblemType), INTENT(IN) :: problem !<The problem to write the checkpoint for.
+    CHARACTER(LEN=*), INTENT(IN) :: path !<The path of the checkpoint, without the .index or .rankN.bin extensions.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(VARYING_STRING) :: vPath
+
+    ENTERS("cmfe_Problem_CheckpointWriteCObj",err,error,*999)
+
+    vPath=path(1:LEN_TRIM(path))
+
+    CALL CHECKPOINT_WRITE(problem%problem,vPath,err,error,*999)
+
+    EXITS("cmfe_Problem_CheckpointWriteCObj")
+    RETURN
+999 ERRORSEXITS("cmfe_Problem_CheckpointWriteCObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Problem_CheckpointWriteCObj
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Writes a checkpoint of the fields and control loop state of a problem identified by user number.
+  SUBROUTINE cmfe_Problem_CheckpointWriteVSNumber(problemUserNumber,path,err)
+    !DLLEXPORT(cmfe_Problem_CheckpointWriteVSNumber)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: problemUserNumber !<The user number of the problem to write the checkpoint for.
+    TYPE(VARYING_STRING), INTENT(IN) :: path !<The path of the checkpoint, without the .index or .rankN.bin extensions.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(PROBLEM_TYPE), POINTER :: PROBLEM
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_Problem_CheckpointWriteVSNumber",err,error,*999)
+
+    NULLIFY(PROBLEM)
+    CALL PROBLEM_USER_NUMBER_FIND(problemUserNumber,PROBLEM,err,error,*999)
+    IF(ASSOCIATED(PROBLEM)) THEN
+      CALL CHECKPOINT_WRITE(PROBLEM,path,err,error,*999)
+    ELSE
+      localError="A problem with an user number of "//TRIM(NumberToVString(problemUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_Problem_CheckpointWriteVSNumber")
+    RETURN
+999 ERRORSEXITS("cmfe_Problem_CheckpointWriteVSNumber",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Problem_CheckpointWriteVSNumber
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Writes a checkpoint of the fields and control loop state of a problem identified by an object.
+  SUBROUTINE cmfe_Problem_CheckpointWriteVSObj(problem,path,err)
+    !DLLEXPORT(cmfe_Problem_CheckpointWriteVSObj)
+
+    !Argument variables
+    TYPE(cmfe_ProblemType), INTENT(IN) :: problem !<The problem to write the checkpoint for.
+    TYPE(VARYING_STRING), INTENT(IN) :: path !<The path of the checkpoint, without the .index or .rankN.bin extensions.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_Problem_CheckpointWriteVSObj",err,error,*999)
+
+    CALL CHECKPOINT_WRITE(problem%problem,path,err,error,*999)
+
+    EXITS("cmfe_Problem_CheckpointWriteVSObj")
+    RETURN
+999 ERRORSEXITS("cmfe_Problem_CheckpointWriteVSObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Problem_CheckpointWriteVSObj
+
    !
   !================================================================================================================================
   !
@@ -50794,6 +52214,335 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Sets/changes the number of threads used to integrate the dofs of a differential-algebraic equation solver identified by an user number.
+  SUBROUTINE cmfe_Solver_DAEThreadsSetNumber0(problemUserNumber,controlLoopIdentifier,solverIndex,numberOfThreads,err)
+    !DLLEXPORT(cmfe_Solver_DAEThreadsSetNumber0)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: problemUserNumber !<The user number of the problem number with the solver to set the DAE threads for.
+    INTEGER(INTG), INTENT(IN) :: controlLoopIdentifier !<The control loop identifier with the solver to set the DAE threads for.
+    INTEGER(INTG), INTENT(IN) :: solverIndex !<The solver index to set the DAE threads for.
+    INTEGER(INTG), INTENT(IN) :: numberOfThreads !<The number of OpenMP threads to integrate the differential-algebraic solver dofs with.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(PROBLEM_TYPE), POINTER :: PROBLEM
+    TYPE(SOLVER_TYPE), POINTER :: SOLVER
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_Solver_DAEThreadsSetNumber0",err,error,*999)
+
+    NULLIFY(PROBLEM)
+    NULLIFY(SOLVER)
+    CALL PROBLEM_USER_NUMBER_FIND(problemUserNumber,PROBLEM,err,error,*999)
+    IF(ASSOCIATED(PROBLEM)) THEN
+      CALL PROBLEM_SOLVER_GET(PROBLEM,controlLoopIdentifier,solverIndex,SOLVER,err,error,*999)
+      CALL SOLVER_DAE_THREADS_SET(SOLVER,numberOfThreads,err,error,*999)
+    ELSE
+      localError="A problem with an user number of "//TRIM(NumberToVString(problemUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_Solver_DAEThreadsSetNumber0")
+    RETURN
+999 ERRORSEXITS("cmfe_Solver_DAEThreadsSetNumber0",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Solver_DAEThreadsSetNumber0
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the number of threads used to integrate the dofs of a differential-algebraic equation solver identified by an user number.
+  SUBROUTINE cmfe_Solver_DAEThreadsSetNumber1(problemUserNumber,controlLoopIdentifiers,solverIndex,numberOfThreads,err)
+    !DLLEXPORT(cmfe_Solver_DAEThreadsSetNumber1)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: problemUserNumber !<The user number of the problem number with the solver to set the DAE threads for.
+    INTEGER(INTG), INTENT(IN) :: controlLoopIdentifiers(:) !<controlLoopIdentifiers(i). The i'th control loop identifier to set the DAE threads for.
+    INTEGER(INTG), INTENT(IN) :: solverIndex !<The solver index to set the DAE threads for.
+    INTEGER(INTG), INTENT(IN) :: numberOfThreads !<The number of OpenMP threads to integrate the differential-algebraic solver dofs with.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(PROBLEM_TYPE), POINTER :: PROBLEM
+    TYPE(SOLVER_TYPE), POINTER :: SOLVER
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_Solver_DAEThreadsSetNumber1",err,error,*999)
+
+    NULLIFY(PROBLEM)
+    NULLIFY(SOLVER)
+    CALL PROBLEM_USER_NUMBER_FIND(problemUserNumber,PROBLEM,err,error,*999)
+    IF(ASSOCIATED(PROBLEM)) THEN
+      CALL PROBLEM_SOLVER_GET(PROBLEM,controlLoopIdentifiers,solverIndex,SOLVER,err,error,*999)
+      CALL SOLVER_DAE_THREADS_SET(SOLVER,numberOfThreads,err,error,*999)
+    ELSE
+      localError="A problem with an user number of "//TRIM(NumberToVString(problemUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_Solver_DAEThreadsSetNumber1")
+    RETURN
+999 ERRORSEXITS("cmfe_Solver_DAEThreadsSetNumber1",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Solver_DAEThreadsSetNumber1
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the number of threads used to integrate the dofs of a differential-algebraic equation solver identified by an object.
+  SUBROUTINE cmfe_Solver_DAEThreadsSetObj(solver,numberOfThreads,err)
+    !DLLEXPORT(cmfe_Solver_DAEThreadsSetObj)
+
+    !Argument variables
+    TYPE(cmfe_SolverType), INTENT(IN) :: solver !<The solver to set the DAE threads for.
+    INTEGER(INTG), INTENT(IN) :: numberOfThreads !<The number of OpenMP threads to integrate the differential-algebraic solver dofs with.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_Solver_DAEThreadsSetObj",err,error,*999)
+
+    CALL SOLVER_DAE_THREADS_SET(solver%solver,numberOfThreads,err,error,*999)
+
+    EXITS("cmfe_Solver_DAEThreadsSetObj")
+    RETURN
+999 ERRORSEXITS("cmfe_Solver_DAEThreadsSetObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Solver_DAEThreadsSetObj
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the absolute and relative local error tolerances for a Runge-Kutta differential-algebraic equation solver identified by an user number.
+  SUBROUTINE cmfe_Solver_DAERungeKuttaTolerancesSetNumber0(problemUserNumber,controlLoopIdentifier,solverIndex,absoluteTolerance, &
+    & relativeTolerance,err)
+    !DLLEXPORT(cmfe_Solver_DAERungeKuttaTolerancesSetNumber0)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: problemUserNumber !<The user number of the problem number with the solver to set the Runge-Kutta tolerances for.
+    INTEGER(INTG), INTENT(IN) :: controlLoopIdentifier !<The control loop identifier with the solver to set the Runge-Kutta tolerances for.
+    INTEGER(INTG), INTENT(IN) :: solverIndex !<The solver index to set the Runge-Kutta tolerances for.
+    REAL(DP), INTENT(IN) :: absoluteTolerance !<The absolute tolerance to set.
+    REAL(DP), INTENT(IN) :: relativeTolerance !<The relative tolerance to set.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(PROBLEM_TYPE), POINTER :: PROBLEM
+    TYPE(SOLVER_TYPE), POINTER :: SOLVER
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_Solver_DAERungeKuttaTolerancesSetNumber0",err,error,*999)
+
+    NULLIFY(PROBLEM)
+    NULLIFY(SOLVER)
+    CALL PROBLEM_USER_NUMBER_FIND(problemUserNumber,PROBLEM,err,error,*999)
+    IF(ASSOCIATED(PROBLEM)) THEN
+      CALL PROBLEM_SOLVER_GET(PROBLEM,controlLoopIdentifier,solverIndex,SOLVER,err,error,*999)
+      CALL SOLVER_DAE_RUNGE_KUTTA_TOLERANCES_SET(SOLVER,absoluteTolerance,relativeTolerance,err,error,*999)
+    ELSE
+      localError="A problem with an user number of "//TRIM(NumberToVString(problemUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_Solver_DAERungeKuttaTolerancesSetNumber0")
+    RETURN
+999 ERRORSEXITS("cmfe_Solver_DAERungeKuttaTolerancesSetNumber0",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Solver_DAERungeKuttaTolerancesSetNumber0
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the absolute and relative local error tolerances for a Runge-Kutta differential-algebraic equation solver identified by an user number.
+  SUBROUTINE cmfe_Solver_DAERungeKuttaTolerancesSetNumber1(problemUserNumber,controlLoopIdentifiers,solverIndex,absoluteTolerance, &
+    & relativeTolerance,err)
+    !DLLEXPORT(cmfe_Solver_DAERungeKuttaTolerancesSetNumber1)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: problemUserNumber !<The user number of the problem number with the solver to set the Runge-Kutta tolerances for.
+    INTEGER(INTG), INTENT(IN) :: controlLoopIdentifiers(:) !<controlLoopIdentifiers(i). The i'th control loop identifier to set the Runge-Kutta tolerances for.
+    INTEGER(INTG), INTENT(IN) :: solverIndex !<The solver index to set the Runge-Kutta tolerances for.
+    REAL(DP), INTENT(IN) :: absoluteTolerance !<The absolute tolerance to set.
+    REAL(DP), INTENT(IN) :: relativeTolerance !<The relative tolerance to set.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(PROBLEM_TYPE), POINTER :: PROBLEM
+    TYPE(SOLVER_TYPE), POINTER :: SOLVER
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_Solver_DAERungeKuttaTolerancesSetNumber1",err,error,*999)
+
+    NULLIFY(PROBLEM)
+    NULLIFY(SOLVER)
+    CALL PROBLEM_USER_NUMBER_FIND(problemUserNumber,PROBLEM,err,error,*999)
+    IF(ASSOCIATED(PROBLEM)) THEN
+      CALL PROBLEM_SOLVER_GET(PROBLEM,controlLoopIdentifiers,solverIndex,SOLVER,err,error,*999)
+      CALL SOLVER_DAE_RUNGE_KUTTA_TOLERANCES_SET(SOLVER,absoluteTolerance,relativeTolerance,err,error,*999)
+    ELSE
+      localError="A problem with an user number of "//TRIM(NumberToVString(problemUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_Solver_DAERungeKuttaTolerancesSetNumber1")
+    RETURN
+999 ERRORSEXITS("cmfe_Solver_DAERungeKuttaTolerancesSetNumber1",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Solver_DAERungeKuttaTolerancesSetNumber1
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the absolute and relative local error tolerances for a Runge-Kutta differential-algebraic equation solver identified by an object.
+  SUBROUTINE cmfe_Solver_DAERungeKuttaTolerancesSetObj(solver,absoluteTolerance,relativeTolerance,err)
+    !DLLEXPORT(cmfe_Solver_DAERungeKuttaTolerancesSetObj)
+
+    !Argument variables
+    TYPE(cmfe_SolverType), INTENT(IN) :: solver !<The solver to set the Runge-Kutta tolerances for.
+    REAL(DP), INTENT(IN) :: absoluteTolerance !<The absolute tolerance to set.
+    REAL(DP), INTENT(IN) :: relativeTolerance !<The relative tolerance to set.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_Solver_DAERungeKuttaTolerancesSetObj",err,error,*999)
+
+    CALL SOLVER_DAE_RUNGE_KUTTA_TOLERANCES_SET(solver%solver,absoluteTolerance,relativeTolerance,err,error,*999)
+
+    EXITS("cmfe_Solver_DAERungeKuttaTolerancesSetObj")
+    RETURN
+999 ERRORSEXITS("cmfe_Solver_DAERungeKuttaTolerancesSetObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Solver_DAERungeKuttaTolerancesSetObj
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the number of cells a differential-algebraic equation solver integrates together in batches identified by an user number.
+  SUBROUTINE cmfe_Solver_DAEBatchSizeSetNumber0(problemUserNumber,controlLoopIdentifier,solverIndex,batchSize,err)
+    !DLLEXPORT(cmfe_Solver_DAEBatchSizeSetNumber0)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: problemUserNumber !<The user number of the problem number with the solver to set the DAE batch size for.
+    INTEGER(INTG), INTENT(IN) :: controlLoopIdentifier !<The control loop identifier with the solver to set the DAE batch size for.
+    INTEGER(INTG), INTENT(IN) :: solverIndex !<The solver index to set the DAE batch size for.
+    INTEGER(INTG), INTENT(IN) :: batchSize !<The number of cells to integrate together in structure-of-arrays batches. 0 to integrate the dofs one at a time.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(PROBLEM_TYPE), POINTER :: PROBLEM
+    TYPE(SOLVER_TYPE), POINTER :: SOLVER
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_Solver_DAEBatchSizeSetNumber0",err,error,*999)
+
+    NULLIFY(PROBLEM)
+    NULLIFY(SOLVER)
+    CALL PROBLEM_USER_NUMBER_FIND(problemUserNumber,PROBLEM,err,error,*999)
+    IF(ASSOCIATED(PROBLEM)) THEN
+      CALL PROBLEM_SOLVER_GET(PROBLEM,controlLoopIdentifier,solverIndex,SOLVER,err,error,*999)
+      CALL SOLVER_DAE_BATCH_SIZE_SET(SOLVER,batchSize,err,error,*999)
+    ELSE
+      localError="A problem with an user number of "//TRIM(NumberToVString(problemUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_Solver_DAEBatchSizeSetNumber0")
+    RETURN
+999 ERRORSEXITS("cmfe_Solver_DAEBatchSizeSetNumber0",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Solver_DAEBatchSizeSetNumber0
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the number of cells a differential-algebraic equation solver integrates together in batches identified by an user number.
+  SUBROUTINE cmfe_Solver_DAEBatchSizeSetNumber1(problemUserNumber,controlLoopIdentifiers,solverIndex,batchSize,err)
+    !DLLEXPORT(cmfe_Solver_DAEBatchSizeSetNumber1)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: problemUserNumber !<The user number of the problem number with the solver to set the DAE batch size for.
+    INTEGER(INTG), INTENT(IN) :: controlLoopIdentifiers(:) !<controlLoopIdentifiers(i). The i'th control loop identifier to set the DAE batch size for.
+    INTEGER(INTG), INTENT(IN) :: solverIndex !<The solver index to set the DAE batch size for.
+    INTEGER(INTG), INTENT(IN) :: batchSize !<The number of cells to integrate together in structure-of-arrays batches. 0 to integrate the dofs one at a time.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+    TYPE(PROBLEM_TYPE), POINTER :: PROBLEM
+    TYPE(SOLVER_TYPE), POINTER :: SOLVER
+    TYPE(VARYING_STRING) :: localError
+
+    ENTERS("cmfe_Solver_DAEBatchSizeSetNumber1",err,error,*999)
+
+    NULLIFY(PROBLEM)
+    NULLIFY(SOLVER)
+    CALL PROBLEM_USER_NUMBER_FIND(problemUserNumber,PROBLEM,err,error,*999)
+    IF(ASSOCIATED(PROBLEM)) THEN
+      CALL PROBLEM_SOLVER_GET(PROBLEM,controlLoopIdentifiers,solverIndex,SOLVER,err,error,*999)
+      CALL SOLVER_DAE_BATCH_SIZE_SET(SOLVER,batchSize,err,error,*999)
+    ELSE
+      localError="A problem with an user number of "//TRIM(NumberToVString(problemUserNumber,"*",err,error))// &
+        & " does not exist."
+      CALL FlagError(localError,err,error,*999)
+    END IF
+
+    EXITS("cmfe_Solver_DAEBatchSizeSetNumber1")
+    RETURN
+999 ERRORSEXITS("cmfe_Solver_DAEBatchSizeSetNumber1",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Solver_DAEBatchSizeSetNumber1
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sets/changes the number of cells a differential-algebraic equation solver integrates together in batches identified by an object.
+  SUBROUTINE cmfe_Solver_DAEBatchSizeSetObj(solver,batchSize,err)
+    !DLLEXPORT(cmfe_Solver_DAEBatchSizeSetObj)
+
+    !Argument variables
+    TYPE(cmfe_SolverType), INTENT(IN) :: solver !<The solver to set the DAE batch size for.
+    INTEGER(INTG), INTENT(IN) :: batchSize !<The number of cells to integrate together in structure-of-arrays batches. 0 to integrate the dofs one at a time.
+    INTEGER(INTG), INTENT(OUT) :: err !<The error code.
+    !Local variables
+
+    ENTERS("cmfe_Solver_DAEBatchSizeSetObj",err,error,*999)
+
+    CALL SOLVER_DAE_BATCH_SIZE_SET(solver%solver,batchSize,err,error,*999)
+
+    EXITS("cmfe_Solver_DAEBatchSizeSetObj")
+    RETURN
+999 ERRORSEXITS("cmfe_Solver_DAEBatchSizeSetObj",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_Solver_DAEBatchSizeSetObj
+
+  !
+  !================================================================================================================================
+  !
+
   !>Changes the absolute and relative error tolerances for the BDF differential-algebraic equation solver.
   SUBROUTINE cmfe_Solver_DAEbdfSetTolerance(solver,abs_tol,rel_tol,err)
     !DLLEXPORT(cmfe_Solver_DAESolverTypeSetNumber1)
@@ -61058,6 +62807,38 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !> Sets the size of the block cache used to read FieldML array data on demand. Only the rows needed by the local and ghost
+  !> nodes of each computational node are read, blockSize rows at a time.
+  SUBROUTINE cmfe_FieldML_InputReadCacheSet( fieldml, blockSize, numberOfBlocks, err )
+    !DLLEXPORT(cmfe_FieldML_InputReadCacheSet)
+    !Arguments
+    TYPE(cmfe_FieldMLIOType), INTENT(INOUT) :: fieldml !< The FieldML context.
+    INTEGER(INTG), INTENT(IN) :: blockSize !< The number of array rows to read at a time.
+    INTEGER(INTG), INTENT(IN) :: numberOfBlocks !< The number of row blocks to hold in the cache.
+    INTEGER(INTG), INTENT(OUT) :: err !< The error code.
+
+    ENTERS("cmfe_FieldML_InputReadCacheSet",err,error,*999)
+
+#ifdef WITH_FIELDML
+
+    CALL FieldmlInput_ReadCacheSet( fieldml%fieldmlInfo, blockSize, numberOfBlocks, err, error, *999 )
+
+#else
+    CALL FlagError("Must compile with WITH_FIELDML ON to use FieldML functionality.",ERR,error,*999)
+#endif
+
+    EXITS("cmfe_FieldML_InputReadCacheSet")
+    RETURN
+999 ERRORSEXITS("cmfe_FieldML_InputReadCacheSet",err,error)
+    CALL cmfe_HandleError(err,error)
+    RETURN
+
+  END SUBROUTINE cmfe_FieldML_InputReadCacheSet
+
+  !
+  !================================================================================================================================
+  !
+
   !> Write the FieldML document managed by the given context to a file with the given name.
   SUBROUTINE cmfe_FieldML_OutputWriteVS( fieldml, filename, err )
     !DLLEXPORT(cmfe_FieldML_OutputWriteVS)
@@ -61132,7 +62913,7 @@ CONTAINS
     !Argument variables
     TYPE(cmfe_FieldMLIOType), INTENT(IN) :: fieldml !< The FieldML context containing the evaluator to use.
     TYPE(VARYING_STRING), INTENT(IN) :: baseName !< The prefix to use when naming automatically created FieldML objects in the context.
-    TYPE(VARYING_STRING), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data.
+    TYPE(VARYING_STRING), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data, e.g. "PLAIN_TEXT", "HDF5", or "PHDF5" for every rank to write its own part of a shared HDF5 file.
     TYPE(cmfe_FieldType), INTENT(IN) :: field !< The field to add.
     INTEGER(INTG), INTENT(IN) :: variableType !< The variable type of the field to add.
     INTEGER(INTG), INTENT(IN) :: setType !<The parameter set type.
@@ -61168,7 +62949,7 @@ CONTAINS
     !Argument variables
     TYPE(cmfe_FieldMLIOType), INTENT(IN) :: fieldml !< The FieldML context containing the evaluator to use.
     TYPE(VARYING_STRING), INTENT(IN) :: baseName !< The prefix to use when naming automatically created FieldML objects in the context.
-    TYPE(VARYING_STRING), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data.
+    TYPE(VARYING_STRING), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data, e.g. "PLAIN_TEXT", "HDF5", or "PHDF5" for every rank to write its own part of a shared HDF5 file.
     INTEGER(INTG), INTENT(IN) :: regionNumber !< The user number of the region containing the field to add to the FieldML context.
     INTEGER(INTG), INTENT(IN) :: fieldNumber !< The user number of the field to add to the FieldML context.
     INTEGER(INTG), INTENT(IN) :: variableType !< The variable type of the field to add to the FieldML context.
@@ -61210,7 +62991,7 @@ CONTAINS
     !Argument variables
     TYPE(cmfe_FieldMLIOType), INTENT(IN) :: fieldml !< The FieldML context containing the evaluator to use.
     TYPE(VARYING_STRING), INTENT(IN) :: baseName !< The prefix to use when naming automatically created FieldML objects in the context.
-    TYPE(VARYING_STRING), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data.
+    TYPE(VARYING_STRING), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data, e.g. "PLAIN_TEXT", "HDF5", or "PHDF5" for every rank to write its own part of a shared HDF5 file.
     TYPE(cmfe_FieldType), INTENT(IN) :: field !< The field to add to the FieldML context.
     INTEGER(INTG), INTENT(IN) :: variableType !< The variable type of the field to add to the FieldML context.
     INTEGER(INTG), INTENT(IN) :: typeHandle !< The FieldML type to assign to the new FieldML field.
@@ -61247,7 +63028,7 @@ CONTAINS
     !Argument variables
     TYPE(cmfe_FieldMLIOType), INTENT(IN) :: fieldml !< The FieldML context containing the evaluator to use.
     TYPE(VARYING_STRING), INTENT(IN) :: baseName !< The prefix to use when naming automatically created FieldML objects in the context.
-    TYPE(VARYING_STRING), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data.
+    TYPE(VARYING_STRING), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data, e.g. "PLAIN_TEXT", "HDF5", or "PHDF5" for every rank to write its own part of a shared HDF5 file.
     INTEGER(INTG), INTENT(IN) :: regionNumber !< The user number of the region owning the field to add.
     INTEGER(INTG), INTENT(IN) :: fieldNumber !< The user number of the field to add.
     INTEGER(INTG), INTENT(IN) :: variableType !< The variable type of the field to add to the FieldML context.
@@ -61291,7 +63072,7 @@ CONTAINS
     !Argument variables
     TYPE(cmfe_FieldMLIOType), INTENT(IN) :: fieldml !< The FieldML context containing the evaluator to use.
     CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: baseName !< The prefix to use when naming automatically created FieldML objects in the context.
-    CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data.
+    CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data, e.g. "PLAIN_TEXT", "HDF5", or "PHDF5" for every rank to write its own part of a shared HDF5 file.
     TYPE(cmfe_FieldType), INTENT(IN) :: field !< The field to add.
     INTEGER(INTG), INTENT(IN) :: variableType !< The variable type of the field to add.
     INTEGER(INTG), INTENT(IN) :: setType !<The parameter set type.
@@ -61327,7 +63108,7 @@ CONTAINS
     !Argument variables
     TYPE(cmfe_FieldMLIOType), INTENT(IN) :: fieldml !< The FieldML context containing the evaluator to use.
     CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: baseName !< The prefix to use when naming automatically created FieldML objects in the context.
-    CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data.
+    CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data, e.g. "PLAIN_TEXT", "HDF5", or "PHDF5" for every rank to write its own part of a shared HDF5 file.
     INTEGER(INTG), INTENT(IN) :: regionNumber !< The user number of the region containing the field to add to the FieldML context.
     INTEGER(INTG), INTENT(IN) :: fieldNumber !< The user number of the field to add to the FieldML context.
     INTEGER(INTG), INTENT(IN) :: variableType !< The variable type of the field to add to the FieldML context.
@@ -61370,7 +63151,7 @@ CONTAINS
     !Argument variables
     TYPE(cmfe_FieldMLIOType), INTENT(IN) :: fieldml !< The FieldML context containing the evaluator to use.
     CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: baseName !< The prefix to use when naming automatically created FieldML objects in the context.
-    CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data.
+    CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data, e.g. "PLAIN_TEXT", "HDF5", or "PHDF5" for every rank to write its own part of a shared HDF5 file.
     TYPE(cmfe_FieldType), INTENT(IN) :: field !< The field to add to the FieldML context.
     INTEGER(INTG), INTENT(IN) :: variableType !< The variable type of the field to add to the FieldML context.
     INTEGER(INTG), INTENT(IN) :: setType !<The parameter set type.
@@ -61407,7 +63188,7 @@ CONTAINS
     !Argument variables
     TYPE(cmfe_FieldMLIOType), INTENT(IN) :: fieldml !< The FieldML context containing the evaluator to use.
     CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: baseName !< The prefix to use when naming automatically created FieldML objects in the context.
-    CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data.
+    CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data, e.g. "PLAIN_TEXT", "HDF5", or "PHDF5" for every rank to write its own part of a shared HDF5 file.
     INTEGER(INTG), INTENT(IN) :: regionNumber !< The user number of the region owning the field to add.
     INTEGER(INTG), INTENT(IN) :: fieldNumber !< The user number of the field to add.
     INTEGER(INTG), INTENT(IN) :: variableType !< The variable type of the field to add to the FieldML context.
@@ -61604,7 +63385,7 @@ CONTAINS
     TYPE(cmfe_FieldMLIOType), INTENT(IN) :: fieldml !< The FieldML context containing the evaluator to use.
     INTEGER(INTG), INTENT(IN) :: typeHandle !< The FieldML type to assign to the new FieldML field.
     TYPE(VARYING_STRING), INTENT(IN) :: baseName !< The prefix to use when naming automatically created FieldML objects in the context.
-    TYPE(VARYING_STRING), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data.
+    TYPE(VARYING_STRING), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data, e.g. "PLAIN_TEXT", "HDF5", or "PHDF5" for every rank to write its own part of a shared HDF5 file.
     TYPE(cmfe_FieldType), INTENT(IN) :: field !< The field whose components are to be added.
     INTEGER(INTG), INTENT(IN) :: fieldComponentNumbers(:)
     INTEGER(INTG), INTENT(IN) :: variableType !< The variable type of the field to add to the FieldML context.
@@ -61642,7 +63423,7 @@ CONTAINS
     TYPE(cmfe_FieldMLIOType), INTENT(IN) :: fieldml !< The FieldML context containing the evaluator to use.
     INTEGER(INTG), INTENT(IN) :: typeHandle !< The FieldML type to assign to the new FieldML field.
     TYPE(VARYING_STRING), INTENT(IN) :: baseName !< The prefix to use when naming automatically created FieldML objects in the context.
-    TYPE(VARYING_STRING), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data.
+    TYPE(VARYING_STRING), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data, e.g. "PLAIN_TEXT", "HDF5", or "PHDF5" for every rank to write its own part of a shared HDF5 file.
     INTEGER(INTG), INTENT(IN) :: regionNumber !< The user number of the region owning the field to add.
     INTEGER(INTG), INTENT(IN) :: fieldNumber !< The user number of the field whose components are to be added.
     INTEGER(INTG), INTENT(IN) :: fieldComponentNumbers(:) !< The component numbers to add.
@@ -61689,7 +63470,7 @@ CONTAINS
     TYPE(cmfe_FieldMLIOType), INTENT(IN) :: fieldml !< The FieldML context containing the evaluator to use.
     INTEGER(INTG), INTENT(IN) :: typeHandle !< The FieldML type to assign to the new FieldML field.
     CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: baseName !< The prefix to use when naming automatically created FieldML objects in the context.
-    CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data.
+    CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data, e.g. "PLAIN_TEXT", "HDF5", or "PHDF5" for every rank to write its own part of a shared HDF5 file.
     TYPE(cmfe_FieldType), INTENT(IN) :: field !< The field whose components are to be added.
     INTEGER(INTG), INTENT(IN) :: fieldComponentNumbers(:)
     INTEGER(INTG), INTENT(IN) :: variableType !< The variable type of the field to add to the FieldML context.
@@ -61727,7 +63508,7 @@ CONTAINS
     TYPE(cmfe_FieldMLIOType), INTENT(IN) :: fieldml !< The FieldML context containing the evaluator to use.
     INTEGER(INTG), INTENT(IN) :: typeHandle !< The FieldML type to assign to the new FieldML field.
     CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: baseName !< The prefix to use when naming automatically created FieldML objects in the context.
-    CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data.
+    CHARACTER(KIND=C_CHAR,LEN=*), INTENT(IN) :: dofFormat !<The name of the format to use when writing dof data, e.g. "PLAIN_TEXT", "HDF5", or "PHDF5" for every rank to write its own part of a shared HDF5 file.
     INTEGER(INTG), INTENT(IN) :: regionNumber !< The user number of the region owning the field to add.
     INTEGER(INTG), INTENT(IN) :: fieldNumber !< The user number of the field whose components are to be added.
     INTEGER(INTG), INTENT(IN) :: fieldComponentNumbers(:) !< The component numbers to add.
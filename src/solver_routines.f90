@@ -564,6 +564,10 @@ MODULE SOLVER_ROUTINES
 
   PUBLIC SOLVER_DAE_TIMES_SET,SOLVER_DAE_TIME_STEP_SET, SOLVER_DAE_BDF_SET_TOLERANCE
 
+  PUBLIC SOLVER_DAE_BATCH_SIZE_SET,SOLVER_DAE_THREADS_SET
+
+  PUBLIC SOLVER_DAE_RUNGE_KUTTA_TOLERANCES_SET
+
   PUBLIC SOLVER_DAE_EULER_SOLVER_TYPE_GET,SOLVER_DAE_EULER_SOLVER_TYPE_SET
 
   PUBLIC Solver_DAECellMLRHSEvaluate
@@ -2151,9 +2155,9 @@ CONTAINS
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
-    INTEGER(INTG) :: dof_idx,DOF_ORDER_TYPE,INTERMEDIATE_END_DOF,intermediate_idx,INTERMEDIATE_START_DOF,model_idx, &
-      & NUMBER_INTERMEDIATES,NUMBER_PARAMETERS,NUMBER_STATES,PARAMETER_END_DOF,parameter_idx,PARAMETER_START_DOF, &
-      & STATE_END_DOF,state_idx,STATE_START_DOF
+    INTEGER(INTG) :: BATCH_SIZE,dof_idx,DOF_ORDER_TYPE,INTERMEDIATE_END_DOF,intermediate_idx,INTERMEDIATE_START_DOF, &
+      & model_idx,NUMBER_INTERMEDIATES,NUMBER_OF_THREADS,NUMBER_PARAMETERS,NUMBER_STATES,PARAMETER_END_DOF,parameter_idx, &
+      & PARAMETER_START_DOF,STATE_END_DOF,state_idx,STATE_START_DOF
     REAL(DP) :: INTERMEDIATES(MAX(1,MAX_NUMBER_INTERMEDIATES)),PARAMETERS(MAX(1,MAX_NUMBER_PARAMETERS)), &
       & RATES(MAX(1,MAX_NUMBER_STATES)),STATES(MAX(1,MAX_NUMBER_STATES)),TIME
     TYPE(CELLML_MODEL_TYPE), POINTER :: MODEL
@@ -2168,10 +2172,29 @@ CONTAINS
       IF(ASSOCIATED(CELLML)) THEN
         IF(ASSOCIATED(CELLML%MODELS_FIELD)) THEN
           CALL FIELD_DOF_ORDER_TYPE_GET(CELLML%MODELS_FIELD%MODELS_FIELD,FIELD_U_VARIABLE_TYPE,DOF_ORDER_TYPE,ERR,ERROR,*999)
-          IF(DOF_ORDER_TYPE==FIELD_SEPARATED_COMPONENT_DOF_ORDER) THEN
+          NUMBER_OF_THREADS=1
+          BATCH_SIZE=0
+          IF(ASSOCIATED(FORWARD_EULER_SOLVER%EULER_DAE_SOLVER)) THEN
+            IF(ASSOCIATED(FORWARD_EULER_SOLVER%EULER_DAE_SOLVER%DAE_SOLVER)) THEN
+              NUMBER_OF_THREADS=FORWARD_EULER_SOLVER%EULER_DAE_SOLVER%DAE_SOLVER%NUMBER_OF_THREADS
+              BATCH_SIZE=FORWARD_EULER_SOLVER%EULER_DAE_SOLVER%DAE_SOLVER%BATCH_SIZE
+            ENDIF
+          ENDIF
+          IF(DOF_ORDER_TYPE/=FIELD_SEPARATED_COMPONENT_DOF_ORDER.AND.BATCH_SIZE>0) THEN
+            !Dof components are continguous. Integrate the cells sharing a model in structure-of-arrays batches.
+            CALL SOLVER_DAE_EULER_FORWARD_INTEGRATE_BATCHED(CELLML,N,START_TIME,END_TIME,TIME_INCREMENT_I, &
+              & MODELS_DATA,MAX_NUMBER_STATES,STATE_DATA,MAX_NUMBER_PARAMETERS,PARAMETERS_DATA, &
+              & MAX_NUMBER_INTERMEDIATES,INTERMEDIATE_DATA,BATCH_SIZE,ERR,ERROR,*999)
+          ELSE IF(DOF_ORDER_TYPE/=FIELD_SEPARATED_COMPONENT_DOF_ORDER.AND.NUMBER_OF_THREADS>1) THEN
+            !Dof components are continguous and the dofs are independent so integrate them in parallel.
+            CALL SOLVER_DAE_EULER_FORWARD_INTEGRATE_THREADED(CELLML,N,START_TIME,END_TIME,TIME_INCREMENT_I, &
+              & ONLY_ONE_MODEL_INDEX,MODELS_DATA,MAX_NUMBER_STATES,STATE_DATA,MAX_NUMBER_PARAMETERS,PARAMETERS_DATA, &
+              & MAX_NUMBER_INTERMEDIATES,INTERMEDIATE_DATA,NUMBER_OF_THREADS,ERR,ERROR,*999)
+          ELSE IF(DOF_ORDER_TYPE==FIELD_SEPARATED_COMPONENT_DOF_ORDER) THEN
             !Dof components are separated. Will need to copy data to temporary arrays.
             IF(ONLY_ONE_MODEL_INDEX==CELLML_MODELS_FIELD_NOT_CONSTANT) THEN
               !Mulitple models
+              TIME=START_TIME
               DO WHILE(TIME<END_TIME)!Aaron changed this (was '<='). until now, we made a step too much. Additionally, the last step size is chosen s.t. we end up with TIME==END_TIME, when leaving.
                 !prepare time increment: (actually, this needs only to be done at most once at the last step. so most of the time it might just be an expensive evaluation. ..-> better idea?!)
                 TIME_INCREMENT=MIN(TIME_INCREMENT,END_TIME-TIME)
@@ -2549,6 +2572,290 @@ CONTAINS
   !================================================================================================================================
   !
 
+  !>Integrate contiguous CellML dofs using a forward Euler differential-algebraic equation solver in batches. The dofs are
+  !>grouped by model using the models field and each batch of cells sharing a model is copied to structure-of-arrays scratch
+  !>arrays, integrated over the whole time interval and copied back.
+  SUBROUTINE SOLVER_DAE_EULER_FORWARD_INTEGRATE_BATCHED(CELLML,N,START_TIME,END_TIME,TIME_INCREMENT_I,MODELS_DATA, &
+    & MAX_NUMBER_STATES,STATE_DATA,MAX_NUMBER_PARAMETERS,PARAMETERS_DATA,MAX_NUMBER_INTERMEDIATES,INTERMEDIATE_DATA, &
+    & BATCH_SIZE,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(CELLML_TYPE), POINTER :: CELLML !<A pointer to the CellML environment to integrate the equations for.
+    INTEGER(INTG), INTENT(IN) :: N !<The number of degrees-of-freedom
+    REAL(DP), INTENT(IN) :: START_TIME !<The start time for the integration
+    REAL(DP), INTENT(IN) :: END_TIME !<The end time for the integration
+    REAL(DP), INTENT(IN) :: TIME_INCREMENT_I !<The (initial) time increment for the integration
+    INTEGER(INTG), POINTER :: MODELS_DATA(:) !<MODELS_DATA(dof_idx). The models data for the dof_idx'th dof.
+    INTEGER(INTG), INTENT(IN) :: MAX_NUMBER_STATES !<The maximum number of state variables per dof
+    REAL(DP), POINTER :: STATE_DATA(:) !<STATE_DATA(state_idx,dof_idx). The state data for the state_idx'th state variable of the dof_idx'th dof. state_idx varies from 1..NUMBER_STATES.
+    INTEGER(INTG), INTENT(IN) :: MAX_NUMBER_PARAMETERS !<The maximum number of parameter variables per dof.
+    REAL(DP), POINTER :: PARAMETERS_DATA(:) !<PARAMETERS_DATA(parameter_idx,dof_idx). The parameters data for the parameter_idx'th parameter variable of the dof_idx'th dof. parameter_idx varies from 1..NUMBER_PARAMETERS.
+    INTEGER(INTG), INTENT(IN) :: MAX_NUMBER_INTERMEDIATES !<The maximum number of intermediate variables per dof.
+    REAL(DP), POINTER :: INTERMEDIATE_DATA(:) !<INTERMEDIATE_DATA(intermediate_idx,dof_idx). The intermediate values data for the intermediate_idx'th intermediate variable of the dof_idx'th dof. intermediate_idx varies from 1.NUMBER_INTERMEDIATE
+    INTEGER(INTG), INTENT(IN) :: BATCH_SIZE !<The maximum number of cells to integrate together
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: batch_start,cell_idx,dof_idx,INTERMEDIATE_START_DOF,model_idx,NUMBER_INTERMEDIATES,NUMBER_OF_CELLS, &
+      & NUMBER_PARAMETERS,NUMBER_STATES,PARAMETER_START_DOF,state_idx,STATE_START_DOF
+    INTEGER(INTG), ALLOCATABLE :: MODEL_DOFS(:),MODEL_DOFS_OFFSETS(:)
+    REAL(DP) :: TIME,TIME_INCREMENT
+    REAL(DP), ALLOCATABLE :: INTERMEDIATES(:,:),PARAMETERS(:,:),RATES(:,:),STATES(:,:)
+    TYPE(CELLML_MODEL_TYPE), POINTER :: MODEL
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("SOLVER_DAE_EULER_FORWARD_INTEGRATE_BATCHED",ERR,ERROR,*999)
+
+    IF(.NOT.ASSOCIATED(CELLML)) CALL FlagError("CellML environment is not associated.",ERR,ERROR,*999)
+    IF(BATCH_SIZE<1) THEN
+      LOCAL_ERROR="The specified batch size of "//TRIM(NumberToVString(BATCH_SIZE,"*",ERR,ERROR))// &
+        & " is invalid. The batch size must be >= 1."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+
+#ifdef WITH_CELLML
+    CALL CellML_ModelsFieldDofsSort(CELLML,N,MODELS_DATA,MODEL_DOFS_OFFSETS,MODEL_DOFS,ERR,ERROR,*999)
+    ALLOCATE(STATES(BATCH_SIZE,MAX(1,MAX_NUMBER_STATES)),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate batch states.",ERR,ERROR,*999)
+    ALLOCATE(RATES(BATCH_SIZE,MAX(1,MAX_NUMBER_STATES)),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate batch rates.",ERR,ERROR,*999)
+    ALLOCATE(INTERMEDIATES(BATCH_SIZE,MAX(1,MAX_NUMBER_INTERMEDIATES)),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate batch intermediates.",ERR,ERROR,*999)
+    ALLOCATE(PARAMETERS(BATCH_SIZE,MAX(1,MAX_NUMBER_PARAMETERS)),STAT=ERR)
+    IF(ERR/=0) CALL FlagError("Could not allocate batch parameters.",ERR,ERROR,*999)
+
+#ifdef TAUPROF
+    CALL TAU_STATIC_PHASE_START('cellml call rhs')
+#endif
+#ifdef USE_CUSTOM_PROFILING
+    CALL CustomProfilingStart('cellml call rhs')
+#endif
+
+    DO model_idx=1,CELLML%NUMBER_OF_MODELS
+      IF(MODEL_DOFS_OFFSETS(model_idx+1)>MODEL_DOFS_OFFSETS(model_idx)) THEN
+        MODEL=>CELLML%MODELS(model_idx)%PTR
+        IF(.NOT.ASSOCIATED(MODEL)) THEN
+          LOCAL_ERROR="CellML environment model is not associated for model index "// &
+            & TRIM(NumberToVString(model_idx,"*",ERR,ERROR))//"."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        ENDIF
+        NUMBER_STATES=MODEL%NUMBER_OF_STATE
+        NUMBER_INTERMEDIATES=MODEL%NUMBER_OF_INTERMEDIATE
+        NUMBER_PARAMETERS=MODEL%NUMBER_OF_PARAMETERS
+        IF(NUMBER_STATES<=0) CALL FlagError("Invalid CellML model for integration - there are no states.",ERR,ERROR,*999)
+        DO batch_start=MODEL_DOFS_OFFSETS(model_idx),MODEL_DOFS_OFFSETS(model_idx+1)-1,BATCH_SIZE
+          NUMBER_OF_CELLS=MIN(BATCH_SIZE,MODEL_DOFS_OFFSETS(model_idx+1)-batch_start)
+          !Gather the batch of cells
+          DO cell_idx=1,NUMBER_OF_CELLS
+            dof_idx=MODEL_DOFS(batch_start+cell_idx-1)
+            STATE_START_DOF=(dof_idx-1)*MAX_NUMBER_STATES
+            STATES(cell_idx,1:NUMBER_STATES)=STATE_DATA(STATE_START_DOF+1:STATE_START_DOF+NUMBER_STATES)
+            IF(NUMBER_PARAMETERS>0) THEN
+              PARAMETER_START_DOF=(dof_idx-1)*MAX_NUMBER_PARAMETERS
+              PARAMETERS(cell_idx,1:NUMBER_PARAMETERS)=PARAMETERS_DATA(PARAMETER_START_DOF+1:PARAMETER_START_DOF+NUMBER_PARAMETERS)
+            ENDIF
+          ENDDO !cell_idx
+          !Integrate the batch
+          TIME=START_TIME
+          TIME_INCREMENT=TIME_INCREMENT_I
+          DO WHILE(TIME<END_TIME)
+            TIME_INCREMENT=MIN(TIME_INCREMENT,END_TIME-TIME)
+            CALL CellML_ModelRHSBatchEvaluate(MODEL,TIME,NUMBER_OF_CELLS,STATES,RATES,INTERMEDIATES,PARAMETERS,ERR,ERROR,*999)
+            DO state_idx=1,NUMBER_STATES
+              STATES(1:NUMBER_OF_CELLS,state_idx)=STATES(1:NUMBER_OF_CELLS,state_idx)+ &
+                & TIME_INCREMENT*RATES(1:NUMBER_OF_CELLS,state_idx)
+            ENDDO !state_idx
+            TIME=TIME+TIME_INCREMENT
+          ENDDO !time
+          !Scatter the batch of cells
+          DO cell_idx=1,NUMBER_OF_CELLS
+            dof_idx=MODEL_DOFS(batch_start+cell_idx-1)
+            STATE_START_DOF=(dof_idx-1)*MAX_NUMBER_STATES
+            STATE_DATA(STATE_START_DOF+1:STATE_START_DOF+NUMBER_STATES)=STATES(cell_idx,1:NUMBER_STATES)
+            IF(NUMBER_INTERMEDIATES>0) THEN
+              INTERMEDIATE_START_DOF=(dof_idx-1)*MAX_NUMBER_INTERMEDIATES
+              INTERMEDIATE_DATA(INTERMEDIATE_START_DOF+1:INTERMEDIATE_START_DOF+NUMBER_INTERMEDIATES)= &
+                & INTERMEDIATES(cell_idx,1:NUMBER_INTERMEDIATES)
+            ENDIF
+          ENDDO !cell_idx
+        ENDDO !batch_start
+      ENDIF
+    ENDDO !model_idx
+
+#ifdef USE_CUSTOM_PROFILING
+    CALL CustomProfilingStop('cellml call rhs')
+#endif
+#ifdef TAUPROF
+    CALL TAU_STATIC_PHASE_STOP('cellml call rhs')
+#endif
+
+    DEALLOCATE(MODEL_DOFS_OFFSETS)
+    DEALLOCATE(MODEL_DOFS)
+    DEALLOCATE(STATES)
+    DEALLOCATE(RATES)
+    DEALLOCATE(INTERMEDIATES)
+    DEALLOCATE(PARAMETERS)
+#else
+    CALL FlagError("Must compile with WITH_CELLML ON to use CellML functionality.",ERR,ERROR,*999)
+#endif
+
+    EXITS("SOLVER_DAE_EULER_FORWARD_INTEGRATE_BATCHED")
+    RETURN
+999 IF(ALLOCATED(MODEL_DOFS_OFFSETS)) DEALLOCATE(MODEL_DOFS_OFFSETS)
+    IF(ALLOCATED(MODEL_DOFS)) DEALLOCATE(MODEL_DOFS)
+    IF(ALLOCATED(STATES)) DEALLOCATE(STATES)
+    IF(ALLOCATED(RATES)) DEALLOCATE(RATES)
+    IF(ALLOCATED(INTERMEDIATES)) DEALLOCATE(INTERMEDIATES)
+    IF(ALLOCATED(PARAMETERS)) DEALLOCATE(PARAMETERS)
+    ERRORSEXITS("SOLVER_DAE_EULER_FORWARD_INTEGRATE_BATCHED",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE SOLVER_DAE_EULER_FORWARD_INTEGRATE_BATCHED
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Integrate contiguous CellML dofs using a forward Euler differential-algebraic equation solver with OpenMP threads. The
+  !>dofs are independent so each thread integrates its dofs over the whole time interval using thread private scratch arrays.
+  SUBROUTINE SOLVER_DAE_EULER_FORWARD_INTEGRATE_THREADED(CELLML,N,START_TIME,END_TIME,TIME_INCREMENT_I, &
+    & ONLY_ONE_MODEL_INDEX,MODELS_DATA,MAX_NUMBER_STATES,STATE_DATA,MAX_NUMBER_PARAMETERS,PARAMETERS_DATA, &
+    & MAX_NUMBER_INTERMEDIATES,INTERMEDIATE_DATA,NUMBER_OF_THREADS,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(CELLML_TYPE), POINTER :: CELLML !<A pointer to the CellML environment to integrate the equations for.
+    INTEGER(INTG), INTENT(IN) :: N !<The number of degrees-of-freedom
+    REAL(DP), INTENT(IN) :: START_TIME !<The start time for the integration
+    REAL(DP), INTENT(IN) :: END_TIME !<The end time for the integration
+    REAL(DP), INTENT(IN) :: TIME_INCREMENT_I !<The (initial) time increment for the integration
+    INTEGER(INTG), INTENT(IN) :: ONLY_ONE_MODEL_INDEX !<If only one model is used in the models data the index of that model. 0 otherwise.
+    INTEGER(INTG), POINTER :: MODELS_DATA(:) !<MODELS_DATA(dof_idx). The models data for the dof_idx'th dof.
+    INTEGER(INTG), INTENT(IN) :: MAX_NUMBER_STATES !<The maximum number of state variables per dof
+    REAL(DP), POINTER :: STATE_DATA(:) !<STATE_DATA(state_idx,dof_idx). The state data for the state_idx'th state variable of the dof_idx'th dof. state_idx varies from 1..NUMBER_STATES.
+    INTEGER(INTG), INTENT(IN) :: MAX_NUMBER_PARAMETERS !<The maximum number of parameter variables per dof.
+    REAL(DP), POINTER :: PARAMETERS_DATA(:) !<PARAMETERS_DATA(parameter_idx,dof_idx). The parameters data for the parameter_idx'th parameter variable of the dof_idx'th dof. parameter_idx varies from 1..NUMBER_PARAMETERS.
+    INTEGER(INTG), INTENT(IN) :: MAX_NUMBER_INTERMEDIATES !<The maximum number of intermediate variables per dof.
+    REAL(DP), POINTER :: INTERMEDIATE_DATA(:) !<INTERMEDIATE_DATA(intermediate_idx,dof_idx). The intermediate values data for the intermediate_idx'th intermediate variable of the dof_idx'th dof. intermediate_idx varies from 1.NUMBER_INTERMEDIATE
+    INTEGER(INTG), INTENT(IN) :: NUMBER_OF_THREADS !<The number of threads to integrate the dofs with
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: dof_idx,INTERMEDIATE_START_DOF,model_idx,NUMBER_INTERMEDIATES,NUMBER_PARAMETERS,NUMBER_STATES, &
+      & PARAMETER_START_DOF,STATE_START_DOF
+    REAL(DP) :: INTERMEDIATES(MAX(1,MAX_NUMBER_INTERMEDIATES)),PARAMETERS(MAX(1,MAX_NUMBER_PARAMETERS)), &
+      & RATES(MAX(1,MAX_NUMBER_STATES)),STATES(MAX(1,MAX_NUMBER_STATES)),TIME,TIME_INCREMENT
+    TYPE(CELLML_MODEL_TYPE), POINTER :: MODEL
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("SOLVER_DAE_EULER_FORWARD_INTEGRATE_THREADED",ERR,ERROR,*999)
+
+    IF(.NOT.ASSOCIATED(CELLML)) CALL FlagError("CellML environment is not associated.",ERR,ERROR,*999)
+    IF(NUMBER_OF_THREADS<1) THEN
+      LOCAL_ERROR="The specified number of threads of "//TRIM(NumberToVString(NUMBER_OF_THREADS,"*",ERR,ERROR))// &
+        & " is invalid. The number of threads must be >= 1."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+
+#ifdef WITH_CELLML
+    !Check all the models before starting the threads as errors can not be flagged from inside the parallel region.
+    IF(ONLY_ONE_MODEL_INDEX==CELLML_MODELS_FIELD_NOT_CONSTANT) THEN
+      DO dof_idx=1,N
+        model_idx=MODELS_DATA(dof_idx)
+        IF(model_idx>0.AND.model_idx<=CELLML%NUMBER_OF_MODELS) THEN
+          MODEL=>CELLML%MODELS(model_idx)%PTR
+          IF(ASSOCIATED(MODEL)) THEN
+            IF(MODEL%NUMBER_OF_STATE<=0) &
+              & CALL FlagError("Invalid CellML model for integration - there are no states.",ERR,ERROR,*999)
+          ELSE
+            LOCAL_ERROR="CellML environment model is not associated for model index "// &
+              & TRIM(NumberToVString(model_idx,"*",ERR,ERROR))//" belonging to dof index "// &
+              & TRIM(NumberToVString(dof_idx,"*",ERR,ERROR))//"."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          ENDIF
+        ELSE IF(model_idx/=0) THEN
+          LOCAL_ERROR="Invalid CellML model index: "// &
+            & TRIM(NumberToVString(model_idx,"*",ERR,ERROR))//". The specified index should be between 1 and "// &
+            & TRIM(NumberToVString(CELLML%NUMBER_OF_MODELS,"*",ERR,ERROR))//"."
+          CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+        ENDIF
+      ENDDO !dof_idx
+    ELSE
+      MODEL=>CELLML%MODELS(ONLY_ONE_MODEL_INDEX)%PTR
+      IF(ASSOCIATED(MODEL)) THEN
+        IF(MODEL%NUMBER_OF_STATE<=0) &
+          & CALL FlagError("Invalid CellML model for integration - there are no states.",ERR,ERROR,*999)
+      ELSE
+        LOCAL_ERROR="CellML environment model is not associated for model index "// &
+          & TRIM(NumberToVString(ONLY_ONE_MODEL_INDEX,"*",ERR,ERROR))//"."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      ENDIF
+    ENDIF
+
+#ifdef TAUPROF
+    CALL TAU_STATIC_PHASE_START('cellml call rhs')
+#endif
+#ifdef USE_CUSTOM_PROFILING
+    CALL CustomProfilingStart('cellml call rhs')
+#endif
+
+    !Each dof is integrated over the whole time interval by one thread. The scratch arrays are private to each thread and
+    !the state, intermediate and parameter data for different dofs do not overlap.
+    !$OMP PARALLEL DO NUM_THREADS(NUMBER_OF_THREADS) SCHEDULE(STATIC) DEFAULT(SHARED) &
+    !$OMP & PRIVATE(dof_idx,model_idx,MODEL,NUMBER_STATES,NUMBER_INTERMEDIATES,NUMBER_PARAMETERS,STATE_START_DOF, &
+    !$OMP & INTERMEDIATE_START_DOF,PARAMETER_START_DOF,STATES,RATES,INTERMEDIATES,PARAMETERS,TIME,TIME_INCREMENT)
+    DO dof_idx=1,N
+      model_idx=MODELS_DATA(dof_idx)
+      IF(model_idx>0) THEN
+        IF(ONLY_ONE_MODEL_INDEX/=CELLML_MODELS_FIELD_NOT_CONSTANT) model_idx=ONLY_ONE_MODEL_INDEX
+        MODEL=>CELLML%MODELS(model_idx)%PTR
+        NUMBER_STATES=MODEL%NUMBER_OF_STATE
+        NUMBER_INTERMEDIATES=MODEL%NUMBER_OF_INTERMEDIATE
+        NUMBER_PARAMETERS=MODEL%NUMBER_OF_PARAMETERS
+        STATE_START_DOF=(dof_idx-1)*MAX_NUMBER_STATES
+        INTERMEDIATE_START_DOF=(dof_idx-1)*MAX_NUMBER_INTERMEDIATES
+        PARAMETER_START_DOF=(dof_idx-1)*MAX_NUMBER_PARAMETERS
+        !Copy the dof data to the thread private arrays. Models without intermediates or parameters use the scratch arrays
+        !to avoid referencing null pointers.
+        STATES(1:NUMBER_STATES)=STATE_DATA(STATE_START_DOF+1:STATE_START_DOF+NUMBER_STATES)
+        IF(NUMBER_PARAMETERS>0) PARAMETERS(1:NUMBER_PARAMETERS)= &
+          & PARAMETERS_DATA(PARAMETER_START_DOF+1:PARAMETER_START_DOF+NUMBER_PARAMETERS)
+        TIME=START_TIME
+        TIME_INCREMENT=TIME_INCREMENT_I
+        DO WHILE(TIME<END_TIME)
+          TIME_INCREMENT=MIN(TIME_INCREMENT,END_TIME-TIME)
+          CALL CELLML_MODEL_DEFINITION_CALL_RHS_ROUTINE(MODEL%PTR,TIME,STATES,RATES,INTERMEDIATES,PARAMETERS)
+          STATES(1:NUMBER_STATES)=STATES(1:NUMBER_STATES)+TIME_INCREMENT*RATES(1:NUMBER_STATES)
+          TIME=TIME+TIME_INCREMENT
+        ENDDO !time
+        !Copy the integrated values back
+        STATE_DATA(STATE_START_DOF+1:STATE_START_DOF+NUMBER_STATES)=STATES(1:NUMBER_STATES)
+        IF(NUMBER_INTERMEDIATES>0) INTERMEDIATE_DATA(INTERMEDIATE_START_DOF+1:INTERMEDIATE_START_DOF+NUMBER_INTERMEDIATES)= &
+          & INTERMEDIATES(1:NUMBER_INTERMEDIATES)
+      ENDIF !model_idx
+    ENDDO !dof_idx
+    !$OMP END PARALLEL DO
+
+#ifdef USE_CUSTOM_PROFILING
+    CALL CustomProfilingStop('cellml call rhs')
+#endif
+#ifdef TAUPROF
+    CALL TAU_STATIC_PHASE_STOP('cellml call rhs')
+#endif
+#else
+    CALL FlagError("Must compile with WITH_CELLML ON to use CellML functionality.",ERR,ERROR,*999)
+#endif
+
+    EXITS("SOLVER_DAE_EULER_FORWARD_INTEGRATE_THREADED")
+    RETURN
+999 ERRORSEXITS("SOLVER_DAE_EULER_FORWARD_INTEGRATE_THREADED",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE SOLVER_DAE_EULER_FORWARD_INTEGRATE_THREADED
+
+  !
+  !================================================================================================================================
+  !
+
   !>Solve using a forward Euler differential-algebraic equation solver.
   SUBROUTINE SOLVER_DAE_EULER_FORWARD_SOLVE(FORWARD_EULER_SOLVER,ERR,ERROR,*)
 
@@ -3302,6 +3609,8 @@ CONTAINS
         SOLVER%DAE_SOLVER%START_TIME=0.0_DP
         SOLVER%DAE_SOLVER%END_TIME=0.1_DP
         SOLVER%DAE_SOLVER%INITIAL_STEP=0.1_DP
+        SOLVER%DAE_SOLVER%NUMBER_OF_THREADS=1
+        SOLVER%DAE_SOLVER%BATCH_SIZE=0
         NULLIFY(SOLVER%DAE_SOLVER%EULER_SOLVER)
         NULLIFY(SOLVER%DAE_SOLVER%CRANK_NICOLSON_SOLVER)
         NULLIFY(SOLVER%DAE_SOLVER%RUNGE_KUTTA_SOLVER)
@@ -3529,7 +3838,7 @@ CONTAINS
         IF(ASSOCIATED(RUNGE_KUTTA_DAE_SOLVER)) THEN
           SELECT CASE(SOLVER_LIBRARY_TYPE)
           CASE(SOLVER_CMISS_LIBRARY)
-            CALL FlagError("Not implemented.",ERR,ERROR,*999)
+            RUNGE_KUTTA_DAE_SOLVER%SOLVER_LIBRARY=SOLVER_CMISS_LIBRARY
           CASE(SOLVER_PETSC_LIBRARY)
             CALL FlagError("Not implemented.",ERR,ERROR,*999)
           CASE DEFAULT
@@ -3595,7 +3904,7 @@ CONTAINS
         IF(ASSOCIATED(RUSH_LARSON_DAE_SOLVER)) THEN
           SELECT CASE(SOLVER_LIBRARY_TYPE)
           CASE(SOLVER_CMISS_LIBRARY)
-            CALL FlagError("Not implemented.",ERR,ERROR,*999)
+            RUSH_LARSON_DAE_SOLVER%SOLVER_LIBRARY=SOLVER_CMISS_LIBRARY
           CASE(SOLVER_PETSC_LIBRARY)
             CALL FlagError("Not implemented.",ERR,ERROR,*999)
           CASE DEFAULT
@@ -5412,8 +5721,13 @@ SUBROUTINE SOLVER_DAE_GL_INTEGRATE(GL_SOLVER,CELLML,N,START_TIME,END_TIME,TIME_I
         IF(ERR/=0) CALL FlagError("Could not allocate Runge-Kutta solver.",ERR,ERROR,*999)
         !Initialise
         DAE_SOLVER%RUNGE_KUTTA_SOLVER%DAE_SOLVER=>DAE_SOLVER
-        DAE_SOLVER%RUNGE_KUTTA_SOLVER%SOLVER_LIBRARY=0
+        DAE_SOLVER%RUNGE_KUTTA_SOLVER%SOLVER_LIBRARY=SOLVER_CMISS_LIBRARY
+        DAE_SOLVER%RUNGE_KUTTA_SOLVER%NUMBER_OF_RHS_EVALUATIONS=0
+        DAE_SOLVER%RUNGE_KUTTA_SOLVER%NUMBER_OF_ACCEPTED_STEPS=0
+        DAE_SOLVER%RUNGE_KUTTA_SOLVER%NUMBER_OF_REJECTED_STEPS=0
         !Defaults
+        DAE_SOLVER%RUNGE_KUTTA_SOLVER%ABSOLUTE_TOLERANCE=1.0E-6_DP
+        DAE_SOLVER%RUNGE_KUTTA_SOLVER%RELATIVE_TOLERANCE=1.0E-6_DP
       ENDIF
     ELSE
       CALL FlagError("Differential-algebraic equation solver is not associated.",ERR,ERROR,*998)
@@ -5431,114 +5745,763 @@ SUBROUTINE SOLVER_DAE_GL_INTEGRATE(GL_SOLVER,CELLML,N,START_TIME,END_TIME,TIME_I
   !================================================================================================================================
   !
 
-  !>Solve using a Runge-Kutta differential-algebraic equation solver.
-  SUBROUTINE SOLVER_DAE_RUNGE_KUTTA_SOLVE(RUNGE_KUTTA_SOLVER,ERR,ERROR,*)
+  !>Integrate using an adaptive Runge-Kutta differential-algebraic equation solver. Each dof is integrated with the
+  !>Dormand-Prince 5(4) embedded pair with its own step size, so stiff cells take small steps without slowing the others.
+  SUBROUTINE SOLVER_DAE_RUNGE_KUTTA_INTEGRATE(RUNGE_KUTTA_SOLVER,CELLML,N,START_TIME,END_TIME,INITIAL_STEP,MODELS_DATA, &
+    & DOF_ORDER_TYPE,MAX_NUMBER_STATES,STATE_DATA,MAX_NUMBER_PARAMETERS,PARAMETERS_DATA,MAX_NUMBER_INTERMEDIATES, &
+    & INTERMEDIATE_DATA,ERR,ERROR,*)
 
     !Argument variables
-    TYPE(RUNGE_KUTTA_DAE_SOLVER_TYPE), POINTER :: RUNGE_KUTTA_SOLVER !<A pointer the Runge-Kutta differential-algebraic equation solver to solve
+    TYPE(RUNGE_KUTTA_DAE_SOLVER_TYPE), POINTER :: RUNGE_KUTTA_SOLVER !<A pointer the Runge-Kutta differential-algebraic equation solver to integrate
+    TYPE(CELLML_TYPE), POINTER :: CELLML !<A pointer to the CellML environment to integrate the equations for.
+    INTEGER(INTG), INTENT(IN) :: N !<The number of degrees-of-freedom
+    REAL(DP), INTENT(IN) :: START_TIME !<The start time for the integration
+    REAL(DP), INTENT(IN) :: END_TIME !<The end time for the integration
+    REAL(DP), INTENT(IN) :: INITIAL_STEP !<The initial time step for each dof
+    INTEGER(INTG), POINTER :: MODELS_DATA(:) !<MODELS_DATA(dof_idx). The models data for the dof_idx'th dof.
+    INTEGER(INTG), INTENT(IN) :: DOF_ORDER_TYPE !<The dof order type of the CellML fields \see FIELD_ROUTINES_DofOrderTypes,FIELD_ROUTINES
+    INTEGER(INTG), INTENT(IN) :: MAX_NUMBER_STATES !<The maximum number of state variables per dof
+    REAL(DP), POINTER :: STATE_DATA(:) !<STATE_DATA(state_idx,dof_idx). The state data for the state_idx'th state variable of the dof_idx'th dof.
+    INTEGER(INTG), INTENT(IN) :: MAX_NUMBER_PARAMETERS !<The maximum number of parameter variables per dof.
+    REAL(DP), POINTER :: PARAMETERS_DATA(:) !<PARAMETERS_DATA(parameter_idx,dof_idx). The parameters data for the parameter_idx'th parameter variable of the dof_idx'th dof.
+    INTEGER(INTG), INTENT(IN) :: MAX_NUMBER_INTERMEDIATES !<The maximum number of intermediate variables per dof.
+    REAL(DP), POINTER :: INTERMEDIATE_DATA(:) !<INTERMEDIATE_DATA(intermediate_idx,dof_idx). The intermediate values data for the intermediate_idx'th intermediate variable of the dof_idx'th dof.
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
+    !Dormand-Prince 5(4) coefficients. The fifth order solution is propagated and the last stage is evaluated at the new
+    !solution so it is reused as the first stage of the next step.
+    REAL(DP), PARAMETER :: C(7)=[0.0_DP,1.0_DP/5.0_DP,3.0_DP/10.0_DP,4.0_DP/5.0_DP,8.0_DP/9.0_DP,1.0_DP,1.0_DP]
+    REAL(DP), PARAMETER :: A(6,6)=RESHAPE([ &
+      & 1.0_DP/5.0_DP,0.0_DP,0.0_DP,0.0_DP,0.0_DP,0.0_DP, &
+      & 3.0_DP/40.0_DP,9.0_DP/40.0_DP,0.0_DP,0.0_DP,0.0_DP,0.0_DP, &
+      & 44.0_DP/45.0_DP,-56.0_DP/15.0_DP,32.0_DP/9.0_DP,0.0_DP,0.0_DP,0.0_DP, &
+      & 19372.0_DP/6561.0_DP,-25360.0_DP/2187.0_DP,64448.0_DP/6561.0_DP,-212.0_DP/729.0_DP,0.0_DP,0.0_DP, &
+      & 9017.0_DP/3168.0_DP,-355.0_DP/33.0_DP,46732.0_DP/5247.0_DP,49.0_DP/176.0_DP,-5103.0_DP/18656.0_DP,0.0_DP, &
+      & 35.0_DP/384.0_DP,0.0_DP,500.0_DP/1113.0_DP,125.0_DP/192.0_DP,-2187.0_DP/6784.0_DP,11.0_DP/84.0_DP],[6,6])
+    REAL(DP), PARAMETER :: E(7)=[71.0_DP/57600.0_DP,0.0_DP,-71.0_DP/16695.0_DP,71.0_DP/1920.0_DP,-17253.0_DP/339200.0_DP, &
+      & 22.0_DP/525.0_DP,-1.0_DP/40.0_DP]
+    REAL(DP), PARAMETER :: SAFETY=0.9_DP,MINIMUM_FACTOR=0.2_DP,MAXIMUM_FACTOR=5.0_DP
+    INTEGER(INTG) :: dof_idx,INTERMEDIATE_COMPONENT_STRIDE,INTERMEDIATE_DOF_STRIDE,intermediate_idx,model_idx, &
+      & NUMBER_INTERMEDIATES,NUMBER_PARAMETERS,NUMBER_STATES,PARAMETER_COMPONENT_STRIDE,PARAMETER_DOF_STRIDE,parameter_idx, &
+      & stage_idx,STATE_COMPONENT_STRIDE,STATE_DOF_STRIDE,state_idx
+    REAL(DP) :: ERROR_ESTIMATE(MAX(1,MAX_NUMBER_STATES)),ERROR_NORM,FACTOR,INTERMEDIATES(MAX(1,MAX_NUMBER_INTERMEDIATES)), &
+      & K(MAX(1,MAX_NUMBER_STATES),7),PARAMETERS(MAX(1,MAX_NUMBER_PARAMETERS)),STATES(MAX(1,MAX_NUMBER_STATES)), &
+      & STAGE_STATES(MAX(1,MAX_NUMBER_STATES)),STEP,TIME
+    LOGICAL :: LAST_STEP
+    TYPE(CELLML_MODEL_TYPE), POINTER :: MODEL
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
 
-    ENTERS("SOLVER_DAE_RUNGE_KUTTA_SOLVE",ERR,ERROR,*999)
-
-    IF(ASSOCIATED(RUNGE_KUTTA_SOLVER)) THEN
-      CALL FlagError("Not implemented.",ERR,ERROR,*999)
-    ELSE
-      CALL FlagError("Runge-Kutta differential-algebraic equation solver is not associated.",ERR,ERROR,*999)
-    ENDIF
-
-    EXITS("SOLVER_DAE_RUNGE_KUTTA_SOLVE")
-    RETURN
-999 ERRORSEXITS("SOLVER_DAE_RUNGE_KUTTA_SOLVE",ERR,ERROR)
-    RETURN 1
+    ENTERS("SOLVER_DAE_RUNGE_KUTTA_INTEGRATE",ERR,ERROR,*999)
 
-  END SUBROUTINE SOLVER_DAE_RUNGE_KUTTA_SOLVE
+#ifdef WITH_CELLML
 
-  !
-  !================================================================================================================================
-  !
+    IF(.NOT.ASSOCIATED(RUNGE_KUTTA_SOLVER)) &
+      & CALL FlagError("Runge-Kutta differential-algebraic equation solver is not associated.",ERR,ERROR,*999)
+    IF(.NOT.ASSOCIATED(CELLML)) CALL FlagError("CellML environment is not associated.",ERR,ERROR,*999)
+
+    !Work out where the components of each dof are in the CellML field data
+    IF(DOF_ORDER_TYPE==FIELD_SEPARATED_COMPONENT_DOF_ORDER) THEN
+      STATE_DOF_STRIDE=1
+      STATE_COMPONENT_STRIDE=N
+      PARAMETER_DOF_STRIDE=1
+      PARAMETER_COMPONENT_STRIDE=N
+      INTERMEDIATE_DOF_STRIDE=1
+      INTERMEDIATE_COMPONENT_STRIDE=N
+    ELSE
+      STATE_DOF_STRIDE=MAX_NUMBER_STATES
+      STATE_COMPONENT_STRIDE=1
+      PARAMETER_DOF_STRIDE=MAX_NUMBER_PARAMETERS
+      PARAMETER_COMPONENT_STRIDE=1
+      INTERMEDIATE_DOF_STRIDE=MAX_NUMBER_INTERMEDIATES
+      INTERMEDIATE_COMPONENT_STRIDE=1
+    ENDIF
+
+    DO dof_idx=1,N
+      model_idx=MODELS_DATA(dof_idx)
+      IF(model_idx==0) CYCLE
+      IF(model_idx<0.OR.model_idx>CELLML%NUMBER_OF_MODELS) THEN
+        LOCAL_ERROR="The model index of "//TRIM(NumberToVString(model_idx,"*",ERR,ERROR))//" for dof index "// &
+          & TRIM(NumberToVString(dof_idx,"*",ERR,ERROR))//" is invalid. The model index should be between 0 and "// &
+          & TRIM(NumberToVString(CELLML%NUMBER_OF_MODELS,"*",ERR,ERROR))//"."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      ENDIF
+      MODEL=>CELLML%MODELS(model_idx)%PTR
+      IF(.NOT.ASSOCIATED(MODEL)) THEN
+        LOCAL_ERROR="CellML environment model is not associated for model index "// &
+          & TRIM(NumberToVString(model_idx,"*",ERR,ERROR))//" belonging to dof index "// &
+          & TRIM(NumberToVString(dof_idx,"*",ERR,ERROR))//"."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      ENDIF
+      NUMBER_STATES=MODEL%NUMBER_OF_STATE
+      NUMBER_INTERMEDIATES=MODEL%NUMBER_OF_INTERMEDIATE
+      NUMBER_PARAMETERS=MODEL%NUMBER_OF_PARAMETERS
+
+      !Copy CellML data to temporary arrays
+      DO state_idx=1,NUMBER_STATES
+        STATES(state_idx)=STATE_DATA((dof_idx-1)*STATE_DOF_STRIDE+(state_idx-1)*STATE_COMPONENT_STRIDE+1)
+      ENDDO !state_idx
+      DO parameter_idx=1,NUMBER_PARAMETERS
+        PARAMETERS(parameter_idx)=PARAMETERS_DATA((dof_idx-1)*PARAMETER_DOF_STRIDE+(parameter_idx-1)* &
+          & PARAMETER_COMPONENT_STRIDE+1)
+      ENDDO !parameter_idx
+
+      TIME=START_TIME
+      STEP=MIN(ABS(INITIAL_STEP),END_TIME-START_TIME)
+      CALL CELLML_MODEL_DEFINITION_CALL_RHS_ROUTINE(MODEL%PTR,TIME,STATES,K(:,1),INTERMEDIATES,PARAMETERS)
+      RUNGE_KUTTA_SOLVER%NUMBER_OF_RHS_EVALUATIONS=RUNGE_KUTTA_SOLVER%NUMBER_OF_RHS_EVALUATIONS+1
+      IF(NUMBER_STATES>0) THEN
+        DO WHILE(TIME<END_TIME)
+          LAST_STEP=TIME+STEP>=END_TIME
+          IF(LAST_STEP) STEP=END_TIME-TIME
+          DO stage_idx=2,7
+            STAGE_STATES(1:NUMBER_STATES)=STATES(1:NUMBER_STATES)+STEP*MATMUL(K(1:NUMBER_STATES,1:stage_idx-1), &
+              & A(1:stage_idx-1,stage_idx-1))
+            CALL CELLML_MODEL_DEFINITION_CALL_RHS_ROUTINE(MODEL%PTR,TIME+C(stage_idx)*STEP,STAGE_STATES,K(:,stage_idx), &
+              & INTERMEDIATES,PARAMETERS)
+          ENDDO !stage_idx
+          RUNGE_KUTTA_SOLVER%NUMBER_OF_RHS_EVALUATIONS=RUNGE_KUTTA_SOLVER%NUMBER_OF_RHS_EVALUATIONS+6
+          !The last stage states are the fifth order solution. Estimate the local error from the embedded fourth order solution.
+          ERROR_ESTIMATE(1:NUMBER_STATES)=STEP*MATMUL(K(1:NUMBER_STATES,1:7),E)
+          ERROR_NORM=SQRT(SUM((ERROR_ESTIMATE(1:NUMBER_STATES)/(RUNGE_KUTTA_SOLVER%ABSOLUTE_TOLERANCE+ &
+            & RUNGE_KUTTA_SOLVER%RELATIVE_TOLERANCE*MAX(ABS(STATES(1:NUMBER_STATES)),ABS(STAGE_STATES(1:NUMBER_STATES)))))**2)/ &
+            & REAL(NUMBER_STATES,DP))
+          IF(ERROR_NORM<=1.0_DP) THEN
+            !Accept the step
+            IF(LAST_STEP) THEN
+              TIME=END_TIME
+            ELSE
+              TIME=TIME+STEP
+            ENDIF
+            STATES(1:NUMBER_STATES)=STAGE_STATES(1:NUMBER_STATES)
+            K(1:NUMBER_STATES,1)=K(1:NUMBER_STATES,7)
+            RUNGE_KUTTA_SOLVER%NUMBER_OF_ACCEPTED_STEPS=RUNGE_KUTTA_SOLVER%NUMBER_OF_ACCEPTED_STEPS+1
+            IF(ERROR_NORM>0.0_DP) THEN
+              FACTOR=MIN(MAXIMUM_FACTOR,MAX(MINIMUM_FACTOR,SAFETY*ERROR_NORM**(-0.2_DP)))
+            ELSE
+              FACTOR=MAXIMUM_FACTOR
+            ENDIF
+          ELSE
+            !Reject the step. A NaN error norm also ends up here and just shrinks the step.
+            RUNGE_KUTTA_SOLVER%NUMBER_OF_REJECTED_STEPS=RUNGE_KUTTA_SOLVER%NUMBER_OF_REJECTED_STEPS+1
+            IF(ERROR_NORM>1.0_DP) THEN
+              FACTOR=MAX(MINIMUM_FACTOR,SAFETY*ERROR_NORM**(-0.2_DP))
+            ELSE
+              FACTOR=MINIMUM_FACTOR
+            ENDIF
+          ENDIF
+          STEP=STEP*FACTOR
+          IF(TIME<END_TIME.AND.STEP<=ZERO_TOLERANCE*MAX(ABS(TIME),1.0_DP)) THEN
+            LOCAL_ERROR="The Runge-Kutta time step for dof index "//TRIM(NumberToVString(dof_idx,"*",ERR,ERROR))// &
+              & " has become too small at time "//TRIM(NumberToVString(TIME,"*",ERR,ERROR))//"."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          ENDIF
+        ENDDO !time
+      ENDIF
 
-  !>Finalise a Rush-Larson differential-algebraic equation solver and deallocate all memory.
-  SUBROUTINE SOLVER_DAE_RUSH_LARSON_FINALISE(RUSH_LARSON_SOLVER,ERR,ERROR,*)
+      !Copy temporary data back to CellML arrays. The last RHS evaluation was at the final states so the intermediates
+      !are consistent with them.
+      DO intermediate_idx=1,NUMBER_INTERMEDIATES
+        INTERMEDIATE_DATA((dof_idx-1)*INTERMEDIATE_DOF_STRIDE+(intermediate_idx-1)*INTERMEDIATE_COMPONENT_STRIDE+1)= &
+          & INTERMEDIATES(intermediate_idx)
+      ENDDO !intermediate_idx
+      DO state_idx=1,NUMBER_STATES
+        STATE_DATA((dof_idx-1)*STATE_DOF_STRIDE+(state_idx-1)*STATE_COMPONENT_STRIDE+1)=STATES(state_idx)
+      ENDDO !state_idx
+    ENDDO !dof_idx
 
-    !Argument variables
-    TYPE(RUSH_LARSON_DAE_SOLVER_TYPE), POINTER :: RUSH_LARSON_SOLVER !<A pointer the Rush-Larson differential-algebraic equation solver to finalise
-    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
-    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
-    !Local Variables
+#else
 
-    ENTERS("SOLVER_DAE_RUSH_LARSON_FINALISE",ERR,ERROR,*999)
+    CALL FlagError("Must compile with WITH_CELLML ON to use CellML functionality.",ERR,ERROR,*999)
 
-    IF(ASSOCIATED(RUSH_LARSON_SOLVER)) THEN
-      DEALLOCATE(RUSH_LARSON_SOLVER)
-    ENDIF
+#endif
 
-    EXITS("SOLVER_DAE_RUSH_LARSON_FINALISE")
+    EXITS("SOLVER_DAE_RUNGE_KUTTA_INTEGRATE")
     RETURN
-999 ERRORSEXITS("SOLVER_DAE_RUSH_LARSON_FINALISE",ERR,ERROR)
+999 ERRORSEXITS("SOLVER_DAE_RUNGE_KUTTA_INTEGRATE",ERR,ERROR)
     RETURN 1
 
-  END SUBROUTINE SOLVER_DAE_RUSH_LARSON_FINALISE
+  END SUBROUTINE SOLVER_DAE_RUNGE_KUTTA_INTEGRATE
 
   !
   !================================================================================================================================
   !
 
-  !>Initialise an Rush-Larson solver for a differential-algebraic equation solver
-  SUBROUTINE SOLVER_DAE_RUSH_LARSON_INITIALISE(DAE_SOLVER,ERR,ERROR,*)
+  !>Solve using a Runge-Kutta differential-algebraic equation solver.
+  SUBROUTINE SOLVER_DAE_RUNGE_KUTTA_SOLVE(RUNGE_KUTTA_SOLVER,ERR,ERROR,*)
 
     !Argument variables
-    TYPE(DAE_SOLVER_TYPE), POINTER :: DAE_SOLVER !<A pointer the differential-algebraic equation solver to initialise a Rush-Larson solver for
+    TYPE(RUNGE_KUTTA_DAE_SOLVER_TYPE), POINTER :: RUNGE_KUTTA_SOLVER !<A pointer the Runge-Kutta differential-algebraic equation solver to solve
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
-    INTEGER(INTG) :: DUMMY_ERR
-    TYPE(VARYING_STRING) :: DUMMY_ERROR
+    INTEGER(INTG) :: cellml_idx,DOF_ORDER_TYPE
+    INTEGER(INTG), POINTER :: MODELS_DATA(:)
+    REAL(DP), POINTER :: INTERMEDIATE_DATA(:),PARAMETERS_DATA(:),STATE_DATA(:)
+    TYPE(CELLML_TYPE), POINTER :: CELLML_ENVIRONMENT
+    TYPE(CELLML_EQUATIONS_TYPE), POINTER :: CELLML_EQUATIONS
+    TYPE(CELLML_MODELS_FIELD_TYPE), POINTER :: CELLML_MODELS_FIELD
+    TYPE(DAE_SOLVER_TYPE), POINTER :: DAE_SOLVER
+    TYPE(FIELD_VARIABLE_TYPE), POINTER :: MODELS_VARIABLE
+    TYPE(FIELD_TYPE), POINTER :: MODELS_FIELD,STATE_FIELD,PARAMETERS_FIELD,INTERMEDIATE_FIELD
+    TYPE(SOLVER_TYPE), POINTER :: SOLVER
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
 
-    ENTERS("SOLVER_DAE_RUSH_LARSON_INITIALISE",ERR,ERROR,*998)
+    ENTERS("SOLVER_DAE_RUNGE_KUTTA_SOLVE",ERR,ERROR,*999)
 
-    IF(ASSOCIATED(DAE_SOLVER)) THEN
-      IF(ASSOCIATED(DAE_SOLVER%RUSH_LARSON_SOLVER)) THEN
-        CALL FlagError("Rush-Larson solver is already associated for this differential-algebraic equation solver.",ERR,ERROR,*998)
-      ELSE
-        !Allocate the Rush-Larson solver
-        ALLOCATE(DAE_SOLVER%RUSH_LARSON_SOLVER,STAT=ERR)
-        IF(ERR/=0) CALL FlagError("Could not allocate Rush-Larson solver.",ERR,ERROR,*999)
-        !Initialise
-        DAE_SOLVER%RUSH_LARSON_SOLVER%DAE_SOLVER=>DAE_SOLVER
-        DAE_SOLVER%RUSH_LARSON_SOLVER%SOLVER_LIBRARY=0
-        !Defaults
-      ENDIF
-    ELSE
-      CALL FlagError("Differential-algebraic equation solver is not associated.",ERR,ERROR,*998)
-    ENDIF
+    IF(ASSOCIATED(RUNGE_KUTTA_SOLVER)) THEN
+      DAE_SOLVER=>RUNGE_KUTTA_SOLVER%DAE_SOLVER
+      IF(ASSOCIATED(DAE_SOLVER)) THEN
+        SOLVER=>DAE_SOLVER%SOLVER
+        IF(ASSOCIATED(SOLVER)) THEN
+          CELLML_EQUATIONS=>SOLVER%CELLML_EQUATIONS
+          IF(ASSOCIATED(CELLML_EQUATIONS)) THEN
+            RUNGE_KUTTA_SOLVER%NUMBER_OF_RHS_EVALUATIONS=0
+            RUNGE_KUTTA_SOLVER%NUMBER_OF_ACCEPTED_STEPS=0
+            RUNGE_KUTTA_SOLVER%NUMBER_OF_REJECTED_STEPS=0
+            DO cellml_idx=1,CELLML_EQUATIONS%NUMBER_OF_CELLML_ENVIRONMENTS
+              CELLML_ENVIRONMENT=>CELLML_EQUATIONS%CELLML_ENVIRONMENTS(cellml_idx)%PTR
+              IF(ASSOCIATED(CELLML_ENVIRONMENT)) THEN
+                CELLML_MODELS_FIELD=>CELLML_ENVIRONMENT%MODELS_FIELD
+                IF(ASSOCIATED(CELLML_MODELS_FIELD)) THEN
+                  MODELS_FIELD=>CELLML_MODELS_FIELD%MODELS_FIELD
+                  IF(ASSOCIATED(MODELS_FIELD)) THEN
+                    NULLIFY(MODELS_DATA)
+                    NULLIFY(INTERMEDIATE_DATA)
+                    NULLIFY(PARAMETERS_DATA)
+                    NULLIFY(STATE_DATA)
+                    NULLIFY(MODELS_VARIABLE)
+                    NULLIFY(STATE_FIELD)
+                    NULLIFY(PARAMETERS_FIELD)
+                    NULLIFY(INTERMEDIATE_FIELD)
 
-    EXITS("SOLVER_DAE_RUSH_LARSON_INITIALISE")
-    RETURN
-999 CALL SOLVER_DAE_RUSH_LARSON_FINALISE(DAE_SOLVER%RUSH_LARSON_SOLVER,DUMMY_ERR,DUMMY_ERROR,*998)
-998 ERRORSEXITS("SOLVER_DAE_RUSH_LARSON_INITIALISE",ERR,ERROR)
-    RETURN 1
+                    !Make sure CellML fields have been updated to the current value of any mapped fields
+                    CALL CELLML_FIELD_TO_CELLML_UPDATE(CELLML_ENVIRONMENT,ERR,ERROR,*999)
 
-  END SUBROUTINE SOLVER_DAE_RUSH_LARSON_INITIALISE
+                    CALL FIELD_VARIABLE_GET(MODELS_FIELD,FIELD_U_VARIABLE_TYPE,MODELS_VARIABLE,ERR,ERROR,*999)
+                    CALL FIELD_DOF_ORDER_TYPE_GET(MODELS_FIELD,FIELD_U_VARIABLE_TYPE,DOF_ORDER_TYPE,ERR,ERROR,*999)
+                    CALL FIELD_PARAMETER_SET_DATA_GET(MODELS_FIELD,FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE, &
+                      & MODELS_DATA,ERR,ERROR,*999)
 
-  !
-  !================================================================================================================================
-  !
+                    !Get the state information if this environment has any.
+                    IF(ASSOCIATED(CELLML_ENVIRONMENT%STATE_FIELD)) THEN
+                      STATE_FIELD=>CELLML_ENVIRONMENT%STATE_FIELD%STATE_FIELD
+                      IF(ASSOCIATED(STATE_FIELD)) THEN
+                        CALL FIELD_PARAMETER_SET_DATA_GET(STATE_FIELD,FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE, &
+                          & STATE_DATA,ERR,ERROR,*999)
+                      ENDIF
+                    ENDIF
 
-  !>Solve using a Rush-Larson differential-algebraic equation solver.
-  SUBROUTINE SOLVER_DAE_RUSH_LARSON_SOLVE(RUSH_LARSON_SOLVER,ERR,ERROR,*)
+                    !Get the parameters information if this environment has any.
+                    IF(ASSOCIATED(CELLML_ENVIRONMENT%PARAMETERS_FIELD)) THEN
+                      PARAMETERS_FIELD=>CELLML_ENVIRONMENT%PARAMETERS_FIELD%PARAMETERS_FIELD
+                      IF(ASSOCIATED(PARAMETERS_FIELD)) THEN
+                        CALL FIELD_PARAMETER_SET_DATA_GET(PARAMETERS_FIELD,FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE, &
+                          & PARAMETERS_DATA,ERR,ERROR,*999)
+                      ENDIF
+                    ENDIF
+
+                    !Get the intermediate information if this environment has any.
+                    IF(ASSOCIATED(CELLML_ENVIRONMENT%INTERMEDIATE_FIELD)) THEN
+                      INTERMEDIATE_FIELD=>CELLML_ENVIRONMENT%INTERMEDIATE_FIELD%INTERMEDIATE_FIELD
+                      IF(ASSOCIATED(INTERMEDIATE_FIELD)) THEN
+                        CALL FIELD_PARAMETER_SET_DATA_GET(INTERMEDIATE_FIELD,FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE, &
+                          & INTERMEDIATE_DATA,ERR,ERROR,*999)
+                      ENDIF
+                    ENDIF
+
+                    !Integrate these CellML equations
+                    CALL SOLVER_DAE_RUNGE_KUTTA_INTEGRATE(RUNGE_KUTTA_SOLVER,CELLML_ENVIRONMENT,MODELS_VARIABLE% &
+                      & TOTAL_NUMBER_OF_DOFS,DAE_SOLVER%START_TIME,DAE_SOLVER%END_TIME,DAE_SOLVER%INITIAL_STEP,MODELS_DATA, &
+                      & DOF_ORDER_TYPE,CELLML_ENVIRONMENT%MAXIMUM_NUMBER_OF_STATE,STATE_DATA,CELLML_ENVIRONMENT% &
+                      & MAXIMUM_NUMBER_OF_PARAMETERS,PARAMETERS_DATA,CELLML_ENVIRONMENT%MAXIMUM_NUMBER_OF_INTERMEDIATE, &
+                      & INTERMEDIATE_DATA,ERR,ERROR,*999)
+
+                    !Restore field data
+                    CALL FIELD_PARAMETER_SET_DATA_RESTORE(MODELS_FIELD,FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE, &
+                      & MODELS_DATA,ERR,ERROR,*999)
+                    IF(ASSOCIATED(STATE_FIELD)) CALL FIELD_PARAMETER_SET_DATA_RESTORE(STATE_FIELD,FIELD_U_VARIABLE_TYPE, &
+                      & FIELD_VALUES_SET_TYPE,STATE_DATA,ERR,ERROR,*999)
+                    IF(ASSOCIATED(PARAMETERS_FIELD)) CALL FIELD_PARAMETER_SET_DATA_RESTORE(PARAMETERS_FIELD, &
+                      & FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE,PARAMETERS_DATA,ERR,ERROR,*999)
+                    IF(ASSOCIATED(INTERMEDIATE_FIELD)) CALL FIELD_PARAMETER_SET_DATA_RESTORE(INTERMEDIATE_FIELD, &
+                      & FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE,INTERMEDIATE_DATA,ERR,ERROR,*999)
+
+                    !Make sure fields have been updated to the current value of any mapped CellML fields
+                    CALL CELLML_CELLML_TO_FIELD_UPDATE(CELLML_ENVIRONMENT,ERR,ERROR,*999)
+
+                  ELSE
+                    LOCAL_ERROR="The CellML models field is not associated for CellML index "// &
+                      & TRIM(NumberToVString(cellml_idx,"*",ERR,ERROR))//"."
+                    CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+                  ENDIF
+                ELSE
+                  LOCAL_ERROR="The CellML models field is not associated for CellML index "// &
+                    & TRIM(NumberToVString(cellml_idx,"*",ERR,ERROR))//"."
+                  CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+                ENDIF
+              ELSE
+                LOCAL_ERROR="The CellML enviroment is not associated for for CellML index "// &
+                  & TRIM(NumberToVString(cellml_idx,"*",ERR,ERROR))//"."
+                CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+              ENDIF
+            ENDDO !cellml_idx
+            IF(SOLVER%OUTPUT_TYPE>=SOLVER_SOLVER_OUTPUT) THEN
+              CALL WRITE_STRING(GENERAL_OUTPUT_TYPE,"",ERR,ERROR,*999)
+              CALL WRITE_STRING(GENERAL_OUTPUT_TYPE,"Runge-Kutta DAE solver statistics:",ERR,ERROR,*999)
+              CALL WRITE_STRING_VALUE(GENERAL_OUTPUT_TYPE,"  Number of RHS evaluations = ", &
+                & RUNGE_KUTTA_SOLVER%NUMBER_OF_RHS_EVALUATIONS,ERR,ERROR,*999)
+              CALL WRITE_STRING_VALUE(GENERAL_OUTPUT_TYPE,"  Number of accepted steps = ", &
+                & RUNGE_KUTTA_SOLVER%NUMBER_OF_ACCEPTED_STEPS,ERR,ERROR,*999)
+              CALL WRITE_STRING_VALUE(GENERAL_OUTPUT_TYPE,"  Number of rejected steps = ", &
+                & RUNGE_KUTTA_SOLVER%NUMBER_OF_REJECTED_STEPS,ERR,ERROR,*999)
+            ENDIF
+          ELSE
+            CALL FlagError("Solver CellML equations is not associated.",ERR,ERROR,*999)
+          ENDIF
+        ELSE
+          CALL FlagError("Solver is not associated.",ERR,ERROR,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("Differential-algebraic equation solver is not associated.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("Runge-Kutta differential-algebraic equation solver is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("SOLVER_DAE_RUNGE_KUTTA_SOLVE")
+    RETURN
+999 ERRORSEXITS("SOLVER_DAE_RUNGE_KUTTA_SOLVE",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE SOLVER_DAE_RUNGE_KUTTA_SOLVE
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Set/change the absolute and relative tolerances for the local error of a Runge-Kutta differential-algebraic equation solver
+  SUBROUTINE SOLVER_DAE_RUNGE_KUTTA_TOLERANCES_SET(SOLVER,ABSOLUTE_TOLERANCE,RELATIVE_TOLERANCE,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(SOLVER_TYPE), POINTER :: SOLVER !<A pointer the differential-algebraic equation solver to set the tolerances for
+    REAL(DP), INTENT(IN) :: ABSOLUTE_TOLERANCE !<The absolute tolerance to set
+    REAL(DP), INTENT(IN) :: RELATIVE_TOLERANCE !<The relative tolerance to set
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(DAE_SOLVER_TYPE), POINTER :: DAE_SOLVER
+    TYPE(RUNGE_KUTTA_DAE_SOLVER_TYPE), POINTER :: RUNGE_KUTTA_SOLVER
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("SOLVER_DAE_RUNGE_KUTTA_TOLERANCES_SET",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(SOLVER)) THEN
+      IF(SOLVER%SOLVE_TYPE==SOLVER_DAE_TYPE) THEN
+        DAE_SOLVER=>SOLVER%DAE_SOLVER
+        IF(ASSOCIATED(DAE_SOLVER)) THEN
+          IF(DAE_SOLVER%DAE_SOLVE_TYPE==SOLVER_DAE_RUNGE_KUTTA) THEN
+            RUNGE_KUTTA_SOLVER=>DAE_SOLVER%RUNGE_KUTTA_SOLVER
+            IF(ASSOCIATED(RUNGE_KUTTA_SOLVER)) THEN
+              IF(ABSOLUTE_TOLERANCE<0.0_DP.OR.RELATIVE_TOLERANCE<0.0_DP.OR. &
+                & (ABSOLUTE_TOLERANCE<=ZERO_TOLERANCE.AND.RELATIVE_TOLERANCE<=ZERO_TOLERANCE)) THEN
+                LOCAL_ERROR="The specified absolute tolerance of "//TRIM(NumberToVString(ABSOLUTE_TOLERANCE,"*",ERR,ERROR))// &
+                  & " and relative tolerance of "//TRIM(NumberToVString(RELATIVE_TOLERANCE,"*",ERR,ERROR))// &
+                  & " are invalid. The tolerances must be >= 0 and at least one must be > 0."
+                CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+              ENDIF
+              RUNGE_KUTTA_SOLVER%ABSOLUTE_TOLERANCE=ABSOLUTE_TOLERANCE
+              RUNGE_KUTTA_SOLVER%RELATIVE_TOLERANCE=RELATIVE_TOLERANCE
+            ELSE
+              CALL FlagError("The Runge-Kutta differential-algebraic equation solver is not associated.",ERR,ERROR,*999)
+            ENDIF
+          ELSE
+            CALL FlagError("The differential-algebraic equation solver is not a Runge-Kutta solver.",ERR,ERROR,*999)
+          ENDIF
+        ELSE
+          CALL FlagError("Differential-algebraic equation solver is not associated.",ERR,ERROR,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("The solver is not a differential-algebraic equation solver.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("Solver is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("SOLVER_DAE_RUNGE_KUTTA_TOLERANCES_SET")
+    RETURN
+999 ERRORSEXITS("SOLVER_DAE_RUNGE_KUTTA_TOLERANCES_SET",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE SOLVER_DAE_RUNGE_KUTTA_TOLERANCES_SET
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Finalise a Rush-Larson differential-algebraic equation solver and deallocate all memory.
+  SUBROUTINE SOLVER_DAE_RUSH_LARSON_FINALISE(RUSH_LARSON_SOLVER,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(RUSH_LARSON_DAE_SOLVER_TYPE), POINTER :: RUSH_LARSON_SOLVER !<A pointer the Rush-Larson differential-algebraic equation solver to finalise
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+
+    ENTERS("SOLVER_DAE_RUSH_LARSON_FINALISE",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(RUSH_LARSON_SOLVER)) THEN
+      DEALLOCATE(RUSH_LARSON_SOLVER)
+    ENDIF
+
+    EXITS("SOLVER_DAE_RUSH_LARSON_FINALISE")
+    RETURN
+999 ERRORSEXITS("SOLVER_DAE_RUSH_LARSON_FINALISE",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE SOLVER_DAE_RUSH_LARSON_FINALISE
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Initialise an Rush-Larson solver for a differential-algebraic equation solver
+  SUBROUTINE SOLVER_DAE_RUSH_LARSON_INITIALISE(DAE_SOLVER,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(DAE_SOLVER_TYPE), POINTER :: DAE_SOLVER !<A pointer the differential-algebraic equation solver to initialise a Rush-Larson solver for
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: DUMMY_ERR
+    TYPE(VARYING_STRING) :: DUMMY_ERROR
+
+    ENTERS("SOLVER_DAE_RUSH_LARSON_INITIALISE",ERR,ERROR,*998)
+
+    IF(ASSOCIATED(DAE_SOLVER)) THEN
+      IF(ASSOCIATED(DAE_SOLVER%RUSH_LARSON_SOLVER)) THEN
+        CALL FlagError("Rush-Larson solver is already associated for this differential-algebraic equation solver.",ERR,ERROR,*998)
+      ELSE
+        !Allocate the Rush-Larson solver
+        ALLOCATE(DAE_SOLVER%RUSH_LARSON_SOLVER,STAT=ERR)
+        IF(ERR/=0) CALL FlagError("Could not allocate Rush-Larson solver.",ERR,ERROR,*999)
+        !Initialise
+        DAE_SOLVER%RUSH_LARSON_SOLVER%DAE_SOLVER=>DAE_SOLVER
+        DAE_SOLVER%RUSH_LARSON_SOLVER%SOLVER_LIBRARY=SOLVER_CMISS_LIBRARY
+        DAE_SOLVER%RUSH_LARSON_SOLVER%NUMBER_OF_RHS_EVALUATIONS=0
+        !Defaults
+      ENDIF
+    ELSE
+      CALL FlagError("Differential-algebraic equation solver is not associated.",ERR,ERROR,*998)
+    ENDIF
+
+    EXITS("SOLVER_DAE_RUSH_LARSON_INITIALISE")
+    RETURN
+999 CALL SOLVER_DAE_RUSH_LARSON_FINALISE(DAE_SOLVER%RUSH_LARSON_SOLVER,DUMMY_ERR,DUMMY_ERROR,*998)
+998 ERRORSEXITS("SOLVER_DAE_RUSH_LARSON_INITIALISE",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE SOLVER_DAE_RUSH_LARSON_INITIALISE
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Integrate using a Rush-Larsen differential-algebraic equation solver. The gating variables of each model are advanced
+  !>with the exact solution of their linearised rate, y+(exp(a*dt)-1)*f/a, and all other states with a forward Euler step.
+  SUBROUTINE SOLVER_DAE_RUSH_LARSON_INTEGRATE(RUSH_LARSON_SOLVER,CELLML,N,START_TIME,END_TIME,TIME_INCREMENT,MODELS_DATA, &
+    & DOF_ORDER_TYPE,MAX_NUMBER_STATES,STATE_DATA,MAX_NUMBER_PARAMETERS,PARAMETERS_DATA,MAX_NUMBER_INTERMEDIATES, &
+    & INTERMEDIATE_DATA,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(RUSH_LARSON_DAE_SOLVER_TYPE), POINTER :: RUSH_LARSON_SOLVER !<A pointer the Rush-Larson differential-algebraic equation solver to integrate
+    TYPE(CELLML_TYPE), POINTER :: CELLML !<A pointer to the CellML environment to integrate the equations for.
+    INTEGER(INTG), INTENT(IN) :: N !<The number of degrees-of-freedom
+    REAL(DP), INTENT(IN) :: START_TIME !<The start time for the integration
+    REAL(DP), INTENT(IN) :: END_TIME !<The end time for the integration
+    REAL(DP), INTENT(IN) :: TIME_INCREMENT !<The time increment for the integration
+    INTEGER(INTG), POINTER :: MODELS_DATA(:) !<MODELS_DATA(dof_idx). The models data for the dof_idx'th dof.
+    INTEGER(INTG), INTENT(IN) :: DOF_ORDER_TYPE !<The dof order type of the CellML fields \see FIELD_ROUTINES_DofOrderTypes,FIELD_ROUTINES
+    INTEGER(INTG), INTENT(IN) :: MAX_NUMBER_STATES !<The maximum number of state variables per dof
+    REAL(DP), POINTER :: STATE_DATA(:) !<STATE_DATA(state_idx,dof_idx). The state data for the state_idx'th state variable of the dof_idx'th dof.
+    INTEGER(INTG), INTENT(IN) :: MAX_NUMBER_PARAMETERS !<The maximum number of parameter variables per dof.
+    REAL(DP), POINTER :: PARAMETERS_DATA(:) !<PARAMETERS_DATA(parameter_idx,dof_idx). The parameters data for the parameter_idx'th parameter variable of the dof_idx'th dof.
+    INTEGER(INTG), INTENT(IN) :: MAX_NUMBER_INTERMEDIATES !<The maximum number of intermediate variables per dof.
+    REAL(DP), POINTER :: INTERMEDIATE_DATA(:) !<INTERMEDIATE_DATA(intermediate_idx,dof_idx). The intermediate values data for the intermediate_idx'th intermediate variable of the dof_idx'th dof.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    INTEGER(INTG) :: dof_idx,INTERMEDIATE_COMPONENT_STRIDE,INTERMEDIATE_DOF_STRIDE,intermediate_idx,model_idx, &
+      & NUMBER_INTERMEDIATES,NUMBER_PARAMETERS,NUMBER_STATES,PARAMETER_COMPONENT_STRIDE,PARAMETER_DOF_STRIDE,parameter_idx, &
+      & STATE_COMPONENT_STRIDE,STATE_DOF_STRIDE,state_idx
+    REAL(DP) :: DELTA(MAX(1,MAX_NUMBER_STATES)),INTERMEDIATES(MAX(1,MAX_NUMBER_INTERMEDIATES)), &
+      & PERTURBED_INTERMEDIATES(MAX(1,MAX_NUMBER_INTERMEDIATES)),PERTURBED_RATES(MAX(1,MAX_NUMBER_STATES)), &
+      & PERTURBED_STATES(MAX(1,MAX_NUMBER_STATES)),PARAMETERS(MAX(1,MAX_NUMBER_PARAMETERS)),RATE_JACOBIAN, &
+      & RATES(MAX(1,MAX_NUMBER_STATES)),STATES(MAX(1,MAX_NUMBER_STATES)),STEP,TIME
+    LOGICAL :: HAS_GATING_STATES,LAST_STEP
+    TYPE(CELLML_MODEL_TYPE), POINTER :: MODEL
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("SOLVER_DAE_RUSH_LARSON_INTEGRATE",ERR,ERROR,*999)
+
+#ifdef WITH_CELLML
+
+    IF(.NOT.ASSOCIATED(RUSH_LARSON_SOLVER)) &
+      & CALL FlagError("Rush-Larson differential-algebraic equation solver is not associated.",ERR,ERROR,*999)
+    IF(.NOT.ASSOCIATED(CELLML)) CALL FlagError("CellML environment is not associated.",ERR,ERROR,*999)
+
+    !Work out where the components of each dof are in the CellML field data
+    IF(DOF_ORDER_TYPE==FIELD_SEPARATED_COMPONENT_DOF_ORDER) THEN
+      STATE_DOF_STRIDE=1
+      STATE_COMPONENT_STRIDE=N
+      PARAMETER_DOF_STRIDE=1
+      PARAMETER_COMPONENT_STRIDE=N
+      INTERMEDIATE_DOF_STRIDE=1
+      INTERMEDIATE_COMPONENT_STRIDE=N
+    ELSE
+      STATE_DOF_STRIDE=MAX_NUMBER_STATES
+      STATE_COMPONENT_STRIDE=1
+      PARAMETER_DOF_STRIDE=MAX_NUMBER_PARAMETERS
+      PARAMETER_COMPONENT_STRIDE=1
+      INTERMEDIATE_DOF_STRIDE=MAX_NUMBER_INTERMEDIATES
+      INTERMEDIATE_COMPONENT_STRIDE=1
+    ENDIF
+
+    DO dof_idx=1,N
+      model_idx=MODELS_DATA(dof_idx)
+      IF(model_idx==0) CYCLE
+      IF(model_idx<0.OR.model_idx>CELLML%NUMBER_OF_MODELS) THEN
+        LOCAL_ERROR="The model index of "//TRIM(NumberToVString(model_idx,"*",ERR,ERROR))//" for dof index "// &
+          & TRIM(NumberToVString(dof_idx,"*",ERR,ERROR))//" is invalid. The model index should be between 0 and "// &
+          & TRIM(NumberToVString(CELLML%NUMBER_OF_MODELS,"*",ERR,ERROR))//"."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      ENDIF
+      MODEL=>CELLML%MODELS(model_idx)%PTR
+      IF(.NOT.ASSOCIATED(MODEL)) THEN
+        LOCAL_ERROR="CellML environment model is not associated for model index "// &
+          & TRIM(NumberToVString(model_idx,"*",ERR,ERROR))//" belonging to dof index "// &
+          & TRIM(NumberToVString(dof_idx,"*",ERR,ERROR))//"."
+        CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+      ENDIF
+      NUMBER_STATES=MODEL%NUMBER_OF_STATE
+      NUMBER_INTERMEDIATES=MODEL%NUMBER_OF_INTERMEDIATE
+      NUMBER_PARAMETERS=MODEL%NUMBER_OF_PARAMETERS
+      HAS_GATING_STATES=ALLOCATED(MODEL%GATING_STATES)
+      IF(HAS_GATING_STATES) HAS_GATING_STATES=ANY(MODEL%GATING_STATES)
+
+      !Copy CellML data to temporary arrays
+      DO state_idx=1,NUMBER_STATES
+        STATES(state_idx)=STATE_DATA((dof_idx-1)*STATE_DOF_STRIDE+(state_idx-1)*STATE_COMPONENT_STRIDE+1)
+      ENDDO !state_idx
+      DO parameter_idx=1,NUMBER_PARAMETERS
+        PARAMETERS(parameter_idx)=PARAMETERS_DATA((dof_idx-1)*PARAMETER_DOF_STRIDE+(parameter_idx-1)* &
+          & PARAMETER_COMPONENT_STRIDE+1)
+      ENDDO !parameter_idx
+
+      TIME=START_TIME
+      DO WHILE(TIME<END_TIME)
+        LAST_STEP=TIME+ABS(TIME_INCREMENT)>=END_TIME
+        IF(LAST_STEP) THEN
+          STEP=END_TIME-TIME
+        ELSE
+          STEP=ABS(TIME_INCREMENT)
+        ENDIF
+        CALL CELLML_MODEL_DEFINITION_CALL_RHS_ROUTINE(MODEL%PTR,TIME,STATES,RATES,INTERMEDIATES,PARAMETERS)
+        RUSH_LARSON_SOLVER%NUMBER_OF_RHS_EVALUATIONS=RUSH_LARSON_SOLVER%NUMBER_OF_RHS_EVALUATIONS+1
+        IF(HAS_GATING_STATES) THEN
+          !The rate of a gating variable only depends on itself and the other non-gating states, so all the gating
+          !variables can be perturbed together to get the diagonal of the rate Jacobian with one extra RHS evaluation.
+          PERTURBED_STATES(1:NUMBER_STATES)=STATES(1:NUMBER_STATES)
+          DO state_idx=1,NUMBER_STATES
+            IF(MODEL%GATING_STATES(state_idx)) THEN
+              DELTA(state_idx)=SQRT(EPSILON(1.0_DP))*MAX(ABS(STATES(state_idx)),1.0_DP)
+              PERTURBED_STATES(state_idx)=STATES(state_idx)+DELTA(state_idx)
+            ENDIF
+          ENDDO !state_idx
+          CALL CELLML_MODEL_DEFINITION_CALL_RHS_ROUTINE(MODEL%PTR,TIME,PERTURBED_STATES,PERTURBED_RATES, &
+            & PERTURBED_INTERMEDIATES,PARAMETERS)
+          RUSH_LARSON_SOLVER%NUMBER_OF_RHS_EVALUATIONS=RUSH_LARSON_SOLVER%NUMBER_OF_RHS_EVALUATIONS+1
+          DO state_idx=1,NUMBER_STATES
+            IF(MODEL%GATING_STATES(state_idx)) THEN
+              RATE_JACOBIAN=(PERTURBED_RATES(state_idx)-RATES(state_idx))/DELTA(state_idx)
+              IF(ABS(RATE_JACOBIAN*STEP)>ZERO_TOLERANCE) THEN
+                STATES(state_idx)=STATES(state_idx)+(EXP(RATE_JACOBIAN*STEP)-1.0_DP)*RATES(state_idx)/RATE_JACOBIAN
+              ELSE
+                STATES(state_idx)=STATES(state_idx)+STEP*RATES(state_idx)
+              ENDIF
+            ELSE
+              STATES(state_idx)=STATES(state_idx)+STEP*RATES(state_idx)
+            ENDIF
+          ENDDO !state_idx
+        ELSE
+          STATES(1:NUMBER_STATES)=STATES(1:NUMBER_STATES)+STEP*RATES(1:NUMBER_STATES)
+        ENDIF
+        IF(LAST_STEP) THEN
+          TIME=END_TIME
+        ELSE
+          TIME=TIME+STEP
+        ENDIF
+      ENDDO !time
+
+      !Copy temporary data back to CellML arrays
+      DO intermediate_idx=1,NUMBER_INTERMEDIATES
+        INTERMEDIATE_DATA((dof_idx-1)*INTERMEDIATE_DOF_STRIDE+(intermediate_idx-1)*INTERMEDIATE_COMPONENT_STRIDE+1)= &
+          & INTERMEDIATES(intermediate_idx)
+      ENDDO !intermediate_idx
+      DO state_idx=1,NUMBER_STATES
+        STATE_DATA((dof_idx-1)*STATE_DOF_STRIDE+(state_idx-1)*STATE_COMPONENT_STRIDE+1)=STATES(state_idx)
+      ENDDO !state_idx
+    ENDDO !dof_idx
+
+#else
+
+    CALL FlagError("Must compile with WITH_CELLML ON to use CellML functionality.",ERR,ERROR,*999)
+
+#endif
+
+    EXITS("SOLVER_DAE_RUSH_LARSON_INTEGRATE")
+    RETURN
+999 ERRORSEXITS("SOLVER_DAE_RUSH_LARSON_INTEGRATE",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE SOLVER_DAE_RUSH_LARSON_INTEGRATE
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Solve using a Rush-Larson differential-algebraic equation solver.
+  SUBROUTINE SOLVER_DAE_RUSH_LARSON_SOLVE(RUSH_LARSON_SOLVER,ERR,ERROR,*)
 
     !Argument variables
     TYPE(RUSH_LARSON_DAE_SOLVER_TYPE), POINTER :: RUSH_LARSON_SOLVER !<A pointer the Rush-Larson differential-algebraic equation solver to solve
     INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
     TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
     !Local Variables
+    INTEGER(INTG) :: cellml_idx,DOF_ORDER_TYPE
+    INTEGER(INTG), POINTER :: MODELS_DATA(:)
+    REAL(DP), POINTER :: INTERMEDIATE_DATA(:),PARAMETERS_DATA(:),STATE_DATA(:)
+    TYPE(CELLML_TYPE), POINTER :: CELLML_ENVIRONMENT
+    TYPE(CELLML_EQUATIONS_TYPE), POINTER :: CELLML_EQUATIONS
+    TYPE(CELLML_MODELS_FIELD_TYPE), POINTER :: CELLML_MODELS_FIELD
+    TYPE(DAE_SOLVER_TYPE), POINTER :: DAE_SOLVER
+    TYPE(FIELD_VARIABLE_TYPE), POINTER :: MODELS_VARIABLE
+    TYPE(FIELD_TYPE), POINTER :: MODELS_FIELD,STATE_FIELD,PARAMETERS_FIELD,INTERMEDIATE_FIELD
+    TYPE(SOLVER_TYPE), POINTER :: SOLVER
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
 
     ENTERS("SOLVER_DAE_RUSH_LARSON_SOLVE",ERR,ERROR,*999)
 
     IF(ASSOCIATED(RUSH_LARSON_SOLVER)) THEN
-      CALL FlagError("Not implemented.",ERR,ERROR,*999)
+      DAE_SOLVER=>RUSH_LARSON_SOLVER%DAE_SOLVER
+      IF(ASSOCIATED(DAE_SOLVER)) THEN
+        SOLVER=>DAE_SOLVER%SOLVER
+        IF(ASSOCIATED(SOLVER)) THEN
+          CELLML_EQUATIONS=>SOLVER%CELLML_EQUATIONS
+          IF(ASSOCIATED(CELLML_EQUATIONS)) THEN
+            RUSH_LARSON_SOLVER%NUMBER_OF_RHS_EVALUATIONS=0
+            DO cellml_idx=1,CELLML_EQUATIONS%NUMBER_OF_CELLML_ENVIRONMENTS
+              CELLML_ENVIRONMENT=>CELLML_EQUATIONS%CELLML_ENVIRONMENTS(cellml_idx)%PTR
+              IF(ASSOCIATED(CELLML_ENVIRONMENT)) THEN
+                CELLML_MODELS_FIELD=>CELLML_ENVIRONMENT%MODELS_FIELD
+                IF(ASSOCIATED(CELLML_MODELS_FIELD)) THEN
+                  MODELS_FIELD=>CELLML_MODELS_FIELD%MODELS_FIELD
+                  IF(ASSOCIATED(MODELS_FIELD)) THEN
+                    NULLIFY(MODELS_DATA)
+                    NULLIFY(INTERMEDIATE_DATA)
+                    NULLIFY(PARAMETERS_DATA)
+                    NULLIFY(STATE_DATA)
+                    NULLIFY(MODELS_VARIABLE)
+                    NULLIFY(STATE_FIELD)
+                    NULLIFY(PARAMETERS_FIELD)
+                    NULLIFY(INTERMEDIATE_FIELD)
+
+                    !Make sure CellML fields have been updated to the current value of any mapped fields
+                    CALL CELLML_FIELD_TO_CELLML_UPDATE(CELLML_ENVIRONMENT,ERR,ERROR,*999)
+
+                    CALL FIELD_VARIABLE_GET(MODELS_FIELD,FIELD_U_VARIABLE_TYPE,MODELS_VARIABLE,ERR,ERROR,*999)
+                    CALL FIELD_DOF_ORDER_TYPE_GET(MODELS_FIELD,FIELD_U_VARIABLE_TYPE,DOF_ORDER_TYPE,ERR,ERROR,*999)
+                    CALL FIELD_PARAMETER_SET_DATA_GET(MODELS_FIELD,FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE, &
+                      & MODELS_DATA,ERR,ERROR,*999)
+
+                    !Get the state information if this environment has any.
+                    IF(ASSOCIATED(CELLML_ENVIRONMENT%STATE_FIELD)) THEN
+                      STATE_FIELD=>CELLML_ENVIRONMENT%STATE_FIELD%STATE_FIELD
+                      IF(ASSOCIATED(STATE_FIELD)) THEN
+                        CALL FIELD_PARAMETER_SET_DATA_GET(STATE_FIELD,FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE, &
+                          & STATE_DATA,ERR,ERROR,*999)
+                      ENDIF
+                    ENDIF
+
+                    !Get the parameters information if this environment has any.
+                    IF(ASSOCIATED(CELLML_ENVIRONMENT%PARAMETERS_FIELD)) THEN
+                      PARAMETERS_FIELD=>CELLML_ENVIRONMENT%PARAMETERS_FIELD%PARAMETERS_FIELD
+                      IF(ASSOCIATED(PARAMETERS_FIELD)) THEN
+                        CALL FIELD_PARAMETER_SET_DATA_GET(PARAMETERS_FIELD,FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE, &
+                          & PARAMETERS_DATA,ERR,ERROR,*999)
+                      ENDIF
+                    ENDIF
+
+                    !Get the intermediate information if this environment has any.
+                    IF(ASSOCIATED(CELLML_ENVIRONMENT%INTERMEDIATE_FIELD)) THEN
+                      INTERMEDIATE_FIELD=>CELLML_ENVIRONMENT%INTERMEDIATE_FIELD%INTERMEDIATE_FIELD
+                      IF(ASSOCIATED(INTERMEDIATE_FIELD)) THEN
+                        CALL FIELD_PARAMETER_SET_DATA_GET(INTERMEDIATE_FIELD,FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE, &
+                          & INTERMEDIATE_DATA,ERR,ERROR,*999)
+                      ENDIF
+                    ENDIF
+
+                    !Integrate these CellML equations
+                    CALL SOLVER_DAE_RUSH_LARSON_INTEGRATE(RUSH_LARSON_SOLVER,CELLML_ENVIRONMENT,MODELS_VARIABLE% &
+                      & TOTAL_NUMBER_OF_DOFS,DAE_SOLVER%START_TIME,DAE_SOLVER%END_TIME,DAE_SOLVER%INITIAL_STEP,MODELS_DATA, &
+                      & DOF_ORDER_TYPE,CELLML_ENVIRONMENT%MAXIMUM_NUMBER_OF_STATE,STATE_DATA,CELLML_ENVIRONMENT% &
+                      & MAXIMUM_NUMBER_OF_PARAMETERS,PARAMETERS_DATA,CELLML_ENVIRONMENT%MAXIMUM_NUMBER_OF_INTERMEDIATE, &
+                      & INTERMEDIATE_DATA,ERR,ERROR,*999)
+
+                    !Restore field data
+                    CALL FIELD_PARAMETER_SET_DATA_RESTORE(MODELS_FIELD,FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE, &
+                      & MODELS_DATA,ERR,ERROR,*999)
+                    IF(ASSOCIATED(STATE_FIELD)) CALL FIELD_PARAMETER_SET_DATA_RESTORE(STATE_FIELD,FIELD_U_VARIABLE_TYPE, &
+                      & FIELD_VALUES_SET_TYPE,STATE_DATA,ERR,ERROR,*999)
+                    IF(ASSOCIATED(PARAMETERS_FIELD)) CALL FIELD_PARAMETER_SET_DATA_RESTORE(PARAMETERS_FIELD, &
+                      & FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE,PARAMETERS_DATA,ERR,ERROR,*999)
+                    IF(ASSOCIATED(INTERMEDIATE_FIELD)) CALL FIELD_PARAMETER_SET_DATA_RESTORE(INTERMEDIATE_FIELD, &
+                      & FIELD_U_VARIABLE_TYPE,FIELD_VALUES_SET_TYPE,INTERMEDIATE_DATA,ERR,ERROR,*999)
+
+                    !Make sure fields have been updated to the current value of any mapped CellML fields
+                    CALL CELLML_CELLML_TO_FIELD_UPDATE(CELLML_ENVIRONMENT,ERR,ERROR,*999)
+
+                  ELSE
+                    LOCAL_ERROR="The CellML models field is not associated for CellML index "// &
+                      & TRIM(NumberToVString(cellml_idx,"*",ERR,ERROR))//"."
+                    CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+                  ENDIF
+                ELSE
+                  LOCAL_ERROR="The CellML models field is not associated for CellML index "// &
+                    & TRIM(NumberToVString(cellml_idx,"*",ERR,ERROR))//"."
+                  CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+                ENDIF
+              ELSE
+                LOCAL_ERROR="The CellML enviroment is not associated for for CellML index "// &
+                  & TRIM(NumberToVString(cellml_idx,"*",ERR,ERROR))//"."
+                CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+              ENDIF
+            ENDDO !cellml_idx
+            IF(SOLVER%OUTPUT_TYPE>=SOLVER_SOLVER_OUTPUT) THEN
+              CALL WRITE_STRING(GENERAL_OUTPUT_TYPE,"",ERR,ERROR,*999)
+              CALL WRITE_STRING(GENERAL_OUTPUT_TYPE,"Rush-Larson DAE solver statistics:",ERR,ERROR,*999)
+              CALL WRITE_STRING_VALUE(GENERAL_OUTPUT_TYPE,"  Number of RHS evaluations = ", &
+                & RUSH_LARSON_SOLVER%NUMBER_OF_RHS_EVALUATIONS,ERR,ERROR,*999)
+            ENDIF
+          ELSE
+            CALL FlagError("Solver CellML equations is not associated.",ERR,ERROR,*999)
+          ENDIF
+        ELSE
+          CALL FlagError("Solver is not associated.",ERR,ERROR,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("Differential-algebraic equation solver is not associated.",ERR,ERROR,*999)
+      ENDIF
     ELSE
       CALL FlagError("Rush-Larson differential-algebraic equation solver is not associated.",ERR,ERROR,*999)
     ENDIF
@@ -5844,6 +6807,117 @@ SUBROUTINE SOLVER_DAE_GL_INTEGRATE(GL_SOLVER,CELLML,N,START_TIME,END_TIME,TIME_I
   !================================================================================================================================
   !
 
+  !>Set/change the number of cells a differential-algebraic equation solver integrates together in structure-of-arrays batches.
+  !>Batched integration runs on one thread so a batch size can not be set when more than one thread has been set.
+  SUBROUTINE SOLVER_DAE_BATCH_SIZE_SET(SOLVER,BATCH_SIZE,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(SOLVER_TYPE), POINTER :: SOLVER !<A pointer the differential-algebraic equation solver to set the batch size for
+    INTEGER(INTG), INTENT(IN) :: BATCH_SIZE !<The number of cells in each batch. 0 to integrate the dofs one at a time.
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(DAE_SOLVER_TYPE), POINTER :: DAE_SOLVER
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("SOLVER_DAE_BATCH_SIZE_SET",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(SOLVER)) THEN
+      IF(SOLVER%SOLVE_TYPE==SOLVER_DAE_TYPE) THEN
+        DAE_SOLVER=>SOLVER%DAE_SOLVER
+        IF(ASSOCIATED(DAE_SOLVER)) THEN
+          IF(BATCH_SIZE>=0) THEN
+            IF(BATCH_SIZE>0.AND.DAE_SOLVER%NUMBER_OF_THREADS>1) THEN
+              LOCAL_ERROR="A batch size of "//TRIM(NumberToVString(BATCH_SIZE,"*",ERR,ERROR))// &
+                & " can not be set as the differential-algebraic equation solver has been set to use "// &
+                & TRIM(NumberToVString(DAE_SOLVER%NUMBER_OF_THREADS,"*",ERR,ERROR))// &
+                & " threads. Batched integration runs on one thread."
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            ENDIF
+            DAE_SOLVER%BATCH_SIZE=BATCH_SIZE
+          ELSE
+            LOCAL_ERROR="The specified batch size of "//TRIM(NumberToVString(BATCH_SIZE,"*",ERR,ERROR))// &
+              & " is invalid. The batch size must be >= 0."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          ENDIF
+        ELSE
+          CALL FlagError("Differential-algebraic equation solver is not associated.",ERR,ERROR,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("The solver is not a differential-algebraic equation solver.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("Solver is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("SOLVER_DAE_BATCH_SIZE_SET")
+    RETURN
+999 ERRORSEXITS("SOLVER_DAE_BATCH_SIZE_SET",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE SOLVER_DAE_BATCH_SIZE_SET
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Set/change the number of OpenMP threads used to integrate the dofs of a differential-algebraic equation solver. More than
+  !>one thread can not be set when the solver has a batch size as batched integration runs on one thread.
+  SUBROUTINE SOLVER_DAE_THREADS_SET(SOLVER,NUMBER_OF_THREADS,ERR,ERROR,*)
+
+    !Argument variables
+    TYPE(SOLVER_TYPE), POINTER :: SOLVER !<A pointer the differential-algebraic equation solver to set the number of threads for
+    INTEGER(INTG), INTENT(IN) :: NUMBER_OF_THREADS !<The number of threads to integrate the dofs with
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local Variables
+    TYPE(DAE_SOLVER_TYPE), POINTER :: DAE_SOLVER
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("SOLVER_DAE_THREADS_SET",ERR,ERROR,*999)
+
+    IF(ASSOCIATED(SOLVER)) THEN
+      IF(SOLVER%SOLVE_TYPE==SOLVER_DAE_TYPE) THEN
+        DAE_SOLVER=>SOLVER%DAE_SOLVER
+        IF(ASSOCIATED(DAE_SOLVER)) THEN
+          IF(NUMBER_OF_THREADS>=1) THEN
+            IF(NUMBER_OF_THREADS>1.AND.DAE_SOLVER%BATCH_SIZE>0) THEN
+              LOCAL_ERROR="The number of threads can not be set to "//TRIM(NumberToVString(NUMBER_OF_THREADS,"*",ERR,ERROR))// &
+                & " as the differential-algebraic equation solver has a batch size of "// &
+                & TRIM(NumberToVString(DAE_SOLVER%BATCH_SIZE,"*",ERR,ERROR))//". Batched integration runs on one thread."
+              CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+            ENDIF
+            DAE_SOLVER%NUMBER_OF_THREADS=NUMBER_OF_THREADS
+#ifndef _OPENMP
+            IF(NUMBER_OF_THREADS>1) CALL FlagWarning("OpenCMISS was not compiled with OpenMP. "// &
+              & "The differential-algebraic equation dofs will be integrated on one thread.",ERR,ERROR,*999)
+#endif
+          ELSE
+            LOCAL_ERROR="The specified number of threads of "//TRIM(NumberToVString(NUMBER_OF_THREADS,"*",ERR,ERROR))// &
+              & " is invalid. The number of threads must be >= 1."
+            CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+          ENDIF
+        ELSE
+          CALL FlagError("Differential-algebraic equation solver is not associated.",ERR,ERROR,*999)
+        ENDIF
+      ELSE
+        CALL FlagError("The solver is not a differential-algebraic equation solver.",ERR,ERROR,*999)
+      ENDIF
+    ELSE
+      CALL FlagError("Solver is not associated.",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("SOLVER_DAE_THREADS_SET")
+    RETURN
+999 ERRORSEXITS("SOLVER_DAE_THREADS_SET",ERR,ERROR)
+    RETURN 1
+
+  END SUBROUTINE SOLVER_DAE_THREADS_SET
+
+  !
+  !================================================================================================================================
+  !
+
   !>Set/change the (initial) time step size for a differential-algebraic equation solver
   SUBROUTINE SOLVER_DAE_TIME_STEP_SET(SOLVER,TIME_STEP,ERR,ERROR,*)
 
@@ -48,6 +48,7 @@ MODULE SORTING
   USE CONSTANTS
   USE KINDS
   USE ISO_VARYING_STRING
+  USE STRINGS
 
 #include "macros.h"  
   
@@ -57,6 +58,8 @@ MODULE SORTING
 
   !Module parameters
 
+  INTEGER(INTG), PARAMETER :: SORTING_INSERTION_THRESHOLD=16 !<Ranges of up to this many items are insertion sorted by the introsort routines
+
   !Module types
 
   !Interfaces
@@ -85,8 +88,26 @@ MODULE SORTING
     MODULE PROCEDURE SHELL_SORT_DP
   END INTERFACE !SHELL_SORT
 
-  PUBLIC BUBBLE_ISORT
-  PUBLIC BUBBLE_SORT,HEAP_SORT,SHELL_SORT
+  INTERFACE INTRO_ISELECT
+    MODULE PROCEDURE INTRO_ISELECT_INTG
+    MODULE PROCEDURE INTRO_ISELECT_SP
+    MODULE PROCEDURE INTRO_ISELECT_DP
+  END INTERFACE !INTRO_ISELECT
+
+  INTERFACE INTRO_ISORT
+    MODULE PROCEDURE INTRO_ISORT_INTG
+    MODULE PROCEDURE INTRO_ISORT_SP
+    MODULE PROCEDURE INTRO_ISORT_DP
+  END INTERFACE !INTRO_ISORT
+
+  INTERFACE INTRO_SORT
+    MODULE PROCEDURE INTRO_SORT_INTG
+    MODULE PROCEDURE INTRO_SORT_SP
+    MODULE PROCEDURE INTRO_SORT_DP
+  END INTERFACE !INTRO_SORT
+
+  PUBLIC BUBBLE_ISORT,INTRO_ISELECT,INTRO_ISORT
+  PUBLIC BUBBLE_SORT,HEAP_SORT,INTRO_SORT,SHELL_SORT
 
 CONTAINS
 
@@ -733,6 +754,1542 @@ CONTAINS
 999 ERRORSEXITS("SHELL_SORT_DP",ERR,ERROR)
     RETURN 1
   END SUBROUTINE SHELL_SORT_DP
+
+  !
+  !================================================================================================================================
+  !
+
+  !#### Generic-subroutine: INTRO_ISELECT
+  !###  Description:
+  !###    Selects the K smallest items of a list, returning sorting index
+  !###  Child-subroutines: INTRO_ISELECT_INTG,INTRO_ISELECT_SP,INTRO_ISELECT_DP
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Selects the K smallest items of an integer list, returning the sorting index. On exit A(K) is the item that would be
+  !>in position K after a sort, A(1:K-1) are no larger and A(K+1:) are no smaller, but neither part is sorted. Equal items
+  !>are ordered by their original position so IND(1:K) is the same set as after a stable sort.
+  SUBROUTINE INTRO_ISELECT_INTG(A,K,IND,ERR,ERROR,*)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: A(:) !<The list to select from
+    INTEGER(INTG), INTENT(IN) :: K !<The number of smallest items to select
+    INTEGER(INTG), INTENT(OUT) :: IND(:) !<On exit, IND(i) is the original position of the i'th item of A
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+    INTEGER(INTG) :: DEPTH,HIGH,i,LOW,PIVOT
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("INTRO_ISELECT_INTG",ERR,ERROR,*999)
+
+    IF(SIZE(IND,1)/=SIZE(A,1)) CALL FlagError("Size of input vectors does not match",ERR,ERROR,*999)
+    IF(K<0.OR.K>SIZE(A,1)) THEN
+      LOCAL_ERROR="The number of items to select of "//TRIM(NumberToVString(K,"*",ERR,ERROR))// &
+        & " is invalid. The number must be >= 0 and <= "//TRIM(NumberToVString(SIZE(A,1),"*",ERR,ERROR))//"."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+
+    DO i=1,SIZE(A,1)
+      IND(i)=i
+    ENDDO !i
+    IF(K>0) THEN
+      LOW=1
+      HIGH=SIZE(A,1)
+      DEPTH=SORTING_DEPTH_LIMIT(SIZE(A,1))
+      !Only keep partitioning the side containing position K
+      DO WHILE(HIGH-LOW>=SORTING_INSERTION_THRESHOLD)
+        IF(DEPTH<=0) THEN
+          CALL HEAP_ISORT_INTG_RANGE(A,IND,LOW,HIGH)
+          LOW=HIGH
+          EXIT
+        ENDIF
+        DEPTH=DEPTH-1
+        CALL INTRO_ISORT_INTG_PARTITION(A,IND,LOW,HIGH,PIVOT)
+        IF(PIVOT==K) THEN
+          LOW=HIGH
+          EXIT
+        ELSE IF(K<PIVOT) THEN
+          HIGH=PIVOT-1
+        ELSE
+          LOW=PIVOT+1
+        ENDIF
+      ENDDO
+      IF(LOW<HIGH) CALL INSERTION_ISORT_INTG_RANGE(A,IND,LOW,HIGH)
+    ENDIF
+
+    EXITS("INTRO_ISELECT_INTG")
+    RETURN
+999 ERRORSEXITS("INTRO_ISELECT_INTG",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE INTRO_ISELECT_INTG
+  !
+  !================================================================================================================================
+  !
+
+  !>Selects the K smallest items of a single precision list, returning the sorting index. On exit A(K) is the item that would be
+  !>in position K after a sort, A(1:K-1) are no larger and A(K+1:) are no smaller, but neither part is sorted. Equal items
+  !>are ordered by their original position so IND(1:K) is the same set as after a stable sort.
+  SUBROUTINE INTRO_ISELECT_SP(A,K,IND,ERR,ERROR,*)
+
+    !Argument variables
+    REAL(SP), INTENT(INOUT) :: A(:) !<The list to select from
+    INTEGER(INTG), INTENT(IN) :: K !<The number of smallest items to select
+    INTEGER(INTG), INTENT(OUT) :: IND(:) !<On exit, IND(i) is the original position of the i'th item of A
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+    INTEGER(INTG) :: DEPTH,HIGH,i,LOW,PIVOT
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("INTRO_ISELECT_SP",ERR,ERROR,*999)
+
+    IF(SIZE(IND,1)/=SIZE(A,1)) CALL FlagError("Size of input vectors does not match",ERR,ERROR,*999)
+    IF(K<0.OR.K>SIZE(A,1)) THEN
+      LOCAL_ERROR="The number of items to select of "//TRIM(NumberToVString(K,"*",ERR,ERROR))// &
+        & " is invalid. The number must be >= 0 and <= "//TRIM(NumberToVString(SIZE(A,1),"*",ERR,ERROR))//"."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+
+    DO i=1,SIZE(A,1)
+      IND(i)=i
+    ENDDO !i
+    IF(K>0) THEN
+      LOW=1
+      HIGH=SIZE(A,1)
+      DEPTH=SORTING_DEPTH_LIMIT(SIZE(A,1))
+      !Only keep partitioning the side containing position K
+      DO WHILE(HIGH-LOW>=SORTING_INSERTION_THRESHOLD)
+        IF(DEPTH<=0) THEN
+          CALL HEAP_ISORT_SP_RANGE(A,IND,LOW,HIGH)
+          LOW=HIGH
+          EXIT
+        ENDIF
+        DEPTH=DEPTH-1
+        CALL INTRO_ISORT_SP_PARTITION(A,IND,LOW,HIGH,PIVOT)
+        IF(PIVOT==K) THEN
+          LOW=HIGH
+          EXIT
+        ELSE IF(K<PIVOT) THEN
+          HIGH=PIVOT-1
+        ELSE
+          LOW=PIVOT+1
+        ENDIF
+      ENDDO
+      IF(LOW<HIGH) CALL INSERTION_ISORT_SP_RANGE(A,IND,LOW,HIGH)
+    ENDIF
+
+    EXITS("INTRO_ISELECT_SP")
+    RETURN
+999 ERRORSEXITS("INTRO_ISELECT_SP",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE INTRO_ISELECT_SP
+  !
+  !================================================================================================================================
+  !
+
+  !>Selects the K smallest items of a double precision list, returning the sorting index. On exit A(K) is the item that would be
+  !>in position K after a sort, A(1:K-1) are no larger and A(K+1:) are no smaller, but neither part is sorted. Equal items
+  !>are ordered by their original position so IND(1:K) is the same set as after a stable sort.
+  SUBROUTINE INTRO_ISELECT_DP(A,K,IND,ERR,ERROR,*)
+
+    !Argument variables
+    REAL(DP), INTENT(INOUT) :: A(:) !<The list to select from
+    INTEGER(INTG), INTENT(IN) :: K !<The number of smallest items to select
+    INTEGER(INTG), INTENT(OUT) :: IND(:) !<On exit, IND(i) is the original position of the i'th item of A
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+    INTEGER(INTG) :: DEPTH,HIGH,i,LOW,PIVOT
+    TYPE(VARYING_STRING) :: LOCAL_ERROR
+
+    ENTERS("INTRO_ISELECT_DP",ERR,ERROR,*999)
+
+    IF(SIZE(IND,1)/=SIZE(A,1)) CALL FlagError("Size of input vectors does not match",ERR,ERROR,*999)
+    IF(K<0.OR.K>SIZE(A,1)) THEN
+      LOCAL_ERROR="The number of items to select of "//TRIM(NumberToVString(K,"*",ERR,ERROR))// &
+        & " is invalid. The number must be >= 0 and <= "//TRIM(NumberToVString(SIZE(A,1),"*",ERR,ERROR))//"."
+      CALL FlagError(LOCAL_ERROR,ERR,ERROR,*999)
+    ENDIF
+
+    DO i=1,SIZE(A,1)
+      IND(i)=i
+    ENDDO !i
+    IF(K>0) THEN
+      LOW=1
+      HIGH=SIZE(A,1)
+      DEPTH=SORTING_DEPTH_LIMIT(SIZE(A,1))
+      !Only keep partitioning the side containing position K
+      DO WHILE(HIGH-LOW>=SORTING_INSERTION_THRESHOLD)
+        IF(DEPTH<=0) THEN
+          CALL HEAP_ISORT_DP_RANGE(A,IND,LOW,HIGH)
+          LOW=HIGH
+          EXIT
+        ENDIF
+        DEPTH=DEPTH-1
+        CALL INTRO_ISORT_DP_PARTITION(A,IND,LOW,HIGH,PIVOT)
+        IF(PIVOT==K) THEN
+          LOW=HIGH
+          EXIT
+        ELSE IF(K<PIVOT) THEN
+          HIGH=PIVOT-1
+        ELSE
+          LOW=PIVOT+1
+        ENDIF
+      ENDDO
+      IF(LOW<HIGH) CALL INSERTION_ISORT_DP_RANGE(A,IND,LOW,HIGH)
+    ENDIF
+
+    EXITS("INTRO_ISELECT_DP")
+    RETURN
+999 ERRORSEXITS("INTRO_ISELECT_DP",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE INTRO_ISELECT_DP
+  !
+  !================================================================================================================================
+  !
+
+  !#### Generic-subroutine: INTRO_ISORT
+  !###  Description:
+  !###    Sorts a list into assending order using the introsort method, returning sorting index
+  !###  Child-subroutines: INTRO_ISORT_INTG,INTRO_ISORT_SP,INTRO_ISORT_DP
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts an integer list into ascending order using the introsort method, returning the sorting index. Equal items are
+  !>ordered by their original position so the result is the same as a stable sort.
+  SUBROUTINE INTRO_ISORT_INTG(A,IND,ERR,ERROR,*)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(OUT) :: IND(:) !<On exit, IND(i) is the original position of the i'th sorted item
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+    INTEGER(INTG) :: i
+
+    ENTERS("INTRO_ISORT_INTG",ERR,ERROR,*999)
+
+    IF(SIZE(IND,1)==SIZE(A,1)) THEN
+      DO i=1,SIZE(A,1)
+        IND(i)=i
+      ENDDO !i
+      IF(SIZE(A,1)>1) CALL INTRO_ISORT_INTG_RANGE(A,IND,1,SIZE(A,1),SORTING_DEPTH_LIMIT(SIZE(A,1)))
+    ELSE
+      CALL FlagError("Size of input vectors does not match",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("INTRO_ISORT_INTG")
+    RETURN
+999 ERRORSEXITS("INTRO_ISORT_INTG",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE INTRO_ISORT_INTG
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts a single precision list into ascending order using the introsort method, returning the sorting index. Equal items are
+  !>ordered by their original position so the result is the same as a stable sort.
+  SUBROUTINE INTRO_ISORT_SP(A,IND,ERR,ERROR,*)
+
+    !Argument variables
+    REAL(SP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(OUT) :: IND(:) !<On exit, IND(i) is the original position of the i'th sorted item
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+    INTEGER(INTG) :: i
+
+    ENTERS("INTRO_ISORT_SP",ERR,ERROR,*999)
+
+    IF(SIZE(IND,1)==SIZE(A,1)) THEN
+      DO i=1,SIZE(A,1)
+        IND(i)=i
+      ENDDO !i
+      IF(SIZE(A,1)>1) CALL INTRO_ISORT_SP_RANGE(A,IND,1,SIZE(A,1),SORTING_DEPTH_LIMIT(SIZE(A,1)))
+    ELSE
+      CALL FlagError("Size of input vectors does not match",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("INTRO_ISORT_SP")
+    RETURN
+999 ERRORSEXITS("INTRO_ISORT_SP",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE INTRO_ISORT_SP
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts a double precision list into ascending order using the introsort method, returning the sorting index. Equal items are
+  !>ordered by their original position so the result is the same as a stable sort.
+  SUBROUTINE INTRO_ISORT_DP(A,IND,ERR,ERROR,*)
+
+    !Argument variables
+    REAL(DP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(OUT) :: IND(:) !<On exit, IND(i) is the original position of the i'th sorted item
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+    INTEGER(INTG) :: i
+
+    ENTERS("INTRO_ISORT_DP",ERR,ERROR,*999)
+
+    IF(SIZE(IND,1)==SIZE(A,1)) THEN
+      DO i=1,SIZE(A,1)
+        IND(i)=i
+      ENDDO !i
+      IF(SIZE(A,1)>1) CALL INTRO_ISORT_DP_RANGE(A,IND,1,SIZE(A,1),SORTING_DEPTH_LIMIT(SIZE(A,1)))
+    ELSE
+      CALL FlagError("Size of input vectors does not match",ERR,ERROR,*999)
+    ENDIF
+
+    EXITS("INTRO_ISORT_DP")
+    RETURN
+999 ERRORSEXITS("INTRO_ISORT_DP",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE INTRO_ISORT_DP
+  !
+  !================================================================================================================================
+  !
+
+  !#### Generic-subroutine: INTRO_SORT
+  !###  Description:
+  !###    Sorts a list into assending order using the introsort method.
+  !###  Child-subroutines: INTRO_SORT_INTG,INTRO_SORT_SP,INTRO_SORT_DP
+
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts an integer list into ascending order using the introsort method.
+  SUBROUTINE INTRO_SORT_INTG(A,ERR,ERROR,*)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+
+    ENTERS("INTRO_SORT_INTG",ERR,ERROR,*999)
+
+    IF(SIZE(A,1)>1) CALL INTRO_SORT_INTG_RANGE(A,1,SIZE(A,1),SORTING_DEPTH_LIMIT(SIZE(A,1)))
+
+    EXITS("INTRO_SORT_INTG")
+    RETURN
+999 ERRORSEXITS("INTRO_SORT_INTG",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE INTRO_SORT_INTG
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts a single precision list into ascending order using the introsort method.
+  SUBROUTINE INTRO_SORT_SP(A,ERR,ERROR,*)
+
+    !Argument variables
+    REAL(SP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+
+    ENTERS("INTRO_SORT_SP",ERR,ERROR,*999)
+
+    IF(SIZE(A,1)>1) CALL INTRO_SORT_SP_RANGE(A,1,SIZE(A,1),SORTING_DEPTH_LIMIT(SIZE(A,1)))
+
+    EXITS("INTRO_SORT_SP")
+    RETURN
+999 ERRORSEXITS("INTRO_SORT_SP",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE INTRO_SORT_SP
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts a double precision list into ascending order using the introsort method.
+  SUBROUTINE INTRO_SORT_DP(A,ERR,ERROR,*)
+
+    !Argument variables
+    REAL(DP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(OUT) :: ERR !<The error code
+    TYPE(VARYING_STRING), INTENT(OUT) :: ERROR !<The error string
+    !Local variables
+
+    ENTERS("INTRO_SORT_DP",ERR,ERROR,*999)
+
+    IF(SIZE(A,1)>1) CALL INTRO_SORT_DP_RANGE(A,1,SIZE(A,1),SORTING_DEPTH_LIMIT(SIZE(A,1)))
+
+    EXITS("INTRO_SORT_DP")
+    RETURN
+999 ERRORSEXITS("INTRO_SORT_DP",ERR,ERROR)
+    RETURN 1
+  END SUBROUTINE INTRO_SORT_DP
+  !
+  !================================================================================================================================
+  !
+
+  !>Partitions A(FIRST:LAST) of an integer list about the median of the first, middle and last items. On exit A(PIVOT) is in
+  !>its sorted position with no larger items before it and no smaller items after it. LAST-FIRST must be at least 2.
+  SUBROUTINE INTRO_SORT_INTG_PARTITION(A,FIRST,LAST,PIVOT)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to partition
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to partition
+    INTEGER(INTG), INTENT(OUT) :: PIVOT !<On exit, the position of the pivot
+    !Local variables
+    INTEGER(INTG) :: i,j,MIDDLE
+    INTEGER(INTG) :: PIVOT_VALUE,VALUE
+
+    MIDDLE=FIRST+(LAST-FIRST)/2
+    IF(A(MIDDLE)<A(FIRST)) THEN
+      VALUE=A(FIRST)
+      A(FIRST)=A(MIDDLE)
+      A(MIDDLE)=VALUE
+    ENDIF
+    IF(A(LAST)<A(FIRST)) THEN
+      VALUE=A(FIRST)
+      A(FIRST)=A(LAST)
+      A(LAST)=VALUE
+    ENDIF
+    IF(A(LAST)<A(MIDDLE)) THEN
+      VALUE=A(MIDDLE)
+      A(MIDDLE)=A(LAST)
+      A(LAST)=VALUE
+    ENDIF
+    !A(FIRST) and A(LAST) now bound the pivot and act as sentinels for the scans below
+    VALUE=A(MIDDLE)
+    A(MIDDLE)=A(LAST-1)
+    A(LAST-1)=VALUE
+    PIVOT_VALUE=A(LAST-1)
+    i=FIRST
+    j=LAST-1
+    DO
+      DO
+        i=i+1
+        IF(.NOT.A(i)<PIVOT_VALUE) EXIT
+      ENDDO
+      DO
+        j=j-1
+        IF(.NOT.PIVOT_VALUE<A(j)) EXIT
+      ENDDO
+      IF(i>=j) EXIT
+      VALUE=A(i)
+      A(i)=A(j)
+      A(j)=VALUE
+    ENDDO
+    VALUE=A(i)
+    A(i)=A(LAST-1)
+    A(LAST-1)=VALUE
+    PIVOT=i
+
+  END SUBROUTINE INTRO_SORT_INTG_PARTITION
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of an integer list into ascending order using the insertion sort method. Used for the short ranges
+  !>left over by the introsort partitioning.
+  SUBROUTINE INSERTION_SORT_INTG_RANGE(A,FIRST,LAST)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    !Local variables
+    INTEGER(INTG) :: i,j
+    INTEGER(INTG) :: VALUE
+
+    DO i=FIRST+1,LAST
+      VALUE=A(i)
+      DO j=i-1,FIRST,-1
+        IF(.NOT.VALUE<A(j)) EXIT
+        A(j+1)=A(j)
+      ENDDO
+      A(j+1)=VALUE
+    ENDDO
+
+  END SUBROUTINE INSERTION_SORT_INTG_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of an integer list into ascending order using the heap sort method. Used when the introsort
+  !>partitioning degenerates.
+  SUBROUTINE HEAP_SORT_INTG_RANGE(A,FIRST,LAST)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    !Local variables
+    INTEGER(INTG) :: HEAP_SIZE,i,j,k,OFFSET
+    INTEGER(INTG) :: VALUE
+
+    OFFSET=FIRST-1
+    HEAP_SIZE=LAST-FIRST+1
+    k=HEAP_SIZE/2+1
+    DO
+      IF(k>1) THEN
+        !Build the heap
+        k=k-1
+        VALUE=A(OFFSET+k)
+      ELSE
+        !Move the top of the heap to the end of the sorted range
+        VALUE=A(OFFSET+HEAP_SIZE)
+        A(OFFSET+HEAP_SIZE)=A(FIRST)
+        HEAP_SIZE=HEAP_SIZE-1
+        IF(HEAP_SIZE<=1) THEN
+          A(FIRST)=VALUE
+          EXIT
+        ENDIF
+      ENDIF
+      !Sift the value down the heap
+      i=k
+      j=k+k
+      DO WHILE(j<=HEAP_SIZE)
+        IF(j<HEAP_SIZE) THEN
+          IF(A(OFFSET+j)<A(OFFSET+j+1)) j=j+1
+        ENDIF
+        IF(.NOT.VALUE<A(OFFSET+j)) EXIT
+        A(OFFSET+i)=A(OFFSET+j)
+        i=j
+        j=j+j
+      ENDDO
+      A(OFFSET+i)=VALUE
+    ENDDO
+
+  END SUBROUTINE HEAP_SORT_INTG_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of an integer list into ascending order using the introsort method. Quicksort partitioning is used
+  !>until the depth limit is reached, after which the remaining range is heap sorted.
+  RECURSIVE SUBROUTINE INTRO_SORT_INTG_RANGE(A,FIRST,LAST,DEPTH_LIMIT)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: DEPTH_LIMIT !<The number of partitioning levels allowed before switching to a heap sort
+    !Local variables
+    INTEGER(INTG) :: DEPTH,LOW,HIGH,PIVOT
+
+    LOW=FIRST
+    HIGH=LAST
+    DEPTH=DEPTH_LIMIT
+    DO WHILE(HIGH-LOW>=SORTING_INSERTION_THRESHOLD)
+      IF(DEPTH<=0) THEN
+        CALL HEAP_SORT_INTG_RANGE(A,LOW,HIGH)
+        RETURN
+      ENDIF
+      DEPTH=DEPTH-1
+      CALL INTRO_SORT_INTG_PARTITION(A,LOW,HIGH,PIVOT)
+      !Recurse on the smaller side and loop on the larger side to bound the stack depth
+      IF(PIVOT-LOW<HIGH-PIVOT) THEN
+        CALL INTRO_SORT_INTG_RANGE(A,LOW,PIVOT-1,DEPTH)
+        LOW=PIVOT+1
+      ELSE
+        CALL INTRO_SORT_INTG_RANGE(A,PIVOT+1,HIGH,DEPTH)
+        HIGH=PIVOT-1
+      ENDIF
+    ENDDO
+    CALL INSERTION_SORT_INTG_RANGE(A,LOW,HIGH)
+
+  END SUBROUTINE INTRO_SORT_INTG_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Partitions A(FIRST:LAST) of an integer list about the median of the first, middle and last items. On exit A(PIVOT) is in
+  !>its sorted position with no larger items before it and no smaller items after it. LAST-FIRST must be at least 2.
+  SUBROUTINE INTRO_ISORT_INTG_PARTITION(A,IND,FIRST,LAST,PIVOT)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(INOUT) :: IND(:) !<The sorting index of the list
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to partition
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to partition
+    INTEGER(INTG), INTENT(OUT) :: PIVOT !<On exit, the position of the pivot
+    !Local variables
+    INTEGER(INTG) :: i,j,MIDDLE,IVALUE,PIVOT_INDEX
+    INTEGER(INTG) :: PIVOT_VALUE,VALUE
+
+    MIDDLE=FIRST+(LAST-FIRST)/2
+    IF((A(MIDDLE)<A(FIRST).OR.(A(MIDDLE)==A(FIRST).AND.IND(MIDDLE)<IND(FIRST)))) THEN
+      VALUE=A(FIRST)
+      A(FIRST)=A(MIDDLE)
+      A(MIDDLE)=VALUE
+      IVALUE=IND(FIRST)
+      IND(FIRST)=IND(MIDDLE)
+      IND(MIDDLE)=IVALUE
+    ENDIF
+    IF((A(LAST)<A(FIRST).OR.(A(LAST)==A(FIRST).AND.IND(LAST)<IND(FIRST)))) THEN
+      VALUE=A(FIRST)
+      A(FIRST)=A(LAST)
+      A(LAST)=VALUE
+      IVALUE=IND(FIRST)
+      IND(FIRST)=IND(LAST)
+      IND(LAST)=IVALUE
+    ENDIF
+    IF((A(LAST)<A(MIDDLE).OR.(A(LAST)==A(MIDDLE).AND.IND(LAST)<IND(MIDDLE)))) THEN
+      VALUE=A(MIDDLE)
+      A(MIDDLE)=A(LAST)
+      A(LAST)=VALUE
+      IVALUE=IND(MIDDLE)
+      IND(MIDDLE)=IND(LAST)
+      IND(LAST)=IVALUE
+    ENDIF
+    !A(FIRST) and A(LAST) now bound the pivot and act as sentinels for the scans below
+    VALUE=A(MIDDLE)
+    A(MIDDLE)=A(LAST-1)
+    A(LAST-1)=VALUE
+    IVALUE=IND(MIDDLE)
+    IND(MIDDLE)=IND(LAST-1)
+    IND(LAST-1)=IVALUE
+    PIVOT_VALUE=A(LAST-1)
+    PIVOT_INDEX=IND(LAST-1)
+    i=FIRST
+    j=LAST-1
+    DO
+      DO
+        i=i+1
+        IF(.NOT.(A(i)<PIVOT_VALUE.OR.(A(i)==PIVOT_VALUE.AND.IND(i)<PIVOT_INDEX))) EXIT
+      ENDDO
+      DO
+        j=j-1
+        IF(.NOT.(PIVOT_VALUE<A(j).OR.(PIVOT_VALUE==A(j).AND.PIVOT_INDEX<IND(j)))) EXIT
+      ENDDO
+      IF(i>=j) EXIT
+      VALUE=A(i)
+      A(i)=A(j)
+      A(j)=VALUE
+      IVALUE=IND(i)
+      IND(i)=IND(j)
+      IND(j)=IVALUE
+    ENDDO
+    VALUE=A(i)
+    A(i)=A(LAST-1)
+    A(LAST-1)=VALUE
+    IVALUE=IND(i)
+    IND(i)=IND(LAST-1)
+    IND(LAST-1)=IVALUE
+    PIVOT=i
+
+  END SUBROUTINE INTRO_ISORT_INTG_PARTITION
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of an integer list into ascending order using the insertion sort method. Used for the short ranges
+  !>left over by the introsort partitioning.
+  SUBROUTINE INSERTION_ISORT_INTG_RANGE(A,IND,FIRST,LAST)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(INOUT) :: IND(:) !<The sorting index of the list
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    !Local variables
+    INTEGER(INTG) :: i,j,IVALUE
+    INTEGER(INTG) :: VALUE
+
+    DO i=FIRST+1,LAST
+      VALUE=A(i)
+      IVALUE=IND(i)
+      DO j=i-1,FIRST,-1
+        IF(.NOT.(VALUE<A(j).OR.(VALUE==A(j).AND.IVALUE<IND(j)))) EXIT
+        A(j+1)=A(j)
+        IND(j+1)=IND(j)
+      ENDDO
+      A(j+1)=VALUE
+      IND(j+1)=IVALUE
+    ENDDO
+
+  END SUBROUTINE INSERTION_ISORT_INTG_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of an integer list into ascending order using the heap sort method. Used when the introsort
+  !>partitioning degenerates.
+  SUBROUTINE HEAP_ISORT_INTG_RANGE(A,IND,FIRST,LAST)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(INOUT) :: IND(:) !<The sorting index of the list
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    !Local variables
+    INTEGER(INTG) :: HEAP_SIZE,i,j,k,OFFSET,IVALUE
+    INTEGER(INTG) :: VALUE
+
+    OFFSET=FIRST-1
+    HEAP_SIZE=LAST-FIRST+1
+    k=HEAP_SIZE/2+1
+    DO
+      IF(k>1) THEN
+        !Build the heap
+        k=k-1
+        VALUE=A(OFFSET+k)
+        IVALUE=IND(OFFSET+k)
+      ELSE
+        !Move the top of the heap to the end of the sorted range
+        VALUE=A(OFFSET+HEAP_SIZE)
+        IVALUE=IND(OFFSET+HEAP_SIZE)
+        A(OFFSET+HEAP_SIZE)=A(FIRST)
+        IND(OFFSET+HEAP_SIZE)=IND(FIRST)
+        HEAP_SIZE=HEAP_SIZE-1
+        IF(HEAP_SIZE<=1) THEN
+          A(FIRST)=VALUE
+          IND(FIRST)=IVALUE
+          EXIT
+        ENDIF
+      ENDIF
+      !Sift the value down the heap
+      i=k
+      j=k+k
+      DO WHILE(j<=HEAP_SIZE)
+        IF(j<HEAP_SIZE) THEN
+          IF((A(OFFSET+j)<A(OFFSET+j+1).OR.(A(OFFSET+j)==A(OFFSET+j+1).AND.IND(OFFSET+j)<IND(OFFSET+j+1)))) j=j+1
+        ENDIF
+        IF(.NOT.(VALUE<A(OFFSET+j).OR.(VALUE==A(OFFSET+j).AND.IVALUE<IND(OFFSET+j)))) EXIT
+        A(OFFSET+i)=A(OFFSET+j)
+        IND(OFFSET+i)=IND(OFFSET+j)
+        i=j
+        j=j+j
+      ENDDO
+      A(OFFSET+i)=VALUE
+      IND(OFFSET+i)=IVALUE
+    ENDDO
+
+  END SUBROUTINE HEAP_ISORT_INTG_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of an integer list into ascending order using the introsort method. Quicksort partitioning is used
+  !>until the depth limit is reached, after which the remaining range is heap sorted.
+  RECURSIVE SUBROUTINE INTRO_ISORT_INTG_RANGE(A,IND,FIRST,LAST,DEPTH_LIMIT)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(INOUT) :: IND(:) !<The sorting index of the list
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: DEPTH_LIMIT !<The number of partitioning levels allowed before switching to a heap sort
+    !Local variables
+    INTEGER(INTG) :: DEPTH,LOW,HIGH,PIVOT
+
+    LOW=FIRST
+    HIGH=LAST
+    DEPTH=DEPTH_LIMIT
+    DO WHILE(HIGH-LOW>=SORTING_INSERTION_THRESHOLD)
+      IF(DEPTH<=0) THEN
+        CALL HEAP_ISORT_INTG_RANGE(A,IND,LOW,HIGH)
+        RETURN
+      ENDIF
+      DEPTH=DEPTH-1
+      CALL INTRO_ISORT_INTG_PARTITION(A,IND,LOW,HIGH,PIVOT)
+      !Recurse on the smaller side and loop on the larger side to bound the stack depth
+      IF(PIVOT-LOW<HIGH-PIVOT) THEN
+        CALL INTRO_ISORT_INTG_RANGE(A,IND,LOW,PIVOT-1,DEPTH)
+        LOW=PIVOT+1
+      ELSE
+        CALL INTRO_ISORT_INTG_RANGE(A,IND,PIVOT+1,HIGH,DEPTH)
+        HIGH=PIVOT-1
+      ENDIF
+    ENDDO
+    CALL INSERTION_ISORT_INTG_RANGE(A,IND,LOW,HIGH)
+
+  END SUBROUTINE INTRO_ISORT_INTG_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Partitions A(FIRST:LAST) of a single precision list about the median of the first, middle and last items. On exit A(PIVOT) is in
+  !>its sorted position with no larger items before it and no smaller items after it. LAST-FIRST must be at least 2.
+  SUBROUTINE INTRO_SORT_SP_PARTITION(A,FIRST,LAST,PIVOT)
+
+    !Argument variables
+    REAL(SP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to partition
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to partition
+    INTEGER(INTG), INTENT(OUT) :: PIVOT !<On exit, the position of the pivot
+    !Local variables
+    INTEGER(INTG) :: i,j,MIDDLE
+    REAL(SP) :: PIVOT_VALUE,VALUE
+
+    MIDDLE=FIRST+(LAST-FIRST)/2
+    IF(A(MIDDLE)<A(FIRST)) THEN
+      VALUE=A(FIRST)
+      A(FIRST)=A(MIDDLE)
+      A(MIDDLE)=VALUE
+    ENDIF
+    IF(A(LAST)<A(FIRST)) THEN
+      VALUE=A(FIRST)
+      A(FIRST)=A(LAST)
+      A(LAST)=VALUE
+    ENDIF
+    IF(A(LAST)<A(MIDDLE)) THEN
+      VALUE=A(MIDDLE)
+      A(MIDDLE)=A(LAST)
+      A(LAST)=VALUE
+    ENDIF
+    !A(FIRST) and A(LAST) now bound the pivot and act as sentinels for the scans below
+    VALUE=A(MIDDLE)
+    A(MIDDLE)=A(LAST-1)
+    A(LAST-1)=VALUE
+    PIVOT_VALUE=A(LAST-1)
+    i=FIRST
+    j=LAST-1
+    DO
+      DO
+        i=i+1
+        IF(.NOT.A(i)<PIVOT_VALUE) EXIT
+      ENDDO
+      DO
+        j=j-1
+        IF(.NOT.PIVOT_VALUE<A(j)) EXIT
+      ENDDO
+      IF(i>=j) EXIT
+      VALUE=A(i)
+      A(i)=A(j)
+      A(j)=VALUE
+    ENDDO
+    VALUE=A(i)
+    A(i)=A(LAST-1)
+    A(LAST-1)=VALUE
+    PIVOT=i
+
+  END SUBROUTINE INTRO_SORT_SP_PARTITION
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of a single precision list into ascending order using the insertion sort method. Used for the short ranges
+  !>left over by the introsort partitioning.
+  SUBROUTINE INSERTION_SORT_SP_RANGE(A,FIRST,LAST)
+
+    !Argument variables
+    REAL(SP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    !Local variables
+    INTEGER(INTG) :: i,j
+    REAL(SP) :: VALUE
+
+    DO i=FIRST+1,LAST
+      VALUE=A(i)
+      DO j=i-1,FIRST,-1
+        IF(.NOT.VALUE<A(j)) EXIT
+        A(j+1)=A(j)
+      ENDDO
+      A(j+1)=VALUE
+    ENDDO
+
+  END SUBROUTINE INSERTION_SORT_SP_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of a single precision list into ascending order using the heap sort method. Used when the introsort
+  !>partitioning degenerates.
+  SUBROUTINE HEAP_SORT_SP_RANGE(A,FIRST,LAST)
+
+    !Argument variables
+    REAL(SP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    !Local variables
+    INTEGER(INTG) :: HEAP_SIZE,i,j,k,OFFSET
+    REAL(SP) :: VALUE
+
+    OFFSET=FIRST-1
+    HEAP_SIZE=LAST-FIRST+1
+    k=HEAP_SIZE/2+1
+    DO
+      IF(k>1) THEN
+        !Build the heap
+        k=k-1
+        VALUE=A(OFFSET+k)
+      ELSE
+        !Move the top of the heap to the end of the sorted range
+        VALUE=A(OFFSET+HEAP_SIZE)
+        A(OFFSET+HEAP_SIZE)=A(FIRST)
+        HEAP_SIZE=HEAP_SIZE-1
+        IF(HEAP_SIZE<=1) THEN
+          A(FIRST)=VALUE
+          EXIT
+        ENDIF
+      ENDIF
+      !Sift the value down the heap
+      i=k
+      j=k+k
+      DO WHILE(j<=HEAP_SIZE)
+        IF(j<HEAP_SIZE) THEN
+          IF(A(OFFSET+j)<A(OFFSET+j+1)) j=j+1
+        ENDIF
+        IF(.NOT.VALUE<A(OFFSET+j)) EXIT
+        A(OFFSET+i)=A(OFFSET+j)
+        i=j
+        j=j+j
+      ENDDO
+      A(OFFSET+i)=VALUE
+    ENDDO
+
+  END SUBROUTINE HEAP_SORT_SP_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of a single precision list into ascending order using the introsort method. Quicksort partitioning is used
+  !>until the depth limit is reached, after which the remaining range is heap sorted.
+  RECURSIVE SUBROUTINE INTRO_SORT_SP_RANGE(A,FIRST,LAST,DEPTH_LIMIT)
+
+    !Argument variables
+    REAL(SP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: DEPTH_LIMIT !<The number of partitioning levels allowed before switching to a heap sort
+    !Local variables
+    INTEGER(INTG) :: DEPTH,LOW,HIGH,PIVOT
+
+    LOW=FIRST
+    HIGH=LAST
+    DEPTH=DEPTH_LIMIT
+    DO WHILE(HIGH-LOW>=SORTING_INSERTION_THRESHOLD)
+      IF(DEPTH<=0) THEN
+        CALL HEAP_SORT_SP_RANGE(A,LOW,HIGH)
+        RETURN
+      ENDIF
+      DEPTH=DEPTH-1
+      CALL INTRO_SORT_SP_PARTITION(A,LOW,HIGH,PIVOT)
+      !Recurse on the smaller side and loop on the larger side to bound the stack depth
+      IF(PIVOT-LOW<HIGH-PIVOT) THEN
+        CALL INTRO_SORT_SP_RANGE(A,LOW,PIVOT-1,DEPTH)
+        LOW=PIVOT+1
+      ELSE
+        CALL INTRO_SORT_SP_RANGE(A,PIVOT+1,HIGH,DEPTH)
+        HIGH=PIVOT-1
+      ENDIF
+    ENDDO
+    CALL INSERTION_SORT_SP_RANGE(A,LOW,HIGH)
+
+  END SUBROUTINE INTRO_SORT_SP_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Partitions A(FIRST:LAST) of a single precision list about the median of the first, middle and last items. On exit A(PIVOT) is in
+  !>its sorted position with no larger items before it and no smaller items after it. LAST-FIRST must be at least 2.
+  SUBROUTINE INTRO_ISORT_SP_PARTITION(A,IND,FIRST,LAST,PIVOT)
+
+    !Argument variables
+    REAL(SP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(INOUT) :: IND(:) !<The sorting index of the list
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to partition
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to partition
+    INTEGER(INTG), INTENT(OUT) :: PIVOT !<On exit, the position of the pivot
+    !Local variables
+    INTEGER(INTG) :: i,j,MIDDLE,IVALUE,PIVOT_INDEX
+    REAL(SP) :: PIVOT_VALUE,VALUE
+
+    MIDDLE=FIRST+(LAST-FIRST)/2
+    IF((A(MIDDLE)<A(FIRST).OR.(A(MIDDLE)==A(FIRST).AND.IND(MIDDLE)<IND(FIRST)))) THEN
+      VALUE=A(FIRST)
+      A(FIRST)=A(MIDDLE)
+      A(MIDDLE)=VALUE
+      IVALUE=IND(FIRST)
+      IND(FIRST)=IND(MIDDLE)
+      IND(MIDDLE)=IVALUE
+    ENDIF
+    IF((A(LAST)<A(FIRST).OR.(A(LAST)==A(FIRST).AND.IND(LAST)<IND(FIRST)))) THEN
+      VALUE=A(FIRST)
+      A(FIRST)=A(LAST)
+      A(LAST)=VALUE
+      IVALUE=IND(FIRST)
+      IND(FIRST)=IND(LAST)
+      IND(LAST)=IVALUE
+    ENDIF
+    IF((A(LAST)<A(MIDDLE).OR.(A(LAST)==A(MIDDLE).AND.IND(LAST)<IND(MIDDLE)))) THEN
+      VALUE=A(MIDDLE)
+      A(MIDDLE)=A(LAST)
+      A(LAST)=VALUE
+      IVALUE=IND(MIDDLE)
+      IND(MIDDLE)=IND(LAST)
+      IND(LAST)=IVALUE
+    ENDIF
+    !A(FIRST) and A(LAST) now bound the pivot and act as sentinels for the scans below
+    VALUE=A(MIDDLE)
+    A(MIDDLE)=A(LAST-1)
+    A(LAST-1)=VALUE
+    IVALUE=IND(MIDDLE)
+    IND(MIDDLE)=IND(LAST-1)
+    IND(LAST-1)=IVALUE
+    PIVOT_VALUE=A(LAST-1)
+    PIVOT_INDEX=IND(LAST-1)
+    i=FIRST
+    j=LAST-1
+    DO
+      DO
+        i=i+1
+        IF(.NOT.(A(i)<PIVOT_VALUE.OR.(A(i)==PIVOT_VALUE.AND.IND(i)<PIVOT_INDEX))) EXIT
+      ENDDO
+      DO
+        j=j-1
+        IF(.NOT.(PIVOT_VALUE<A(j).OR.(PIVOT_VALUE==A(j).AND.PIVOT_INDEX<IND(j)))) EXIT
+      ENDDO
+      IF(i>=j) EXIT
+      VALUE=A(i)
+      A(i)=A(j)
+      A(j)=VALUE
+      IVALUE=IND(i)
+      IND(i)=IND(j)
+      IND(j)=IVALUE
+    ENDDO
+    VALUE=A(i)
+    A(i)=A(LAST-1)
+    A(LAST-1)=VALUE
+    IVALUE=IND(i)
+    IND(i)=IND(LAST-1)
+    IND(LAST-1)=IVALUE
+    PIVOT=i
+
+  END SUBROUTINE INTRO_ISORT_SP_PARTITION
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of a single precision list into ascending order using the insertion sort method. Used for the short ranges
+  !>left over by the introsort partitioning.
+  SUBROUTINE INSERTION_ISORT_SP_RANGE(A,IND,FIRST,LAST)
+
+    !Argument variables
+    REAL(SP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(INOUT) :: IND(:) !<The sorting index of the list
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    !Local variables
+    INTEGER(INTG) :: i,j,IVALUE
+    REAL(SP) :: VALUE
+
+    DO i=FIRST+1,LAST
+      VALUE=A(i)
+      IVALUE=IND(i)
+      DO j=i-1,FIRST,-1
+        IF(.NOT.(VALUE<A(j).OR.(VALUE==A(j).AND.IVALUE<IND(j)))) EXIT
+        A(j+1)=A(j)
+        IND(j+1)=IND(j)
+      ENDDO
+      A(j+1)=VALUE
+      IND(j+1)=IVALUE
+    ENDDO
+
+  END SUBROUTINE INSERTION_ISORT_SP_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of a single precision list into ascending order using the heap sort method. Used when the introsort
+  !>partitioning degenerates.
+  SUBROUTINE HEAP_ISORT_SP_RANGE(A,IND,FIRST,LAST)
+
+    !Argument variables
+    REAL(SP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(INOUT) :: IND(:) !<The sorting index of the list
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    !Local variables
+    INTEGER(INTG) :: HEAP_SIZE,i,j,k,OFFSET,IVALUE
+    REAL(SP) :: VALUE
+
+    OFFSET=FIRST-1
+    HEAP_SIZE=LAST-FIRST+1
+    k=HEAP_SIZE/2+1
+    DO
+      IF(k>1) THEN
+        !Build the heap
+        k=k-1
+        VALUE=A(OFFSET+k)
+        IVALUE=IND(OFFSET+k)
+      ELSE
+        !Move the top of the heap to the end of the sorted range
+        VALUE=A(OFFSET+HEAP_SIZE)
+        IVALUE=IND(OFFSET+HEAP_SIZE)
+        A(OFFSET+HEAP_SIZE)=A(FIRST)
+        IND(OFFSET+HEAP_SIZE)=IND(FIRST)
+        HEAP_SIZE=HEAP_SIZE-1
+        IF(HEAP_SIZE<=1) THEN
+          A(FIRST)=VALUE
+          IND(FIRST)=IVALUE
+          EXIT
+        ENDIF
+      ENDIF
+      !Sift the value down the heap
+      i=k
+      j=k+k
+      DO WHILE(j<=HEAP_SIZE)
+        IF(j<HEAP_SIZE) THEN
+          IF((A(OFFSET+j)<A(OFFSET+j+1).OR.(A(OFFSET+j)==A(OFFSET+j+1).AND.IND(OFFSET+j)<IND(OFFSET+j+1)))) j=j+1
+        ENDIF
+        IF(.NOT.(VALUE<A(OFFSET+j).OR.(VALUE==A(OFFSET+j).AND.IVALUE<IND(OFFSET+j)))) EXIT
+        A(OFFSET+i)=A(OFFSET+j)
+        IND(OFFSET+i)=IND(OFFSET+j)
+        i=j
+        j=j+j
+      ENDDO
+      A(OFFSET+i)=VALUE
+      IND(OFFSET+i)=IVALUE
+    ENDDO
+
+  END SUBROUTINE HEAP_ISORT_SP_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of a single precision list into ascending order using the introsort method. Quicksort partitioning is used
+  !>until the depth limit is reached, after which the remaining range is heap sorted.
+  RECURSIVE SUBROUTINE INTRO_ISORT_SP_RANGE(A,IND,FIRST,LAST,DEPTH_LIMIT)
+
+    !Argument variables
+    REAL(SP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(INOUT) :: IND(:) !<The sorting index of the list
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: DEPTH_LIMIT !<The number of partitioning levels allowed before switching to a heap sort
+    !Local variables
+    INTEGER(INTG) :: DEPTH,LOW,HIGH,PIVOT
+
+    LOW=FIRST
+    HIGH=LAST
+    DEPTH=DEPTH_LIMIT
+    DO WHILE(HIGH-LOW>=SORTING_INSERTION_THRESHOLD)
+      IF(DEPTH<=0) THEN
+        CALL HEAP_ISORT_SP_RANGE(A,IND,LOW,HIGH)
+        RETURN
+      ENDIF
+      DEPTH=DEPTH-1
+      CALL INTRO_ISORT_SP_PARTITION(A,IND,LOW,HIGH,PIVOT)
+      !Recurse on the smaller side and loop on the larger side to bound the stack depth
+      IF(PIVOT-LOW<HIGH-PIVOT) THEN
+        CALL INTRO_ISORT_SP_RANGE(A,IND,LOW,PIVOT-1,DEPTH)
+        LOW=PIVOT+1
+      ELSE
+        CALL INTRO_ISORT_SP_RANGE(A,IND,PIVOT+1,HIGH,DEPTH)
+        HIGH=PIVOT-1
+      ENDIF
+    ENDDO
+    CALL INSERTION_ISORT_SP_RANGE(A,IND,LOW,HIGH)
+
+  END SUBROUTINE INTRO_ISORT_SP_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Partitions A(FIRST:LAST) of a double precision list about the median of the first, middle and last items. On exit A(PIVOT) is in
+  !>its sorted position with no larger items before it and no smaller items after it. LAST-FIRST must be at least 2.
+  SUBROUTINE INTRO_SORT_DP_PARTITION(A,FIRST,LAST,PIVOT)
+
+    !Argument variables
+    REAL(DP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to partition
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to partition
+    INTEGER(INTG), INTENT(OUT) :: PIVOT !<On exit, the position of the pivot
+    !Local variables
+    INTEGER(INTG) :: i,j,MIDDLE
+    REAL(DP) :: PIVOT_VALUE,VALUE
+
+    MIDDLE=FIRST+(LAST-FIRST)/2
+    IF(A(MIDDLE)<A(FIRST)) THEN
+      VALUE=A(FIRST)
+      A(FIRST)=A(MIDDLE)
+      A(MIDDLE)=VALUE
+    ENDIF
+    IF(A(LAST)<A(FIRST)) THEN
+      VALUE=A(FIRST)
+      A(FIRST)=A(LAST)
+      A(LAST)=VALUE
+    ENDIF
+    IF(A(LAST)<A(MIDDLE)) THEN
+      VALUE=A(MIDDLE)
+      A(MIDDLE)=A(LAST)
+      A(LAST)=VALUE
+    ENDIF
+    !A(FIRST) and A(LAST) now bound the pivot and act as sentinels for the scans below
+    VALUE=A(MIDDLE)
+    A(MIDDLE)=A(LAST-1)
+    A(LAST-1)=VALUE
+    PIVOT_VALUE=A(LAST-1)
+    i=FIRST
+    j=LAST-1
+    DO
+      DO
+        i=i+1
+        IF(.NOT.A(i)<PIVOT_VALUE) EXIT
+      ENDDO
+      DO
+        j=j-1
+        IF(.NOT.PIVOT_VALUE<A(j)) EXIT
+      ENDDO
+      IF(i>=j) EXIT
+      VALUE=A(i)
+      A(i)=A(j)
+      A(j)=VALUE
+    ENDDO
+    VALUE=A(i)
+    A(i)=A(LAST-1)
+    A(LAST-1)=VALUE
+    PIVOT=i
+
+  END SUBROUTINE INTRO_SORT_DP_PARTITION
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of a double precision list into ascending order using the insertion sort method. Used for the short ranges
+  !>left over by the introsort partitioning.
+  SUBROUTINE INSERTION_SORT_DP_RANGE(A,FIRST,LAST)
+
+    !Argument variables
+    REAL(DP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    !Local variables
+    INTEGER(INTG) :: i,j
+    REAL(DP) :: VALUE
+
+    DO i=FIRST+1,LAST
+      VALUE=A(i)
+      DO j=i-1,FIRST,-1
+        IF(.NOT.VALUE<A(j)) EXIT
+        A(j+1)=A(j)
+      ENDDO
+      A(j+1)=VALUE
+    ENDDO
+
+  END SUBROUTINE INSERTION_SORT_DP_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of a double precision list into ascending order using the heap sort method. Used when the introsort
+  !>partitioning degenerates.
+  SUBROUTINE HEAP_SORT_DP_RANGE(A,FIRST,LAST)
+
+    !Argument variables
+    REAL(DP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    !Local variables
+    INTEGER(INTG) :: HEAP_SIZE,i,j,k,OFFSET
+    REAL(DP) :: VALUE
+
+    OFFSET=FIRST-1
+    HEAP_SIZE=LAST-FIRST+1
+    k=HEAP_SIZE/2+1
+    DO
+      IF(k>1) THEN
+        !Build the heap
+        k=k-1
+        VALUE=A(OFFSET+k)
+      ELSE
+        !Move the top of the heap to the end of the sorted range
+        VALUE=A(OFFSET+HEAP_SIZE)
+        A(OFFSET+HEAP_SIZE)=A(FIRST)
+        HEAP_SIZE=HEAP_SIZE-1
+        IF(HEAP_SIZE<=1) THEN
+          A(FIRST)=VALUE
+          EXIT
+        ENDIF
+      ENDIF
+      !Sift the value down the heap
+      i=k
+      j=k+k
+      DO WHILE(j<=HEAP_SIZE)
+        IF(j<HEAP_SIZE) THEN
+          IF(A(OFFSET+j)<A(OFFSET+j+1)) j=j+1
+        ENDIF
+        IF(.NOT.VALUE<A(OFFSET+j)) EXIT
+        A(OFFSET+i)=A(OFFSET+j)
+        i=j
+        j=j+j
+      ENDDO
+      A(OFFSET+i)=VALUE
+    ENDDO
+
+  END SUBROUTINE HEAP_SORT_DP_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of a double precision list into ascending order using the introsort method. Quicksort partitioning is used
+  !>until the depth limit is reached, after which the remaining range is heap sorted.
+  RECURSIVE SUBROUTINE INTRO_SORT_DP_RANGE(A,FIRST,LAST,DEPTH_LIMIT)
+
+    !Argument variables
+    REAL(DP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: DEPTH_LIMIT !<The number of partitioning levels allowed before switching to a heap sort
+    !Local variables
+    INTEGER(INTG) :: DEPTH,LOW,HIGH,PIVOT
+
+    LOW=FIRST
+    HIGH=LAST
+    DEPTH=DEPTH_LIMIT
+    DO WHILE(HIGH-LOW>=SORTING_INSERTION_THRESHOLD)
+      IF(DEPTH<=0) THEN
+        CALL HEAP_SORT_DP_RANGE(A,LOW,HIGH)
+        RETURN
+      ENDIF
+      DEPTH=DEPTH-1
+      CALL INTRO_SORT_DP_PARTITION(A,LOW,HIGH,PIVOT)
+      !Recurse on the smaller side and loop on the larger side to bound the stack depth
+      IF(PIVOT-LOW<HIGH-PIVOT) THEN
+        CALL INTRO_SORT_DP_RANGE(A,LOW,PIVOT-1,DEPTH)
+        LOW=PIVOT+1
+      ELSE
+        CALL INTRO_SORT_DP_RANGE(A,PIVOT+1,HIGH,DEPTH)
+        HIGH=PIVOT-1
+      ENDIF
+    ENDDO
+    CALL INSERTION_SORT_DP_RANGE(A,LOW,HIGH)
+
+  END SUBROUTINE INTRO_SORT_DP_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Partitions A(FIRST:LAST) of a double precision list about the median of the first, middle and last items. On exit A(PIVOT) is in
+  !>its sorted position with no larger items before it and no smaller items after it. LAST-FIRST must be at least 2.
+  SUBROUTINE INTRO_ISORT_DP_PARTITION(A,IND,FIRST,LAST,PIVOT)
+
+    !Argument variables
+    REAL(DP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(INOUT) :: IND(:) !<The sorting index of the list
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to partition
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to partition
+    INTEGER(INTG), INTENT(OUT) :: PIVOT !<On exit, the position of the pivot
+    !Local variables
+    INTEGER(INTG) :: i,j,MIDDLE,IVALUE,PIVOT_INDEX
+    REAL(DP) :: PIVOT_VALUE,VALUE
+
+    MIDDLE=FIRST+(LAST-FIRST)/2
+    IF((A(MIDDLE)<A(FIRST).OR.(A(MIDDLE)==A(FIRST).AND.IND(MIDDLE)<IND(FIRST)))) THEN
+      VALUE=A(FIRST)
+      A(FIRST)=A(MIDDLE)
+      A(MIDDLE)=VALUE
+      IVALUE=IND(FIRST)
+      IND(FIRST)=IND(MIDDLE)
+      IND(MIDDLE)=IVALUE
+    ENDIF
+    IF((A(LAST)<A(FIRST).OR.(A(LAST)==A(FIRST).AND.IND(LAST)<IND(FIRST)))) THEN
+      VALUE=A(FIRST)
+      A(FIRST)=A(LAST)
+      A(LAST)=VALUE
+      IVALUE=IND(FIRST)
+      IND(FIRST)=IND(LAST)
+      IND(LAST)=IVALUE
+    ENDIF
+    IF((A(LAST)<A(MIDDLE).OR.(A(LAST)==A(MIDDLE).AND.IND(LAST)<IND(MIDDLE)))) THEN
+      VALUE=A(MIDDLE)
+      A(MIDDLE)=A(LAST)
+      A(LAST)=VALUE
+      IVALUE=IND(MIDDLE)
+      IND(MIDDLE)=IND(LAST)
+      IND(LAST)=IVALUE
+    ENDIF
+    !A(FIRST) and A(LAST) now bound the pivot and act as sentinels for the scans below
+    VALUE=A(MIDDLE)
+    A(MIDDLE)=A(LAST-1)
+    A(LAST-1)=VALUE
+    IVALUE=IND(MIDDLE)
+    IND(MIDDLE)=IND(LAST-1)
+    IND(LAST-1)=IVALUE
+    PIVOT_VALUE=A(LAST-1)
+    PIVOT_INDEX=IND(LAST-1)
+    i=FIRST
+    j=LAST-1
+    DO
+      DO
+        i=i+1
+        IF(.NOT.(A(i)<PIVOT_VALUE.OR.(A(i)==PIVOT_VALUE.AND.IND(i)<PIVOT_INDEX))) EXIT
+      ENDDO
+      DO
+        j=j-1
+        IF(.NOT.(PIVOT_VALUE<A(j).OR.(PIVOT_VALUE==A(j).AND.PIVOT_INDEX<IND(j)))) EXIT
+      ENDDO
+      IF(i>=j) EXIT
+      VALUE=A(i)
+      A(i)=A(j)
+      A(j)=VALUE
+      IVALUE=IND(i)
+      IND(i)=IND(j)
+      IND(j)=IVALUE
+    ENDDO
+    VALUE=A(i)
+    A(i)=A(LAST-1)
+    A(LAST-1)=VALUE
+    IVALUE=IND(i)
+    IND(i)=IND(LAST-1)
+    IND(LAST-1)=IVALUE
+    PIVOT=i
+
+  END SUBROUTINE INTRO_ISORT_DP_PARTITION
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of a double precision list into ascending order using the insertion sort method. Used for the short ranges
+  !>left over by the introsort partitioning.
+  SUBROUTINE INSERTION_ISORT_DP_RANGE(A,IND,FIRST,LAST)
+
+    !Argument variables
+    REAL(DP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(INOUT) :: IND(:) !<The sorting index of the list
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    !Local variables
+    INTEGER(INTG) :: i,j,IVALUE
+    REAL(DP) :: VALUE
+
+    DO i=FIRST+1,LAST
+      VALUE=A(i)
+      IVALUE=IND(i)
+      DO j=i-1,FIRST,-1
+        IF(.NOT.(VALUE<A(j).OR.(VALUE==A(j).AND.IVALUE<IND(j)))) EXIT
+        A(j+1)=A(j)
+        IND(j+1)=IND(j)
+      ENDDO
+      A(j+1)=VALUE
+      IND(j+1)=IVALUE
+    ENDDO
+
+  END SUBROUTINE INSERTION_ISORT_DP_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of a double precision list into ascending order using the heap sort method. Used when the introsort
+  !>partitioning degenerates.
+  SUBROUTINE HEAP_ISORT_DP_RANGE(A,IND,FIRST,LAST)
+
+    !Argument variables
+    REAL(DP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(INOUT) :: IND(:) !<The sorting index of the list
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    !Local variables
+    INTEGER(INTG) :: HEAP_SIZE,i,j,k,OFFSET,IVALUE
+    REAL(DP) :: VALUE
+
+    OFFSET=FIRST-1
+    HEAP_SIZE=LAST-FIRST+1
+    k=HEAP_SIZE/2+1
+    DO
+      IF(k>1) THEN
+        !Build the heap
+        k=k-1
+        VALUE=A(OFFSET+k)
+        IVALUE=IND(OFFSET+k)
+      ELSE
+        !Move the top of the heap to the end of the sorted range
+        VALUE=A(OFFSET+HEAP_SIZE)
+        IVALUE=IND(OFFSET+HEAP_SIZE)
+        A(OFFSET+HEAP_SIZE)=A(FIRST)
+        IND(OFFSET+HEAP_SIZE)=IND(FIRST)
+        HEAP_SIZE=HEAP_SIZE-1
+        IF(HEAP_SIZE<=1) THEN
+          A(FIRST)=VALUE
+          IND(FIRST)=IVALUE
+          EXIT
+        ENDIF
+      ENDIF
+      !Sift the value down the heap
+      i=k
+      j=k+k
+      DO WHILE(j<=HEAP_SIZE)
+        IF(j<HEAP_SIZE) THEN
+          IF((A(OFFSET+j)<A(OFFSET+j+1).OR.(A(OFFSET+j)==A(OFFSET+j+1).AND.IND(OFFSET+j)<IND(OFFSET+j+1)))) j=j+1
+        ENDIF
+        IF(.NOT.(VALUE<A(OFFSET+j).OR.(VALUE==A(OFFSET+j).AND.IVALUE<IND(OFFSET+j)))) EXIT
+        A(OFFSET+i)=A(OFFSET+j)
+        IND(OFFSET+i)=IND(OFFSET+j)
+        i=j
+        j=j+j
+      ENDDO
+      A(OFFSET+i)=VALUE
+      IND(OFFSET+i)=IVALUE
+    ENDDO
+
+  END SUBROUTINE HEAP_ISORT_DP_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Sorts A(FIRST:LAST) of a double precision list into ascending order using the introsort method. Quicksort partitioning is used
+  !>until the depth limit is reached, after which the remaining range is heap sorted.
+  RECURSIVE SUBROUTINE INTRO_ISORT_DP_RANGE(A,IND,FIRST,LAST,DEPTH_LIMIT)
+
+    !Argument variables
+    REAL(DP), INTENT(INOUT) :: A(:) !<The list to sort
+    INTEGER(INTG), INTENT(INOUT) :: IND(:) !<The sorting index of the list
+    INTEGER(INTG), INTENT(IN) :: FIRST !<The first item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: LAST !<The last item of the range to sort
+    INTEGER(INTG), INTENT(IN) :: DEPTH_LIMIT !<The number of partitioning levels allowed before switching to a heap sort
+    !Local variables
+    INTEGER(INTG) :: DEPTH,LOW,HIGH,PIVOT
+
+    LOW=FIRST
+    HIGH=LAST
+    DEPTH=DEPTH_LIMIT
+    DO WHILE(HIGH-LOW>=SORTING_INSERTION_THRESHOLD)
+      IF(DEPTH<=0) THEN
+        CALL HEAP_ISORT_DP_RANGE(A,IND,LOW,HIGH)
+        RETURN
+      ENDIF
+      DEPTH=DEPTH-1
+      CALL INTRO_ISORT_DP_PARTITION(A,IND,LOW,HIGH,PIVOT)
+      !Recurse on the smaller side and loop on the larger side to bound the stack depth
+      IF(PIVOT-LOW<HIGH-PIVOT) THEN
+        CALL INTRO_ISORT_DP_RANGE(A,IND,LOW,PIVOT-1,DEPTH)
+        LOW=PIVOT+1
+      ELSE
+        CALL INTRO_ISORT_DP_RANGE(A,IND,PIVOT+1,HIGH,DEPTH)
+        HIGH=PIVOT-1
+      ENDIF
+    ENDDO
+    CALL INSERTION_ISORT_DP_RANGE(A,IND,LOW,HIGH)
+
+  END SUBROUTINE INTRO_ISORT_DP_RANGE
+  !
+  !================================================================================================================================
+  !
+
+  !>Returns the number of partitioning levels an introsort of N items is allowed before switching to a heap sort,
+  !>2*floor(log2(N)).
+  FUNCTION SORTING_DEPTH_LIMIT(N)
+
+    !Argument variables
+    INTEGER(INTG), INTENT(IN) :: N !<The number of items to sort
+    !Function variable
+    INTEGER(INTG) :: SORTING_DEPTH_LIMIT
+    !Local variables
+    INTEGER(INTG) :: M
+
+    SORTING_DEPTH_LIMIT=0
+    M=N
+    DO WHILE(M>1)
+      M=M/2
+      SORTING_DEPTH_LIMIT=SORTING_DEPTH_LIMIT+2
+    ENDDO
+
+  END FUNCTION SORTING_DEPTH_LIMIT
   
   !
   !================================================================================================================================
@@ -121,6 +121,10 @@ MODULE TYPES
     INTEGER(INTG) :: KEY_DIMENSION !<The key dimension number i.e., the dimension index used for indexing and sorting
     INTEGER(INTG) :: SORT_ORDER !<The ordering to be used when sorting the list \see LISTS_SortingOrder
     INTEGER(INTG) :: SORT_METHOD !<The sorting method to be used when sorting the list \see LISTS_SortingMethod
+    INTEGER(INTG) :: DUPLICATES_METHOD !<The method to be used when removing duplicates from the list \see LISTS_DuplicatesMethod
+    REAL(DP) :: GROWTH_FACTOR !<The factor the size of the list is multiplied by when a full list is reallocated. Must be > 1.
+    INTEGER(INTG) :: NUMBER_OF_REALLOCATIONS !<The number of times the list data has been reallocated to grow the list.
+    INTEGER(LINTG) :: NUMBER_OF_BYTES_COPIED !<The number of bytes of list data copied when growing the list.
     INTEGER(INTG), ALLOCATABLE :: LIST_INTG(:) !<The integer data (dimension = 1) for integer lists. 
     INTEGER(INTG), ALLOCATABLE :: LIST_INTG2(:,:) !<The integer data (dimension > 1) for integer lists. 
     REAL(SP), ALLOCATABLE :: LIST_SP(:) !<The single precision data (dimension = 1)for single precision real lists. 
@@ -130,6 +134,14 @@ MODULE TYPES
     INTEGER(C_INT), ALLOCATABLE :: LIST_C_INT(:) !<The integer data (dimension = 1) for integer lists. 
     INTEGER(C_INT), ALLOCATABLE :: LIST_C_INT2(:,:) !<The integer data (dimension > 1) for integer lists. 
   END TYPE LIST_TYPE
+
+  !>Contains information on an open addressing hash set of integers \see HASH_SETS
+  TYPE HashSetType
+    INTEGER(INTG) :: numberOfItems !<The number of items currently in the hash set
+    INTEGER(INTG) :: tableSize !<The number of slots in the hash table. This is always a power of two.
+    LOGICAL, ALLOCATABLE :: occupied(:) !<occupied(slotIdx). Is .TRUE. if slot slotIdx (0 to tableSize-1) of the hash table holds an item.
+    INTEGER(INTG), ALLOCATABLE :: items(:) !<items(slotIdx). The item held in slot slotIdx of the hash table.
+  END TYPE HashSetType
     
   !
   !================================================================================================================================
@@ -286,6 +298,42 @@ MODULE TYPES
     REAL(DP), ALLOCATABLE :: projectionVector(:) !<The projection vectors from data point to the projected point. 
   END TYPE DATA_PROJECTION_RESULT_TYPE
 
+  !>Contains a uniform grid spatial index of the data projection candidates, used to find the closest candidates to a data point without visiting every candidate.
+  TYPE DataProjectionSpatialIndexType
+    INTEGER(INTG) :: numberOfCandidates !<The number of candidates in the spatial index.
+    INTEGER(INTG) :: numberOfDimensions !<The number of coordinate dimensions of the spatial index.
+    INTEGER(INTG) :: numberOfCells(3) !<numberOfCells(coordinateIdx). The number of grid cells in the coordinateIdx'th direction.
+    REAL(DP) :: minimumBounds(3) !<minimumBounds(coordinateIdx). The lower corner of the grid in the coordinateIdx'th direction.
+    REAL(DP) :: cellSize(3) !<cellSize(coordinateIdx). The size of a grid cell in the coordinateIdx'th direction.
+    REAL(DP), ALLOCATABLE :: candidatePoints(:,:) !<candidatePoints(coordinateIdx,candidateIdx). The position of the candidateIdx'th candidate evaluated at the starting xi.
+    INTEGER(INTG), ALLOCATABLE :: cellCandidatesStart(:) !<cellCandidatesStart(cellIdx). The position in cellCandidates of the first candidate in the cellIdx'th grid cell. cellCandidatesStart(numberOfCells+1) is one past the last candidate.
+    INTEGER(INTG), ALLOCATABLE :: cellCandidates(:) !<cellCandidates(idx). The candidate indices in each grid cell, stored cell by cell in increasing candidate order.
+  END TYPE DataProjectionSpatialIndexType
+
+  !>Contains a least recently used cache of the element/face/line interpolation parameters of the projection field, used during a data projection evaluation so that the parameters of an element/face/line are only retrieved from the field once.
+  TYPE DataProjectionParametersCacheType
+    TYPE(FIELD_TYPE), POINTER :: field !<A pointer to the field the cached parameters are from.
+    INTEGER(INTG) :: parameterSetType !<The field parameter set type of the cached parameters.
+    INTEGER(INTG) :: projectionType !<The projection type of the data projection, which gives whether element, face or line parameters are cached. \see DATA_PROJECTION_ROUTINES_DataProjectionTypes
+    INTEGER(INTG) :: numberOfComponents !<The number of field components cached for each entry.
+    INTEGER(INTG) :: maximumNumberOfParameters !<The maximum number of parameters cached for each component of an entry.
+    INTEGER(INTG) :: maximumNumberOfEntries !<The maximum number of entries in the cache, set from the cache memory limit.
+    INTEGER(INTG) :: numberOfEntries !<The number of entries in use in the cache.
+    INTEGER(INTG) :: mostRecentEntry !<The entry that was most recently used, or 0 if the cache is empty.
+    INTEGER(INTG) :: leastRecentEntry !<The entry that was least recently used, or 0 if the cache is empty. This is the entry evicted when the cache is full.
+    INTEGER(INTG) :: numberOfHits !<The number of parameter retrievals found in the cache.
+    INTEGER(INTG) :: numberOfMisses !<The number of parameter retrievals not found in the cache.
+    INTEGER(INTG), ALLOCATABLE :: entryNumbers(:) !<entryNumbers(entityNumber). The cache entry holding the parameters of the entityNumber'th local element/face/line, or 0 if they are not cached.
+    INTEGER(INTG), ALLOCATABLE :: entityNumbers(:) !<entityNumbers(entryIdx). The local element/face/line number of the entryIdx'th cache entry.
+    INTEGER(INTG), ALLOCATABLE :: previousEntries(:) !<previousEntries(entryIdx). The entry used more recently than the entryIdx'th entry, or 0 if it is the most recent.
+    INTEGER(INTG), ALLOCATABLE :: nextEntries(:) !<nextEntries(entryIdx). The entry used less recently than the entryIdx'th entry, or 0 if it is the least recent.
+    INTEGER(INTG), ALLOCATABLE :: numberOfXi(:) !<numberOfXi(entryIdx). The number of xi directions of the entryIdx'th entry.
+    TYPE(BASIS_PTR_TYPE), ALLOCATABLE :: bases(:,:) !<bases(componentIdx,entryIdx). The basis of the componentIdx'th component of the entryIdx'th entry.
+    INTEGER(INTG), ALLOCATABLE :: numberOfParameters(:,:) !<numberOfParameters(componentIdx,entryIdx). The number of parameters of the componentIdx'th component of the entryIdx'th entry.
+    REAL(DP), ALLOCATABLE :: parameters(:,:,:) !<parameters(parameterIdx,componentIdx,entryIdx). The interpolation parameters of the entryIdx'th entry.
+    REAL(DP), ALLOCATABLE :: scaleFactors(:,:,:) !<scaleFactors(parameterIdx,componentIdx,entryIdx). The scale factors of the entryIdx'th entry. Only allocated if the field is scaled.
+  END TYPE DataProjectionParametersCacheType
+
   TYPE DATA_PROJECTION_TYPE
     INTEGER(INTG) :: GLOBAL_NUMBER !<The global number of data projection. 
     INTEGER(INTG) :: USER_NUMBER !<The user defined number of data projection. 
@@ -303,6 +351,12 @@ MODULE TYPES
     REAL(DP), ALLOCATABLE :: STARTING_XI(:) !<The starting value of the element xi
     REAL(DP) :: ABSOLUTE_TOLERANCE !<The absolute tolerance of the iteration update
     REAL(DP) :: RELATIVE_TOLERANCE !<The relative tolerance of the iteration update
+    INTEGER(INTG) :: spatialIndexType !<The type of spatial index used to find the closest candidates. \See DATA_PROJECTION_ROUTINES_DataProjectionSpatialIndexTypes
+    TYPE(DataProjectionSpatialIndexType), POINTER :: spatialIndex !<A pointer to the spatial index of the candidates from the last evaluation. Only associated if a spatial index type has been set.
+    LOGICAL :: parametersCacheEnabled !<Is .TRUE. if the interpolation parameters are cached during an evaluation, .FALSE. if not.
+    TYPE(DataProjectionParametersCacheType), POINTER :: parametersCache !<A pointer to the interpolation parameters cache. Only associated during an evaluation.
+    INTEGER(INTG) :: parametersCacheHits !<The number of interpolation parameter retrievals found in the cache during the last evaluation.
+    INTEGER(INTG) :: parametersCacheMisses !<The number of interpolation parameter retrievals not found in the cache during the last evaluation.
     INTEGER(INTG), ALLOCATABLE :: candidateElementNumbers(:) !<candidateElementNumbers(candidateElementIdx). The user specified USER (get convert to local element number in PROJECTION_EVALUATE routines) candidate element numbers
     INTEGER(INTG), ALLOCATABLE :: localFaceLineNumbers(:) !<localFaceLineNumbers(candidateElementIdx). The user specified corresponding element face/line numbers for the candidate elements
     LOGICAL :: DATA_PROJECTION_PROJECTED !<Is .TRUE. if the data projection have been projected, .FALSE. if not.
@@ -1071,6 +1125,10 @@ END TYPE GENERATED_MESH_ELLIPSOID_TYPE
     INTEGER(INTG) :: NUMBER_OF_DOMAINS !<The number of domains that this decomposition contains.
     INTEGER(INTG) :: NUMBER_OF_EDGES_CUT !<For automatically calculated decompositions, the number of edges of the mesh dual graph that were cut for the composition. It provides an indication of the optimally of the automatic decomposition.
     INTEGER(INTG), ALLOCATABLE :: ELEMENT_DOMAIN(:) !<ELEMENT_DOMAIN(ne). The domain number that the ne'th global element is in for the decomposition. Note: the domain numbers start at 0 and go up to the NUMBER_OF_DOMAINS-1.
+    INTEGER(INTG) :: PARTITION_METHOD !<For automatically calculated decompositions, the graph partitioning method used. \see MESH_ROUTINES_DecompositionPartitionMethods
+    INTEGER(INTG) :: ELEMENT_WEIGHT_TYPE !<For automatically calculated decompositions, how the element weights for the partitioning are found. \see MESH_ROUTINES_DecompositionElementWeightTypes
+    INTEGER(INTG) :: NUMBER_OF_CONSTRAINTS !<The number of weights (balance constraints) for each element in ELEMENT_WEIGHTS.
+    INTEGER(INTG), ALLOCATABLE :: ELEMENT_WEIGHTS(:,:) !<ELEMENT_WEIGHTS(constraint_idx,ne). The user set weight of the ne'th global element for the constraint_idx'th balance constraint when the element weight type is DECOMPOSITION_USER_ELEMENT_WEIGHTS.
     TYPE(DECOMPOSITION_TOPOLOGY_TYPE), POINTER :: TOPOLOGY !<A pointer to the topology for this decomposition.
     TYPE(DOMAIN_PTR_TYPE), POINTER :: DOMAIN(:) !<DOMAIN(mesh_component_idx). A pointer to the domain for mesh component for the domain associated with the computational node. \todo Change this to allocatable???
     LOGICAL :: CALCULATE_FACES !<Boolean flag to determine whether faces should be calculated
@@ -1386,6 +1444,7 @@ END TYPE GENERATED_MESH_ELLIPSOID_TYPE
   !>Contains information for an element matrix.
   TYPE ELEMENT_MATRIX_TYPE
     INTEGER(INTG) :: EQUATIONS_MATRIX_NUMBER !<The equations matrix number that this element matrix belongs to.
+    INTEGER(INTG) :: elementNumber !<The local element number the element matrix was last calculated for. Zero if the rows or columns of the element matrix come from more than one element.
     INTEGER(INTG) :: STRUCTURE_TYPE !<The structure type of the element matrix. \see EQUATIONS_MATRICES_ROUTINES_EquationsMatrixStructureTypes,EQUATIONS_MATRICES_ROUTINES
     INTEGER(INTG) :: NUMBER_OF_ROWS !<The current number of rows in the element matrix.
     INTEGER(INTG) :: NUMBER_OF_COLUMNS !<The current number of columns in the element matrix.
@@ -1396,6 +1455,15 @@ END TYPE GENERATED_MESH_ELLIPSOID_TYPE
     REAL(DP), ALLOCATABLE :: MATRIX(:,:) !<MATRIX(i,j). The vlaue of the i'th row and the j'th column of the element matrix.
   END TYPE ELEMENT_MATRIX_TYPE
 
+  !>Contains the storage locations in a sparse distributed matrix of the entries of an element matrix, so that the element matrix can be added without searching the sparsity pattern.
+  TYPE ElementScatterMapType
+    INTEGER(INTG) :: numberOfRows !<The number of rows in the element matrix the storage locations were found for. Zero if the storage locations have not been found.
+    INTEGER(INTG) :: numberOfColumns !<The number of columns in the element matrix the storage locations were found for.
+    INTEGER(INTG), ALLOCATABLE :: rowDofs(:) !<rowDofs(rowIdx). The equations row of the rowIdx'th row of the element matrix.
+    INTEGER(INTG), ALLOCATABLE :: columnDofs(:) !<columnDofs(columnIdx). The equations column of the columnIdx'th column of the element matrix.
+    INTEGER(INTG), ALLOCATABLE :: locations(:,:) !<locations(rowIdx,columnIdx). The storage location in the distributed matrix data of the rowIdx'th row and columnIdx'th column of the element matrix.
+  END TYPE ElementScatterMapType
+
   !>Contains information for an element vector.
   TYPE ELEMENT_VECTOR_TYPE
     INTEGER(INTG) :: NUMBER_OF_ROWS !<The current number of rows in the element vector
@@ -1440,6 +1508,7 @@ END TYPE GENERATED_MESH_ELLIPSOID_TYPE
     TYPE(ELEMENT_MATRIX_TYPE) :: ELEMENT_MATRIX !<The element matrix for this equations matrix
     TYPE(NodalMatrixType) :: NodalMatrix !<The nodal matrix for this equations matrix
     TYPE(DISTRIBUTED_VECTOR_TYPE), POINTER :: TEMP_VECTOR !<Temporary vector used for assembly. 
+    TYPE(ElementScatterMapType), POINTER :: elementScatterMaps(:) !<elementScatterMaps(elementIdx). The storage locations of the element matrix entries for the elementIdx'th local element. Only associated for sparse CMISS equations matrices. The maps are shared with any assembly copies of the matrix.
   END TYPE EQUATIONS_MATRIX_TYPE
 
   !>A buffer type to allow for an array of pointers to a EQUATIONS_MATRIX_TYPE \see TYPES::EQUATIONS_MATRIX_TYPE.
@@ -1460,6 +1529,7 @@ END TYPE GENERATED_MESH_ELLIPSOID_TYPE
     TYPE(ELEMENT_MATRIX_TYPE) :: ELEMENT_JACOBIAN !<The element matrix for this Jacobian matrix. This is not used if the Jacobian is not supplied.
     TYPE(NodalMatrixType) :: NodalJacobian !<The nodal matrix for this Jacobian matrix. This is not used if the Jacobian is not supplied.
     INTEGER(INTG) :: JACOBIAN_CALCULATION_TYPE !<The calculation type (analytic of finite difference) of the Jacobian.
+    TYPE(ElementScatterMapType), POINTER :: elementScatterMaps(:) !<elementScatterMaps(elementIdx). The storage locations of the element Jacobian entries for the elementIdx'th local element. Only associated for sparse CMISS Jacobian matrices. The maps are shared with any assembly copies of the Jacobian.
   END TYPE EQUATIONS_JACOBIAN_TYPE
 
   !>A buffer type to allow for an array of pointers to a EQUATIONS_JACOBIAN_TYPE \see TYPES::EQUATIONS_JACOBIAN_TYPE.
@@ -1937,6 +2007,13 @@ END TYPE GENERATED_MESH_ELLIPSOID_TYPE
     TYPE(FIELD_TYPE), POINTER :: EQUATIONS_SET_FIELD_FIELD !<A pointer to the equations set field for the equations set.
   END TYPE EQUATIONS_SET_EQUATIONS_SET_FIELD_TYPE
 
+  !>Contains a colouring of the local elements of an equations set for threaded assembly. Elements with the same colour do not share any nodes and so do not add to the same rows of the equations matrices and vectors.
+  TYPE EquationsSetElementColouringType
+    INTEGER(INTG) :: numberOfColours !<The number of colours in the element colouring. Zero if the elements could not be coloured, in which case the elements are assembled on a single thread.
+    INTEGER(INTG), ALLOCATABLE :: colourStarts(:) !<colourStarts(colourIdx). The position in elements of the first element of the colourIdx'th colour. colourStarts(numberOfColours+1) is one past the position of the last element.
+    INTEGER(INTG), ALLOCATABLE :: elements(:) !<elements(elementIdx). The local element number of the elementIdx'th element, ordered by colour.
+  END TYPE EquationsSetElementColouringType
+
   !>Contains information on an equations set. \see OPENCMISS::CMISSEquationsSetType
   TYPE EQUATIONS_SET_TYPE
     INTEGER(INTG) :: USER_NUMBER !<The user identifying number of the equations set
@@ -1956,6 +2033,8 @@ END TYPE GENERATED_MESH_ELLIPSOID_TYPE
     TYPE(EQUATIONS_TYPE), POINTER :: EQUATIONS !<A pointer to the equations information for the equations set
     TYPE(BOUNDARY_CONDITIONS_TYPE), POINTER :: BOUNDARY_CONDITIONS !<A pointer to the boundary condition information for the equations set.
     TYPE(EQUATIONS_SET_EQUATIONS_SET_FIELD_TYPE) :: EQUATIONS_SET_FIELD !<A pointer to the equations set field for the equations set.
+    INTEGER(INTG) :: numberOfAssemblyThreads !<The number of OpenMP threads used to assemble the finite element equations of the equations set.
+    TYPE(EquationsSetElementColouringType), POINTER :: elementColouring !<A pointer to the element colouring used for threaded assembly. Calculated on the first threaded assembly.
   END TYPE EQUATIONS_SET_TYPE
   
   !>A buffer type to allow for an array of pointers to a EQUATIONS_SET_TYPE \see TYPES::EQUATIONS_SET_TYPE
@@ -2268,12 +2347,14 @@ END TYPE GENERATED_MESH_ELLIPSOID_TYPE
     INTEGER(INTG) :: GLOBAL_NUMBER !< The global number of this CellML model within the parent CellML environment.
     TYPE(VARYING_STRING) :: MODEL_ID !<The ID of the model.
     TYPE(C_PTR) :: PTR !< The handle for the actual C++ CellML model definition object
+    TYPE(C_FUNPTR) :: BATCH_RHS_ROUTINE !<The optional batched RHS routine that evaluates a block of cells laid out structure-of-arrays. C_NULL_FUNPTR if the model only has the per cell RHS routine. \see CMISS_CELLML::CellML_ModelBatchRHSRoutineSet
     INTEGER(INTG) :: NUMBER_OF_STATE !<The number of state variables in the CellML model.
     TYPE(VARYING_STRING), ALLOCATABLE :: STATE_VARIABLE_ID(:) !<STATE_VARIABLE_ID(state_variable_idx). The ID for the state_variable_idx'th state variable.
     INTEGER(INTG) :: NUMBER_OF_INTERMEDIATE !<The number of intermediate variables in the CellML model.
     TYPE(VARYING_STRING), ALLOCATABLE :: INTERMEDIATE_VARIABLE_ID(:) !<INTERMEDIATE_VARIABLE_ID(intermediate_variable_idx). The ID for the intermediate_variable_idx'th intermediate variable.
     INTEGER(INTG) :: NUMBER_OF_PARAMETERS !<The number of parameters in the CellML model.
     TYPE(VARYING_STRING), ALLOCATABLE :: PARAMETER_VARIABLE_ID(:) !<PARAMETER_VARIABLE_ID(parameter_variable_idx). The ID for the parameter_variable_idx'th parameter variable.
+    LOGICAL, ALLOCATABLE :: GATING_STATES(:) !<GATING_STATES(state_idx). Is .TRUE. if the state_idx'th state variable is a gating variable that can be integrated with a Rush-Larsen step, .FALSE. if not. Not allocated if the model has no gating variables. \see CMISS_CELLML::CellML_ModelGatingVariableSet
  END TYPE CELLML_MODEL_TYPE
 
   !>A buffer type to allow for an array of pointers to a CELLML_MODEL_TYPE
@@ -2544,6 +2625,11 @@ END TYPE GENERATED_MESH_ELLIPSOID_TYPE
   TYPE RUNGE_KUTTA_DAE_SOLVER_TYPE
     TYPE(DAE_SOLVER_TYPE), POINTER :: DAE_SOLVER !<A pointer to the differential-algebraic solver
     INTEGER(INTG) :: SOLVER_LIBRARY !<The library type for the Runge-Kutta differential-algebraic equation solver \see SOLVER_ROUTINES_SolverLibraries,SOLVER_ROUTINES
+    REAL(DP) :: ABSOLUTE_TOLERANCE !<The absolute tolerance for the local error of the embedded Dormand-Prince solution
+    REAL(DP) :: RELATIVE_TOLERANCE !<The relative tolerance for the local error of the embedded Dormand-Prince solution
+    INTEGER(LINTG) :: NUMBER_OF_RHS_EVALUATIONS !<The number of RHS evaluations in the last solve
+    INTEGER(LINTG) :: NUMBER_OF_ACCEPTED_STEPS !<The number of accepted steps in the last solve
+    INTEGER(LINTG) :: NUMBER_OF_REJECTED_STEPS !<The number of rejected steps in the last solve
   END TYPE RUNGE_KUTTA_DAE_SOLVER_TYPE
   
   !>Contains information for an Adams-Moulton differential-algebraic equation solver
@@ -2572,6 +2658,7 @@ END TYPE GENERATED_MESH_ELLIPSOID_TYPE
   TYPE RUSH_LARSON_DAE_SOLVER_TYPE
     TYPE(DAE_SOLVER_TYPE), POINTER :: DAE_SOLVER !<A pointer to the differential-algebraic solver
     INTEGER(INTG) :: SOLVER_LIBRARY !<The library type for the Rush-Larson differential-algebraic equation solver \see SOLVER_ROUTINES_SolverLibraries,SOLVER_ROUTINES
+    INTEGER(LINTG) :: NUMBER_OF_RHS_EVALUATIONS !<The number of RHS evaluations in the last solve
   END TYPE RUSH_LARSON_DAE_SOLVER_TYPE
   
   !>Contains information for an external differential-algebraic equation solver
@@ -2587,6 +2674,8 @@ END TYPE GENERATED_MESH_ELLIPSOID_TYPE
     REAL(DP) :: START_TIME !<The start time to integrate from
     REAL(DP) :: END_TIME !<The end time to integrate to
     REAL(DP) :: INITIAL_STEP !<The (initial) time step
+    INTEGER(INTG) :: NUMBER_OF_THREADS !<The number of OpenMP threads to use when integrating the DAE dofs
+    INTEGER(INTG) :: BATCH_SIZE !<The number of cells to integrate together in structure-of-arrays blocks. 0 if the dofs are integrated one at a time.
     TYPE(EULER_DAE_SOLVER_TYPE), POINTER :: EULER_SOLVER !<A pointer to information for an Euler solver
     TYPE(CRANK_NICOLSON_DAE_SOLVER_TYPE), POINTER :: CRANK_NICOLSON_SOLVER !<A pointer to information for a Crank-Nicholson solver
     TYPE(RUNGE_KUTTA_DAE_SOLVER_TYPE), POINTER :: RUNGE_KUTTA_SOLVER !<A pointer to information for a Runge-Kutta solver
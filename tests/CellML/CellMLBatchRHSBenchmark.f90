@@ -0,0 +1,381 @@
+!> \file
+!> \brief Benchmark comparing per dof and batched structure-of-arrays integration of a CellML model.
+!>
+!> \section LICENSE
+!>
+!> Version: MPL 1.1/GPL 2.0/LGPL 2.1
+!>
+!> The contents of this file are subject to the Mozilla Public License
+!> Version 1.1 (the "License"); you may not use this file except in
+!> compliance with the License. You may obtain a copy of the License at
+!> http://www.mozilla.org/MPL/
+!>
+!> Software distributed under the License is distributed on an "AS IS"
+!> basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+!> License for the specific language governing rights and limitations
+!> under the License.
+!>
+!> The Original Code is OpenCMISS
+!>
+!> The Initial Developer of the Original Code is University of Auckland,
+!> Auckland, New Zealand and University of Oxford, Oxford, United
+!> Kingdom. Portions created by the University of Auckland and University
+!> of Oxford are Copyright (C) 2007 by the University of Auckland and
+!> the University of Oxford. All Rights Reserved.
+!>
+!> Contributor(s):
+!>
+!> Alternatively, the contents of this file may be used under the terms of
+!> either the GNU General Public License Version 2 or later (the "GPL"), or
+!> the GNU Lesser General Public License Version 2.1 or later (the "LGPL"),
+!> in which case the provisions of the GPL or the LGPL are applicable instead
+!> of those above. If you wish to allow use of your version of this file only
+!> under the terms of either the GPL or the LGPL, and not to allow others to
+!> use your version of this file under the terms of the MPL, indicate your
+!> decision by deleting the provisions above and replace them with the notice
+!> and other provisions required by the GPL or the LGPL. If you do not delete
+!> the provisions above, a recipient may use your version of this file under
+!> the terms of any one of the MPL, the GPL or the LGPL.
+!>
+
+!> Main program
+PROGRAM CELLMLBATCHRHSBENCHMARK
+
+  USE OpenCMISS
+  USE OpenCMISS_Iron
+#ifndef NOMPIMOD
+  USE MPI
+#endif
+
+#ifdef WIN32
+  USE IFQWIN
+#endif
+
+  IMPLICIT NONE
+
+#ifdef NOMPIMOD
+#include "mpif.h"
+#endif
+
+  !Test program parameters
+
+  REAL(CMISSRP), PARAMETER :: WIDTH=1.0_CMISSRP
+  REAL(CMISSRP), PARAMETER :: HEIGHT=1.0_CMISSRP
+
+  INTEGER(CMISSIntg), PARAMETER :: CoordinateSystemUserNumber=1
+  INTEGER(CMISSIntg), PARAMETER :: RegionUserNumber=2
+  INTEGER(CMISSIntg), PARAMETER :: BasisUserNumber=3
+  INTEGER(CMISSIntg), PARAMETER :: GeneratedMeshUserNumber=4
+  INTEGER(CMISSIntg), PARAMETER :: MeshUserNumber=5
+  INTEGER(CMISSIntg), PARAMETER :: DecompositionUserNumber=6
+  INTEGER(CMISSIntg), PARAMETER :: GeometricFieldUserNumber=7
+  INTEGER(CMISSIntg), PARAMETER :: EquationsSetFieldUserNumber=8
+  INTEGER(CMISSIntg), PARAMETER :: DependentFieldUserNumber=9
+  INTEGER(CMISSIntg), PARAMETER :: MaterialsFieldUserNumber=10
+  INTEGER(CMISSIntg), PARAMETER :: CellMLUserNumber=11
+  INTEGER(CMISSIntg), PARAMETER :: CellMLModelsFieldUserNumber=12
+  INTEGER(CMISSIntg), PARAMETER :: CellMLStateFieldUserNumber=13
+  INTEGER(CMISSIntg), PARAMETER :: CellMLIntermediateFieldUserNumber=14
+  INTEGER(CMISSIntg), PARAMETER :: CellMLParametersFieldUserNumber=15
+  INTEGER(CMISSIntg), PARAMETER :: EquationsSetUserNumber=16
+  INTEGER(CMISSIntg), PARAMETER :: ProblemUserNumber=17
+
+  REAL(CMISSRP), PARAMETER :: ODE_TIME_STEP=0.00001_CMISSRP
+  REAL(CMISSRP), PARAMETER :: PDE_TIME_STEP=0.001_CMISSRP
+  REAL(CMISSRP), PARAMETER :: TIME_STOP=0.01_CMISSRP
+  REAL(CMISSRP), PARAMETER :: CONDUCTIVITY=0.1_CMISSRP
+  REAL(CMISSDP), PARAMETER :: TOLERANCE=1.0E-10_CMISSDP
+
+  !Program variables
+
+  INTEGER(CMISSIntg) :: NUMBER_OF_ARGUMENTS,ARGUMENT_LENGTH,STATUS
+  CHARACTER(LEN=255) :: COMMAND_ARGUMENT,CellmlFile
+  LOGICAL :: fileExist
+
+  INTEGER(CMISSIntg) :: NUMBER_GLOBAL_X_ELEMENTS,NUMBER_GLOBAL_Y_ELEMENTS,NUMBER_OF_CELLS,BATCH_SIZE,run_idx
+  INTEGER(CMISSIntg) :: n98ModelIndex
+  INTEGER(CMISSIntg) :: runBatchSizes(2)
+  REAL(CMISSDP) :: startTime,stopTime,cellsPerSecond(2),localDifference,maximumDifference
+  REAL(CMISSDP), POINTER :: dependentData(:),stateData(:)
+  REAL(CMISSDP), ALLOCATABLE :: initialDependent(:),initialStates(:),finalStates(:,:)
+
+  !CMISS variables
+
+  TYPE(cmfe_BasisType) :: Basis
+  TYPE(cmfe_BoundaryConditionsType) :: BoundaryConditions
+  TYPE(cmfe_CellMLType) :: CellML
+  TYPE(cmfe_CellMLEquationsType) :: CellMLEquations
+  TYPE(cmfe_ControlLoopType) :: ControlLoop
+  TYPE(cmfe_CoordinateSystemType) :: CoordinateSystem,WorldCoordinateSystem
+  TYPE(cmfe_DecompositionType) :: Decomposition
+  TYPE(cmfe_EquationsType) :: Equations
+  TYPE(cmfe_EquationsSetType) :: EquationsSet
+  TYPE(cmfe_FieldType) :: GeometricField,EquationsSetField,DependentField,MaterialsField
+  TYPE(cmfe_FieldType) :: CellMLModelsField,CellMLStateField,CellMLIntermediateField,CellMLParametersField
+  TYPE(cmfe_GeneratedMeshType) :: GeneratedMesh
+  TYPE(cmfe_MeshType) :: Mesh
+  TYPE(cmfe_ProblemType) :: Problem
+  TYPE(cmfe_RegionType) :: Region,WorldRegion
+  TYPE(cmfe_SolverType) :: Solver
+  TYPE(cmfe_SolverEquationsType) :: SolverEquations
+
+  !Generic CMISS variables
+
+  INTEGER(CMISSIntg) :: NumberOfComputationalNodes,ComputationalNodeNumber
+  INTEGER(CMISSIntg) :: EquationsSetIndex,CellMLIndex
+  INTEGER(CMISSIntg) :: Err
+
+  !Usage: CellMLBatchRHSBenchmark <CellML Model URL> [number of elements in each direction] [batch size]
+  NUMBER_GLOBAL_X_ELEMENTS=50
+  BATCH_SIZE=64
+  NUMBER_OF_ARGUMENTS=COMMAND_ARGUMENT_COUNT()
+  IF(NUMBER_OF_ARGUMENTS>=1) THEN
+    CALL GET_COMMAND_ARGUMENT(1,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    CellmlFile=ADJUSTL(COMMAND_ARGUMENT)
+    INQUIRE(FILE=CellmlFile,EXIST=fileExist)
+    IF(.NOT.fileExist) THEN
+      WRITE(*,'(">>ERROR: File does not exist")')
+      STOP 1
+    ENDIF
+  ELSE
+    WRITE(*,'(">>USAGE: ",A)') "CellMLBatchRHSBenchmark <CellML Model URL> [number of elements] [batch size]"
+    STOP 1
+  ENDIF
+  IF(NUMBER_OF_ARGUMENTS>=2) THEN
+    CALL GET_COMMAND_ARGUMENT(2,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    READ(COMMAND_ARGUMENT(1:ARGUMENT_LENGTH),*) NUMBER_GLOBAL_X_ELEMENTS
+  ENDIF
+  IF(NUMBER_OF_ARGUMENTS>=3) THEN
+    CALL GET_COMMAND_ARGUMENT(3,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    READ(COMMAND_ARGUMENT(1:ARGUMENT_LENGTH),*) BATCH_SIZE
+  ENDIF
+  NUMBER_GLOBAL_Y_ELEMENTS=NUMBER_GLOBAL_X_ELEMENTS
+  NUMBER_OF_CELLS=(NUMBER_GLOBAL_X_ELEMENTS+1)*(NUMBER_GLOBAL_Y_ELEMENTS+1)
+
+  !Intialise OpenCMISS
+  CALL cmfe_Initialise(WorldCoordinateSystem,WorldRegion,Err)
+  CALL cmfe_ErrorHandlingModeSet(CMFE_ERRORS_TRAP_ERROR,Err)
+  CALL cmfe_ComputationalNumberOfNodesGet(NumberOfComputationalNodes,Err)
+  CALL cmfe_ComputationalNodeNumberGet(ComputationalNodeNumber,Err)
+
+  !Create a 2D RC coordinate system, region, bilinear basis and mesh
+  CALL cmfe_CoordinateSystem_Initialise(CoordinateSystem,Err)
+  CALL cmfe_CoordinateSystem_CreateStart(CoordinateSystemUserNumber,CoordinateSystem,Err)
+  CALL cmfe_CoordinateSystem_DimensionSet(CoordinateSystem,2,Err)
+  CALL cmfe_CoordinateSystem_CreateFinish(CoordinateSystem,Err)
+
+  CALL cmfe_Region_Initialise(Region,Err)
+  CALL cmfe_Region_CreateStart(RegionUserNumber,WorldRegion,Region,Err)
+  CALL cmfe_Region_CoordinateSystemSet(Region,CoordinateSystem,Err)
+  CALL cmfe_Region_LabelSet(Region,"Region",Err)
+  CALL cmfe_Region_CreateFinish(Region,Err)
+
+  CALL cmfe_Basis_Initialise(Basis,Err)
+  CALL cmfe_Basis_CreateStart(BasisUserNumber,Basis,Err)
+  CALL cmfe_Basis_NumberOfXiSet(Basis,2,Err)
+  CALL cmfe_Basis_CreateFinish(Basis,Err)
+
+  CALL cmfe_GeneratedMesh_Initialise(GeneratedMesh,Err)
+  CALL cmfe_GeneratedMesh_CreateStart(GeneratedMeshUserNumber,Region,GeneratedMesh,Err)
+  CALL cmfe_GeneratedMesh_TypeSet(GeneratedMesh,CMFE_GENERATED_MESH_REGULAR_MESH_TYPE,Err)
+  CALL cmfe_GeneratedMesh_BasisSet(GeneratedMesh,Basis,Err)
+  CALL cmfe_GeneratedMesh_ExtentSet(GeneratedMesh,[WIDTH,HEIGHT],Err)
+  CALL cmfe_GeneratedMesh_NumberOfElementsSet(GeneratedMesh,[NUMBER_GLOBAL_X_ELEMENTS,NUMBER_GLOBAL_Y_ELEMENTS],Err)
+  CALL cmfe_Mesh_Initialise(Mesh,Err)
+  CALL cmfe_GeneratedMesh_CreateFinish(GeneratedMesh,MeshUserNumber,Mesh,Err)
+
+  CALL cmfe_Decomposition_Initialise(Decomposition,Err)
+  CALL cmfe_Decomposition_CreateStart(DecompositionUserNumber,Mesh,Decomposition,Err)
+  CALL cmfe_Decomposition_TypeSet(Decomposition,CMFE_DECOMPOSITION_CALCULATED_TYPE,Err)
+  CALL cmfe_Decomposition_NumberOfDomainsSet(Decomposition,NumberOfComputationalNodes,Err)
+  CALL cmfe_Decomposition_CreateFinish(Decomposition,Err)
+
+  CALL cmfe_Field_Initialise(GeometricField,Err)
+  CALL cmfe_Field_CreateStart(GeometricFieldUserNumber,Region,GeometricField,Err)
+  CALL cmfe_Field_MeshDecompositionSet(GeometricField,Decomposition,Err)
+  CALL cmfe_Field_ComponentMeshComponentSet(GeometricField,CMFE_FIELD_U_VARIABLE_TYPE,1,1,Err)
+  CALL cmfe_Field_ComponentMeshComponentSet(GeometricField,CMFE_FIELD_U_VARIABLE_TYPE,2,1,Err)
+  CALL cmfe_Field_CreateFinish(GeometricField,Err)
+  CALL cmfe_GeneratedMesh_GeometricParametersCalculate(GeneratedMesh,GeometricField,Err)
+
+  !Create the Monodomain equations set
+  CALL cmfe_EquationsSet_Initialise(EquationsSet,Err)
+  CALL cmfe_Field_Initialise(EquationsSetField,Err)
+  CALL cmfe_EquationsSet_CreateStart(EquationsSetUserNumber,Region,GeometricField,[CMFE_EQUATIONS_SET_BIOELECTRICS_CLASS, &
+    & CMFE_EQUATIONS_SET_MONODOMAIN_EQUATION_TYPE,CMFE_EQUATIONS_SET_NO_SUBTYPE],EquationsSetFieldUserNumber,EquationsSetField, &
+    & EquationsSet,Err)
+  CALL cmfe_EquationsSet_CreateFinish(EquationsSet,Err)
+
+  CALL cmfe_Field_Initialise(DependentField,Err)
+  CALL cmfe_EquationsSet_DependentCreateStart(EquationsSet,DependentFieldUserNumber,DependentField,Err)
+  CALL cmfe_EquationsSet_DependentCreateFinish(EquationsSet,Err)
+
+  CALL cmfe_Field_Initialise(MaterialsField,Err)
+  CALL cmfe_EquationsSet_MaterialsCreateStart(EquationsSet,MaterialsFieldUserNumber,MaterialsField,Err)
+  CALL cmfe_EquationsSet_MaterialsCreateFinish(EquationsSet,Err)
+  !Set Am, Cm and the conductivity
+  CALL cmfe_Field_ComponentValuesInitialise(MaterialsField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,1, &
+    & 193.6_CMISSRP,Err)
+  CALL cmfe_Field_ComponentValuesInitialise(MaterialsField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,2, &
+    & 0.014651_CMISSRP,Err)
+  CALL cmfe_Field_ComponentValuesInitialise(MaterialsField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,3, &
+    & CONDUCTIVITY,Err)
+  CALL cmfe_Field_ComponentValuesInitialise(MaterialsField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,4, &
+    & CONDUCTIVITY,Err)
+
+  !Create the CellML environment with a Noble 1998 model at every node
+  CALL cmfe_CellML_Initialise(CellML,Err)
+  CALL cmfe_CellML_CreateStart(CellMLUserNumber,Region,CellML,Err)
+  CALL cmfe_CellML_ModelImport(CellML,CellmlFile,n98ModelIndex,Err)
+  CALL cmfe_CellML_VariableSetAsKnown(CellML,n98ModelIndex,"membrane/IStim",Err)
+  CALL cmfe_CellML_VariableSetAsWanted(CellML,n98ModelIndex,"membrane/i_K1",Err)
+  CALL cmfe_CellML_VariableSetAsWanted(CellML,n98ModelIndex,"membrane/i_Na",Err)
+  CALL cmfe_CellML_CreateFinish(CellML,Err)
+
+  CALL cmfe_CellML_FieldMapsCreateStart(CellML,Err)
+  CALL cmfe_CellML_CreateFieldToCellMLMap(CellML,DependentField,CMFE_FIELD_U_VARIABLE_TYPE,1,CMFE_FIELD_VALUES_SET_TYPE, &
+    & n98ModelIndex,"membrane/V",CMFE_FIELD_VALUES_SET_TYPE,Err)
+  CALL cmfe_CellML_CreateCellMLToFieldMap(CellML,n98ModelIndex,"membrane/V",CMFE_FIELD_VALUES_SET_TYPE, &
+    & DependentField,CMFE_FIELD_U_VARIABLE_TYPE,1,CMFE_FIELD_VALUES_SET_TYPE,Err)
+  CALL cmfe_CellML_FieldMapsCreateFinish(CellML,Err)
+  CALL cmfe_Field_ComponentValuesInitialise(DependentField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,1, &
+    & -92.5_CMISSRP,Err)
+
+  CALL cmfe_Field_Initialise(CellMLModelsField,Err)
+  CALL cmfe_CellML_ModelsFieldCreateStart(CellML,CellMLModelsFieldUserNumber,CellMLModelsField,Err)
+  CALL cmfe_CellML_ModelsFieldCreateFinish(CellML,Err)
+  CALL cmfe_Field_Initialise(CellMLStateField,Err)
+  CALL cmfe_CellML_StateFieldCreateStart(CellML,CellMLStateFieldUserNumber,CellMLStateField,Err)
+  CALL cmfe_CellML_StateFieldCreateFinish(CellML,Err)
+  CALL cmfe_Field_Initialise(CellMLIntermediateField,Err)
+  CALL cmfe_CellML_IntermediateFieldCreateStart(CellML,CellMLIntermediateFieldUserNumber,CellMLIntermediateField,Err)
+  CALL cmfe_CellML_IntermediateFieldCreateFinish(CellML,Err)
+  CALL cmfe_Field_Initialise(CellMLParametersField,Err)
+  CALL cmfe_CellML_ParametersFieldCreateStart(CellML,CellMLParametersFieldUserNumber,CellMLParametersField,Err)
+  CALL cmfe_CellML_ParametersFieldCreateFinish(CellML,Err)
+
+  CALL cmfe_Equations_Initialise(Equations,Err)
+  CALL cmfe_EquationsSet_EquationsCreateStart(EquationsSet,Equations,Err)
+  CALL cmfe_Equations_SparsityTypeSet(Equations,CMFE_EQUATIONS_SPARSE_MATRICES,Err)
+  CALL cmfe_Equations_OutputTypeSet(Equations,CMFE_EQUATIONS_NO_OUTPUT,Err)
+  CALL cmfe_EquationsSet_EquationsCreateFinish(EquationsSet,Err)
+
+  !Create a Gudunov split Monodomain problem
+  CALL cmfe_Problem_Initialise(Problem,Err)
+  CALL cmfe_Problem_CreateStart(ProblemUserNumber,[CMFE_PROBLEM_BIOELECTRICS_CLASS,CMFE_PROBLEM_MONODOMAIN_EQUATION_TYPE, &
+    & CMFE_PROBLEM_MONODOMAIN_GUDUNOV_SPLIT_SUBTYPE],Problem,Err)
+  CALL cmfe_Problem_CreateFinish(Problem,Err)
+
+  CALL cmfe_Problem_ControlLoopCreateStart(Problem,Err)
+  CALL cmfe_ControlLoop_Initialise(ControlLoop,Err)
+  CALL cmfe_Problem_ControlLoopGet(Problem,CMFE_CONTROL_LOOP_NODE,ControlLoop,Err)
+  CALL cmfe_ControlLoop_TimesSet(ControlLoop,0.0_CMISSRP,TIME_STOP,PDE_TIME_STEP,Err)
+  CALL cmfe_ControlLoop_OutputTypeSet(ControlLoop,CMFE_CONTROL_LOOP_NO_OUTPUT,Err)
+  CALL cmfe_Problem_ControlLoopCreateFinish(Problem,Err)
+
+  CALL cmfe_Problem_SolversCreateStart(Problem,Err)
+  CALL cmfe_Solver_Initialise(Solver,Err)
+  CALL cmfe_Problem_SolverGet(Problem,CMFE_CONTROL_LOOP_NODE,1,Solver,Err)
+  CALL cmfe_Solver_DAETimeStepSet(Solver,ODE_TIME_STEP,Err)
+  CALL cmfe_Solver_OutputTypeSet(Solver,CMFE_SOLVER_NO_OUTPUT,Err)
+  CALL cmfe_Solver_Initialise(Solver,Err)
+  CALL cmfe_Problem_SolverGet(Problem,CMFE_CONTROL_LOOP_NODE,2,Solver,Err)
+  CALL cmfe_Solver_OutputTypeSet(Solver,CMFE_SOLVER_NO_OUTPUT,Err)
+  CALL cmfe_Problem_SolversCreateFinish(Problem,Err)
+
+  CALL cmfe_Problem_CellMLEquationsCreateStart(Problem,Err)
+  CALL cmfe_Solver_Initialise(Solver,Err)
+  CALL cmfe_Problem_SolverGet(Problem,CMFE_CONTROL_LOOP_NODE,1,Solver,Err)
+  CALL cmfe_CellMLEquations_Initialise(CellMLEquations,Err)
+  CALL cmfe_Solver_CellMLEquationsGet(Solver,CellMLEquations,Err)
+  CALL cmfe_CellMLEquations_CellMLAdd(CellMLEquations,CellML,CellMLIndex,Err)
+  CALL cmfe_Problem_CellMLEquationsCreateFinish(Problem,Err)
+
+  CALL cmfe_Problem_SolverEquationsCreateStart(Problem,Err)
+  CALL cmfe_Solver_Initialise(Solver,Err)
+  CALL cmfe_Problem_SolverGet(Problem,CMFE_CONTROL_LOOP_NODE,2,Solver,Err)
+  CALL cmfe_SolverEquations_Initialise(SolverEquations,Err)
+  CALL cmfe_Solver_SolverEquationsGet(Solver,SolverEquations,Err)
+  CALL cmfe_SolverEquations_SparsityTypeSet(SolverEquations,CMFE_SOLVER_SPARSE_MATRICES,Err)
+  CALL cmfe_SolverEquations_EquationsSetAdd(SolverEquations,EquationsSet,EquationsSetIndex,Err)
+  CALL cmfe_Problem_SolverEquationsCreateFinish(Problem,Err)
+
+  CALL cmfe_BoundaryConditions_Initialise(BoundaryConditions,Err)
+  CALL cmfe_SolverEquations_BoundaryConditionsCreateStart(SolverEquations,BoundaryConditions,Err)
+  CALL cmfe_SolverEquations_BoundaryConditionsCreateFinish(SolverEquations,Err)
+
+  !Keep the initial conditions so that both runs start from the same state
+  NULLIFY(dependentData)
+  CALL cmfe_Field_ParameterSetDataGet(DependentField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,dependentData,Err)
+  ALLOCATE(initialDependent(SIZE(dependentData)))
+  initialDependent=dependentData
+  CALL cmfe_Field_ParameterSetDataRestore(DependentField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,dependentData,Err)
+  NULLIFY(stateData)
+  CALL cmfe_Field_ParameterSetDataGet(CellMLStateField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,stateData,Err)
+  ALLOCATE(initialStates(SIZE(stateData)))
+  ALLOCATE(finalStates(SIZE(stateData),2))
+  initialStates=stateData
+  CALL cmfe_Field_ParameterSetDataRestore(CellMLStateField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,stateData,Err)
+
+  !Solve with the per dof integration and then with batches of cells
+  CALL cmfe_Solver_Initialise(Solver,Err)
+  CALL cmfe_Problem_SolverGet(Problem,CMFE_CONTROL_LOOP_NODE,1,Solver,Err)
+  runBatchSizes=[0,BATCH_SIZE]
+  DO run_idx=1,2
+    CALL cmfe_Solver_DAEBatchSizeSet(Solver,runBatchSizes(run_idx),Err)
+    !Reset the dependent and state fields to the initial conditions
+    CALL cmfe_Field_ParameterSetDataGet(DependentField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,dependentData,Err)
+    dependentData=initialDependent
+    CALL cmfe_Field_ParameterSetDataRestore(DependentField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE, &
+      & dependentData,Err)
+    CALL cmfe_Field_ParameterSetUpdateStart(DependentField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,Err)
+    CALL cmfe_Field_ParameterSetUpdateFinish(DependentField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,Err)
+    CALL cmfe_Field_ParameterSetDataGet(CellMLStateField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,stateData,Err)
+    stateData=initialStates
+    CALL cmfe_Field_ParameterSetDataRestore(CellMLStateField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE, &
+      & stateData,Err)
+    CALL cmfe_Field_ParameterSetUpdateStart(CellMLStateField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,Err)
+    CALL cmfe_Field_ParameterSetUpdateFinish(CellMLStateField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,Err)
+    CALL MPI_BARRIER(MPI_COMM_WORLD,Err)
+    startTime=MPI_WTIME()
+    CALL cmfe_Problem_Solve(Problem,Err)
+    CALL MPI_BARRIER(MPI_COMM_WORLD,Err)
+    stopTime=MPI_WTIME()
+    !The DAE solver integrates every cell over each PDE time step using the ODE time step
+    cellsPerSecond(run_idx)=REAL(NUMBER_OF_CELLS,CMISSDP)*NINT(TIME_STOP/ODE_TIME_STEP,CMISSIntg)/(stopTime-startTime)
+    CALL cmfe_Field_ParameterSetDataGet(CellMLStateField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,stateData,Err)
+    finalStates(:,run_idx)=stateData
+    CALL cmfe_Field_ParameterSetDataRestore(CellMLStateField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE, &
+      & stateData,Err)
+  ENDDO !run_idx
+
+  !The batched integration must give the same states as the per dof integration
+  localDifference=0.0_CMISSDP
+  IF(SIZE(finalStates,1)>0) localDifference=MAXVAL(ABS(finalStates(:,2)-finalStates(:,1))/ &
+    & MAX(1.0_CMISSDP,ABS(finalStates(:,1))))
+  CALL MPI_ALLREDUCE(localDifference,maximumDifference,1,MPI_DOUBLE_PRECISION,MPI_MAX,MPI_COMM_WORLD,Err)
+
+  IF(ComputationalNodeNumber==0) THEN
+    WRITE(*,'("Number of cells: ",I0,", batch size: ",I0)') NUMBER_OF_CELLS,BATCH_SIZE
+    WRITE(*,'("Per dof integration:     ",ES12.4," cell steps per second")') cellsPerSecond(1)
+    WRITE(*,'("Batched integration:     ",ES12.4," cell steps per second")') cellsPerSecond(2)
+    WRITE(*,'("Speedup:                 ",F8.3)') cellsPerSecond(2)/cellsPerSecond(1)
+    WRITE(*,'("Maximum state difference:",ES12.4)') maximumDifference
+  ENDIF
+  IF(maximumDifference>TOLERANCE) THEN
+    IF(ComputationalNodeNumber==0) WRITE(*,'(">>ERROR: The batched and per dof states differ by more than ",ES12.4)') &
+      & TOLERANCE
+    CALL cmfe_Finalise(Err)
+    STOP 1
+  ENDIF
+  DEALLOCATE(initialDependent)
+  DEALLOCATE(initialStates)
+  DEALLOCATE(finalStates)
+
+  CALL cmfe_Finalise(Err)
+
+  WRITE(*,'(A)') "Program successfully completed."
+
+  STOP
+
+END PROGRAM CELLMLBATCHRHSBENCHMARK
@@ -0,0 +1,336 @@
+!> \file
+!> \brief This is a test program that checks the threaded finite element assembly of a nonlinear Poisson equation against the single threaded assembly using OpenCMISS calls.
+!>
+!> \section LICENSE
+!>
+!> Version: MPL 1.1/GPL 2.0/LGPL 2.1
+!>
+!> The contents of this file are subject to the Mozilla Public License
+!> Version 1.1 (the "License"); you may not use this file except in
+!> compliance with the License. You may obtain a copy of the License at
+!> http://www.mozilla.org/MPL/
+!>
+!> Software distributed under the License is distributed on an "AS IS"
+!> basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+!> License for the specific language governing rights and limitations
+!> under the License.
+!>
+!> The Original Code is OpenCMISS
+!>
+!> The Initial Developer of the Original Code is University of Auckland,
+!> Auckland, New Zealand and University of Oxford, Oxford, United
+!> Kingdom. Portions created by the University of Auckland and University
+!> of Oxford are Copyright (C) 2007 by the University of Auckland and
+!> the University of Oxford. All Rights Reserved.
+!>
+!> Contributor(s):
+!>
+!> Alternatively, the contents of this file may be used under the terms of
+!> either the GNU General Public License Version 2 or later (the "GPL"), or
+!> the GNU Lesser General Public License Version 2.1 or later (the "LGPL"),
+!> in which case the provisions of the GPL or the LGPL are applicable instead
+!> of those above. If you wish to allow use of your version of this file only
+!> under the terms of either the GPL or the LGPL, and not to allow others to
+!> use your version of this file under the terms of the MPL, indicate your
+!> decision by deleting the provisions above and replace them with the notice
+!> and other provisions required by the GPL or the LGPL. If you do not delete
+!> the provisions above, a recipient may use your version of this file under
+!> the terms of any one of the MPL, the GPL or the LGPL.
+!>
+
+!> Main program
+PROGRAM THREADEDASSEMBLY
+
+  USE OpenCMISS
+  USE OpenCMISS_Iron
+#ifndef NOMPIMOD
+  USE MPI
+#endif
+
+#ifdef WIN32
+  USE IFQWIN
+#endif
+
+  IMPLICIT NONE
+
+#ifdef NOMPIMOD
+#include "mpif.h"
+#endif
+
+  !Test program parameters
+
+  REAL(CMISSRP), PARAMETER :: HEIGHT=0.5_CMISSRP
+  REAL(CMISSRP), PARAMETER :: WIDTH=0.5_CMISSRP
+  REAL(CMISSRP), PARAMETER :: TOLERANCE=1.0E-8_CMISSRP
+
+  INTEGER(CMISSIntg), PARAMETER :: CoordinateSystemUserNumber=1
+  INTEGER(CMISSIntg), PARAMETER :: BasisUserNumber=2
+  INTEGER(CMISSIntg), PARAMETER :: GeneratedMeshUserNumber=3
+  INTEGER(CMISSIntg), PARAMETER :: MeshUserNumber=4
+  INTEGER(CMISSIntg), PARAMETER :: DecompositionUserNumber=5
+  INTEGER(CMISSIntg), PARAMETER :: GeometricFieldUserNumber=6
+  INTEGER(CMISSIntg), PARAMETER :: DependentFieldUserNumber=7
+  INTEGER(CMISSIntg), PARAMETER :: MaterialsFieldUserNumber=8
+  INTEGER(CMISSIntg), PARAMETER :: AnalyticFieldUserNumber=9
+  INTEGER(CMISSIntg), PARAMETER :: EquationsSetUserNumber=10
+  INTEGER(CMISSIntg), PARAMETER :: EquationsSetFieldUserNumber=11
+  !The region and problem of each assembly are numbered from these
+  INTEGER(CMISSIntg), PARAMETER :: RegionUserNumber=20
+  INTEGER(CMISSIntg), PARAMETER :: ProblemUserNumber=30
+
+  !Program variables
+
+  INTEGER(CMISSIntg) :: NUMBER_GLOBAL_X_ELEMENTS,NUMBER_GLOBAL_Y_ELEMENTS,NUMBER_OF_THREADS
+  INTEGER(CMISSIntg) :: NUMBER_OF_ARGUMENTS,ARGUMENT_LENGTH,STATUS
+  CHARACTER(LEN=255) :: COMMAND_ARGUMENT
+
+  REAL(CMISSRP) :: jacobianDifference,residualDifference,jacobianScale,residualScale
+  REAL(CMISSRP) :: localDifferences(2),maxDifferences(2),localScales(2),maxScales(2)
+  REAL(CMISSRP), ALLOCATABLE :: serialJacobian(:),serialResidual(:),threadedJacobian(:),threadedResidual(:)
+  LOGICAL :: sizesMatch,allSizesMatch
+
+  !CMISS variables
+
+  TYPE(cmfe_BasisType) :: Basis
+  TYPE(cmfe_CoordinateSystemType) :: CoordinateSystem,WorldCoordinateSystem
+  TYPE(cmfe_RegionType) :: WorldRegion
+
+  !Generic CMISS variables
+
+  INTEGER(CMISSIntg) :: Err
+  INTEGER(CMISSIntg) :: NumberOfComputationalNodes,ComputationalNodeNumber
+
+  !Usage: ThreadedAssembly [number of X elements] [number of Y elements] [number of threads]
+  NUMBER_GLOBAL_X_ELEMENTS=8
+  NUMBER_GLOBAL_Y_ELEMENTS=8
+  NUMBER_OF_THREADS=4
+  NUMBER_OF_ARGUMENTS=COMMAND_ARGUMENT_COUNT()
+  IF(NUMBER_OF_ARGUMENTS>=3) THEN
+    CALL GET_COMMAND_ARGUMENT(1,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    IF(STATUS>0) CALL HANDLE_ERROR("Error for command argument 1.")
+    READ(COMMAND_ARGUMENT(1:ARGUMENT_LENGTH),*) NUMBER_GLOBAL_X_ELEMENTS
+    IF(NUMBER_GLOBAL_X_ELEMENTS<=0) CALL HANDLE_ERROR("Invalid number of X elements.")
+    CALL GET_COMMAND_ARGUMENT(2,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    IF(STATUS>0) CALL HANDLE_ERROR("Error for command argument 2.")
+    READ(COMMAND_ARGUMENT(1:ARGUMENT_LENGTH),*) NUMBER_GLOBAL_Y_ELEMENTS
+    IF(NUMBER_GLOBAL_Y_ELEMENTS<=0) CALL HANDLE_ERROR("Invalid number of Y elements.")
+    CALL GET_COMMAND_ARGUMENT(3,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    IF(STATUS>0) CALL HANDLE_ERROR("Error for command argument 3.")
+    READ(COMMAND_ARGUMENT(1:ARGUMENT_LENGTH),*) NUMBER_OF_THREADS
+    IF(NUMBER_OF_THREADS<=1) CALL HANDLE_ERROR("Invalid number of threads.")
+  ENDIF
+
+  !Intialise OpenCMISS
+  CALL cmfe_Initialise(WorldCoordinateSystem,WorldRegion,Err)
+  CALL cmfe_ErrorHandlingModeSet(CMFE_ERRORS_TRAP_ERROR,Err)
+  CALL cmfe_ComputationalNumberOfNodesGet(NumberOfComputationalNodes,Err)
+  CALL cmfe_ComputationalNodeNumberGet(ComputationalNodeNumber,Err)
+
+  !The coordinate system and basis are shared by both assemblies
+  CALL cmfe_CoordinateSystem_Initialise(CoordinateSystem,Err)
+  CALL cmfe_CoordinateSystem_CreateStart(CoordinateSystemUserNumber,CoordinateSystem,Err)
+  CALL cmfe_CoordinateSystem_DimensionSet(CoordinateSystem,2,Err)
+  CALL cmfe_CoordinateSystem_CreateFinish(CoordinateSystem,Err)
+
+  CALL cmfe_Basis_Initialise(Basis,Err)
+  CALL cmfe_Basis_CreateStart(BasisUserNumber,Basis,Err)
+  CALL cmfe_Basis_NumberOfXiSet(Basis,2,Err)
+  CALL cmfe_Basis_InterpolationXiSet(Basis,[CMFE_BASIS_LINEAR_LAGRANGE_INTERPOLATION, &
+    & CMFE_BASIS_LINEAR_LAGRANGE_INTERPOLATION],Err)
+  CALL cmfe_Basis_CreateFinish(Basis,Err)
+
+  !Solve the same problem assembled on one thread and on several threads
+  CALL SOLVE_POISSON(1,1,serialJacobian,serialResidual)
+  CALL SOLVE_POISSON(2,NUMBER_OF_THREADS,threadedJacobian,threadedResidual)
+
+  !The elements are added in a different order so the values can differ by rounding errors
+  sizesMatch=SIZE(serialJacobian,1)==SIZE(threadedJacobian,1).AND.SIZE(serialResidual,1)==SIZE(threadedResidual,1)
+  CALL MPI_ALLREDUCE(sizesMatch,allSizesMatch,1,MPI_LOGICAL,MPI_LAND,MPI_COMM_WORLD,Err)
+  IF(.NOT.allSizesMatch) CALL CHECK_FAILED("The threaded and single threaded equations matrices have different sizes.")
+  localDifferences=0.0_CMISSRP
+  localScales=0.0_CMISSRP
+  IF(SIZE(serialJacobian,1)>0) THEN
+    localDifferences(1)=MAXVAL(ABS(threadedJacobian-serialJacobian))
+    localScales(1)=MAXVAL(ABS(serialJacobian))
+  ENDIF
+  IF(SIZE(serialResidual,1)>0) THEN
+    localDifferences(2)=MAXVAL(ABS(threadedResidual-serialResidual))
+    localScales(2)=MAXVAL(ABS(serialResidual))
+  ENDIF
+  CALL MPI_ALLREDUCE(localDifferences,maxDifferences,2,MPI_DOUBLE_PRECISION,MPI_MAX,MPI_COMM_WORLD,Err)
+  CALL MPI_ALLREDUCE(localScales,maxScales,2,MPI_DOUBLE_PRECISION,MPI_MAX,MPI_COMM_WORLD,Err)
+  jacobianDifference=maxDifferences(1)
+  residualDifference=maxDifferences(2)
+  jacobianScale=MAX(maxScales(1),1.0_CMISSRP)
+  residualScale=MAX(maxScales(2),1.0_CMISSRP)
+
+  IF(ComputationalNodeNumber==0) THEN
+    WRITE(*,'("Number of assembly threads: ",I0)') NUMBER_OF_THREADS
+    WRITE(*,'("Maximum Jacobian difference: ",ES12.4)') jacobianDifference
+    WRITE(*,'("Maximum residual difference: ",ES12.4)') residualDifference
+  ENDIF
+  IF(jacobianDifference>TOLERANCE*jacobianScale) &
+    & CALL CHECK_FAILED("The threaded Jacobian does not match the single threaded Jacobian.")
+  IF(residualDifference>TOLERANCE*residualScale) &
+    & CALL CHECK_FAILED("The threaded residual does not match the single threaded residual.")
+
+  !Finialise CMISS
+  CALL cmfe_Finalise(Err)
+
+  WRITE(*,'(A)') "Program successfully completed."
+
+  STOP
+
+CONTAINS
+
+  !Sets up and solves the nonlinear Poisson problem in a new region and returns this rank's equations Jacobian and residual values
+  SUBROUTINE SOLVE_POISSON(RUN_NUMBER,NUMBER_OF_ASSEMBLY_THREADS,JACOBIAN_VALUES,RESIDUAL_VALUES)
+
+    INTEGER(CMISSIntg), INTENT(IN) :: RUN_NUMBER
+    INTEGER(CMISSIntg), INTENT(IN) :: NUMBER_OF_ASSEMBLY_THREADS
+    REAL(CMISSRP), ALLOCATABLE, INTENT(OUT) :: JACOBIAN_VALUES(:)
+    REAL(CMISSRP), ALLOCATABLE, INTENT(OUT) :: RESIDUAL_VALUES(:)
+
+    REAL(CMISSRP), POINTER :: data(:)
+    INTEGER(CMISSIntg) :: EquationsSetIndex
+    TYPE(cmfe_BoundaryConditionsType) :: BoundaryConditions
+    TYPE(cmfe_DecompositionType) :: Decomposition
+    TYPE(cmfe_DistributedMatrixType) :: JacobianMatrix
+    TYPE(cmfe_DistributedVectorType) :: ResidualVector
+    TYPE(cmfe_EquationsType) :: Equations
+    TYPE(cmfe_EquationsSetType) :: EquationsSet
+    TYPE(cmfe_FieldType) :: GeometricField,DependentField,MaterialsField,AnalyticField,EquationsSetField
+    TYPE(cmfe_GeneratedMeshType) :: GeneratedMesh
+    TYPE(cmfe_MeshType) :: Mesh
+    TYPE(cmfe_ProblemType) :: Problem
+    TYPE(cmfe_RegionType) :: Region
+    TYPE(cmfe_SolverType) :: Solver,LinearSolver
+    TYPE(cmfe_SolverEquationsType) :: SolverEquations
+
+    CALL cmfe_Region_Initialise(Region,Err)
+    CALL cmfe_Region_CreateStart(RegionUserNumber+RUN_NUMBER,WorldRegion,Region,Err)
+    CALL cmfe_Region_CoordinateSystemSet(Region,CoordinateSystem,Err)
+    CALL cmfe_Region_CreateFinish(Region,Err)
+
+    CALL cmfe_GeneratedMesh_Initialise(GeneratedMesh,Err)
+    CALL cmfe_GeneratedMesh_CreateStart(GeneratedMeshUserNumber,Region,GeneratedMesh,Err)
+    CALL cmfe_GeneratedMesh_TypeSet(GeneratedMesh,CMFE_GENERATED_MESH_REGULAR_MESH_TYPE,Err)
+    CALL cmfe_GeneratedMesh_BasisSet(GeneratedMesh,Basis,Err)
+    CALL cmfe_GeneratedMesh_ExtentSet(GeneratedMesh,[WIDTH,HEIGHT],Err)
+    CALL cmfe_GeneratedMesh_NumberOfElementsSet(GeneratedMesh,[NUMBER_GLOBAL_X_ELEMENTS,NUMBER_GLOBAL_Y_ELEMENTS],Err)
+    CALL cmfe_Mesh_Initialise(Mesh,Err)
+    CALL cmfe_GeneratedMesh_CreateFinish(GeneratedMesh,MeshUserNumber,Mesh,Err)
+
+    CALL cmfe_Decomposition_Initialise(Decomposition,Err)
+    CALL cmfe_Decomposition_CreateStart(DecompositionUserNumber,Mesh,Decomposition,Err)
+    CALL cmfe_Decomposition_TypeSet(Decomposition,CMFE_DECOMPOSITION_CALCULATED_TYPE,Err)
+    CALL cmfe_Decomposition_NumberOfDomainsSet(Decomposition,NumberOfComputationalNodes,Err)
+    CALL cmfe_Decomposition_CreateFinish(Decomposition,Err)
+
+    CALL cmfe_Field_Initialise(GeometricField,Err)
+    CALL cmfe_Field_CreateStart(GeometricFieldUserNumber,Region,GeometricField,Err)
+    CALL cmfe_Field_MeshDecompositionSet(GeometricField,Decomposition,Err)
+    CALL cmfe_Field_ComponentMeshComponentSet(GeometricField,CMFE_FIELD_U_VARIABLE_TYPE,1,1,Err)
+    CALL cmfe_Field_ComponentMeshComponentSet(GeometricField,CMFE_FIELD_U_VARIABLE_TYPE,2,1,Err)
+    CALL cmfe_Field_CreateFinish(GeometricField,Err)
+    CALL cmfe_GeneratedMesh_GeometricParametersCalculate(GeneratedMesh,GeometricField,Err)
+
+    CALL cmfe_EquationsSet_Initialise(EquationsSet,Err)
+    CALL cmfe_Field_Initialise(EquationsSetField,Err)
+    CALL cmfe_EquationsSet_CreateStart(EquationsSetUserNumber,Region,GeometricField,[CMFE_EQUATIONS_SET_CLASSICAL_FIELD_CLASS, &
+      & CMFE_EQUATIONS_SET_POISSON_EQUATION_TYPE,CMFE_EQUATIONS_SET_EXPONENTIAL_SOURCE_POISSON_SUBTYPE], &
+      & EquationsSetFieldUserNumber,EquationsSetField,EquationsSet,Err)
+    CALL cmfe_EquationsSet_CreateFinish(EquationsSet,Err)
+
+    CALL cmfe_Field_Initialise(DependentField,Err)
+    CALL cmfe_EquationsSet_DependentCreateStart(EquationsSet,DependentFieldUserNumber,DependentField,Err)
+    CALL cmfe_EquationsSet_DependentCreateFinish(EquationsSet,Err)
+    CALL cmfe_Field_ComponentValuesInitialise(DependentField,CMFE_FIELD_U_VARIABLE_TYPE,CMFE_FIELD_VALUES_SET_TYPE,1, &
+      & 0.0_CMISSRP,Err)
+
+    CALL cmfe_Field_Initialise(MaterialsField,Err)
+    CALL cmfe_EquationsSet_MaterialsCreateStart(EquationsSet,MaterialsFieldUserNumber,MaterialsField,Err)
+    CALL cmfe_EquationsSet_MaterialsCreateFinish(EquationsSet,Err)
+
+    CALL cmfe_Field_Initialise(AnalyticField,Err)
+    CALL cmfe_EquationsSet_AnalyticCreateStart(EquationsSet,CMFE_EQUATIONS_SET_POISSON_EQUATION_TWO_DIM_1, &
+      & AnalyticFieldUserNumber,AnalyticField,Err)
+    CALL cmfe_EquationsSet_AnalyticCreateFinish(EquationsSet,Err)
+
+    CALL cmfe_Equations_Initialise(Equations,Err)
+    CALL cmfe_EquationsSet_EquationsCreateStart(EquationsSet,Equations,Err)
+    CALL cmfe_Equations_SparsityTypeSet(Equations,CMFE_EQUATIONS_SPARSE_MATRICES,Err)
+    CALL cmfe_Equations_OutputTypeSet(Equations,CMFE_EQUATIONS_NO_OUTPUT,Err)
+    CALL cmfe_EquationsSet_EquationsCreateFinish(EquationsSet,Err)
+    CALL cmfe_EquationsSet_AssemblyThreadsSet(EquationsSet,NUMBER_OF_ASSEMBLY_THREADS,Err)
+
+    CALL cmfe_Problem_Initialise(Problem,Err)
+    CALL cmfe_Problem_CreateStart(ProblemUserNumber+RUN_NUMBER,[CMFE_PROBLEM_CLASSICAL_FIELD_CLASS, &
+      & CMFE_PROBLEM_POISSON_EQUATION_TYPE,CMFE_PROBLEM_NONLINEAR_SOURCE_POISSON_SUBTYPE],Problem,Err)
+    CALL cmfe_Problem_CreateFinish(Problem,Err)
+    CALL cmfe_Problem_ControlLoopCreateStart(Problem,Err)
+    CALL cmfe_Problem_ControlLoopCreateFinish(Problem,Err)
+
+    CALL cmfe_Solver_Initialise(Solver,Err)
+    CALL cmfe_Solver_Initialise(LinearSolver,Err)
+    CALL cmfe_Problem_SolversCreateStart(Problem,Err)
+    CALL cmfe_Problem_SolverGet(Problem,CMFE_CONTROL_LOOP_NODE,1,Solver,Err)
+    CALL cmfe_Solver_OutputTypeSet(Solver,CMFE_SOLVER_NO_OUTPUT,Err)
+    CALL cmfe_Solver_NewtonJacobianCalculationTypeSet(Solver,CMFE_SOLVER_NEWTON_JACOBIAN_EQUATIONS_CALCULATED,Err)
+    CALL cmfe_Solver_NewtonLinearSolverGet(Solver,LinearSolver,Err)
+    CALL cmfe_Solver_LinearIterativeMaximumIterationsSet(LinearSolver,500,Err)
+    CALL cmfe_Problem_SolversCreateFinish(Problem,Err)
+
+    CALL cmfe_Solver_Initialise(Solver,Err)
+    CALL cmfe_SolverEquations_Initialise(SolverEquations,Err)
+    CALL cmfe_Problem_SolverEquationsCreateStart(Problem,Err)
+    CALL cmfe_Problem_SolverGet(Problem,CMFE_CONTROL_LOOP_NODE,1,Solver,Err)
+    CALL cmfe_Solver_SolverEquationsGet(Solver,SolverEquations,Err)
+    CALL cmfe_SolverEquations_SparsityTypeSet(SolverEquations,CMFE_SOLVER_SPARSE_MATRICES,Err)
+    CALL cmfe_SolverEquations_EquationsSetAdd(SolverEquations,EquationsSet,EquationsSetIndex,Err)
+    CALL cmfe_Problem_SolverEquationsCreateFinish(Problem,Err)
+
+    CALL cmfe_BoundaryConditions_Initialise(BoundaryConditions,Err)
+    CALL cmfe_SolverEquations_BoundaryConditionsCreateStart(SolverEquations,BoundaryConditions,Err)
+    CALL cmfe_SolverEquations_BoundaryConditionsAnalytic(SolverEquations,Err)
+    CALL cmfe_SolverEquations_BoundaryConditionsCreateFinish(SolverEquations,Err)
+
+    CALL cmfe_Problem_Solve(Problem,Err)
+
+    !Copy out the equations Jacobian and residual from the last Newton iteration
+    CALL cmfe_DistributedMatrix_Initialise(JacobianMatrix,Err)
+    CALL cmfe_Equations_JacobianMatrixGet(Equations,1,CMFE_FIELD_U_VARIABLE_TYPE,JacobianMatrix,Err)
+    CALL cmfe_DistributedMatrix_DataGet(JacobianMatrix,data,Err)
+    ALLOCATE(JACOBIAN_VALUES(SIZE(data,1)))
+    JACOBIAN_VALUES=data
+    CALL cmfe_DistributedMatrix_DataRestore(JacobianMatrix,data,Err)
+    CALL cmfe_DistributedVector_Initialise(ResidualVector,Err)
+    CALL cmfe_Equations_ResidualVectorGet(Equations,1,ResidualVector,Err)
+    CALL cmfe_DistributedVector_DataGet(ResidualVector,data,Err)
+    ALLOCATE(RESIDUAL_VALUES(SIZE(data,1)))
+    RESIDUAL_VALUES=data
+    CALL cmfe_DistributedVector_DataRestore(ResidualVector,data,Err)
+
+  END SUBROUTINE SOLVE_POISSON
+
+  SUBROUTINE HANDLE_ERROR(ERROR_STRING)
+
+    CHARACTER(LEN=*), INTENT(IN) :: ERROR_STRING
+
+    WRITE(*,'(">>ERROR: ",A)') ERROR_STRING(1:LEN_TRIM(ERROR_STRING))
+    STOP
+
+  END SUBROUTINE HANDLE_ERROR
+
+  !Reports a failed comparison on the first rank and fails the test on all ranks
+  SUBROUTINE CHECK_FAILED(ERROR_STRING)
+
+    CHARACTER(LEN=*), INTENT(IN) :: ERROR_STRING
+
+    IF(ComputationalNodeNumber==0) WRITE(*,'(">>ERROR: ",A)') ERROR_STRING(1:LEN_TRIM(ERROR_STRING))
+    CALL cmfe_Finalise(Err)
+    STOP 1
+
+  END SUBROUTINE CHECK_FAILED
+
+END PROGRAM THREADEDASSEMBLY
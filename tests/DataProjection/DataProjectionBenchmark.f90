@@ -0,0 +1,237 @@
+!> \file
+!> \brief Benchmark of the data projection of random data points onto a generated mesh, reporting the interpolation parameters cache hit rate.
+!> The cached projection results are checked against a second evaluation with the parameters cache disabled.
+!>
+!> \section LICENSE
+!>
+!> Version: MPL 1.1/GPL 2.0/LGPL 2.1
+!>
+!> The contents of this file are subject to the Mozilla Public License
+!> Version 1.1 (the "License"); you may not use this file except in
+!> compliance with the License. You may obtain a copy of the License at
+!> http://www.mozilla.org/MPL/
+!>
+!> Software distributed under the License is distributed on an "AS IS"
+!> basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+!> License for the specific language governing rights and limitations
+!> under the License.
+!>
+!> The Original Code is OpenCMISS
+!>
+!> The Initial Developer of the Original Code is University of Auckland,
+!> Auckland, New Zealand and University of Oxford, Oxford, United
+!> Kingdom. Portions created by the University of Auckland and University
+!> of Oxford are Copyright (C) 2007 by the University of Auckland and
+!> the University of Oxford. All Rights Reserved.
+!>
+!> Contributor(s):
+!>
+!> Alternatively, the contents of this file may be used under the terms of
+!> either the GNU General Public License Version 2 or later (the "GPL"), or
+!> the GNU Lesser General Public License Version 2.1 or later (the "LGPL"),
+!> in which case the provisions of the GPL or the LGPL are applicable instead
+!> of those above. If you wish to allow use of your version of this file only
+!> under the terms of either the GPL or the LGPL, and not to allow others to
+!> use your version of this file under the terms of the MPL, indicate your
+!> decision by deleting the provisions above and replace them with the notice
+!> and other provisions required by the GPL or the LGPL. If you do not delete
+!> the provisions above, a recipient may use your version of this file under
+!> the terms of any one of the MPL, the GPL or the LGPL.
+!>
+
+
+!> Main program
+PROGRAM DATAPROJECTIONBENCHMARK
+
+  USE OpenCMISS
+  USE OpenCMISS_Iron
+#ifndef NOMPIMOD
+  USE MPI
+#endif
+
+#ifdef WIN32
+  USE IFQWIN
+#endif
+
+  IMPLICIT NONE
+
+#ifdef NOMPIMOD
+#include "mpif.h"
+#endif
+
+  !Test program parameters
+
+  REAL(CMISSRP), PARAMETER :: WIDTH=1.0_CMISSRP
+  REAL(CMISSRP), PARAMETER :: HEIGHT=1.0_CMISSRP
+
+  INTEGER(CMISSIntg), PARAMETER :: CoordinateSystemUserNumber=1
+  INTEGER(CMISSIntg), PARAMETER :: RegionUserNumber=2
+  INTEGER(CMISSIntg), PARAMETER :: BasisUserNumber=3
+  INTEGER(CMISSIntg), PARAMETER :: GeneratedMeshUserNumber=4
+  INTEGER(CMISSIntg), PARAMETER :: MeshUserNumber=5
+  INTEGER(CMISSIntg), PARAMETER :: DecompositionUserNumber=6
+  INTEGER(CMISSIntg), PARAMETER :: GeometricFieldUserNumber=7
+  INTEGER(CMISSIntg), PARAMETER :: DataProjectionUserNumber=8
+
+  !Program variables
+
+  INTEGER(CMISSIntg) :: NUMBER_OF_ARGUMENTS,ARGUMENT_LENGTH,STATUS
+  CHARACTER(LEN=255) :: COMMAND_ARGUMENT
+
+  INTEGER(CMISSIntg) :: NUMBER_GLOBAL_X_ELEMENTS,NUMBER_GLOBAL_Y_ELEMENTS,NUMBER_OF_DATA_POINTS,data_point_idx
+  INTEGER(CMISSIntg) :: numberOfHits,numberOfMisses
+  INTEGER(CMISSIntg) :: elementNumber,exitTag,numberOfMismatches,globalNumberOfMismatches
+  INTEGER(CMISSIntg), ALLOCATABLE :: cachedElementNumbers(:),cachedExitTags(:)
+  REAL(CMISSRP) :: dataPointValues(2),xi(2),distance
+  REAL(CMISSRP), ALLOCATABLE :: cachedXi(:,:),cachedDistances(:)
+  REAL(CMISSDP) :: startTime,stopTime
+
+  !CMISS variables
+
+  TYPE(cmfe_BasisType) :: Basis
+  TYPE(cmfe_CoordinateSystemType) :: CoordinateSystem,WorldCoordinateSystem
+  TYPE(cmfe_DataPointsType) :: DataPoints
+  TYPE(cmfe_DataProjectionType) :: DataProjection
+  TYPE(cmfe_DecompositionType) :: Decomposition
+  TYPE(cmfe_FieldType) :: GeometricField
+  TYPE(cmfe_GeneratedMeshType) :: GeneratedMesh
+  TYPE(cmfe_MeshType) :: Mesh
+  TYPE(cmfe_RegionType) :: Region,WorldRegion
+
+  !Generic CMISS variables
+
+  INTEGER(CMISSIntg) :: NumberOfComputationalNodes,ComputationalNodeNumber
+  INTEGER(CMISSIntg) :: Err
+
+  !Usage: DataProjectionBenchmark [number of elements in each direction] [number of data points]
+  NUMBER_GLOBAL_X_ELEMENTS=50
+  NUMBER_OF_DATA_POINTS=100000
+  NUMBER_OF_ARGUMENTS=COMMAND_ARGUMENT_COUNT()
+  IF(NUMBER_OF_ARGUMENTS>=1) THEN
+    CALL GET_COMMAND_ARGUMENT(1,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    READ(COMMAND_ARGUMENT(1:ARGUMENT_LENGTH),*) NUMBER_GLOBAL_X_ELEMENTS
+  ENDIF
+  IF(NUMBER_OF_ARGUMENTS>=2) THEN
+    CALL GET_COMMAND_ARGUMENT(2,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    READ(COMMAND_ARGUMENT(1:ARGUMENT_LENGTH),*) NUMBER_OF_DATA_POINTS
+  ENDIF
+  NUMBER_GLOBAL_Y_ELEMENTS=NUMBER_GLOBAL_X_ELEMENTS
+
+  !Intialise OpenCMISS
+  CALL cmfe_Initialise(WorldCoordinateSystem,WorldRegion,Err)
+  CALL cmfe_ErrorHandlingModeSet(CMFE_ERRORS_TRAP_ERROR,Err)
+  CALL cmfe_ComputationalNumberOfNodesGet(NumberOfComputationalNodes,Err)
+  CALL cmfe_ComputationalNodeNumberGet(ComputationalNodeNumber,Err)
+
+  !Create a 2D RC coordinate system, region, bilinear basis and mesh
+  CALL cmfe_CoordinateSystem_Initialise(CoordinateSystem,Err)
+  CALL cmfe_CoordinateSystem_CreateStart(CoordinateSystemUserNumber,CoordinateSystem,Err)
+  CALL cmfe_CoordinateSystem_DimensionSet(CoordinateSystem,2,Err)
+  CALL cmfe_CoordinateSystem_CreateFinish(CoordinateSystem,Err)
+
+  CALL cmfe_Region_Initialise(Region,Err)
+  CALL cmfe_Region_CreateStart(RegionUserNumber,WorldRegion,Region,Err)
+  CALL cmfe_Region_CoordinateSystemSet(Region,CoordinateSystem,Err)
+  CALL cmfe_Region_LabelSet(Region,"Region",Err)
+  CALL cmfe_Region_CreateFinish(Region,Err)
+
+  CALL cmfe_Basis_Initialise(Basis,Err)
+  CALL cmfe_Basis_CreateStart(BasisUserNumber,Basis,Err)
+  CALL cmfe_Basis_NumberOfXiSet(Basis,2,Err)
+  CALL cmfe_Basis_CreateFinish(Basis,Err)
+
+  CALL cmfe_GeneratedMesh_Initialise(GeneratedMesh,Err)
+  CALL cmfe_GeneratedMesh_CreateStart(GeneratedMeshUserNumber,Region,GeneratedMesh,Err)
+  CALL cmfe_GeneratedMesh_TypeSet(GeneratedMesh,CMFE_GENERATED_MESH_REGULAR_MESH_TYPE,Err)
+  CALL cmfe_GeneratedMesh_BasisSet(GeneratedMesh,Basis,Err)
+  CALL cmfe_GeneratedMesh_ExtentSet(GeneratedMesh,[WIDTH,HEIGHT],Err)
+  CALL cmfe_GeneratedMesh_NumberOfElementsSet(GeneratedMesh,[NUMBER_GLOBAL_X_ELEMENTS,NUMBER_GLOBAL_Y_ELEMENTS],Err)
+  CALL cmfe_Mesh_Initialise(Mesh,Err)
+  CALL cmfe_GeneratedMesh_CreateFinish(GeneratedMesh,MeshUserNumber,Mesh,Err)
+
+  CALL cmfe_Decomposition_Initialise(Decomposition,Err)
+  CALL cmfe_Decomposition_CreateStart(DecompositionUserNumber,Mesh,Decomposition,Err)
+  CALL cmfe_Decomposition_TypeSet(Decomposition,CMFE_DECOMPOSITION_CALCULATED_TYPE,Err)
+  CALL cmfe_Decomposition_NumberOfDomainsSet(Decomposition,NumberOfComputationalNodes,Err)
+  CALL cmfe_Decomposition_CreateFinish(Decomposition,Err)
+
+  CALL cmfe_Field_Initialise(GeometricField,Err)
+  CALL cmfe_Field_CreateStart(GeometricFieldUserNumber,Region,GeometricField,Err)
+  CALL cmfe_Field_MeshDecompositionSet(GeometricField,Decomposition,Err)
+  CALL cmfe_Field_ComponentMeshComponentSet(GeometricField,CMFE_FIELD_U_VARIABLE_TYPE,1,1,Err)
+  CALL cmfe_Field_ComponentMeshComponentSet(GeometricField,CMFE_FIELD_U_VARIABLE_TYPE,2,1,Err)
+  CALL cmfe_Field_CreateFinish(GeometricField,Err)
+  CALL cmfe_GeneratedMesh_GeometricParametersCalculate(GeneratedMesh,GeometricField,Err)
+
+  !Create random data points over the mesh
+  CALL cmfe_DataPoints_Initialise(DataPoints,Err)
+  CALL cmfe_DataPoints_CreateStart(Region,NUMBER_OF_DATA_POINTS,DataPoints,Err)
+  DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+    CALL RANDOM_NUMBER(dataPointValues)
+    CALL cmfe_DataPoints_ValuesSet(DataPoints,data_point_idx,[WIDTH*dataPointValues(1),HEIGHT*dataPointValues(2)],Err)
+  ENDDO !data_point_idx
+  CALL cmfe_DataPoints_CreateFinish(DataPoints,Err)
+
+  !Project the data points onto the elements of the mesh
+  CALL cmfe_DataProjection_Initialise(DataProjection,Err)
+  CALL cmfe_DataProjection_CreateStart(DataProjectionUserNumber,DataPoints,Mesh,DataProjection,Err)
+  CALL cmfe_DataProjection_ProjectionTypeSet(DataProjection,CMFE_DATA_PROJECTION_ALL_ELEMENTS_PROJECTION_TYPE,Err)
+  CALL cmfe_DataProjection_SpatialIndexSet(DataProjection,CMFE_DATA_PROJECTION_GRID_SPATIAL_INDEX,Err)
+  CALL cmfe_DataProjection_CreateFinish(DataProjection,Err)
+
+  CALL MPI_BARRIER(MPI_COMM_WORLD,Err)
+  startTime=MPI_WTIME()
+  CALL cmfe_DataProjection_DataPointsProjectionEvaluate(DataProjection,GeometricField,Err)
+  CALL MPI_BARRIER(MPI_COMM_WORLD,Err)
+  stopTime=MPI_WTIME()
+  CALL cmfe_DataProjection_ParametersCacheStatisticsGet(DataProjection,numberOfHits,numberOfMisses,Err)
+
+  IF(ComputationalNodeNumber==0) THEN
+    WRITE(*,'("Number of elements: ",I0,", number of data points: ",I0)') NUMBER_GLOBAL_X_ELEMENTS*NUMBER_GLOBAL_Y_ELEMENTS, &
+      & NUMBER_OF_DATA_POINTS
+    WRITE(*,'("Projection time:         ",ES12.4," seconds")') stopTime-startTime
+    WRITE(*,'("Parameters cache hits:   ",I0)') numberOfHits
+    WRITE(*,'("Parameters cache misses: ",I0)') numberOfMisses
+    WRITE(*,'("Parameters cache hit rate:",F8.3)') REAL(numberOfHits,CMISSDP)/REAL(MAX(numberOfHits+numberOfMisses,1),CMISSDP)
+  ENDIF
+
+  !Store the cached projection results
+  ALLOCATE(cachedElementNumbers(NUMBER_OF_DATA_POINTS))
+  ALLOCATE(cachedExitTags(NUMBER_OF_DATA_POINTS))
+  ALLOCATE(cachedXi(2,NUMBER_OF_DATA_POINTS))
+  ALLOCATE(cachedDistances(NUMBER_OF_DATA_POINTS))
+  DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+    CALL cmfe_DataProjection_ResultElementNumberGet(DataProjection,data_point_idx,cachedElementNumbers(data_point_idx),Err)
+    CALL cmfe_DataProjection_ResultExitTagGet(DataProjection,data_point_idx,cachedExitTags(data_point_idx),Err)
+    CALL cmfe_DataProjection_ResultXiGet(DataProjection,data_point_idx,cachedXi(:,data_point_idx),Err)
+    CALL cmfe_DataProjection_ResultDistanceGet(DataProjection,data_point_idx,cachedDistances(data_point_idx),Err)
+  ENDDO !data_point_idx
+
+  !Project again without the parameters cache. The interpolation parameters are the same so the results must be identical.
+  CALL cmfe_DataProjection_ParametersCacheEnabledSet(DataProjection,.FALSE.,Err)
+  CALL cmfe_DataProjection_DataPointsProjectionEvaluate(DataProjection,GeometricField,Err)
+  numberOfMismatches=0
+  DO data_point_idx=1,NUMBER_OF_DATA_POINTS
+    CALL cmfe_DataProjection_ResultElementNumberGet(DataProjection,data_point_idx,elementNumber,Err)
+    CALL cmfe_DataProjection_ResultExitTagGet(DataProjection,data_point_idx,exitTag,Err)
+    CALL cmfe_DataProjection_ResultXiGet(DataProjection,data_point_idx,xi,Err)
+    CALL cmfe_DataProjection_ResultDistanceGet(DataProjection,data_point_idx,distance,Err)
+    IF(elementNumber/=cachedElementNumbers(data_point_idx).OR.exitTag/=cachedExitTags(data_point_idx).OR. &
+      & ANY(xi/=cachedXi(:,data_point_idx)).OR.distance/=cachedDistances(data_point_idx)) &
+      & numberOfMismatches=numberOfMismatches+1
+  ENDDO !data_point_idx
+  CALL MPI_ALLREDUCE(numberOfMismatches,globalNumberOfMismatches,1,MPI_INTEGER,MPI_SUM,MPI_COMM_WORLD,Err)
+  IF(globalNumberOfMismatches>0) THEN
+    IF(ComputationalNodeNumber==0) WRITE(*,'(">>ERROR: ",I0," cached data point projections differ from the uncached ones.")') &
+      & globalNumberOfMismatches
+    CALL cmfe_Finalise(Err)
+    STOP 1
+  ENDIF
+
+  CALL cmfe_Finalise(Err)
+
+  WRITE(*,'(A)') "Program successfully completed."
+
+  STOP
+
+END PROGRAM DATAPROJECTIONBENCHMARK
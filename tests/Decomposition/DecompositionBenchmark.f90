@@ -0,0 +1,173 @@
+!> \file
+!> \brief Benchmark of the decomposition of a generated trilinear hexahedral mesh, timing the calculation of the domain mappings.
+!>
+!> \section LICENSE
+!>
+!> Version: MPL 1.1/GPL 2.0/LGPL 2.1
+!>
+!> The contents of this file are subject to the Mozilla Public License
+!> Version 1.1 (the "License"); you may not use this file except in
+!> compliance with the License. You may obtain a copy of the License at
+!> http://www.mozilla.org/MPL/
+!>
+!> Software distributed under the License is distributed on an "AS IS"
+!> basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+!> License for the specific language governing rights and limitations
+!> under the License.
+!>
+!> The Original Code is OpenCMISS
+!>
+!> The Initial Developer of the Original Code is University of Auckland,
+!> Auckland, New Zealand and University of Oxford, Oxford, United
+!> Kingdom. Portions created by the University of Auckland and University
+!> of Oxford are Copyright (C) 2007 by the University of Auckland and
+!> the University of Oxford. All Rights Reserved.
+!>
+!> Contributor(s):
+!>
+!> Alternatively, the contents of this file may be used under the terms of
+!> either the GNU General Public License Version 2 or later (the "GPL"), or
+!> the GNU Lesser General Public License Version 2.1 or later (the "LGPL"),
+!> in which case the provisions of the GPL or the LGPL are applicable instead
+!> of those above. If you wish to allow use of your version of this file only
+!> under the terms of either the GPL or the LGPL, and not to allow others to
+!> use your version of this file under the terms of the MPL, indicate your
+!> decision by deleting the provisions above and replace them with the notice
+!> and other provisions required by the GPL or the LGPL. If you do not delete
+!> the provisions above, a recipient may use your version of this file under
+!> the terms of any one of the MPL, the GPL or the LGPL.
+!>
+
+!> Main program
+PROGRAM DECOMPOSITIONBENCHMARK
+
+  USE OpenCMISS
+  USE OpenCMISS_Iron
+#ifndef NOMPIMOD
+  USE MPI
+#endif
+
+#ifdef WIN32
+  USE IFQWIN
+#endif
+
+  IMPLICIT NONE
+
+#ifdef NOMPIMOD
+#include "mpif.h"
+#endif
+
+  !Test program parameters
+
+  REAL(CMISSRP), PARAMETER :: WIDTH=1.0_CMISSRP
+  REAL(CMISSRP), PARAMETER :: HEIGHT=1.0_CMISSRP
+  REAL(CMISSRP), PARAMETER :: LENGTH=1.0_CMISSRP
+
+  INTEGER(CMISSIntg), PARAMETER :: CoordinateSystemUserNumber=1
+  INTEGER(CMISSIntg), PARAMETER :: RegionUserNumber=2
+  INTEGER(CMISSIntg), PARAMETER :: BasisUserNumber=3
+  INTEGER(CMISSIntg), PARAMETER :: GeneratedMeshUserNumber=4
+  INTEGER(CMISSIntg), PARAMETER :: MeshUserNumber=5
+  INTEGER(CMISSIntg), PARAMETER :: DecompositionUserNumber=6
+
+  !Program variables
+
+  INTEGER(CMISSIntg) :: NUMBER_OF_ARGUMENTS,ARGUMENT_LENGTH,STATUS
+  CHARACTER(LEN=255) :: COMMAND_ARGUMENT
+
+  INTEGER(CMISSIntg) :: NUMBER_GLOBAL_X_ELEMENTS,PARTITION_METHOD,ELEMENT_WEIGHT_TYPE
+  REAL(CMISSDP) :: startTime,stopTime
+
+  !CMISS variables
+
+  TYPE(cmfe_BasisType) :: Basis
+  TYPE(cmfe_CoordinateSystemType) :: CoordinateSystem,WorldCoordinateSystem
+  TYPE(cmfe_DecompositionType) :: Decomposition
+  TYPE(cmfe_GeneratedMeshType) :: GeneratedMesh
+  TYPE(cmfe_MeshType) :: Mesh
+  TYPE(cmfe_RegionType) :: Region,WorldRegion
+
+  !Generic CMISS variables
+
+  INTEGER(CMISSIntg) :: NumberOfComputationalNodes,ComputationalNodeNumber
+  INTEGER(CMISSIntg) :: Err
+
+  !Usage: DecompositionBenchmark [number of elements in each direction]
+  !A value of 100 gives the 10^6 element mesh used for the timings of the list duplicate removal methods.
+  NUMBER_GLOBAL_X_ELEMENTS=100
+  PARTITION_METHOD=CMFE_DECOMPOSITION_MESH_KWAY_PARTITION
+  ELEMENT_WEIGHT_TYPE=CMFE_DECOMPOSITION_UNIFORM_ELEMENT_WEIGHTS
+  NUMBER_OF_ARGUMENTS=COMMAND_ARGUMENT_COUNT()
+  IF(NUMBER_OF_ARGUMENTS>=1) THEN
+    CALL GET_COMMAND_ARGUMENT(1,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    READ(COMMAND_ARGUMENT(1:ARGUMENT_LENGTH),*) NUMBER_GLOBAL_X_ELEMENTS
+  ENDIF
+  IF(NUMBER_OF_ARGUMENTS>=2) THEN
+    CALL GET_COMMAND_ARGUMENT(2,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    READ(COMMAND_ARGUMENT(1:ARGUMENT_LENGTH),*) PARTITION_METHOD
+  ENDIF
+  IF(NUMBER_OF_ARGUMENTS>=3) THEN
+    CALL GET_COMMAND_ARGUMENT(3,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    READ(COMMAND_ARGUMENT(1:ARGUMENT_LENGTH),*) ELEMENT_WEIGHT_TYPE
+  ENDIF
+
+  !Intialise OpenCMISS
+  CALL cmfe_Initialise(WorldCoordinateSystem,WorldRegion,Err)
+  CALL cmfe_ErrorHandlingModeSet(CMFE_ERRORS_TRAP_ERROR,Err)
+  CALL cmfe_ComputationalNumberOfNodesGet(NumberOfComputationalNodes,Err)
+  CALL cmfe_ComputationalNodeNumberGet(ComputationalNodeNumber,Err)
+
+  !Create a 3D RC coordinate system, region, trilinear basis and mesh
+  CALL cmfe_CoordinateSystem_Initialise(CoordinateSystem,Err)
+  CALL cmfe_CoordinateSystem_CreateStart(CoordinateSystemUserNumber,CoordinateSystem,Err)
+  CALL cmfe_CoordinateSystem_DimensionSet(CoordinateSystem,3,Err)
+  CALL cmfe_CoordinateSystem_CreateFinish(CoordinateSystem,Err)
+
+  CALL cmfe_Region_Initialise(Region,Err)
+  CALL cmfe_Region_CreateStart(RegionUserNumber,WorldRegion,Region,Err)
+  CALL cmfe_Region_CoordinateSystemSet(Region,CoordinateSystem,Err)
+  CALL cmfe_Region_LabelSet(Region,"Region",Err)
+  CALL cmfe_Region_CreateFinish(Region,Err)
+
+  CALL cmfe_Basis_Initialise(Basis,Err)
+  CALL cmfe_Basis_CreateStart(BasisUserNumber,Basis,Err)
+  CALL cmfe_Basis_NumberOfXiSet(Basis,3,Err)
+  CALL cmfe_Basis_CreateFinish(Basis,Err)
+
+  CALL cmfe_GeneratedMesh_Initialise(GeneratedMesh,Err)
+  CALL cmfe_GeneratedMesh_CreateStart(GeneratedMeshUserNumber,Region,GeneratedMesh,Err)
+  CALL cmfe_GeneratedMesh_TypeSet(GeneratedMesh,CMFE_GENERATED_MESH_REGULAR_MESH_TYPE,Err)
+  CALL cmfe_GeneratedMesh_BasisSet(GeneratedMesh,Basis,Err)
+  CALL cmfe_GeneratedMesh_ExtentSet(GeneratedMesh,[WIDTH,HEIGHT,LENGTH],Err)
+  CALL cmfe_GeneratedMesh_NumberOfElementsSet(GeneratedMesh,[NUMBER_GLOBAL_X_ELEMENTS,NUMBER_GLOBAL_X_ELEMENTS, &
+    & NUMBER_GLOBAL_X_ELEMENTS],Err)
+  CALL cmfe_Mesh_Initialise(Mesh,Err)
+  CALL cmfe_GeneratedMesh_CreateFinish(GeneratedMesh,MeshUserNumber,Mesh,Err)
+
+  CALL cmfe_Decomposition_Initialise(Decomposition,Err)
+  CALL cmfe_Decomposition_CreateStart(DecompositionUserNumber,Mesh,Decomposition,Err)
+  CALL cmfe_Decomposition_TypeSet(Decomposition,CMFE_DECOMPOSITION_CALCULATED_TYPE,Err)
+  CALL cmfe_Decomposition_NumberOfDomainsSet(Decomposition,NumberOfComputationalNodes,Err)
+  CALL cmfe_Decomposition_PartitionMethodSet(Decomposition,PARTITION_METHOD,Err)
+  CALL cmfe_Decomposition_ElementWeightTypeSet(Decomposition,ELEMENT_WEIGHT_TYPE,Err)
+
+  CALL MPI_BARRIER(MPI_COMM_WORLD,Err)
+  startTime=MPI_WTIME()
+  CALL cmfe_Decomposition_CreateFinish(Decomposition,Err)
+  CALL MPI_BARRIER(MPI_COMM_WORLD,Err)
+  stopTime=MPI_WTIME()
+
+  IF(ComputationalNodeNumber==0) THEN
+    WRITE(*,'("Number of elements: ",I0,", number of domains: ",I0)') NUMBER_GLOBAL_X_ELEMENTS**3, &
+      & NumberOfComputationalNodes
+    WRITE(*,'("Partition method: ",I0,", element weight type: ",I0)') PARTITION_METHOD,ELEMENT_WEIGHT_TYPE
+    WRITE(*,'("Decomposition create finish time: ",ES12.4," seconds")') stopTime-startTime
+  ENDIF
+
+  CALL cmfe_Finalise(Err)
+
+  WRITE(*,'(A)') "Program successfully completed."
+
+  STOP
+
+END PROGRAM DECOMPOSITIONBENCHMARK
@@ -0,0 +1,214 @@
+!> \file
+!> \brief This is a test program that checks that calculated decompositions balance user set, single and multi-constraint, element weights across the domains.
+!>
+!> \section LICENSE
+!>
+!> Version: MPL 1.1/GPL 2.0/LGPL 2.1
+!>
+!> The contents of this file are subject to the Mozilla Public License
+!> Version 1.1 (the "License"); you may not use this file except in
+!> compliance with the License. You may obtain a copy of the License at
+!> http://www.mozilla.org/MPL/
+!>
+!> Software distributed under the License is distributed on an "AS IS"
+!> basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+!> License for the specific language governing rights and limitations
+!> under the License.
+!>
+!> The Original Code is OpenCMISS
+!>
+!> The Initial Developer of the Original Code is University of Auckland,
+!> Auckland, New Zealand and University of Oxford, Oxford, United
+!> Kingdom. Portions created by the University of Auckland and University
+!> of Oxford are Copyright (C) 2007 by the University of Auckland and
+!> the University of Oxford. All Rights Reserved.
+!>
+!> Contributor(s):
+!>
+!> Alternatively, the contents of this file may be used under the terms of
+!> either the GNU General Public License Version 2 or later (the "GPL"), or
+!> the GNU Lesser General Public License Version 2.1 or later (the "LGPL"),
+!> in which case the provisions of the GPL or the LGPL are applicable instead
+!> of those above. If you wish to allow use of your version of this file only
+!> under the terms of either the GPL or the LGPL, and not to allow others to
+!> use your version of this file under the terms of the MPL, indicate your
+!> decision by deleting the provisions above and replace them with the notice
+!> and other provisions required by the GPL or the LGPL. If you do not delete
+!> the provisions above, a recipient may use your version of this file under
+!> the terms of any one of the MPL, the GPL or the LGPL.
+!>
+
+
+!> Main program
+PROGRAM DECOMPOSITIONWEIGHTS
+
+  USE OpenCMISS
+  USE OpenCMISS_Iron
+#ifndef NOMPIMOD
+  USE MPI
+#endif
+
+#ifdef WIN32
+  USE IFQWIN
+#endif
+
+  IMPLICIT NONE
+
+#ifdef NOMPIMOD
+#include "mpif.h"
+#endif
+
+  !Test program parameters
+
+  REAL(CMISSRP), PARAMETER :: WIDTH=1.0_CMISSRP
+  REAL(CMISSRP), PARAMETER :: HEIGHT=1.0_CMISSRP
+  !The load imbalance tolerance the decomposition passes to ParMETIS for each balance constraint
+  REAL(CMISSDP), PARAMETER :: IMBALANCE_TOLERANCE=1.05_CMISSDP
+
+  INTEGER(CMISSIntg), PARAMETER :: CoordinateSystemUserNumber=1
+  INTEGER(CMISSIntg), PARAMETER :: RegionUserNumber=2
+  INTEGER(CMISSIntg), PARAMETER :: BasisUserNumber=3
+  INTEGER(CMISSIntg), PARAMETER :: GeneratedMeshUserNumber=4
+  INTEGER(CMISSIntg), PARAMETER :: MeshUserNumber=5
+  INTEGER(CMISSIntg), PARAMETER :: DecompositionUserNumber=6
+
+  INTEGER(CMISSIntg), PARAMETER :: NUMBER_OF_TEST_CASES=3
+
+  !Program variables
+
+  INTEGER(CMISSIntg) :: NUMBER_OF_ARGUMENTS,ARGUMENT_LENGTH,STATUS
+  CHARACTER(LEN=255) :: COMMAND_ARGUMENT
+
+  INTEGER(CMISSIntg) :: NUMBER_GLOBAL_X_ELEMENTS,NUMBER_OF_ELEMENTS,NUMBER_OF_CONSTRAINTS,PARTITION_METHOD
+  INTEGER(CMISSIntg) :: constraint_idx,domain,element_idx,test_case_idx
+  INTEGER(CMISSIntg), ALLOCATABLE :: elementWeights(:,:),domainWeights(:,:)
+  REAL(CMISSDP) :: imbalance,meanWeight
+
+  !CMISS variables
+
+  TYPE(cmfe_BasisType) :: Basis
+  TYPE(cmfe_CoordinateSystemType) :: CoordinateSystem,WorldCoordinateSystem
+  TYPE(cmfe_DecompositionType) :: Decomposition
+  TYPE(cmfe_GeneratedMeshType) :: GeneratedMesh
+  TYPE(cmfe_MeshType) :: Mesh
+  TYPE(cmfe_RegionType) :: Region,WorldRegion
+
+  !Generic CMISS variables
+
+  INTEGER(CMISSIntg) :: NumberOfComputationalNodes,ComputationalNodeNumber
+  INTEGER(CMISSIntg) :: Err
+
+  !Usage: DecompositionWeights [number of elements in each direction]
+  NUMBER_GLOBAL_X_ELEMENTS=30
+  NUMBER_OF_ARGUMENTS=COMMAND_ARGUMENT_COUNT()
+  IF(NUMBER_OF_ARGUMENTS>=1) THEN
+    CALL GET_COMMAND_ARGUMENT(1,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    READ(COMMAND_ARGUMENT(1:ARGUMENT_LENGTH),*) NUMBER_GLOBAL_X_ELEMENTS
+  ENDIF
+  NUMBER_OF_ELEMENTS=NUMBER_GLOBAL_X_ELEMENTS**2
+
+  !Intialise OpenCMISS
+  CALL cmfe_Initialise(WorldCoordinateSystem,WorldRegion,Err)
+  CALL cmfe_ErrorHandlingModeSet(CMFE_ERRORS_TRAP_ERROR,Err)
+  CALL cmfe_ComputationalNumberOfNodesGet(NumberOfComputationalNodes,Err)
+  CALL cmfe_ComputationalNodeNumberGet(ComputationalNodeNumber,Err)
+
+  !Create a 2D RC coordinate system, region, bilinear basis and mesh
+  CALL cmfe_CoordinateSystem_Initialise(CoordinateSystem,Err)
+  CALL cmfe_CoordinateSystem_CreateStart(CoordinateSystemUserNumber,CoordinateSystem,Err)
+  CALL cmfe_CoordinateSystem_DimensionSet(CoordinateSystem,2,Err)
+  CALL cmfe_CoordinateSystem_CreateFinish(CoordinateSystem,Err)
+
+  CALL cmfe_Region_Initialise(Region,Err)
+  CALL cmfe_Region_CreateStart(RegionUserNumber,WorldRegion,Region,Err)
+  CALL cmfe_Region_CoordinateSystemSet(Region,CoordinateSystem,Err)
+  CALL cmfe_Region_LabelSet(Region,"Region",Err)
+  CALL cmfe_Region_CreateFinish(Region,Err)
+
+  CALL cmfe_Basis_Initialise(Basis,Err)
+  CALL cmfe_Basis_CreateStart(BasisUserNumber,Basis,Err)
+  CALL cmfe_Basis_NumberOfXiSet(Basis,2,Err)
+  CALL cmfe_Basis_CreateFinish(Basis,Err)
+
+  CALL cmfe_GeneratedMesh_Initialise(GeneratedMesh,Err)
+  CALL cmfe_GeneratedMesh_CreateStart(GeneratedMeshUserNumber,Region,GeneratedMesh,Err)
+  CALL cmfe_GeneratedMesh_TypeSet(GeneratedMesh,CMFE_GENERATED_MESH_REGULAR_MESH_TYPE,Err)
+  CALL cmfe_GeneratedMesh_BasisSet(GeneratedMesh,Basis,Err)
+  CALL cmfe_GeneratedMesh_ExtentSet(GeneratedMesh,[WIDTH,HEIGHT],Err)
+  CALL cmfe_GeneratedMesh_NumberOfElementsSet(GeneratedMesh,[NUMBER_GLOBAL_X_ELEMENTS,NUMBER_GLOBAL_X_ELEMENTS],Err)
+  CALL cmfe_Mesh_Initialise(Mesh,Err)
+  CALL cmfe_GeneratedMesh_CreateFinish(GeneratedMesh,MeshUserNumber,Mesh,Err)
+
+  ALLOCATE(domainWeights(2,0:NumberOfComputationalNodes-1))
+
+  !Test case 1 has a single constraint set with cmfe_Decomposition_ElementWeightsSet. Test cases 2 and 3 have two constraints,
+  !partitioned as a mesh and as a dual graph. The first constraint varies element by element and the second is heavier over the
+  !left half of the mesh.
+  DO test_case_idx=1,NUMBER_OF_TEST_CASES
+    IF(test_case_idx==1) THEN
+      NUMBER_OF_CONSTRAINTS=1
+    ELSE
+      NUMBER_OF_CONSTRAINTS=2
+    ENDIF
+    IF(test_case_idx==3) THEN
+      PARTITION_METHOD=CMFE_DECOMPOSITION_DUAL_GRAPH_KWAY_PARTITION
+    ELSE
+      PARTITION_METHOD=CMFE_DECOMPOSITION_MESH_KWAY_PARTITION
+    ENDIF
+    ALLOCATE(elementWeights(NUMBER_OF_CONSTRAINTS,NUMBER_OF_ELEMENTS))
+    DO element_idx=1,NUMBER_OF_ELEMENTS
+      elementWeights(1,element_idx)=1+MOD(element_idx,4)
+      IF(NUMBER_OF_CONSTRAINTS>1) THEN
+        IF(MOD(element_idx-1,NUMBER_GLOBAL_X_ELEMENTS)<NUMBER_GLOBAL_X_ELEMENTS/2) THEN
+          elementWeights(2,element_idx)=3
+        ELSE
+          elementWeights(2,element_idx)=1
+        ENDIF
+      ENDIF
+    ENDDO !element_idx
+
+    CALL cmfe_Decomposition_Initialise(Decomposition,Err)
+    CALL cmfe_Decomposition_CreateStart(DecompositionUserNumber,Mesh,Decomposition,Err)
+    CALL cmfe_Decomposition_TypeSet(Decomposition,CMFE_DECOMPOSITION_CALCULATED_TYPE,Err)
+    CALL cmfe_Decomposition_NumberOfDomainsSet(Decomposition,NumberOfComputationalNodes,Err)
+    CALL cmfe_Decomposition_PartitionMethodSet(Decomposition,PARTITION_METHOD,Err)
+    IF(NUMBER_OF_CONSTRAINTS==1) THEN
+      CALL cmfe_Decomposition_ElementWeightsSet(Decomposition,elementWeights(1,:),Err)
+    ELSE
+      CALL cmfe_Decomposition_ElementConstraintWeightsSet(Decomposition,elementWeights,Err)
+    ENDIF
+    CALL cmfe_Decomposition_CreateFinish(Decomposition,Err)
+
+    !Every rank has the domains of all the elements, so sum the weights of each domain and check them against the mean
+    domainWeights=0
+    DO element_idx=1,NUMBER_OF_ELEMENTS
+      CALL cmfe_Decomposition_ElementDomainGet(Decomposition,element_idx,domain,Err)
+      domainWeights(1:NUMBER_OF_CONSTRAINTS,domain)=domainWeights(1:NUMBER_OF_CONSTRAINTS,domain)+ &
+        & elementWeights(:,element_idx)
+    ENDDO !element_idx
+    DO constraint_idx=1,NUMBER_OF_CONSTRAINTS
+      meanWeight=REAL(SUM(elementWeights(constraint_idx,:)),CMISSDP)/REAL(NumberOfComputationalNodes,CMISSDP)
+      imbalance=REAL(MAXVAL(domainWeights(constraint_idx,:)),CMISSDP)/meanWeight
+      IF(ComputationalNodeNumber==0) WRITE(*,'("Test case ",I0,", constraint ",I0,": imbalance ",F8.4)') test_case_idx, &
+        & constraint_idx,imbalance
+      IF(imbalance>IMBALANCE_TOLERANCE) THEN
+        IF(ComputationalNodeNumber==0) WRITE(*,'(">>ERROR: Test case ",I0,", constraint ",I0,": the imbalance of ",F8.4, &
+          & " exceeds the tolerance of ",F8.4,".")') test_case_idx,constraint_idx,imbalance,IMBALANCE_TOLERANCE
+        CALL cmfe_Finalise(Err)
+        STOP 1
+      ENDIF
+    ENDDO !constraint_idx
+
+    CALL cmfe_Decomposition_Destroy(Decomposition,Err)
+    DEALLOCATE(elementWeights)
+  ENDDO !test_case_idx
+
+  DEALLOCATE(domainWeights)
+
+  CALL cmfe_Finalise(Err)
+
+  WRITE(*,'(A)') "Program successfully completed."
+
+  STOP
+
+END PROGRAM DECOMPOSITIONWEIGHTS
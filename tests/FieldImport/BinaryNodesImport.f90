@@ -0,0 +1,220 @@
+!> \file
+!> \brief Round trip test of the binary node files. The nodes of a generated trilinear hexahedral mesh are exported to exnode files, converted to binary node files, imported back with the "BINARY" method and compared with the original geometric field.
+!>
+!> \section LICENSE
+!>
+!> Version: MPL 1.1/GPL 2.0/LGPL 2.1
+!>
+!> The contents of this file are subject to the Mozilla Public License
+!> Version 1.1 (the "License"); you may not use this file except in
+!> compliance with the License. You may obtain a copy of the License at
+!> http://www.mozilla.org/MPL/
+!>
+!> Software distributed under the License is distributed on an "AS IS"
+!> basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+!> License for the specific language governing rights and limitations
+!> under the License.
+!>
+!> The Original Code is OpenCMISS
+!>
+!> The Initial Developer of the Original Code is University of Auckland,
+!> Auckland, New Zealand and University of Oxford, Oxford, United
+!> Kingdom. Portions created by the University of Auckland and University
+!> of Oxford are Copyright (C) 2007 by the University of Auckland and
+!> the University of Oxford. All Rights Reserved.
+!>
+!> Contributor(s):
+!>
+!> Alternatively, the contents of this file may be used under the terms of
+!> either the GNU General Public License Version 2 or later (the "GPL"), or
+!> the GNU Lesser General Public License Version 2.1 or later (the "LGPL"),
+!> in which case the provisions of the GPL or the LGPL are applicable instead
+!> of those above. If you wish to allow use of your version of this file only
+!> under the terms of either the GPL or the LGPL, and not to allow others to
+!> use your version of this file under the terms of the MPL, indicate your
+!> decision by deleting the provisions above and replace them with the notice
+!> and other provisions required by the GPL or the LGPL. If you do not delete
+!> the provisions above, a recipient may use your version of this file under
+!> the terms of any one of the MPL, the GPL or the LGPL.
+!>
+
+!> Main program
+PROGRAM BINARYNODESIMPORT
+
+  USE OpenCMISS
+  USE OpenCMISS_Iron
+#ifndef NOMPIMOD
+  USE MPI
+#endif
+
+#ifdef WIN32
+  USE IFQWIN
+#endif
+
+  IMPLICIT NONE
+
+#ifdef NOMPIMOD
+#include "mpif.h"
+#endif
+
+  !Test program parameters
+
+  REAL(CMISSRP), PARAMETER :: WIDTH=1.0_CMISSRP
+  REAL(CMISSRP), PARAMETER :: HEIGHT=2.0_CMISSRP
+  REAL(CMISSRP), PARAMETER :: LENGTH=3.0_CMISSRP
+  REAL(CMISSRP), PARAMETER :: TOLERANCE=1.0E-14_CMISSRP
+
+  INTEGER(CMISSIntg), PARAMETER :: CoordinateSystemUserNumber=1
+  INTEGER(CMISSIntg), PARAMETER :: RegionUserNumber=2
+  INTEGER(CMISSIntg), PARAMETER :: BinaryRegionUserNumber=3
+  INTEGER(CMISSIntg), PARAMETER :: BasisUserNumber=4
+  INTEGER(CMISSIntg), PARAMETER :: GeneratedMeshUserNumber=5
+  INTEGER(CMISSIntg), PARAMETER :: MeshUserNumber=6
+  INTEGER(CMISSIntg), PARAMETER :: DecompositionUserNumber=7
+  INTEGER(CMISSIntg), PARAMETER :: GeometricFieldUserNumber=8
+  !The import numbers the imported fields from 1
+  INTEGER(CMISSIntg), PARAMETER :: ImportedFieldUserNumber=1
+
+  !Program variables
+
+  INTEGER(CMISSIntg) :: NUMBER_OF_ARGUMENTS,ARGUMENT_LENGTH,STATUS
+  CHARACTER(LEN=255) :: COMMAND_ARGUMENT,PART_NAME
+
+  INTEGER(CMISSIntg) :: NUMBER_GLOBAL_X_ELEMENTS,NUMBER_OF_NODES
+  INTEGER(CMISSIntg) :: component_idx,node_idx,domain,binaryDomain,numberCompared,totalCompared
+  REAL(CMISSRP) :: value,binaryValue,maxDifference,totalMaxDifference
+
+  !CMISS variables
+
+  TYPE(cmfe_BasisType) :: Basis
+  TYPE(cmfe_CoordinateSystemType) :: CoordinateSystem,WorldCoordinateSystem
+  TYPE(cmfe_DecompositionType) :: Decomposition,BinaryDecomposition
+  TYPE(cmfe_FieldType) :: GeometricField
+  TYPE(cmfe_FieldsType) :: Fields
+  TYPE(cmfe_GeneratedMeshType) :: GeneratedMesh
+  TYPE(cmfe_MeshType) :: Mesh,BinaryMesh
+  TYPE(cmfe_RegionType) :: Region,BinaryRegion,WorldRegion
+
+  !Generic CMISS variables
+
+  INTEGER(CMISSIntg) :: NumberOfComputationalNodes,ComputationalNodeNumber
+  INTEGER(CMISSIntg) :: Err
+
+  !Usage: BinaryNodesImport [number of elements in each direction]
+  NUMBER_GLOBAL_X_ELEMENTS=4
+  NUMBER_OF_ARGUMENTS=COMMAND_ARGUMENT_COUNT()
+  IF(NUMBER_OF_ARGUMENTS>=1) THEN
+    CALL GET_COMMAND_ARGUMENT(1,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    READ(COMMAND_ARGUMENT(1:ARGUMENT_LENGTH),*) NUMBER_GLOBAL_X_ELEMENTS
+  ENDIF
+  NUMBER_OF_NODES=(NUMBER_GLOBAL_X_ELEMENTS+1)**3
+
+  !Intialise OpenCMISS
+  CALL cmfe_Initialise(WorldCoordinateSystem,WorldRegion,Err)
+  CALL cmfe_ErrorHandlingModeSet(CMFE_ERRORS_TRAP_ERROR,Err)
+  CALL cmfe_ComputationalNumberOfNodesGet(NumberOfComputationalNodes,Err)
+  CALL cmfe_ComputationalNodeNumberGet(ComputationalNodeNumber,Err)
+
+  !Create a 3D RC coordinate system, the regions, a trilinear basis and a generated mesh to export
+  CALL cmfe_CoordinateSystem_Initialise(CoordinateSystem,Err)
+  CALL cmfe_CoordinateSystem_CreateStart(CoordinateSystemUserNumber,CoordinateSystem,Err)
+  CALL cmfe_CoordinateSystem_DimensionSet(CoordinateSystem,3,Err)
+  CALL cmfe_CoordinateSystem_CreateFinish(CoordinateSystem,Err)
+
+  CALL cmfe_Region_Initialise(Region,Err)
+  CALL cmfe_Region_CreateStart(RegionUserNumber,WorldRegion,Region,Err)
+  CALL cmfe_Region_CoordinateSystemSet(Region,CoordinateSystem,Err)
+  CALL cmfe_Region_LabelSet(Region,"Region",Err)
+  CALL cmfe_Region_CreateFinish(Region,Err)
+
+  CALL cmfe_Region_Initialise(BinaryRegion,Err)
+  CALL cmfe_Region_CreateStart(BinaryRegionUserNumber,WorldRegion,BinaryRegion,Err)
+  CALL cmfe_Region_CoordinateSystemSet(BinaryRegion,CoordinateSystem,Err)
+  CALL cmfe_Region_LabelSet(BinaryRegion,"BinaryRegion",Err)
+  CALL cmfe_Region_CreateFinish(BinaryRegion,Err)
+
+  CALL cmfe_Basis_Initialise(Basis,Err)
+  CALL cmfe_Basis_CreateStart(BasisUserNumber,Basis,Err)
+  CALL cmfe_Basis_NumberOfXiSet(Basis,3,Err)
+  CALL cmfe_Basis_CreateFinish(Basis,Err)
+
+  CALL cmfe_GeneratedMesh_Initialise(GeneratedMesh,Err)
+  CALL cmfe_GeneratedMesh_CreateStart(GeneratedMeshUserNumber,Region,GeneratedMesh,Err)
+  CALL cmfe_GeneratedMesh_TypeSet(GeneratedMesh,CMFE_GENERATED_MESH_REGULAR_MESH_TYPE,Err)
+  CALL cmfe_GeneratedMesh_BasisSet(GeneratedMesh,Basis,Err)
+  CALL cmfe_GeneratedMesh_ExtentSet(GeneratedMesh,[WIDTH,HEIGHT,LENGTH],Err)
+  CALL cmfe_GeneratedMesh_NumberOfElementsSet(GeneratedMesh,[NUMBER_GLOBAL_X_ELEMENTS,NUMBER_GLOBAL_X_ELEMENTS, &
+    & NUMBER_GLOBAL_X_ELEMENTS],Err)
+  CALL cmfe_Mesh_Initialise(Mesh,Err)
+  CALL cmfe_GeneratedMesh_CreateFinish(GeneratedMesh,MeshUserNumber,Mesh,Err)
+
+  CALL cmfe_Decomposition_Initialise(Decomposition,Err)
+  CALL cmfe_Decomposition_CreateStart(DecompositionUserNumber,Mesh,Decomposition,Err)
+  CALL cmfe_Decomposition_TypeSet(Decomposition,CMFE_DECOMPOSITION_CALCULATED_TYPE,Err)
+  CALL cmfe_Decomposition_NumberOfDomainsSet(Decomposition,NumberOfComputationalNodes,Err)
+  CALL cmfe_Decomposition_CreateFinish(Decomposition,Err)
+
+  CALL cmfe_Field_Initialise(GeometricField,Err)
+  CALL cmfe_Field_CreateStart(GeometricFieldUserNumber,Region,GeometricField,Err)
+  CALL cmfe_Field_MeshDecompositionSet(GeometricField,Decomposition,Err)
+  CALL cmfe_Field_ComponentMeshComponentSet(GeometricField,CMFE_FIELD_U_VARIABLE_TYPE,1,1,Err)
+  CALL cmfe_Field_ComponentMeshComponentSet(GeometricField,CMFE_FIELD_U_VARIABLE_TYPE,2,1,Err)
+  CALL cmfe_Field_ComponentMeshComponentSet(GeometricField,CMFE_FIELD_U_VARIABLE_TYPE,3,1,Err)
+  CALL cmfe_Field_CreateFinish(GeometricField,Err)
+  CALL cmfe_GeneratedMesh_GeometricParametersCalculate(GeneratedMesh,GeometricField,Err)
+
+  !Export the mesh, one pair of part files for each rank, and convert this rank's exnode file to a binary node file
+  CALL cmfe_Fields_Initialise(Fields,Err)
+  CALL cmfe_Fields_Create(Region,Fields,Err)
+  CALL cmfe_Fields_NodesExport(Fields,"BinaryNodesImport","FORTRAN",Err)
+  CALL cmfe_Fields_ElementsExport(Fields,"BinaryNodesImport","FORTRAN",Err)
+  CALL cmfe_Fields_Finalise(Fields,Err)
+  WRITE(PART_NAME,'("BinaryNodesImport.part",I0)') ComputationalNodeNumber
+  CALL cmfe_Fields_ExnodeToBinary(TRIM(PART_NAME)//".exnode",TRIM(PART_NAME),Err)
+  CALL MPI_BARRIER(MPI_COMM_WORLD,Err)
+
+  !Import the mesh again, reading the nodes from the binary node files
+  CALL cmfe_Mesh_Initialise(BinaryMesh,Err)
+  CALL cmfe_Decomposition_Initialise(BinaryDecomposition,Err)
+  CALL cmfe_Fields_Import("BinaryNodesImport","BINARY",BinaryRegion,BinaryMesh,MeshUserNumber, &
+    & BinaryDecomposition,DecompositionUserNumber,CMFE_DECOMPOSITION_CALCULATED_TYPE,CMFE_FIELD_VALUES_SET_TYPE, &
+    & CMFE_FIELD_NO_SCALING,Err)
+
+  !Compare the values of the nodes this rank owns in both decompositions
+  maxDifference=0.0_CMISSRP
+  numberCompared=0
+  DO node_idx=1,NUMBER_OF_NODES
+    CALL cmfe_Decomposition_NodeDomainGet(RegionUserNumber,MeshUserNumber,DecompositionUserNumber,node_idx,1,domain,Err)
+    CALL cmfe_Decomposition_NodeDomainGet(BinaryRegionUserNumber,MeshUserNumber,DecompositionUserNumber,node_idx,1, &
+      & binaryDomain,Err)
+    IF(domain==ComputationalNodeNumber.AND.binaryDomain==ComputationalNodeNumber) THEN
+      DO component_idx=1,3
+        CALL cmfe_Field_ParameterSetGetNode(RegionUserNumber,GeometricFieldUserNumber,CMFE_FIELD_U_VARIABLE_TYPE, &
+          & CMFE_FIELD_VALUES_SET_TYPE,1,1,node_idx,component_idx,value,Err)
+        CALL cmfe_Field_ParameterSetGetNode(BinaryRegionUserNumber,ImportedFieldUserNumber,CMFE_FIELD_U_VARIABLE_TYPE, &
+          & CMFE_FIELD_VALUES_SET_TYPE,1,1,node_idx,component_idx,binaryValue,Err)
+        maxDifference=MAX(maxDifference,ABS(binaryValue-value))
+      ENDDO !component_idx
+      numberCompared=numberCompared+1
+    ENDIF
+  ENDDO !node_idx
+  CALL MPI_ALLREDUCE(maxDifference,totalMaxDifference,1,MPI_DOUBLE_PRECISION,MPI_MAX,MPI_COMM_WORLD,Err)
+  CALL MPI_ALLREDUCE(numberCompared,totalCompared,1,MPI_INTEGER,MPI_SUM,MPI_COMM_WORLD,Err)
+
+  IF(ComputationalNodeNumber==0) THEN
+    WRITE(*,'("Number of nodes compared: ",I0," of ",I0)') totalCompared,NUMBER_OF_NODES
+    WRITE(*,'("Maximum node value difference: ",ES12.4)') totalMaxDifference
+  ENDIF
+  IF(totalCompared==0.OR.totalMaxDifference>TOLERANCE) THEN
+    IF(ComputationalNodeNumber==0) WRITE(*,'(A)') ">>ERROR: The imported binary node values do not match the exported values."
+    CALL cmfe_Finalise(Err)
+    STOP 1
+  ENDIF
+
+  CALL cmfe_Finalise(Err)
+
+  WRITE(*,'(A)') "Program successfully completed."
+
+  STOP
+
+END PROGRAM BINARYNODESIMPORT
@@ -0,0 +1,213 @@
+!> \file
+!> \brief Benchmark of the import of a mesh and its geometric field from exelem and exnode files on a generated trilinear hexahedral mesh, timing the import through the master rank against the parallel import where every rank reads part of each file.
+!>
+!> \section LICENSE
+!>
+!> Version: MPL 1.1/GPL 2.0/LGPL 2.1
+!>
+!> The contents of this file are subject to the Mozilla Public License
+!> Version 1.1 (the "License"); you may not use this file except in
+!> compliance with the License. You may obtain a copy of the License at
+!> http://www.mozilla.org/MPL/
+!>
+!> Software distributed under the License is distributed on an "AS IS"
+!> basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+!> License for the specific language governing rights and limitations
+!> under the License.
+!>
+!> The Original Code is OpenCMISS
+!>
+!> The Initial Developer of the Original Code is University of Auckland,
+!> Auckland, New Zealand and University of Oxford, Oxford, United
+!> Kingdom. Portions created by the University of Auckland and University
+!> of Oxford are Copyright (C) 2007 by the University of Auckland and
+!> the University of Oxford. All Rights Reserved.
+!>
+!> Contributor(s):
+!>
+!> Alternatively, the contents of this file may be used under the terms of
+!> either the GNU General Public License Version 2 or later (the "GPL"), or
+!> the GNU Lesser General Public License Version 2.1 or later (the "LGPL"),
+!> in which case the provisions of the GPL or the LGPL are applicable instead
+!> of those above. If you wish to allow use of your version of this file only
+!> under the terms of either the GPL or the LGPL, and not to allow others to
+!> use your version of this file under the terms of the MPL, indicate your
+!> decision by deleting the provisions above and replace them with the notice
+!> and other provisions required by the GPL or the LGPL. If you do not delete
+!> the provisions above, a recipient may use your version of this file under
+!> the terms of any one of the MPL, the GPL or the LGPL.
+!>
+
+!> Main program
+PROGRAM FIELDIMPORTBENCHMARK
+
+  USE OpenCMISS
+  USE OpenCMISS_Iron
+#ifndef NOMPIMOD
+  USE MPI
+#endif
+
+#ifdef WIN32
+  USE IFQWIN
+#endif
+
+  IMPLICIT NONE
+
+#ifdef NOMPIMOD
+#include "mpif.h"
+#endif
+
+  !Test program parameters
+
+  REAL(CMISSRP), PARAMETER :: WIDTH=1.0_CMISSRP
+  REAL(CMISSRP), PARAMETER :: HEIGHT=1.0_CMISSRP
+  REAL(CMISSRP), PARAMETER :: LENGTH=1.0_CMISSRP
+
+  INTEGER(CMISSIntg), PARAMETER :: CoordinateSystemUserNumber=1
+  INTEGER(CMISSIntg), PARAMETER :: RegionUserNumber=2
+  INTEGER(CMISSIntg), PARAMETER :: FortranRegionUserNumber=3
+  INTEGER(CMISSIntg), PARAMETER :: ParallelRegionUserNumber=4
+  INTEGER(CMISSIntg), PARAMETER :: BasisUserNumber=5
+  INTEGER(CMISSIntg), PARAMETER :: GeneratedMeshUserNumber=6
+  INTEGER(CMISSIntg), PARAMETER :: MeshUserNumber=7
+  INTEGER(CMISSIntg), PARAMETER :: DecompositionUserNumber=8
+  INTEGER(CMISSIntg), PARAMETER :: GeometricFieldUserNumber=9
+
+  !Program variables
+
+  INTEGER(CMISSIntg) :: NUMBER_OF_ARGUMENTS,ARGUMENT_LENGTH,STATUS
+  CHARACTER(LEN=255) :: COMMAND_ARGUMENT
+
+  INTEGER(CMISSIntg) :: NUMBER_GLOBAL_X_ELEMENTS
+  REAL(CMISSDP) :: startTime,stopTime,fortranTime,parallelTime
+
+  !CMISS variables
+
+  TYPE(cmfe_BasisType) :: Basis
+  TYPE(cmfe_CoordinateSystemType) :: CoordinateSystem,WorldCoordinateSystem
+  TYPE(cmfe_DecompositionType) :: Decomposition,FortranDecomposition,ParallelDecomposition
+  TYPE(cmfe_FieldType) :: GeometricField
+  TYPE(cmfe_FieldsType) :: Fields
+  TYPE(cmfe_GeneratedMeshType) :: GeneratedMesh
+  TYPE(cmfe_MeshType) :: Mesh,FortranMesh,ParallelMesh
+  TYPE(cmfe_RegionType) :: Region,FortranRegion,ParallelRegion,WorldRegion
+
+  !Generic CMISS variables
+
+  INTEGER(CMISSIntg) :: NumberOfComputationalNodes,ComputationalNodeNumber
+  INTEGER(CMISSIntg) :: Err
+
+  !Usage: FieldImportBenchmark [number of elements in each direction]
+  !The default of 127 gives a mesh of just over 2*10^6 elements.
+  NUMBER_GLOBAL_X_ELEMENTS=127
+  NUMBER_OF_ARGUMENTS=COMMAND_ARGUMENT_COUNT()
+  IF(NUMBER_OF_ARGUMENTS>=1) THEN
+    CALL GET_COMMAND_ARGUMENT(1,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    READ(COMMAND_ARGUMENT(1:ARGUMENT_LENGTH),*) NUMBER_GLOBAL_X_ELEMENTS
+  ENDIF
+
+  !Intialise OpenCMISS
+  CALL cmfe_Initialise(WorldCoordinateSystem,WorldRegion,Err)
+  CALL cmfe_ErrorHandlingModeSet(CMFE_ERRORS_TRAP_ERROR,Err)
+  CALL cmfe_ComputationalNumberOfNodesGet(NumberOfComputationalNodes,Err)
+  CALL cmfe_ComputationalNodeNumberGet(ComputationalNodeNumber,Err)
+
+  !Create a 3D RC coordinate system, the regions, a trilinear basis and a generated mesh to export
+  CALL cmfe_CoordinateSystem_Initialise(CoordinateSystem,Err)
+  CALL cmfe_CoordinateSystem_CreateStart(CoordinateSystemUserNumber,CoordinateSystem,Err)
+  CALL cmfe_CoordinateSystem_DimensionSet(CoordinateSystem,3,Err)
+  CALL cmfe_CoordinateSystem_CreateFinish(CoordinateSystem,Err)
+
+  CALL cmfe_Region_Initialise(Region,Err)
+  CALL cmfe_Region_CreateStart(RegionUserNumber,WorldRegion,Region,Err)
+  CALL cmfe_Region_CoordinateSystemSet(Region,CoordinateSystem,Err)
+  CALL cmfe_Region_LabelSet(Region,"Region",Err)
+  CALL cmfe_Region_CreateFinish(Region,Err)
+
+  CALL cmfe_Region_Initialise(FortranRegion,Err)
+  CALL cmfe_Region_CreateStart(FortranRegionUserNumber,WorldRegion,FortranRegion,Err)
+  CALL cmfe_Region_CoordinateSystemSet(FortranRegion,CoordinateSystem,Err)
+  CALL cmfe_Region_LabelSet(FortranRegion,"FortranRegion",Err)
+  CALL cmfe_Region_CreateFinish(FortranRegion,Err)
+
+  CALL cmfe_Region_Initialise(ParallelRegion,Err)
+  CALL cmfe_Region_CreateStart(ParallelRegionUserNumber,WorldRegion,ParallelRegion,Err)
+  CALL cmfe_Region_CoordinateSystemSet(ParallelRegion,CoordinateSystem,Err)
+  CALL cmfe_Region_LabelSet(ParallelRegion,"ParallelRegion",Err)
+  CALL cmfe_Region_CreateFinish(ParallelRegion,Err)
+
+  CALL cmfe_Basis_Initialise(Basis,Err)
+  CALL cmfe_Basis_CreateStart(BasisUserNumber,Basis,Err)
+  CALL cmfe_Basis_NumberOfXiSet(Basis,3,Err)
+  CALL cmfe_Basis_CreateFinish(Basis,Err)
+
+  CALL cmfe_GeneratedMesh_Initialise(GeneratedMesh,Err)
+  CALL cmfe_GeneratedMesh_CreateStart(GeneratedMeshUserNumber,Region,GeneratedMesh,Err)
+  CALL cmfe_GeneratedMesh_TypeSet(GeneratedMesh,CMFE_GENERATED_MESH_REGULAR_MESH_TYPE,Err)
+  CALL cmfe_GeneratedMesh_BasisSet(GeneratedMesh,Basis,Err)
+  CALL cmfe_GeneratedMesh_ExtentSet(GeneratedMesh,[WIDTH,HEIGHT,LENGTH],Err)
+  CALL cmfe_GeneratedMesh_NumberOfElementsSet(GeneratedMesh,[NUMBER_GLOBAL_X_ELEMENTS,NUMBER_GLOBAL_X_ELEMENTS, &
+    & NUMBER_GLOBAL_X_ELEMENTS],Err)
+  CALL cmfe_Mesh_Initialise(Mesh,Err)
+  CALL cmfe_GeneratedMesh_CreateFinish(GeneratedMesh,MeshUserNumber,Mesh,Err)
+
+  CALL cmfe_Decomposition_Initialise(Decomposition,Err)
+  CALL cmfe_Decomposition_CreateStart(DecompositionUserNumber,Mesh,Decomposition,Err)
+  CALL cmfe_Decomposition_TypeSet(Decomposition,CMFE_DECOMPOSITION_CALCULATED_TYPE,Err)
+  CALL cmfe_Decomposition_NumberOfDomainsSet(Decomposition,NumberOfComputationalNodes,Err)
+  CALL cmfe_Decomposition_CreateFinish(Decomposition,Err)
+
+  CALL cmfe_Field_Initialise(GeometricField,Err)
+  CALL cmfe_Field_CreateStart(GeometricFieldUserNumber,Region,GeometricField,Err)
+  CALL cmfe_Field_MeshDecompositionSet(GeometricField,Decomposition,Err)
+  CALL cmfe_Field_ComponentMeshComponentSet(GeometricField,CMFE_FIELD_U_VARIABLE_TYPE,1,1,Err)
+  CALL cmfe_Field_ComponentMeshComponentSet(GeometricField,CMFE_FIELD_U_VARIABLE_TYPE,2,1,Err)
+  CALL cmfe_Field_ComponentMeshComponentSet(GeometricField,CMFE_FIELD_U_VARIABLE_TYPE,3,1,Err)
+  CALL cmfe_Field_CreateFinish(GeometricField,Err)
+  CALL cmfe_GeneratedMesh_GeometricParametersCalculate(GeneratedMesh,GeometricField,Err)
+
+  !Export the mesh, one pair of part files for each rank
+  CALL cmfe_Fields_Initialise(Fields,Err)
+  CALL cmfe_Fields_Create(Region,Fields,Err)
+  CALL cmfe_Fields_NodesExport(Fields,"FieldImportBenchmark","FORTRAN",Err)
+  CALL cmfe_Fields_ElementsExport(Fields,"FieldImportBenchmark","FORTRAN",Err)
+  CALL cmfe_Fields_Finalise(Fields,Err)
+
+  !Time the import through the master rank
+  CALL cmfe_Mesh_Initialise(FortranMesh,Err)
+  CALL cmfe_Decomposition_Initialise(FortranDecomposition,Err)
+  CALL MPI_BARRIER(MPI_COMM_WORLD,Err)
+  startTime=MPI_WTIME()
+  CALL cmfe_Fields_Import("FieldImportBenchmark","FORTRAN",FortranRegion,FortranMesh,MeshUserNumber, &
+    & FortranDecomposition,DecompositionUserNumber,CMFE_DECOMPOSITION_CALCULATED_TYPE,CMFE_FIELD_VALUES_SET_TYPE, &
+    & CMFE_FIELD_NO_SCALING,Err)
+  CALL MPI_BARRIER(MPI_COMM_WORLD,Err)
+  stopTime=MPI_WTIME()
+  fortranTime=stopTime-startTime
+
+  !Time the parallel import, with every rank reading a part of each file
+  CALL cmfe_Mesh_Initialise(ParallelMesh,Err)
+  CALL cmfe_Decomposition_Initialise(ParallelDecomposition,Err)
+  CALL MPI_BARRIER(MPI_COMM_WORLD,Err)
+  startTime=MPI_WTIME()
+  CALL cmfe_Fields_Import("FieldImportBenchmark","PARALLEL",ParallelRegion,ParallelMesh,MeshUserNumber, &
+    & ParallelDecomposition,DecompositionUserNumber,CMFE_DECOMPOSITION_CALCULATED_TYPE,CMFE_FIELD_VALUES_SET_TYPE, &
+    & CMFE_FIELD_NO_SCALING,Err)
+  CALL MPI_BARRIER(MPI_COMM_WORLD,Err)
+  stopTime=MPI_WTIME()
+  parallelTime=stopTime-startTime
+
+  IF(ComputationalNodeNumber==0) THEN
+    WRITE(*,'("Number of elements: ",I0,", number of domains: ",I0)') NUMBER_GLOBAL_X_ELEMENTS**3, &
+      & NumberOfComputationalNodes
+    WRITE(*,'("Master rank import time: ",ES12.4," seconds")') fortranTime
+    WRITE(*,'("Parallel import time: ",ES12.4," seconds")') parallelTime
+  ENDIF
+
+  CALL cmfe_Finalise(Err)
+
+  WRITE(*,'(A)') "Program successfully completed."
+
+  STOP
+
+END PROGRAM FIELDIMPORTBENCHMARK
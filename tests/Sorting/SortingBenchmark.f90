@@ -0,0 +1,210 @@
+!> \file
+!> \brief Benchmark and check of the sorting and selection routines for 10^3 to 10^7 items.
+!>
+!> \section LICENSE
+!>
+!> Version: MPL 1.1/GPL 2.0/LGPL 2.1
+!>
+!> The contents of this file are subject to the Mozilla Public License
+!> Version 1.1 (the "License"); you may not use this file except in
+!> compliance with the License. You may obtain a copy of the License at
+!> http://www.mozilla.org/MPL/
+!>
+!> Software distributed under the License is distributed on an "AS IS"
+!> basis, WITHOUT WARRANTY OF ANY KIND, either express or implied. See the
+!> License for the specific language governing rights and limitations
+!> under the License.
+!>
+!> The Original Code is OpenCMISS
+!>
+!> The Initial Developer of the Original Code is University of Auckland,
+!> Auckland, New Zealand and University of Oxford, Oxford, United
+!> Kingdom. Portions created by the University of Auckland and University
+!> of Oxford are Copyright (C) 2007 by the University of Auckland and
+!> the University of Oxford. All Rights Reserved.
+!>
+!> Contributor(s):
+!>
+!> Alternatively, the contents of this file may be used under the terms of
+!> either the GNU General Public License Version 2 or later (the "GPL"), or
+!> the GNU Lesser General Public License Version 2.1 or later (the "LGPL"),
+!> in which case the provisions of the GPL or the LGPL are applicable instead
+!> of those above. If you wish to allow use of your version of this file only
+!> under the terms of either the GPL or the LGPL, and not to allow others to
+!> use your version of this file under the terms of the MPL, indicate your
+!> decision by deleting the provisions above and replace them with the notice
+!> and other provisions required by the GPL or the LGPL. If you do not delete
+!> the provisions above, a recipient may use your version of this file under
+!> the terms of any one of the MPL, the GPL or the LGPL.
+!>
+
+
+!> Main program
+PROGRAM SORTINGBENCHMARK
+
+  USE ISO_VARYING_STRING
+  USE KINDS
+  USE OpenCMISS
+  USE OpenCMISS_Iron
+  USE SORTING
+  USE TEST_FRAMEWORK_ROUTINES
+
+#ifdef WIN32
+  USE IFQWIN
+#endif
+
+  IMPLICIT NONE
+
+  !Test program parameters
+
+  INTEGER(INTG), PARAMETER :: MINIMUM_EXPONENT=3 !<The smallest list has 10^3 items
+  INTEGER(INTG), PARAMETER :: MAXIMUM_EXPONENT=7 !<The largest list has 10^7 items
+  INTEGER(INTG), PARAMETER :: MAXIMUM_BUBBLE_SORT_SIZE=10000 !<Larger lists are not bubble sorted as it takes too long
+  INTEGER(INTG), PARAMETER :: NUMBER_OF_SELECTED_ITEMS=100 !<The number of smallest items to select, e.g., closest candidates
+
+  !Program variables
+
+  INTEGER(INTG) :: ARGUMENT_LENGTH,LARGEST_EXPONENT,list_exponent,NUMBER_OF_ARGUMENTS,NUMBER_OF_ITEMS, &
+    & NUMBER_SELECTED,STATUS
+  INTEGER(LINTG) :: CLOCK_RATE,START_COUNT,STOP_COUNT
+  INTEGER(INTG), ALLOCATABLE :: SORTING_IND(:)
+  REAL(DP) :: BUBBLE_TIME,HEAP_TIME,INTRO_ISELECT_TIME,INTRO_ISORT_TIME,INTRO_TIME,SHELL_TIME
+  REAL(DP), ALLOCATABLE :: SORTED_VALUES(:),VALUES(:),WORK(:)
+  CHARACTER(LEN=255) :: COMMAND_ARGUMENT
+  TYPE(VARYING_STRING) :: ERROR
+
+  !CMISS variables
+
+  TYPE(cmfe_CoordinateSystemType) :: WorldCoordinateSystem
+  TYPE(cmfe_RegionType) :: WorldRegion
+  INTEGER(INTG) :: Err
+
+#ifdef WIN32
+  !Quickwin type
+  LOGICAL :: QUICKWIN_STATUS=.FALSE.
+  TYPE(WINDOWCONFIG) :: QUICKWIN_WINDOW_CONFIG
+#endif
+
+#ifdef WIN32
+  !Initialise QuickWin
+  QUICKWIN_WINDOW_CONFIG%TITLE="General Output" !Window title
+  QUICKWIN_WINDOW_CONFIG%NUMTEXTROWS=-1 !Max possible number of rows
+  QUICKWIN_WINDOW_CONFIG%MODE=QWIN$SCROLLDOWN
+  !Set the window parameters
+  QUICKWIN_STATUS=SETWINDOWCONFIG(QUICKWIN_WINDOW_CONFIG)
+  !If attempt fails set with system estimated values
+  IF(.NOT.QUICKWIN_STATUS) QUICKWIN_STATUS=SETWINDOWCONFIG(QUICKWIN_WINDOW_CONFIG)
+#endif
+
+  !Usage: SortingBenchmark [largest list size exponent]
+  LARGEST_EXPONENT=6
+  NUMBER_OF_ARGUMENTS=COMMAND_ARGUMENT_COUNT()
+  IF(NUMBER_OF_ARGUMENTS>=1) THEN
+    CALL GET_COMMAND_ARGUMENT(1,COMMAND_ARGUMENT,ARGUMENT_LENGTH,STATUS)
+    READ(COMMAND_ARGUMENT(1:ARGUMENT_LENGTH),*) LARGEST_EXPONENT
+    IF(LARGEST_EXPONENT<MINIMUM_EXPONENT.OR.LARGEST_EXPONENT>MAXIMUM_EXPONENT) THEN
+      WRITE(*,'(">>USAGE: ",A,I0,A,I0,A)') "SortingBenchmark [largest list size exponent between ",MINIMUM_EXPONENT, &
+        & " and ",MAXIMUM_EXPONENT,"]"
+      STOP 1
+    ENDIF
+  ENDIF
+
+  !Intialise OpenCMISS
+  CALL cmfe_Initialise(WorldCoordinateSystem,WorldRegion,Err)
+  CALL cmfe_ErrorHandlingModeSet(CMFE_ERRORS_TRAP_ERROR,Err)
+
+  CALL SYSTEM_CLOCK(COUNT_RATE=CLOCK_RATE)
+  WRITE(*,'(A12,6A14)') "Items","Bubble isort","Heap sort","Shell sort","Intro sort","Intro isort","Intro iselect"
+  DO list_exponent=MINIMUM_EXPONENT,LARGEST_EXPONENT
+    NUMBER_OF_ITEMS=10**list_exponent
+    NUMBER_SELECTED=MIN(NUMBER_OF_SELECTED_ITEMS,NUMBER_OF_ITEMS)
+    ALLOCATE(VALUES(NUMBER_OF_ITEMS),SORTED_VALUES(NUMBER_OF_ITEMS),WORK(NUMBER_OF_ITEMS),SORTING_IND(NUMBER_OF_ITEMS))
+    CALL RANDOM_NUMBER(VALUES)
+
+    !The heap sort gives the reference result
+    SORTED_VALUES=VALUES
+    CALL SYSTEM_CLOCK(START_COUNT)
+    CALL HEAP_SORT(SORTED_VALUES,Err,ERROR,*999)
+    CALL SYSTEM_CLOCK(STOP_COUNT)
+    HEAP_TIME=REAL(STOP_COUNT-START_COUNT,DP)/REAL(CLOCK_RATE,DP)
+
+    BUBBLE_TIME=-1.0_DP
+    IF(NUMBER_OF_ITEMS<=MAXIMUM_BUBBLE_SORT_SIZE) THEN
+      WORK=VALUES
+      CALL SYSTEM_CLOCK(START_COUNT)
+      CALL BUBBLE_ISORT(WORK,SORTING_IND,Err,ERROR,*999)
+      CALL SYSTEM_CLOCK(STOP_COUNT)
+      BUBBLE_TIME=REAL(STOP_COUNT-START_COUNT,DP)/REAL(CLOCK_RATE,DP)
+      CALL CHECK_SORTED(WORK,SORTING_IND)
+    ENDIF
+
+    WORK=VALUES
+    CALL SYSTEM_CLOCK(START_COUNT)
+    CALL SHELL_SORT(WORK,Err,ERROR,*999)
+    CALL SYSTEM_CLOCK(STOP_COUNT)
+    SHELL_TIME=REAL(STOP_COUNT-START_COUNT,DP)/REAL(CLOCK_RATE,DP)
+    CALL TEST_FRAMEWORK_ASSERT_EQUALS(0,COUNT(WORK/=SORTED_VALUES),Err)
+    IF(Err/=0) CALL HANDLE_FAILURE("Shell sort")
+
+    WORK=VALUES
+    CALL SYSTEM_CLOCK(START_COUNT)
+    CALL INTRO_SORT(WORK,Err,ERROR,*999)
+    CALL SYSTEM_CLOCK(STOP_COUNT)
+    INTRO_TIME=REAL(STOP_COUNT-START_COUNT,DP)/REAL(CLOCK_RATE,DP)
+    CALL TEST_FRAMEWORK_ASSERT_EQUALS(0,COUNT(WORK/=SORTED_VALUES),Err)
+    IF(Err/=0) CALL HANDLE_FAILURE("Intro sort")
+
+    WORK=VALUES
+    CALL SYSTEM_CLOCK(START_COUNT)
+    CALL INTRO_ISORT(WORK,SORTING_IND,Err,ERROR,*999)
+    CALL SYSTEM_CLOCK(STOP_COUNT)
+    INTRO_ISORT_TIME=REAL(STOP_COUNT-START_COUNT,DP)/REAL(CLOCK_RATE,DP)
+    CALL CHECK_SORTED(WORK,SORTING_IND)
+
+    WORK=VALUES
+    CALL SYSTEM_CLOCK(START_COUNT)
+    CALL INTRO_ISELECT(WORK,NUMBER_SELECTED,SORTING_IND,Err,ERROR,*999)
+    CALL SYSTEM_CLOCK(STOP_COUNT)
+    INTRO_ISELECT_TIME=REAL(STOP_COUNT-START_COUNT,DP)/REAL(CLOCK_RATE,DP)
+    CALL TEST_FRAMEWORK_ASSERT_EQUALS(SORTED_VALUES(NUMBER_SELECTED),MAXVAL(WORK(1:NUMBER_SELECTED)),Err)
+    IF(Err/=0) CALL HANDLE_FAILURE("Intro iselect")
+    CALL TEST_FRAMEWORK_ASSERT_EQUALS(0,COUNT(VALUES(SORTING_IND)/=WORK),Err)
+    IF(Err/=0) CALL HANDLE_FAILURE("Intro iselect index")
+
+    WRITE(*,'(I12,6F14.6)') NUMBER_OF_ITEMS,BUBBLE_TIME,HEAP_TIME,SHELL_TIME,INTRO_TIME,INTRO_ISORT_TIME,INTRO_ISELECT_TIME
+    DEALLOCATE(VALUES,SORTED_VALUES,WORK,SORTING_IND)
+  ENDDO !list_exponent
+  WRITE(*,'(A)') "Times are in seconds. A bubble sort time of -1 means the list was too large to bubble sort."
+
+  CALL cmfe_Finalise(Err)
+
+  WRITE(*,'(A)') "Program successfully completed."
+
+  STOP
+999 WRITE(*,'(">>ERROR: ",A)') CHAR(ERROR)
+  STOP 1
+
+CONTAINS
+
+  !>Checks a list sorted with its sorting index against the reference sort.
+  SUBROUTINE CHECK_SORTED(SORTED,IND)
+    REAL(DP), INTENT(IN) :: SORTED(:) !<The sorted list
+    INTEGER(INTG), INTENT(IN) :: IND(:) !<The sorting index of the list
+
+    CALL TEST_FRAMEWORK_ASSERT_EQUALS(0,COUNT(SORTED/=SORTED_VALUES),Err)
+    IF(Err/=0) CALL HANDLE_FAILURE("Sorted values")
+    CALL TEST_FRAMEWORK_ASSERT_EQUALS(0,COUNT(VALUES(IND)/=SORTED),Err)
+    IF(Err/=0) CALL HANDLE_FAILURE("Sorting index")
+
+  END SUBROUTINE CHECK_SORTED
+
+  !>Reports a failed check and stops.
+  SUBROUTINE HANDLE_FAILURE(CHECK)
+    CHARACTER(LEN=*), INTENT(IN) :: CHECK !<The check that failed
+
+    WRITE(*,'(">>ERROR: ",A," check failed for ",I0," items.")') CHECK,NUMBER_OF_ITEMS
+    STOP 1
+
+  END SUBROUTINE HANDLE_FAILURE
+
+END PROGRAM SORTINGBENCHMARK
@@ -1,41 +1,458 @@
 #!/usr/bin/env python
-import sys,os
-sys.path.append(os.environ['OPENCMISS_ROOT']+'/cm/examples')
-from noseMain import *
 
 """
-Use the noseMain.py testing file to run the tests in a .prop file locally
+Run the testing points in .prop files locally, in parallel
 Doesn't build the example or check building
+
+Usage: local_prop_test.py [options] prop_file [prop_file ...]
+
+A .prop file contains "key=value" lines. Keys starting with 42 hold a single
+value, all other keys can be repeated and hold a list of comma separated
+values. Lines starting with # are ignored. Each testing point has the form:
+
+  TestingPoint=<path>,<arguments>[,np=<processes>]
+
+where <path> is the testing point directory relative to 42TestingPointsPATH
+and may reference other properties as ${key}. Testing points are scheduled
+across a pool of workers limited by the number of cores and MPI slots, with
+the longest running tests from previous runs started first. Each one is run
+in its own working directory under the output directory, with the files from
+the testing point directory linked in. The executable run is the example built
+in the testing point directory, under bin/<arch>-<system>, unless one is given
+with --executable, so the .prop files of several examples can be run at once.
+If the testing point directory has an
+expected_results directory, each file in it is compared with the output file
+of the same name using ndiff.
+
+The wall time and peak memory use of each test are written to a JUnit XML
+file and appended to a timing history, and tests that are significantly
+slower than their previous runs are reported.
 """
 
-def test_prop_file(prop_file_path):
-  global compiler
-  root = os.getcwd()
-  system = os.uname()[0].lower()
-  arch = os.uname()[4]
-  propFile= file(prop_file_path, "r")
-  properties = dict()
-  load_prop(propFile,properties)
-  if '42TestingPointsPATH' in properties :
-    testingPointsPath = os.environ['OPENCMISS_ROOT']+"/cm/examples/"+properties['42TestingPointsPATH']
-  else:
-    testingPointsPath = ""
-  testpoints = properties['TestingPoint']
-  for testpoint in testpoints :
-    if (testpoint[0].find("${")!=-1) :
-      testingPointPath = properties[testpoint[0][2:testpoint[0].find("}")]]+testpoint[0][testpoint[0].find("}")+1:]
+import datetime
+import json
+import multiprocessing
+import optparse
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+
+NDIFF = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ndiff')
+
+
+def load_prop(prop_file):
+    """Read properties from a .prop file"""
+    properties = {}
+    for line in prop_file:
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        (key, value) = [s.strip() for s in line.split('=', 1)]
+        if key.startswith('42'):
+            properties[key] = value
+        else:
+            properties.setdefault(key, []).append(
+                [v.strip() for v in value.split(',')])
+    return properties
+
+
+def expand_properties(value, properties):
+    """Substitute ${key} references to other properties"""
+    while '${' in value:
+        start = value.find('${')
+        end = value.find('}', start)
+        if end == -1:
+            raise ValueError("Unterminated property reference in %s" % value)
+        key = value[start + 2:end]
+        if key not in properties:
+            raise KeyError("Unknown property %s referenced in %s" %
+                (key, value))
+        replacement = properties[key]
+        if isinstance(replacement, list):
+            replacement = ','.join(replacement[0])
+        value = value[:start] + replacement + value[end + 1:]
+    return value
+
+
+class TestingPoint(object):
+    """A single run of an example executable"""
+
+    def __init__(self, prop_name, path, directory, arguments, num_procs):
+        self.prop_name = prop_name
+        self.path = path
+        self.directory = directory
+        self.arguments = arguments
+        self.num_procs = num_procs
+        self.name = ('%s %s' % (path, arguments)).strip()
+        if num_procs > 1:
+            self.name += ' np=%d' % num_procs
+        self.status = None
+        self.message = ''
+        self.output = ''
+        self.wall_time = 0.0
+        self.peak_rss = 0
+
+    @property
+    def test_id(self):
+        return '%s:%s' % (self.prop_name, self.name)
+
+
+def read_testing_points(prop_file_path, examples_root):
+    """Return a list of TestingPoints from a .prop file"""
+    with open(prop_file_path, 'r') as prop_file:
+        properties = load_prop(prop_file)
+    prop_name = os.path.splitext(os.path.basename(prop_file_path))[0]
+    if '42TestingPointsPATH' in properties:
+        testing_points_path = os.path.join(
+            examples_root, properties['42TestingPointsPATH'])
+    else:
+        testing_points_path = os.path.dirname(os.path.abspath(prop_file_path))
+
+    testing_points = []
+    for fields in properties.get('TestingPoint', []):
+        path = expand_properties(fields[0], properties)
+        arguments = fields[1] if len(fields) > 1 else ''
+        num_procs = 1
+        for field in fields[2:]:
+            if field.startswith('np='):
+                num_procs = int(field[3:])
+        testing_points.append(TestingPoint(prop_name, path,
+            os.path.abspath(os.path.join(testing_points_path, path)),
+            arguments, num_procs))
+    return testing_points
+
+
+class SlotPool(object):
+    """Limit the total number of processes running at once, where each
+    test may need several MPI processes"""
+
+    def __init__(self, num_slots):
+        self.num_slots = num_slots
+        self.free = num_slots
+        self.condition = threading.Condition()
+
+    def acquire(self, count):
+        count = min(count, self.num_slots)
+        with self.condition:
+            while self.free < count:
+                self.condition.wait()
+            self.free -= count
+        return count
+
+    def release(self, count):
+        with self.condition:
+            self.free += count
+            self.condition.notify_all()
+
+
+def exit_code(status):
+    """Convert a status from os.wait4 into a return code"""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def link_inputs(source_dir, work_dir):
+    """Make the testing point input files available in the working directory
+    without copying them"""
+    if os.path.isdir(work_dir):
+        shutil.rmtree(work_dir)
+    os.makedirs(work_dir)
+    if not os.path.isdir(source_dir):
+        return
+    for name in os.listdir(source_dir):
+        if name == 'expected_results' or name.startswith('.'):
+            continue
+        source = os.path.join(source_dir, name)
+        try:
+            os.symlink(source, os.path.join(work_dir, name))
+        except (AttributeError, OSError):
+            if os.path.isdir(source):
+                shutil.copytree(source, os.path.join(work_dir, name))
+            else:
+                shutil.copy(source, work_dir)
+
+
+def find_executable(directory):
+    """Find the example executable built in a testing point directory. The
+    example Makefiles put it in bin/<arch>-<system>/<mpi>/<compiler>, and the
+    most recently built one is used if there are several."""
+    (system, _, _, _, arch) = os.uname()
+    bin_dir = os.path.join(directory, 'bin',
+        '%s-%s' % (arch, system.lower()))
+    executables = []
+    for (dir_path, _, file_names) in os.walk(bin_dir):
+        for name in file_names:
+            path = os.path.join(dir_path, name)
+            if os.access(path, os.X_OK):
+                executables.append(path)
+    if not executables:
+        raise IOError("No example executable found in %s" % bin_dir)
+    return max(executables, key=os.path.getmtime)
+
+
+def check_results(test, work_dir, tolerance):
+    """Compare the outputs with any expected results, returning a list of
+    files that differ"""
+    expected_dir = os.path.join(test.directory, 'expected_results')
+    if not os.path.isdir(expected_dir):
+        return []
+    failed = []
+    for name in sorted(os.listdir(expected_dir)):
+        output = os.path.join(work_dir, name)
+        if not os.path.isfile(output):
+            output = os.path.join(work_dir, 'output', name)
+        if not os.path.isfile(output):
+            failed.append('%s (missing)' % name)
+            continue
+        with open(os.devnull, 'w') as devnull:
+            if subprocess.call(['perl', NDIFF, '-t', str(tolerance),
+                    os.path.join(expected_dir, name), output],
+                    stdout=devnull, stderr=devnull) != 0:
+                failed.append(name)
+    return failed
+
+
+def run_test(test, options, slots):
+    """Run a single testing point, setting its status, wall time and peak
+    resident set size"""
+    work_dir = os.path.join(options.output_dir, test.prop_name,
+        '_'.join(test.name.split()).replace(os.sep, '_'))
+    link_inputs(test.directory, work_dir)
+    executable = options.executable or find_executable(test.directory)
+    command = [executable] + shlex.split(test.arguments)
+    if test.num_procs > 1:
+        command = [options.mpiexec, '-n', str(test.num_procs)] + command
+    log_path = os.path.join(work_dir, 'test.log')
+
+    count = slots.acquire(test.num_procs)
+    try:
+        with open(log_path, 'w') as log:
+            start = time.time()
+            process = subprocess.Popen(command, cwd=work_dir,
+                stdout=log, stderr=subprocess.STDOUT)
+            timer = threading.Timer(options.timeout, process.kill)
+            timer.start()
+            try:
+                # wait4 gives the resource usage of this test alone
+                (_, status, usage) = os.wait4(process.pid, 0)
+            finally:
+                timer.cancel()
+            test.wall_time = time.time() - start
+        process.returncode = exit_code(status)
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        test.peak_rss = usage.ru_maxrss * (1 if sys.platform == 'darwin'
+            else 1024)
+    finally:
+        slots.release(count)
+
+    with open(log_path, 'r') as log:
+        test.output = log.read()[-options.log_tail:]
+    if process.returncode != 0:
+        test.status = 'fail'
+        if test.wall_time >= options.timeout:
+            test.message = 'Timed out after %d s' % options.timeout
+        else:
+            test.message = 'Exited with code %d' % process.returncode
+        return
+    failed = check_results(test, work_dir, options.tolerance)
+    if failed:
+        test.status = 'fail'
+        test.message = 'Output differs from expected: %s' % ', '.join(failed)
     else:
-      testingPointPath = testpoint[0]
-    os.chdir(testingPointsPath + testingPointPath)
-    if len(testpoint)<=2 :            
-      yield check_run, 'run', os.getcwd(), system, arch, compiler, root, testpoint[1], testingPointPath, False
-    else :
-      yield check_run, 'run', os.getcwd(), system, arch, compiler, root, testpoint[1], testingPointPath
-  
+        test.status = 'pass'
+
+
+def run_tests(tests, options):
+    """Run tests in parallel, starting the longest running ones first"""
+    num_slots = min(options.jobs, options.mpi_slots)
+    slots = SlotPool(num_slots)
+    pending = list(tests)
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if not pending:
+                    return
+                test = pending.pop(0)
+            try:
+                run_test(test, options, slots)
+            except Exception as e:
+                test.status = 'error'
+                test.message = '%s: %s' % (type(e).__name__, e)
+            sys.stdout.write('%-5s %7.2f s %8.1f MB  %s\n' % (
+                test.status.upper(), test.wall_time,
+                test.peak_rss / 1048576.0, test.test_id))
+            sys.stdout.flush()
+
+    threads = [threading.Thread(target=worker)
+        for _ in range(min(num_slots, len(tests)))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def load_history(history_path):
+    """Read previous wall times for each test from the timing history"""
+    history = {}
+    if not os.path.isfile(history_path):
+        return history
+    with open(history_path, 'r') as history_file:
+        for line in history_file:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get('status') == 'pass':
+                history.setdefault(record['test'], []).append(
+                    record['wall_time'])
+    return history
+
+
+def append_history(history_path, tests):
+    timestamp = datetime.datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%SZ')
+    with open(history_path, 'a') as history_file:
+        for test in tests:
+            history_file.write(json.dumps({
+                'time': timestamp,
+                'test': test.test_id,
+                'status': test.status,
+                'wall_time': round(test.wall_time, 3),
+                'peak_rss': test.peak_rss}, sort_keys=True) + '\n')
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return 0.5 * (values[middle - 1] + values[middle])
+
+
+def find_regressions(tests, history, threshold, num_runs):
+    """Return tests that took longer than threshold times the median wall
+    time of their last num_runs passing runs"""
+    regressions = []
+    for test in tests:
+        previous = history.get(test.test_id, [])[-num_runs:]
+        if test.status != 'pass' or not previous:
+            continue
+        previous_time = median(previous)
+        if previous_time > 0.0 and test.wall_time > threshold * previous_time:
+            regressions.append((test, previous_time))
+    return regressions
+
+
+def write_junit(junit_path, tests):
+    suites = ET.Element('testsuites')
+    for prop_name in sorted(set(t.prop_name for t in tests)):
+        prop_tests = [t for t in tests if t.prop_name == prop_name]
+        suite = ET.SubElement(suites, 'testsuite', {
+            'name': prop_name,
+            'tests': str(len(prop_tests)),
+            'failures': str(sum(t.status == 'fail' for t in prop_tests)),
+            'errors': str(sum(t.status == 'error' for t in prop_tests)),
+            'time': '%.3f' % sum(t.wall_time for t in prop_tests)})
+        for test in prop_tests:
+            case = ET.SubElement(suite, 'testcase', {
+                'classname': prop_name,
+                'name': test.name,
+                'time': '%.3f' % test.wall_time})
+            properties = ET.SubElement(case, 'properties')
+            ET.SubElement(properties, 'property',
+                {'name': 'peak_rss', 'value': str(test.peak_rss)})
+            ET.SubElement(properties, 'property',
+                {'name': 'num_procs', 'value': str(test.num_procs)})
+            if test.status in ('fail', 'error'):
+                ET.SubElement(case, 'failure' if test.status == 'fail'
+                    else 'error', {'message': test.message})
+            ET.SubElement(case, 'system-out').text = test.output
+    ET.ElementTree(suites).write(junit_path, encoding='utf-8')
+
+
+def main(argv):
+    parser = optparse.OptionParser(
+        usage='%prog [options] prop_file [prop_file ...]')
+    parser.add_option('-e', '--executable',
+        help='executable to run for every testing point instead of the '
+             'example built in each testing point directory')
+    parser.add_option('-j', '--jobs', type='int',
+        default=multiprocessing.cpu_count(),
+        help='number of cores to use (default: %default)')
+    parser.add_option('--mpi-slots', type='int', default=None,
+        help='maximum number of MPI processes (default: number of cores)')
+    parser.add_option('--mpiexec', default='mpiexec',
+        help='MPI launcher used when np is greater than 1 '
+             '(default: %default)')
+    parser.add_option('--examples-root', default=os.path.join(
+        os.environ.get('OPENCMISS_ROOT', '.'), 'cm', 'examples'),
+        help='root of 42TestingPointsPATH (default: %default)')
+    parser.add_option('-o', '--output-dir', default='prop_test_output',
+        help='directory for test working directories and reports '
+             '(default: %default)')
+    parser.add_option('--junit', default=None,
+        help='JUnit XML file (default: OUTPUT_DIR/junit.xml)')
+    parser.add_option('--history', default=None,
+        help='timing history file (default: OUTPUT_DIR/history.jsonl)')
+    parser.add_option('--timeout', type='float', default=3600.0,
+        help='timeout for each testing point in seconds (default: %default)')
+    parser.add_option('-t', '--tolerance', type='float', default=1.0e-6,
+        help='tolerance used when comparing results (default: %default)')
+    parser.add_option('--regression-threshold', type='float', default=1.25,
+        help='report tests slower than this factor times their previous '
+             'median wall time (default: %default)')
+    parser.add_option('--regression-runs', type='int', default=5,
+        help='number of previous runs to compare with (default: %default)')
+    parser.add_option('--log-tail', type='int', default=10000,
+        help='number of characters of output kept in the report '
+             '(default: %default)')
+    (options, prop_files) = parser.parse_args(argv)
+    if not prop_files:
+        parser.error('No .prop files given')
+    if options.executable is not None:
+        options.executable = os.path.abspath(options.executable)
+    options.output_dir = os.path.abspath(options.output_dir)
+    if options.mpi_slots is None:
+        options.mpi_slots = options.jobs
+    junit_path = options.junit or os.path.join(options.output_dir, 'junit.xml')
+    history_path = options.history or os.path.join(
+        options.output_dir, 'history.jsonl')
+
+    tests = []
+    for prop_file in prop_files:
+        tests.extend(read_testing_points(prop_file, options.examples_root))
+    if not tests:
+        sys.stderr.write('No testing points found\n')
+        return 1
+    if not os.path.isdir(options.output_dir):
+        os.makedirs(options.output_dir)
+
+    history = load_history(history_path)
+    # Start the slowest tests first so they don't hold up the end of the run
+    tests.sort(key=lambda t: -median(history.get(t.test_id, [0.0])))
+    run_tests(tests, options)
+
+    write_junit(junit_path, tests)
+    regressions = find_regressions(tests, history,
+        options.regression_threshold, options.regression_runs)
+    append_history(history_path, tests)
+
+    for (test, previous_time) in regressions:
+        sys.stdout.write('SLOWER %7.2f s (previously %.2f s)  %s\n' %
+            (test.wall_time, previous_time, test.test_id))
+    failed = [t for t in tests if t.status != 'pass']
+    sys.stdout.write('%d passed, %d failed, %d slower than before\n' %
+        (len(tests) - len(failed), len(failed), len(regressions)))
+    return 1 if failed else 0
+
+
 if __name__ == '__main__':
-  if len(sys.argv) != 2:
-    sys.stderr.write('Usage '+sys.argv[0]+' prop_file\n')
-    exit(1)
-  for check in test_prop_file(sys.argv[1]):
-      print ' '.join([str(c) for c in check[1:]])
-      check[0](*check[1:])
+    sys.exit(main(sys.argv[1:]))
@@ -2,8 +2,21 @@
 """
 Update OpenCMISS Fortran code to use the new cmfe_ prefix.
 Also use an array to set the equation set and problem specifications.
+
+Usage: update_fortran_program_prefix.py [options] path [path ...]
+
+Each path can be a Fortran source file or a directory, in which case all
+Fortran source files below it are updated. Files are processed in parallel
+and any file that hasn't changed since it was last processed with the
+current converters is skipped. Use --dry-run to print a diff of the changes
+without modifying any files.
 """
 
+import difflib
+import hashlib
+import json
+import multiprocessing
+import optparse
 import os
 import re
 import sys
@@ -66,22 +79,61 @@ def remove_problem_spec_comment(match, info):
     return ""
 
 
+def dispatch_regex(functions):
+    """Combine the regexes for registered functions into a single regex
+
+    This is used to find lines that match any of the functions with one
+    search, so that the individual regexes only need to be tried for the
+    few lines that match one of them.
+    """
+    if not functions:
+        return None
+    return re.compile(
+        '|'.join('(?:%s)' % regex.pattern for _, regex in functions),
+        re.IGNORECASE)
+
+
+_dispatch = {}
+
+
+def get_dispatch_regexes():
+    """Get combined reader and converter regexes, compiling them once
+    """
+    if not _dispatch:
+        _dispatch['readers'] = dispatch_regex(readers)
+        _dispatch['converters'] = dispatch_regex(converters)
+    return (_dispatch['readers'], _dispatch['converters'])
+
+
 def convert(source):
     """Convert source file, generating new lines
     """
     # Read all of input as we need to go over it twice
-    lines = source.readlines()
+    return convert_lines(source.readlines())
+
+
+def convert_lines(source_lines):
+    """Convert a list of source lines, generating new lines
+    """
+    (any_reader, any_converter) = get_dispatch_regexes()
+    lines = list(full_lines(source_lines))
 
     # Find information
     info = {}
-    for line, _ in full_lines(lines):
-        for read, regex in readers:
-            match = regex.search(line)
-            if match:
-                read(match, info)
+    if any_reader is not None:
+        for line, _ in lines:
+            if not any_reader.search(line):
+                continue
+            for read, regex in readers:
+                match = regex.search(line)
+                if match:
+                    read(match, info)
 
     # Now convert file
-    for line, orig_lines in full_lines(lines):
+    for line, orig_lines in lines:
+        if any_converter is None or not any_converter.search(line):
+            yield orig_lines
+            continue
         for convert, regex in converters:
             match = regex.search(line)
             if match:
@@ -143,30 +195,160 @@ def fix_line(line):
 constant_prefix_re = re.compile(r'\bCMISS_')
 prefix_re = re.compile(r'\bCMISS([A-Za-z])')
 type_suffix_re = re.compile(r'([0-9])_CMISS')
+# Stuff like CMISSDP, CMISSDPC etc. that shouldn't get the cmfe_ prefix
+kind_re = re.compile(r'cmfe_(DP|SP|QP|S?Intg|LIntg)')
 
 
 def convert_prefix(line):
+    if 'CMISS' not in line and 'cmfe_' not in line:
+        return line
     # Convert constants, subroutine calls and type suffixes
     line = constant_prefix_re.sub('CMFE_', line)
     line = prefix_re.sub(r'cmfe_\1', line)
     line = type_suffix_re.sub(r'\1_CMFE', line)
-    # Fix up stuff like CMISSDP etc that shouldn't be changed
-    line = line.replace('cmfe_DP', 'CMFEDP')
-    line = line.replace('cmfe_SP', 'CMFESP')
-    line = line.replace('cmfe_QP', 'CMFEQP')
-    line = line.replace('cmfe_DPC', 'CMFEDPC')
-    line = line.replace('cmfe_SPC', 'CMFESPC')
-    line = line.replace('cmfe_Intg', 'CMFEIntg')
-    line = line.replace('cmfe_SIntg', 'CMFESIntg')
-    line = line.replace('cmfe_LIntg', 'CMFELIntg')
+    # Fix up kind parameters that shouldn't be changed
+    line = kind_re.sub(r'CMFE\1', line)
     return line
 
 
+FORTRAN_EXTENSIONS = ('.f90', '.F90', '.f95', '.F95')
+
+
+def find_sources(paths):
+    """Find all Fortran source files in the given files and directories
+    """
+    sources = []
+    for path in paths:
+        if os.path.isdir(path):
+            for (dir_path, dir_names, file_names) in os.walk(path):
+                dir_names[:] = [d for d in dir_names if not d.startswith('.')]
+                sources.extend(os.path.join(dir_path, f)
+                    for f in file_names if f.endswith(FORTRAN_EXTENSIONS))
+        else:
+            sources.append(path)
+    return sorted(set(os.path.abspath(s) for s in sources))
+
+
+def rules_hash():
+    """Hash of this script, so the cache is invalidated if any of the
+    converters change
+    """
+    script = os.path.splitext(os.path.abspath(__file__))[0] + '.py'
+    with open(script, 'rb') as script_file:
+        return hashlib.sha1(script_file.read()).hexdigest()
+
+
+def content_hash(content):
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def load_cache(cache_path, rules):
+    """Load hashes of files that are already up to date
+    """
+    if cache_path is None or not os.path.isfile(cache_path):
+        return {}
+    try:
+        with open(cache_path, 'r') as cache_file:
+            cache = json.load(cache_file)
+    except ValueError:
+        return {}
+    if cache.get('rules') != rules:
+        return {}
+    return cache.get('files', {})
+
+
+def save_cache(cache_path, rules, files):
+    if cache_path is None:
+        return
+    with open(cache_path, 'w') as cache_file:
+        json.dump({'rules': rules, 'files': files}, cache_file,
+            indent=0, sort_keys=True)
+
+
+def update_file(args):
+    """Convert a single file
+
+    Returns a tuple of the file path, a status of 'unchanged', 'cached',
+    'updated' or 'error', the hash of the file content after conversion and
+    a diff of the changes or an error message.
+    """
+    (path, cached_hash, dry_run) = args
+    try:
+        with open(path, 'r') as input:
+            original = input.read()
+        original_hash = content_hash(original)
+        if original_hash == cached_hash:
+            return (path, 'cached', original_hash, '')
+
+        source = original.splitlines(True)
+        converted = ''.join(convert_prefix(newline)
+            for newline in convert_lines(source))
+        if converted == original:
+            return (path, 'unchanged', original_hash, '')
+
+        diff = ''
+        if dry_run:
+            diff = ''.join(difflib.unified_diff(
+                source, converted.splitlines(True), path, path))
+        else:
+            outfile = path + '.fixed'
+            with open(outfile, 'w') as output:
+                output.write(converted)
+            os.rename(outfile, path)
+        return (path, 'updated', content_hash(converted), diff)
+    except Exception as e:
+        return (path, 'error', None, '%s: %s' % (type(e).__name__, e))
+
+
+def main(argv):
+    parser = optparse.OptionParser(
+        usage='%prog [options] path [path ...]')
+    parser.add_option('-n', '--dry-run', action='store_true', default=False,
+        help='print a diff of the changes without modifying any files')
+    parser.add_option('-j', '--jobs', type='int', default=0,
+        help='number of worker processes (default: number of CPUs)')
+    parser.add_option('--cache', default='.update_fortran_program_prefix_cache',
+        help='file used to record already converted files '
+             '(default: %default)')
+    parser.add_option('--no-cache', dest='cache', action='store_const',
+        const=None, help="don't skip files that are already converted")
+    (options, paths) = parser.parse_args(argv)
+    if not paths:
+        parser.error('No source files or directories given')
+
+    rules = rules_hash()
+    cached = load_cache(options.cache, rules)
+    sources = find_sources(paths)
+    tasks = [(path, cached.get(path), options.dry_run) for path in sources]
+
+    jobs = options.jobs or multiprocessing.cpu_count()
+    if jobs > 1 and len(tasks) > 1:
+        pool = multiprocessing.Pool(min(jobs, len(tasks)))
+        try:
+            results = pool.map(update_file, tasks, chunksize=4)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [update_file(task) for task in tasks]
+
+    counts = {'cached': 0, 'unchanged': 0, 'updated': 0, 'error': 0}
+    for (path, status, new_hash, message) in results:
+        counts[status] += 1
+        if status == 'error':
+            sys.stderr.write('Error converting %s: %s\n' % (path, message))
+            cached.pop(path, None)
+        elif options.dry_run:
+            sys.stdout.write(message)
+        else:
+            cached[path] = new_hash
+    if not options.dry_run:
+        save_cache(options.cache, rules, cached)
+
+    sys.stderr.write('%(updated)d updated, %(unchanged)d unchanged, '
+        '%(cached)d skipped, %(error)d errors\n' % counts)
+    return 1 if counts['error'] else 0
+
+
 if __name__ == '__main__':
-    infile = sys.argv[1]
-    outfile = sys.argv[1] + '.fixed'
-    with open(infile, 'r') as input:
-        with open(outfile, 'w') as output:
-            for newline in convert(input):
-                output.write(convert_prefix(newline))
-    os.rename(outfile, infile)
+    sys.exit(main(sys.argv[1:]))